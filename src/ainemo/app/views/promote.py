@@ -305,8 +305,9 @@ def _distinct_lang_pairs(tm: object) -> tuple[tuple[str, str], ...]:
     iter_all = getattr(tm, "iter_all_translations", None)
     if iter_all is None:
         # Cycle-1 Protocol has no bulk iterator without lang filtering;
-        # peek at the SQLite-backed default impl as a best-effort fallback.
-        conn = getattr(tm, "_conn", None)
+        # peek at the SQLite-backed default impl as a best-effort fallback
+        # (unwrapping a CachedTranslationMemory first).
+        conn = getattr(getattr(tm, "backend", tm), "_conn", None)
         if conn is None:
             return ()
         try:
@@ -128,7 +128,8 @@ def run_app(args: argparse.Namespace, *, err: TextIO | None = None) -> int:
 def _run_app_run(args: argparse.Namespace, *, err: TextIO) -> int:
     """Execute ``nemo app run``.
 
-    Constructs concrete dependencies (KuzuTermbase, SqliteTranslationMemory,
+    Constructs concrete dependencies (KuzuTermbase, SqliteTranslationMemory
+    behind the CachedTranslationMemory lookup cache,
     ProviderRouter with noop default) and passes them to the DI factory.
     The factory (create_app) depends only on Protocols — the concrete
     types live here per the Library-first / CLI-second rule.
@@ -140,8 +141,10 @@ def _run_app_run(args: argparse.Namespace, *, err: TextIO) -> int:
     from ainemo.app.store.import_skips import SqliteImportSkipStore
     from ainemo.core.segment import Segment
     from ainemo.core.termbase.kuzu.store import KuzuTermbase
+    from ainemo.core.tm.cached import CachedTranslationMemory
     from ainemo.core.tm.sqlite import SqliteTranslationMemory
     from ainemo.providers._ids import PROVIDER_ID_NOOP
+    from ainemo.providers._response_cache import ResponseCache
     from ainemo.providers._usage_log import DEFAULT_USAGE_LOG_PATH, UsageLog
     from ainemo.providers.base import Provider, ProviderResult
     from ainemo.providers.router import ProviderRouter, RoutingConfig
@@ -195,13 +198,15 @@ def _run_app_run(args: argparse.Namespace, *, err: TextIO) -> int:
         return _EXIT_USAGE
 
     termbase = KuzuTermbase(termbase_path)
-    tm = SqliteTranslationMemory(tm_path)
+    tm = CachedTranslationMemory(SqliteTranslationMemory(tm_path))
     import_skips = SqliteImportSkipStore(config.import_skips_path)
     noop: Provider = _NoOpProvider()
     router = ProviderRouter(
         providers={PROVIDER_ID_NOOP: noop},
         routing_config=RoutingConfig(default_provider=PROVIDER_ID_NOOP),
         usage_log=UsageLog(Path(DEFAULT_USAGE_LOG_PATH)),
+        # Reviewers re-run back-translation on the same strings.
+        response_cache=ResponseCache(),
     )
 
     app = create_app(
@@ -13,23 +13,49 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import ClassVar, Final
+from typing import ClassVar, Final, Sequence
 
 from ainemo.core.adapters.base import BundleAdapter
 from ainemo.core.adapters.gettext_po import GettextPoAdapter
 from ainemo.core.adapters.i18next_json import I18NextJsonAdapter
 from ainemo.core.adapters.java_properties import JavaPropertiesAdapter
 from ainemo.core.adapters.xliff import XliffAdapter
-from ainemo.core.pipeline import TranslationPipeline
+from ainemo.core.cascade import DEFAULT_ESCALATION_THRESHOLD, CascadePolicy
+from ainemo.core.passthrough import PassthroughPolicy
+from ainemo.core.pipeline import PipelineResult, TranslationPipeline
+from ainemo.core.planner import RunBudget, RunPlan, plan_run
 from ainemo.core.segment import Segment
-from ainemo.core.tm.sqlite import DEFAULT_TM_PATH, SqliteTranslationMemory
+from ainemo.core.tm.memory import InMemoryTranslationMemory
+from ainemo.core.tm.sqlite import (
+    DEFAULT_TM_PATH,
+    MERGE_POLICIES,
+    MERGE_POLICY_LATEST,
+    SqliteTranslationMemory,
+)
 from ainemo.core.validators.base import VIOLATION_SEVERITY_ERROR, Validator
 from ainemo.core.validators.forbidden import ForbiddenTermsValidator
 from ainemo.core.validators.icu import IcuSyntaxValidator
 from ainemo.core.validators.length import LengthBudgetValidator
 from ainemo.core.validators.placeholder import PlaceholderParityValidator
+from ainemo.providers._adaptive import RouteSelector
+from ainemo.providers._bulk import BulkJob, BulkResultProvider, ResultKey, wait_for_bulk
+from ainemo.providers._endpoints import STRATEGIES as ENDPOINT_STRATEGIES
+from ainemo.providers._endpoints import (
+    STRATEGY_LEAST_OUTSTANDING,
+    EndpointPoolOptions,
+    configure_endpoint_pools,
+)
+from ainemo.providers._hedge import DEFAULT_HEDGE_QUANTILE, HedgePolicy
+from ainemo.providers._http import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    DEFAULT_READ_TIMEOUT_S,
+    HttpTransportOptions,
+    configure_client_registry,
+)
 from ainemo.providers._ids import (
     PROVIDER_ID_ANTHROPIC,
     PROVIDER_ID_NLLB,
@@ -38,9 +64,26 @@ from ainemo.providers._ids import (
     PROVIDER_ID_OPENAI,
     PROVIDER_ID_OPUS,
 )
+from ainemo.providers._local_model import DTYPE_FLOAT32, LOCAL_DTYPES, LocalModelOptions
+from ainemo.providers._packing import DEFAULT_PACK_SIZE
+from ainemo.providers._rate_limit import RateLimit, configure_rate_limits, rate_limiters
+from ainemo.providers._response_cache import (
+    DEFAULT_RESPONSE_CACHE_ENTRIES,
+    DEFAULT_RESPONSE_CACHE_TTL_S,
+    ResponseCache,
+    ResponseCacheOptions,
+)
+from ainemo.providers._routes import load_routing_config
 from ainemo.providers._usage_log import DEFAULT_USAGE_LOG_PATH, UsageLog
-from ainemo.providers.base import Provider, ProviderResult
-from ainemo.providers.router import ProviderRouter, RoutingConfig
+from ainemo.providers.base import (
+    BULK_STATE_FAILED,
+    BULK_STATE_PENDING,
+    BulkBatchProvider,
+    Provider,
+    ProviderResult,
+)
+from ainemo.providers.opus._languages import to_opus_config
+from ainemo.providers.router import AdaptiveRule, ProviderRouter, RoutingConfig, RoutingRule
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +113,17 @@ _EXTENSION_TO_FORMAT_ID: dict[str, str] = {
 _EXIT_OK: Final = 0
 _EXIT_VALIDATION_ERROR: Final = 1
 _EXIT_USAGE: Final = 2
+# --collect-batch: the job is still running / the provider rejected it.
+_EXIT_BATCH_PENDING: Final = 3
+_EXIT_BATCH_FAILED: Final = 4
+
+# --- TM backends (CLI --tm-backend flag) ---------------------------------
+
+# ``sqlite`` reads and writes the TM file directly; ``memory`` loads it
+# into an InMemoryTranslationMemory and writes it back once at exit.
+TM_BACKEND_SQLITE: Final = "sqlite"
+TM_BACKEND_MEMORY: Final = "memory"
+_TM_BACKEND_CHOICES: Final = (TM_BACKEND_SQLITE, TM_BACKEND_MEMORY)
 
 # --- Provider registry (CLI --provider flag) -----------------------------
 
@@ -84,6 +138,12 @@ _PROVIDER_CHOICES: Final = (
     PROVIDER_ID_OLLAMA,
 )
 
+# Providers with an offline batch API (--submit-batch / --collect-batch).
+_BULK_PROVIDER_CHOICES: Final = (PROVIDER_ID_OPENAI, PROVIDER_ID_ANTHROPIC)
+
+# --opus-max-model-mb is given in MiB.
+_BYTES_PER_MB: Final = 1024 * 1024
+
 
 # ---------------------------------------------------------------------------
 # `nemo translate`
@@ -129,6 +189,30 @@ def register_translate(
         type=Path,
         default=DEFAULT_TM_PATH,
     )
+    parser.add_argument(
+        "--tm-miss-filter",
+        dest="tm_miss_filter",
+        action="store_true",
+        help=(
+            "Build an in-memory negative-lookup filter over the TM at open so "
+            "certain misses skip the SQLite query and fuzzy scan. Speeds up "
+            "cold runs (new bundle or new target language); assumes no other "
+            "process writes the TM during the run."
+        ),
+    )
+    parser.add_argument(
+        "--tm-backend",
+        dest="tm_backend",
+        choices=_TM_BACKEND_CHOICES,
+        default=TM_BACKEND_SQLITE,
+        help=(
+            "TM storage for this run. ``sqlite`` (default) writes every "
+            "translation through to --tm-path; ``memory`` loads --tm-path "
+            "into memory (when it exists) and snapshots it back at exit — "
+            "faster, but a crash loses the run's new translations. "
+            "--tm-miss-filter has no effect with ``memory``."
+        ),
+    )
     parser.add_argument(
         "--strict",
         dest="strict",
@@ -166,6 +250,470 @@ def register_translate(
             f"Default: {DEFAULT_USAGE_LOG_PATH}."
         ),
     )
+    parser.add_argument(
+        "--routes",
+        dest="routes_path",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help=(
+            "Routing config YAML: static and adaptive rules choosing the provider "
+            "per language pair. Replaces --provider (see docs/providers.md § Routing)."
+        ),
+    )
+    parser.add_argument(
+        "--routing-seed",
+        dest="routing_seed",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Seed the adaptive rules' exploration draws, for reproducible routing.",
+    )
+    parser.add_argument(
+        "--cascade-draft",
+        dest="cascade_draft",
+        choices=_PROVIDER_CHOICES,
+        default=None,
+        metavar="PROVIDER",
+        help=(
+            "Cascade mode: draft every TM miss with this (cheap) provider and send "
+            "only drafts scoring below --cascade-threshold on to --provider / --routes."
+        ),
+    )
+    parser.add_argument(
+        "--cascade-threshold",
+        dest="cascade_threshold",
+        type=float,
+        default=DEFAULT_ESCALATION_THRESHOLD,
+        metavar="SCORE",
+        help=(
+            "Lowest draft score (0-1, from placeholder parity, length budget, "
+            "termbase agreement and validators) kept without escalation. "
+            f"Default: {DEFAULT_ESCALATION_THRESHOLD}."
+        ),
+    )
+    parser.add_argument(
+        "--passthrough",
+        dest="passthrough",
+        action="store_true",
+        help=(
+            "Copy segments with nothing to translate (placeholders only, numbers, "
+            "URLs, email addresses, format strings) to the output without a TM "
+            "lookup or provider call."
+        ),
+    )
+    parser.add_argument(
+        "--passthrough-pattern",
+        dest="passthrough_patterns",
+        action="append",
+        default=[],
+        metavar="REGEX",
+        help="Also pass through segments fully matching REGEX. Repeatable; implies --passthrough.",
+    )
+    parser.add_argument(
+        "--do-not-translate",
+        dest="do_not_translate",
+        action="append",
+        default=[],
+        metavar="TERM",
+        help=(
+            "Also pass through segments that are exactly TERM, ignoring case (brand "
+            "names). Repeatable; implies --passthrough."
+        ),
+    )
+    parser.add_argument(
+        "--mask-placeholders",
+        dest="mask_placeholders",
+        action="store_true",
+        help=(
+            "Send placeholders as short tokens and ICU plural/select branches as "
+            "separate sub-segments, restored after translation. Saves input tokens "
+            "on placeholder-heavy bundles."
+        ),
+    )
+    parser.add_argument(
+        "--plan",
+        dest="plan",
+        action="store_true",
+        help=(
+            "Print the run's estimated tokens, cost (from --usage-log history), TM "
+            "hits and wall time, then exit without calling any provider."
+        ),
+    )
+    parser.add_argument(
+        "--max-cost-usd",
+        dest="max_cost_usd",
+        type=float,
+        default=None,
+        metavar="USD",
+        help=(
+            "Stop calling providers once the run would spend more than USD; the "
+            "rest is left untranslated and reported."
+        ),
+    )
+    parser.add_argument(
+        "--max-tokens",
+        dest="max_tokens",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Same as --max-cost-usd, for input plus output tokens.",
+    )
+    parser.add_argument(
+        "--priority-key",
+        dest="priority_keys",
+        action="append",
+        default=[],
+        metavar="PATTERN",
+        help=(
+            "Under a budget, translate keys matching this glob (e.g. 'checkout.*') "
+            "in every language first. Repeatable. Languages follow --to-langs order."
+        ),
+    )
+    batch = parser.add_mutually_exclusive_group()
+    batch.add_argument(
+        "--submit-batch",
+        dest="submit_batch",
+        type=Path,
+        default=None,
+        metavar="MANIFEST",
+        help=(
+            "Submit every TM miss as one offline batch job (openai, anthropic) at "
+            "the batch price and write its manifest to MANIFEST. Writes no output "
+            "files; run --collect-batch later."
+        ),
+    )
+    batch.add_argument(
+        "--collect-batch",
+        dest="collect_batch",
+        type=Path,
+        default=None,
+        metavar="MANIFEST",
+        help=(
+            "Poll the batch job in MANIFEST; once it has ended, ingest its results "
+            f"and write the outputs. Exits {_EXIT_BATCH_PENDING} while the job is "
+            f"still running and {_EXIT_BATCH_FAILED} when the provider rejected it."
+        ),
+    )
+    parser.add_argument(
+        "--batch-wait",
+        dest="batch_wait",
+        type=float,
+        default=0.0,
+        metavar="SECONDS",
+        help="With --collect-batch, keep polling up to SECONDS for the job to end.",
+    )
+    add_local_model_arguments(parser)
+    add_llm_arguments(parser)
+    add_response_cache_arguments(parser)
+
+
+def add_llm_arguments(parser: argparse.ArgumentParser) -> None:
+    """Request flags for the LLM ``openai`` / ``anthropic`` / ``ollama``
+    providers. Shared by ``nemo translate`` and ``nemo daemon``; other
+    providers ignore them."""
+    group = parser.add_argument_group("LLM options (openai, anthropic, ollama)")
+    group.add_argument(
+        "--llm-pack-size",
+        dest="llm_pack_size",
+        type=int,
+        default=DEFAULT_PACK_SIZE,
+        metavar="N",
+        help=(
+            "Send up to N segments per request as one JSON array; segments "
+            f"missing from the reply are retried singly. Default: {DEFAULT_PACK_SIZE} "
+            "(one request per segment)."
+        ),
+    )
+    group.add_argument(
+        "--llm-max-connections",
+        dest="llm_max_connections",
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        metavar="N",
+        help=(
+            "Connections per provider endpoint in the shared HTTP pool. "
+            f"Default: {DEFAULT_MAX_CONNECTIONS}."
+        ),
+    )
+    group.add_argument(
+        "--llm-endpoint-strategy",
+        dest="llm_endpoint_strategy",
+        choices=ENDPOINT_STRATEGIES,
+        default=STRATEGY_LEAST_OUTSTANDING,
+        help=(
+            "How requests are spread when OLLAMA_HOST / OPENAI_BASE_URL list several "
+            "comma-separated endpoints: fewest requests in flight, or that count "
+            f"weighted by recent latency. Default: {STRATEGY_LEAST_OUTSTANDING}."
+        ),
+    )
+    group.add_argument(
+        "--llm-endpoint-concurrency",
+        dest="llm_endpoint_concurrency",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Requests in flight per pooled endpoint; more wait. Default: unlimited.",
+    )
+    group.add_argument(
+        "--llm-timeout",
+        dest="llm_timeout",
+        type=float,
+        default=DEFAULT_READ_TIMEOUT_S,
+        metavar="SECONDS",
+        help=(
+            "Read timeout per OpenAI / Anthropic request (Ollama reads are "
+            f"unbounded). Default: {DEFAULT_READ_TIMEOUT_S:g}."
+        ),
+    )
+    group.add_argument(
+        "--llm-rpm",
+        dest="llm_rpm",
+        type=float,
+        default=None,
+        metavar="N",
+        help=(
+            "Requests per minute per provider model; calls beyond it queue "
+            "in arrival order. Default: unlimited (rate-limit replies still pause calls)."
+        ),
+    )
+    group.add_argument(
+        "--llm-tpm",
+        dest="llm_tpm",
+        type=float,
+        default=None,
+        metavar="N",
+        help=(
+            "Tokens per minute per provider model, estimated before each call. Default: unlimited."
+        ),
+    )
+    group.add_argument(
+        "--llm-deadline",
+        dest="llm_deadline",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Fail a provider call, retries included, that has not finished in SECONDS.",
+    )
+    group.add_argument(
+        "--llm-hedge",
+        dest="llm_hedge",
+        action="store_true",
+        help=(
+            "Send a duplicate of a call still running past the provider's recent "
+            "--llm-hedge-quantile latency, and keep the first reply."
+        ),
+    )
+    group.add_argument(
+        "--llm-hedge-quantile",
+        dest="llm_hedge_quantile",
+        type=float,
+        default=DEFAULT_HEDGE_QUANTILE,
+        metavar="Q",
+        help=f"Latency quantile that triggers a hedge. Default: {DEFAULT_HEDGE_QUANTILE}.",
+    )
+    group.add_argument(
+        "--llm-hedge-provider",
+        dest="llm_hedge_provider",
+        choices=_PROVIDER_CHOICES,
+        default=None,
+        help="Send hedges to this provider instead (implies --llm-hedge).",
+    )
+    group.add_argument(
+        "--llm-multi-target",
+        dest="llm_multi_target",
+        action="store_true",
+        help=(
+            "Ask for every --to-langs language in the same request, so each "
+            "source string and glossary is sent once rather than once per language."
+        ),
+    )
+
+
+def configure_http_from_args(args: argparse.Namespace) -> None:
+    """Apply the ``--llm-max-connections`` / ``--llm-timeout`` flags
+    to the process-wide provider client registry, and the
+    ``--llm-endpoint-*`` flags to the endpoint pools. Raises
+    ``ValueError`` for out-of-range values."""
+    max_connections = args.llm_max_connections
+    transport_options = HttpTransportOptions(
+        max_connections=max_connections,
+        max_keepalive_connections=min(DEFAULT_MAX_KEEPALIVE_CONNECTIONS, max_connections),
+        read_timeout_s=args.llm_timeout,
+    )
+    pool_options = EndpointPoolOptions(
+        strategy=args.llm_endpoint_strategy, max_concurrency=args.llm_endpoint_concurrency
+    )
+    configure_client_registry(transport_options)
+    configure_endpoint_pools(pool_options)
+
+
+def hedge_policy_from_args(args: argparse.Namespace) -> HedgePolicy | None:
+    """Build the router's :class:`HedgePolicy` from the
+    ``--llm-hedge*`` flags, or ``None`` when hedging is off. Raises
+    ``ValueError`` for out-of-range values."""
+    if not args.llm_hedge and args.llm_hedge_provider is None:
+        return None
+    return HedgePolicy(quantile=args.llm_hedge_quantile, secondary_provider=args.llm_hedge_provider)
+
+
+def configure_rate_limits_from_args(args: argparse.Namespace) -> None:
+    """Apply the ``--llm-rpm`` / ``--llm-tpm`` flags to the
+    process-wide rate limiters. Raises ``ValueError`` for
+    out-of-range values."""
+    configure_rate_limits(
+        RateLimit(requests_per_minute=args.llm_rpm, tokens_per_minute=args.llm_tpm)
+    )
+
+
+def add_response_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    """Router response-cache flags. Shared by ``nemo translate`` and
+    ``nemo daemon``; they apply to every provider."""
+    group = parser.add_argument_group("response cache options")
+    group.add_argument(
+        "--response-cache",
+        dest="response_cache",
+        action="store_true",
+        help=(
+            "Answer repeated single-segment requests (same text, language pair, "
+            "model and prompt addendum) from memory, and send identical concurrent "
+            "requests to the provider once."
+        ),
+    )
+    group.add_argument(
+        "--response-cache-path",
+        dest="response_cache_path",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Also keep cached responses in this SQLite file (implies --response-cache).",
+    )
+    group.add_argument(
+        "--response-cache-size",
+        dest="response_cache_size",
+        type=int,
+        default=DEFAULT_RESPONSE_CACHE_ENTRIES,
+        metavar="N",
+        help=f"Responses kept in memory. Default: {DEFAULT_RESPONSE_CACHE_ENTRIES}.",
+    )
+    group.add_argument(
+        "--response-cache-ttl",
+        dest="response_cache_ttl",
+        type=float,
+        default=DEFAULT_RESPONSE_CACHE_TTL_S,
+        metavar="SECONDS",
+        help=f"Seconds a cached response is served. Default: {DEFAULT_RESPONSE_CACHE_TTL_S:g}.",
+    )
+
+
+def response_cache_from_args(args: argparse.Namespace) -> ResponseCache | None:
+    """Open the router's :class:`ResponseCache` from the
+    ``--response-cache*`` flags, or ``None`` when caching is off.
+    Raises ``ValueError`` for out-of-range values."""
+    if not args.response_cache and args.response_cache_path is None:
+        return None
+    return ResponseCache(
+        ResponseCacheOptions(
+            max_entries=args.response_cache_size,
+            ttl_s=args.response_cache_ttl,
+            path=args.response_cache_path,
+        )
+    )
+
+
+def add_local_model_arguments(parser: argparse.ArgumentParser) -> None:
+    """CPU execution flags for the local ``nllb`` / ``opus`` providers.
+    Shared by ``nemo translate`` and ``nemo daemon``; other providers
+    ignore them."""
+    group = parser.add_argument_group("local model options (nllb, opus)")
+    group.add_argument(
+        "--local-int8",
+        dest="local_int8",
+        action="store_true",
+        help="Dynamically quantize the model's linear layers to int8 at load.",
+    )
+    group.add_argument(
+        "--local-dtype",
+        dest="local_dtype",
+        choices=LOCAL_DTYPES,
+        default=DTYPE_FLOAT32,
+        help=(
+            "Weight dtype. ``bfloat16`` needs native CPU support "
+            "(AVX512-BF16/AMX) and otherwise stays float32."
+        ),
+    )
+    group.add_argument(
+        "--torch-threads",
+        dest="torch_threads",
+        type=int,
+        default=None,
+        metavar="N",
+        help="torch intra-op threads (default: torch's own choice).",
+    )
+    group.add_argument(
+        "--torch-interop-threads",
+        dest="torch_interop_threads",
+        type=int,
+        default=None,
+        metavar="N",
+        help="torch inter-op threads (default: torch's own choice).",
+    )
+    group.add_argument(
+        "--num-beams",
+        dest="num_beams",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Beam width for generation; 1 is greedy (default: the model's own).",
+    )
+    group.add_argument(
+        "--opus-max-models",
+        dest="opus_max_models",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Keep at most N OPUS models loaded, evicting the least recently used.",
+    )
+    group.add_argument(
+        "--opus-max-model-mb",
+        dest="opus_max_model_mb",
+        type=int,
+        default=None,
+        metavar="MB",
+        help="Evict least-recently-used OPUS models while loaded weights exceed MB.",
+    )
+    group.add_argument(
+        "--opus-pin",
+        dest="opus_pinned_target_langs",
+        default="",
+        metavar="LANGS",
+        help="Comma-separated target languages whose OPUS models are never evicted.",
+    )
+
+
+def local_model_options_from_args(args: argparse.Namespace) -> LocalModelOptions:
+    """Build :class:`LocalModelOptions` from the
+    :func:`add_local_model_arguments` flags. Raises ``ValueError`` on
+    invalid combinations (e.g. int8 with bfloat16) and unknown
+    ``--opus-pin`` languages."""
+    pinned = tuple(
+        lang.strip() for lang in args.opus_pinned_target_langs.split(",") if lang.strip()
+    )
+    unknown = [lang for lang in pinned if to_opus_config(lang) is None]
+    if unknown:
+        raise ValueError(f"--opus-pin: OPUS has no en→target model for {unknown}.")
+    return LocalModelOptions(
+        quantize_int8=args.local_int8,
+        dtype=args.local_dtype,
+        num_threads=args.torch_threads,
+        num_interop_threads=args.torch_interop_threads,
+        num_beams=args.num_beams,
+        max_models=args.opus_max_models,
+        max_model_bytes=(
+            args.opus_max_model_mb * _BYTES_PER_MB if args.opus_max_model_mb is not None else None
+        ),
+        pinned_target_langs=pinned,
+    )
 
 
 def run_translate(args: argparse.Namespace) -> int:
@@ -181,14 +729,86 @@ def run_translate(args: argparse.Namespace) -> int:
         logger.error("--to-langs must specify at least one language.")
         return _EXIT_USAGE
 
-    tm = SqliteTranslationMemory(args.tm_path)
+    try:
+        local_options = local_model_options_from_args(args)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        return _EXIT_USAGE
+    if args.llm_pack_size < 1:
+        logger.error("--llm-pack-size must be >= 1, got %d.", args.llm_pack_size)
+        return _EXIT_USAGE
+    if args.llm_deadline is not None and args.llm_deadline <= 0:
+        logger.error("--llm-deadline must be > 0, got %g.", args.llm_deadline)
+        return _EXIT_USAGE
+    try:
+        configure_http_from_args(args)
+        configure_rate_limits_from_args(args)
+        hedge = hedge_policy_from_args(args)
+        response_cache = response_cache_from_args(args)
+        routing_config = _load_routes(args.routes_path) if args.routes_path else None
+        if not 0.0 <= args.cascade_threshold <= 1.0:
+            raise ValueError(
+                f"--cascade-threshold must be in [0, 1], got {args.cascade_threshold:g}."
+            )
+        budget = (
+            RunBudget(max_cost_usd=args.max_cost_usd, max_tokens=args.max_tokens)
+            if args.max_cost_usd is not None or args.max_tokens is not None
+            else None
+        )
+        passthrough = (
+            PassthroughPolicy(
+                patterns=tuple(args.passthrough_patterns),
+                do_not_translate=tuple(args.do_not_translate),
+            )
+            if args.passthrough or args.passthrough_patterns or args.do_not_translate
+            else None
+        )
+        if args.submit_batch is not None or args.collect_batch is not None:
+            _check_batch_args(args)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        return _EXIT_USAGE
+
+    tm = _build_tm(args.tm_backend, args.tm_path, miss_filter=args.tm_miss_filter)
     try:
         # Cycle-2 CLI: the requested ``--provider`` is built lazily and
         # wrapped in a :class:`ProviderRouter` so every call records to
         # the UsageLog (per AGENTS.md § Provider Rules). The pipeline
         # always sees a router — there is no bare-provider path from the
         # CLI any more, even for the noop default.
-        provider: Provider = _build_router(args.provider_id, args.usage_log_path)
+        provider: Provider = _build_router(
+            args.provider_id,
+            args.usage_log_path,
+            local_options=local_options,
+            pack_size=args.llm_pack_size,
+            multi_target=args.llm_multi_target,
+            deadline_s=args.llm_deadline,
+            hedge=hedge,
+            response_cache=response_cache,
+            routing_config=routing_config,
+            routing_seed=args.routing_seed,
+        )
+        batch_job: BulkJob | None = None
+        if args.collect_batch is not None:
+            collected = _collect_batch(args, provider)
+            if isinstance(collected, int):
+                return collected
+            provider, batch_job = collected
+        cascade = None
+        if args.cascade_draft is not None:
+            # The draft leg gets its own router on the same UsageLog,
+            # so both legs of an escalated segment are recorded.
+            cascade = CascadePolicy(
+                draft_provider=_build_router(
+                    args.cascade_draft,
+                    args.usage_log_path,
+                    local_options=local_options,
+                    pack_size=args.llm_pack_size,
+                    deadline_s=args.llm_deadline,
+                    response_cache=response_cache,
+                ),
+                threshold=args.cascade_threshold,
+            )
         validators = _build_validators(args.forbidden_terms)
         pipeline = TranslationPipeline(
             adapter=adapter,
@@ -202,24 +822,223 @@ def run_translate(args: argparse.Namespace) -> int:
             # provider so a prior ``--provider noop`` run does not
             # satisfy a later ``--provider openai`` run. Model is left
             # unconstrained — callers who want per-model scoping pass
-            # it through the routes-config layer (cycle 3).
-            expected_provider=args.provider_id,
+            # it through the routes-config layer (cycle 3). A --routes
+            # config or a cascade may answer from several providers, so
+            # they leave lookups unscoped.
+            expected_provider=(
+                args.provider_id if routing_config is None and cascade is None else None
+            ),
+            cascade=cascade,
+            mask_placeholders=args.mask_placeholders,
+            passthrough=passthrough,
+        )
+        if args.submit_batch is not None:
+            return _submit_batch(args, pipeline, target_langs)
+        plan = None
+        if args.plan or budget is not None:
+            plan = plan_run(
+                pipeline.collect_misses(source_path),
+                segment_count=len(adapter.parse(source_path, args.source_lang)) * len(target_langs),
+                target_langs=target_langs,
+                provider_for=lambda target_lang: _planned_provider(
+                    provider, cascade, args.source_lang, target_lang
+                ),
+                usage_log=UsageLog(args.usage_log_path),
+                budget=budget,
+                priority_keys=args.priority_keys,
+            )
+            if args.plan:
+                _print_plan(plan, source_path)
+                return _EXIT_OK
+        result = pipeline.translate_file(source_path, args.output_dir, plan=plan)
+        _print_translate_summary(
+            result,
+            cascade=cascade is not None,
+            budget=budget,
+            masked=args.mask_placeholders,
+            passthrough=passthrough is not None,
         )
-        result = pipeline.translate_file(source_path, args.output_dir)
-        _print_translate_summary(result)
+        if batch_job is not None:
+            assert isinstance(provider, BulkResultProvider)
+            replace(batch_job, collected=True).save(args.collect_batch)
+            sys.stdout.write(
+                f"  batch:      {provider.result_count} results, "
+                f"{provider.fallback_count} translated interactively\n"
+            )
         if result.error_count > 0:
             return _EXIT_VALIDATION_ERROR
         return _EXIT_OK
     finally:
         tm.close()
+        if response_cache is not None:
+            response_cache.close()
+
+
+def _check_batch_args(args: argparse.Namespace) -> None:
+    """Raise ``ValueError`` unless the translate flags fit a batch job."""
+    flag = "--submit-batch" if args.submit_batch is not None else "--collect-batch"
+    if args.provider_id not in _BULK_PROVIDER_CHOICES:
+        raise ValueError(f"{flag} needs --provider {' or '.join(_BULK_PROVIDER_CHOICES)}.")
+    if args.routes_path is not None or args.cascade_draft is not None:
+        raise ValueError(f"{flag} cannot be combined with --routes or --cascade-draft.")
+    if args.batch_wait < 0:
+        raise ValueError(f"--batch-wait must be >= 0, got {args.batch_wait:g}.")
+    if args.plan or args.max_cost_usd is not None or args.max_tokens is not None:
+        raise ValueError(f"{flag} cannot be combined with --plan or a run budget.")
+    if args.mask_placeholders:
+        raise ValueError(f"{flag} cannot be combined with --mask-placeholders.")
+
+
+def _build_bulk_provider(args: argparse.Namespace) -> BulkBatchProvider:
+    provider = _build_provider(args.provider_id)
+    assert isinstance(provider, BulkBatchProvider)  # Gated by `_check_batch_args`.
+    return provider
+
+
+def _submit_batch(
+    args: argparse.Namespace, pipeline: TranslationPipeline, target_langs: Sequence[str]
+) -> int:
+    """``--submit-batch``: write the manifest, then submit its job.
+
+    A manifest left unsubmitted by an earlier run (a crash between the
+    two steps) is submitted as it is; one whose job was submitted but
+    not collected yet is refused, so no job is orphaned.
+    """
+    path: Path = args.submit_batch
+    bulk = _build_bulk_provider(args)
+    job: BulkJob | None = None
+    if path.exists():
+        try:
+            previous = BulkJob.load(path)
+        except ValueError as exc:
+            logger.error("%s", exc)
+            return _EXIT_USAGE
+        if previous.job_id is not None and not previous.collected:
+            logger.error(
+                "Batch job %s in %s is not collected yet; run --collect-batch first.",
+                previous.job_id,
+                path,
+            )
+            return _EXIT_USAGE
+        if previous.job_id is None and previous.requests and not previous.collected:
+            logger.info("Submitting the unsubmitted batch manifest %s.", path)
+            job = previous
+    if job is None:
+        job = BulkJob.from_misses(
+            pipeline.collect_misses(args.source_path),
+            provider=args.provider_id,
+            model=bulk.model,
+            source_path=args.source_path,
+            source_lang=args.source_lang,
+            target_langs=target_langs,
+        )
+        job.save(path)
+    if job.requests:
+        job = job.submitted(bulk.submit_bulk(list(job.bulk_requests().values())))
+        job.save(path)
+    sys.stdout.write(
+        f"\nBatch submitted:\n"
+        f"  job:        {job.job_id or '(nothing to translate)'}\n"
+        f"  requests:   {len(job.requests)}\n"
+        f"  manifest:   {path}\n"
+    )
+    return _EXIT_OK
+
+
+def _collect_batch(
+    args: argparse.Namespace, fallback: Provider
+) -> tuple[BulkResultProvider, BulkJob] | int:
+    """``--collect-batch``: poll the manifest's job and, once it has
+    ended, fetch its results. Returns the provider serving them to the
+    pipeline, or an exit code. Results are recorded to the UsageLog
+    once, however many times the collect runs."""
+    path: Path = args.collect_batch
+    try:
+        job = BulkJob.load(path)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        return _EXIT_USAGE
+    if job.provider != args.provider_id:
+        logger.error("Batch manifest %s is for --provider %s.", path, job.provider)
+        return _EXIT_USAGE
+    results: dict[ResultKey, ProviderResult] = {}
+    if job.job_id is None:
+        if job.requests:
+            logger.error("Batch manifest %s was never submitted; run --submit-batch.", path)
+            return _EXIT_USAGE
+        return BulkResultProvider(results, fallback), job
+
+    bulk = _build_bulk_provider(args)
+    status = wait_for_bulk(bulk, job.job_id, wait_s=args.batch_wait)
+    if status.state == BULK_STATE_PENDING:
+        sys.stdout.write(
+            f"Batch job {job.job_id} is still running: "
+            f"{status.succeeded + status.failed} of {status.total} requests done.\n"
+        )
+        return _EXIT_BATCH_PENDING
+    if status.state == BULK_STATE_FAILED:
+        logger.error("Batch job %s failed; submit the bundle again.", job.job_id)
+        return _EXIT_BATCH_FAILED
+
+    entries = {entry.custom_id: entry for entry in job.requests}
+    usage_log = UsageLog(args.usage_log_path)
+    for item in bulk.collect_bulk(job.job_id, job.bulk_requests()):
+        entry = entries.get(item.custom_id)
+        if entry is None or item.result is None:
+            logger.warning("Batch request %s failed: %s", item.custom_id, item.error)
+            continue
+        results[entry.result_key] = item.result
+        if not job.usage_recorded:
+            usage_log.record(
+                provider=item.result.provider,
+                model=item.result.model,
+                input_tokens=item.result.input_tokens,
+                output_tokens=item.result.output_tokens,
+                cache_read_tokens=item.result.cache_read_tokens,
+                cache_write_tokens=item.result.cache_write_tokens,
+                latency_ms=item.result.latency_ms,
+                cost_usd=item.result.cost_usd,
+                source_lang=entry.source_lang,
+                target_lang=entry.target_lang,
+                segment_fingerprint=entry.fingerprint,
+                batch_job=job.job_id,
+            )
+    if not job.usage_recorded:
+        job = replace(job, usage_recorded=True)
+        job.save(path)
+    return BulkResultProvider(results, fallback), job
+
+
+def _load_routes(path: Path) -> RoutingConfig:
+    """Load a ``--routes`` file and check it names known providers.
+    Raises ``ValueError``."""
+    config = load_routing_config(path)
+    unknown = [
+        provider_id for provider_id in config.provider_ids() if provider_id not in _PROVIDER_CHOICES
+    ]
+    if unknown:
+        raise ValueError(
+            f"Routes file {path} names unknown provider id(s) {unknown}; "
+            f"known: {list(_PROVIDER_CHOICES)}."
+        )
+    return config
+
+
+def _build_tm(
+    backend: str, tm_path: Path, *, miss_filter: bool
+) -> SqliteTranslationMemory | InMemoryTranslationMemory:
+    if backend == TM_BACKEND_MEMORY:
+        return InMemoryTranslationMemory(snapshot_path=tm_path)
+    return SqliteTranslationMemory(tm_path, membership_filter=miss_filter)
 
 
 # ---------------------------------------------------------------------------
-# `nemo tm stats`
+# `nemo tm stats` / `nemo tm merge`
 # ---------------------------------------------------------------------------
 
 
 _TM_SUBCMD_STATS: Final = "stats"
+_TM_SUBCMD_MERGE: Final = "merge"
 
 
 def register_tm(
@@ -231,17 +1050,60 @@ def register_tm(
         _TM_SUBCMD_STATS, help="Print TM size and hit-rate statistics."
     )
     stats_parser.add_argument("--tm-path", dest="tm_path", type=Path, default=DEFAULT_TM_PATH)
+    stats_parser.add_argument(
+        "--top",
+        dest="top",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Also list the N most-hit translations per target language.",
+    )
+
+    merge_parser = tm_sub.add_parser(
+        _TM_SUBCMD_MERGE,
+        help=(
+            "Merge one or more TM files (e.g. per-shard CI outputs) into an "
+            "output TM. Embeddings are copied, never recomputed."
+        ),
+    )
+    merge_parser.add_argument(
+        "output_path",
+        type=Path,
+        help="Destination TM. Created if missing; existing rows are kept.",
+    )
+    merge_parser.add_argument(
+        "input_paths",
+        type=Path,
+        nargs="+",
+        help="TM files to merge in, in priority order for --policy keep-existing.",
+    )
+    merge_parser.add_argument(
+        "--policy",
+        dest="merge_policy",
+        choices=MERGE_POLICIES,
+        default=MERGE_POLICY_LATEST,
+        help=(
+            "How to resolve two rows for the same (segment, target lang, "
+            "provider, model): ``latest`` keeps the newer created_at; "
+            "``keep-existing`` keeps the first one merged."
+        ),
+    )
 
 
 def run_tm(args: argparse.Namespace) -> int:
     _configure_logging()
-    if args.tm_subcommand != _TM_SUBCMD_STATS:
-        logger.error(
-            "Unknown `nemo tm` subcommand: %r. Try `nemo tm stats`.",
-            args.tm_subcommand,
-        )
-        return _EXIT_USAGE
-    tm_path: Path = args.tm_path
+    if args.tm_subcommand == _TM_SUBCMD_STATS:
+        return _run_tm_stats(args.tm_path, top=args.top)
+    if args.tm_subcommand == _TM_SUBCMD_MERGE:
+        return _run_tm_merge(args.output_path, args.input_paths, args.merge_policy)
+    logger.error(
+        "Unknown `nemo tm` subcommand: %r. Try `nemo tm stats` or `nemo tm merge`.",
+        args.tm_subcommand,
+    )
+    return _EXIT_USAGE
+
+
+def _run_tm_stats(tm_path: Path, *, top: int = 0) -> int:
     if not tm_path.exists():
         logger.error("TM database not found: %s", tm_path)
         return _EXIT_USAGE
@@ -255,6 +1117,69 @@ def run_tm(args: argparse.Namespace) -> int:
             f"  target langs: {stats.target_lang_count}\n"
             f"  embeddings:   {stats.embedding_count}\n"
         )
+        if top > 0:
+            _print_top_translations(tm, top)
+    finally:
+        tm.close()
+    return _EXIT_OK
+
+
+# Columns of the `nemo tm stats --top` listing; source / target text
+# is clipped so one row stays one terminal line.
+_TOP_TEXT_WIDTH: Final = 32
+
+
+def _print_top_translations(tm: SqliteTranslationMemory, top: int) -> None:
+    current_lang: str | None = None
+    for usage in tm.iter_top_translations(per_target_lang=top):
+        translated = usage.translated
+        if translated.target_lang != current_lang:
+            current_lang = translated.target_lang
+            sys.stdout.write(f"\nTop {top} for {current_lang}:\n")
+        last_hit = (
+            datetime.fromtimestamp(usage.last_hit_at, tz=timezone.utc).strftime("%Y-%m-%d %H:%M")
+            if usage.last_hit_at is not None
+            else "-"
+        )
+        sys.stdout.write(
+            f"  {usage.hit_count:>7}  {last_hit}  "
+            f"{translated.provider}/{translated.model or '-'}  "
+            f"{_clip(translated.segment.source_text)!r} → {_clip(translated.target_text)!r}\n"
+        )
+    if current_lang is None:
+        sys.stdout.write("\nNo TM hits recorded yet.\n")
+
+
+def _clip(text: str) -> str:
+    if len(text) <= _TOP_TEXT_WIDTH:
+        return text
+    return text[: _TOP_TEXT_WIDTH - 1] + "…"
+
+
+def _run_tm_merge(output_path: Path, input_paths: list[Path], policy: str) -> int:
+    missing = [path for path in input_paths if not path.is_file()]
+    if missing:
+        logger.error("TM database(s) not found: %s", ", ".join(str(p) for p in missing))
+        return _EXIT_USAGE
+    tm = SqliteTranslationMemory(output_path)
+    try:
+        for input_path in input_paths:
+            try:
+                merged = tm.merge_from(input_path, policy=policy)
+            except ValueError as exc:
+                logger.error("%s", exc)
+                return _EXIT_USAGE
+            sys.stdout.write(
+                f"Merged {input_path}: "
+                f"{merged.segments_read} segments, "
+                f"{merged.translations_written}/{merged.translations_read} translations written\n"
+            )
+        stats = tm.stats()
+        sys.stdout.write(
+            f"TM at {output_path}\n"
+            f"  segments:     {stats.segment_count}\n"
+            f"  translations: {stats.translation_count}\n"
+        )
     finally:
         tm.close()
     return _EXIT_OK
@@ -340,50 +1265,124 @@ def run_validate(args: argparse.Namespace) -> int:
 # ---------------------------------------------------------------------------
 
 
-def _build_provider(provider_id: str) -> Provider:
+def _build_provider(
+    provider_id: str,
+    *,
+    local_options: LocalModelOptions | None = None,
+    pack_size: int = DEFAULT_PACK_SIZE,
+    multi_target: bool = False,
+) -> Provider:
     """Construct a single concrete provider for the CLI's ``--provider``
     choice. Real-SDK providers (NLLB, OPUS, OpenAI) build their lazy
     clients inside their constructors, so module import stays cheap and
     the CLI prints ``--help`` without reaching for any model weights or
-    API keys."""
+    API keys. ``local_options`` applies to the local seq2seq providers
+    only, ``pack_size`` and ``multi_target`` to the LLM providers only."""
     if provider_id == PROVIDER_ID_NOOP:
         return _NoOpProvider()
     if provider_id == PROVIDER_ID_NLLB:
         from ainemo.providers.nllb.nllb_provider import NllbProvider
 
-        return NllbProvider()
+        return NllbProvider(options=local_options)
     if provider_id == PROVIDER_ID_OPUS:
         from ainemo.providers.opus.opus_provider import OpusProvider
 
-        return OpusProvider()
+        return OpusProvider(options=local_options)
     if provider_id == PROVIDER_ID_OPENAI:
         from ainemo.providers.openai.openai_provider import OpenAIProvider
 
-        return OpenAIProvider()
+        return OpenAIProvider(pack_size=pack_size, multi_target=multi_target)
     if provider_id == PROVIDER_ID_ANTHROPIC:
         from ainemo.providers.anthropic.anthropic_provider import AnthropicProvider
 
-        return AnthropicProvider()
+        return AnthropicProvider(pack_size=pack_size, multi_target=multi_target)
     if provider_id == PROVIDER_ID_OLLAMA:
         from ainemo.providers.ollama.ollama_provider import OllamaProvider
 
-        return OllamaProvider()
+        return OllamaProvider(pack_size=pack_size, multi_target=multi_target)
     raise ValueError(f"Unknown provider id: {provider_id!r}. Known ids: {list(_PROVIDER_CHOICES)}.")
 
 
-def _build_router(provider_id: str, usage_log_path: Path) -> ProviderRouter:
+def _build_router(
+    provider_id: str,
+    usage_log_path: Path,
+    *,
+    local_options: LocalModelOptions | None = None,
+    pack_size: int = DEFAULT_PACK_SIZE,
+    multi_target: bool = False,
+    deadline_s: float | None = None,
+    hedge: HedgePolicy | None = None,
+    response_cache: ResponseCache | None = None,
+    routing_config: RoutingConfig | None = None,
+    routing_seed: int | None = None,
+) -> ProviderRouter:
     """Wrap one concrete provider behind a :class:`ProviderRouter`. Even
     a single-provider CLI call goes through the router so cost/latency
     surveillance is uniform across CLI, daemon, and Gradle plugin
-    invocations (per AGENTS.md § Provider Rules)."""
-    provider = _build_provider(provider_id)
+    invocations (per AGENTS.md § Provider Rules). With a
+    ``routing_config`` (``--routes``), every provider it names is
+    registered and ``provider_id`` is ignored."""
+    config = (
+        routing_config
+        if routing_config is not None
+        else RoutingConfig(default_provider=provider_id)
+    )
+    providers = {
+        routed_id: _build_provider(
+            routed_id,
+            local_options=local_options,
+            pack_size=pack_size,
+            multi_target=multi_target,
+        )
+        for routed_id in config.provider_ids()
+    }
+    secondary_id = hedge.secondary_provider if hedge is not None else None
+    if secondary_id is not None and secondary_id not in providers:
+        providers.update(
+            _hedge_providers(
+                config.default_provider,
+                hedge,
+                local_options=local_options,
+                pack_size=pack_size,
+                multi_target=multi_target,
+            )
+        )
     return ProviderRouter(
-        providers={provider_id: provider},
-        routing_config=RoutingConfig(default_provider=provider_id),
+        providers=providers,
+        routing_config=config,
         usage_log=UsageLog(usage_log_path),
+        rate_limiters=rate_limiters(),
+        deadline_s=deadline_s,
+        hedge=hedge,
+        response_cache=response_cache,
+        routing_seed=routing_seed,
     )
 
 
+def _hedge_providers(
+    provider_id: str,
+    hedge: HedgePolicy | None,
+    *,
+    local_options: LocalModelOptions | None,
+    pack_size: int,
+    multi_target: bool,
+) -> dict[str, Provider]:
+    """The hedge policy's secondary provider, when it is not the routed
+    one, for registration next to it. Routing never selects it; only
+    hedges go there."""
+    secondary_id = hedge.secondary_provider if hedge is not None else None
+    if secondary_id is None or secondary_id == provider_id:
+        return {}
+    return {
+        secondary_id: _build_provider(
+            secondary_id,
+            local_options=local_options,
+            pack_size=pack_size,
+            multi_target=multi_target,
+        )
+    }
+
+
 class _NoOpProvider:
     """Cycle-1 placeholder provider. Returns source text unchanged.
 
@@ -447,19 +1446,99 @@ def _build_validators(forbidden_terms: list[str]) -> tuple[Validator, ...]:
     return tuple(validators)
 
 
-def _print_translate_summary(result) -> None:  # type: ignore[no-untyped-def]
+def _print_translate_summary(
+    result: PipelineResult,
+    *,
+    cascade: bool = False,
+    budget: RunBudget | None = None,
+    masked: bool = False,
+    passthrough: bool = False,
+) -> None:
     sys.stdout.write(
         f"\nTranslation summary:\n"
         f"  source:     {result.source_path}\n"
         f"  TM hits:    {result.tm_hit_count}\n"
         f"  provider:   {result.provider_call_count}\n"
-        f"  errors:     {result.error_count}\n"
-        f"  warnings:   {result.warning_count}\n"
     )
+    if cascade:
+        sys.stdout.write(f"  escalated:  {result.escalation_count}\n")
+    if passthrough:
+        sys.stdout.write(f"  passthrough: {result.passthrough_count}\n")
+    if masked:
+        sys.stdout.write(f"  masked:     {result.masked_count}\n")
+    if budget is not None:
+        sys.stdout.write(
+            f"  spent:      ${result.spent_cost_usd:.6f}, {result.spent_tokens} tokens\n"
+            f"  skipped:    {result.skipped_count}\n"
+        )
+        if result.skipped_count:
+            by_lang: dict[str, int] = {}
+            for outcome in result.outcomes:
+                if outcome.skipped:
+                    by_lang[outcome.target_lang] = by_lang.get(outcome.target_lang, 0) + 1
+            sys.stdout.write(
+                "  Run budget reached; these outputs are partial (re-run to continue):\n"
+            )
+            for lang, count in by_lang.items():
+                sys.stdout.write(f"    {lang}: {count} untranslated\n")
+    sys.stdout.write(f"  errors:     {result.error_count}\n  warnings:   {result.warning_count}\n")
     for lang, path in result.target_lang_paths.items():
         sys.stdout.write(f"  → {lang}: {path}\n")
 
 
+def _planned_provider(
+    provider: Provider, cascade: CascadePolicy | None, source_lang: str, target_lang: str
+) -> str:
+    """The provider a target language's TM misses go to first."""
+    first = (
+        cascade.draft_provider
+        if cascade is not None and cascade.draft_provider.supports(source_lang, target_lang)
+        else provider
+    )
+    if isinstance(first, ProviderRouter):
+        return first.explain_route(source_lang, target_lang).provider_id
+    return first.provider_id
+
+
+def _print_plan(plan: RunPlan, source_path: Path) -> None:
+    sys.stdout.write(
+        f"\nRun plan (no provider called; estimates ±50%):\n"
+        f"  source:     {source_path}\n"
+        f"  segments:   {plan.segment_count}\n"
+        f"  TM hits:    {plan.tm_hit_count} (projected)\n"
+        f"  misses:     {plan.miss_count}\n"
+    )
+    for estimate in plan.by_provider():
+        sys.stdout.write(
+            f"    {estimate.provider_id:<12} {estimate.calls} calls, "
+            f"{estimate.input_tokens} in / {estimate.output_tokens} out tokens, "
+            f"{_format_cost(estimate.cost_usd)}, {_format_seconds(estimate.wall_time_s)}\n"
+        )
+    sys.stdout.write(
+        f"  tokens:     {plan.total_tokens}\n"
+        f"  cost:       {_format_cost(plan.cost_usd)}\n"
+        f"  wall time:  {_format_seconds(plan.wall_time_s)}\n"
+    )
+    if plan.budget is not None:
+        sys.stdout.write(
+            f"  budget:     {plan.admitted_count} of {plan.miss_count} misses fit; "
+            f"{len(plan.skipped)} would be skipped\n"
+        )
+        if plan.budget.max_cost_usd is not None and plan.unpriced_providers:
+            sys.stdout.write(
+                f"  note:       no cost history for {', '.join(plan.unpriced_providers)}; "
+                "--max-cost-usd is checked against recorded spend during the run only\n"
+            )
+
+
+def _format_cost(cost_usd: float | None) -> str:
+    return f"~${cost_usd:.6f}" if cost_usd is not None else "cost unknown (no usage history)"
+
+
+def _format_seconds(seconds: float | None) -> str:
+    return f"~{seconds:.1f} s" if seconds is not None else "time unknown (no usage history)"
+
+
 def _configure_logging() -> None:
     logging.basicConfig(
         level=logging.INFO,
@@ -478,6 +1557,9 @@ def _configure_logging() -> None:
 
 _PROVIDER_SUBCMD_LIST: Final = "list"
 _PROVIDER_SUBCMD_STATS: Final = "stats"
+_PROVIDER_SUBCMD_ROUTES: Final = "routes"
+_ROUTES_DEFAULT_SOURCE_LANG: Final = "en-US"
+_PAIR_SEPARATOR: Final = ":"
 
 
 def register_provider(
@@ -511,6 +1593,45 @@ def register_provider(
         help="ISO-format timestamp; only count records with timestamp >= this.",
     )
 
+    routes_parser = provider_sub.add_parser(
+        _PROVIDER_SUBCMD_ROUTES,
+        help="Show a --routes file's rules, or explain which provider each pair routes to.",
+    )
+    routes_parser.add_argument("--routes", dest="routes_path", type=Path, required=True)
+    routes_parser.add_argument(
+        "--usage-log",
+        dest="usage_log_path",
+        type=Path,
+        default=DEFAULT_USAGE_LOG_PATH,
+        help="Adaptive rules score candidates from this log's recent calls.",
+    )
+    routes_parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Print the routing decision, its reason, and per-candidate scores for each pair.",
+    )
+    routes_parser.add_argument(
+        "--pair",
+        dest="pairs",
+        action="append",
+        default=None,
+        metavar="SRC:TGT",
+        help=(
+            "Language pair to explain (repeatable). Default: each rule's target_lang, "
+            f"from its source_lang or {_ROUTES_DEFAULT_SOURCE_LANG}."
+        ),
+    )
+    routes_parser.add_argument("--persona", default=None)
+    routes_parser.add_argument("--domain", default=None)
+    routes_parser.add_argument(
+        "--seed",
+        dest="routing_seed",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Seed for the exploration draws (same as `nemo translate --routing-seed`).",
+    )
+
 
 def run_provider(args: argparse.Namespace) -> int:
     _configure_logging()
@@ -519,9 +1640,11 @@ def run_provider(args: argparse.Namespace) -> int:
         return _run_provider_list()
     if sub == _PROVIDER_SUBCMD_STATS:
         return _run_provider_stats(args.usage_log_path, args.since_iso)
+    if sub == _PROVIDER_SUBCMD_ROUTES:
+        return _run_provider_routes(args)
     logger.error(
-        "Unknown `nemo provider` subcommand: %r. Try `nemo provider list` or "
-        "`nemo provider stats`.",
+        "Unknown `nemo provider` subcommand: %r. Try `nemo provider list`, "
+        "`nemo provider stats`, or `nemo provider routes`.",
         sub,
     )
     return _EXIT_USAGE
@@ -594,9 +1717,15 @@ def _run_provider_stats(usage_log_path: Path, since_iso: str | None) -> int:
         f"  calls:               {stats.call_count}\n"
         f"  total input tokens:  {stats.total_input_tokens}\n"
         f"  total output tokens: {stats.total_output_tokens}\n"
+        f"  cache read tokens:   {stats.total_cache_read_tokens}\n"
+        f"  cache write tokens:  {stats.total_cache_write_tokens}\n"
         f"  total latency (ms):  {stats.total_latency_ms}\n"
         f"  total cost (USD):    {stats.total_cost_usd:.6f}\n"
     )
+    if stats.response_cache_hits:
+        sys.stdout.write(f"  response cache hits: {stats.response_cache_hits}\n")
+    if stats.batch_calls:
+        sys.stdout.write(f"  batch job calls:     {stats.batch_calls}\n")
     if stats.by_provider:
         sys.stdout.write("  by provider:\n")
         for provider, count in sorted(stats.by_provider.items()):
@@ -605,9 +1734,103 @@ def _run_provider_stats(usage_log_path: Path, since_iso: str | None) -> int:
         sys.stdout.write("  by model:\n")
         for model, count in sorted(stats.by_model.items()):
             sys.stdout.write(f"    {model:<32} {count}\n")
+    if stats.by_endpoint:
+        sys.stdout.write("  by endpoint (calls, mean latency ms):\n")
+        for endpoint, count in sorted(stats.by_endpoint.items()):
+            mean_ms = stats.latency_ms_by_endpoint.get(endpoint, 0) / count
+            sys.stdout.write(f"    {endpoint:<32} {count:>6} {mean_ms:>8.0f}\n")
+    return _EXIT_OK
+
+
+def _run_provider_routes(args: argparse.Namespace) -> int:
+    """List a routes file's rules; with ``--explain``, route each pair
+    the way ``nemo translate --routes`` would, from the usage log's
+    recent calls, without building any provider."""
+    try:
+        config = _load_routes(args.routes_path)
+        pairs = [_parse_pair(pair) for pair in args.pairs or ()] or _rule_pairs(config)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        return _EXIT_USAGE
+    sys.stdout.write(f"Routes: {args.routes_path}\n")
+    sys.stdout.write(f"  default: {config.default_provider}\n")
+    for index, rule in enumerate(config.rules):
+        sys.stdout.write(f"  rule {index}: {_describe_rule(rule)}\n")
+    if not args.explain:
+        return _EXIT_OK
+    if not pairs:
+        logger.error("No rule names a target_lang; pass --pair SRC:TGT to explain.")
+        return _EXIT_USAGE
+    usage_log = UsageLog(args.usage_log_path) if args.usage_log_path.exists() else None
+    selector = RouteSelector(
+        config.rules, config.default_provider, usage_log=usage_log, seed=args.routing_seed
+    )
+    for source_lang, target_lang in pairs:
+        decision = selector.decide(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            persona=args.persona,
+            domain=args.domain,
+        )
+        sys.stdout.write(
+            f"\n{source_lang} -> {target_lang}: {decision.provider_id} ({decision.reason})\n"
+        )
+        if decision.scores:
+            sys.stdout.write(
+                f"    {'candidate':<12} {'calls':>6} {'latency ms':>11} {'errors':>7} "
+                f"{'$/1k tok':>9}  note\n"
+            )
+        for score in decision.scores:
+            latency = "-" if score.latency_ms is None else f"{score.latency_ms:.0f}"
+            cost = (
+                "-"
+                if score.cost_per_1k_tokens_usd is None
+                else f"{score.cost_per_1k_tokens_usd:.4f}"
+            )
+            sys.stdout.write(
+                f"    {score.provider_id:<12} {score.samples:>6} {latency:>11} "
+                f"{score.error_rate:>7.0%} {cost:>9}  {score.note}\n"
+            )
     return _EXIT_OK
 
 
+def _parse_pair(value: str) -> tuple[str, str]:
+    source_lang, separator, target_lang = value.partition(_PAIR_SEPARATOR)
+    if not separator or not source_lang or not target_lang:
+        raise ValueError(
+            f"--pair must be SRC{_PAIR_SEPARATOR}TGT (e.g. en-US:de-DE), got {value!r}."
+        )
+    return source_lang, target_lang
+
+
+def _rule_pairs(config: RoutingConfig) -> list[tuple[str, str]]:
+    pairs: list[tuple[str, str]] = []
+    for rule in config.rules:
+        if rule.target_lang is None:
+            continue
+        pair = (rule.source_lang or _ROUTES_DEFAULT_SOURCE_LANG, rule.target_lang)
+        if pair not in pairs:
+            pairs.append(pair)
+    return pairs
+
+
+def _describe_rule(rule: RoutingRule | AdaptiveRule) -> str:
+    filters = ", ".join(
+        f"{name}={value}"
+        for name, value in (
+            ("source_lang", rule.source_lang),
+            ("target_lang", rule.target_lang),
+            ("persona", rule.persona),
+            ("domain", rule.domain),
+        )
+        if value is not None
+    )
+    when = f" when {filters}" if filters else " (any call)"
+    if isinstance(rule, AdaptiveRule):
+        return f"{rule.objective} over {list(rule.candidates)}{when}"
+    return f"{rule.provider_id}{when}"
+
+
 def _parse_iso(s: str) -> datetime:
     """Best-effort ISO-8601 parse. Bare dates accepted as midnight UTC."""
     try:
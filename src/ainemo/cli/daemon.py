@@ -15,10 +15,34 @@ Response (err):
 
 Operations (cycle-2 minimum surface):
 
-- ``ping`` — health check; returns ``{"pong": true}``
+- ``ping`` — health check; returns ``{"pong": true, "ready": ...}``.
+  ``ready`` is false while a warm-up is still running; ping itself
+  never waits for one.
 - ``translate`` — single-segment translation through the router; the
   Gradle plugin batches by issuing many requests on one daemon
-  process, amortizing model load + SDK init across the build.
+  process, amortizing model load + SDK init across the build. With
+  the optional ``tm_path`` param the TM is consulted first and
+  validated provider output is stored back.
+- ``release_models`` — unload the local (nllb / opus) models the daemon
+  has loaded, so a long build can free memory between phases. Pinned
+  OPUS models stay unless ``include_pinned`` is true; everything
+  reloads on demand.
+- ``warmup`` — build a provider, load its models for the given
+  language pairs, open a TM (preloading the daemon's ``--hot-set``)
+  and/or termbase, all in a background thread. Returns at once; poll
+  ``ping`` for ``ready``. ``nemo daemon --preload`` queues the same
+  work at start-up.
+- ``http_pools`` — request and connection counts for the shared HTTP
+  pools of the cloud providers (see :mod:`ainemo.providers._http`),
+  and the load, latency and health of each pooled endpoint when
+  ``OLLAMA_HOST`` / ``OPENAI_BASE_URL`` list several (see
+  :mod:`ainemo.providers._endpoints`).
+- ``rate_limits`` — budget, queue and throttle state of each
+  (provider, model) rate limiter (see
+  :mod:`ainemo.providers._rate_limit`).
+- ``response_cache`` — size, hit and coalescing counts of the routers'
+  response cache (see :mod:`ainemo.providers._response_cache`);
+  ``null`` when ``--response-cache`` is off.
 
 Errors are line-delimited JSON envelopes — never raw stack traces on
 stdout. Stderr is reserved for human-readable diagnostics that the
@@ -31,19 +55,37 @@ import argparse
 import json
 import logging
 import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Final, Mapping, TextIO
 
-from ainemo.core.segment import Segment
+from ainemo.core.segment import (
+    TRANSLATION_SOURCE_PROVIDER,
+    Segment,
+    TranslatedSegment,
+)
 
 if TYPE_CHECKING:
     # Kuzu is a heavyweight dep (cycle-3); keep it out of import-time
     # for daemons that never get a persona-aware request.
     from ainemo.core.termbase.base import Persona
     from ainemo.core.termbase.kuzu.store import KuzuTermbase
+    from ainemo.core.tm.cached import CachedTranslationMemory
+from ainemo.providers._hedge import HedgePolicy
+from ainemo.providers._local_model import LocalModelOptions
+from ainemo.providers._packing import DEFAULT_PACK_SIZE
+from ainemo.providers._response_cache import ResponseCache
 from ainemo.providers._usage_log import DEFAULT_USAGE_LOG_PATH, UsageLog
-from ainemo.providers.base import Provider, ProviderResult
+from ainemo.providers.base import (
+    Provider,
+    ProviderResult,
+    ReleasableProvider,
+    WarmableProvider,
+)
 from ainemo.providers.router import (
+    ProviderDeadlineExceeded,
     ProviderRouteNotFound,
     ProviderRouter,
     ProviderUnsupportedPair,
@@ -72,6 +114,11 @@ ERROR_KEY_MESSAGE: Final = "message"
 OP_PING: Final = "ping"
 OP_TRANSLATE: Final = "translate"
 OP_TRANSLATE_FILE: Final = "translate_file"
+OP_RELEASE_MODELS: Final = "release_models"
+OP_WARMUP: Final = "warmup"
+OP_HTTP_POOLS: Final = "http_pools"
+OP_RATE_LIMITS: Final = "rate_limits"
+OP_RESPONSE_CACHE: Final = "response_cache"
 
 # Error codes — the Gradle plugin pattern-matches on ``error.code``
 # strings rather than message text; codes are stable, messages can
@@ -82,6 +129,7 @@ ERR_VERSION_MISMATCH: Final = "version-mismatch"
 ERR_UNKNOWN_OP: Final = "unknown-op"
 ERR_INVALID_PARAMS: Final = "invalid-params"
 ERR_PROVIDER_FAILURE: Final = "provider-failure"
+ERR_DEADLINE_EXCEEDED: Final = "deadline-exceeded"
 ERR_INTERNAL: Final = "internal"
 
 # Translate-op param keys.
@@ -106,6 +154,51 @@ PARAM_TM_PATH: Final = "tm_path"
 # that location with the starter personas.
 PARAM_PERSONA_ID: Final = "persona_id"
 PARAM_TERMBASE_PATH: Final = "termbase_path"
+# Optional translate_file param: token budget for the persona +
+# glossary addendum (``PromptBudget``). Absent keeps the full addendum.
+PARAM_GLOSSARY_MAX_TOKENS: Final = "glossary_max_tokens"
+# Optional translate_file param: send placeholders / ICU branches
+# masked (``ainemo.core.masking``).
+PARAM_MASK_PLACEHOLDERS: Final = "mask_placeholders"
+# Optional translate_file params: copy non-translatable segments
+# (``ainemo.core.passthrough``). Setting patterns or terms implies
+# ``passthrough``; the persona's ``do_not_translate`` list is added.
+PARAM_PASSTHROUGH: Final = "passthrough"
+PARAM_PASSTHROUGH_PATTERNS: Final = "passthrough_patterns"
+PARAM_DO_NOT_TRANSLATE: Final = "do_not_translate"
+
+# release_models-op params + result keys. ``provider`` (optional)
+# limits the release to one provider id.
+PARAM_INCLUDE_PINNED: Final = "include_pinned"
+RESULT_RELEASED_MODEL_COUNT: Final = "released_model_count"
+RESULT_RELEASED_BY_PROVIDER: Final = "released_by_provider"
+
+# warmup-op params (``provider`` / ``tm_path`` / ``termbase_path`` are
+# shared with the other ops). ``lang_pairs`` is a list of
+# ``[source_lang, target_lang]`` pairs.
+PARAM_LANG_PAIRS: Final = "lang_pairs"
+
+# http_pools-op result key: one object per pooled HTTP transport of
+# the cloud providers, with the ``PoolStats`` fields plus
+# ``utilization``.
+RESULT_POOLS: Final = "pools"
+RESULT_POOL_UTILIZATION: Final = "utilization"
+# Additive: one object per pooled endpoint, with the
+# ``EndpointStats`` fields.
+RESULT_ENDPOINTS: Final = "endpoints"
+
+# rate_limits-op result key: one object per (provider, model) limiter,
+# with the ``RateLimiterStats`` fields.
+RESULT_LIMITERS: Final = "limiters"
+
+# response_cache-op result key: the ``ResponseCacheStats`` fields, or
+# null without a cache.
+RESULT_RESPONSE_CACHE: Final = "response_cache"
+
+# ping-op result keys.
+RESULT_PONG: Final = "pong"
+RESULT_READY: Final = "ready"
+RESULT_WARMUP_ERRORS: Final = "warmup_errors"
 
 # translate_file-op result keys.
 RESULT_TARGET_LANG_PATHS: Final = "target_lang_paths"
@@ -113,6 +206,9 @@ RESULT_TM_HIT_COUNT: Final = "tm_hit_count"
 RESULT_PROVIDER_CALL_COUNT: Final = "provider_call_count"
 RESULT_ERROR_COUNT: Final = "error_count"
 RESULT_WARNING_COUNT: Final = "warning_count"
+RESULT_PROMPT_TOKENS_SAVED: Final = "prompt_tokens_saved"
+RESULT_MASKED_COUNT: Final = "masked_count"
+RESULT_PASSTHROUGH_COUNT: Final = "passthrough_count"
 
 # Translate-op result keys.
 RESULT_TARGET_TEXT: Final = "target_text"
@@ -122,12 +218,81 @@ RESULT_INPUT_TOKENS: Final = "input_tokens"
 RESULT_OUTPUT_TOKENS: Final = "output_tokens"
 RESULT_LATENCY_MS: Final = "latency_ms"
 RESULT_COST_USD: Final = "cost_usd"
+# Additive: where the translation came from — one of
+# ``TRANSLATION_SOURCE_*`` (``provider`` unless ``tm_path`` was set and
+# the TM answered).
+RESULT_TRANSLATION_SOURCE: Final = "translation_source"
 
 
 # --- Argparse registration ------------------------------------------------
 
 CMD_NAME_DAEMON: Final = "daemon"
 
+# Startup exit code for invalid flag combinations (matches `nemo translate`).
+_EXIT_USAGE: Final = 2
+
+# Source language assumed by translate_file and by ``--preload`` pairs
+# that name only a target language.
+DEFAULT_SOURCE_LANG: Final = "en-US"
+
+# ``--preload`` syntax: ``provider[:pairs]`` where pairs are
+# comma-separated ``source/target`` (or bare ``target``) tags.
+_PRELOAD_PROVIDER_SEPARATOR: Final = ":"
+_PRELOAD_PAIR_SEPARATOR: Final = ","
+_PRELOAD_LANG_SEPARATOR: Final = "/"
+
+# Hot-set preload on start: the N most-hit rows per target language of
+# the default TM are loaded into the daemon's lookup cache, so a
+# long-lived daemon serves most exact hits without touching disk.
+# 0 disables the preload.
+DEFAULT_HOT_SET_PER_TARGET_LANG: Final = 1000
+
+# How long ``close`` waits for running warm-ups. A model download can
+# take minutes; past this the daemon shuts down without waiting.
+_WARMUP_JOIN_TIMEOUT_S: Final = 5.0
+
+
+@dataclass(frozen=True)
+class PreloadSpec:
+    """One ``--preload`` flag: a provider and the pairs to warm."""
+
+    provider_id: str
+    lang_pairs: tuple[tuple[str, str], ...] = ()
+
+
+@dataclass(frozen=True)
+class WarmupPlan:
+    """Everything one warm-up pass loads, in order: providers (with
+    their models), then the TM hot set, then the termbase."""
+
+    providers: tuple[PreloadSpec, ...] = ()
+    tm_path: Path | None = None
+    hot_set_per_target_lang: int = 0
+    termbase_path: str | None = None
+
+
+def parse_preload_spec(text: str) -> PreloadSpec:
+    """Parse ``provider[:pairs]`` — e.g. ``opus:de-DE,fr-FR`` or
+    ``nllb:en-US/de-DE,ja-JP/en-US``. A bare target uses
+    :data:`DEFAULT_SOURCE_LANG` as the source. Raises ``ValueError``
+    (which argparse reports as a usage error)."""
+    provider_id, _, pairs_text = text.partition(_PRELOAD_PROVIDER_SEPARATOR)
+    provider_id = provider_id.strip()
+    if not provider_id:
+        raise ValueError(f"--preload {text!r}: missing provider id")
+    pairs: list[tuple[str, str]] = []
+    for item in pairs_text.split(_PRELOAD_PAIR_SEPARATOR):
+        item = item.strip()
+        if not item:
+            continue
+        source, sep, target = item.partition(_PRELOAD_LANG_SEPARATOR)
+        if not sep:
+            source, target = DEFAULT_SOURCE_LANG, item
+        if not source.strip() or not target.strip():
+            raise ValueError(f"--preload {text!r}: bad language pair {item!r}")
+        pairs.append((source.strip(), target.strip()))
+    return PreloadSpec(provider_id=provider_id, lang_pairs=tuple(pairs))
+
 
 def register_daemon(
     subparsers: argparse._SubParsersAction,  # type: ignore[type-arg]
@@ -146,6 +311,57 @@ def register_daemon(
         type=Path,
         default=DEFAULT_USAGE_LOG_PATH,
     )
+    parser.add_argument(
+        "--tm-path",
+        dest="tm_path",
+        type=Path,
+        default=None,
+        help=(
+            "TM whose hot set is preloaded on start (default: "
+            "./.ainemo/tm.sqlite, when it exists). Requests may still name "
+            "other TMs via their tm_path param."
+        ),
+    )
+    parser.add_argument(
+        "--hot-set",
+        dest="hot_set_per_target_lang",
+        type=int,
+        default=DEFAULT_HOT_SET_PER_TARGET_LANG,
+        metavar="N",
+        help="Preload the N most-hit TM rows per target language (0 disables).",
+    )
+    parser.add_argument(
+        "--preload",
+        dest="preload",
+        type=parse_preload_spec,
+        action="append",
+        default=[],
+        metavar="PROVIDER[:PAIRS]",
+        help=(
+            "Build PROVIDER and warm its models for PAIRS (comma-separated "
+            "'source/target' or bare 'target' tags) in a background thread "
+            "at start. Repeatable. ping reports ready once every preload, "
+            "the TM hot set and --preload-termbase are loaded."
+        ),
+    )
+    parser.add_argument(
+        "--preload-termbase",
+        dest="preload_termbase_path",
+        default=None,
+        metavar="PATH",
+        help="Open this Kuzu termbase during the start-up warm-up.",
+    )
+    # Same CPU and LLM flags as `nemo translate`; they apply to every
+    # router the daemon builds.
+    from ainemo.cli.commands import (
+        add_llm_arguments,
+        add_local_model_arguments,
+        add_response_cache_arguments,
+    )
+
+    add_local_model_arguments(parser)
+    add_llm_arguments(parser)
+    add_response_cache_arguments(parser)
 
 
 def run_daemon(args: argparse.Namespace) -> int:
@@ -159,8 +375,75 @@ def run_daemon(args: argparse.Namespace) -> int:
     # ``\r``. ``newline=""`` forces stream-level pass-through.
     sys.stdin.reconfigure(encoding="utf-8", newline="")  # type: ignore[union-attr]
     sys.stdout.reconfigure(encoding="utf-8", newline="")  # type: ignore[union-attr]
-    server = DaemonServer(usage_log_path=args.usage_log_path)
-    server.serve(stdin=sys.stdin, stdout=sys.stdout)
+    from ainemo.cli.commands import (
+        _PROVIDER_CHOICES,
+        configure_http_from_args,
+        configure_rate_limits_from_args,
+        hedge_policy_from_args,
+        local_model_options_from_args,
+        response_cache_from_args,
+    )
+
+    try:
+        local_options = local_model_options_from_args(args)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        return _EXIT_USAGE
+    if args.llm_pack_size < 1:
+        logger.error("--llm-pack-size must be >= 1, got %d.", args.llm_pack_size)
+        return _EXIT_USAGE
+    if args.llm_deadline is not None and args.llm_deadline <= 0:
+        logger.error("--llm-deadline must be > 0, got %g.", args.llm_deadline)
+        return _EXIT_USAGE
+    try:
+        configure_http_from_args(args)
+        configure_rate_limits_from_args(args)
+        hedge = hedge_policy_from_args(args)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        return _EXIT_USAGE
+    unknown = [
+        spec.provider_id for spec in args.preload if spec.provider_id not in _PROVIDER_CHOICES
+    ]
+    if unknown:
+        logger.error("--preload: unknown provider id(s) %s; known: %s", unknown, _PROVIDER_CHOICES)
+        return _EXIT_USAGE
+    try:
+        response_cache = response_cache_from_args(args)
+    except ValueError as exc:
+        logger.error("%s", exc)
+        return _EXIT_USAGE
+    server = DaemonServer(
+        usage_log_path=args.usage_log_path,
+        local_options=local_options,
+        pack_size=args.llm_pack_size,
+        multi_target=args.llm_multi_target,
+        deadline_s=args.llm_deadline,
+        hedge=hedge,
+        response_cache=response_cache,
+        hot_set_per_target_lang=args.hot_set_per_target_lang,
+    )
+    from ainemo.core.tm.sqlite import DEFAULT_TM_PATH
+
+    tm_path = args.tm_path if args.tm_path is not None else DEFAULT_TM_PATH
+    # An explicit --tm-path is opened (and created) even when empty; the
+    # implicit default is only preloaded when a previous run left one.
+    preload_tm = args.hot_set_per_target_lang > 0 and (args.tm_path is not None or tm_path.exists())
+    plan = WarmupPlan(
+        providers=tuple(args.preload),
+        tm_path=tm_path if preload_tm else None,
+        hot_set_per_target_lang=args.hot_set_per_target_lang,
+        termbase_path=args.preload_termbase_path,
+    )
+    if plan.providers or plan.tm_path is not None or plan.termbase_path is not None:
+        # Warm in the background: ping answers (with ready=false) while
+        # models load, so the Gradle plugin's start-up check never
+        # times out on a model download.
+        server.start_warmup(plan)
+    try:
+        server.serve(stdin=sys.stdin, stdout=sys.stdout)
+    finally:
+        server.close()
     return 0
 
 
@@ -176,17 +459,108 @@ class DaemonServer:
     client (the cycle-2 win for batch jobs like the Gradle plugin).
     """
 
-    def __init__(self, *, usage_log_path: Path = DEFAULT_USAGE_LOG_PATH) -> None:
+    def __init__(
+        self,
+        *,
+        usage_log_path: Path = DEFAULT_USAGE_LOG_PATH,
+        local_options: LocalModelOptions | None = None,
+        pack_size: int = DEFAULT_PACK_SIZE,
+        multi_target: bool = False,
+        deadline_s: float | None = None,
+        hedge: HedgePolicy | None = None,
+        response_cache: ResponseCache | None = None,
+        hot_set_per_target_lang: int = DEFAULT_HOT_SET_PER_TARGET_LANG,
+    ) -> None:
         self._usage_log_path = usage_log_path
+        # CPU execution options for the local nllb/opus providers.
+        self._local_options = local_options
+        # Segments per request, and whether one request covers every
+        # target language, for the LLM providers.
+        self._pack_size = pack_size
+        self._multi_target = multi_target
+        # Per-call deadline and hedge policy of every router.
+        self._deadline_s = deadline_s
+        self._hedge = hedge
+        # Response cache shared by every router; closed with the daemon.
+        self._response_cache = response_cache
+        # ``--hot-set``: rows per target language a TM warm-up preloads,
+        # on start and for the ``warmup`` op alike.
+        self._hot_set_per_target_lang = hot_set_per_target_lang
         # Cache: provider_id → built ProviderRouter (each router wraps
         # one concrete backend + a UsageLog handle). Built lazily so a
         # daemon only ever connects to providers the caller asks for.
         self._routers: dict[str, ProviderRouter] = {}
+        # The concrete provider behind each router, for ops that manage
+        # provider resources directly (release_models).
+        self._providers: dict[str, Provider] = {}
         # Cycle-3 S6: cache: termbase_path string → KuzuTermbase
         # handle. Lazily opened the first time a persona-aware request
         # arrives; reused across requests so Kuzu's per-open cost
         # amortizes over the daemon lifetime.
         self._termbases: dict[str, "KuzuTermbase"] = {}
+        # Cache: resolved tm_path → SQLite TM wrapped in the LRU lookup
+        # cache. Kept open for the daemon lifetime so repeated lookups
+        # for the same fingerprints across requests (one translate_file
+        # per target-language batch, many single-segment translates)
+        # are answered from memory. Keyed on the resolved path, so the
+        # relative ``--tm-path`` preloaded on start and the absolute
+        # path a build sends share one TM.
+        self._tms: dict[Path, "CachedTranslationMemory"] = {}
+        # Guards the three caches above: a warm-up thread builds into
+        # them while the serve loop reads them.
+        self._build_lock = threading.RLock()
+        # Warm-up bookkeeping, reported by ping.
+        self._state_lock = threading.Lock()
+        self._warmups_pending = 0
+        self._warmup_errors: list[str] = []
+        self._warmup_threads: list[threading.Thread] = []
+        # Set by close(): warm-ups skip the steps they have not begun.
+        self._closing = threading.Event()
+
+    def preload_hot_set(self, tm_path: Path, *, per_target_lang: int) -> int:
+        """Warm the cached TM for ``tm_path`` with its most-hit rows;
+        return the number of rows loaded. Requests naming the same
+        ``tm_path`` then hit the warmed cache."""
+        return self._get_or_build_tm(tm_path).preload_hot_set(per_target_lang=per_target_lang)
+
+    def start_warmup(self, plan: WarmupPlan) -> threading.Thread:
+        """Run ``plan`` in a background thread and return the thread.
+        :attr:`ready` is false until it (and any other warm-up) ends."""
+        with self._state_lock:
+            self._warmups_pending += 1
+        thread = threading.Thread(
+            target=self._run_warmup, args=(plan,), name="nemo-daemon-warmup", daemon=True
+        )
+        self._warmup_threads.append(thread)
+        thread.start()
+        return thread
+
+    @property
+    def ready(self) -> bool:
+        """``True`` when no warm-up is running."""
+        with self._state_lock:
+            return self._warmups_pending == 0
+
+    def close(self) -> None:
+        """Release the cached TM handles and the response cache. Called
+        once stdin reaches EOF."""
+        # A warm-up still loading would otherwise write into TMs that
+        # are being closed. It stops at its next step; a step that is
+        # stuck (e.g. a model download) gets a bounded wait.
+        self._closing.set()
+        deadline = time.monotonic() + _WARMUP_JOIN_TIMEOUT_S
+        for thread in self._warmup_threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        if any(thread.is_alive() for thread in self._warmup_threads):
+            logger.warning(
+                "warm-up still running after %.0fs; shutting down without it",
+                _WARMUP_JOIN_TIMEOUT_S,
+            )
+        for tm in self._tms.values():
+            tm.close()
+        self._tms.clear()
+        if self._response_cache is not None:
+            self._response_cache.close()
 
     def serve(self, *, stdin: TextIO, stdout: TextIO) -> None:
         """Read newline-delimited JSON requests from ``stdin`` and
@@ -264,6 +638,12 @@ class DaemonServer:
                 code=ERR_PROVIDER_FAILURE,
                 message=str(exc),
             )
+        except ProviderDeadlineExceeded as exc:
+            return _error_envelope(
+                request_id=request_id,
+                code=ERR_DEADLINE_EXCEEDED,
+                message=str(exc),
+            )
         except SystemExit as exc:
             # P2 fix (PR #7 review): the cycle-1 CLI helpers raise
             # ``SystemExit`` for usage errors (unknown bundle extension,
@@ -291,7 +671,62 @@ class DaemonServer:
     # --- Op handlers ---
 
     def _op_ping(self, params: Mapping[str, Any]) -> dict[str, Any]:
-        return {"pong": True}
+        with self._state_lock:
+            return {
+                RESULT_PONG: True,
+                RESULT_READY: self._warmups_pending == 0,
+                RESULT_WARMUP_ERRORS: list(self._warmup_errors),
+            }
+
+    def _op_warmup(self, params: Mapping[str, Any]) -> dict[str, Any]:
+        provider_id = params.get(PARAM_PROVIDER)
+        pairs_raw = params.get(PARAM_LANG_PAIRS, [])
+        tm_path_raw = params.get(PARAM_TM_PATH)
+        termbase_path_raw = params.get(PARAM_TERMBASE_PATH)
+        if provider_id is not None and (not isinstance(provider_id, str) or not provider_id):
+            raise _DaemonRequestError(
+                code=ERR_INVALID_PARAMS,
+                message=f"warmup {PARAM_PROVIDER!r} must be a non-empty string",
+            )
+        if not isinstance(pairs_raw, list) or not all(
+            isinstance(pair, list) and len(pair) == 2 and all(isinstance(x, str) for x in pair)
+            for pair in pairs_raw
+        ):
+            raise _DaemonRequestError(
+                code=ERR_INVALID_PARAMS,
+                message=(
+                    f"warmup {PARAM_LANG_PAIRS!r} must be a list of "
+                    "[source_lang, target_lang] string pairs"
+                ),
+            )
+        if pairs_raw and provider_id is None:
+            raise _DaemonRequestError(
+                code=ERR_INVALID_PARAMS,
+                message=f"warmup {PARAM_LANG_PAIRS!r} requires {PARAM_PROVIDER!r}",
+            )
+        for value, name in ((tm_path_raw, PARAM_TM_PATH), (termbase_path_raw, PARAM_TERMBASE_PATH)):
+            if value is not None and (not isinstance(value, str) or not value):
+                raise _DaemonRequestError(
+                    code=ERR_INVALID_PARAMS,
+                    message=f"warmup {name!r} must be a non-empty string",
+                )
+        plan = WarmupPlan(
+            providers=(
+                (
+                    PreloadSpec(
+                        provider_id=provider_id,
+                        lang_pairs=tuple((src, tgt) for src, tgt in pairs_raw),
+                    ),
+                )
+                if provider_id is not None
+                else ()
+            ),
+            tm_path=Path(tm_path_raw) if tm_path_raw is not None else None,
+            hot_set_per_target_lang=self._hot_set_per_target_lang,
+            termbase_path=termbase_path_raw,
+        )
+        self.start_warmup(plan)
+        return {RESULT_READY: False}
 
     def _op_translate(self, params: Mapping[str, Any]) -> dict[str, Any]:
         key = params.get(PARAM_KEY)
@@ -321,6 +756,18 @@ class DaemonServer:
 
         router = self._get_or_build_router(provider_id)
         segment = Segment(key=key, source_text=source_text, source_lang=source_lang)
+        tm_path_raw = params.get(PARAM_TM_PATH)
+        tm = (
+            self._get_or_build_tm(Path(tm_path_raw))
+            if isinstance(tm_path_raw, str) and tm_path_raw
+            else None
+        )
+        if tm is not None:
+            # Scoped to the requested provider, as translate_file
+            # scopes its pipeline (PR #7 review P1).
+            hit = tm.lookup(segment, target_lang, provider=provider_id)
+            if hit is not None:
+                return _tm_hit_to_dict(hit.translated)
         # Cycle-3 S6: optional persona-aware addendum. When the
         # request omits persona_id, this returns None and the call
         # is byte-identical to cycle-2 behavior.
@@ -329,6 +776,8 @@ class DaemonServer:
             result = router.translate(segment, target_lang)
         else:
             result = router.translate(segment, target_lang, system_prompt_addendum=addendum)
+        if tm is not None:
+            self._store_if_valid(tm, segment, target_lang, result)
         return _provider_result_to_dict(result)
 
     def _op_translate_file(self, params: Mapping[str, Any]) -> dict[str, Any]:
@@ -345,9 +794,14 @@ class DaemonServer:
         target_langs_raw = params.get(PARAM_TARGET_LANGS)
         output_dir_raw = params.get(PARAM_OUTPUT_DIR)
         provider_id = params.get(PARAM_PROVIDER)
-        source_lang = params.get(PARAM_SOURCE_LANG, "en-US")
+        source_lang = params.get(PARAM_SOURCE_LANG, DEFAULT_SOURCE_LANG)
         format_id_raw = params.get(PARAM_FORMAT)
         tm_path_raw = params.get(PARAM_TM_PATH)
+        glossary_max_tokens = params.get(PARAM_GLOSSARY_MAX_TOKENS)
+        mask_placeholders = params.get(PARAM_MASK_PLACEHOLDERS, False)
+        passthrough_on = params.get(PARAM_PASSTHROUGH, False)
+        passthrough_patterns = params.get(PARAM_PASSTHROUGH_PATTERNS, [])
+        do_not_translate = params.get(PARAM_DO_NOT_TRANSLATE, [])
 
         if not isinstance(source_path_raw, str) or not source_path_raw:
             raise _DaemonRequestError(
@@ -370,13 +824,43 @@ class DaemonServer:
                 code=ERR_INVALID_PARAMS,
                 message=f"translate_file requires non-empty string {PARAM_PROVIDER!r}",
             )
+        if glossary_max_tokens is not None and (
+            isinstance(glossary_max_tokens, bool)
+            or not isinstance(glossary_max_tokens, int)
+            or glossary_max_tokens < 1
+        ):
+            raise _DaemonRequestError(
+                code=ERR_INVALID_PARAMS,
+                message=f"translate_file {PARAM_GLOSSARY_MAX_TOKENS!r} must be an integer >= 1",
+            )
+        if not isinstance(mask_placeholders, bool):
+            raise _DaemonRequestError(
+                code=ERR_INVALID_PARAMS,
+                message=f"translate_file {PARAM_MASK_PLACEHOLDERS!r} must be a boolean",
+            )
+        if not isinstance(passthrough_on, bool):
+            raise _DaemonRequestError(
+                code=ERR_INVALID_PARAMS,
+                message=f"translate_file {PARAM_PASSTHROUGH!r} must be a boolean",
+            )
+        for value, name in (
+            (passthrough_patterns, PARAM_PASSTHROUGH_PATTERNS),
+            (do_not_translate, PARAM_DO_NOT_TRANSLATE),
+        ):
+            if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+                raise _DaemonRequestError(
+                    code=ERR_INVALID_PARAMS,
+                    message=f"translate_file {name!r} must be a list of strings",
+                )
 
         # Local imports keep the module's import-time cheap and avoid
         # pulling adapter/pipeline deps unless this op is actually
         # called.
         from ainemo.cli.commands import _build_validators, _resolve_adapter
+        from ainemo.core.passthrough import PassthroughPolicy
         from ainemo.core.pipeline import TranslationPipeline
-        from ainemo.core.tm.sqlite import DEFAULT_TM_PATH, SqliteTranslationMemory
+        from ainemo.core.termbase.glossary import PromptBudget
+        from ainemo.core.tm.sqlite import DEFAULT_TM_PATH
 
         source_path = Path(source_path_raw)
         if not source_path.exists():
@@ -390,6 +874,15 @@ class DaemonServer:
             Path(tm_path_raw) if isinstance(tm_path_raw, str) and tm_path_raw else DEFAULT_TM_PATH
         )
         output_dir = Path(output_dir_raw)
+        passthrough = None
+        if passthrough_on or passthrough_patterns or do_not_translate:
+            try:
+                passthrough = PassthroughPolicy(
+                    patterns=tuple(passthrough_patterns),
+                    do_not_translate=tuple(do_not_translate),
+                )
+            except ValueError as exc:
+                raise _DaemonRequestError(code=ERR_INVALID_PARAMS, message=str(exc)) from exc
 
         # Cycle-3 S6: optional persona + termbase resolution.
         # `(None, None)` when persona_id is absent — pipeline path
@@ -397,26 +890,29 @@ class DaemonServer:
         persona, termbase = self._resolve_persona(params)
         router = self._get_or_build_router(provider_id)
         validators = _build_validators(forbidden_terms=[])
-        tm = SqliteTranslationMemory(tm_path)
-        try:
-            pipeline = TranslationPipeline(
-                adapter=adapter,
-                tm=tm,
-                provider=router,
-                validators=validators,
-                target_langs=target_langs,
-                source_lang=str(source_lang),
-                strict=False,
-                # P1 fix (PR #7 review): scope TM lookups to the
-                # requested provider so a prior run with a different
-                # backend does not satisfy this one.
-                expected_provider=provider_id,
-                termbase=termbase,
-                persona=persona,
-            )
-            result = pipeline.translate_file(source_path, output_dir)
-        finally:
-            tm.close()
+        pipeline = TranslationPipeline(
+            adapter=adapter,
+            tm=self._get_or_build_tm(tm_path),
+            provider=router,
+            validators=validators,
+            target_langs=target_langs,
+            source_lang=str(source_lang),
+            strict=False,
+            # P1 fix (PR #7 review): scope TM lookups to the
+            # requested provider so a prior run with a different
+            # backend does not satisfy this one.
+            expected_provider=provider_id,
+            termbase=termbase,
+            persona=persona,
+            prompt_budget=(
+                PromptBudget(max_tokens=glossary_max_tokens, provider_id=provider_id)
+                if glossary_max_tokens is not None
+                else None
+            ),
+            mask_placeholders=mask_placeholders,
+            passthrough=passthrough,
+        )
+        result = pipeline.translate_file(source_path, output_dir)
 
         return {
             RESULT_TARGET_LANG_PATHS: {
@@ -426,25 +922,199 @@ class DaemonServer:
             RESULT_PROVIDER_CALL_COUNT: result.provider_call_count,
             RESULT_ERROR_COUNT: result.error_count,
             RESULT_WARNING_COUNT: result.warning_count,
+            RESULT_PROMPT_TOKENS_SAVED: result.prompt_tokens_saved,
+            RESULT_MASKED_COUNT: result.masked_count,
+            RESULT_PASSTHROUGH_COUNT: result.passthrough_count,
+        }
+
+    def _op_release_models(self, params: Mapping[str, Any]) -> dict[str, Any]:
+        provider_id = params.get(PARAM_PROVIDER)
+        include_pinned = params.get(PARAM_INCLUDE_PINNED, False)
+        if provider_id is not None and not isinstance(provider_id, str):
+            raise _DaemonRequestError(
+                code=ERR_INVALID_PARAMS,
+                message=f"release_models {PARAM_PROVIDER!r} must be a string",
+            )
+        if not isinstance(include_pinned, bool):
+            raise _DaemonRequestError(
+                code=ERR_INVALID_PARAMS,
+                message=f"release_models {PARAM_INCLUDE_PINNED!r} must be a boolean",
+            )
+        released: dict[str, int] = {}
+        for built_id, provider in self._providers.items():
+            if provider_id is not None and built_id != provider_id:
+                continue
+            if isinstance(provider, ReleasableProvider):
+                released[built_id] = provider.release_models(include_pinned=include_pinned)
+        total = sum(released.values())
+        logger.info("released %d local model(s)", total)
+        return {
+            RESULT_RELEASED_MODEL_COUNT: total,
+            RESULT_RELEASED_BY_PROVIDER: released,
+        }
+
+    def _op_http_pools(self, params: Mapping[str, Any]) -> dict[str, Any]:
+        from ainemo.providers._endpoints import endpoint_pools
+        from ainemo.providers._http import client_registry
+
+        return {
+            RESULT_POOLS: [
+                {**asdict(stats), RESULT_POOL_UTILIZATION: stats.utilization}
+                for stats in client_registry().stats()
+            ],
+            RESULT_ENDPOINTS: [asdict(stats) for stats in endpoint_pools().stats()],
         }
 
+    def _op_rate_limits(self, params: Mapping[str, Any]) -> dict[str, Any]:
+        from ainemo.providers._rate_limit import rate_limiters
+
+        return {RESULT_LIMITERS: [asdict(stats) for stats in rate_limiters().stats()]}
+
+    def _op_response_cache(self, params: Mapping[str, Any]) -> dict[str, Any]:
+        cache = self._response_cache
+        return {RESULT_RESPONSE_CACHE: asdict(cache.stats()) if cache is not None else None}
+
     def _get_or_build_router(self, provider_id: str) -> ProviderRouter:
+        with self._build_lock:
+            return self._build_router_locked(provider_id)
+
+    def _build_router_locked(self, provider_id: str) -> ProviderRouter:
         cached = self._routers.get(provider_id)
         if cached is not None:
             return cached
         # Local import avoids pulling the provider's SDK at module
         # import time. Mirrors the cycle-2 CLI's lazy provider build.
-        from ainemo.cli.commands import _build_provider
-
-        provider = _build_provider(provider_id)
+        from ainemo.cli.commands import _build_provider, _hedge_providers
+        from ainemo.providers._rate_limit import rate_limiters
+
+        provider = _build_provider(
+            provider_id,
+            local_options=self._local_options,
+            pack_size=self._pack_size,
+            multi_target=self._multi_target,
+        )
         router = ProviderRouter(
-            providers={provider_id: provider},
+            providers={
+                provider_id: provider,
+                **_hedge_providers(
+                    provider_id,
+                    self._hedge,
+                    local_options=self._local_options,
+                    pack_size=self._pack_size,
+                    multi_target=self._multi_target,
+                ),
+            },
             routing_config=RoutingConfig(default_provider=provider_id),
             usage_log=UsageLog(self._usage_log_path),
+            rate_limiters=rate_limiters(),
+            deadline_s=self._deadline_s,
+            hedge=self._hedge,
+            response_cache=self._response_cache,
         )
         self._routers[provider_id] = router
+        self._providers[provider_id] = provider
         return router
 
+    def _get_or_build_tm(self, tm_path: Path) -> "CachedTranslationMemory":
+        key = tm_path.expanduser().resolve()
+        with self._build_lock:
+            cached = self._tms.get(key)
+            if cached is not None:
+                return cached
+            from ainemo.core.tm.cached import CachedTranslationMemory
+            from ainemo.core.tm.sqlite import SqliteTranslationMemory
+
+            tm = CachedTranslationMemory(SqliteTranslationMemory(key))
+            self._tms[key] = tm
+            return tm
+
+    def _store_if_valid(
+        self,
+        tm: "CachedTranslationMemory",
+        segment: Segment,
+        target_lang: str,
+        result: ProviderResult,
+    ) -> None:
+        """Store a provider translation back to the TM unless a
+        validator blocks it — the same gate the pipeline applies
+        (``strict=False``: only error-severity violations block)."""
+        from ainemo.cli.commands import _build_validators
+        from ainemo.core.validators.base import VIOLATION_SEVERITY_ERROR
+
+        translated = TranslatedSegment(
+            segment=segment,
+            target_lang=target_lang,
+            target_text=result.target_text,
+            provider=result.provider,
+            model=result.model,
+            confidence=result.confidence,
+            source=TRANSLATION_SOURCE_PROVIDER,
+        )
+        for validator in _build_validators(forbidden_terms=[]):
+            for violation in validator.check(segment, translated):
+                if violation.severity == VIOLATION_SEVERITY_ERROR:
+                    logger.warning(
+                        "translate %r blocked by %s; not stored to TM",
+                        segment.key,
+                        violation.validator,
+                    )
+                    return
+        tm.store(translated)
+
+    # --- Warm-up ---
+
+    def _run_warmup(self, plan: WarmupPlan) -> None:
+        """Warm-up thread body. Each step's failure is logged and
+        reported through ping's ``warmup_errors``; later steps still
+        run, and the request that needs the failed piece gets the
+        error again (as an envelope) when it asks."""
+        started = time.perf_counter()
+        try:
+            for spec in plan.providers:
+                self._warm_step(f"provider {spec.provider_id!r}", self._warm_provider, spec)
+            if plan.tm_path is not None:
+                self._warm_step(f"TM {plan.tm_path}", self._warm_tm, plan)
+            if plan.termbase_path is not None:
+                self._warm_step(
+                    f"termbase {plan.termbase_path}",
+                    self._get_or_build_termbase,
+                    {PARAM_TERMBASE_PATH: plan.termbase_path},
+                )
+        finally:
+            with self._state_lock:
+                self._warmups_pending -= 1
+            logger.info("warm-up finished in %.1fs", time.perf_counter() - started)
+
+    def _warm_step(self, what: str, step: Callable[[Any], object], arg: Any) -> None:
+        if self._closing.is_set():
+            logger.info("daemon closing; skipped warm-up of %s", what)
+            return
+        try:
+            step(arg)
+        except Exception as exc:  # noqa: BLE001 — a warm-up failure must not kill the daemon
+            logger.warning("warm-up of %s failed: %s", what, exc)
+            with self._state_lock:
+                self._warmup_errors.append(f"{what}: {type(exc).__name__}: {exc}")
+
+    def _warm_provider(self, spec: PreloadSpec) -> None:
+        self._get_or_build_router(spec.provider_id)
+        provider = self._providers[spec.provider_id]
+        unsupported = [pair for pair in spec.lang_pairs if not provider.supports(*pair)]
+        if unsupported:
+            raise ValueError(f"unsupported language pair(s) {unsupported}")
+        if isinstance(provider, WarmableProvider):
+            provider.warm_up(spec.lang_pairs)
+
+    def _warm_tm(self, plan: WarmupPlan) -> None:
+        assert plan.tm_path is not None  # Checked by _run_warmup.
+        if plan.hot_set_per_target_lang > 0:
+            loaded = self.preload_hot_set(
+                plan.tm_path, per_target_lang=plan.hot_set_per_target_lang
+            )
+            logger.info("preloaded %d hot TM row(s) from %s", loaded, plan.tm_path)
+        else:
+            self._get_or_build_tm(plan.tm_path)
+
     # --- Cycle-3 S6 persona-aware request helpers ---
 
     def _resolve_persona(
@@ -483,14 +1153,15 @@ class DaemonServer:
 
         path_raw = params.get(PARAM_TERMBASE_PATH)
         path_str = path_raw if isinstance(path_raw, str) and path_raw else DEFAULT_TERMBASE_PATH
-        cached = self._termbases.get(path_str)
-        if cached is not None:
-            return cached
-        from ainemo.core.termbase.kuzu.store import KuzuTermbase
+        with self._build_lock:
+            cached = self._termbases.get(path_str)
+            if cached is not None:
+                return cached
+            from ainemo.core.termbase.kuzu.store import KuzuTermbase
 
-        termbase = KuzuTermbase(Path(path_str))
-        self._termbases[path_str] = termbase
-        return termbase
+            termbase = KuzuTermbase(Path(path_str))
+            self._termbases[path_str] = termbase
+            return termbase
 
     def _build_persona_addendum(
         self,
@@ -565,6 +1236,22 @@ def _provider_result_to_dict(result: ProviderResult) -> dict[str, Any]:
         RESULT_OUTPUT_TOKENS: result.output_tokens,
         RESULT_LATENCY_MS: result.latency_ms,
         RESULT_COST_USD: result.cost_usd,
+        RESULT_TRANSLATION_SOURCE: TRANSLATION_SOURCE_PROVIDER,
+    }
+
+
+def _tm_hit_to_dict(translated: TranslatedSegment) -> dict[str, Any]:
+    """Translate-op result for a TM hit: same keys as a provider
+    result, with zero usage — the TM answered, no provider was called."""
+    return {
+        RESULT_TARGET_TEXT: translated.target_text,
+        RESULT_PROVIDER: translated.provider,
+        RESULT_MODEL: translated.model,
+        RESULT_INPUT_TOKENS: 0,
+        RESULT_OUTPUT_TOKENS: 0,
+        RESULT_LATENCY_MS: 0,
+        RESULT_COST_USD: 0.0,
+        RESULT_TRANSLATION_SOURCE: translated.source,
     }
 
 
@@ -576,6 +1263,11 @@ _HANDLERS: dict[str, Callable[["DaemonServer", Mapping[str, Any]], dict[str, Any
     OP_PING: DaemonServer._op_ping,
     OP_TRANSLATE: DaemonServer._op_translate,
     OP_TRANSLATE_FILE: DaemonServer._op_translate_file,
+    OP_RELEASE_MODELS: DaemonServer._op_release_models,
+    OP_WARMUP: DaemonServer._op_warmup,
+    OP_HTTP_POOLS: DaemonServer._op_http_pools,
+    OP_RATE_LIMITS: DaemonServer._op_rate_limits,
+    OP_RESPONSE_CACHE: DaemonServer._op_response_cache,
 }
 
 
@@ -587,6 +1279,9 @@ __all__ = [
     "CMD_NAME_DAEMON",
     "DaemonServer",
     "PROTOCOL_VERSION",
+    "PreloadSpec",
+    "WarmupPlan",
+    "parse_preload_spec",
     "register_daemon",
     "run_daemon",
 ]
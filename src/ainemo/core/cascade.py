@@ -0,0 +1,163 @@
+"""Cascade translation: a cheap draft first, the routed provider only
+for doubtful drafts.
+
+A :class:`CascadePolicy` hands the pipeline's TM misses to a cheap
+``draft_provider`` (typically local NLLB / OPUS) first. Each draft is
+scored by :func:`score_draft` from the same cheap signals the reviewer
+UI shows (:mod:`ainemo.app.qa.signals`), computed without any model
+call:
+
+placeholder_parity
+    1.0 when the draft keeps the source's placeholders, else 0.0
+    (:class:`~ainemo.core.validators.placeholder.PlaceholderParityValidator`).
+length_budget
+    1.0 when the draft fits ``segment.metadata["max_length"]`` or no
+    budget is set, else 0.0
+    (:class:`~ainemo.core.validators.length.LengthBudgetValidator`).
+termbase_agreement
+    Share of the termbase concepts found in the source whose target
+    term appears in the draft. ``None`` when no concept with a target
+    term matches, and then left out of the composite.
+
+The composite weights them with the reviewer UI's confidence weights
+(:mod:`ainemo.app._ids`; termbase agreement takes the termbase cosine's
+weight) and divides by the active weights, so it stays in [0, 1]. A
+draft with any violation from the pipeline's own validators scores
+0.0. Drafts scoring below ``threshold`` are escalated: the
+pipeline's main provider (the LLM) translates the segment again and
+its result is the one validated and stored.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Final, Sequence
+
+from ainemo.app._ids import (
+    WEIGHT_LENGTH_BUDGET,
+    WEIGHT_PLACEHOLDER_PARITY,
+    WEIGHT_TERMBASE_COSINE,
+)
+from ainemo.core.segment import Segment, TranslatedSegment
+from ainemo.core.termbase.base import Termbase
+from ainemo.core.validators.base import Violation
+from ainemo.core.validators.length import LengthBudgetValidator
+from ainemo.core.validators.placeholder import PlaceholderParityValidator
+from ainemo.providers.base import Provider
+
+logger = logging.getLogger(__name__)
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+DEFAULT_ESCALATION_THRESHOLD: Final = 0.8
+"""Drafts scoring below this go to the main provider. With no termbase
+hit, a draft needs both placeholder parity and the length budget."""
+
+_TERMBASE_MAX_HITS: Final = 8
+
+
+@dataclass(frozen=True)
+class CascadePolicy:
+    """Draft with ``draft_provider``; escalate drafts scoring below
+    ``threshold`` to the pipeline's provider."""
+
+    draft_provider: Provider
+    threshold: float = DEFAULT_ESCALATION_THRESHOLD
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.threshold <= 1.0:
+            raise ValueError(f"threshold must be in [0, 1], got {self.threshold}.")
+
+
+@dataclass(frozen=True)
+class DraftScore:
+    """The cheap signals for one draft. Float fields are in [0, 1]."""
+
+    placeholder_parity: float
+    length_budget: float
+    termbase_agreement: float | None
+    """``None`` when no termbase concept with a target term matched."""
+
+    violation_count: int
+    """Violations the pipeline's validators raised on the draft."""
+
+    @property
+    def composite(self) -> float:
+        """Weighted mean of the active signals; 0.0 with any violation."""
+        if self.violation_count:
+            return 0.0
+        weighted = (
+            WEIGHT_PLACEHOLDER_PARITY * self.placeholder_parity
+            + WEIGHT_LENGTH_BUDGET * self.length_budget
+        )
+        total = WEIGHT_PLACEHOLDER_PARITY + WEIGHT_LENGTH_BUDGET
+        if self.termbase_agreement is not None:
+            weighted += WEIGHT_TERMBASE_COSINE * self.termbase_agreement
+            total += WEIGHT_TERMBASE_COSINE
+        return weighted / total
+
+
+def score_draft(
+    segment: Segment,
+    draft: TranslatedSegment,
+    violations: Sequence[Violation],
+    *,
+    termbase: Termbase | None = None,
+    domain_id: str | None = None,
+) -> DraftScore:
+    """Score ``draft`` from its cheap signals and the ``violations``
+    the pipeline's validators found on it. ``domain_id`` scopes the
+    termbase lookup, as it does for the glossary block."""
+    return DraftScore(
+        placeholder_parity=_passes(PlaceholderParityValidator().check(segment, draft)),
+        length_budget=_passes(LengthBudgetValidator().check(segment, draft)),
+        termbase_agreement=_termbase_agreement(segment, draft, termbase, domain_id),
+        violation_count=len(violations),
+    )
+
+
+def _passes(violations: Sequence[Violation]) -> float:
+    return 0.0 if violations else 1.0
+
+
+def _termbase_agreement(
+    segment: Segment,
+    draft: TranslatedSegment,
+    termbase: Termbase | None,
+    domain_id: str | None,
+) -> float | None:
+    """Share of matched concepts whose target term the draft uses.
+
+    Literal, case-insensitive containment, like the termbase's own
+    source-side lookup. A failing lookup counts as no hit.
+    """
+    if termbase is None:
+        return None
+    try:
+        hits = termbase.lookup_concepts_for(
+            segment.source_text,
+            segment.source_lang,
+            draft.target_lang,
+            domain_id=domain_id,
+            max_hits=_TERMBASE_MAX_HITS,
+        )
+    except Exception:
+        logger.debug("Termbase lookup failed; no termbase agreement signal", exc_info=True)
+        return None
+    expected = [hit.target_terms for hit in hits if hit.target_terms]
+    if not expected:
+        return None
+    target = draft.target_text.casefold()
+    agreeing = sum(
+        1 for terms in expected if any(term.surface.casefold() in target for term in terms)
+    )
+    return agreeing / len(expected)
+
+
+__all__ = [
+    "DEFAULT_ESCALATION_THRESHOLD",
+    "CascadePolicy",
+    "DraftScore",
+    "score_draft",
+]
@@ -0,0 +1,236 @@
+"""Placeholder and ICU masking: smaller provider payloads.
+
+Placeholders are sent verbatim by default, so a segment such as
+``{count, plural, one {# file in {folder_name}} other {# files in
+{folder_name}}}`` is tokenized and billed with all of its syntax on
+every call. :func:`mask_segment` takes the segment apart with
+:func:`~ainemo.core.icu.parse_placeholders` and
+:func:`~ainemo.core.icu.parse_icu_branches`:
+
+- every placeholder is replaced by a short positional token — ``{0}``,
+  ``{1}``, … — numbered per text;
+- the body of every ICU plural / select / selectordinal branch becomes
+  its own sub-segment, masked the same way, so nested placeholders and
+  nested ICU blocks are handled at any depth;
+- a text with nothing to translate once masked (only tokens,
+  whitespace, punctuation, ``#``) is not sent at all.
+
+The example above goes out as two sub-segments, ``# file in {0}`` and
+``# files in {0}``. The pipeline translates the sub-segments in one
+batch call (see :class:`~ainemo.core.pipeline.TranslationPipeline`),
+and :meth:`MaskedSegment.restore` reassembles the translation: each
+token is swapped back for its placeholder, and each ICU block keeps
+its source argument, type and selectors around the translated branch
+bodies.
+
+:class:`~ainemo.core.validators.placeholder.PlaceholderParityValidator`
+guards the round trip: a sub-segment whose translation dropped,
+repeated or invented a token makes :meth:`~MaskedSegment.restore`
+return ``None``, and the caller translates the whole segment unmasked
+instead.
+
+Segments are only masked when that shrinks the payload: a segment
+without placeholders, or with placeholders already as short as their
+tokens, goes out unchanged. The source's selectors are kept as they
+are; a target language with more plural categories than the source
+(e.g. Polish ``few`` / ``many``) does not get them added.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Final, Iterable, Sequence, TypeVar
+
+from ainemo.core.icu import parse_icu_branches, parse_placeholders
+from ainemo.core.segment import Placeholder, PlaceholderKind, Segment, TranslatedSegment
+from ainemo.core.validators.placeholder import PlaceholderParityValidator
+from ainemo.providers.base import ProviderResult
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# Token standing in for the ``index``-th placeholder of a text. A
+# positional placeholder: models keep those intact, and the parity
+# validator recognizes them.
+MASK_TOKEN_TEMPLATE: Final = "{{{index}}}"
+
+# Sub-segment keys are ``<segment key>#<part index>``.
+_PART_KEY_SEPARATOR: Final = "#"
+
+_N = TypeVar("_N", int, float)
+
+_ICU_KINDS: Final = (
+    PlaceholderKind.ICU_PLURAL,
+    PlaceholderKind.ICU_SELECT,
+    PlaceholderKind.ICU_SELECTORDINAL,
+)
+
+
+@dataclass(frozen=True)
+class _Slot:
+    """One masked placeholder: its source form, plus the masked body of
+    each branch when it is an ICU block."""
+
+    placeholder: Placeholder
+    branches: tuple[tuple[tuple[int, int], _MaskedText], ...] = ()
+    """(branch body span within ``placeholder.raw``, masked body)."""
+
+
+@dataclass(frozen=True)
+class _MaskedText:
+    """A text with its placeholders replaced by tokens."""
+
+    text: str
+    slots: tuple[_Slot, ...]
+    part: int | None
+    """Index of the sub-segment carrying ``text``; ``None`` when there
+    is nothing to translate and ``text`` is restored as is."""
+
+
+@dataclass(frozen=True)
+class MaskedSegment:
+    """A segment taken apart into masked sub-segments."""
+
+    segment: Segment
+    parts: tuple[Segment, ...]
+    """The sub-segments to translate, in order."""
+
+    _root: _MaskedText
+
+    def restore(self, results: Sequence[ProviderResult]) -> ProviderResult | None:
+        """Reassemble the translations of :attr:`parts` (one result per
+        part, in order) into one result for :attr:`segment`.
+
+        Returns ``None`` when a part's translation fails the placeholder
+        parity check. Token counts, latency and cost are the parts'
+        sums; provider and model are the first part's.
+        """
+        if len(results) != len(self.parts) or not results:
+            return None
+        validator = PlaceholderParityValidator()
+        for part, result in zip(self.parts, results, strict=True):
+            translated = TranslatedSegment(
+                segment=part,
+                target_lang="",
+                target_text=result.target_text,
+                provider=result.provider,
+            )
+            if validator.check(part, translated):
+                return None
+        texts = [result.target_text for result in results]
+        first = results[0]
+        return replace(
+            first,
+            target_text=_render(self._root, texts),
+            input_tokens=_sum_known(result.input_tokens for result in results),
+            output_tokens=_sum_known(result.output_tokens for result in results),
+            cache_read_tokens=_sum_known(result.cache_read_tokens for result in results),
+            cache_write_tokens=_sum_known(result.cache_write_tokens for result in results),
+            latency_ms=sum(result.latency_ms for result in results),
+            cost_usd=_sum_known(result.cost_usd for result in results),
+            confidence=None,
+        )
+
+
+def mask_segment(segment: Segment) -> MaskedSegment | None:
+    """Mask ``segment``, or ``None`` when masking would not shrink its
+    payload (or leaves nothing to translate)."""
+    texts: list[str] = []
+    root = _mask(segment.source_text, texts)
+    if root is None or not texts:
+        return None
+    if sum(len(text) for text in texts) >= len(segment.source_text):
+        return None
+    parts = tuple(
+        Segment(
+            key=f"{segment.key}{_PART_KEY_SEPARATOR}{index}",
+            source_text=text,
+            source_lang=segment.source_lang,
+            placeholders=parse_placeholders(text),
+        )
+        for index, text in enumerate(texts)
+    )
+    return MaskedSegment(segment=segment, parts=parts, _root=root)
+
+
+def _mask(text: str, texts: list[str]) -> _MaskedText | None:
+    """Mask ``text`` and its ICU branch bodies, appending each body
+    that needs translating to ``texts`` (identical bodies once).
+    ``None`` when a masked text does not parse back to its tokens."""
+    placeholders = parse_placeholders(text)
+    pieces: list[str] = []
+    slots: list[_Slot] = []
+    cursor = 0
+    for index, placeholder in enumerate(placeholders):
+        start, end = placeholder.span
+        pieces.append(text[cursor:start])
+        pieces.append(MASK_TOKEN_TEMPLATE.format(index=index))
+        cursor = end
+        branches: list[tuple[tuple[int, int], _MaskedText]] = []
+        if placeholder.kind in _ICU_KINDS:
+            for branch in parse_icu_branches(placeholder):
+                body = _mask(branch.text, texts)
+                if body is None:
+                    return None
+                branches.append((branch.span, body))
+        slots.append(_Slot(placeholder=placeholder, branches=tuple(branches)))
+    pieces.append(text[cursor:])
+    masked = "".join(pieces)
+    tokens = parse_placeholders(masked)
+    if [token.raw for token in tokens] != [
+        MASK_TOKEN_TEMPLATE.format(index=index) for index in range(len(slots))
+    ]:
+        return None
+    part: int | None = None
+    if _has_words(masked, tokens):
+        if masked not in texts:
+            texts.append(masked)
+        part = texts.index(masked)
+    return _MaskedText(text=masked, slots=tuple(slots), part=part)
+
+
+def _render(node: _MaskedText, translations: Sequence[str]) -> str:
+    """``node``'s translation with its tokens swapped back for their
+    placeholders, ICU branch bodies translated."""
+    text = translations[node.part] if node.part is not None else node.text
+    rendered = [_render_slot(slot, translations) for slot in node.slots]
+    pieces: list[str] = []
+    cursor = 0
+    for token in parse_placeholders(text):
+        start, end = token.span
+        pieces.append(text[cursor:start])
+        # Parity-checked: every token in ``text`` is one of ours.
+        pieces.append(rendered[int(token.raw[1:-1])])
+        cursor = end
+    pieces.append(text[cursor:])
+    return "".join(pieces)
+
+
+def _render_slot(slot: _Slot, translations: Sequence[str]) -> str:
+    raw = slot.placeholder.raw
+    # Right to left, so earlier spans stay valid.
+    for (start, end), body in reversed(slot.branches):
+        raw = raw[:start] + _render(body, translations) + raw[end:]
+    return raw
+
+
+def _has_words(text: str, tokens: Sequence[Placeholder]) -> bool:
+    """Whether ``text`` has any letter outside its tokens."""
+    cursor = 0
+    for token in tokens:
+        start, end = token.span
+        if any(char.isalpha() for char in text[cursor:start]):
+            return True
+        cursor = end
+    return any(char.isalpha() for char in text[cursor:])
+
+
+def _sum_known(values: Iterable[_N | None]) -> _N | None:
+    known = [value for value in values if value is not None]
+    return sum(known) if known else None
+
+
+__all__ = [
+    "MASK_TOKEN_TEMPLATE",
+    "MaskedSegment",
+    "mask_segment",
+]
@@ -0,0 +1,137 @@
+"""Non-translatable segment detection.
+
+Many bundle values have nothing to translate: pure placeholders
+(``{0}``), numbers, URLs, email addresses, printf-style format strings,
+brand names, empty strings. Without this stage each one costs a TM
+lookup and, on a miss, a paid provider call that echoes the input.
+
+A :class:`PassthroughPolicy` classifies a segment before the TM is
+consulted. A segment it matches is written to the output as its own
+source text with ``source="passthrough"``. It is not looked up in or
+stored to the TM, so TM rows keep naming the provider that actually
+produced them. It is never sent to a provider either, and
+``PipelineResult.passthrough_count`` counts it.
+
+A segment passes through when, after its simple placeholders are set
+aside:
+
+empty
+    nothing but whitespace is left (``""``, ``"{0}"``, ``"{0} {1}"``);
+no-text
+    no letter is left: numbers, prices, punctuation (``"42"``,
+    ``"{0} / {1}"``, ``"—"``);
+builtin
+    what is left fully matches a built-in pattern: a URL, an email
+    address or a run of printf format specifiers (``"%s: %d"``);
+do-not-translate
+    the whole text is one of the policy's or the persona's
+    do-not-translate terms, ignoring case (brand and product names);
+pattern
+    the whole text fully matches one of the policy's ``patterns``.
+
+A segment with an ICU plural / select / selectordinal placeholder
+always goes to the provider: its branches hold text.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Final
+
+from ainemo.core.icu import parse_placeholders
+from ainemo.core.segment import Placeholder, PlaceholderKind, Segment
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+PASSTHROUGH_REASON_EMPTY: Final = "empty"
+PASSTHROUGH_REASON_NO_TEXT: Final = "no-text"
+PASSTHROUGH_REASON_BUILTIN: Final = "builtin"
+PASSTHROUGH_REASON_DO_NOT_TRANSLATE: Final = "do-not-translate"
+PASSTHROUGH_REASON_PATTERN: Final = "pattern"
+
+# Full-match patterns for values that never need translating. Checked
+# against the text with its simple placeholders removed and stripped.
+_BUILTIN_PATTERNS: Final = (
+    # URL
+    r"(?:https?|ftp)://\S+|www\.\S+",
+    # Email address
+    r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+",
+    # printf format specifiers, with separators between them
+    r"(?:%(?:\d+\$)?[-+ 0#]*(?:\d+|\*)?(?:\.(?:\d+|\*))?(?:hh|h|ll|l|L|z|j|t)?"
+    r"[diouxXeEfFgGaAcspn@%][\s\W]*)+",
+)
+
+_SIMPLE_KINDS: Final = (PlaceholderKind.POSITIONAL, PlaceholderKind.NAMED)
+
+
+@dataclass(frozen=True)
+class PassthroughPolicy:
+    """Which segments skip the TM and the provider.
+
+    ``patterns`` are regular expressions matched against the whole
+    source text. ``do_not_translate`` terms are compared with the whole
+    text, ignoring case; the pipeline adds the persona's
+    ``do_not_translate`` list. ``builtin`` turns the URL / email /
+    format-string patterns on.
+    """
+
+    patterns: tuple[str, ...] = ()
+    do_not_translate: tuple[str, ...] = ()
+    builtin: bool = True
+
+    def __post_init__(self) -> None:
+        for pattern in self.patterns:
+            try:
+                _compile(pattern)
+            except re.error as exc:
+                raise ValueError(f"Invalid passthrough pattern {pattern!r}: {exc}") from exc
+
+    def classify(self, segment: Segment) -> str | None:
+        """The ``PASSTHROUGH_REASON_*`` under which ``segment`` passes
+        through, or ``None`` when it needs translating."""
+        text = segment.source_text
+        placeholders = parse_placeholders(text)
+        if any(placeholder.kind not in _SIMPLE_KINDS for placeholder in placeholders):
+            return None
+        residual = _without(text, placeholders).strip()
+        if not residual:
+            return PASSTHROUGH_REASON_EMPTY
+        if not any(char.isalpha() for char in residual):
+            return PASSTHROUGH_REASON_NO_TEXT
+        if self.builtin and any(_compile(p).fullmatch(residual) for p in _BUILTIN_PATTERNS):
+            return PASSTHROUGH_REASON_BUILTIN
+        stripped = text.strip().casefold()
+        if any(stripped == term.strip().casefold() for term in self.do_not_translate):
+            return PASSTHROUGH_REASON_DO_NOT_TRANSLATE
+        if any(_compile(pattern).fullmatch(text) for pattern in self.patterns):
+            return PASSTHROUGH_REASON_PATTERN
+        return None
+
+
+@lru_cache(maxsize=256)
+def _compile(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
+
+def _without(text: str, placeholders: tuple[Placeholder, ...]) -> str:
+    """``text`` with the placeholders' spans cut out."""
+    pieces: list[str] = []
+    cursor = 0
+    for placeholder in placeholders:
+        start, end = placeholder.span
+        pieces.append(text[cursor:start])
+        cursor = end
+    pieces.append(text[cursor:])
+    return "".join(pieces)
+
+
+__all__ = [
+    "PASSTHROUGH_REASON_BUILTIN",
+    "PASSTHROUGH_REASON_DO_NOT_TRANSLATE",
+    "PASSTHROUGH_REASON_EMPTY",
+    "PASSTHROUGH_REASON_NO_TEXT",
+    "PASSTHROUGH_REASON_PATTERN",
+    "PassthroughPolicy",
+]
@@ -12,18 +12,78 @@ Cycle-1 :class:`TranslationPipeline` ties the four layers together:
 
 The pipeline is target-language-aware: a single source file fans out
 into one output file per requested target language.
+
+When the provider can translate many segments per call (a
+:class:`~ainemo.providers.base.BatchProvider`, an LLM provider with a
+``pack_size`` above 1, or a router whose route resolves to either),
+each target language starts with a prefetch pass: the TM misses are
+translated together through ``translate_batch`` and the per-segment
+loop then consumes those results instead of calling the provider.
+Outcomes, counts and TM writes are the same as the one-segment-at-a-time
+path.
+
+With several target languages and a provider on the multi-target path
+(a :class:`~ainemo.providers.base.MultiTargetProvider` with
+``multi_target`` on, or a router resolving every language to one), a
+single prefetch pass covers all the languages instead. Each miss is
+requested once for every language that needs it with the same addendum.
+Per-language TM stores and validator runs are unchanged.
+
+With a :class:`~ainemo.core.cascade.CascadePolicy`, TM misses go to the
+policy's cheap draft provider first (prefetched in batch when it can
+batch). Each draft is validated and scored from cheap QA signals (see
+:mod:`ainemo.core.cascade`); only drafts scoring below the threshold
+are translated again by the main provider, and only the final
+translation is stored. Languages the draft provider does not support
+go straight to the main provider. Multi-target prefetch is off in
+cascade mode, since drafts are per language.
+
+With a :class:`~ainemo.core.planner.RunPlan` carrying a budget,
+only the misses the plan admitted are translated (prefetch passes
+included), and the run stops calling providers once the recorded
+spend plus the next call's estimate would exceed the budget. A
+prefetch pass admits each miss against the spend plus the estimates of
+the misses already queued for its batch calls. A miss without a cost
+estimate is sent in a batch of its own first, and the run's mean cost
+per call so far estimates the rest. In cascade mode an escalation is
+admitted like a call of its own; one that no longer fits leaves its
+segment untranslated rather than keeping the doubtful draft. Skipped
+misses are left out of the output files and counted in
+``PipelineResult.skipped_count``.
+
+With ``mask_placeholders``, segments go to the provider masked (see
+:mod:`ainemo.core.masking`): placeholders become short tokens and ICU
+branch bodies separate sub-segments, translated in the same batch call
+as the rest of the prefetch pass. A segment whose sub-segment
+translations fail the placeholder parity check is translated again
+unmasked. On the one-segment-at-a-time path only segments that mask to
+a single sub-segment are masked, since every extra sub-segment would
+cost its own call. Multi-target prefetch is off while masking.
+
+With a :class:`~ainemo.core.passthrough.PassthroughPolicy`, segments
+with nothing to translate (placeholders only, numbers, URLs, format
+strings, do-not-translate terms) are copied from the source before the
+TM is consulted, with ``source="passthrough"``. They are neither
+looked up in nor stored to the TM, never reach a provider, and are
+counted in ``PipelineResult.passthrough_count``.
 """
 
 from __future__ import annotations
 
 import logging
+import math
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Final, Iterator, Sequence, TypeVar
 
 from ainemo.core.adapters.base import BundleAdapter
+from ainemo.core.cascade import CascadePolicy, score_draft
+from ainemo.core.masking import mask_segment
+from ainemo.core.passthrough import PassthroughPolicy
+from ainemo.core.planner import PlanKey, PlannedCall, RunPlan
 from ainemo.core.segment import (
+    TRANSLATION_SOURCE_PASSTHROUGH,
     TRANSLATION_SOURCE_PROVIDER,
     Segment,
     TranslatedSegment,
@@ -32,22 +92,45 @@ from ainemo.core.termbase.base import (
     Persona,
     Termbase,
 )
-from ainemo.core.termbase.glossary import build_glossary_block
+from ainemo.core.termbase.glossary import (
+    GlossaryPromptBuilder,
+    PromptBudget,
+    build_glossary_block,
+)
 from ainemo.core.tm.base import (
     DEFAULT_FUZZY_THRESHOLD,
     TM_MATCH_TYPE_EXACT,
+    TmHit,
     TranslationMemory,
+    UsageTrackingTranslationMemory,
 )
+from ainemo.core.tm.cached import CachedTranslationMemory
 from ainemo.core.validators.base import (
     VIOLATION_SEVERITY_ERROR,
     Validator,
     Violation,
 )
-from ainemo.providers.base import Provider, ProviderResult
+from ainemo.providers._ids import PROVIDER_ID_PASSTHROUGH
+from ainemo.providers.base import (
+    BatchProvider,
+    MultiTargetProvider,
+    Provider,
+    ProviderResult,
+    uses_batch_path,
+    uses_multi_target_path,
+)
 from ainemo.providers.router import ProviderRouter
 
 logger = logging.getLogger(__name__)
 
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# A fuzzy threshold no cosine similarity reaches: the lookup can only
+# return an exact hit.
+_EXACT_ONLY_THRESHOLD: Final = math.inf
+
+_Miss = TypeVar("_Miss")
+
 
 @dataclass(frozen=True)
 class SegmentOutcome:
@@ -56,12 +139,28 @@ class SegmentOutcome:
     segment_key: str
     target_lang: str
     translated: TranslatedSegment | None
-    """``None`` when an error-severity validator blocked the write."""
+    """``None`` when an error-severity validator blocked the write or
+    the run budget skipped the segment."""
 
     violations: tuple[Violation, ...]
     """Every violation surfaced for this segment, both error and
     warning severity. The reviewer UI groups by segment."""
 
+    escalated: bool = field(default=False)
+    """Cascade mode: the draft scored below the threshold and the main
+    provider translated the segment again."""
+
+    draft_score: float | None = field(default=None)
+    """Cascade mode: the draft's composite score. ``None`` for TM hits
+    and segments that had no draft."""
+
+    skipped: bool = field(default=False)
+    """Run budget: the TM miss was left untranslated."""
+
+    passthrough: bool = field(default=False)
+    """The segment had nothing to translate and was copied from the
+    source."""
+
 
 @dataclass(frozen=True)
 class PipelineResult:
@@ -85,6 +184,125 @@ class PipelineResult:
 
     warning_count: int = field(default=0)
 
+    escalation_count: int = field(default=0)
+    """Cascade mode: drafts sent on to the main provider. Each one is a
+    second provider call for its segment."""
+
+    skipped_count: int = field(default=0)
+    """Run budget: TM misses left untranslated. Not part of
+    ``provider_call_count``."""
+
+    spent_cost_usd: float = field(default=0.0)
+    """Run budget: cost the run's provider results reported."""
+
+    spent_tokens: int = field(default=0)
+    """Run budget: tokens the run's provider results reported (the
+    plan's estimate for providers that report none)."""
+
+    passthrough_count: int = field(default=0)
+    """Segments copied from the source without a TM lookup or provider
+    call. Not part of ``tm_hit_count`` or ``provider_call_count``."""
+
+    masked_count: int = field(default=0)
+    """Placeholder masking: provider translations made from masked
+    sub-segments."""
+
+    prompt_tokens_saved: int = field(default=0)
+    """Prompt budget: estimated system-prompt addendum tokens the
+    budgeted glossary left out, over the run's distinct prompts."""
+
+
+@dataclass(frozen=True)
+class _Prefetch:
+    """Per-target-language results of the batch prefetch pass."""
+
+    hits: dict[int, TmHit]
+    """TM hits found during the pass, by segment index — reused so each
+    hit is looked up (and hit-counted) once."""
+
+    addenda: dict[int, str | None]
+    """System-prompt addendum built for each missed segment index."""
+
+    results: dict[tuple[str, str | None], ProviderResult]
+    """Provider results keyed by (segment fingerprint, addendum)."""
+
+
+@dataclass
+class _Spend:
+    """Run-budget bookkeeping for one ``translate_file`` call."""
+
+    plan: RunPlan
+    calls: dict[PlanKey, PlannedCall]
+    cost_usd: float = 0.0
+    tokens: int = 0
+    charged: int = 0
+    """Provider results charged so far."""
+
+    escalations: int = 0
+    escalation_cost_usd: float = 0.0
+    """Cascade escalations charged so far, and what they cost."""
+
+    reserved: dict[PlanKey, tuple[float, int]] = field(default_factory=dict)
+    """Estimates of misses queued for a batch call, until charged."""
+
+    def estimate(self, key: PlanKey, *, escalation: bool = False) -> tuple[float | None, int]:
+        """(cost, tokens) the miss is expected to spend. Without a plan
+        estimate the cost is the run's mean cost per call so far, or
+        ``None`` before anything was charged. The plan prices the draft
+        leg of a cascade; an escalation costs what earlier ones did."""
+        call = self.calls.get(key)
+        if escalation and self.escalations:
+            cost: float | None = self.escalation_cost_usd / self.escalations
+        else:
+            cost = call.cost_usd if call is not None else None
+            if cost is None and self.charged:
+                cost = self.cost_usd / self.charged
+        return cost, call.total_tokens if call is not None else 0
+
+    def admits(self, key: PlanKey, *, escalation: bool = False) -> bool:
+        """Whether the miss was admitted by the plan and its estimate
+        still fits next to what the run has spent and queued so far."""
+        call = self.calls.get(key)
+        if call is not None and not call.admitted:
+            return False
+        budget = self.plan.budget
+        if budget is None:
+            return True
+        cost, tokens = self.estimate(key, escalation=escalation)
+        return budget.fits(
+            self.cost_usd + sum(queued for queued, _ in self.reserved.values()) + (cost or 0.0),
+            self.tokens + sum(queued for _, queued in self.reserved.values()) + tokens,
+        )
+
+    def reserve(self, key: PlanKey) -> bool:
+        """:meth:`admits`, then hold the miss's estimate against the
+        budget until :meth:`charge`."""
+        if not self.admits(key):
+            return False
+        cost, tokens = self.estimate(key)
+        self.reserved[key] = (cost or 0.0, tokens)
+        return True
+
+    def blind(self, key: PlanKey) -> bool:
+        """Whether a cost budget applies but the miss's cost cannot be
+        estimated yet."""
+        budget = self.plan.budget
+        return (
+            budget is not None and budget.max_cost_usd is not None and self.estimate(key)[0] is None
+        )
+
+    def charge(self, key: PlanKey, result: ProviderResult, *, escalation: bool = False) -> None:
+        self.reserved.pop(key, None)
+        self.charged += 1
+        self.cost_usd += result.cost_usd or 0.0
+        if escalation:
+            self.escalations += 1
+            self.escalation_cost_usd += result.cost_usd or 0.0
+        if result.input_tokens is not None or result.output_tokens is not None:
+            self.tokens += (result.input_tokens or 0) + (result.output_tokens or 0)
+        elif key in self.calls:
+            self.tokens += self.calls[key].total_tokens
+
 
 class TranslationPipeline:
     """Orchestrates the four-layer translation pipeline."""
@@ -104,6 +322,10 @@ class TranslationPipeline:
         expected_model: str | None = None,
         termbase: Termbase | None = None,
         persona: Persona | None = None,
+        cascade: CascadePolicy | None = None,
+        prompt_budget: PromptBudget | None = None,
+        mask_placeholders: bool = False,
+        passthrough: PassthroughPolicy | None = None,
     ) -> None:
         self._adapter = adapter
         self._tm = tm
@@ -130,8 +352,49 @@ class TranslationPipeline:
         # pass unchanged.
         self._termbase = termbase
         self._persona = persona
+        self._cascade = cascade
+        # Without a prompt budget the addendum comes straight from
+        # ``build_glossary_block``, as before.
+        self._prompt_builder = (
+            GlossaryPromptBuilder(termbase, persona, budget=prompt_budget)
+            if prompt_budget is not None
+            else None
+        )
+        self._spend: _Spend | None = None
+        self._mask_placeholders = mask_placeholders
+        if passthrough is not None and persona is not None and persona.do_not_translate:
+            passthrough = replace(
+                passthrough,
+                do_not_translate=passthrough.do_not_translate + persona.do_not_translate,
+            )
+        self._passthrough = passthrough
+        # Classified once per source text, not once per language and pass.
+        self._passes: dict[str, bool] = {}
+        self._masked_count = 0
+
+    def translate_file(
+        self, source_path: Path, output_dir: Path, *, plan: RunPlan | None = None
+    ) -> PipelineResult:
+        """Translate ``source_path`` into one file per target language.
 
-    def translate_file(self, source_path: Path, output_dir: Path) -> PipelineResult:
+        ``plan`` (from :func:`~ainemo.core.planner.plan_run` over
+        :meth:`collect_misses`) limits the run to its admitted misses
+        and its budget.
+        """
+        self._spend = (
+            _Spend(plan=plan, calls={call.key: call for call in plan.calls})
+            if plan is not None
+            else None
+        )
+        if self._prompt_builder is not None:
+            self._prompt_builder.reset()
+        self._masked_count = 0
+        try:
+            return self._translate_file(source_path, output_dir)
+        finally:
+            self._spend = None
+
+    def _translate_file(self, source_path: Path, output_dir: Path) -> PipelineResult:
         segments = self._adapter.parse(source_path, self._source_lang)
         output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -141,18 +404,34 @@ class TranslationPipeline:
         provider_call_count = 0
         error_count = 0
         warning_count = 0
+        escalation_count = 0
+        skipped_count = 0
+        passthrough_count = 0
 
+        multi_prefetch = self._prefetch_multi(segments)
         for target_lang in self._target_langs:
             translated_for_lang: list[TranslatedSegment] = []
-            for segment in segments:
-                outcome, was_tm_hit = self._translate_one(segment, target_lang)
+            if multi_prefetch is not None:
+                prefetch: _Prefetch | None = multi_prefetch[target_lang]
+            else:
+                prefetch = self._prefetch(segments, target_lang)
+            for index, segment in enumerate(segments):
+                outcome, was_tm_hit = self._translate_one(
+                    segment, target_lang, prefetch=prefetch, index=index
+                )
                 outcomes.append(outcome)
                 if outcome.translated is not None:
                     translated_for_lang.append(outcome.translated)
                 if was_tm_hit:
                     tm_hit_count += 1
+                elif outcome.skipped:
+                    skipped_count += 1
+                elif outcome.passthrough:
+                    passthrough_count += 1
                 else:
                     provider_call_count += 1
+                if outcome.escalated:
+                    escalation_count += 1
                 for v in outcome.violations:
                     if v.severity == VIOLATION_SEVERITY_ERROR:
                         error_count += 1
@@ -176,18 +455,85 @@ class TranslationPipeline:
             provider_call_count=provider_call_count,
             error_count=error_count,
             warning_count=warning_count,
+            escalation_count=escalation_count,
+            skipped_count=skipped_count,
+            passthrough_count=passthrough_count,
+            spent_cost_usd=self._spend.cost_usd if self._spend is not None else 0.0,
+            spent_tokens=self._spend.tokens if self._spend is not None else 0,
+            masked_count=self._masked_count,
+            prompt_tokens_saved=(
+                self._prompt_builder.stats().tokens_saved if self._prompt_builder is not None else 0
+            ),
         )
 
+    def collect_misses(self, source_path: Path) -> list[tuple[Segment, str, str | None]]:
+        """Every TM miss of ``source_path``, without translating it.
+
+        Returns (segment, target language, system-prompt addendum)
+        triples, de-duplicated the way the prefetch pass does it: an
+        offline batch job (see :mod:`ainemo.providers._bulk`) submits
+        them and :meth:`translate_file` later consumes the results.
+        TM hit counters are left alone, so a plan is a dry run.
+        """
+        segments = self._adapter.parse(source_path, self._source_lang)
+        misses: list[tuple[Segment, str, str | None]] = []
+        seen: set[tuple[str, str, str | None]] = set()
+        for target_lang in self._target_langs:
+            for segment in segments:
+                if self._passes_through(segment):
+                    continue
+                if self._lookup(segment, target_lang, record_hits=False) is not None:
+                    continue
+                addendum = self._build_system_prompt_addendum(segment, target_lang)
+                key = (segment.fingerprint, target_lang, addendum)
+                if key not in seen:
+                    seen.add(key)
+                    misses.append((segment, target_lang, addendum))
+        return misses
+
     # --- Internals ---
 
-    def _translate_one(self, segment: Segment, target_lang: str) -> tuple[SegmentOutcome, bool]:
-        hit = self._tm.lookup(
-            segment,
-            target_lang,
-            self._fuzzy_threshold,
-            provider=self._expected_provider,
-            model=self._expected_model,
-        )
+    def _translate_one(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        prefetch: _Prefetch | None = None,
+        index: int = -1,
+    ) -> tuple[SegmentOutcome, bool]:
+        if self._passes_through(segment):
+            return (
+                SegmentOutcome(
+                    segment_key=segment.key,
+                    target_lang=target_lang,
+                    translated=TranslatedSegment(
+                        segment=segment,
+                        target_lang=target_lang,
+                        target_text=segment.source_text,
+                        provider=PROVIDER_ID_PASSTHROUGH,
+                        source=TRANSLATION_SOURCE_PASSTHROUGH,
+                    ),
+                    violations=(),
+                    passthrough=True,
+                ),
+                False,
+            )
+        violations: list[Violation] | None = None
+        draft_score: float | None = None
+        escalated = False
+        hit = prefetch.hits.get(index) if prefetch is not None else None
+        addendum: str | None = None
+        prefetched: ProviderResult | None = None
+        if hit is None and prefetch is not None and index in prefetch.addenda:
+            addendum = prefetch.addenda[index]
+            prefetched = prefetch.results.get((segment.fingerprint, addendum))
+        if hit is None:
+            # Misses are looked up again: an earlier duplicate of this
+            # segment may have been stored since the prefetch pass. A
+            # prefetched translation is already paid for, so only an
+            # exact hit may replace it — never a fuzzy hit on a row
+            # another segment stored since.
+            hit = self._lookup(segment, target_lang, exact_only=prefetched is not None)
         if hit is not None and hit.match_type == TM_MATCH_TYPE_EXACT:
             translated = hit.translated
             tm_hit = True
@@ -214,22 +560,69 @@ class TranslationPipeline:
             # paths — we call without the kwarg so existing Provider
             # impls and test doubles whose `translate()` predates the
             # Protocol bump stay byte-stable.
-            addendum = self._build_system_prompt_addendum(segment, target_lang)
-            result = self._call_provider(segment, target_lang, addendum)
-            translated = TranslatedSegment(
-                segment=segment,
-                target_lang=target_lang,
-                target_text=result.target_text,
-                provider=result.provider,
-                model=result.model,
-                confidence=result.confidence,
-                source=TRANSLATION_SOURCE_PROVIDER,
-            )
+            if prefetch is None or index not in prefetch.addenda:
+                addendum = self._build_system_prompt_addendum(segment, target_lang)
+            key = (segment.fingerprint, target_lang, addendum)
+            if prefetched is None and not self._admits(key):
+                return (
+                    SegmentOutcome(
+                        segment_key=segment.key,
+                        target_lang=target_lang,
+                        translated=None,
+                        violations=(),
+                        skipped=True,
+                    ),
+                    False,
+                )
+            # Cascade mode: the first call goes to the draft provider,
+            # and a draft scoring below the threshold is replaced by
+            # the main provider's translation.
+            first = self._first_provider(target_lang)
+            if prefetched is not None:
+                result = prefetched
+            else:
+                result = self._call_provider(segment, target_lang, addendum, provider=first)
+                self._charge(key, result)
+            translated = _from_provider(segment, target_lang, result)
             tm_hit = False
+            if self._cascade is not None and first is not self._provider:
+                violations = self._check(segment, translated)
+                draft_score = score_draft(
+                    segment,
+                    translated,
+                    violations,
+                    termbase=self._termbase,
+                    domain_id=self._persona.domain_id if self._persona is not None else None,
+                ).composite
+                if draft_score < self._cascade.threshold:
+                    if not self._admits(key, escalation=True):
+                        # Left untranslated rather than storing a doubtful
+                        # draft, so a re-run escalates it.
+                        return (
+                            SegmentOutcome(
+                                segment_key=segment.key,
+                                target_lang=target_lang,
+                                translated=None,
+                                violations=(),
+                                draft_score=draft_score,
+                                skipped=True,
+                            ),
+                            False,
+                        )
+                    logger.debug(
+                        "Draft for %r scored %.2f < %.2f; escalating.",
+                        segment.key,
+                        draft_score,
+                        self._cascade.threshold,
+                    )
+                    result = self._call_provider(segment, target_lang, addendum)
+                    self._charge(key, result, escalation=True)
+                    translated = _from_provider(segment, target_lang, result)
+                    violations = None
+                    escalated = True
 
-        violations: list[Violation] = []
-        for validator in self._validators:
-            violations.extend(validator.check(segment, translated))
+        if violations is None:
+            violations = self._check(segment, translated)
 
         has_blocking = any(self._is_blocking(v) for v in violations)
 
@@ -245,6 +638,8 @@ class TranslationPipeline:
                     target_lang=target_lang,
                     translated=None,
                     violations=tuple(violations),
+                    escalated=escalated,
+                    draft_score=draft_score,
                 ),
                 tm_hit,
             )
@@ -260,17 +655,279 @@ class TranslationPipeline:
                 target_lang=target_lang,
                 translated=translated,
                 violations=tuple(violations),
+                escalated=escalated,
+                draft_score=draft_score,
             ),
             tm_hit,
         )
 
+    def _check(self, segment: Segment, translated: TranslatedSegment) -> list[Violation]:
+        violations: list[Violation] = []
+        for validator in self._validators:
+            violations.extend(validator.check(segment, translated))
+        return violations
+
+    def _passes_through(self, segment: Segment) -> bool:
+        if self._passthrough is None:
+            return False
+        text = segment.source_text
+        if text not in self._passes:
+            self._passes[text] = self._passthrough.classify(segment) is not None
+        return self._passes[text]
+
+    def _admits(self, key: PlanKey, *, escalation: bool = False) -> bool:
+        return self._spend is None or self._spend.admits(key, escalation=escalation)
+
+    def _charge(self, key: PlanKey, result: ProviderResult, *, escalation: bool = False) -> None:
+        if self._spend is not None:
+            self._spend.charge(key, result, escalation=escalation)
+
+    def _first_provider(self, target_lang: str) -> Provider:
+        """The provider a TM miss goes to first: the cascade's draft
+        provider when it supports the pair, else the main one."""
+        if self._cascade is not None and self._cascade.draft_provider.supports(
+            self._source_lang, target_lang
+        ):
+            return self._cascade.draft_provider
+        return self._provider
+
+    def _lookup(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        exact_only: bool = False,
+        record_hits: bool = True,
+    ) -> TmHit | None:
+        threshold = _EXACT_ONLY_THRESHOLD if exact_only else self._fuzzy_threshold
+        if not record_hits and isinstance(
+            self._tm, (UsageTrackingTranslationMemory, CachedTranslationMemory)
+        ):
+            return self._tm.lookup(
+                segment,
+                target_lang,
+                threshold,
+                provider=self._expected_provider,
+                model=self._expected_model,
+                record_hits=False,
+            )
+        return self._tm.lookup(
+            segment,
+            target_lang,
+            threshold,
+            provider=self._expected_provider,
+            model=self._expected_model,
+        )
+
+    def _prefetch(self, segments: Sequence[Segment], target_lang: str) -> _Prefetch | None:
+        """Translate this language's TM misses in batch calls.
+
+        Returns ``None`` (per-segment path) unless the provider is
+        batch-capable for the pair. Misses are de-duplicated by
+        (fingerprint, addendum) and grouped by addendum, since a batch
+        call carries one addendum for all its segments.
+        """
+        if not self._batches(target_lang):
+            return None
+        hits: dict[int, TmHit] = {}
+        addenda: dict[int, str | None] = {}
+        misses: dict[PlanKey, tuple[str | None, Segment]] = {}
+        for index, segment in enumerate(segments):
+            if self._passes_through(segment):
+                continue
+            hit = self._lookup(segment, target_lang)
+            if hit is not None:
+                hits[index] = hit
+                continue
+            addendum = self._build_system_prompt_addendum(segment, target_lang)
+            addenda[index] = addendum
+            misses.setdefault((segment.fingerprint, target_lang, addendum), (addendum, segment))
+
+        results: dict[tuple[str, str | None], ProviderResult] = {}
+        for admitted in self._budget_rounds(list(misses.items())):
+            pending: dict[str | None, list[Segment]] = {}
+            for addendum, segment in admitted:
+                pending.setdefault(addendum, []).append(segment)
+            for addendum, batch in pending.items():
+                for segment, result in zip(
+                    batch, self._call_provider_batch(batch, target_lang, addendum), strict=True
+                ):
+                    results[(segment.fingerprint, addendum)] = result
+                    self._charge((segment.fingerprint, target_lang, addendum), result)
+        return _Prefetch(hits=hits, addenda=addenda, results=results)
+
+    def _prefetch_multi(self, segments: Sequence[Segment]) -> dict[str, _Prefetch] | None:
+        """Translate every language's TM misses in multi-target calls.
+
+        Returns ``None`` (per-language prefetch) unless there are several
+        target languages and the provider is multi-target for all of
+        them. A miss joins one call per distinct addendum. Its
+        languages with the same addendum share that call, since a
+        glossary built per target language can differ between them.
+        """
+        if not self._multi_targets():
+            return None
+        hits: dict[str, dict[int, TmHit]] = {lang: {} for lang in self._target_langs}
+        addenda: dict[str, dict[int, str | None]] = {lang: {} for lang in self._target_langs}
+        misses: dict[PlanKey, tuple[Segment, str, str | None]] = {}
+        for index, segment in enumerate(segments):
+            if self._passes_through(segment):
+                continue
+            for target_lang in self._target_langs:
+                hit = self._lookup(segment, target_lang)
+                if hit is not None:
+                    hits[target_lang][index] = hit
+                    continue
+                addendum = self._build_system_prompt_addendum(segment, target_lang)
+                addenda[target_lang][index] = addendum
+                misses.setdefault(
+                    (segment.fingerprint, target_lang, addendum), (segment, target_lang, addendum)
+                )
+
+        results: dict[str, dict[tuple[str, str | None], ProviderResult]] = {
+            lang: {} for lang in self._target_langs
+        }
+        for admitted in self._budget_rounds(list(misses.items())):
+            langs_by_segment: dict[str, dict[str | None, list[str]]] = {}
+            by_fingerprint: dict[str, Segment] = {}
+            for segment, target_lang, addendum in admitted:
+                by_fingerprint.setdefault(segment.fingerprint, segment)
+                langs_by_segment.setdefault(segment.fingerprint, {}).setdefault(
+                    addendum, []
+                ).append(target_lang)
+            pending: dict[tuple[str | None, tuple[str, ...]], list[Segment]] = {}
+            for fingerprint, langs_by_addendum in langs_by_segment.items():
+                for addendum, langs in langs_by_addendum.items():
+                    pending.setdefault((addendum, tuple(langs)), []).append(
+                        by_fingerprint[fingerprint]
+                    )
+            for (addendum, group_langs), batch in pending.items():
+                by_lang = self._call_provider_multi(batch, group_langs, addendum)
+                for target_lang in group_langs:
+                    for segment, result in zip(batch, by_lang[target_lang], strict=True):
+                        results[target_lang][(segment.fingerprint, addendum)] = result
+                        self._charge((segment.fingerprint, target_lang, addendum), result)
+        return {
+            lang: _Prefetch(hits=hits[lang], addenda=addenda[lang], results=results[lang])
+            for lang in self._target_langs
+        }
+
+    def _budget_rounds(self, misses: list[tuple[PlanKey, _Miss]]) -> Iterator[list[_Miss]]:
+        """Split a prefetch pass's misses into the batch rounds the run
+        budget allows; the caller charges each round before the next.
+
+        Each admitted miss holds its estimate against the budget until
+        it is charged, so one batch cannot overrun it. A miss whose cost
+        cannot be estimated yet ends its round: the round's charges give
+        the remaining misses an estimate. Misses the budget rejects are
+        left out (the per-segment loop skips them).
+        """
+        while misses:
+            admitted: list[_Miss] = []
+            rest: list[tuple[PlanKey, _Miss]] = []
+            for position, (key, miss) in enumerate(misses):
+                if self._spend is not None and not self._spend.reserve(key):
+                    continue
+                admitted.append(miss)
+                if self._spend is not None and self._spend.blind(key):
+                    rest = misses[position + 1 :]
+                    break
+            if admitted:
+                yield admitted
+            misses = rest
+
+    def _multi_targets(self) -> bool:
+        if len(self._target_langs) < 2 or self._cascade is not None or self._mask_placeholders:
+            return False
+        if isinstance(self._provider, ProviderRouter):
+            routing = self._routing_kwargs()
+            return self._provider.resolves_to_multi(
+                self._source_lang,
+                self._target_langs,
+                persona=routing.get("persona"),
+                domain=routing.get("domain"),
+            )
+        return uses_multi_target_path(self._provider) and all(
+            self._provider.supports(self._source_lang, lang) for lang in self._target_langs
+        )
+
+    def _batches(self, target_lang: str) -> bool:
+        provider = self._first_provider(target_lang)
+        if isinstance(provider, ProviderRouter):
+            routing = self._routing_kwargs(provider)
+            return provider.resolves_to_batch(
+                self._source_lang,
+                target_lang,
+                persona=routing.get("persona"),
+                domain=routing.get("domain"),
+            )
+        return uses_batch_path(provider)
+
+    def _routing_kwargs(self, provider: Provider | None = None) -> dict[str, str | None]:
+        provider = provider if provider is not None else self._provider
+        if isinstance(provider, ProviderRouter) and self._persona is not None:
+            return {"persona": self._persona.persona_id, "domain": self._persona.domain_id}
+        return {}
+
+    def _call_provider_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        system_prompt_addendum: str | None,
+    ) -> list[ProviderResult]:
+        """Batch twin of :meth:`_call_provider`, with the same
+        conditional kwargs. In cascade mode this batches the drafts."""
+        if self._mask_placeholders:
+            return self._translate_masked(
+                segments, lambda batch: self._send_batch(batch, target_lang, system_prompt_addendum)
+            )
+        return self._send_batch(segments, target_lang, system_prompt_addendum)
+
+    def _send_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        system_prompt_addendum: str | None,
+    ) -> list[ProviderResult]:
+        provider = self._first_provider(target_lang)
+        kwargs = self._routing_kwargs(provider)
+        if system_prompt_addendum is not None:
+            kwargs["system_prompt_addendum"] = system_prompt_addendum
+        if isinstance(provider, ProviderRouter):
+            return provider.translate_batch(segments, target_lang, **kwargs)
+        assert isinstance(provider, BatchProvider)  # Gated by `_batches`.
+        if not kwargs:
+            return provider.translate_batch(segments, target_lang)
+        return provider.translate_batch(segments, target_lang, **kwargs)
+
+    def _call_provider_multi(
+        self,
+        segments: Sequence[Segment],
+        target_langs: Sequence[str],
+        system_prompt_addendum: str | None,
+    ) -> dict[str, list[ProviderResult]]:
+        """Multi-target twin of :meth:`_call_provider`, with the same
+        conditional kwargs."""
+        kwargs = self._routing_kwargs()
+        if system_prompt_addendum is not None:
+            kwargs["system_prompt_addendum"] = system_prompt_addendum
+        if isinstance(self._provider, ProviderRouter):
+            return self._provider.translate_multi(segments, target_langs, **kwargs)
+        assert isinstance(self._provider, MultiTargetProvider)  # Gated by `_multi_targets`.
+        if not kwargs:
+            return self._provider.translate_multi(segments, target_langs)
+        return self._provider.translate_multi(segments, target_langs, **kwargs)
+
     def _call_provider(
         self,
         segment: Segment,
         target_lang: str,
         system_prompt_addendum: str | None,
+        *,
+        provider: Provider | None = None,
     ) -> ProviderResult:
-        """Forward to the configured provider with the right kwargs.
+        """Forward to ``provider`` (default: the configured one) with
+        the right kwargs.
 
         Cycle-3 S6 P2 fix: when the provider is a
         :class:`ProviderRouter`, thread ``persona`` + ``domain`` so the
@@ -284,7 +941,25 @@ class TranslationPipeline:
         doubles whose ``translate()`` predates the cycle-3 Protocol
         bump stay byte-stable.
         """
-        is_router = isinstance(self._provider, ProviderRouter)
+        masked = mask_segment(segment) if self._mask_placeholders else None
+        if masked is not None and len(masked.parts) == 1:
+            restored = masked.restore(
+                [self._send(masked.parts[0], target_lang, system_prompt_addendum, provider)]
+            )
+            if restored is not None:
+                self._masked_count += 1
+                return restored
+        return self._send(segment, target_lang, system_prompt_addendum, provider)
+
+    def _send(
+        self,
+        segment: Segment,
+        target_lang: str,
+        system_prompt_addendum: str | None,
+        provider: Provider | None,
+    ) -> ProviderResult:
+        provider = provider if provider is not None else self._provider
+        is_router = isinstance(provider, ProviderRouter)
         kwargs: dict[str, str | None] = {}
         if system_prompt_addendum is not None:
             kwargs["system_prompt_addendum"] = system_prompt_addendum
@@ -292,8 +967,35 @@ class TranslationPipeline:
             kwargs["persona"] = self._persona.persona_id
             kwargs["domain"] = self._persona.domain_id
         if not kwargs:
-            return self._provider.translate(segment, target_lang)
-        return self._provider.translate(segment, target_lang, **kwargs)
+            return provider.translate(segment, target_lang)
+        return provider.translate(segment, target_lang, **kwargs)
+
+    def _translate_masked(
+        self,
+        segments: Sequence[Segment],
+        send: Callable[[Sequence[Segment]], list[ProviderResult]],
+    ) -> list[ProviderResult]:
+        """Translate ``segments`` through ``send`` with placeholder
+        masking: one call for the sub-segments of every maskable
+        segment plus the others whole, and a second one for segments
+        whose sub-segments failed the parity check."""
+        masks = [mask_segment(segment) for segment in segments]
+        batch: list[Segment] = []
+        for segment, masked in zip(segments, masks, strict=True):
+            batch.extend(masked.parts if masked is not None else (segment,))
+        sent = iter(send(batch))
+        results: list[ProviderResult | None] = []
+        for masked in masks:
+            if masked is None:
+                results.append(next(sent))
+                continue
+            restored = masked.restore([next(sent) for _ in masked.parts])
+            if restored is not None:
+                self._masked_count += 1
+            results.append(restored)
+        retry = [segment for segment, result in zip(segments, results) if result is None]
+        fallback = iter(send(retry) if retry else [])
+        return [result if result is not None else next(fallback) for result in results]
 
     def _build_system_prompt_addendum(self, segment: Segment, target_lang: str) -> str | None:
         """Compose the persona prompt + termbase glossary block.
@@ -303,7 +1005,17 @@ class TranslationPipeline:
         implementation.  Semantics are byte-identical to the pre-cycle-5
         private implementation — the cycle-3 S6 integration test asserts
         exact string values and must pass unchanged.
+
+        With a prompt budget, the budgeted
+        :class:`~ainemo.core.termbase.glossary.GlossaryPromptBuilder`
+        builds it instead.
         """
+        if self._prompt_builder is not None:
+            return self._prompt_builder.build(
+                source_text=segment.source_text,
+                source_lang=segment.source_lang,
+                target_lang=target_lang,
+            )
         return build_glossary_block(
             self._termbase,
             self._persona,
@@ -319,6 +1031,18 @@ class TranslationPipeline:
         return self._strict
 
 
+def _from_provider(segment: Segment, target_lang: str, result: ProviderResult) -> TranslatedSegment:
+    return TranslatedSegment(
+        segment=segment,
+        target_lang=target_lang,
+        target_text=result.target_text,
+        provider=result.provider,
+        model=result.model,
+        confidence=result.confidence,
+        source=TRANSLATION_SOURCE_PROVIDER,
+    )
+
+
 _LOCALE_SUFFIX_PATTERN = re.compile(r"_(?:[a-z]{2,3})(?:_[A-Za-z][A-Za-z0-9]{1,3})?$")
 """Matches a trailing locale tag in a filename stem.
 
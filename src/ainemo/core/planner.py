@@ -0,0 +1,273 @@
+"""Run planning: what a translate run will cost before it starts.
+
+:func:`plan_run` turns the pipeline's TM misses
+(:meth:`~ainemo.core.pipeline.TranslationPipeline.collect_misses`) into
+a :class:`RunPlan` without calling any provider:
+
+- tokens per miss come from :func:`~ainemo.providers._usage_log.estimate_tokens_from_chars`
+  over the source text (and the system-prompt addendum, on the input
+  side); the output is assumed about as long as the source. The input
+  side is at least the median input of the provider's past calls,
+  which carries the fixed system prompt;
+- cost comes from :meth:`~ainemo.providers._usage_log.UsageLog.estimate_for`,
+  the median cost per token of the provider's past calls;
+- wall time comes from the median latency of those calls, summed as if
+  the misses were sent one at a time.
+
+Estimates are rough (±50%). A provider with no history in the UsageLog
+gets no cost or time estimate, so a cost budget admits its misses at
+plan time (:attr:`RunPlan.unpriced_providers`); the pipeline then
+checks them against the spend it records.
+
+With a :class:`RunBudget`, the plan admits misses in priority order —
+keys matching a priority pattern first, in every language, then the
+rest, languages in ``--to-langs`` order — until the next one would
+exceed the budget. The pipeline translates the admitted misses only,
+and also stops once the spend it actually records, plus the next
+call's estimate, would exceed the budget. A call that costs more than
+its estimate can still take the run past the budget. Everything
+else is left untranslated and counted in ``PipelineResult.skipped_count``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from typing import Callable, Iterable, Sequence
+
+from ainemo.core.segment import Segment
+from ainemo.providers._usage_log import UsageLog, estimate_tokens_from_chars
+
+PlanKey = tuple[str, str, str | None]
+"""(segment fingerprint, target language, system-prompt addendum), the
+key :meth:`~ainemo.core.pipeline.TranslationPipeline.collect_misses`
+de-duplicates by."""
+
+_History = tuple[float | None, float | None, float | None]
+
+
+@dataclass(frozen=True)
+class RunBudget:
+    """Spend limits for one run; ``None`` leaves a dimension unbounded."""
+
+    max_cost_usd: float | None = None
+    max_tokens: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_cost_usd is not None and self.max_cost_usd <= 0:
+            raise ValueError(f"max_cost_usd must be > 0, got {self.max_cost_usd:g}.")
+        if self.max_tokens is not None and self.max_tokens < 1:
+            raise ValueError(f"max_tokens must be >= 1, got {self.max_tokens}.")
+
+    def fits(self, cost_usd: float, tokens: int) -> bool:
+        """Whether a spend of ``cost_usd`` and ``tokens`` stays within
+        the budget."""
+        if self.max_cost_usd is not None and cost_usd > self.max_cost_usd:
+            return False
+        return self.max_tokens is None or tokens <= self.max_tokens
+
+
+@dataclass(frozen=True)
+class PlannedCall:
+    """One TM miss and what translating it is expected to spend."""
+
+    segment_key: str
+    target_lang: str
+    key: PlanKey
+    provider_id: str
+    input_tokens: int
+    output_tokens: int
+    cost_usd: float | None
+    """``None`` when the provider has no cost history."""
+
+    latency_ms: float | None
+    admitted: bool = True
+    """Whether the call fits the run's budget."""
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass(frozen=True)
+class ProviderEstimate:
+    """Planned calls of one provider, summed. Only admitted calls count."""
+
+    provider_id: str
+    calls: int
+    input_tokens: int
+    output_tokens: int
+    cost_usd: float | None
+    """``None`` when no call of the provider has a cost estimate."""
+
+    wall_time_s: float | None
+
+
+@dataclass(frozen=True)
+class RunPlan:
+    """The TM-hit projection and per-miss estimates for one run."""
+
+    segment_count: int
+    """Segments times target languages."""
+
+    calls: tuple[PlannedCall, ...]
+    """Every miss, in priority order."""
+
+    budget: RunBudget | None = None
+
+    @property
+    def miss_count(self) -> int:
+        return len(self.calls)
+
+    @property
+    def tm_hit_count(self) -> int:
+        """Projected TM hits. Repeats of a missed string count as hits:
+        the first translation is stored before the repeat comes up."""
+        return self.segment_count - self.miss_count
+
+    @property
+    def admitted_count(self) -> int:
+        return sum(1 for call in self.calls if call.admitted)
+
+    @property
+    def skipped(self) -> tuple[PlannedCall, ...]:
+        return tuple(call for call in self.calls if not call.admitted)
+
+    def by_provider(self) -> tuple[ProviderEstimate, ...]:
+        """Admitted calls summed per provider, in first-call order."""
+        grouped: dict[str, list[PlannedCall]] = {}
+        for call in self.calls:
+            if call.admitted:
+                grouped.setdefault(call.provider_id, []).append(call)
+        return tuple(
+            ProviderEstimate(
+                provider_id=provider_id,
+                calls=len(calls),
+                input_tokens=sum(call.input_tokens for call in calls),
+                output_tokens=sum(call.output_tokens for call in calls),
+                cost_usd=_sum_known(call.cost_usd for call in calls),
+                wall_time_s=_seconds(_sum_known(call.latency_ms for call in calls)),
+            )
+            for provider_id, calls in grouped.items()
+        )
+
+    @property
+    def unpriced_providers(self) -> tuple[str, ...]:
+        """Providers with admitted calls but no cost estimate, in
+        first-call order. A cost budget cannot limit them at plan time."""
+        return tuple(
+            dict.fromkeys(
+                call.provider_id for call in self.calls if call.admitted and call.cost_usd is None
+            )
+        )
+
+    @property
+    def cost_usd(self) -> float | None:
+        return _sum_known(estimate.cost_usd for estimate in self.by_provider())
+
+    @property
+    def total_tokens(self) -> int:
+        return sum(call.total_tokens for call in self.calls if call.admitted)
+
+    @property
+    def wall_time_s(self) -> float | None:
+        return _sum_known(estimate.wall_time_s for estimate in self.by_provider())
+
+
+def plan_run(
+    misses: Sequence[tuple[Segment, str, str | None]],
+    *,
+    segment_count: int,
+    target_langs: Sequence[str],
+    provider_for: Callable[[str], str],
+    usage_log: UsageLog | None = None,
+    budget: RunBudget | None = None,
+    priority_keys: Sequence[str] = (),
+) -> RunPlan:
+    """Estimate ``misses`` — (segment, target language, addendum)
+    triples — and admit them against ``budget``.
+
+    ``provider_for`` names the provider a target language's misses go
+    to. ``priority_keys`` are ``fnmatch`` patterns over segment keys.
+    Makes no provider call.
+    """
+    lang_order = {lang: index for index, lang in enumerate(target_langs)}
+
+    def _priority(item: tuple[int, tuple[Segment, str, str | None]]) -> tuple[int, int, int]:
+        index, (segment, target_lang, _) = item
+        urgent = any(fnmatchcase(segment.key, pattern) for pattern in priority_keys)
+        return (0 if urgent else 1, lang_order.get(target_lang, len(lang_order)), index)
+
+    estimates: dict[str, _History] = {}
+    calls: list[PlannedCall] = []
+    spent_cost = 0.0
+    spent_tokens = 0
+    exhausted = False
+    for _, (segment, target_lang, addendum) in sorted(enumerate(misses), key=_priority):
+        provider_id = provider_for(target_lang)
+        if provider_id not in estimates:
+            estimates[provider_id] = _history(usage_log, provider_id)
+        cost_per_token, latency_ms, typical_input = estimates[provider_id]
+        input_tokens = max(
+            estimate_tokens_from_chars(
+                len(segment.source_text) + len(addendum or ""), provider_id=provider_id
+            ),
+            round(typical_input or 0),
+        )
+        output_tokens = estimate_tokens_from_chars(
+            len(segment.source_text), provider_id=provider_id
+        )
+        tokens = input_tokens + output_tokens
+        cost = cost_per_token * tokens if cost_per_token is not None else None
+        if budget is not None and not exhausted:
+            # Admission stops at the first miss that does not fit, so
+            # the budget is spent in priority order.
+            exhausted = not budget.fits(spent_cost + (cost or 0.0), spent_tokens + tokens)
+        if not exhausted:
+            spent_cost += cost or 0.0
+            spent_tokens += tokens
+        calls.append(
+            PlannedCall(
+                segment_key=segment.key,
+                target_lang=target_lang,
+                key=(segment.fingerprint, target_lang, addendum),
+                provider_id=provider_id,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cost_usd=cost,
+                latency_ms=latency_ms,
+                admitted=not exhausted,
+            )
+        )
+    return RunPlan(segment_count=segment_count, calls=tuple(calls), budget=budget)
+
+
+def _history(usage_log: UsageLog | None, provider_id: str) -> _History:
+    """(cost per token, latency in ms, input tokens per call), medians
+    of the provider's past calls, each ``None`` without history."""
+    if usage_log is None:
+        return (None, None, None)
+    return (
+        usage_log.estimate_for(provider_id, None, 1),
+        usage_log.estimate_latency_ms(provider_id),
+        usage_log.estimate_input_tokens(provider_id),
+    )
+
+
+def _sum_known(values: Iterable[float | None]) -> float | None:
+    known = [value for value in values if value is not None]
+    return sum(known) if known else None
+
+
+def _seconds(milliseconds: float | None) -> float | None:
+    return milliseconds / 1000 if milliseconds is not None else None
+
+
+__all__ = [
+    "PlanKey",
+    "PlannedCall",
+    "ProviderEstimate",
+    "RunBudget",
+    "RunPlan",
+    "plan_run",
+]
@@ -40,8 +40,11 @@ TRANSLATION_SOURCE_EXACT_TM: Final = "exact_tm"
 TRANSLATION_SOURCE_FUZZY_TM: Final = "fuzzy_tm"
 TRANSLATION_SOURCE_PROVIDER: Final = "provider"
 TRANSLATION_SOURCE_MANUAL: Final = "manual"
+# Copied from the source by the pipeline's non-translatable segment
+# stage (``ainemo.core.passthrough``); never stored to the TM.
+TRANSLATION_SOURCE_PASSTHROUGH: Final = "passthrough"
 
-TranslationSource = Literal["exact_tm", "fuzzy_tm", "provider", "manual"]
+TranslationSource = Literal["exact_tm", "fuzzy_tm", "provider", "manual", "passthrough"]
 
 
 class PlaceholderKind(str, Enum):
@@ -168,4 +171,5 @@ __all__ = [
     "TRANSLATION_SOURCE_FUZZY_TM",
     "TRANSLATION_SOURCE_PROVIDER",
     "TRANSLATION_SOURCE_MANUAL",
+    "TRANSLATION_SOURCE_PASSTHROUGH",
 ]
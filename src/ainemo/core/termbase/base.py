@@ -142,6 +142,10 @@ class Persona:
 
     style_guide_url: str | None = None
     glossary_overrides: tuple[GlossaryOverride, ...] = ()
+    do_not_translate: tuple[str, ...] = ()
+    """Values (brand and product names) the pipeline's passthrough
+    stage copies verbatim instead of translating, when the whole
+    segment is one of them (see :mod:`ainemo.core.passthrough`)."""
 
 
 @dataclass(frozen=True)
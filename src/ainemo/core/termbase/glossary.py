@@ -12,15 +12,25 @@ extraction.
 
 The pipeline refactored its private method to delegate here; the UI's
 ``/personas/<persona_id>/preview-hits`` route calls here directly.
+
+:class:`GlossaryPromptBuilder` is the token-budgeted variant. With a
+:class:`PromptBudget` it keeps only glossary entries whose source term
+literally appears in the segment, ranks them by relevance, drops
+repeated target terms and stops adding entries at the budget. Without
+a budget its output is :func:`build_glossary_block`'s, byte for byte.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Final
 
 from ainemo.core.termbase.base import ConceptHit, Persona, Termbase
+from ainemo.providers._usage_log import estimate_tokens_from_chars
 
 _GLOSSARY_HEADER: Final = "Glossary (apply to the segment if relevant):"
+_SECTION_SEPARATOR: Final = "\n\n"
+_ENTRY_TEMPLATE: Final = '- "{source}" → "{target}"'
 
 
 def format_glossary_block(hits: tuple[ConceptHit, ...], target_lang: str) -> str | None:
@@ -45,9 +55,7 @@ def format_glossary_block(hits: tuple[ConceptHit, ...], target_lang: str) -> str
     for hit in hits:
         if not hit.target_terms:
             continue
-        target_surface = hit.target_terms[0].surface
-        source_surface = hit.matched_source_term.surface
-        lines.append(f'- "{source_surface}" → "{target_surface}"')
+        lines.append(_entry(hit))
     if not lines:
         return None
     return "\n".join([_GLOSSARY_HEADER, *lines])
@@ -103,10 +111,184 @@ def build_glossary_block(
     if not sections:
         return None
 
-    return "\n\n".join(sections)
+    return _SECTION_SEPARATOR.join(sections)
+
+
+@dataclass(frozen=True)
+class PromptBudget:
+    """Token budget for the whole system-prompt addendum.
+
+    ``provider_id`` picks the characters-per-token ratio the estimate
+    uses (see :func:`~ainemo.providers._usage_log.estimate_tokens_from_chars`).
+    The persona block is always kept, even over the budget; glossary
+    entries fill what is left.
+    """
+
+    max_tokens: int
+    provider_id: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_tokens < 1:
+            raise ValueError(f"max_tokens must be >= 1, got {self.max_tokens}.")
+
+    def tokens(self, text: str | None) -> int:
+        return _tokens(text, self.provider_id)
+
+
+@dataclass(frozen=True)
+class PromptStats:
+    """Addendum sizes over the distinct prompts a builder produced."""
+
+    prompts: int = 0
+    full_tokens: int = 0
+    """Estimated tokens :func:`build_glossary_block` would have sent."""
+
+    sent_tokens: int = 0
+    dropped_entries: int = 0
+    """Glossary entries left out: absent from the segment, a repeated
+    target term, or over the budget."""
+
+    @property
+    def tokens_saved(self) -> int:
+        return self.full_tokens - self.sent_tokens
+
+
+class GlossaryPromptBuilder:
+    """Builds addenda like :func:`build_glossary_block`, within an
+    optional :class:`PromptBudget`.
+
+    Results are memoized per (source text, source language, target
+    language), so each distinct prompt costs one termbase lookup and
+    is counted once in :meth:`stats`. The rendered persona block is
+    cached per persona.
+    """
+
+    def __init__(
+        self,
+        termbase: Termbase | None,
+        persona: Persona | None,
+        *,
+        budget: PromptBudget | None = None,
+    ) -> None:
+        self._termbase = termbase
+        self._persona = persona
+        self._budget = budget
+        self._persona_blocks: dict[str, str | None] = {}
+        self._built: dict[tuple[str, str, str], str | None] = {}
+        self._stats = PromptStats()
+
+    def build(self, *, source_text: str, source_lang: str, target_lang: str) -> str | None:
+        key = (source_text, source_lang, target_lang)
+        if key not in self._built:
+            self._built[key] = self._build(source_text, source_lang, target_lang)
+        return self._built[key]
+
+    def stats(self) -> PromptStats:
+        return self._stats
+
+    def reset(self) -> None:
+        """Forget memoized prompts and zero the stats, e.g. per run."""
+        self._built.clear()
+        self._stats = PromptStats()
+
+    def _build(self, source_text: str, source_lang: str, target_lang: str) -> str | None:
+        if self._budget is None:
+            addendum = build_glossary_block(
+                self._termbase,
+                self._persona,
+                source_text=source_text,
+                source_lang=source_lang,
+                target_lang=target_lang,
+            )
+            self._count(addendum, addendum, dropped=0)
+            return addendum
+        if self._termbase is None and self._persona is None:
+            return None
+
+        persona_block = self._persona_block()
+        hits: tuple[ConceptHit, ...] = ()
+        if self._termbase is not None:
+            hits = self._termbase.lookup_concepts_for(
+                source_text,
+                source_lang,
+                target_lang,
+                domain_id=self._persona.domain_id if self._persona is not None else None,
+            )
+        full = _join(persona_block, format_glossary_block(hits, target_lang))
+        entries = _ranked_entries(hits, source_text)
+        kept: list[str] = []
+        for entry in entries:
+            candidate = _join(persona_block, _glossary([*kept, entry]))
+            if self._budget.tokens(candidate) > self._budget.max_tokens:
+                break
+            kept.append(entry)
+        addendum = _join(persona_block, _glossary(kept))
+        with_target = sum(1 for hit in hits if hit.target_terms)
+        self._count(full, addendum, dropped=with_target - len(kept))
+        return addendum
+
+    def _persona_block(self) -> str | None:
+        if self._persona is None:
+            return None
+        persona_id = self._persona.persona_id
+        if persona_id not in self._persona_blocks:
+            self._persona_blocks[persona_id] = self._persona.prompt_addendum.strip() or None
+        return self._persona_blocks[persona_id]
+
+    def _count(self, full: str | None, sent: str | None, *, dropped: int) -> None:
+        provider_id = self._budget.provider_id if self._budget is not None else None
+        self._stats = PromptStats(
+            prompts=self._stats.prompts + 1,
+            full_tokens=self._stats.full_tokens + _tokens(full, provider_id),
+            sent_tokens=self._stats.sent_tokens + _tokens(sent, provider_id),
+            dropped_entries=self._stats.dropped_entries + dropped,
+        )
+
+
+def _tokens(text: str | None, provider_id: str | None) -> int:
+    return estimate_tokens_from_chars(len(text or ""), provider_id=provider_id)
+
+
+def _entry(hit: ConceptHit) -> str:
+    return _ENTRY_TEMPLATE.format(
+        source=hit.matched_source_term.surface, target=hit.target_terms[0].surface
+    )
+
+
+def _ranked_entries(hits: tuple[ConceptHit, ...], source_text: str) -> list[str]:
+    """Glossary lines for the hits whose source term appears literally
+    (case-insensitively) in ``source_text``: most relevant first, then
+    longest source term, one line per target term."""
+    text = source_text.casefold()
+    present = [
+        hit
+        for hit in hits
+        if hit.target_terms and hit.matched_source_term.surface.casefold() in text
+    ]
+    present.sort(key=lambda hit: (-hit.relevance, -len(hit.matched_source_term.surface)))
+    seen: set[str] = set()
+    entries: list[str] = []
+    for hit in present:
+        target = hit.target_terms[0].surface.casefold()
+        if target not in seen:
+            seen.add(target)
+            entries.append(_entry(hit))
+    return entries
+
+
+def _glossary(entries: list[str]) -> str | None:
+    return "\n".join([_GLOSSARY_HEADER, *entries]) if entries else None
+
+
+def _join(*sections: str | None) -> str | None:
+    present = [section for section in sections if section]
+    return _SECTION_SEPARATOR.join(present) if present else None
 
 
 __all__ = [
+    "GlossaryPromptBuilder",
+    "PromptBudget",
+    "PromptStats",
     "build_glossary_block",
     "format_glossary_block",
     "_GLOSSARY_HEADER",
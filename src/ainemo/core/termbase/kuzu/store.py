@@ -22,8 +22,9 @@ Design choices
   refreshes properties without duplicating the row. Mirrors the
   cycle-1 SQLite TM's ``INSERT OR REPLACE`` idempotency contract.
 - **JSON-encoded list properties.** Kuzu's typed columns work fine
-  for scalars; ``forbidden_terms`` and ``glossary_overrides`` are
-  encoded as JSON strings on the ``Persona`` node. Cheap, portable,
+  for scalars; ``forbidden_terms``, ``glossary_overrides`` and
+  ``do_not_translate`` are encoded as JSON strings on the ``Persona``
+  node. Cheap, portable,
   and avoids mapping nested ``LIST`` types whose API surface differs
   across Kuzu minor versions.
 - **Literal n-gram match.** ``lookup_concepts_for`` walks every term
@@ -226,6 +227,7 @@ class KuzuTermbase:
                 for override in persona.glossary_overrides
             ]
         )
+        dnt_json = json.dumps(list(persona.do_not_translate))
         self._conn.execute(
             f"MERGE (p:{NODE_LABEL_PERSONA} {{persona_id: $pid}}) "
             "ON CREATE SET p.domain_id = $did, p.name = $name, "
@@ -233,13 +235,15 @@ class KuzuTermbase:
             "              p.forbidden_terms_json = $fbt, "
             "              p.prompt_addendum = $addendum, "
             "              p.style_guide_url = $sgu, "
-            "              p.glossary_overrides_json = $ovr "
+            "              p.glossary_overrides_json = $ovr, "
+            "              p.do_not_translate_json = $dnt "
             "ON MATCH  SET p.domain_id = $did, p.name = $name, "
             "              p.register = $reg, "
             "              p.forbidden_terms_json = $fbt, "
             "              p.prompt_addendum = $addendum, "
             "              p.style_guide_url = $sgu, "
-            "              p.glossary_overrides_json = $ovr",
+            "              p.glossary_overrides_json = $ovr, "
+            "              p.do_not_translate_json = $dnt",
             {
                 "pid": persona.persona_id,
                 "did": persona.domain_id,
@@ -249,6 +253,7 @@ class KuzuTermbase:
                 "addendum": persona.prompt_addendum,
                 "sgu": persona.style_guide_url,
                 "ovr": overrides_json,
+                "dnt": dnt_json,
             },
         )
 
@@ -257,7 +262,8 @@ class KuzuTermbase:
             f"MATCH (p:{NODE_LABEL_PERSONA} {{persona_id: $pid}}) "
             "RETURN p.persona_id, p.domain_id, p.name, p.register, "
             "       p.forbidden_terms_json, p.prompt_addendum, "
-            "       p.style_guide_url, p.glossary_overrides_json",
+            "       p.style_guide_url, p.glossary_overrides_json, "
+            "       p.do_not_translate_json",
             {"pid": persona_id},
         )
         row = _next_row(result)
@@ -270,7 +276,8 @@ class KuzuTermbase:
             f"MATCH (p:{NODE_LABEL_PERSONA}) "
             "RETURN p.persona_id, p.domain_id, p.name, p.register, "
             "       p.forbidden_terms_json, p.prompt_addendum, "
-            "       p.style_guide_url, p.glossary_overrides_json "
+            "       p.style_guide_url, p.glossary_overrides_json, "
+            "       p.do_not_translate_json "
             "ORDER BY p.persona_id"
         )
         personas: list[Persona] = []
@@ -454,8 +461,14 @@ class KuzuTermbase:
             "  prompt_addendum STRING, "
             "  style_guide_url STRING, "
             "  glossary_overrides_json STRING, "
+            "  do_not_translate_json STRING, "
             "  PRIMARY KEY (persona_id))"
         )
+        # Termbases created before ``do_not_translate`` get the column
+        # added in place.
+        self._conn.execute(
+            f"ALTER TABLE {NODE_LABEL_PERSONA} ADD IF NOT EXISTS do_not_translate_json STRING"
+        )
         self._conn.execute(
             f"CREATE NODE TABLE IF NOT EXISTS {NODE_LABEL_SEGMENT} ("
             "  fingerprint STRING, "
@@ -644,6 +657,7 @@ def _row_to_persona(row: list[Any]) -> Persona:
         register=None if row[3] is None else str(row[3]),
         style_guide_url=None if row[6] is None else str(row[6]),
         glossary_overrides=tuple(overrides_list),
+        do_not_translate=tuple(json.loads(row[8])) if row[8] is not None else (),
     )
 
 
@@ -24,6 +24,8 @@ Optional:
 - ``style_guide_url`` (string)
 - ``glossary_overrides`` (list of ``{source_term, target_lang,
   target_term}`` records)
+- ``do_not_translate`` (list of strings kept verbatim when a whole
+  segment is one of them)
 
 Unknown fields are rejected (``extra='forbid'``) so a YAML carrying
 the dropped ``provider_hints`` field surfaces as a load error rather
@@ -75,7 +77,7 @@ class _PersonaSchema(BaseModel):
     """Pydantic schema for one persona YAML file.
 
     Field order mirrors the public :class:`Persona` dataclass — four
-    mandatory, four optional. The ``Field(default=...)`` pattern keeps
+    mandatory, five optional. The ``Field(default=...)`` pattern keeps
     omitted fields stable rather than raising.
     """
 
@@ -107,6 +109,7 @@ class _PersonaSchema(BaseModel):
     )
     style_guide_url: str | None = None
     glossary_overrides: tuple[_GlossaryOverrideSchema, ...] = Field(default_factory=tuple)
+    do_not_translate: tuple[str, ...] = Field(default_factory=tuple)
 
     def to_persona(self) -> Persona:
         return Persona(
@@ -125,6 +128,7 @@ class _PersonaSchema(BaseModel):
                 )
                 for ovr in self.glossary_overrides
             ),
+            do_not_translate=tuple(self.do_not_translate),
         )
 
 
@@ -13,4 +13,11 @@ Cycle-1 ships:
 - :class:`ainemo.core.tm.sqlite.SqliteTranslationMemory` — the default
   backend with file-based SQLite + optional MiniLM embeddings for
   fuzzy lookup.
+
+:class:`ainemo.core.tm.cached.CachedTranslationMemory` wraps any
+backend with a write-through LRU lookup cache for long-lived
+processes (``nemo daemon``, ``nemo app``).
+:class:`ainemo.core.tm.memory.InMemoryTranslationMemory` is a
+dict/numpy backend for tests and short runs, optionally loaded from and
+snapshotted to a SQLite TM file.
 """
@@ -0,0 +1,239 @@
+"""In-memory negative-lookup filter for the SQLite TM.
+
+Cold runs (a brand-new bundle, a newly added target language) miss on
+almost every segment, yet each miss still pays an exact ``SELECT``
+and — with an embedder configured — an embedder call plus a full
+fuzzy scan. :class:`TmMembershipFilter` lets
+:class:`~ainemo.core.tm.sqlite.SqliteTranslationMemory` answer
+"certainly not cached" from memory:
+
+- **Exact keys** live in a Bloom filter over
+  ``(fingerprint, target_lang)``, ``(fingerprint, target_lang,
+  provider)`` and ``(fingerprint, target_lang, provider, model)`` — one
+  entry per lookup shape the pipeline uses. A Bloom filter never
+  reports a false negative, so a "no" skips the query safely; a
+  false-positive "maybe" (~1% at the configured density) just runs
+  the query as before.
+- **Fuzzy candidates** are tracked exactly: the small set of
+  ``(source_lang, target_lang[, provider[, model]])`` combinations that
+  have at least one translation with a stored embedding. When the
+  lookup's combination is absent there is no plausible fuzzy
+  neighbour, and the embedder call is skipped along with the scan.
+
+The filter is process-local and never persisted; it is rebuilt from
+the database on open. It assumes the owning connection is the only
+writer for its lifetime — rows written by another process after open
+are invisible to it (a stale "no" costs a redundant provider call,
+never a wrong translation).
+"""
+
+from __future__ import annotations
+
+from typing import Final, Hashable, Iterable
+
+import numpy as np
+from numpy.typing import NDArray
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# Bloom-filter density. 10 bits per key with 7 hash functions gives a
+# ~0.8% false-positive rate — well below the point where the wasted
+# SELECTs would matter.
+_BITS_PER_KEY: Final = 10
+_HASH_COUNT: Final = 7
+
+# Floor so an empty TM still gets a usefully sized filter for the
+# rows the first run stores.
+_MIN_CAPACITY: Final = 4096
+
+# Keys are hashed in chunks during bulk load so the (chunk, k)
+# position matrix stays a few MB regardless of TM size.
+_BULK_CHUNK: Final = 262_144
+
+_MASK_64: Final = 0xFFFFFFFFFFFFFFFF
+_MASK_32: Final = 0xFFFFFFFF
+
+
+class _BloomFilter:
+    """Bit-packed Bloom filter with double hashing.
+
+    Keys are any hashable; Python's per-process salted :func:`hash`
+    seeds the two base hashes, which is fine because the filter never
+    leaves the process.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = max(capacity, _MIN_CAPACITY)
+        self._bit_count = self._capacity * _BITS_PER_KEY
+        self._bits: NDArray[np.uint8] = np.zeros((self._bit_count + 7) // 8, dtype=np.uint8)
+        self._count = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def saturated(self) -> bool:
+        """True once more keys were added than the filter was sized
+        for; the false-positive rate climbs past the design point."""
+        return self._count > self._capacity
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._bits.nbytes)
+
+    def add(self, key: Hashable) -> None:
+        h1, h2 = _split_hash(key)
+        for i in range(_HASH_COUNT):
+            position = (h1 + i * h2) % self._bit_count
+            self._bits[position >> 3] |= np.uint8(1 << (position & 7))
+        self._count += 1
+
+    def add_many(self, keys: Iterable[Hashable]) -> None:
+        """Vectorized bulk insert used when the filter is built at open."""
+        chunk: list[int] = []
+        for key in keys:
+            chunk.append(hash(key) & _MASK_64)
+            if len(chunk) >= _BULK_CHUNK:
+                self._add_hashes(chunk)
+                chunk = []
+        if chunk:
+            self._add_hashes(chunk)
+
+    def __contains__(self, key: Hashable) -> bool:
+        h1, h2 = _split_hash(key)
+        for i in range(_HASH_COUNT):
+            position = (h1 + i * h2) % self._bit_count
+            if not (int(self._bits[position >> 3]) >> (position & 7)) & 1:
+                return False
+        return True
+
+    def _add_hashes(self, hashes: list[int]) -> None:
+        h = np.array(hashes, dtype=np.uint64)
+        h1 = h & np.uint64(_MASK_32)
+        h2 = (h >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(_HASH_COUNT, dtype=np.uint64)
+        positions = (h1[:, None] + steps[None, :] * h2[:, None]) % np.uint64(self._bit_count)
+        flat = positions.ravel()
+        np.bitwise_or.at(
+            self._bits,
+            (flat >> np.uint64(3)).astype(np.intp),
+            (np.uint8(1) << (flat & np.uint64(7)).astype(np.uint8)),
+        )
+        self._count += len(hashes)
+
+
+def _split_hash(key: Hashable) -> tuple[int, int]:
+    """Derive the two double-hashing bases exactly as
+    :meth:`_BloomFilter._add_hashes` does, so scalar and bulk inserts
+    set the same bits. ``h2`` is forced odd so it never collapses the
+    probe sequence onto one bit."""
+    h = hash(key) & _MASK_64
+    return h & _MASK_32, (h >> 32) | 1
+
+
+class TmMembershipFilter:
+    """Exact-key Bloom filter plus exact fuzzy-candidate set.
+
+    Feed it rows with :meth:`add` / :meth:`add_many`; ask it with
+    :meth:`might_contain` and :meth:`has_fuzzy_candidates`. Both
+    questions answer ``True`` whenever they cannot rule a hit out.
+    """
+
+    def __init__(self, expected_rows: int = 0) -> None:
+        # Three Bloom keys per row (one per lookup shape), sized with
+        # 2x headroom so the first run's stores don't saturate it.
+        self._keys = _BloomFilter(capacity=expected_rows * 3 * 2)
+        self._fuzzy: set[tuple[str, ...]] = set()
+
+    @property
+    def saturated(self) -> bool:
+        return self._keys.saturated
+
+    @property
+    def nbytes(self) -> int:
+        return self._keys.nbytes
+
+    def add(
+        self,
+        *,
+        fingerprint: str,
+        target_lang: str,
+        provider: str,
+        model: str,
+        source_lang: str,
+        has_embedding: bool,
+    ) -> None:
+        for key in _exact_keys(fingerprint, target_lang, provider, model):
+            self._keys.add(key)
+        if has_embedding:
+            self._fuzzy.update(_fuzzy_keys(source_lang, target_lang, provider, model))
+
+    def add_many(self, rows: Iterable[tuple[str, str, str, str, str, bool]]) -> None:
+        """Bulk insert ``(fingerprint, target_lang, provider, model,
+        source_lang, has_embedding)`` rows."""
+        fuzzy = self._fuzzy
+
+        def _keys() -> Iterable[Hashable]:
+            for fingerprint, target_lang, provider, model, source_lang, has_embedding in rows:
+                yield from _exact_keys(fingerprint, target_lang, provider, model)
+                if has_embedding:
+                    fuzzy.update(_fuzzy_keys(source_lang, target_lang, provider, model))
+
+        self._keys.add_many(_keys())
+
+    def might_contain(
+        self,
+        fingerprint: str,
+        target_lang: str,
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> bool:
+        """``False`` only when no stored translation can match the
+        lookup. A model filter without a provider filter has no
+        dedicated key and is answered at the (fingerprint, lang) level."""
+        if provider is None:
+            return (fingerprint, target_lang) in self._keys
+        if model is None:
+            return (fingerprint, target_lang, provider) in self._keys
+        return (fingerprint, target_lang, provider, model) in self._keys
+
+    def has_fuzzy_candidates(
+        self,
+        source_lang: str,
+        target_lang: str,
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> bool:
+        """``False`` when no embedded translation exists for the
+        combination, i.e. a fuzzy scan is guaranteed to miss."""
+        if provider is None:
+            return (source_lang, target_lang) in self._fuzzy
+        if model is None:
+            return (source_lang, target_lang, provider) in self._fuzzy
+        return (source_lang, target_lang, provider, model) in self._fuzzy
+
+
+def _exact_keys(
+    fingerprint: str, target_lang: str, provider: str, model: str
+) -> tuple[tuple[str, ...], ...]:
+    return (
+        (fingerprint, target_lang),
+        (fingerprint, target_lang, provider),
+        (fingerprint, target_lang, provider, model),
+    )
+
+
+def _fuzzy_keys(
+    source_lang: str, target_lang: str, provider: str, model: str
+) -> tuple[tuple[str, ...], ...]:
+    return (
+        (source_lang, target_lang),
+        (source_lang, target_lang, provider),
+        (source_lang, target_lang, provider, model),
+    )
+
+
+__all__ = ["TmMembershipFilter"]
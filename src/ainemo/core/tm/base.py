@@ -45,6 +45,30 @@ class TmHit:
     match_type: TmMatchType
 
 
+@dataclass(frozen=True)
+class TmCacheStats:
+    """Counters of an in-process lookup cache in front of a TM backend
+    (:class:`ainemo.core.tm.cached.CachedTranslationMemory`)."""
+
+    hits: int
+    """Lookups answered with a cached exact hit."""
+
+    negative_hits: int
+    """Lookups answered with a cached miss."""
+
+    misses: int
+    """Lookups forwarded to the backend."""
+
+    evictions: int
+    """Entries dropped to stay within the entry / byte bounds."""
+
+    entries: int
+    """Entries currently cached."""
+
+    bytes: int
+    """Approximate memory held by the cached entries."""
+
+
 @dataclass(frozen=True)
 class TmStats:
     """Aggregate TM statistics surfaced by `nemo tm stats` (CLI scope 10)."""
@@ -62,6 +86,33 @@ class TmStats:
     """Number of segments that have an embedding stored — relevant for
     fuzzy-lookup readiness."""
 
+    cache: TmCacheStats | None = None
+    """Lookup-cache counters when the TM is wrapped in a cache; ``None``
+    for a bare backend."""
+
+
+@dataclass(frozen=True)
+class TmUsage:
+    """One stored translation with its usage counters. Surfaced by
+    ``nemo tm stats --top`` and consumed by the hot-set preload of
+    :class:`ainemo.core.tm.cached.CachedTranslationMemory`."""
+
+    translated: TranslatedSegment
+    """The stored row, tagged as an exact-TM translation. The segment's
+    ``key`` is the fingerprint — bundle keys are not stored."""
+
+    hit_count: int
+
+    last_hit_at: int | None
+    """Unix seconds of the most recent hit; ``None`` if never hit."""
+
+    newest_for_provider: bool
+    """True when this is the row a provider-scoped exact lookup (no
+    model filter) returns — the most recent for its provider."""
+
+    newest_for_target_lang: bool
+    """True when this is the row an unscoped exact lookup returns."""
+
 
 @runtime_checkable
 class TranslationMemory(Protocol):
@@ -127,11 +178,52 @@ class TranslationMemory(Protocol):
         ...
 
 
+@runtime_checkable
+class UsageTrackingTranslationMemory(TranslationMemory, Protocol):
+    """A TM that counts hits per stored translation (cycle-6).
+
+    Optional capability — consumers check ``isinstance`` and degrade
+    gracefully for backends that do not track usage.
+    """
+
+    def lookup(
+        self,
+        segment: Segment,
+        target_lang: str,
+        fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD,
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+        record_hits: bool = True,
+    ) -> TmHit | None:
+        """:meth:`TranslationMemory.lookup`; ``record_hits=False``
+        leaves the hit counters untouched (e.g. for a dry-run plan)."""
+        ...
+
+    def record_hit(self, translated: TranslatedSegment) -> None:
+        """Count a hit served on the backend's behalf (e.g. from a
+        cache). Implementations may defer the write."""
+        ...
+
+    def flush_hits(self) -> None:
+        """Persist any deferred hit counts."""
+        ...
+
+    def iter_top_translations(
+        self, *, per_target_lang: int, target_lang: str | None = None
+    ) -> Iterator[TmUsage]:
+        """Yield the most-hit rows per target language, most-hit first."""
+        ...
+
+
 __all__ = [
+    "TmCacheStats",
     "TmHit",
     "TmStats",
+    "TmUsage",
     "TmMatchType",
     "TranslationMemory",
+    "UsageTrackingTranslationMemory",
     "TM_MATCH_TYPE_EXACT",
     "TM_MATCH_TYPE_FUZZY",
     "DEFAULT_FUZZY_THRESHOLD",
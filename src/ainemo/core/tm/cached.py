@@ -0,0 +1,346 @@
+"""Write-through LRU cache in front of any :class:`TranslationMemory`.
+
+Long-lived callers — the ``nemo daemon`` serving a Gradle build, the
+``nemo app`` reviewer UI — ask the TM about the same fingerprints
+over and over. Every repeat against
+:class:`~ainemo.core.tm.sqlite.SqliteTranslationMemory` pays a
+``SELECT`` (and, on a miss with an embedder configured, an embedder
+call plus a fuzzy scan). :class:`CachedTranslationMemory` wraps any
+backend and answers repeats from memory:
+
+- **Exact hits** are cached per ``(fingerprint, target_lang, provider,
+  model)`` lookup key and rebound to the caller's
+  :class:`~ainemo.core.segment.Segment` on the way out, so the bundle
+  key of the current request is preserved exactly as the backend
+  would preserve it.
+- **Misses** are cached too, remembering the fuzzy threshold they were
+  computed at. A miss at threshold *t* stays a miss for any threshold
+  ``>= t``; a looser threshold goes back to the backend.
+- **Fuzzy hits** are not cached. They depend on the whole corpus for
+  the language pair, and :meth:`store` would have to invalidate them
+  on every write.
+
+:meth:`store` writes through to the backend first, then primes the
+exact keys the new row answers and bumps a per-target-language
+generation that invalidates every cached miss for that language (a
+new row can turn any of them into a fuzzy hit). The cache never answers for rows
+written by *another* process after it was populated — the same
+single-writer assumption as the SQLite TM's membership filter.
+
+Eviction is LRU, bounded by both an entry count and an approximate
+byte budget (the ``sys.getsizeof`` of the cached strings plus a fixed
+per-entry overhead). Counters are surfaced on
+:attr:`TmStats.cache <ainemo.core.tm.base.TmStats.cache>`.
+
+When the backend tracks usage
+(:class:`~ainemo.core.tm.base.UsageTrackingTranslationMemory`), cache
+hits are forwarded to its deferred hit counters, and
+:meth:`CachedTranslationMemory.preload_hot_set` can warm the cache with
+the most-hit rows per target language before the first request.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Final, Iterator
+
+from ainemo.core.segment import TRANSLATION_SOURCE_EXACT_TM, Segment, TranslatedSegment
+from ainemo.core.tm.base import (
+    DEFAULT_FUZZY_THRESHOLD,
+    EXACT_MATCH_SIMILARITY,
+    TM_MATCH_TYPE_EXACT,
+    TmCacheStats,
+    TmHit,
+    TmStats,
+    TmUsage,
+    TranslationMemory,
+    UsageTrackingTranslationMemory,
+)
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# Defaults sized for a daemon serving a large Android build: ~50k
+# cached lookups cost in the order of tens of MB, far below the
+# models the same process keeps resident.
+DEFAULT_CACHE_MAX_ENTRIES: Final = 50_000
+DEFAULT_CACHE_MAX_BYTES: Final = 64 * 1024 * 1024
+
+# Approximate fixed cost of one cache entry beyond its strings: the
+# OrderedDict slot, the key tuple, the _Entry / TmHit /
+# TranslatedSegment objects. Deliberately rounded up — the byte budget
+# is a ceiling, not an accounting system.
+_ENTRY_OVERHEAD_BYTES: Final = 512
+
+_CacheKey = tuple[str, str, "str | None", "str | None"]
+
+
+@dataclass(frozen=True)
+class _Entry:
+    """One cached lookup result.
+
+    ``hit`` is ``None`` for a cached miss; ``threshold`` only matters
+    in that case. ``generation`` is the target language's write
+    generation the entry was computed at — a cached miss is served
+    only while it is current.
+    """
+
+    hit: TmHit | None
+    threshold: float
+    generation: int
+    size: int
+
+
+class CachedTranslationMemory:
+    """Bounded LRU for exact hits and misses, write-through on store.
+
+    Implements the :class:`TranslationMemory` Protocol, so it drops in
+    wherever a backend is accepted. The wrapped backend stays owned by
+    the caller — close it through :attr:`backend` (or :meth:`close`)
+    when done.
+    """
+
+    def __init__(
+        self,
+        backend: TranslationMemory,
+        *,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be >= 1, got {max_bytes}")
+        self._backend = backend
+        # Resolved once: a runtime Protocol check per hit is not free.
+        self._usage: UsageTrackingTranslationMemory | None = (
+            backend if isinstance(backend, UsageTrackingTranslationMemory) else None
+        )
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[_CacheKey, _Entry] = OrderedDict()
+        self._bytes = 0
+        # target_lang → write generation; a cached miss is valid only
+        # while its language's generation is unchanged.
+        self._generations: dict[str, int] = {}
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # The daemon and the Flask dev server may call in from more
+        # than one thread; the backend itself is shared the same way.
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self) -> TranslationMemory:
+        """The wrapped TM. Reads and writes that bypass the wrapper are
+        invisible to the cache — use it for backend-specific surfaces
+        only (``merge_from``, ``close``)."""
+        return self._backend
+
+    def lookup(
+        self,
+        segment: Segment,
+        target_lang: str,
+        fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD,
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+        record_hits: bool = True,
+    ) -> TmHit | None:
+        """``record_hits=False`` leaves the backend's hit counters
+        alone, on cached hits and backend lookups alike."""
+        key: _CacheKey = (segment.fingerprint, target_lang, provider, model)
+        cached_hit: TmHit | None = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.hit is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                cached_hit = entry.hit
+            elif entry is not None and (
+                fuzzy_threshold >= entry.threshold
+                and entry.generation == self._generations.get(target_lang, 0)
+            ):
+                self._entries.move_to_end(key)
+                self._negative_hits += 1
+                return None
+            else:
+                self._misses += 1
+            # Captured before the backend call: a store() racing with
+            # this lookup bumps the generation, and the (possibly
+            # stale) result below is then returned but not cached.
+            generation = self._generations.get(target_lang, 0)
+        if cached_hit is not None:
+            # Outside the lock: the backend's hit counter has its own.
+            if self._usage is not None and record_hits:
+                self._usage.record_hit(cached_hit.translated)
+            return _rebind(cached_hit, segment)
+
+        if self._usage is not None and not record_hits:
+            hit = self._usage.lookup(
+                segment,
+                target_lang,
+                fuzzy_threshold,
+                provider=provider,
+                model=model,
+                record_hits=False,
+            )
+        else:
+            hit = self._backend.lookup(
+                segment, target_lang, fuzzy_threshold, provider=provider, model=model
+            )
+        if hit is None:
+            entry = _Entry(
+                hit=None,
+                threshold=fuzzy_threshold,
+                generation=generation,
+                size=_ENTRY_OVERHEAD_BYTES,
+            )
+            self._put(key, entry, target_lang=target_lang)
+        elif hit.match_type == TM_MATCH_TYPE_EXACT:
+            self._put(key, _hit_entry(hit, generation), target_lang=target_lang)
+        return hit
+
+    def store(self, translated: TranslatedSegment) -> None:
+        self._backend.store(translated)
+        fingerprint = translated.segment.fingerprint
+        target_lang = translated.target_lang
+        with self._lock:
+            generation = self._generations.get(target_lang, 0) + 1
+            self._generations[target_lang] = generation
+        hit = TmHit(
+            translated=replace(translated, source=TRANSLATION_SOURCE_EXACT_TM),
+            similarity=EXACT_MATCH_SIMILARITY,
+            match_type=TM_MATCH_TYPE_EXACT,
+        )
+        # The new row is now the most recent answer for every lookup
+        # shape that can see it — unscoped, provider-scoped, model-
+        # scoped. Rows for other providers/models are unaffected.
+        for provider in (None, translated.provider):
+            for model in (None, translated.model):
+                self._put(
+                    (fingerprint, target_lang, provider, model),
+                    _hit_entry(hit, generation),
+                    target_lang=target_lang,
+                )
+
+    def preload_hot_set(self, *, per_target_lang: int) -> int:
+        """Warm the cache with the ``per_target_lang`` most-hit rows of
+        each target language; return how many rows were loaded.
+
+        A no-op (returning 0) when the backend does not track usage.
+        Each row is cached under every lookup shape it answers — its
+        exact ``(provider, model)`` key, plus the provider-scoped and
+        unscoped keys when it is the newest row for them. Rows are
+        inserted coldest-first so the hottest end up most recently
+        used; the usual entry / byte bounds apply.
+        """
+        if self._usage is None or per_target_lang < 1:
+            return 0
+        rows = list(self._usage.iter_top_translations(per_target_lang=per_target_lang))
+        rows.sort(key=lambda row: row.hit_count)
+        for row in rows:
+            target_lang = row.translated.target_lang
+            hit = TmHit(
+                translated=row.translated,
+                similarity=EXACT_MATCH_SIMILARITY,
+                match_type=TM_MATCH_TYPE_EXACT,
+            )
+            with self._lock:
+                generation = self._generations.get(target_lang, 0)
+            for key in _preload_keys(row):
+                self._put(key, _hit_entry(hit, generation), target_lang=target_lang)
+        return len(rows)
+
+    def stats(self) -> TmStats:
+        return replace(self._backend.stats(), cache=self.cache_stats())
+
+    def cache_stats(self) -> TmCacheStats:
+        with self._lock:
+            return TmCacheStats(
+                hits=self._hits,
+                negative_hits=self._negative_hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                bytes=self._bytes,
+            )
+
+    def iter_translations(
+        self, *, source_lang: str, target_lang: str
+    ) -> Iterator[TranslatedSegment]:
+        return self._backend.iter_translations(source_lang=source_lang, target_lang=target_lang)
+
+    def clear(self) -> None:
+        """Drop every cached entry. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def close(self) -> None:
+        """Clear the cache and close the backend when it is closable."""
+        self.clear()
+        close = getattr(self._backend, "close", None)
+        if close is not None:
+            close()
+
+    def _put(self, key: _CacheKey, entry: _Entry, *, target_lang: str) -> None:
+        with self._lock:
+            if entry.generation != self._generations.get(target_lang, 0):
+                # A store() for this language landed after the entry
+                # was computed; it may already be stale.
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            while len(self._entries) > self._max_entries or (
+                self._bytes > self._max_bytes and len(self._entries) > 1
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.size
+                self._evictions += 1
+
+
+def _hit_entry(hit: TmHit, generation: int) -> _Entry:
+    translated = hit.translated
+    size = (
+        _ENTRY_OVERHEAD_BYTES
+        + sys.getsizeof(translated.target_text)
+        + sys.getsizeof(translated.segment.source_text)
+    )
+    return _Entry(hit=hit, threshold=EXACT_MATCH_SIMILARITY, generation=generation, size=size)
+
+
+def _preload_keys(row: TmUsage) -> list[_CacheKey]:
+    translated = row.translated
+    fingerprint, target_lang = translated.segment.fingerprint, translated.target_lang
+    keys: list[_CacheKey] = [(fingerprint, target_lang, translated.provider, translated.model)]
+    if row.newest_for_provider:
+        keys.append((fingerprint, target_lang, translated.provider, None))
+    if row.newest_for_target_lang:
+        keys.append((fingerprint, target_lang, None, None))
+    return keys
+
+
+def _rebind(hit: TmHit, segment: Segment) -> TmHit:
+    """Return ``hit`` attributed to the caller's ``segment``.
+
+    The fingerprint ignores the bundle key, so the cached hit may
+    carry another key's Segment; backends always answer with the
+    caller's, and so must the cache.
+    """
+    if hit.translated.segment is segment:
+        return hit
+    return replace(hit, translated=replace(hit.translated, segment=segment))
+
+
+__all__ = [
+    "CachedTranslationMemory",
+    "DEFAULT_CACHE_MAX_ENTRIES",
+    "DEFAULT_CACHE_MAX_BYTES",
+]
@@ -0,0 +1,604 @@
+"""In-memory :class:`ainemo.core.tm.base.TranslationMemory` backend.
+
+The SQLite backend pays file I/O and an fsync per ``store``; for the
+unit / integration suites and ``--provider noop`` smoke runs that is
+most of the wall-clock. :class:`InMemoryTranslationMemory` implements
+the same Protocol — and the same lookup semantics — from plain Python
+structures:
+
+- **Exact lookups** are two dict probes: ``(fingerprint, target_lang)``
+  → ``(provider, model)`` → row. With no provider/model filter the most
+  recent row wins, as in SQLite; ties on ``created_at`` go to the row
+  written last.
+- **Fuzzy lookups** use one L2-normalized ``numpy`` matrix per source
+  language, so the cosine scan is a single matrix-vector product
+  instead of a Python loop over decoded BLOBs.
+- **iter_translations** walks a per-language-pair index lazily.
+
+Persistence is opt-in via ``snapshot_path``. An existing ``tm.sqlite``
+there is loaded at construction (embeddings, timestamps and usage
+counters included — nothing is re-embedded). :meth:`snapshot` writes the
+whole TM back atomically (a temporary file, then ``os.replace``); it runs
+on :meth:`close`, and every ``snapshot_interval_seconds`` after a change
+when an interval is set. Interval snapshots run in a background thread,
+so no ``lookup`` or ``store`` waits for the rewrite; a failed one is
+logged and retried after the next interval. A crash loses the writes
+since the last snapshot — the trade this backend makes for speed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final, Iterator
+
+import numpy as np
+from numpy.typing import NDArray
+
+from ainemo.core.segment import (
+    TRANSLATION_SOURCE_EXACT_TM,
+    TRANSLATION_SOURCE_FUZZY_TM,
+    Segment,
+    TranslatedSegment,
+    TranslationSource,
+)
+from ainemo.core.tm.base import (
+    DEFAULT_FUZZY_THRESHOLD,
+    EXACT_MATCH_SIMILARITY,
+    TM_MATCH_TYPE_EXACT,
+    TM_MATCH_TYPE_FUZZY,
+    TmHit,
+    TmStats,
+    TmUsage,
+)
+from ainemo.core.tm.sqlite import Embedder, SqliteTranslationMemory, TmRow, _now_seconds
+
+logger = logging.getLogger(__name__)
+
+_EmbeddingArray = NDArray[np.float32]
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# Initial row capacity of a per-source-language embedding matrix; it
+# doubles when full, so appends stay amortized O(1).
+_INITIAL_MATRIX_ROWS: Final = 1024
+
+_SNAPSHOT_TMP_SUFFIX: Final = ".tmp"
+
+
+@dataclass
+class _Translation:
+    """One stored translation. Mutable: usage counters change on hit."""
+
+    target_text: str
+    provider: str
+    model: str
+    confidence: float | None
+    source: TranslationSource
+    created_at: int
+    seq: int
+    """Write order; breaks ``created_at`` ties so "most recent" is
+    deterministic."""
+
+    hit_count: int = 0
+    last_hit_at: int | None = None
+
+
+@dataclass
+class _StoredSegment:
+    segment: Segment
+    """Key is the fingerprint, as in the SQLite backend's rows."""
+
+    embedding: _EmbeddingArray | None
+    created_at: int
+
+
+class _EmbeddingMatrix:
+    """Append-only matrix of unit-length embeddings for one source
+    language, with the fingerprint of each row."""
+
+    def __init__(self, dim: int) -> None:
+        self._vectors: _EmbeddingArray = np.zeros((_INITIAL_MATRIX_ROWS, dim), dtype=np.float32)
+        self._fingerprints: list[str] = []
+
+    def add(self, fingerprint: str, embedding: _EmbeddingArray) -> None:
+        if embedding.shape != (self._vectors.shape[1],):
+            raise ValueError(
+                f"Embedding shape {embedding.shape} does not match the TM's "
+                f"dimension {self._vectors.shape[1]}."
+            )
+        count = len(self._fingerprints)
+        if count == self._vectors.shape[0]:
+            grown = np.zeros((count * 2, self._vectors.shape[1]), dtype=np.float32)
+            grown[:count] = self._vectors
+            self._vectors = grown
+        self._vectors[count] = _unit(embedding)
+        self._fingerprints.append(fingerprint)
+
+    def ranked(self, query: _EmbeddingArray) -> Iterator[tuple[str, float]]:
+        """Yield ``(fingerprint, cosine similarity)`` best-first."""
+        count = len(self._fingerprints)
+        similarities = self._vectors[:count] @ _unit(query)
+        for index in np.argsort(-similarities, kind="stable"):
+            yield self._fingerprints[index], float(similarities[index])
+
+
+class InMemoryTranslationMemory:
+    """Dict- and numpy-backed TM. See module docstring for design notes."""
+
+    def __init__(
+        self,
+        embedder: Embedder | None = None,
+        *,
+        snapshot_path: Path | None = None,
+        snapshot_interval_seconds: float | None = None,
+    ) -> None:
+        self._embedder = embedder
+        self._snapshot_path = snapshot_path
+        self._snapshot_interval = snapshot_interval_seconds
+        self._segments: dict[str, _StoredSegment] = {}
+        # (fingerprint, target_lang) → (provider, model) → row.
+        self._translations: dict[tuple[str, str], dict[tuple[str, str], _Translation]] = {}
+        # (source_lang, target_lang) → fingerprints with a translation,
+        # in insertion order (a dict used as an ordered set).
+        self._pairs: dict[tuple[str, str], dict[str, None]] = {}
+        self._matrices: dict[str, _EmbeddingMatrix] = {}
+        self._translation_count = 0
+        self._lang_counts: dict[str, int] = {}
+        self._embedding_count = 0
+        self._seq = 0
+        # Bumped on every change; a snapshot records the generation it
+        # wrote, so the TM is dirty until a snapshot of the latest
+        # generation has been written successfully.
+        self._generation = 0
+        self._saved_generation = 0
+        self._last_snapshot = time.monotonic()
+        # One lock for all structures; the Flask app and the daemon's
+        # cache call in from several threads.
+        self._lock = threading.RLock()
+        # Serializes writers of the snapshot's temporary file.
+        self._snapshot_lock = threading.Lock()
+        # The running interval snapshot, if any.
+        self._snapshot_thread: threading.Thread | None = None
+        if snapshot_path is not None and snapshot_path.exists():
+            self._load(snapshot_path)
+
+    # --- TranslationMemory Protocol ---
+
+    def lookup(
+        self,
+        segment: Segment,
+        target_lang: str,
+        fuzzy_threshold: float = DEFAULT_FUZZY_THRESHOLD,
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+        record_hits: bool = True,
+    ) -> TmHit | None:
+        with self._lock:
+            row = self._newest(segment.fingerprint, target_lang, provider=provider, model=model)
+            if row is not None and record_hits:
+                self._note_hit(row)
+        if row is not None:
+            self._maybe_snapshot()
+            return TmHit(
+                translated=TranslatedSegment(
+                    segment=segment,
+                    target_lang=target_lang,
+                    target_text=row.target_text,
+                    provider=row.provider,
+                    model=row.model,
+                    confidence=row.confidence,
+                    source=TRANSLATION_SOURCE_EXACT_TM,
+                ),
+                similarity=EXACT_MATCH_SIMILARITY,
+                match_type=TM_MATCH_TYPE_EXACT,
+            )
+        with self._lock:
+            matrix = self._matrices.get(segment.source_lang)
+            if (
+                self._embedder is None
+                or matrix is None
+                or (segment.source_lang, target_lang) not in self._pairs
+            ):
+                return None
+        query = self._embedder(segment.source_text)
+        with self._lock:
+            hit = self._lookup_fuzzy(
+                matrix,
+                query,
+                segment,
+                target_lang,
+                fuzzy_threshold,
+                provider,
+                model,
+                record_hits=record_hits,
+            )
+        self._maybe_snapshot()
+        return hit
+
+    def store(self, translated: TranslatedSegment) -> None:
+        seg = translated.segment
+        fingerprint = seg.fingerprint
+        with self._lock:
+            stored = self._segments.get(fingerprint)
+            needs_embedding = self._embedder is not None and (
+                stored is None or stored.embedding is None
+            )
+        # Embed outside the lock — it is the slow part. A segment that
+        # already has an embedding keeps it: same text, same vector.
+        embedding = self._embedder(seg.source_text) if needs_embedding and self._embedder else None
+        now = _now_seconds()
+        with self._lock:
+            self._put_segment(
+                Segment(
+                    key=fingerprint,
+                    source_text=seg.source_text,
+                    source_lang=seg.source_lang,
+                    placeholders=seg.placeholders,
+                ),
+                embedding,
+                now,
+            )
+            rows = self._translations.setdefault((fingerprint, translated.target_lang), {})
+            previous = rows.get((translated.provider, translated.model))
+            self._put_translation(
+                fingerprint,
+                seg.source_lang,
+                translated.target_lang,
+                _Translation(
+                    target_text=translated.target_text,
+                    provider=translated.provider,
+                    model=translated.model,
+                    confidence=translated.confidence,
+                    source=translated.source,
+                    created_at=now,
+                    seq=self._next_seq(),
+                    # Re-storing keeps usage counters, as in SQLite.
+                    hit_count=previous.hit_count if previous else 0,
+                    last_hit_at=previous.last_hit_at if previous else None,
+                ),
+            )
+            self._generation += 1
+        self._maybe_snapshot()
+
+    def stats(self) -> TmStats:
+        with self._lock:
+            return TmStats(
+                segment_count=len(self._segments),
+                translation_count=self._translation_count,
+                target_lang_count=len(self._lang_counts),
+                embedding_count=self._embedding_count,
+            )
+
+    def iter_translations(
+        self, *, source_lang: str, target_lang: str
+    ) -> Iterator[TranslatedSegment]:
+        # Snapshot only the fingerprint list, then build each
+        # TranslatedSegment on demand — stores made during iteration
+        # cannot invalidate the iterator.
+        with self._lock:
+            fingerprints = tuple(self._pairs.get((source_lang, target_lang), ()))
+        for fingerprint in fingerprints:
+            with self._lock:
+                segment = self._segments[fingerprint].segment
+                rows = tuple(self._translations.get((fingerprint, target_lang), {}).values())
+            for row in rows:
+                yield TranslatedSegment(
+                    segment=segment,
+                    target_lang=target_lang,
+                    target_text=row.target_text,
+                    provider=row.provider,
+                    model=row.model,
+                    confidence=row.confidence,
+                    source=row.source,
+                )
+
+    # --- Usage tracking (UsageTrackingTranslationMemory) ---
+
+    def record_hit(self, translated: TranslatedSegment) -> None:
+        with self._lock:
+            rows = self._translations.get(
+                (translated.segment.fingerprint, translated.target_lang), {}
+            )
+            row = rows.get((translated.provider, translated.model))
+            if row is not None:
+                self._note_hit(row)
+
+    def flush_hits(self) -> None:
+        """No-op: counters are updated in place and persisted by
+        :meth:`snapshot`."""
+
+    def iter_top_translations(
+        self, *, per_target_lang: int, target_lang: str | None = None
+    ) -> Iterator[TmUsage]:
+        with self._lock:
+            by_lang: dict[str, list[tuple[str, _Translation]]] = {}
+            for (fingerprint, lang), rows in self._translations.items():
+                if target_lang is not None and lang != target_lang:
+                    continue
+                for row in rows.values():
+                    if row.hit_count > 0:
+                        by_lang.setdefault(lang, []).append((fingerprint, row))
+            usages: list[TmUsage] = []
+            for lang in sorted(by_lang):
+                ranked = sorted(
+                    by_lang[lang],
+                    key=lambda item: (item[1].hit_count, item[1].last_hit_at or 0),
+                    reverse=True,
+                )
+                for fingerprint, row in ranked[:per_target_lang]:
+                    usages.append(self._usage(fingerprint, lang, row))
+        yield from usages
+
+    # --- Bulk row transfer ---
+
+    def iter_rows(self) -> Iterator[TmRow]:
+        """Every translation row with its segment, as
+        :meth:`SqliteTranslationMemory.iter_rows` yields them."""
+        with self._lock:
+            rows = list(self._iter_rows())
+        yield from rows
+
+    # --- Persistence ---
+
+    def snapshot(self) -> None:
+        """Write the whole TM to ``snapshot_path`` atomically. A no-op
+        without a snapshot path.
+
+        The TM only counts as saved once ``os.replace`` succeeds: a
+        failed write raises and leaves the changes pending, so the
+        next snapshot (or :meth:`close`) tries again.
+        """
+        if self._snapshot_path is None:
+            return
+        path = self._snapshot_path
+        tmp_path = path.with_name(path.name + _SNAPSHOT_TMP_SUFFIX)
+        with self._snapshot_lock:
+            with self._lock:
+                rows = list(self._iter_rows())
+                generation = self._generation
+                self._last_snapshot = time.monotonic()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.unlink(missing_ok=True)
+            try:
+                target = SqliteTranslationMemory(tmp_path, track_hits=False)
+                try:
+                    target.insert_rows(rows)
+                finally:
+                    target.close()
+                os.replace(tmp_path, path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            with self._lock:
+                # Changes made while writing stay pending.
+                self._saved_generation = max(self._saved_generation, generation)
+
+    def close(self) -> None:
+        """Snapshot pending changes (when a snapshot path is set),
+        after any interval snapshot still running."""
+        with self._lock:
+            thread = self._snapshot_thread
+        if thread is not None:
+            thread.join()
+        if self._dirty:
+            self.snapshot()
+
+    # --- Internals ---
+
+    def _load(self, path: Path) -> None:
+        source = SqliteTranslationMemory(path, track_hits=False)
+        try:
+            for row in source.iter_rows():
+                self._put_segment(row.segment, row.embedding, row.segment_created_at)
+                self._put_translation(
+                    row.segment.fingerprint,
+                    row.segment.source_lang,
+                    row.target_lang,
+                    _Translation(
+                        target_text=row.target_text,
+                        provider=row.provider,
+                        model=row.model,
+                        confidence=row.confidence,
+                        source=row.source,
+                        created_at=row.created_at,
+                        seq=self._next_seq(),
+                        hit_count=row.hit_count,
+                        last_hit_at=row.last_hit_at,
+                    ),
+                )
+        finally:
+            source.close()
+
+    def _put_segment(
+        self, segment: Segment, embedding: _EmbeddingArray | None, created_at: int
+    ) -> None:
+        fingerprint = segment.fingerprint
+        stored = self._segments.get(fingerprint)
+        if stored is None:
+            stored = _StoredSegment(segment=segment, embedding=None, created_at=created_at)
+            self._segments[fingerprint] = stored
+        else:
+            stored.created_at = max(stored.created_at, created_at)
+        if embedding is not None and stored.embedding is None:
+            stored.embedding = embedding
+            self._embedding_count += 1
+            matrix = self._matrices.get(segment.source_lang)
+            if matrix is None:
+                matrix = _EmbeddingMatrix(dim=embedding.shape[0])
+                self._matrices[segment.source_lang] = matrix
+            matrix.add(fingerprint, embedding)
+
+    def _put_translation(
+        self, fingerprint: str, source_lang: str, target_lang: str, row: _Translation
+    ) -> None:
+        rows = self._translations.setdefault((fingerprint, target_lang), {})
+        if (row.provider, row.model) not in rows:
+            self._translation_count += 1
+            self._lang_counts[target_lang] = self._lang_counts.get(target_lang, 0) + 1
+        rows[(row.provider, row.model)] = row
+        self._pairs.setdefault((source_lang, target_lang), {})[fingerprint] = None
+
+    def _newest(
+        self,
+        fingerprint: str,
+        target_lang: str,
+        *,
+        provider: str | None,
+        model: str | None,
+    ) -> _Translation | None:
+        rows = self._translations.get((fingerprint, target_lang))
+        if not rows:
+            return None
+        if provider is not None and model is not None:
+            return rows.get((provider, model))
+        best: _Translation | None = None
+        for row in rows.values():
+            if provider is not None and row.provider != provider:
+                continue
+            if model is not None and row.model != model:
+                continue
+            if best is None or (row.created_at, row.seq) > (best.created_at, best.seq):
+                best = row
+        return best
+
+    def _lookup_fuzzy(
+        self,
+        matrix: _EmbeddingMatrix,
+        query: _EmbeddingArray,
+        segment: Segment,
+        target_lang: str,
+        threshold: float,
+        provider: str | None,
+        model: str | None,
+        *,
+        record_hits: bool = True,
+    ) -> TmHit | None:
+        for fingerprint, similarity in matrix.ranked(query):
+            if similarity < threshold:
+                return None
+            row = self._newest(fingerprint, target_lang, provider=provider, model=model)
+            if row is None:
+                continue
+            if record_hits:
+                self._note_hit(row)
+            stored = self._segments[fingerprint].segment
+            return TmHit(
+                translated=TranslatedSegment(
+                    segment=Segment(
+                        key=segment.key,  # caller's key, as in the SQLite backend
+                        source_text=stored.source_text,
+                        source_lang=stored.source_lang,
+                        placeholders=stored.placeholders,
+                    ),
+                    target_lang=target_lang,
+                    target_text=row.target_text,
+                    provider=row.provider,
+                    model=row.model,
+                    confidence=row.confidence,
+                    source=TRANSLATION_SOURCE_FUZZY_TM,
+                ),
+                similarity=similarity,
+                match_type=TM_MATCH_TYPE_FUZZY,
+            )
+        return None
+
+    def _note_hit(self, row: _Translation) -> None:
+        row.hit_count += 1
+        row.last_hit_at = _now_seconds()
+        self._generation += 1
+
+    def _usage(self, fingerprint: str, target_lang: str, row: _Translation) -> TmUsage:
+        newest_for_provider = self._newest(
+            fingerprint, target_lang, provider=row.provider, model=None
+        )
+        newest_for_lang = self._newest(fingerprint, target_lang, provider=None, model=None)
+        return TmUsage(
+            translated=TranslatedSegment(
+                segment=self._segments[fingerprint].segment,
+                target_lang=target_lang,
+                target_text=row.target_text,
+                provider=row.provider,
+                model=row.model,
+                confidence=row.confidence,
+                source=TRANSLATION_SOURCE_EXACT_TM,
+            ),
+            hit_count=row.hit_count,
+            last_hit_at=row.last_hit_at,
+            newest_for_provider=newest_for_provider is row,
+            newest_for_target_lang=newest_for_lang is row,
+        )
+
+    def _iter_rows(self) -> Iterator[TmRow]:
+        for (fingerprint, target_lang), rows in self._translations.items():
+            stored = self._segments[fingerprint]
+            for row in rows.values():
+                yield TmRow(
+                    segment=stored.segment,
+                    embedding=stored.embedding,
+                    segment_created_at=stored.created_at,
+                    target_lang=target_lang,
+                    target_text=row.target_text,
+                    provider=row.provider,
+                    model=row.model,
+                    confidence=row.confidence,
+                    source=row.source,
+                    created_at=row.created_at,
+                    hit_count=row.hit_count,
+                    last_hit_at=row.last_hit_at,
+                )
+
+    def _next_seq(self) -> int:
+        self._seq += 1
+        return self._seq
+
+    @property
+    def _dirty(self) -> bool:
+        return self._generation != self._saved_generation
+
+    def _maybe_snapshot(self) -> None:
+        """Start an interval snapshot in the background when one is
+        due. The calling ``lookup`` / ``store`` never waits for it."""
+        if self._snapshot_interval is None:
+            return
+        with self._lock:
+            if (
+                not self._dirty
+                or time.monotonic() - self._last_snapshot < self._snapshot_interval
+                or (self._snapshot_thread is not None and self._snapshot_thread.is_alive())
+            ):
+                return
+            self._last_snapshot = time.monotonic()
+            thread = threading.Thread(
+                target=self._snapshot_in_background, name="nemo-tm-snapshot", daemon=True
+            )
+            self._snapshot_thread = thread
+        thread.start()
+
+    def _snapshot_in_background(self) -> None:
+        try:
+            self.snapshot()
+        except Exception as exc:  # noqa: BLE001 — the next interval retries
+            logger.warning(
+                "TM snapshot to %s failed; retrying in %gs: %s",
+                self._snapshot_path,
+                self._snapshot_interval,
+                exc,
+            )
+
+
+def _unit(vector: _EmbeddingArray) -> _EmbeddingArray:
+    """L2-normalize; a zero vector stays zero (cosine 0, as in SQLite)."""
+    vector = np.asarray(vector, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0:
+        return vector
+    return vector / norm
+
+
+__all__ = ["InMemoryTranslationMemory"]
@@ -27,17 +27,33 @@ Design choices
 - **Idempotent ``store``.** ``INSERT OR REPLACE`` for both tables;
   re-storing a TranslatedSegment refreshes ``created_at`` but does
   not duplicate.
+- **Set-based merge.** :meth:`SqliteTranslationMemory.merge_from`
+  ``ATTACH``-es another TM file and folds it in with two
+  ``INSERT ... SELECT ... ON CONFLICT`` statements inside a single
+  transaction, so sharded CI builds can combine their ``tm.sqlite``
+  files without re-running the pipeline or re-embedding.
+- **Optional negative-lookup filter.** ``membership_filter=True``
+  builds a :class:`~ainemo.core.tm._membership.TmMembershipFilter` at
+  open so cold-bundle misses skip the exact ``SELECT`` and, when no
+  embedded neighbour can exist, the embedder call and fuzzy scan.
+- **Deferred usage counters.** Every hit bumps the row's ``hit_count``
+  / ``last_hit_at`` — but in memory. Pending hits are written in one
+  batched ``UPDATE`` once enough accumulate, once the flush interval
+  has passed, or on :meth:`SqliteTranslationMemory.close`, so a
+  lookup never turns into a per-row write.
 """
 
 from __future__ import annotations
 
 import json
+import logging
 import sqlite3
+import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Callable, Final, Iterator, Protocol, cast, runtime_checkable
+from typing import Any, Callable, Final, Iterable, Iterator, Protocol, cast, runtime_checkable
 
 import numpy as np
 from numpy.typing import NDArray
@@ -53,6 +69,7 @@ from ainemo.core.segment import (
     TranslatedSegment,
     TranslationSource,
 )
+from ainemo.core.tm._membership import TmMembershipFilter
 from ainemo.core.tm.base import (
     DEFAULT_FUZZY_THRESHOLD,
     EXACT_MATCH_SIMILARITY,
@@ -60,8 +77,11 @@ from ainemo.core.tm.base import (
     TM_MATCH_TYPE_FUZZY,
     TmHit,
     TmStats,
+    TmUsage,
 )
 
+logger = logging.getLogger(__name__)
+
 # Type alias for the embedding arrays the TM produces and consumes.
 # `NDArray[np.float32]` is more precise than the bare `np.ndarray`
 # (which mypy strict on Python 3.10 rejects for missing type
@@ -90,7 +110,10 @@ _EMBEDDING_DTYPE = np.float32
 #               table and recreates — pre-1.0 cycle 1 just shipped, so
 #               the data loss is acceptable; documented in the cycle-2
 #               retro.
-_SCHEMA_VERSION = 2
+# Cycle-6 (v3): adds `hit_count` / `last_hit_at` usage counters to
+#               translations. Migration: ALTER TABLE ADD COLUMN — rows
+#               are kept, with zero hits.
+_SCHEMA_VERSION = 3
 
 _DDL_META = "CREATE TABLE IF NOT EXISTS meta (  key TEXT PRIMARY KEY,  value TEXT NOT NULL)"
 _DDL_SEGMENTS = (
@@ -113,6 +136,8 @@ _DDL_TRANSLATIONS = (
     "  confidence REAL,"
     "  source TEXT NOT NULL,"
     "  created_at INTEGER NOT NULL,"
+    "  hit_count INTEGER NOT NULL DEFAULT 0,"
+    "  last_hit_at INTEGER,"
     "  PRIMARY KEY (fingerprint, target_lang, provider, model)"
     ")"
 )
@@ -120,9 +145,178 @@ _DDL_TRANSLATIONS_LANG_INDEX = (
     "CREATE INDEX IF NOT EXISTS idx_translations_lang ON translations(target_lang)"
 )
 
+_DDL_V3_ADD_HIT_COUNT = "ALTER TABLE translations ADD COLUMN hit_count INTEGER NOT NULL DEFAULT 0"
+_DDL_V3_ADD_LAST_HIT_AT = "ALTER TABLE translations ADD COLUMN last_hit_at INTEGER"
+
 # meta-table keys
 _META_KEY_SCHEMA_VERSION = "schema_version"
 
+# Re-storing a row refreshes its content and ``created_at`` but keeps
+# its usage counters — a provider re-run does not make a hot row cold.
+_UPSERT_TRANSLATION_SQL = (
+    "INSERT INTO translations "
+    "(fingerprint, target_lang, target_text, provider, model, "
+    " confidence, source, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT(fingerprint, target_lang, provider, model) DO UPDATE SET "
+    "  target_text = excluded.target_text, "
+    "  confidence = excluded.confidence, "
+    "  source = excluded.source, "
+    "  created_at = excluded.created_at"
+)
+
+# Deferred hit tracking. Pending hits are flushed in one batched
+# UPDATE once this many distinct rows are pending, or on the first
+# hit after the interval has elapsed since the last flush — whichever
+# comes first — and always on close().
+_HIT_FLUSH_MAX_PENDING: Final = 1024
+_HIT_FLUSH_INTERVAL_SECONDS: Final = 30.0
+_FLUSH_HITS_SQL = (
+    "UPDATE translations SET "
+    "  hit_count = hit_count + ?, "
+    "  last_hit_at = MAX(COALESCE(last_hit_at, 0), ?) "
+    "WHERE fingerprint = ? AND target_lang = ? AND provider = ? AND model = ?"
+)
+
+# Top-N rows per target language by usage. The two ``newest_*`` flags
+# tell a cache which lookup shapes the row answers: the exact lookup
+# returns the most recent row among those it can see.
+_TOP_TRANSLATIONS_SQL = (
+    "SELECT fingerprint, source_text, source_lang, placeholders_json, target_lang, "
+    "       target_text, provider, model, confidence, hit_count, last_hit_at, "
+    "       newest_for_provider, newest_for_target_lang "
+    "FROM ("
+    "  SELECT t.fingerprint, s.source_text, s.source_lang, s.placeholders_json, "
+    "         t.target_lang, t.target_text, t.provider, t.model, t.confidence, "
+    "         t.hit_count, t.last_hit_at, "
+    "         ROW_NUMBER() OVER (PARTITION BY t.target_lang "
+    "           ORDER BY t.hit_count DESC, t.last_hit_at DESC) AS lang_rank, "
+    "         ROW_NUMBER() OVER (PARTITION BY t.fingerprint, t.target_lang, t.provider "
+    "           ORDER BY t.created_at DESC) = 1 AS newest_for_provider, "
+    "         ROW_NUMBER() OVER (PARTITION BY t.fingerprint, t.target_lang "
+    "           ORDER BY t.created_at DESC) = 1 AS newest_for_target_lang "
+    "  FROM translations t JOIN segments s ON s.fingerprint = t.fingerprint "
+    "  {where}"
+    ") WHERE hit_count > 0 AND lang_rank <= ? "
+    "ORDER BY target_lang, lang_rank"
+)
+
+_INSERT_SEGMENT_ROW_SQL = (
+    "INSERT OR REPLACE INTO segments "
+    "(fingerprint, source_text, source_lang, placeholders_json, embedding, created_at) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_INSERT_TRANSLATION_ROW_SQL = (
+    "INSERT OR REPLACE INTO translations "
+    "(fingerprint, target_lang, target_text, provider, model, confidence, source, created_at, "
+    " hit_count, last_hit_at) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+_HitKey = tuple[str, str, str, str]
+
+# Conflict policies for :meth:`SqliteTranslationMemory.merge_from`. A
+# conflict is two rows sharing the translations primary key
+# (fingerprint, target_lang, provider, model) — rows from different
+# providers or models never conflict; they coexist exactly as they
+# would had one pipeline produced both.
+#
+# - ``latest``: the row with the newer ``created_at`` wins (ties keep
+#   the existing row, so re-merging the same shard is a no-op).
+# - ``keep-existing``: rows already in the destination always win, so
+#   the order of inputs on the command line is the priority order.
+#
+# Usage counters (hit_count / last_hit_at) travel with the winning row.
+MERGE_POLICY_LATEST: Final = "latest"
+MERGE_POLICY_KEEP_EXISTING: Final = "keep-existing"
+MERGE_POLICIES: Final = (MERGE_POLICY_LATEST, MERGE_POLICY_KEEP_EXISTING)
+
+# Schema alias the merge source is ATTACH-ed under.
+_MERGE_SOURCE_ALIAS: Final = "merge_src"
+
+# ``WHERE true`` disambiguates the upsert clause from a join
+# constraint — required by SQLite when ``ON CONFLICT`` follows an
+# ``INSERT ... SELECT`` (https://sqlite.org/lang_upsert.html §2.2).
+# Segment rows are content-addressed by fingerprint, so on conflict the
+# only interesting columns are the embedding (keep whichever side has
+# one; never re-embed) and created_at (keep the newest).
+_MERGE_SEGMENTS_SQL = (
+    "INSERT INTO segments "
+    "(fingerprint, source_text, source_lang, placeholders_json, embedding, created_at) "
+    "SELECT fingerprint, source_text, source_lang, placeholders_json, embedding, created_at "
+    f"FROM {_MERGE_SOURCE_ALIAS}.segments WHERE true "
+    "ON CONFLICT(fingerprint) DO UPDATE SET "
+    "  embedding = COALESCE(segments.embedding, excluded.embedding), "
+    "  created_at = MAX(segments.created_at, excluded.created_at)"
+)
+_MERGE_TRANSLATIONS_SELECT = (
+    "INSERT INTO translations "
+    "(fingerprint, target_lang, target_text, provider, model, confidence, source, created_at, "
+    " hit_count, last_hit_at) "
+    "SELECT fingerprint, target_lang, target_text, provider, model, confidence, source, "
+    "       created_at, hit_count, last_hit_at "
+    f"FROM {_MERGE_SOURCE_ALIAS}.translations WHERE true "
+)
+_MERGE_TRANSLATIONS_SQL: Final[dict[str, str]] = {
+    MERGE_POLICY_LATEST: (
+        _MERGE_TRANSLATIONS_SELECT + "ON CONFLICT(fingerprint, target_lang, provider, model) "
+        "DO UPDATE SET "
+        "  target_text = excluded.target_text, "
+        "  confidence = excluded.confidence, "
+        "  source = excluded.source, "
+        "  created_at = excluded.created_at, "
+        "  hit_count = excluded.hit_count, "
+        "  last_hit_at = excluded.last_hit_at "
+        "WHERE excluded.created_at > translations.created_at"
+    ),
+    MERGE_POLICY_KEEP_EXISTING: (
+        _MERGE_TRANSLATIONS_SELECT + "ON CONFLICT(fingerprint, target_lang, provider, model) "
+        "DO NOTHING"
+    ),
+}
+
+
+@dataclass(frozen=True)
+class TmMergeResult:
+    """Outcome of one :meth:`SqliteTranslationMemory.merge_from` call."""
+
+    source_path: Path
+    segments_read: int
+    """Segment rows in the merged-in file."""
+
+    translations_read: int
+    """Translation rows in the merged-in file."""
+
+    translations_written: int
+    """Translation rows inserted or overwritten in the destination.
+    ``translations_read - translations_written`` rows lost their
+    conflict under the chosen policy (or were already present)."""
+
+
+@dataclass(frozen=True)
+class TmRow:
+    """One stored translation together with its segment, in storage
+    form — the unit of :meth:`SqliteTranslationMemory.iter_rows` /
+    :meth:`SqliteTranslationMemory.insert_rows` bulk transfer (used by
+    the in-memory backend's load / snapshot). Carries every column, so
+    a round trip loses nothing and never calls the embedder."""
+
+    segment: Segment
+    """Stored segment; ``key`` is the fingerprint (bundle keys are not
+    stored)."""
+
+    embedding: _EmbeddingArray | None
+    segment_created_at: int
+    target_lang: str
+    target_text: str
+    provider: str
+    model: str
+    confidence: float | None
+    source: TranslationSource
+    created_at: int
+    hit_count: int
+    last_hit_at: int | None
+
 
 @runtime_checkable
 class Embedder(Protocol):
@@ -138,9 +332,19 @@ class SqliteTranslationMemory:
         self,
         db_path: Path,
         embedder: Embedder | None = None,
+        *,
+        membership_filter: bool = False,
+        track_hits: bool = True,
     ) -> None:
         self._db_path = db_path
         self._embedder = embedder
+        # Deferred usage counters: (fingerprint, target_lang, provider,
+        # model) → [hits, last_hit_at]. Guarded by its own lock — the
+        # Flask app and the daemon's cache call in from several threads.
+        self._track_hits = track_hits
+        self._pending_hits: dict[_HitKey, list[int]] = {}
+        self._hits_lock = threading.Lock()
+        self._last_hit_flush = time.monotonic()
         db_path.parent.mkdir(parents=True, exist_ok=True)
         # `check_same_thread=False` lets the cycle-5 reviewer Flask app
         # share a single SqliteTranslationMemory across worker threads
@@ -150,10 +354,25 @@ class SqliteTranslationMemory:
         # is minimal. The cycle-1 CLI use-case (single-thread) is
         # unaffected.
         self._conn = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=False)
+        # SQLite's per-connection lock covers single statements only:
+        # every BEGIN ... COMMIT on the shared connection (stores, hit
+        # flushes from a lookup thread, merges) holds this lock, so two
+        # threads never interleave inside one transaction. A rebuild
+        # of the membership filter holds it too. Re-entrant because
+        # merge_from holds it around ATTACH and its transaction, and
+        # store around its transaction and filter update.
+        self._write_lock = threading.RLock()
         self._conn.execute("PRAGMA foreign_keys = ON")
         self._init_schema()
+        # Opt-in because it assumes this connection is the TM's only
+        # writer (see ainemo.core.tm._membership). The CLI enables it
+        # with ``--tm-miss-filter``.
+        self._membership: TmMembershipFilter | None = None
+        if membership_filter:
+            self._rebuild_membership()
 
     def close(self) -> None:
+        self.flush_hits()
         self._conn.close()
 
     # --- TranslationMemory Protocol ---
@@ -166,18 +385,27 @@ class SqliteTranslationMemory:
         *,
         provider: str | None = None,
         model: str | None = None,
+        record_hits: bool = True,
     ) -> TmHit | None:
-        exact = self._lookup_exact(segment, target_lang, provider=provider, model=model)
-        if exact is not None:
-            return exact
+        if self.might_contain(segment, target_lang, provider=provider, model=model):
+            exact = self._lookup_exact(
+                segment, target_lang, provider=provider, model=model, record_hits=record_hits
+            )
+            if exact is not None:
+                return exact
         if self._embedder is None:
             return None
+        if not self.has_fuzzy_candidates(
+            segment.source_lang, target_lang, provider=provider, model=model
+        ):
+            return None
         return self._lookup_fuzzy(
             segment,
             target_lang,
             fuzzy_threshold,
             provider=provider,
             model=model,
+            record_hits=record_hits,
         )
 
     def store(self, translated: TranslatedSegment) -> None:
@@ -186,37 +414,48 @@ class SqliteTranslationMemory:
         if self._embedder is not None:
             embedding_blob = _encode_embedding(self._embedder(seg.source_text))
         now = _now_seconds()
-        with self._transaction():
-            self._conn.execute(
-                "INSERT OR REPLACE INTO segments "
-                "(fingerprint, source_text, source_lang, placeholders_json, "
-                " embedding, created_at) "
-                "VALUES (?, ?, ?, ?, ?, ?)",
-                (
-                    seg.fingerprint,
-                    seg.source_text,
-                    seg.source_lang,
-                    _placeholders_to_json(seg.placeholders),
-                    embedding_blob,
-                    now,
-                ),
-            )
-            self._conn.execute(
-                "INSERT OR REPLACE INTO translations "
-                "(fingerprint, target_lang, target_text, provider, model, "
-                " confidence, source, created_at) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    seg.fingerprint,
-                    translated.target_lang,
-                    translated.target_text,
-                    translated.provider,
-                    translated.model,
-                    translated.confidence,
-                    translated.source,
-                    now,
-                ),
-            )
+        # The filter is updated under the lock a rebuild holds, so a row
+        # never lands in a filter that is about to be replaced.
+        with self._write_lock:
+            with self._transaction():
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO segments "
+                    "(fingerprint, source_text, source_lang, placeholders_json, "
+                    " embedding, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        seg.fingerprint,
+                        seg.source_text,
+                        seg.source_lang,
+                        _placeholders_to_json(seg.placeholders),
+                        embedding_blob,
+                        now,
+                    ),
+                )
+                self._conn.execute(
+                    _UPSERT_TRANSLATION_SQL,
+                    (
+                        seg.fingerprint,
+                        translated.target_lang,
+                        translated.target_text,
+                        translated.provider,
+                        translated.model,
+                        translated.confidence,
+                        translated.source,
+                        now,
+                    ),
+                )
+            if self._membership is not None:
+                self._membership.add(
+                    fingerprint=seg.fingerprint,
+                    target_lang=translated.target_lang,
+                    provider=translated.provider,
+                    model=translated.model,
+                    source_lang=seg.source_lang,
+                    has_embedding=embedding_blob is not None,
+                )
+                if self._membership.saturated:
+                    self._rebuild_membership()
 
     def iter_translations(
         self, *, source_lang: str, target_lang: str
@@ -275,8 +514,334 @@ class SqliteTranslationMemory:
             embedding_count=embedding_count,
         )
 
+    # --- Usage tracking ---
+
+    def record_hit(self, translated: TranslatedSegment) -> None:
+        """Count a hit on the stored row ``translated`` came from.
+
+        :meth:`lookup` records its own hits; this is for layers that
+        answer from memory on the TM's behalf (the
+        :class:`~ainemo.core.tm.cached.CachedTranslationMemory`), so
+        their hits still reach the usage counters.
+        """
+        self._note_hit(
+            translated.segment.fingerprint,
+            translated.target_lang,
+            translated.provider,
+            translated.model,
+        )
+
+    def flush_hits(self) -> None:
+        """Write pending hit counts in one batched ``UPDATE``.
+
+        A failed flush is logged and its counts dropped — usage
+        counters are advisory and must never fail a lookup.
+        """
+        with self._hits_lock:
+            pending = self._pending_hits
+            self._pending_hits = {}
+            self._last_hit_flush = time.monotonic()
+        if not pending:
+            return
+        rows = [
+            (hits, last_hit_at, fingerprint, target_lang, provider, model)
+            for (fingerprint, target_lang, provider, model), (hits, last_hit_at) in pending.items()
+        ]
+        try:
+            with self._transaction():
+                self._conn.executemany(_FLUSH_HITS_SQL, rows)
+        except sqlite3.Error:
+            logger.warning("Dropped %d pending TM hit count(s)", len(rows), exc_info=True)
+
+    def iter_top_translations(
+        self, *, per_target_lang: int, target_lang: str | None = None
+    ) -> Iterator[TmUsage]:
+        """Yield the ``per_target_lang`` most-hit rows of each target
+        language (or only ``target_lang``), most-hit first. Rows that
+        were never hit are skipped. Pending hits are flushed first so
+        the ranking includes them."""
+        self.flush_hits()
+        where = "WHERE t.target_lang = ?" if target_lang is not None else ""
+        params: list[object] = [target_lang] if target_lang is not None else []
+        cursor = self._conn.execute(
+            _TOP_TRANSLATIONS_SQL.format(where=where), (*params, per_target_lang)
+        )
+        for raw in cursor:
+            segment = Segment(
+                key=str(raw[0]),
+                source_text=str(raw[1]),
+                source_lang=str(raw[2]),
+                placeholders=_placeholders_from_json(str(raw[3])),
+            )
+            yield TmUsage(
+                translated=TranslatedSegment(
+                    segment=segment,
+                    target_lang=str(raw[4]),
+                    target_text=str(raw[5]),
+                    provider=str(raw[6]),
+                    model=str(raw[7]) if raw[7] is not None else "",
+                    confidence=None if raw[8] is None else float(raw[8]),
+                    source=TRANSLATION_SOURCE_EXACT_TM,
+                ),
+                hit_count=int(raw[9]),
+                last_hit_at=None if raw[10] is None else int(raw[10]),
+                newest_for_provider=bool(raw[11]),
+                newest_for_target_lang=bool(raw[12]),
+            )
+
+    # --- Negative-lookup filter ---
+
+    def might_contain(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> bool:
+        """``False`` when an exact lookup is certain to miss.
+
+        Answered from memory when the TM was opened with
+        ``membership_filter=True``; otherwise always ``True`` (the
+        caller has to ask SQLite).
+        """
+        if self._membership is None:
+            return True
+        return self._membership.might_contain(
+            segment.fingerprint, target_lang, provider=provider, model=model
+        )
+
+    def has_fuzzy_candidates(
+        self,
+        source_lang: str,
+        target_lang: str,
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> bool:
+        """``False`` when no stored translation with an embedding
+        exists for the language pair (and provider/model, when given),
+        i.e. no fuzzy neighbour is plausible.
+
+        O(1) with the membership filter; without it, a single
+        ``EXISTS`` probe that stops at the first candidate row.
+        """
+        if self._membership is not None:
+            return self._membership.has_fuzzy_candidates(
+                source_lang, target_lang, provider=provider, model=model
+            )
+        clauses = ["t.target_lang = ?", "s.source_lang = ?", "s.embedding IS NOT NULL"]
+        params: list[object] = [target_lang, source_lang]
+        if provider is not None:
+            clauses.append("t.provider = ?")
+            params.append(provider)
+        if model is not None:
+            clauses.append("t.model = ?")
+            params.append(model)
+        cursor = self._conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM translations t "
+            "JOIN segments s ON s.fingerprint = t.fingerprint "
+            f"WHERE {' AND '.join(clauses)})",
+            params,
+        )
+        return bool(cursor.fetchone()[0])
+
+    # --- Maintenance ---
+
+    def merge_from(
+        self,
+        source_path: Path,
+        *,
+        policy: str = MERGE_POLICY_LATEST,
+    ) -> TmMergeResult:
+        """Fold every row of the TM at ``source_path`` into this one.
+
+        The source is ``ATTACH``-ed to this connection and copied with
+        two set-based ``INSERT ... SELECT`` statements inside a single
+        transaction — no per-row Python round trip, and a failure
+        leaves the destination untouched. Stored embeddings are copied
+        verbatim, so the merge never calls the embedder. See
+        :data:`MERGE_POLICIES` for how primary-key conflicts resolve.
+
+        Raises ``ValueError`` for an unknown policy, a missing source,
+        a source that *is* this database, or a source whose schema
+        version differs from ours (open it with
+        :class:`SqliteTranslationMemory` first to migrate it).
+        """
+        translations_sql = _MERGE_TRANSLATIONS_SQL.get(policy)
+        if translations_sql is None:
+            raise ValueError(f"Unknown merge policy {policy!r}; expected one of {MERGE_POLICIES}.")
+        if not source_path.is_file():
+            raise ValueError(f"TM to merge not found: {source_path}")
+        if source_path.resolve() == self._db_path.resolve():
+            raise ValueError(f"Cannot merge TM {source_path} into itself.")
+
+        # ATTACH is not allowed inside a transaction, so it brackets
+        # the BEGIN/COMMIT rather than living inside it.
+        with self._write_lock:
+            self._conn.execute(f"ATTACH DATABASE ? AS {_MERGE_SOURCE_ALIAS}", (str(source_path),))
+            try:
+                source_version = self._read_attached_schema_version()
+                if source_version is None:
+                    raise ValueError(f"{source_path} is not an AI-NEMO translation memory.")
+                if source_version != _SCHEMA_VERSION:
+                    raise ValueError(
+                        f"TM {source_path} has schema version {source_version}; "
+                        f"expected {_SCHEMA_VERSION}. Open it with `nemo tm stats` "
+                        f"once to migrate it, then retry the merge."
+                    )
+                with self._transaction():
+                    segments_read = self._count_attached("segments")
+                    translations_read = self._count_attached("translations")
+                    self._conn.execute(_MERGE_SEGMENTS_SQL)
+                    before = self._conn.total_changes
+                    self._conn.execute(translations_sql)
+                    translations_written = self._conn.total_changes - before
+            finally:
+                self._conn.execute(f"DETACH DATABASE {_MERGE_SOURCE_ALIAS}")
+        if self._membership is not None:
+            self._rebuild_membership()
+        return TmMergeResult(
+            source_path=source_path,
+            segments_read=segments_read,
+            translations_read=translations_read,
+            translations_written=translations_written,
+        )
+
+    # --- Bulk row transfer ---
+
+    def iter_rows(self) -> Iterator[TmRow]:
+        """Stream every translation row with its segment. Pending hits
+        are flushed first so the counters are current."""
+        self.flush_hits()
+        cursor = self._conn.execute(
+            "SELECT s.fingerprint, s.source_text, s.source_lang, s.placeholders_json, "
+            "       s.embedding, s.created_at, t.target_lang, t.target_text, t.provider, "
+            "       t.model, t.confidence, t.source, t.created_at, t.hit_count, t.last_hit_at "
+            "FROM translations t JOIN segments s ON s.fingerprint = t.fingerprint"
+        )
+        for raw in cursor:
+            yield TmRow(
+                segment=Segment(
+                    key=str(raw[0]),
+                    source_text=str(raw[1]),
+                    source_lang=str(raw[2]),
+                    placeholders=_placeholders_from_json(str(raw[3])),
+                ),
+                embedding=None if raw[4] is None else _decode_embedding(bytes(raw[4])),
+                segment_created_at=int(raw[5]),
+                target_lang=str(raw[6]),
+                target_text=str(raw[7]),
+                provider=str(raw[8]),
+                model=str(raw[9]) if raw[9] is not None else "",
+                confidence=None if raw[10] is None else float(raw[10]),
+                source=_coerce_translation_source(raw[11]),
+                created_at=int(raw[12]),
+                hit_count=int(raw[13]),
+                last_hit_at=None if raw[14] is None else int(raw[14]),
+            )
+
+    def insert_rows(self, rows: Iterable[TmRow]) -> int:
+        """Write ``rows`` verbatim — timestamps, embeddings and usage
+        counters included — in one transaction; return the number of
+        translation rows written. Existing rows with the same key are
+        replaced."""
+        seen_segments: set[str] = set()
+        segment_params: list[tuple[object, ...]] = []
+        translation_params: list[tuple[object, ...]] = []
+        for row in rows:
+            fingerprint = row.segment.fingerprint
+            if fingerprint not in seen_segments:
+                seen_segments.add(fingerprint)
+                segment_params.append(
+                    (
+                        fingerprint,
+                        row.segment.source_text,
+                        row.segment.source_lang,
+                        _placeholders_to_json(row.segment.placeholders),
+                        None if row.embedding is None else _encode_embedding(row.embedding),
+                        row.segment_created_at,
+                    )
+                )
+            translation_params.append(
+                (
+                    fingerprint,
+                    row.target_lang,
+                    row.target_text,
+                    row.provider,
+                    row.model,
+                    row.confidence,
+                    row.source,
+                    row.created_at,
+                    row.hit_count,
+                    row.last_hit_at,
+                )
+            )
+        with self._transaction():
+            self._conn.executemany(_INSERT_SEGMENT_ROW_SQL, segment_params)
+            self._conn.executemany(_INSERT_TRANSLATION_ROW_SQL, translation_params)
+        if self._membership is not None:
+            self._rebuild_membership()
+        return len(translation_params)
+
     # --- Internals ---
 
+    def _note_hit(self, fingerprint: str, target_lang: str, provider: str, model: str) -> None:
+        if not self._track_hits:
+            return
+        now = _now_seconds()
+        with self._hits_lock:
+            entry = self._pending_hits.setdefault(
+                (fingerprint, target_lang, provider, model), [0, 0]
+            )
+            entry[0] += 1
+            entry[1] = now
+            due = (
+                len(self._pending_hits) >= _HIT_FLUSH_MAX_PENDING
+                or time.monotonic() - self._last_hit_flush >= _HIT_FLUSH_INTERVAL_SECONDS
+            )
+        if due:
+            self.flush_hits()
+
+    def _rebuild_membership(self) -> None:
+        """(Re)build the negative-lookup filter from the database in
+        one streaming pass over the translations table. Holds the write
+        lock, so no store commits between the scan and the swap."""
+        with self._write_lock:
+            cursor = self._conn.execute("SELECT COUNT(*) FROM translations")
+            membership = TmMembershipFilter(expected_rows=int(cursor.fetchone()[0]))
+            cursor = self._conn.execute(
+                "SELECT t.fingerprint, t.target_lang, t.provider, t.model, "
+                "       s.source_lang, s.embedding IS NOT NULL "
+                "FROM translations t JOIN segments s ON s.fingerprint = t.fingerprint"
+            )
+            membership.add_many(
+                (str(fp), str(lang), str(provider), str(model or ""), str(src), bool(has_emb))
+                for fp, lang, provider, model, src, has_emb in cursor
+            )
+            self._membership = membership
+
+    def _read_attached_schema_version(self) -> int | None:
+        try:
+            cursor = self._conn.execute(
+                f"SELECT value FROM {_MERGE_SOURCE_ALIAS}.meta WHERE key = ?",
+                (_META_KEY_SCHEMA_VERSION,),
+            )
+        except sqlite3.OperationalError:
+            # No meta table — not a TM file (or an empty database).
+            return None
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        try:
+            return int(row[0])
+        except (TypeError, ValueError):
+            return None
+
+    def _count_attached(self, table: str) -> int:
+        cursor = self._conn.execute(f"SELECT COUNT(*) FROM {_MERGE_SOURCE_ALIAS}.{table}")
+        return int(cursor.fetchone()[0])
+
     def _init_schema(self) -> None:
         with self._transaction():
             self._conn.execute(_DDL_META)
@@ -317,20 +882,26 @@ class SqliteTranslationMemory:
         recreate it with the new shape. Pre-1.0 cycle-1 just shipped, so
         the data loss is acceptable; documented in the cycle-2 retro.
         Future migrations can preserve data by COPY-INTO-NEW-TABLE.
+
+        Cycle-6 (v2 → v3): plain column additions, so rows are kept.
         """
         if from_version < 2:
             self._conn.execute("DROP TABLE IF EXISTS translations")
+        elif from_version < 3:
+            self._conn.execute(_DDL_V3_ADD_HIT_COUNT)
+            self._conn.execute(_DDL_V3_ADD_LAST_HIT_AT)
 
     @contextmanager
     def _transaction(self) -> Iterator[None]:
-        self._conn.execute("BEGIN")
-        try:
-            yield
-        except Exception:
-            self._conn.execute("ROLLBACK")
-            raise
-        else:
-            self._conn.execute("COMMIT")
+        with self._write_lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            else:
+                self._conn.execute("COMMIT")
 
     def _lookup_exact(
         self,
@@ -339,6 +910,7 @@ class SqliteTranslationMemory:
         *,
         provider: str | None = None,
         model: str | None = None,
+        record_hits: bool = True,
     ) -> TmHit | None:
         clauses = ["fingerprint = ?", "target_lang = ?"]
         params: list[object] = [segment.fingerprint, target_lang]
@@ -359,6 +931,8 @@ class SqliteTranslationMemory:
         if row is None:
             return None
         target_text, provider, model, confidence, _stored_source = row
+        if record_hits:
+            self._note_hit(segment.fingerprint, target_lang, provider, model or "")
         translated = TranslatedSegment(
             segment=segment,
             target_lang=target_lang,
@@ -382,6 +956,7 @@ class SqliteTranslationMemory:
         *,
         provider: str | None = None,
         model: str | None = None,
+        record_hits: bool = True,
     ) -> TmHit | None:
         if self._embedder is None:
             return None
@@ -416,6 +991,8 @@ class SqliteTranslationMemory:
                 best_row = row
         if best_row is None or best_similarity < threshold:
             return None
+        if record_hits:
+            self._note_hit(best_row.fingerprint, target_lang, best_row.provider, best_row.model)
         match_segment = Segment(
             key=segment.key,  # caller's key; the cached segment's is incidental
             source_text=best_row.source_text,
@@ -581,6 +1158,11 @@ def make_default_embedder(
 __all__ = [
     "DEFAULT_TM_PATH",
     "Embedder",
+    "MERGE_POLICIES",
+    "MERGE_POLICY_KEEP_EXISTING",
+    "MERGE_POLICY_LATEST",
     "SqliteTranslationMemory",
+    "TmMergeResult",
+    "TmRow",
     "make_default_embedder",
 ]
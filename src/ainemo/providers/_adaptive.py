@@ -0,0 +1,494 @@
+"""Cost- and latency-aware adaptive routing for :class:`ProviderRouter`.
+
+A static :class:`~ainemo.providers.router.RoutingRule` always names one
+provider. An :class:`AdaptiveRule` names a set of candidates and an
+objective, and :class:`RouteSelector` picks among them per call from
+each provider's recent calls:
+
+- **Metrics.** :class:`ProviderMetrics` keeps the last ``window`` calls
+  of each provider: the latency quantile of its successful calls, its
+  error rate, and its cost per 1,000 tokens. The window starts from the
+  provider's most recent UsageLog records, so a new process does not
+  start cold. The router then adds every call it makes, and every call
+  that fails. Providers that report no cost (local models) count as
+  free.
+- **Objective.** ``cheapest-under-slo`` picks the cheapest candidate
+  whose latency quantile is within ``latency_slo_ms``.
+  ``fastest-under-budget`` picks the fastest candidate whose cost is
+  within ``max_cost_per_1k_tokens_usd``. Either way, a candidate above
+  ``max_error_rate`` is not eligible. When no candidate is eligible,
+  the rule falls back to the fastest (SLO) or cheapest (budget)
+  candidate below the error-rate limit, then to the lowest error rate.
+- **Exploration.** A candidate with fewer than ``min_samples`` calls
+  is tried first, so every candidate gets measured. After that, a
+  fraction ``exploration`` of the calls goes to a random candidate, so
+  a provider that was slow or failing can show it has recovered.
+  The random draws come from one ``random.Random(seed)``: the same seed
+  and the same history give the same decisions.
+
+Every decision is a :class:`RouteDecision` carrying the per-candidate
+scores and the reason for the pick; ``nemo provider routes --explain``
+prints them.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Final, Mapping, Protocol, Sequence
+
+from ainemo.providers._usage_log import (
+    FIELD_BATCH_JOB,
+    FIELD_COST_USD,
+    FIELD_INPUT_TOKENS,
+    FIELD_LATENCY_MS,
+    FIELD_OUTPUT_TOKENS,
+    FIELD_PROVIDER,
+    FIELD_RESPONSE_CACHE_HIT,
+    UsageLog,
+)
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+OBJECTIVE_CHEAPEST_UNDER_SLO: Final = "cheapest-under-slo"
+OBJECTIVE_FASTEST_UNDER_BUDGET: Final = "fastest-under-budget"
+OBJECTIVES: Final = (OBJECTIVE_CHEAPEST_UNDER_SLO, OBJECTIVE_FASTEST_UNDER_BUDGET)
+
+DEFAULT_ROUTING_WINDOW: Final = 200
+DEFAULT_ROUTING_MIN_SAMPLES: Final = 10
+DEFAULT_ROUTING_LATENCY_QUANTILE: Final = 0.95
+DEFAULT_MAX_ERROR_RATE: Final = 0.2
+DEFAULT_EXPLORATION: Final = 0.05
+
+_TOKENS_PER_COST_UNIT: Final = 1000
+
+_NOTE_ELIGIBLE: Final = "eligible"
+_NOTE_UNSUPPORTED: Final = "not registered or does not support the pair"
+
+
+class StaticRule(Protocol):
+    """The shape of :class:`~ainemo.providers.router.RoutingRule` the
+    selector needs."""
+
+    @property
+    def provider_id(self) -> str: ...
+
+    def matches(
+        self,
+        *,
+        source_lang: str,
+        target_lang: str,
+        persona: str | None,
+        domain: str | None,
+    ) -> bool: ...
+
+
+@dataclass(frozen=True)
+class AdaptiveRule:
+    """A routing rule that picks one of ``candidates`` per call. Same
+    ``None``-means-any filters as
+    :class:`~ainemo.providers.router.RoutingRule`."""
+
+    candidates: tuple[str, ...]
+    """Provider ids to choose from; earlier ones win ties."""
+
+    objective: str = OBJECTIVE_CHEAPEST_UNDER_SLO
+    """One of :data:`OBJECTIVES`."""
+
+    latency_slo_ms: float | None = None
+    """Latency quantile a candidate must stay within; required by
+    ``cheapest-under-slo``."""
+
+    max_cost_per_1k_tokens_usd: float | None = None
+    """Cost a candidate must stay within; required by
+    ``fastest-under-budget``."""
+
+    source_lang: str | None = None
+    target_lang: str | None = None
+    persona: str | None = None
+    domain: str | None = None
+
+    latency_quantile: float = DEFAULT_ROUTING_LATENCY_QUANTILE
+    max_error_rate: float = DEFAULT_MAX_ERROR_RATE
+    min_samples: int = DEFAULT_ROUTING_MIN_SAMPLES
+
+    exploration: float = DEFAULT_EXPLORATION
+    """Share of calls sent to a random candidate once all are measured."""
+
+    def __post_init__(self) -> None:
+        if not self.candidates:
+            raise ValueError("candidates must name at least one provider.")
+        if len(set(self.candidates)) != len(self.candidates):
+            raise ValueError(f"candidates must be unique, got {list(self.candidates)}.")
+        if self.objective not in OBJECTIVES:
+            raise ValueError(
+                f"objective must be one of {list(OBJECTIVES)}, got {self.objective!r}."
+            )
+        if self.objective == OBJECTIVE_CHEAPEST_UNDER_SLO and self.latency_slo_ms is None:
+            raise ValueError(f"objective {self.objective!r} needs latency_slo_ms.")
+        if self.objective == OBJECTIVE_FASTEST_UNDER_BUDGET and (
+            self.max_cost_per_1k_tokens_usd is None
+        ):
+            raise ValueError(f"objective {self.objective!r} needs max_cost_per_1k_tokens_usd.")
+        if self.latency_slo_ms is not None and self.latency_slo_ms <= 0:
+            raise ValueError(f"latency_slo_ms must be > 0, got {self.latency_slo_ms}.")
+        if self.max_cost_per_1k_tokens_usd is not None and self.max_cost_per_1k_tokens_usd < 0:
+            raise ValueError(
+                f"max_cost_per_1k_tokens_usd must be >= 0, got {self.max_cost_per_1k_tokens_usd}."
+            )
+        if not 0 < self.latency_quantile < 1:
+            raise ValueError(
+                f"latency_quantile must be between 0 and 1, got {self.latency_quantile}."
+            )
+        if not 0 <= self.max_error_rate <= 1:
+            raise ValueError(f"max_error_rate must be between 0 and 1, got {self.max_error_rate}.")
+        if self.min_samples < 1:
+            raise ValueError(f"min_samples must be >= 1, got {self.min_samples}.")
+        if not 0 <= self.exploration < 1:
+            raise ValueError(f"exploration must be in [0, 1), got {self.exploration}.")
+
+    def matches(
+        self,
+        *,
+        source_lang: str,
+        target_lang: str,
+        persona: str | None,
+        domain: str | None,
+    ) -> bool:
+        if self.source_lang is not None and self.source_lang != source_lang:
+            return False
+        if self.target_lang is not None and self.target_lang != target_lang:
+            return False
+        if self.persona is not None and self.persona != persona:
+            return False
+        if self.domain is not None and self.domain != domain:
+            return False
+        return True
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """One provider's recent calls, summarized."""
+
+    samples: int
+    errors: int
+    latency_ms: float | None
+    """Latency quantile of the successful calls; ``None`` without any."""
+
+    cost_per_1k_tokens_usd: float | None
+    """``None`` when the provider reported cost but no token counts."""
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.samples if self.samples else 0.0
+
+
+@dataclass(frozen=True)
+class _Sample:
+    ok: bool
+    latency_ms: int = 0
+    cost_usd: float = 0.0
+    tokens: int = 0
+
+
+class ProviderMetrics:
+    """Thread-safe window of one provider's recent calls."""
+
+    def __init__(self, window: int = DEFAULT_ROUTING_WINDOW) -> None:
+        self._samples: deque[_Sample] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, *, latency_ms: int, cost_usd: float | None, tokens: int | None) -> None:
+        with self._lock:
+            self._samples.append(
+                _Sample(
+                    ok=True, latency_ms=latency_ms, cost_usd=cost_usd or 0.0, tokens=tokens or 0
+                )
+            )
+
+    def observe_error(self) -> None:
+        with self._lock:
+            self._samples.append(_Sample(ok=False))
+
+    def snapshot(self, quantile: float) -> MetricsSnapshot:
+        with self._lock:
+            samples = list(self._samples)
+        ok = [sample for sample in samples if sample.ok]
+        latencies = sorted(sample.latency_ms for sample in ok)
+        latency = (
+            float(latencies[min(len(latencies) - 1, math.ceil(quantile * len(latencies)) - 1)])
+            if latencies
+            else None
+        )
+        cost = sum(sample.cost_usd for sample in ok)
+        tokens = sum(sample.tokens for sample in ok)
+        if cost == 0:
+            cost_per_1k: float | None = 0.0
+        else:
+            cost_per_1k = cost / tokens * _TOKENS_PER_COST_UNIT if tokens else None
+        return MetricsSnapshot(
+            samples=len(samples),
+            errors=len(samples) - len(ok),
+            latency_ms=latency,
+            cost_per_1k_tokens_usd=cost_per_1k,
+        )
+
+
+@dataclass(frozen=True)
+class CandidateScore:
+    """How one candidate measured up when a decision was made."""
+
+    provider_id: str
+    samples: int
+    latency_ms: float | None
+    error_rate: float
+    cost_per_1k_tokens_usd: float | None
+    eligible: bool
+    note: str
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    """The provider a call routes to, and why."""
+
+    provider_id: str
+    reason: str
+    rule_index: int | None
+    """Index of the matching rule in ``RoutingConfig.rules``; ``None``
+    for the default provider."""
+
+    objective: str | None = None
+    explored: bool = False
+    scores: tuple[CandidateScore, ...] = ()
+
+
+class RouteSelector:
+    """Applies a routing config's rules to one call. Owned by a
+    :class:`~ainemo.providers.router.ProviderRouter`, or built on its
+    own to explain decisions without building providers."""
+
+    def __init__(
+        self,
+        rules: Sequence[StaticRule | AdaptiveRule],
+        default_provider: str,
+        *,
+        usage_log: UsageLog | None = None,
+        seed: int | None = None,
+        window: int = DEFAULT_ROUTING_WINDOW,
+    ) -> None:
+        self._rules = tuple(rules)
+        self._default_provider = default_provider
+        self._usage_log = usage_log
+        self._window = window
+        self._rng = random.Random(seed)
+        self._metrics: dict[str, ProviderMetrics] = {}
+        self._history_loaded = usage_log is None
+        # Guards the RNG and the lazy history load.
+        self._lock = threading.Lock()
+
+    @property
+    def adaptive(self) -> bool:
+        """``True`` when any rule is an :class:`AdaptiveRule`."""
+        return any(isinstance(rule, AdaptiveRule) for rule in self._rules)
+
+    def decide(
+        self,
+        *,
+        source_lang: str,
+        target_lang: str,
+        persona: str | None = None,
+        domain: str | None = None,
+        supported: Callable[[str], bool] | None = None,
+    ) -> RouteDecision:
+        """Route one call. ``supported(provider_id)`` filters adaptive
+        candidates (``None``: every candidate is usable)."""
+        for index, rule in enumerate(self._rules):
+            if not rule.matches(
+                source_lang=source_lang, target_lang=target_lang, persona=persona, domain=domain
+            ):
+                continue
+            if isinstance(rule, AdaptiveRule):
+                return self._choose(index, rule, supported)
+            return RouteDecision(
+                provider_id=rule.provider_id, reason=f"static rule {index}", rule_index=index
+            )
+        return RouteDecision(
+            provider_id=self._default_provider, reason="no rule matched", rule_index=None
+        )
+
+    def observe(
+        self, provider_id: str, *, latency_ms: int, cost_usd: float | None, tokens: int | None
+    ) -> None:
+        self.metrics(provider_id).observe(latency_ms=latency_ms, cost_usd=cost_usd, tokens=tokens)
+
+    def observe_error(self, provider_id: str) -> None:
+        self.metrics(provider_id).observe_error()
+
+    def metrics(self, provider_id: str) -> ProviderMetrics:
+        self._load_history()
+        with self._lock:
+            metrics = self._metrics.get(provider_id)
+            if metrics is None:
+                metrics = ProviderMetrics(self._window)
+                self._metrics[provider_id] = metrics
+            return metrics
+
+    # --- Internals ---
+
+    def _choose(
+        self, index: int, rule: AdaptiveRule, supported: Callable[[str], bool] | None
+    ) -> RouteDecision:
+        scores = tuple(self._score(rule, provider_id, supported) for provider_id in rule.candidates)
+
+        def _decision(provider_id: str, reason: str, *, explored: bool = False) -> RouteDecision:
+            return RouteDecision(
+                provider_id=provider_id,
+                reason=reason,
+                rule_index=index,
+                objective=rule.objective,
+                explored=explored,
+                scores=scores,
+            )
+
+        usable = [score for score in scores if score.note != _NOTE_UNSUPPORTED]
+        if not usable:
+            return _decision(rule.candidates[0], "no candidate supports the pair")
+        cold = [score for score in usable if score.samples < rule.min_samples]
+        if cold:
+            first = min(cold, key=lambda score: score.samples)
+            return _decision(
+                first.provider_id,
+                f"measuring {first.provider_id}: {first.samples} of {rule.min_samples} calls",
+            )
+        eligible = [score for score in usable if score.eligible]
+        with self._lock:
+            explored = self._rng.choice(usable) if self._rng.random() < rule.exploration else None
+        if explored is not None:
+            return _decision(
+                explored.provider_id, f"exploring (p={rule.exploration:g})", explored=True
+            )
+        if eligible:
+            if rule.objective == OBJECTIVE_CHEAPEST_UNDER_SLO:
+                best = min(eligible, key=_by_cost)
+                return _decision(
+                    best.provider_id,
+                    f"cheapest within the {rule.latency_slo_ms:g} ms "
+                    f"p{rule.latency_quantile * 100:g} SLO",
+                )
+            best = min(eligible, key=_by_latency)
+            return _decision(
+                best.provider_id, f"fastest within ${rule.max_cost_per_1k_tokens_usd:g}/1k tokens"
+            )
+        healthy = [score for score in usable if score.error_rate <= rule.max_error_rate]
+        if not healthy:
+            best = min(usable, key=lambda score: score.error_rate)
+            return _decision(best.provider_id, "every candidate over the error-rate limit")
+        if rule.objective == OBJECTIVE_CHEAPEST_UNDER_SLO:
+            best = min(healthy, key=_by_latency)
+            return _decision(best.provider_id, "no candidate meets the SLO; fastest")
+        best = min(healthy, key=_by_cost)
+        return _decision(best.provider_id, "no candidate within budget; cheapest")
+
+    def _score(
+        self, rule: AdaptiveRule, provider_id: str, supported: Callable[[str], bool] | None
+    ) -> CandidateScore:
+        snapshot = self.metrics(provider_id).snapshot(rule.latency_quantile)
+        note = _NOTE_ELIGIBLE
+        if supported is not None and not supported(provider_id):
+            note = _NOTE_UNSUPPORTED
+        elif snapshot.samples < rule.min_samples:
+            note = f"measuring ({snapshot.samples}/{rule.min_samples})"
+        elif snapshot.error_rate > rule.max_error_rate:
+            note = f"error rate {snapshot.error_rate:.0%} over {rule.max_error_rate:.0%}"
+        elif rule.objective == OBJECTIVE_CHEAPEST_UNDER_SLO:
+            if snapshot.latency_ms is None or snapshot.latency_ms > (rule.latency_slo_ms or 0):
+                note = "over the latency SLO"
+        else:
+            cost = snapshot.cost_per_1k_tokens_usd
+            if cost is None or cost > (rule.max_cost_per_1k_tokens_usd or 0):
+                note = "over the cost budget"
+        return CandidateScore(
+            provider_id=provider_id,
+            samples=snapshot.samples,
+            latency_ms=snapshot.latency_ms,
+            error_rate=snapshot.error_rate,
+            cost_per_1k_tokens_usd=snapshot.cost_per_1k_tokens_usd,
+            eligible=note == _NOTE_ELIGIBLE,
+            note=note,
+        )
+
+    def _load_history(self) -> None:
+        """Start every candidate's window from its latest UsageLog
+        records, once."""
+        with self._lock:
+            log = self._usage_log
+            if self._history_loaded or log is None:
+                return
+            self._history_loaded = True
+            candidates = {
+                provider_id
+                for rule in self._rules
+                if isinstance(rule, AdaptiveRule)
+                for provider_id in rule.candidates
+            }
+            recent: dict[str, deque[Mapping[str, object]]] = {
+                provider_id: deque(maxlen=self._window) for provider_id in candidates
+            }
+            for record in log.records():
+                window = recent.get(str(record.get(FIELD_PROVIDER, "")))
+                # Cache hits and batch results say nothing about a
+                # provider's interactive latency.
+                if (
+                    window is not None
+                    and record.get(FIELD_RESPONSE_CACHE_HIT) is not True
+                    and record.get(FIELD_BATCH_JOB) is None
+                ):
+                    window.append(record)
+            for provider_id, entries in recent.items():
+                metrics = ProviderMetrics(self._window)
+                for entry in entries:
+                    metrics.observe(
+                        latency_ms=_as_int(entry.get(FIELD_LATENCY_MS)),
+                        cost_usd=_as_float(entry.get(FIELD_COST_USD)),
+                        tokens=_as_int(entry.get(FIELD_INPUT_TOKENS))
+                        + _as_int(entry.get(FIELD_OUTPUT_TOKENS)),
+                    )
+                self._metrics[provider_id] = metrics
+
+
+def _by_cost(score: CandidateScore) -> float:
+    cost = score.cost_per_1k_tokens_usd
+    return math.inf if cost is None else cost
+
+
+def _by_latency(score: CandidateScore) -> float:
+    return math.inf if score.latency_ms is None else score.latency_ms
+
+
+def _as_int(value: object) -> int:
+    return int(value) if isinstance(value, (int, float)) else 0
+
+
+def _as_float(value: object) -> float | None:
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+__all__ = [
+    "DEFAULT_EXPLORATION",
+    "DEFAULT_MAX_ERROR_RATE",
+    "DEFAULT_ROUTING_LATENCY_QUANTILE",
+    "DEFAULT_ROUTING_MIN_SAMPLES",
+    "DEFAULT_ROUTING_WINDOW",
+    "OBJECTIVES",
+    "OBJECTIVE_CHEAPEST_UNDER_SLO",
+    "OBJECTIVE_FASTEST_UNDER_BUDGET",
+    "AdaptiveRule",
+    "CandidateScore",
+    "MetricsSnapshot",
+    "ProviderMetrics",
+    "RouteDecision",
+    "RouteSelector",
+]
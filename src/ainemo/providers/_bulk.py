@@ -0,0 +1,271 @@
+"""Offline batch jobs: submit every TM miss at once, collect later.
+
+Nightly full-catalog refreshes don't need interactive latency. A
+:class:`~ainemo.providers.base.BulkBatchProvider` (OpenAI Batch API,
+Anthropic Message Batches) runs the same requests as an offline job at
+the provider's batch price, with its own, much larger rate limits.
+
+The flow is split across two process runs, joined by a
+:class:`BulkJob` manifest file:
+
+1. ``nemo translate --submit-batch job.json`` collects the TM misses,
+   writes the manifest, submits the job and records its id.
+2. ``nemo translate --collect-batch job.json`` polls the job; once it
+   has ended, it fetches the results, records them to the UsageLog and
+   runs the pipeline with a :class:`BulkResultProvider` serving them,
+   so validators, TM writes and output files are the interactive
+   ones.
+
+Every step saves the manifest before moving on, so either command can
+be re-run after a crash: an unsubmitted manifest is submitted again,
+usage is recorded once, and results already stored in the TM come
+back as TM hits.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, ClassVar, Final, Mapping, Sequence
+
+from ainemo.core.segment import Segment
+from ainemo.providers.base import (
+    BULK_STATE_PENDING,
+    BulkBatchProvider,
+    BulkRequest,
+    BulkStatus,
+    Provider,
+    ProviderResult,
+)
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# OpenAI and Anthropic both bill batch jobs at half the interactive
+# rate — verify alongside the providers' pricing tables.
+BATCH_PRICE_MULTIPLIER: Final = 0.5
+
+# Seconds between polls while ``--batch-wait`` is running.
+DEFAULT_POLL_INTERVAL_S: Final = 30.0
+
+# Manifest schema version; bump on incompatible changes.
+MANIFEST_VERSION: Final = 1
+
+# ``custom_id`` shape: short and ``[A-Za-z0-9_-]`` only, as the
+# Message Batches API requires.
+_CUSTOM_ID_TEMPLATE: Final = "seg-{index:06d}"
+
+_KEY_VERSION: Final = "version"
+_KEY_REQUESTS: Final = "requests"
+_KEY_TARGET_LANGS: Final = "target_langs"
+
+ResultKey = tuple[str, str, str | None]
+"""(segment fingerprint, target language, system-prompt addendum)."""
+
+
+@dataclass(frozen=True)
+class BulkJobEntry:
+    """One request of a :class:`BulkJob`, with what the pipeline needs
+    to match its result to a segment again."""
+
+    custom_id: str
+    key: str
+    source_text: str
+    source_lang: str
+    fingerprint: str
+    """Fingerprint of the parsed segment (placeholders included), which
+    a segment rebuilt from the fields above would not reproduce."""
+
+    target_lang: str
+    addendum: str | None = None
+
+    @property
+    def result_key(self) -> ResultKey:
+        return (self.fingerprint, self.target_lang, self.addendum)
+
+    def to_request(self) -> BulkRequest:
+        return BulkRequest(
+            custom_id=self.custom_id,
+            segment=Segment(
+                key=self.key, source_text=self.source_text, source_lang=self.source_lang
+            ),
+            target_lang=self.target_lang,
+            system_prompt_addendum=self.addendum,
+        )
+
+
+@dataclass(frozen=True)
+class BulkJob:
+    """Manifest of one offline batch job, saved as JSON between runs."""
+
+    provider: str
+    model: str
+    source_path: str
+    source_lang: str
+    target_langs: tuple[str, ...]
+    requests: tuple[BulkJobEntry, ...]
+
+    job_id: str | None = None
+    """Set once the provider accepted the job; ``None`` before that and
+    for a job with no requests."""
+
+    submitted_at: str | None = None
+    usage_recorded: bool = False
+    """Whether the results were written to the UsageLog (only once)."""
+
+    collected: bool = False
+    """Whether a collect run ingested the results; a collected
+    manifest may be overwritten by the next submit."""
+
+    @classmethod
+    def from_misses(
+        cls,
+        misses: Sequence[tuple[Segment, str, str | None]],
+        *,
+        provider: str,
+        model: str,
+        source_path: Path,
+        source_lang: str,
+        target_langs: Sequence[str],
+    ) -> BulkJob:
+        """A manifest for ``misses`` — (segment, target language,
+        addendum) triples, e.g. from
+        :meth:`~ainemo.core.pipeline.TranslationPipeline.collect_misses`."""
+        return cls(
+            provider=provider,
+            model=model,
+            source_path=str(source_path),
+            source_lang=source_lang,
+            target_langs=tuple(target_langs),
+            requests=tuple(
+                BulkJobEntry(
+                    custom_id=_CUSTOM_ID_TEMPLATE.format(index=index),
+                    key=segment.key,
+                    source_text=segment.source_text,
+                    source_lang=segment.source_lang,
+                    fingerprint=segment.fingerprint,
+                    target_lang=target_lang,
+                    addendum=addendum,
+                )
+                for index, (segment, target_lang, addendum) in enumerate(misses)
+            ),
+        )
+
+    def bulk_requests(self) -> dict[str, BulkRequest]:
+        """The provider requests, by ``custom_id``."""
+        return {entry.custom_id: entry.to_request() for entry in self.requests}
+
+    def submitted(self, job_id: str) -> BulkJob:
+        return replace(self, job_id=job_id, submitted_at=datetime.now(timezone.utc).isoformat())
+
+    def save(self, path: Path) -> None:
+        """Write the manifest atomically: a crash leaves the old file or
+        the new one, never half of either."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {_KEY_VERSION: MANIFEST_VERSION, **asdict(self)}
+        partial = path.with_name(f"{path.name}.partial")
+        partial.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(partial, path)
+
+    @classmethod
+    def load(cls, path: Path) -> BulkJob:
+        """Read a manifest. Raises ``ValueError`` naming the file when
+        it is missing, unreadable or from another manifest version."""
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+            if raw.pop(_KEY_VERSION, None) != MANIFEST_VERSION:
+                raise ValueError(f"expected manifest version {MANIFEST_VERSION}")
+            raw[_KEY_TARGET_LANGS] = tuple(raw[_KEY_TARGET_LANGS])
+            raw[_KEY_REQUESTS] = tuple(BulkJobEntry(**entry) for entry in raw[_KEY_REQUESTS])
+            return cls(**raw)
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid batch manifest {path}: {exc}") from exc
+
+
+class BulkResultProvider:
+    """Serves a collected job's results to the pipeline.
+
+    A segment whose (fingerprint, target language, addendum) has a
+    result gets it without a call; any other — a request the job
+    failed, or a segment added to the source since the submit — is
+    translated by ``fallback`` interactively and counted in
+    :attr:`fallback_count`. Put it in front of the router, so fallback
+    calls are routed and logged as usual.
+    """
+
+    # A façade like ProviderRouter: each result names its own provider.
+    provider_id: ClassVar[str] = "bulk"
+
+    def __init__(self, results: Mapping[ResultKey, ProviderResult], fallback: Provider) -> None:
+        self._results = dict(results)
+        self._fallback = fallback
+        self.fallback_count = 0
+
+    @property
+    def result_count(self) -> int:
+        return len(self._results)
+
+    def translate(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> ProviderResult:
+        result = self._results.get((segment.fingerprint, target_lang, system_prompt_addendum))
+        if result is not None:
+            return result
+        self.fallback_count += 1
+        if system_prompt_addendum is None:
+            return self._fallback.translate(segment, target_lang)
+        return self._fallback.translate(
+            segment, target_lang, system_prompt_addendum=system_prompt_addendum
+        )
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return self._fallback.supports(source_lang, target_lang)
+
+
+def at_batch_price(result: ProviderResult) -> ProviderResult:
+    """``result`` with its cost at the batch rate."""
+    if result.cost_usd is None:
+        return result
+    return replace(result, cost_usd=result.cost_usd * BATCH_PRICE_MULTIPLIER)
+
+
+def wait_for_bulk(
+    provider: BulkBatchProvider,
+    job_id: str,
+    *,
+    wait_s: float = 0.0,
+    poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> BulkStatus:
+    """Poll until the job leaves ``pending`` or ``wait_s`` seconds have
+    passed; ``wait_s`` 0 polls once."""
+    deadline = clock() + wait_s
+    status = provider.poll_bulk(job_id)
+    while status.state == BULK_STATE_PENDING:
+        remaining = deadline - clock()
+        if remaining <= 0:
+            break
+        sleep(min(poll_interval_s, remaining))
+        status = provider.poll_bulk(job_id)
+    return status
+
+
+__all__ = [
+    "BATCH_PRICE_MULTIPLIER",
+    "DEFAULT_POLL_INTERVAL_S",
+    "MANIFEST_VERSION",
+    "BulkJob",
+    "BulkJobEntry",
+    "BulkResultProvider",
+    "ResultKey",
+    "at_batch_price",
+    "wait_for_bulk",
+]
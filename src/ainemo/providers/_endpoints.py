@@ -0,0 +1,493 @@
+"""Load-balanced pools of interchangeable endpoints for one provider.
+
+A team running several Ollama boxes, or several OpenAI-compatible
+gateways, lists them all (``OLLAMA_HOST`` / ``OPENAI_BASE_URL``
+accept a comma-separated list). The provider then leases an endpoint
+from an :class:`EndpointPool` for every request:
+
+- **Balancing.** ``least-outstanding`` sends the request to the
+  endpoint with the fewest requests in flight. ``ewma`` weighs that
+  count by each endpoint's exponentially weighted average latency,
+  so a slower box gets proportionally less work. An endpoint that has
+  never been leased is tried once before any other; until its first
+  latency sample arrives it is weighed at the mean of the sampled
+  endpoints. Ties go to the endpoint that has served fewer requests.
+- **Concurrency caps.** With ``max_concurrency`` set, a request waits
+  for a free slot rather than piling onto a saturated endpoint. Threads
+  block on a condition; coroutines await a future, never blocking the
+  event loop.
+- **Ejection.** ``eject_after_failures`` consecutive failures
+  (connection errors, timeouts, HTTP 5xx / 429) take an endpoint out
+  of rotation for ``ejection_s``, doubled on each repeated ejection up
+  to ``max_ejection_s``. Once that expires one trial request goes
+  through; success readmits the endpoint, failure ejects it again.
+  Client errors such as HTTP 400 say nothing about the endpoint and
+  do not count. If every endpoint is ejected, requests are spread over
+  all of them rather than failing outright.
+- **Health checks.** :meth:`EndpointPool.check_health` probes every
+  endpoint (``GET /api/version`` for Ollama, ``GET /models`` for the
+  OpenAI API) and ejects or readmits each. The providers run it from
+  ``warm_up()``, so ``nemo daemon --preload`` checks the pool at
+  start-up.
+
+The endpoint that served a call is set on
+:attr:`ProviderResult.endpoint <ainemo.providers.base.ProviderResult.endpoint>`,
+so the UsageLog records per-endpoint latency.
+
+:func:`endpoint_pools` returns the process-wide
+:class:`EndpointPoolRegistry`, one pool per (provider, endpoint list)
+shared by every provider instance; :func:`configure_endpoint_pools`
+replaces it, e.g. from CLI flags.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Final, Iterator, Sequence
+
+from ainemo.providers._rate_limit import HTTP_TOO_MANY_REQUESTS
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+STRATEGY_LEAST_OUTSTANDING: Final = "least-outstanding"
+STRATEGY_EWMA: Final = "ewma"
+STRATEGIES: Final = (STRATEGY_LEAST_OUTSTANDING, STRATEGY_EWMA)
+
+DEFAULT_EJECT_AFTER_FAILURES: Final = 3
+DEFAULT_EJECTION_S: Final = 30.0
+DEFAULT_MAX_EJECTION_S: Final = 300.0
+
+# Weight of the newest latency sample in the moving average.
+DEFAULT_EWMA_DECAY: Final = 0.3
+
+DEFAULT_PROBE_TIMEOUT_S: Final = 2.0
+
+# Latency assumed for every endpoint before any has been sampled; any
+# positive value reduces ``ewma`` to least-outstanding.
+_EWMA_PRIOR_WITHOUT_SAMPLES_MS: Final = 1.0
+
+# Separator of endpoint lists in ``OLLAMA_HOST`` / ``OPENAI_BASE_URL``.
+ENDPOINT_LIST_SEPARATOR: Final = ","
+
+_HTTP_SERVER_ERROR: Final = 500
+
+# Exception classes (by name, anywhere in the MRO) that mean the
+# endpoint could not be reached: httpx's ``TransportError`` (timeouts
+# included) and the OpenAI / Anthropic SDK wrappers around it.
+_TRANSPORT_ERROR_NAMES: Final = frozenset(
+    {"TransportError", "APIConnectionError", "APITimeoutError"}
+)
+
+
+@dataclass(frozen=True)
+class EndpointPoolOptions:
+    """Balancing, concurrency and ejection settings of every pool."""
+
+    strategy: str = STRATEGY_LEAST_OUTSTANDING
+    """One of :data:`STRATEGIES`."""
+
+    max_concurrency: int | None = None
+    """Requests in flight per endpoint; ``None`` for no cap."""
+
+    eject_after_failures: int = DEFAULT_EJECT_AFTER_FAILURES
+    ejection_s: float = DEFAULT_EJECTION_S
+    max_ejection_s: float = DEFAULT_MAX_EJECTION_S
+    ewma_decay: float = DEFAULT_EWMA_DECAY
+
+    def __post_init__(self) -> None:
+        if self.strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {list(STRATEGIES)}, got {self.strategy!r}.")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {self.max_concurrency}.")
+        if self.eject_after_failures < 1:
+            raise ValueError(f"eject_after_failures must be >= 1, got {self.eject_after_failures}.")
+        if self.ejection_s <= 0:
+            raise ValueError(f"ejection_s must be > 0, got {self.ejection_s}.")
+        if self.max_ejection_s < self.ejection_s:
+            raise ValueError(
+                f"max_ejection_s must be >= ejection_s ({self.ejection_s}), "
+                f"got {self.max_ejection_s}."
+            )
+        if not 0 < self.ewma_decay <= 1:
+            raise ValueError(f"ewma_decay must be in (0, 1], got {self.ewma_decay}.")
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    """Snapshot of one endpoint of a pool."""
+
+    provider: str
+    endpoint: str
+    requests: int
+    in_flight: int
+    failures: int
+    ewma_latency_ms: float | None
+    healthy: bool
+    """``False`` from an ejection until a trial request or health
+    check readmits the endpoint."""
+
+    ejections: int
+    """Consecutive ejections; reset when the endpoint recovers."""
+
+
+class _Endpoint:
+    """Mutable state of one endpoint. Guarded by the pool's lock."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.requests = 0
+        self.in_flight = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.ewma_ms: float | None = None
+        self.ejected_until: float | None = None
+        self.ejections = 0
+        self.trial = False
+
+    def available(self, now: float) -> bool:
+        """Not ejected, or due its one trial request."""
+        if self.ejected_until is None:
+            return True
+        return now >= self.ejected_until and not self.trial
+
+
+class EndpointPool:
+    """Leases the endpoints of one provider. Thread-safe, and usable
+    from several event loops at once."""
+
+    def __init__(
+        self,
+        provider: str,
+        endpoints: Sequence[str],
+        options: EndpointPoolOptions | None = None,
+        *,
+        probe: Callable[[str], bool] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not endpoints:
+            raise ValueError("endpoints must name at least one endpoint.")
+        if len(set(endpoints)) != len(endpoints):
+            raise ValueError(f"endpoints must be unique, got {list(endpoints)}.")
+        self._provider = provider
+        self._endpoints = {url: _Endpoint(url) for url in endpoints}
+        self._options = options or EndpointPoolOptions()
+        self._probe = probe
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._async_waiters: deque[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = deque()
+
+    @property
+    def endpoints(self) -> tuple[str, ...]:
+        return tuple(self._endpoints)
+
+    def acquire(self) -> str:
+        """Take a slot on the best endpoint, waiting while every
+        candidate is at its concurrency cap. Pair with :meth:`release`."""
+        with self._available:
+            while True:
+                endpoint = self._take()
+                if endpoint is not None:
+                    return endpoint
+                self._available.wait()
+
+    async def aacquire(self) -> str:
+        """:meth:`acquire` for coroutines."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                endpoint = self._take()
+                if endpoint is not None:
+                    return endpoint
+                waiter: asyncio.Future[None] = loop.create_future()
+                entry = (loop, waiter)
+                self._async_waiters.append(entry)
+            try:
+                await waiter
+            finally:
+                with self._lock:
+                    if entry in self._async_waiters:
+                        self._async_waiters.remove(entry)
+
+    def release(
+        self,
+        endpoint: str,
+        *,
+        latency_ms: float | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """Return a slot. ``latency_ms`` feeds the moving average of a
+        successful request; an ``error`` that
+        :func:`is_endpoint_failure` counts towards ejection."""
+        with self._lock:
+            state = self._endpoints[endpoint]
+            state.in_flight -= 1
+            trial, state.trial = state.trial, False
+            if error is None:
+                self._succeeded(state, latency_ms)
+            elif isinstance(error, Exception) and is_endpoint_failure(error):
+                self._failed(state, trial=trial)
+            self._wake()
+
+    @contextmanager
+    def lease(self) -> Iterator[str]:
+        """``with pool.lease() as endpoint:`` — acquire, time the body,
+        and release with its outcome."""
+        endpoint = self.acquire()
+        started = time.perf_counter()
+        try:
+            yield endpoint
+        except BaseException as exc:
+            self.release(endpoint, error=exc)
+            raise
+        self.release(endpoint, latency_ms=(time.perf_counter() - started) * 1000)
+
+    @asynccontextmanager
+    async def alease(self) -> AsyncIterator[str]:
+        """:meth:`lease` for coroutines."""
+        endpoint = await self.aacquire()
+        started = time.perf_counter()
+        try:
+            yield endpoint
+        except BaseException as exc:
+            self.release(endpoint, error=exc)
+            raise
+        self.release(endpoint, latency_ms=(time.perf_counter() - started) * 1000)
+
+    def check_health(self) -> dict[str, bool]:
+        """Probe every endpoint: eject the ones that fail, readmit the
+        ejected ones that pass. Without a probe, reports the current
+        state. Blocks for up to one probe timeout per endpoint."""
+        if self._probe is None:
+            now = self._clock()
+            with self._lock:
+                return {url: state.available(now) for url, state in self._endpoints.items()}
+        results = {url: self._probe(url) for url in self._endpoints}
+        with self._lock:
+            for url, healthy in results.items():
+                state = self._endpoints[url]
+                if healthy:
+                    self._readmit(state)
+                elif state.ejected_until is None:
+                    self._eject(state)
+            self._wake()
+        return results
+
+    def stats(self) -> tuple[EndpointStats, ...]:
+        with self._lock:
+            return tuple(
+                EndpointStats(
+                    provider=self._provider,
+                    endpoint=state.url,
+                    requests=state.requests,
+                    in_flight=state.in_flight,
+                    failures=state.failures,
+                    ewma_latency_ms=state.ewma_ms,
+                    healthy=state.ejected_until is None,
+                    ejections=state.ejections,
+                )
+                for state in self._endpoints.values()
+            )
+
+    # --- Internals (caller holds the lock) ---
+
+    def _take(self) -> str | None:
+        now = self._clock()
+        states = list(self._endpoints.values())
+        # With every endpoint ejected, spread the load rather than fail.
+        choices = [state for state in states if state.available(now)] or states
+        cap = self._options.max_concurrency
+        if cap is not None:
+            choices = [state for state in choices if state.in_flight < cap]
+        if not choices:
+            return None
+        if self._options.strategy == STRATEGY_EWMA:
+            best = self._pick_ewma(choices, states)
+        else:
+            best = min(choices, key=lambda s: (s.in_flight, s.requests))
+        best.requests += 1
+        best.in_flight += 1
+        if best.ejected_until is not None and now >= best.ejected_until:
+            best.trial = True
+        return best.url
+
+    def _pick_ewma(self, choices: list[_Endpoint], states: list[_Endpoint]) -> _Endpoint:
+        # Explore: every endpoint gets one request before the averages
+        # decide, so a new or readded box is not starved.
+        unexplored = [state for state in choices if state.requests == 0]
+        if unexplored:
+            return unexplored[0]
+        # An endpoint still waiting for its first sample is neither the
+        # fastest nor the slowest: weigh it at the pool's mean.
+        samples = [state.ewma_ms for state in states if state.ewma_ms is not None]
+        prior = sum(samples) / len(samples) if samples else _EWMA_PRIOR_WITHOUT_SAMPLES_MS
+
+        def _cost(state: _Endpoint) -> tuple[float, int]:
+            ewma_ms = prior if state.ewma_ms is None else state.ewma_ms
+            return ewma_ms * (state.in_flight + 1), state.requests
+
+        return min(choices, key=_cost)
+
+    def _succeeded(self, state: _Endpoint, latency_ms: float | None) -> None:
+        state.consecutive_failures = 0
+        if latency_ms is not None:
+            decay = self._options.ewma_decay
+            state.ewma_ms = (
+                latency_ms
+                if state.ewma_ms is None
+                else decay * latency_ms + (1 - decay) * state.ewma_ms
+            )
+        self._readmit(state)
+
+    def _failed(self, state: _Endpoint, *, trial: bool) -> None:
+        state.failures += 1
+        state.consecutive_failures += 1
+        if trial or state.consecutive_failures >= self._options.eject_after_failures:
+            self._eject(state)
+
+    def _eject(self, state: _Endpoint) -> None:
+        state.ejections += 1
+        duration = self._options.ejection_s * 2 ** (state.ejections - 1)
+        state.ejected_until = self._clock() + min(duration, self._options.max_ejection_s)
+        state.consecutive_failures = 0
+
+    def _readmit(self, state: _Endpoint) -> None:
+        state.ejected_until = None
+        state.ejections = 0
+
+    def _wake(self) -> None:
+        self._available.notify_all()
+        while self._async_waiters:
+            loop, waiter = self._async_waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:
+                pass  # The waiter's event loop is closed.
+
+
+class EndpointPoolRegistry:
+    """One :class:`EndpointPool` per (provider, endpoint list), all
+    created with the same :class:`EndpointPoolOptions`."""
+
+    def __init__(self, options: EndpointPoolOptions | None = None) -> None:
+        self._options = options or EndpointPoolOptions()
+        self._pools: dict[tuple[str, tuple[str, ...]], EndpointPool] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def options(self) -> EndpointPoolOptions:
+        return self._options
+
+    def pool(
+        self,
+        provider: str,
+        endpoints: Sequence[str],
+        *,
+        probe: Callable[[str], bool] | None = None,
+    ) -> EndpointPool:
+        key = (provider, tuple(endpoints))
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = EndpointPool(provider, endpoints, self._options, probe=probe)
+                self._pools[key] = pool
+            return pool
+
+    def stats(self) -> list[EndpointStats]:
+        with self._lock:
+            pools = list(self._pools.values())
+        return [stats for pool in pools for stats in pool.stats()]
+
+
+_registry: EndpointPoolRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def endpoint_pools() -> EndpointPoolRegistry:
+    """The process-wide registry, with default options until
+    configured."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = EndpointPoolRegistry()
+        return _registry
+
+
+def configure_endpoint_pools(options: EndpointPoolOptions) -> EndpointPoolRegistry:
+    """Replace the process-wide registry with one using ``options``.
+    Providers that already leased from a pool keep the old one."""
+    global _registry
+    with _registry_lock:
+        _registry = EndpointPoolRegistry(options)
+        return _registry
+
+
+def split_endpoints(value: str) -> tuple[str, ...]:
+    """The endpoints of a comma-separated list, trailing slashes and
+    duplicates dropped, in order."""
+    endpoints: list[str] = []
+    for item in value.split(ENDPOINT_LIST_SEPARATOR):
+        endpoint = item.strip().rstrip("/")
+        if endpoint and endpoint not in endpoints:
+            endpoints.append(endpoint)
+    return tuple(endpoints)
+
+
+def is_endpoint_failure(exc: Exception) -> bool:
+    """``True`` when ``exc`` says the endpoint is down or overloaded:
+    a connection error or timeout, or an SDK error carrying HTTP 5xx or
+    429. Other HTTP errors are the request's fault."""
+    status = getattr(exc, "status_code", None)
+    if isinstance(status, int):
+        return status >= _HTTP_SERVER_ERROR or status == HTTP_TOO_MANY_REQUESTS
+    if isinstance(exc, (OSError, TimeoutError)):
+        return True
+    return any(cls.__name__ in _TRANSPORT_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+def http_probe(path: str, *, timeout_s: float = DEFAULT_PROBE_TIMEOUT_S) -> Callable[[str], bool]:
+    """A health probe that sends ``GET <endpoint><path>``. Any reply
+    below HTTP 500 passes: an endpoint that answers 401 is up."""
+
+    def _probe(endpoint: str) -> bool:
+        import httpx
+
+        try:
+            response = httpx.get(endpoint + path, timeout=timeout_s)
+        except httpx.HTTPError:
+            return False
+        return response.status_code < _HTTP_SERVER_ERROR
+
+    return _probe
+
+
+def _resolve(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+__all__ = [
+    "DEFAULT_EJECTION_S",
+    "DEFAULT_EJECT_AFTER_FAILURES",
+    "DEFAULT_EWMA_DECAY",
+    "DEFAULT_MAX_EJECTION_S",
+    "DEFAULT_PROBE_TIMEOUT_S",
+    "ENDPOINT_LIST_SEPARATOR",
+    "STRATEGIES",
+    "STRATEGY_EWMA",
+    "STRATEGY_LEAST_OUTSTANDING",
+    "EndpointPool",
+    "EndpointPoolOptions",
+    "EndpointPoolRegistry",
+    "EndpointStats",
+    "configure_endpoint_pools",
+    "endpoint_pools",
+    "http_probe",
+    "is_endpoint_failure",
+    "split_endpoints",
+]
@@ -0,0 +1,230 @@
+"""Per-call deadlines and hedged requests for :class:`ProviderRouter`.
+
+Cloud LLM latency has a long tail: most calls return in about a second,
+but a few take twenty. Over thousands of calls, every run hits the
+tail. :func:`run_hedged` / :func:`arun_hedged` race the attempts of
+one router call:
+
+- The primary attempt starts at once.
+- When a :class:`HedgePolicy` is set and the primary has not returned
+  after the provider's observed latency quantile
+  (:class:`LatencyWindow`), a duplicate starts. It goes to the same
+  provider or to the policy's secondary provider.
+- The first attempt to finish decides, success or error alike, so
+  hard errors still fail fast. The other attempt is cancelled where
+  possible: a coroutine is cancelled, a worker-thread call that has
+  not started is dropped. An attempt that cannot be stopped runs to
+  completion, and its result goes to ``on_late`` so the router can
+  record the usage.
+- With a deadline, the call raises :class:`ProviderDeadlineExceeded`
+  once the deadline passes. Attempts still running are handled like
+  losers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Final, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# Hedge once the primary is slower than 95% of recent calls: about one
+# call in twenty is duplicated.
+DEFAULT_HEDGE_QUANTILE: Final = 0.95
+
+# Recent latencies kept per provider, and how many are needed before
+# the quantile is trusted enough to hedge on.
+DEFAULT_LATENCY_WINDOW: Final = 200
+DEFAULT_MIN_SAMPLES: Final = 20
+
+# Never hedge sooner than this, however fast the provider usually is.
+DEFAULT_MIN_HEDGE_DELAY_S: Final = 0.1
+
+T = TypeVar("T")
+
+
+class ProviderDeadlineExceeded(TimeoutError):
+    """A router call did not finish within its deadline."""
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When, and where, :class:`ProviderRouter` sends a duplicate
+    call."""
+
+    quantile: float = DEFAULT_HEDGE_QUANTILE
+    """Latency quantile of the provider's recent calls after which a
+    still-running call is hedged."""
+
+    min_samples: int = DEFAULT_MIN_SAMPLES
+    """Calls observed before hedging starts."""
+
+    window: int = DEFAULT_LATENCY_WINDOW
+    """Recent calls the quantile is computed over."""
+
+    min_delay_s: float = DEFAULT_MIN_HEDGE_DELAY_S
+
+    secondary_provider: str | None = None
+    """Provider id the duplicate goes to; ``None`` (or a provider that
+    does not support the pair) sends it to the same provider."""
+
+    def __post_init__(self) -> None:
+        if not 0 < self.quantile < 1:
+            raise ValueError(f"quantile must be between 0 and 1, got {self.quantile}.")
+        if self.min_samples < 1:
+            raise ValueError(f"min_samples must be >= 1, got {self.min_samples}.")
+        if self.window < self.min_samples:
+            raise ValueError(
+                f"window must be >= min_samples ({self.min_samples}), got {self.window}."
+            )
+        if self.min_delay_s < 0:
+            raise ValueError(f"min_delay_s must be >= 0, got {self.min_delay_s}.")
+
+
+class LatencyWindow:
+    """Thread-safe window of one provider's recent call latencies."""
+
+    def __init__(self, size: int = DEFAULT_LATENCY_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def quantile(self, q: float, *, min_samples: int = 1) -> float | None:
+        """Nearest-rank ``q`` quantile, or ``None`` with fewer than
+        ``min_samples`` observations."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples or len(samples) < min_samples:
+            return None
+        return samples[min(len(samples) - 1, math.ceil(q * len(samples)) - 1)]
+
+
+def run_hedged(
+    executor: Executor,
+    primary: Callable[[], T],
+    *,
+    hedge: Callable[[], T] | None = None,
+    hedge_after_s: float | None = None,
+    deadline_s: float | None = None,
+    on_late: Callable[[T], None],
+) -> T:
+    """Race ``primary`` (and, after ``hedge_after_s``, ``hedge``) on
+    ``executor`` and return the first to finish. Raises that attempt's
+    exception, or :class:`ProviderDeadlineExceeded` after
+    ``deadline_s``."""
+    started = time.monotonic()
+    futures: list[Future[T]] = [executor.submit(primary)]
+    hedge_at = None if hedge is None or hedge_after_s is None else started + hedge_after_s
+    deadline_at = None if deadline_s is None else started + deadline_s
+    while True:
+        now = time.monotonic()
+        timeouts = [at - now for at in (hedge_at, deadline_at) if at is not None]
+        done, _ = wait(
+            futures,
+            timeout=max(0.0, min(timeouts)) if timeouts else None,
+            return_when=FIRST_COMPLETED,
+        )
+        if done:
+            winner = next(future for future in futures if future in done)
+            for future in futures:
+                if future is not winner:
+                    _settle_late(future, on_late)
+            return winner.result()
+        now = time.monotonic()
+        if deadline_at is not None and now >= deadline_at:
+            for future in futures:
+                _settle_late(future, on_late)
+            raise ProviderDeadlineExceeded(f"Provider call exceeded its {deadline_s:g}s deadline.")
+        if hedge is not None and hedge_at is not None and now >= hedge_at:
+            logger.debug("Provider call still running after %.2fs; hedging.", hedge_after_s)
+            futures.append(executor.submit(hedge))
+            hedge_at = None
+
+
+async def arun_hedged(
+    primary: Callable[[], Awaitable[T]],
+    *,
+    hedge: Callable[[], Awaitable[T]] | None = None,
+    hedge_after_s: float | None = None,
+    deadline_s: float | None = None,
+    on_late: Callable[[T], None],
+) -> T:
+    """Coroutine form of :func:`run_hedged`. Losing attempts are
+    cancelled; one that finished alongside the winner goes to
+    ``on_late``."""
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    tasks: list[asyncio.Task[T]] = [asyncio.ensure_future(primary())]
+    hedge_at = None if hedge is None or hedge_after_s is None else started + hedge_after_s
+    deadline_at = None if deadline_s is None else started + deadline_s
+    try:
+        while True:
+            now = loop.time()
+            timeouts = [at - now for at in (hedge_at, deadline_at) if at is not None]
+            done, _ = await asyncio.wait(
+                tasks,
+                timeout=max(0.0, min(timeouts)) if timeouts else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if done:
+                winner = next(task for task in tasks if task in done)
+                for task in tasks:
+                    if task is not winner and task.done() and not task.cancelled():
+                        if task.exception() is None:
+                            on_late(task.result())
+                return winner.result()
+            now = loop.time()
+            if deadline_at is not None and now >= deadline_at:
+                raise ProviderDeadlineExceeded(
+                    f"Provider call exceeded its {deadline_s:g}s deadline."
+                )
+            if hedge is not None and hedge_at is not None and now >= hedge_at:
+                logger.debug("Provider call still running after %.2fs; hedging.", hedge_after_s)
+                tasks.append(asyncio.ensure_future(hedge()))
+                hedge_at = None
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
+
+def _settle_late(future: Future[T], on_late: Callable[[T], None]) -> None:
+    """Drop a losing attempt that has not started; otherwise hand its
+    result to ``on_late`` when it finishes."""
+    if future.cancel():
+        return
+
+    def _done(finished: Future[T]) -> None:
+        if finished.cancelled() or finished.exception() is not None:
+            return
+        try:
+            on_late(finished.result())
+        except Exception:  # A late record must not crash a worker thread.
+            logger.warning("Could not record a losing provider call.", exc_info=True)
+
+    future.add_done_callback(_done)
+
+
+__all__ = [
+    "DEFAULT_HEDGE_QUANTILE",
+    "DEFAULT_LATENCY_WINDOW",
+    "DEFAULT_MIN_HEDGE_DELAY_S",
+    "DEFAULT_MIN_SAMPLES",
+    "HedgePolicy",
+    "LatencyWindow",
+    "ProviderDeadlineExceeded",
+    "arun_hedged",
+    "run_hedged",
+]
@@ -0,0 +1,494 @@
+"""Process-wide registry of pooled HTTP clients for the LLM providers.
+
+Each OpenAI / Anthropic / Ollama provider builds its SDK client lazily.
+Left to themselves, every provider instance (one per router in the
+daemon, one per CLI run, one per Flask request) would open its own
+connection pool with the SDK's default limits and timeouts. The
+:class:`ClientRegistry` hands out one SDK client per (provider,
+endpoint, credential) instead. All the SDK clients for a (provider,
+endpoint) share one transport, tuned by :class:`HttpTransportOptions`:
+
+- connection-pool size and keep-alive pool size / expiry;
+- connect, read and pool-wait timeouts;
+- HTTP/2 when the optional ``h2`` package is installed.
+
+The transports are metered. :meth:`ClientRegistry.stats` reports the
+requests sent, the requests in flight (and the peak) and the open
+connections per pool, so a saturated pool shows up as utilization
+near 1.0.
+
+The SDKs do not all ship the same HTTP library: Ollama uses ``httpx``
+and recent OpenAI / Anthropic SDKs use its ``httpx2`` fork, with the
+same API. The registry is handed the SDK's client class (or, for
+Ollama, the module) and builds its transports from that module.
+
+httpx async pools are bound to the event loop that opened their
+connections. Async clients are therefore shared per running loop and
+dropped with it; the meters are shared across loops.
+
+:func:`client_registry` returns the process-wide registry that the
+providers' ``_client`` modules use. :func:`configure_client_registry`
+replaces it, e.g. from CLI flags before the first provider call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import importlib.util
+import threading
+import weakref
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Any, AsyncIterator, Callable, Final, Iterator, TypeVar
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# Connections per (provider, endpoint) pool. The daemon and the
+# router's async fan-out issue tens of concurrent calls at most.
+DEFAULT_MAX_CONNECTIONS: Final = 32
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS: Final = 16
+
+# Idle keep-alive connections are closed after this long. Below the
+# ~60s idle timeout of the common API load balancers, so the pool
+# rarely hands out a connection the server already dropped.
+DEFAULT_KEEPALIVE_EXPIRY_S: Final = 30.0
+
+DEFAULT_CONNECT_TIMEOUT_S: Final = 5.0
+
+# Non-streaming completions send nothing until the whole reply is
+# generated, so the read timeout bounds generation time. 2000 output
+# tokens fit comfortably.
+DEFAULT_READ_TIMEOUT_S: Final = 120.0
+
+# How long a request waits for a free pooled connection.
+DEFAULT_POOL_TIMEOUT_S: Final = 30.0
+
+CLIENT_KIND_SYNC: Final = "sync"
+CLIENT_KIND_ASYNC: Final = "async"
+
+# Optional package httpx needs for HTTP/2.
+_HTTP2_MODULE: Final = "h2"
+
+# Hex digits of the credential digest kept in registry keys; the key
+# itself is never stored.
+_CREDENTIAL_DIGEST_CHARS: Final = 16
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HttpTransportOptions:
+    """Pool limits and timeouts for the shared provider transports."""
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    """Open connections per (provider, endpoint) pool."""
+
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    """Idle connections kept open for reuse."""
+
+    keepalive_expiry_s: float = DEFAULT_KEEPALIVE_EXPIRY_S
+    connect_timeout_s: float = DEFAULT_CONNECT_TIMEOUT_S
+    read_timeout_s: float = DEFAULT_READ_TIMEOUT_S
+    pool_timeout_s: float = DEFAULT_POOL_TIMEOUT_S
+
+    http2: bool | None = None
+    """``None`` enables HTTP/2 when ``h2`` is importable. ``True``
+    without ``h2`` installed fails on the first request."""
+
+    def __post_init__(self) -> None:
+        if self.max_connections < 1:
+            raise ValueError(f"max_connections must be >= 1, got {self.max_connections}.")
+        if not 0 <= self.max_keepalive_connections <= self.max_connections:
+            raise ValueError(
+                "max_keepalive_connections must be between 0 and max_connections "
+                f"({self.max_connections}), got {self.max_keepalive_connections}."
+            )
+        for name in ("keepalive_expiry_s", "connect_timeout_s", "read_timeout_s", "pool_timeout_s"):
+            if getattr(self, name) <= 0:
+                raise ValueError(f"{name} must be > 0, got {getattr(self, name)}.")
+
+    @property
+    def use_http2(self) -> bool:
+        if self.http2 is not None:
+            return self.http2
+        return importlib.util.find_spec(_HTTP2_MODULE) is not None
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of one metered (provider, endpoint, kind) pool."""
+
+    provider: str
+    endpoint: str
+    kind: str
+    """:data:`CLIENT_KIND_SYNC` or :data:`CLIENT_KIND_ASYNC`."""
+
+    max_connections: int
+    requests: int
+    """Requests sent since the pool was created."""
+
+    in_flight: int
+    """Requests sent whose response body is not yet closed."""
+
+    peak_in_flight: int
+    open_connections: int
+    """Connections currently held by the pool (busy or idle). For
+    async pools, summed over the live event loops."""
+
+    @property
+    def utilization(self) -> float:
+        """``in_flight / max_connections``; near 1.0 means callers are
+        queuing for connections."""
+        return self.in_flight / self.max_connections
+
+
+class _PoolMeter:
+    """Request counters for one (provider, endpoint, kind)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.transports: weakref.WeakSet[Any] = weakref.WeakSet()
+
+    def started(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+    def finished(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def open_connections(self) -> int:
+        total = 0
+        for transport in list(self.transports):
+            pool = getattr(transport.inner, "_pool", None)
+            total += len(getattr(pool, "connections", ()))
+        return total
+
+
+def _metered_transport_classes(http: ModuleType) -> tuple[type[Any], type[Any]]:
+    """Metered (sync, async) transport classes for the httpx-compatible
+    module ``http``. The response streams must subclass that module's
+    own stream types, so the classes are built per module."""
+
+    class _MeteredStream(http.SyncByteStream):  # type: ignore[name-defined,misc]
+        def __init__(self, inner: Any, meter: _PoolMeter) -> None:
+            self._inner = inner
+            self._meter = meter
+            self._closed = False
+
+        def __iter__(self) -> Iterator[bytes]:
+            yield from self._inner
+
+        def close(self) -> None:
+            try:
+                self._inner.close()
+            finally:
+                if not self._closed:
+                    self._closed = True
+                    self._meter.finished()
+
+    class _MeteredAsyncStream(http.AsyncByteStream):  # type: ignore[name-defined,misc]
+        def __init__(self, inner: Any, meter: _PoolMeter) -> None:
+            self._inner = inner
+            self._meter = meter
+            self._closed = False
+
+        async def __aiter__(self) -> AsyncIterator[bytes]:
+            async for chunk in self._inner:
+                yield chunk
+
+        async def aclose(self) -> None:
+            try:
+                await self._inner.aclose()
+            finally:
+                if not self._closed:
+                    self._closed = True
+                    self._meter.finished()
+
+    class _MeteredTransport(http.BaseTransport):  # type: ignore[name-defined,misc]
+        def __init__(self, inner: Any, meter: _PoolMeter) -> None:
+            self.inner = inner
+            self._meter = meter
+            meter.transports.add(self)
+
+        def handle_request(self, request: Any) -> Any:
+            self._meter.started()
+            try:
+                response = self.inner.handle_request(request)
+            except BaseException:
+                self._meter.finished()
+                raise
+            return http.Response(
+                status_code=response.status_code,
+                headers=response.headers,
+                stream=_MeteredStream(response.stream, self._meter),
+                extensions=response.extensions,
+            )
+
+        def close(self) -> None:
+            self.inner.close()
+
+    class _MeteredAsyncTransport(http.AsyncBaseTransport):  # type: ignore[name-defined,misc]
+        def __init__(self, inner: Any, meter: _PoolMeter) -> None:
+            self.inner = inner
+            self._meter = meter
+            meter.transports.add(self)
+
+        async def handle_async_request(self, request: Any) -> Any:
+            self._meter.started()
+            try:
+                response = await self.inner.handle_async_request(request)
+            except BaseException:
+                self._meter.finished()
+                raise
+            return http.Response(
+                status_code=response.status_code,
+                headers=response.headers,
+                stream=_MeteredAsyncStream(response.stream, self._meter),
+                extensions=response.extensions,
+            )
+
+        async def aclose(self) -> None:
+            await self.inner.aclose()
+
+    return _MeteredTransport, _MeteredAsyncTransport
+
+
+_PoolKey = tuple[str, str]
+_ClientKey = tuple[str, str, str]
+
+
+class ClientRegistry:
+    """Shared, metered HTTP transports and SDK clients, keyed by
+    provider id and endpoint. Thread-safe."""
+
+    def __init__(self, options: HttpTransportOptions | None = None) -> None:
+        self._options = options or HttpTransportOptions()
+        self._lock = threading.Lock()
+        self._classes: dict[str, tuple[type[Any], type[Any]]] = {}
+        self._meters: dict[tuple[str, str, str], _PoolMeter] = {}
+        self._transports: dict[_PoolKey, Any] = {}
+        self._clients: dict[_ClientKey, Any] = {}
+        self._async_transports: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[_PoolKey, Any]
+        ] = weakref.WeakKeyDictionary()
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[_ClientKey, Any]
+        ] = weakref.WeakKeyDictionary()
+
+    @property
+    def options(self) -> HttpTransportOptions:
+        return self._options
+
+    def transport(self, provider: str, endpoint: str, http: ModuleType) -> Any:
+        """The shared sync transport for ``(provider, endpoint)``, an
+        ``http.BaseTransport``."""
+        with self._lock:
+            transport = self._transports.get((provider, endpoint))
+            if transport is None:
+                sync_cls, _ = self._transport_classes(http)
+                transport = sync_cls(
+                    http.HTTPTransport(limits=self._limits(http), http2=self._options.use_http2),
+                    self._meter(provider, endpoint, CLIENT_KIND_SYNC),
+                )
+                self._transports[(provider, endpoint)] = transport
+            return transport
+
+    def async_transport(self, provider: str, endpoint: str, http: ModuleType) -> Any:
+        """The async transport for ``(provider, endpoint)`` on the
+        running event loop. Outside a loop a fresh, unshared (but still
+        metered) transport is returned."""
+        loop = _running_loop()
+        with self._lock:
+            by_key = self._async_transports.setdefault(loop, {}) if loop is not None else {}
+            transport = by_key.get((provider, endpoint))
+            if transport is None:
+                _, async_cls = self._transport_classes(http)
+                transport = async_cls(
+                    http.AsyncHTTPTransport(
+                        limits=self._limits(http), http2=self._options.use_http2
+                    ),
+                    self._meter(provider, endpoint, CLIENT_KIND_ASYNC),
+                )
+                by_key[(provider, endpoint)] = transport
+            return transport
+
+    def timeout(self, http: ModuleType, *, bounded_read: bool = True) -> Any:
+        """The request timeout as an ``http.Timeout``.
+        ``bounded_read=False`` drops the read limit, for local daemons
+        whose first call may load a model."""
+        return http.Timeout(
+            connect=self._options.connect_timeout_s,
+            read=self._options.read_timeout_s if bounded_read else None,
+            write=self._options.read_timeout_s,
+            pool=self._options.pool_timeout_s,
+        )
+
+    def http_client(self, provider: str, endpoint: str, client_cls: Callable[..., T]) -> T:
+        """A new SDK HTTP client (e.g. ``openai.DefaultHttpxClient``)
+        over the shared sync transport, with the registry's timeouts.
+        Hand it to an SDK client built inside :meth:`client`."""
+        http = _http_module(client_cls)
+        return client_cls(
+            transport=self.transport(provider, endpoint, http), timeout=self.timeout(http)
+        )
+
+    def async_http_client(self, provider: str, endpoint: str, client_cls: Callable[..., T]) -> T:
+        """:meth:`http_client` for the async transport (e.g.
+        ``openai.DefaultAsyncHttpxClient``)."""
+        http = _http_module(client_cls)
+        return client_cls(
+            transport=self.async_transport(provider, endpoint, http), timeout=self.timeout(http)
+        )
+
+    def client(self, provider: str, endpoint: str, credential: str, build: Callable[[], T]) -> T:
+        """The shared sync SDK client for ``(provider, endpoint,
+        credential)``, built with ``build()`` on first use. Only a
+        digest of ``credential`` is kept."""
+        key = (provider, endpoint, _digest(credential))
+        with self._lock:
+            existing = self._clients.get(key)
+        if existing is not None:
+            return existing  # type: ignore[no-any-return]
+        # Built outside the lock: ``build`` calls back into transport().
+        # Two racing first calls both build; the loser's client is
+        # dropped, and it shares the same transport anyway.
+        built = build()
+        with self._lock:
+            return self._clients.setdefault(key, built)  # type: ignore[no-any-return]
+
+    def async_client(
+        self, provider: str, endpoint: str, credential: str, build: Callable[[], T]
+    ) -> T:
+        """:meth:`client` for async SDK clients, shared per running
+        event loop. Outside a loop ``build()`` runs every time."""
+        loop = _running_loop()
+        if loop is None:
+            return build()
+        key = (provider, endpoint, _digest(credential))
+        with self._lock:
+            existing = self._async_clients.get(loop, {}).get(key)
+        if existing is not None:
+            return existing  # type: ignore[no-any-return]
+        built = build()
+        with self._lock:
+            by_key = self._async_clients.setdefault(loop, {})
+            return by_key.setdefault(key, built)  # type: ignore[no-any-return]
+
+    def stats(self) -> tuple[PoolStats, ...]:
+        """One :class:`PoolStats` per pool, sorted by provider,
+        endpoint and kind."""
+        with self._lock:
+            meters = sorted(self._meters.items(), key=lambda item: item[0])
+        return tuple(
+            PoolStats(
+                provider=provider,
+                endpoint=endpoint,
+                kind=kind,
+                max_connections=self._options.max_connections,
+                requests=meter.requests,
+                in_flight=meter.in_flight,
+                peak_in_flight=meter.peak_in_flight,
+                open_connections=meter.open_connections(),
+            )
+            for (provider, endpoint, kind), meter in meters
+        )
+
+    def close(self) -> None:
+        """Close the sync pools and forget every client. Async pools
+        close with their event loops."""
+        with self._lock:
+            transports = list(self._transports.values())
+            self._transports.clear()
+            self._clients.clear()
+            self._async_transports.clear()
+            self._async_clients.clear()
+        for transport in transports:
+            transport.close()
+
+    def _limits(self, http: ModuleType) -> Any:
+        return http.Limits(
+            max_connections=self._options.max_connections,
+            max_keepalive_connections=self._options.max_keepalive_connections,
+            keepalive_expiry=self._options.keepalive_expiry_s,
+        )
+
+    def _transport_classes(self, http: ModuleType) -> tuple[type[Any], type[Any]]:
+        """Caller holds the lock."""
+        classes = self._classes.get(http.__name__)
+        if classes is None:
+            classes = _metered_transport_classes(http)
+            self._classes[http.__name__] = classes
+        return classes
+
+    def _meter(self, provider: str, endpoint: str, kind: str) -> _PoolMeter:
+        """Caller holds the lock."""
+        return self._meters.setdefault((provider, endpoint, kind), _PoolMeter())
+
+
+_registry: ClientRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def client_registry() -> ClientRegistry:
+    """The process-wide registry, created with default options on
+    first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ClientRegistry()
+        return _registry
+
+
+def configure_client_registry(options: HttpTransportOptions) -> ClientRegistry:
+    """Replace the process-wide registry with one using ``options``.
+    Clients already handed out keep their old pools; call this before
+    the first provider request."""
+    global _registry
+    with _registry_lock:
+        _registry = ClientRegistry(options)
+        return _registry
+
+
+def _http_module(client_cls: Callable[..., Any]) -> ModuleType:
+    """The httpx-compatible top-level module ``client_cls`` (an SDK's
+    ``DefaultHttpxClient`` or a plain ``httpx.Client``) is built on."""
+    for base in getattr(client_cls, "__mro__", ()):
+        if base.__name__ in ("Client", "AsyncClient"):
+            return importlib.import_module(base.__module__.partition(".")[0])
+    raise TypeError(f"{client_cls!r} is not an httpx-style client class.")
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _digest(credential: str) -> str:
+    return hashlib.sha256(credential.encode("utf-8")).hexdigest()[:_CREDENTIAL_DIGEST_CHARS]
+
+
+__all__ = [
+    "CLIENT_KIND_ASYNC",
+    "CLIENT_KIND_SYNC",
+    "DEFAULT_CONNECT_TIMEOUT_S",
+    "DEFAULT_KEEPALIVE_EXPIRY_S",
+    "DEFAULT_MAX_CONNECTIONS",
+    "DEFAULT_MAX_KEEPALIVE_CONNECTIONS",
+    "DEFAULT_POOL_TIMEOUT_S",
+    "DEFAULT_READ_TIMEOUT_S",
+    "ClientRegistry",
+    "HttpTransportOptions",
+    "PoolStats",
+    "client_registry",
+    "configure_client_registry",
+]
@@ -23,6 +23,9 @@ PROVIDER_ID_OLLAMA: Final = "ollama"
 # and the manual-edit identifier the validator CLI uses.
 PROVIDER_ID_NOOP: Final = "noop"
 PROVIDER_ID_MANUAL: Final = "manual"
+# Names the pipeline's passthrough stage on segments it copied from
+# the source without a provider call.
+PROVIDER_ID_PASSTHROUGH: Final = "passthrough"
 
 
 __all__ = [
@@ -33,4 +36,5 @@ __all__ = [
     "PROVIDER_ID_OLLAMA",
     "PROVIDER_ID_NOOP",
     "PROVIDER_ID_MANUAL",
+    "PROVIDER_ID_PASSTHROUGH",
 ]
@@ -0,0 +1,187 @@
+"""CPU execution options for the local seq2seq providers (NLLB, OPUS).
+
+Both HF models load in fp32 with torch's default threading, which is
+slow and memory-hungry on GPU-less build agents. :class:`LocalModelOptions`
+bundles the knobs that matter there:
+
+- **Dynamic int8 quantization** of every ``nn.Linear`` (weights stored
+  as int8, activations quantized on the fly). Roughly quarters the
+  linear-layer memory and speeds up CPU matmuls; quality drift on
+  short UI strings is small — measure it with
+  ``tests/benchmarks/test_local_model_options_benchmark.py``.
+- **bfloat16 weights** on CPUs with native bf16 support (AVX512-BF16 /
+  AMX). Elsewhere the request is logged and the model stays fp32,
+  because emulated bf16 is slower than fp32.
+- **Thread counts** for torch's intra-op and inter-op pools. Both are
+  process-wide torch settings; the inter-op pool can only be sized
+  once, before any parallel work runs.
+- **Beam width** for ``generate``: ``1`` is greedy decoding (fastest),
+  ``None`` keeps the checkpoint's own default.
+- **Resident-model caps** for OPUS, which loads one checkpoint per
+  target language: at most N models and/or B bytes of weights stay
+  loaded, least recently used first out, except pinned target
+  languages.
+
+The holders (:class:`~ainemo.providers.nllb._client.NllbModelHolder`,
+:class:`~ainemo.providers.opus._client.MarianModelCache`) apply the
+load-time options; the providers pass :meth:`LocalModelOptions.generate_kwargs`
+to every ``generate`` call.
+"""
+
+from __future__ import annotations
+
+import logging
+import warnings
+from dataclasses import dataclass
+from typing import Any, Final
+
+logger = logging.getLogger(__name__)
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+DTYPE_FLOAT32: Final = "float32"
+DTYPE_BFLOAT16: Final = "bfloat16"
+LOCAL_DTYPES: Final = (DTYPE_FLOAT32, DTYPE_BFLOAT16)
+
+# ``generate`` kwarg for the beam width.
+_GENERATE_KWARG_NUM_BEAMS: Final = "num_beams"
+
+
+@dataclass(frozen=True, kw_only=True)
+class LocalModelOptions:
+    """How a local seq2seq model is loaded and decoded on CPU.
+
+    The defaults reproduce the historical behavior: fp32 weights,
+    torch's own thread counts and the checkpoint's decoding settings.
+    """
+
+    quantize_int8: bool = False
+    """Apply dynamic int8 quantization to every ``nn.Linear`` at load."""
+
+    dtype: str = DTYPE_FLOAT32
+    """Weight dtype, one of :data:`LOCAL_DTYPES`. ``bfloat16`` falls back
+    to fp32 (with a warning) when the CPU lacks native bf16."""
+
+    num_threads: int | None = None
+    """``torch.set_num_threads`` — intra-op parallelism. ``None`` keeps
+    torch's default (one thread per physical core)."""
+
+    num_interop_threads: int | None = None
+    """``torch.set_num_interop_threads`` — inter-op parallelism."""
+
+    num_beams: int | None = None
+    """Beam width for ``generate``; ``1`` is greedy decoding."""
+
+    max_models: int | None = None
+    """OPUS: keep at most this many models loaded (LRU). ``None`` keeps
+    every model loaded for the process lifetime."""
+
+    max_model_bytes: int | None = None
+    """OPUS: evict least-recently-used models while the loaded weights
+    exceed this many bytes."""
+
+    pinned_target_langs: tuple[str, ...] = ()
+    """OPUS: target languages whose models are never evicted."""
+
+    def __post_init__(self) -> None:
+        if self.dtype not in LOCAL_DTYPES:
+            raise ValueError(f"dtype must be one of {LOCAL_DTYPES}, got {self.dtype!r}.")
+        if self.quantize_int8 and self.dtype != DTYPE_FLOAT32:
+            raise ValueError(
+                "int8 dynamic quantization starts from fp32 weights; "
+                f"it cannot be combined with dtype={self.dtype!r}."
+            )
+        for name in (
+            "num_threads",
+            "num_interop_threads",
+            "num_beams",
+            "max_models",
+            "max_model_bytes",
+        ):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} must be >= 1, got {value}.")
+
+    def generate_kwargs(self) -> dict[str, Any]:
+        """Decoding kwargs to merge into every ``generate`` call."""
+        if self.num_beams is None:
+            return {}
+        return {_GENERATE_KWARG_NUM_BEAMS: self.num_beams}
+
+
+# The inter-op pool size torch was given, if we set it. torch raises on
+# a second ``set_num_interop_threads``, so later different requests are
+# logged and ignored instead.
+_interop_threads_applied: int | None = None
+
+
+def apply_thread_settings(options: LocalModelOptions) -> None:
+    """Apply the options' torch thread counts (process-wide)."""
+    global _interop_threads_applied
+    if options.num_threads is None and options.num_interop_threads is None:
+        return
+    import torch
+
+    if options.num_threads is not None:
+        torch.set_num_threads(options.num_threads)
+    requested = options.num_interop_threads
+    if requested is None or requested == _interop_threads_applied:
+        return
+    try:
+        torch.set_num_interop_threads(requested)
+    except RuntimeError:
+        logger.warning(
+            "torch inter-op threads are already fixed at %d for this process; "
+            "ignoring the request for %d.",
+            torch.get_num_interop_threads(),
+            requested,
+        )
+        return
+    _interop_threads_applied = requested
+
+
+def cpu_supports_bf16() -> bool:
+    """``True`` when this CPU runs bf16 matmuls natively."""
+    import torch
+
+    try:
+        return bool(torch.ops.mkldnn._is_mkldnn_bf16_supported())
+    except (AttributeError, RuntimeError):
+        return False
+
+
+def prepare_model(model: Any, options: LocalModelOptions) -> Any:
+    """Return ``model`` in eval mode with the load-time options applied.
+
+    Quantization returns a new module; the bf16 cast converts in place.
+    """
+    import torch
+
+    model = model.eval()
+    if options.quantize_int8:
+        # torch marks its eager-mode quantization API deprecated in
+        # favor of the separate ``torchao`` package, but it is still the
+        # in-tree way to quantize on CPU without another dependency.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            warnings.simplefilter("ignore", UserWarning)
+            from torch.ao.quantization import quantize_dynamic
+
+            quantize: Any = quantize_dynamic  # Untyped in torch's stubs.
+            return quantize(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if options.dtype == DTYPE_BFLOAT16:
+        if cpu_supports_bf16():
+            return model.to(torch.bfloat16)
+        logger.warning("CPU has no native bfloat16 support; keeping float32 weights.")
+    return model
+
+
+__all__ = [
+    "DTYPE_BFLOAT16",
+    "DTYPE_FLOAT32",
+    "LOCAL_DTYPES",
+    "LocalModelOptions",
+    "apply_thread_settings",
+    "cpu_supports_bf16",
+    "prepare_model",
+]
@@ -0,0 +1,419 @@
+"""Multi-segment request packing for the LLM providers.
+
+OpenAI, Anthropic and Ollama translate one segment per chat request,
+and every request repeats the system prompt plus any persona /
+glossary addendum. For short UI strings that prompt is several times
+the payload. With a ``pack_size`` above 1 the providers' batch path
+sends up to ``pack_size`` segments in one request instead:
+
+1. The segments go out as a JSON array of ``{"id", "text"}`` items,
+   where ``id`` is the segment's position in the pack.
+2. The model replies with a JSON array of ``{"id", "text"}`` items.
+   :func:`decode_pack` checks the ids and the types and drops bad
+   entries. An id that appears twice, or is unknown, is treated as
+   missing.
+3. Segments without a valid entry are retried with the provider's
+   single-segment ``translate``. A pack never fails as a whole because
+   of one bad item.
+4. The pack's token usage is apportioned across its segments. Input
+   tokens are split in proportion to source length and output tokens
+   in proportion to translation length. The split uses largest
+   remainders, so the per-segment UsageLog records sum exactly to what
+   the API reported. A segment that needed a retry carries its pack
+   share plus its own retry call. Prompt-cache read / write counts
+   are part of the input and are split the same way.
+
+Segments with different source languages never share a pack, because
+the prompt names one source language.
+
+A packed reply is as long as all of its translations together, so the
+single-segment ``max_tokens`` would truncate a large pack and send every
+segment in it to the fallback. :func:`pack_max_tokens` scales the limit
+with the pack's source length times its language count, capped at the
+model's output limit.
+
+:func:`translate_multi_in_packs` is the multi-target variant. Each pack
+asks for every target language at once, and each reply item carries a
+``translations`` object keyed by language tag. Validation, fallback and
+apportioning then work per (segment, language) cell instead of per
+segment.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Final, Sequence
+
+from ainemo.core.segment import Segment
+from ainemo.providers._usage_log import estimate_tokens_from_chars
+from ainemo.providers.base import ProviderResult, TokenUsage
+
+logger = logging.getLogger(__name__)
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# Segments per packed request. 1 keeps the historical one-request-per-
+# segment behavior; packing is opt-in per provider.
+DEFAULT_PACK_SIZE: Final = 1
+
+PACK_ITEM_ID_KEY: Final = "id"
+PACK_ITEM_TEXT_KEY: Final = "text"
+PACK_ITEM_TRANSLATIONS_KEY: Final = "translations"
+
+# Markdown code fence some models wrap JSON replies in despite the prompt.
+_CODE_FENCE: Final = "```"
+
+# Output budget of a packed reply, per (segment, language) cell: the
+# translation may run this many times the source's tokens (longer
+# target languages, less dense tokenization), plus the JSON item's id,
+# keys, quotes and separators.
+_PACK_OUTPUT_EXPANSION: Final = 3
+_PACK_ITEM_OVERHEAD_TOKENS: Final = 16
+
+
+@dataclass(frozen=True)
+class PackReply:
+    """Raw reply to one packed request."""
+
+    text: str
+    """The model's reply, expected to be the JSON array."""
+
+    usage: TokenUsage
+
+    endpoint: str | None = None
+    """Pooled endpoint that answered; set on every result of the pack."""
+
+
+def encode_pack(segments: Sequence[Segment]) -> str:
+    """The JSON array of ``{"id", "text"}`` items for ``segments``."""
+    return json.dumps(
+        [
+            {PACK_ITEM_ID_KEY: str(i), PACK_ITEM_TEXT_KEY: segment.source_text}
+            for i, segment in enumerate(segments)
+        ],
+        ensure_ascii=False,
+    )
+
+
+def decode_pack(raw: str, count: int) -> dict[int, str]:
+    """Return ``{position: translation}`` for every valid entry in a
+    packed reply to ``count`` items. Anything unparseable yields ``{}``."""
+    found: dict[int, str] = {}
+    duplicates: set[int] = set()
+    for position, item in _reply_items(raw, count):
+        target = item.get(PACK_ITEM_TEXT_KEY)
+        if not isinstance(target, str):
+            continue
+        if position in found:
+            duplicates.add(position)
+        found[position] = target
+    for position in duplicates:
+        del found[position]
+    return found
+
+
+def decode_multi_pack(
+    raw: str, count: int, target_langs: Sequence[str]
+) -> dict[tuple[int, str], str]:
+    """Multi-target :func:`decode_pack`: ``{(position, target_lang):
+    translation}`` for every valid cell. Languages not asked for are
+    ignored; an item whose id appears twice is dropped entirely."""
+    wanted = set(target_langs)
+    found: dict[tuple[int, str], str] = {}
+    seen: set[int] = set()
+    duplicates: set[int] = set()
+    for position, item in _reply_items(raw, count):
+        if position in seen:
+            duplicates.add(position)
+        seen.add(position)
+        translations = item.get(PACK_ITEM_TRANSLATIONS_KEY)
+        if not isinstance(translations, dict):
+            continue
+        for lang, target in translations.items():
+            if lang in wanted and isinstance(target, str):
+                found[(position, lang)] = target
+    return {cell: text for cell, text in found.items() if cell[0] not in duplicates}
+
+
+def apportion(total: int | None, weights: Sequence[int]) -> list[int | None]:
+    """Split ``total`` across ``weights`` (largest-remainder, so the
+    shares sum to ``total``). ``None`` stays ``None``; all-zero weights
+    split evenly."""
+    if total is None:
+        return [None] * len(weights)
+    if not weights:
+        return []
+    weights = [max(w, 0) for w in weights]
+    weight_sum = sum(weights)
+    if weight_sum == 0:
+        weights = [1] * len(weights)
+        weight_sum = len(weights)
+    exact = [total * w / weight_sum for w in weights]
+    shares = [int(e) for e in exact]
+    by_remainder = sorted(range(len(exact)), key=lambda i: exact[i] - shares[i], reverse=True)
+    for i in by_remainder[: total - sum(shares)]:
+        shares[i] += 1
+    return list(shares)
+
+
+def pack_max_tokens(
+    pack: Sequence[Segment],
+    *,
+    lang_count: int = 1,
+    floor: int,
+    limit: int,
+    provider_id: str | None = None,
+) -> int:
+    """``max_tokens`` for a packed request: the expected reply size of
+    ``pack`` in ``lang_count`` languages, at least ``floor`` (the
+    single-segment limit) and at most ``limit`` (the model's)."""
+    per_lang = sum(
+        _PACK_OUTPUT_EXPANSION
+        * estimate_tokens_from_chars(len(segment.source_text), provider_id=provider_id)
+        + _PACK_ITEM_OVERHEAD_TOKENS
+        for segment in pack
+    )
+    return min(limit, max(floor, per_lang * max(lang_count, 1)))
+
+
+def translate_in_packs(
+    segments: Sequence[Segment],
+    *,
+    pack_size: int,
+    send_pack: Callable[[Sequence[Segment]], PackReply],
+    translate_one: Callable[[Segment], ProviderResult],
+    make_result: Callable[[str, TokenUsage, int], ProviderResult],
+) -> list[ProviderResult]:
+    """Translate ``segments`` in packs of ``pack_size``, in input order.
+
+    ``send_pack`` issues one packed request. ``translate_one`` is the
+    single-segment fallback. ``make_result(text, usage, latency_ms)``
+    builds a result and prices it. With
+    ``pack_size`` 1 every segment goes through ``translate_one``.
+    """
+    if pack_size <= 1:
+        return [translate_one(segment) for segment in segments]
+    # One "language" stands in for the target: the cells are segments.
+    lang = ""
+    by_lang = _translate_cells(
+        segments,
+        (lang,),
+        pack_size=pack_size,
+        send_pack=lambda pack, _langs: send_pack(pack),
+        decode=lambda raw, count, _langs: {
+            (position, lang): text for position, text in decode_pack(raw, count).items()
+        },
+        translate_one=lambda segment, _lang: translate_one(segment),
+        make_result=make_result,
+    )
+    return by_lang[lang]
+
+
+def translate_multi_in_packs(
+    segments: Sequence[Segment],
+    target_langs: Sequence[str],
+    *,
+    pack_size: int,
+    send_pack: Callable[[Sequence[Segment], Sequence[str]], PackReply],
+    translate_one: Callable[[Segment, str], ProviderResult],
+    make_result: Callable[[str, TokenUsage, int], ProviderResult],
+) -> dict[str, list[ProviderResult]]:
+    """Translate ``segments`` into every language in ``target_langs``.
+
+    Each request covers up to ``pack_size`` segments (at least one) and
+    all the languages. ``send_pack(pack, target_langs)`` issues it and
+    ``translate_one(segment, target_lang)`` is the per-cell fallback.
+    Returns ``{target_lang: results}``, each list in input order.
+    """
+    return _translate_cells(
+        segments,
+        tuple(target_langs),
+        pack_size=max(pack_size, 1),
+        send_pack=send_pack,
+        decode=decode_multi_pack,
+        translate_one=translate_one,
+        make_result=make_result,
+    )
+
+
+def _translate_cells(
+    segments: Sequence[Segment],
+    target_langs: tuple[str, ...],
+    *,
+    pack_size: int,
+    send_pack: Callable[[Sequence[Segment], Sequence[str]], PackReply],
+    decode: Callable[[str, int, Sequence[str]], dict[tuple[int, str], str]],
+    translate_one: Callable[[Segment, str], ProviderResult],
+    make_result: Callable[[str, TokenUsage, int], ProviderResult],
+) -> dict[str, list[ProviderResult]]:
+    results: dict[tuple[int, str], ProviderResult] = {}
+    by_source_lang: dict[str, list[int]] = {}
+    for index, segment in enumerate(segments):
+        by_source_lang.setdefault(segment.source_lang, []).append(index)
+    for indices in by_source_lang.values():
+        for start in range(0, len(indices), pack_size):
+            pack_indices = indices[start : start + pack_size]
+            pack = [segments[i] for i in pack_indices]
+            started = time.perf_counter()
+            reply = send_pack(pack, target_langs)
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            pack_results = _split_reply(
+                pack,
+                target_langs,
+                reply,
+                decode(reply.text, len(pack), target_langs),
+                elapsed_ms,
+                translate_one=translate_one,
+                make_result=make_result,
+            )
+            for (position, lang), result in pack_results.items():
+                results[(pack_indices[position], lang)] = result
+    return {
+        lang: [results[(index, lang)] for index in range(len(segments))] for lang in target_langs
+    }
+
+
+def _split_reply(
+    pack: Sequence[Segment],
+    target_langs: tuple[str, ...],
+    reply: PackReply,
+    translations: dict[tuple[int, str], str],
+    elapsed_ms: int,
+    *,
+    translate_one: Callable[[Segment, str], ProviderResult],
+    make_result: Callable[[str, TokenUsage, int], ProviderResult],
+) -> dict[tuple[int, str], ProviderResult]:
+    """One result per (position, language) cell of a pack, falling back
+    to ``translate_one`` for cells the reply did not cover."""
+    cells = [(position, lang) for position in range(len(pack)) for lang in target_langs]
+    input_weights = [len(pack[position].source_text) for position, _ in cells]
+    # Output tokens went to the entries the model produced; with none
+    # usable, charge them by source length like the input.
+    output_weights = (
+        [len(translations.get(cell, "")) for cell in cells] if translations else input_weights
+    )
+    shares = _apportion_usage(reply.usage, input_weights, output_weights)
+    latency_share = elapsed_ms // len(cells)
+
+    missing = len(cells) - len(translations)
+    if missing:
+        logger.warning(
+            "%d of %d packed translation(s) missing or malformed in the reply; "
+            "translating them one by one.",
+            missing,
+            len(cells),
+        )
+    results: dict[tuple[int, str], ProviderResult] = {}
+    for i, (position, lang) in enumerate(cells):
+        target = translations.get((position, lang))
+        if target is not None:
+            result = make_result(target, shares[i], latency_share)
+            if reply.endpoint is not None:
+                result = replace(result, endpoint=reply.endpoint)
+            results[(position, lang)] = result
+            continue
+        single = translate_one(pack[position], lang)
+        own = TokenUsage(
+            input_tokens=single.input_tokens,
+            output_tokens=single.output_tokens,
+            cache_read_tokens=single.cache_read_tokens,
+            cache_write_tokens=single.cache_write_tokens,
+        )
+        results[(position, lang)] = replace(
+            make_result(
+                single.target_text, _add_usage(own, shares[i]), single.latency_ms + latency_share
+            ),
+            endpoint=single.endpoint,
+        )
+    return results
+
+
+def _apportion_usage(
+    usage: TokenUsage, input_weights: Sequence[int], output_weights: Sequence[int]
+) -> list[TokenUsage]:
+    """Per-cell shares of ``usage``. Input-side counts (cache reads and
+    writes included) follow ``input_weights``; output follows
+    ``output_weights``."""
+    inputs = apportion(usage.input_tokens, input_weights)
+    outputs = apportion(usage.output_tokens, output_weights)
+    reads = apportion(usage.cache_read_tokens, input_weights)
+    writes = apportion(usage.cache_write_tokens, input_weights)
+    return [
+        TokenUsage(
+            input_tokens=inputs[i],
+            output_tokens=outputs[i],
+            cache_read_tokens=reads[i],
+            cache_write_tokens=writes[i],
+        )
+        for i in range(len(input_weights))
+    ]
+
+
+def _reply_items(raw: str, count: int) -> list[tuple[int, dict[str, Any]]]:
+    """``(position, item)`` for each object in a packed reply whose id
+    names one of the ``count`` items sent."""
+    text = raw.strip()
+    if text.startswith(_CODE_FENCE):
+        # ```json\n[...]\n``` → [...]
+        text = text.partition("\n")[2]
+        text = text.rsplit(_CODE_FENCE, 1)[0].strip()
+    try:
+        items = json.loads(text)
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(items, list):
+        return []
+    found: list[tuple[int, dict[str, Any]]] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        position = _position(item.get(PACK_ITEM_ID_KEY), count)
+        if position is not None:
+            found.append((position, item))
+    return found
+
+
+def _position(item_id: Any, count: int) -> int | None:
+    if isinstance(item_id, int) and not isinstance(item_id, bool):
+        position = item_id
+    elif isinstance(item_id, str) and item_id.isdigit():
+        position = int(item_id)
+    else:
+        return None
+    return position if 0 <= position < count else None
+
+
+def _add(own: int | None, share: int | None) -> int | None:
+    """``own + share``, an unknown side counting as 0; ``None`` only
+    when both are unknown, so the cells still sum to the pack's usage."""
+    if own is None and share is None:
+        return None
+    return (own or 0) + (share or 0)
+
+
+def _add_usage(own: TokenUsage, share: TokenUsage) -> TokenUsage:
+    return TokenUsage(
+        input_tokens=_add(own.input_tokens, share.input_tokens),
+        output_tokens=_add(own.output_tokens, share.output_tokens),
+        cache_read_tokens=_add(own.cache_read_tokens, share.cache_read_tokens),
+        cache_write_tokens=_add(own.cache_write_tokens, share.cache_write_tokens),
+    )
+
+
+__all__ = [
+    "DEFAULT_PACK_SIZE",
+    "PACK_ITEM_ID_KEY",
+    "PACK_ITEM_TEXT_KEY",
+    "PACK_ITEM_TRANSLATIONS_KEY",
+    "PackReply",
+    "apportion",
+    "decode_multi_pack",
+    "decode_pack",
+    "encode_pack",
+    "pack_max_tokens",
+    "translate_in_packs",
+    "translate_multi_in_packs",
+]
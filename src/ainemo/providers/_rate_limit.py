@@ -0,0 +1,585 @@
+"""Adaptive per-(provider, model) rate limiting for provider calls.
+
+:func:`~ainemo.providers._retry.with_retry` only reacts once a call has
+been rejected, and every rejected caller backs off on its own schedule,
+so a burst of concurrent calls that hits a rate limit retries as a
+burst. A :class:`RateLimiter` paces the calls *before* they are sent:
+
+- Two token buckets enforce the configured :class:`RateLimit` budgets,
+  requests per minute and tokens per minute. A call reserves one
+  request and an estimate of its tokens (:func:`estimate_tokens`);
+  :meth:`RateLimiter.settle` corrects the token bucket with the
+  provider's reported usage afterwards.
+- Reservations are taken in arrival order and a caller that has to
+  wait sleeps outside the lock, so waiters are served first-come,
+  first-served. The same reservation works from threads
+  (:meth:`RateLimiter.acquire`) and coroutines
+  (:meth:`RateLimiter.aacquire`).
+- :meth:`RateLimiter.throttle` is fed each rate-limit rejection. It
+  reads ``Retry-After`` and the OpenAI / Anthropic rate-limit headers
+  from the SDK error (:func:`rate_limit_hint`), pauses every caller
+  until the server's reset, halves the sending rate, and learns a
+  request rate when none was configured. Successful calls restore the
+  rate step by step.
+
+:func:`rate_limiters` returns the process-wide
+:class:`RateLimiterRegistry`, one limiter per (provider, model);
+:func:`configure_rate_limits` replaces it, e.g. from CLI flags.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Final, Sequence
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+_SECONDS_PER_MINUTE: Final = 60.0
+
+# Bucket capacity, in seconds of budget. Providers enforce per-minute
+# limits over shorter windows too, so an idle limiter lets a burst of
+# a few seconds' budget through rather than a whole minute's.
+BURST_WINDOW_S: Final = 6.0
+
+# Rough English-and-European-language ratio used to estimate a call's
+# tokens before it is sent; :meth:`RateLimiter.settle` corrects it.
+CHARS_PER_TOKEN: Final = 4
+
+# Multiplicative decrease on each rejection, additive increase on each
+# success, never below the floor.
+RATE_DECREASE_FACTOR: Final = 0.5
+RATE_RECOVERY_STEP: Final = 0.05
+MIN_RATE_FACTOR: Final = 0.1
+
+# Pause after a rejection that names no reset time, doubled for each
+# consecutive rejection up to the cap.
+THROTTLE_FALLBACK_S: Final = 1.0
+MAX_THROTTLE_S: Final = 60.0
+
+# Status code of a rate-limit rejection (HTTP 429 Too Many Requests).
+HTTP_TOO_MANY_REQUESTS: Final = 429
+
+HEADER_RETRY_AFTER: Final = "retry-after"
+HEADER_RETRY_AFTER_MS: Final = "retry-after-ms"
+# OpenAI.
+HEADER_LIMIT_REQUESTS: Final = "x-ratelimit-limit-requests"
+HEADER_LIMIT_TOKENS: Final = "x-ratelimit-limit-tokens"
+HEADER_REMAINING_REQUESTS: Final = "x-ratelimit-remaining-requests"
+HEADER_REMAINING_TOKENS: Final = "x-ratelimit-remaining-tokens"
+HEADER_RESET_REQUESTS: Final = "x-ratelimit-reset-requests"
+HEADER_RESET_TOKENS: Final = "x-ratelimit-reset-tokens"
+# Anthropic.
+HEADER_ANTHROPIC_LIMIT_REQUESTS: Final = "anthropic-ratelimit-requests-limit"
+HEADER_ANTHROPIC_LIMIT_TOKENS: Final = "anthropic-ratelimit-tokens-limit"
+HEADER_ANTHROPIC_REMAINING_REQUESTS: Final = "anthropic-ratelimit-requests-remaining"
+HEADER_ANTHROPIC_REMAINING_TOKENS: Final = "anthropic-ratelimit-tokens-remaining"
+HEADER_ANTHROPIC_RESET_REQUESTS: Final = "anthropic-ratelimit-requests-reset"
+HEADER_ANTHROPIC_RESET_TOKENS: Final = "anthropic-ratelimit-tokens-reset"
+
+# OpenAI reset durations: "1s", "6m0s", "20ms", "1h2m3.5s".
+_DURATION_PATTERN: Final = re.compile(
+    r"^(?:(?P<h>\d+(?:\.\d+)?)h)?(?:(?P<m>\d+(?:\.\d+)?)m(?!s))?"
+    r"(?:(?P<s>\d+(?:\.\d+)?)s)?(?:(?P<ms>\d+(?:\.\d+)?)ms)?$"
+)
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Budgets for one (provider, model). ``None`` leaves that budget
+    unenforced; rejections are still honored."""
+
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+
+    def __post_init__(self) -> None:
+        for name in ("requests_per_minute", "tokens_per_minute"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"{name} must be > 0, got {value}.")
+
+
+@dataclass(frozen=True)
+class RateLimitHint:
+    """What a rate-limit rejection said about the server's limits.
+    Fields are ``None`` when the error carried no such header."""
+
+    retry_after_s: float | None = None
+    limit_requests: float | None = None
+    limit_tokens: float | None = None
+    remaining_requests: float | None = None
+    remaining_tokens: float | None = None
+    reset_requests_s: float | None = None
+    reset_tokens_s: float | None = None
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Snapshot of one (provider, model) limiter."""
+
+    provider: str
+    model: str
+    requests_per_minute: float | None
+    """Request budget in force: configured or learned, scaled by
+    ``rate_factor``. ``None`` when unenforced."""
+
+    tokens_per_minute: float | None
+    requests_available: float | None
+    """Requests that could start now; negative while callers are
+    queued on the bucket. ``None`` when unenforced."""
+
+    tokens_available: float | None
+    queued: int
+    """Callers currently waiting for their reservation."""
+
+    peak_queued: int
+    acquired: int
+    """Reservations handed out since the limiter was created."""
+
+    throttle_events: int
+    """Rate-limit rejections reported via :meth:`RateLimiter.throttle`."""
+
+    waited_s: float
+    """Total time callers spent waiting."""
+
+    rate_factor: float
+    """Share of the budget in use, lowered by rejections."""
+
+    paused_for_s: float
+    """Time left until the server's last reset; 0 when not paused."""
+
+
+class _Bucket:
+    """Reservation-style token bucket. ``level`` may go negative: the
+    deficit is the queue of reservations not yet covered, and each new
+    reservation waits for the whole deficit to refill. ``updated`` may
+    lie in the future while the bucket is paused."""
+
+    def __init__(self, per_minute: float | None, now: float) -> None:
+        self.rate: float | None = None
+        self.capacity = 0.0
+        self.level = 0.0
+        self.updated = now
+        self.set_rate(per_minute, now)
+
+    def set_rate(self, per_minute: float | None, now: float) -> None:
+        """Change the refill rate; a bucket that was unlimited starts
+        full."""
+        self._refill(now)
+        if per_minute is None:
+            self.rate = None
+            return
+        was_unlimited = self.rate is None
+        self.rate = per_minute / _SECONDS_PER_MINUTE
+        self.capacity = max(1.0, self.rate * BURST_WINDOW_S)
+        self.level = self.capacity if was_unlimited else min(self.level, self.capacity)
+
+    def reserve(self, cost: float, now: float) -> float:
+        """Take ``cost`` and return how long the caller must wait."""
+        if self.rate is None:
+            return 0.0
+        self._refill(now)
+        self.level -= cost
+        return max(0.0, self.updated - now) + max(0.0, -self.level) / self.rate
+
+    def refund(self, amount: float, now: float) -> None:
+        if self.rate is None:
+            return
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+    def pause(self, until: float, level: float) -> None:
+        """Refill nothing before ``until``, and start from at most
+        ``level`` then."""
+        if self.rate is None:
+            return
+        self.updated = max(self.updated, until)
+        self.level = min(self.level, level)
+
+    def available(self, now: float) -> float | None:
+        if self.rate is None:
+            return None
+        self._refill(now)
+        return self.level
+
+    def _refill(self, now: float) -> None:
+        if now > self.updated:
+            if self.rate is not None:
+                self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+            self.updated = now
+
+
+class RateLimiter:
+    """Thread- and asyncio-safe limiter for one (provider, model)."""
+
+    def __init__(
+        self,
+        provider: str,
+        model: str,
+        limit: RateLimit | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._provider = provider
+        self._model = model
+        self._limit = limit or RateLimit()
+        self._clock = clock
+        self._lock = threading.Lock()
+        now = clock()
+        self._learned_rpm: float | None = None
+        self._learned_tpm: float | None = None
+        self._rate_factor = 1.0
+        self._requests = _Bucket(self._limit.requests_per_minute, now)
+        self._tokens = _Bucket(self._limit.tokens_per_minute, now)
+        self._paused_until = now
+        self._recent: deque[float] = deque()
+        self._consecutive_throttles = 0
+        self._queued = 0
+        self._peak_queued = 0
+        self._acquired = 0
+        self._throttle_events = 0
+        self._waited_s = 0.0
+
+    def acquire(self, tokens: int = 0, *, sleep: Callable[[float], None] = time.sleep) -> None:
+        """Reserve one request and ``tokens`` tokens, sleeping until
+        the reservation is covered."""
+        wait = self._reserve(tokens)
+        if wait <= 0:
+            return
+        try:
+            sleep(wait)
+        finally:
+            self._leave_queue()
+
+    async def aacquire(
+        self,
+        tokens: int = 0,
+        *,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Coroutine form of :meth:`acquire`; waits without blocking
+        the event loop."""
+        wait = self._reserve(tokens)
+        if wait <= 0:
+            return
+        try:
+            await sleep(wait)
+        finally:
+            self._leave_queue()
+
+    def settle(self, estimated_tokens: int, actual_tokens: int | None) -> None:
+        """Record a successful call: correct the token bucket by the
+        difference between the reservation and the reported usage, and
+        step the rate back up after earlier rejections."""
+        with self._lock:
+            now = self._clock()
+            if actual_tokens is not None:
+                self._tokens.refund(estimated_tokens - actual_tokens, now)
+            self._consecutive_throttles = 0
+            if self._rate_factor < 1.0:
+                self._rate_factor = min(1.0, self._rate_factor + RATE_RECOVERY_STEP)
+                self._apply_rates(now)
+
+    def throttle(self, exc: BaseException) -> float:
+        """Record a rate-limit rejection and adapt; returns how long
+        new calls are paused for."""
+        hint = rate_limit_hint(exc)
+        with self._lock:
+            now = self._clock()
+            self._throttle_events += 1
+            self._consecutive_throttles += 1
+            self._rate_factor = max(MIN_RATE_FACTOR, self._rate_factor * RATE_DECREASE_FACTOR)
+            if hint.limit_requests is not None:
+                self._learned_rpm = hint.limit_requests
+            elif self._limit.requests_per_minute is None:
+                # The server rejected the rate we were sending at.
+                self._prune_recent(now)
+                self._learned_rpm = float(max(1, len(self._recent)))
+            if hint.limit_tokens is not None:
+                self._learned_tpm = hint.limit_tokens
+            self._apply_rates(now)
+
+            pause = _pause_seconds(hint, self._consecutive_throttles)
+            self._paused_until = max(self._paused_until, now + pause)
+            # One request may go as soon as the pause ends; the rest
+            # follow at the reduced rate.
+            self._requests.pause(self._paused_until, 1.0)
+            remaining = hint.remaining_tokens
+            self._tokens.pause(self._paused_until, math.inf if remaining is None else remaining)
+            return max(0.0, self._paused_until - now)
+
+    def stats(self) -> RateLimiterStats:
+        with self._lock:
+            now = self._clock()
+            return RateLimiterStats(
+                provider=self._provider,
+                model=self._model,
+                requests_per_minute=_scaled(self._requests_per_minute(), self._rate_factor),
+                tokens_per_minute=_scaled(self._tokens_per_minute(), self._rate_factor),
+                requests_available=self._requests.available(now),
+                tokens_available=self._tokens.available(now),
+                queued=self._queued,
+                peak_queued=self._peak_queued,
+                acquired=self._acquired,
+                throttle_events=self._throttle_events,
+                waited_s=self._waited_s,
+                rate_factor=self._rate_factor,
+                paused_for_s=max(0.0, self._paused_until - now),
+            )
+
+    def _reserve(self, tokens: int) -> float:
+        """Take a reservation; when it has to wait, the caller is
+        counted as queued until :meth:`_leave_queue`."""
+        with self._lock:
+            now = self._clock()
+            wait = max(
+                self._requests.reserve(1.0, now),
+                self._tokens.reserve(float(tokens), now),
+                self._paused_until - now,
+            )
+            self._acquired += 1
+            self._recent.append(now + max(0.0, wait))
+            self._prune_recent(now)
+            if wait > 0:
+                self._waited_s += wait
+                self._queued += 1
+                self._peak_queued = max(self._peak_queued, self._queued)
+            return wait
+
+    def _leave_queue(self) -> None:
+        with self._lock:
+            self._queued -= 1
+
+    def _prune_recent(self, now: float) -> None:
+        """Caller holds the lock."""
+        while self._recent and self._recent[0] <= now - _SECONDS_PER_MINUTE:
+            self._recent.popleft()
+
+    def _requests_per_minute(self) -> float | None:
+        return self._limit.requests_per_minute or self._learned_rpm
+
+    def _tokens_per_minute(self) -> float | None:
+        return self._limit.tokens_per_minute or self._learned_tpm
+
+    def _apply_rates(self, now: float) -> None:
+        """Caller holds the lock."""
+        self._requests.set_rate(_scaled(self._requests_per_minute(), self._rate_factor), now)
+        self._tokens.set_rate(_scaled(self._tokens_per_minute(), self._rate_factor), now)
+
+
+class RateLimiterRegistry:
+    """One :class:`RateLimiter` per (provider, model), all created with
+    the same :class:`RateLimit`."""
+
+    def __init__(self, limit: RateLimit | None = None) -> None:
+        self._limit = limit or RateLimit()
+        self._limiters: dict[tuple[str, str], RateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> RateLimit:
+        return self._limit
+
+    def limiter(self, provider: str, model: str) -> RateLimiter:
+        with self._lock:
+            limiter = self._limiters.get((provider, model))
+            if limiter is None:
+                limiter = RateLimiter(provider, model, self._limit)
+                self._limiters[(provider, model)] = limiter
+            return limiter
+
+    def stats(self) -> list[RateLimiterStats]:
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return [limiter.stats() for limiter in limiters]
+
+
+_registry: RateLimiterRegistry | None = None
+_registry_lock = threading.Lock()
+
+
+def rate_limiters() -> RateLimiterRegistry:
+    """The process-wide registry, unlimited until configured."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = RateLimiterRegistry()
+        return _registry
+
+
+def configure_rate_limits(limit: RateLimit) -> RateLimiterRegistry:
+    """Replace the process-wide registry with one enforcing ``limit``.
+    Routers built earlier keep the old registry."""
+    global _registry
+    with _registry_lock:
+        _registry = RateLimiterRegistry(limit)
+        return _registry
+
+
+def estimate_tokens(
+    source_texts: Sequence[str],
+    *,
+    system_prompt_addendum: str | None = None,
+    target_count: int = 1,
+) -> int:
+    """Tokens a call is likely to use: the sources and addendum in,
+    one translation of each source per target language out. Excludes
+    the provider's fixed system prompt, which the token-usage
+    correction in :meth:`RateLimiter.settle` accounts for."""
+    source_chars = sum(len(text) for text in source_texts)
+    prompt_chars = source_chars + len(system_prompt_addendum or "")
+    return math.ceil(prompt_chars / CHARS_PER_TOKEN) + target_count * math.ceil(
+        source_chars / CHARS_PER_TOKEN
+    )
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """``True`` for an SDK error carrying HTTP 429 (OpenAI's and
+    Anthropic's ``RateLimitError``, Ollama's ``ResponseError``)."""
+    return getattr(exc, "status_code", None) == HTTP_TOO_MANY_REQUESTS
+
+
+def retry_after_seconds(exc: BaseException) -> float | None:
+    """The server-requested delay before retrying, from the
+    ``retry-after-ms`` / ``Retry-After`` headers of ``exc``'s
+    response, or ``None``."""
+    return rate_limit_hint(exc).retry_after_s
+
+
+def rate_limit_hint(exc: BaseException) -> RateLimitHint:
+    """Parse the rate-limit headers of an SDK error's HTTP response."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return RateLimitHint()
+    now = time.time()
+    retry_after = _duration(_header(headers, HEADER_RETRY_AFTER_MS), now)
+    if retry_after is not None:
+        retry_after /= 1000.0
+    else:
+        retry_after = _duration(_header(headers, HEADER_RETRY_AFTER), now)
+    return RateLimitHint(
+        retry_after_s=retry_after,
+        limit_requests=_number(
+            _header(headers, HEADER_LIMIT_REQUESTS, HEADER_ANTHROPIC_LIMIT_REQUESTS)
+        ),
+        limit_tokens=_number(_header(headers, HEADER_LIMIT_TOKENS, HEADER_ANTHROPIC_LIMIT_TOKENS)),
+        remaining_requests=_number(
+            _header(headers, HEADER_REMAINING_REQUESTS, HEADER_ANTHROPIC_REMAINING_REQUESTS)
+        ),
+        remaining_tokens=_number(
+            _header(headers, HEADER_REMAINING_TOKENS, HEADER_ANTHROPIC_REMAINING_TOKENS)
+        ),
+        reset_requests_s=_duration(
+            _header(headers, HEADER_RESET_REQUESTS, HEADER_ANTHROPIC_RESET_REQUESTS), now
+        ),
+        reset_tokens_s=_duration(
+            _header(headers, HEADER_RESET_TOKENS, HEADER_ANTHROPIC_RESET_TOKENS), now
+        ),
+    )
+
+
+def _pause_seconds(hint: RateLimitHint, consecutive: int) -> float:
+    """How long to stop sending after a rejection: the server's
+    ``Retry-After``, else the reset of an exhausted budget, else an
+    exponential fallback."""
+    if hint.retry_after_s is not None:
+        return hint.retry_after_s
+    resets = [
+        reset
+        for remaining, reset in (
+            (hint.remaining_requests, hint.reset_requests_s),
+            (hint.remaining_tokens, hint.reset_tokens_s),
+        )
+        if remaining is not None and remaining <= 0 and reset is not None
+    ]
+    if resets:
+        return max(resets)
+    return min(MAX_THROTTLE_S, THROTTLE_FALLBACK_S * 2.0 ** (consecutive - 1))
+
+
+def _scaled(per_minute: float | None, factor: float) -> float | None:
+    return None if per_minute is None else per_minute * factor
+
+
+def _header(headers: Any, *names: str) -> str | None:
+    """First non-blank header of ``names``. SDK responses carry
+    case-insensitive ``httpx.Headers``; plain mappings are matched
+    case-insensitively too."""
+    if not hasattr(headers, "items"):
+        return None
+    lowered = {str(key).lower(): value for key, value in headers.items()}
+    for name in names:
+        value = lowered.get(name)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return None
+
+
+def _number(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if math.isfinite(number) and number >= 0 else None
+
+
+def _duration(value: str | None, now: float) -> float | None:
+    """Seconds from ``now`` (epoch) for a header holding seconds, an
+    OpenAI duration, an HTTP date or an RFC 3339 timestamp."""
+    if value is None:
+        return None
+    seconds = _number(value)
+    if seconds is not None:
+        return seconds
+    match = _DURATION_PATTERN.match(value)
+    if match is not None and any(match.groupdict().values()):
+        parts = {unit: float(amount) for unit, amount in match.groupdict().items() if amount}
+        return (
+            parts.get("h", 0.0) * 3600
+            + parts.get("m", 0.0) * 60
+            + parts.get("s", 0.0)
+            + parts.get("ms", 0.0) / 1000
+        )
+    moment: datetime | None
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, moment.timestamp() - now)
+
+
+__all__ = [
+    "BURST_WINDOW_S",
+    "CHARS_PER_TOKEN",
+    "HTTP_TOO_MANY_REQUESTS",
+    "MAX_THROTTLE_S",
+    "MIN_RATE_FACTOR",
+    "RATE_DECREASE_FACTOR",
+    "RATE_RECOVERY_STEP",
+    "THROTTLE_FALLBACK_S",
+    "RateLimit",
+    "RateLimitHint",
+    "RateLimiter",
+    "RateLimiterRegistry",
+    "RateLimiterStats",
+    "configure_rate_limits",
+    "estimate_tokens",
+    "is_rate_limit_error",
+    "rate_limit_hint",
+    "rate_limiters",
+    "retry_after_seconds",
+]
@@ -0,0 +1,418 @@
+"""Request-level response cache and single-flight for :class:`ProviderRouter`.
+
+The TM keys on ``(fingerprint, target_lang, provider, model)`` and only
+the pipeline consults it. The daemon's single-segment ``translate`` op
+and the QA back-translation path call the router directly. Without this
+cache, a repeated request is sent to the provider again. A
+:class:`ResponseCache` sits in front of those calls:
+
+- **Key.** :func:`request_key` hashes the whole request: provider id,
+  model, segment fingerprint (source text, source language and
+  placeholder shape), target language, and a hash of the
+  ``system_prompt_addendum``. A different glossary or persona block
+  is a different request.
+- **Store.** An in-memory LRU of ``max_entries`` results, each kept
+  for ``ttl_s`` seconds. With a ``path``, results are also written to
+  a SQLite file, so a restarted daemon starts warm. The file is
+  trimmed of expired rows and cut to the ``max_entries`` most recent
+  on open, and again every few hundred stores, so a long-lived
+  process keeps it bounded too.
+- **Single-flight.** Concurrent identical requests share one provider
+  call. The first caller makes the call; the others wait for its
+  result, or its exception. If the first caller is cancelled, one of
+  the waiters makes the call instead.
+
+Only successful results are stored. Errors are never cached.
+
+A result served from the store, or shared from another caller's call,
+is returned as :func:`as_cache_hit` made it: same text and
+attribution, zero tokens, zero cost, zero latency. The router records
+it to the UsageLog as a response-cache hit, not as a provider call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from dataclasses import replace as _replace
+from pathlib import Path
+from typing import Awaitable, Callable, Final
+
+from ainemo.providers.base import ProviderResult
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+DEFAULT_RESPONSE_CACHE_ENTRIES: Final = 10_000
+
+# A day: long enough to absorb a build's repeats and a reviewer's
+# session, short enough that a model update shows up the next day.
+DEFAULT_RESPONSE_CACHE_TTL_S: Final = 24 * 60 * 60.0
+
+# Stores between two trims of the on-disk store (at most
+# ``max_entries``, so the file never holds more than twice the bound).
+_TRIM_INTERVAL_PUTS: Final = 256
+
+# Bumped when the key pre-image changes, so an old on-disk store
+# misses instead of serving results keyed differently.
+_KEY_VERSION: Final = "1"
+
+_SCHEMA: Final = (
+    "CREATE TABLE IF NOT EXISTS responses ("
+    "key TEXT PRIMARY KEY, "
+    "target_text TEXT NOT NULL, "
+    "provider TEXT NOT NULL, "
+    "model TEXT NOT NULL, "
+    "confidence REAL, "
+    "stored_at REAL NOT NULL)"
+)
+
+
+@dataclass(frozen=True)
+class ResponseCacheOptions:
+    """Size, lifetime and persistence of a :class:`ResponseCache`."""
+
+    max_entries: int = DEFAULT_RESPONSE_CACHE_ENTRIES
+    """Results kept in memory; the least recently used go first."""
+
+    ttl_s: float | None = DEFAULT_RESPONSE_CACHE_TTL_S
+    """Seconds a result is served after it was stored; ``None`` keeps
+    results until evicted."""
+
+    path: Path | None = None
+    """SQLite file the results are also written to; ``None`` keeps the
+    cache in memory only."""
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1:
+            raise ValueError(f"max_entries must be >= 1, got {self.max_entries}.")
+        if self.ttl_s is not None and self.ttl_s <= 0:
+            raise ValueError(f"ttl_s must be > 0, got {self.ttl_s}.")
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Point-in-time counters of one :class:`ResponseCache`."""
+
+    entries: int
+    max_entries: int
+    hits: int
+    """Requests served from memory or the on-disk store."""
+
+    misses: int
+    """Requests that called the provider."""
+
+    coalesced: int
+    """Requests that waited for an identical call already in flight."""
+
+    evictions: int
+    expired: int
+    in_flight: int
+    path: str | None
+
+
+class _Abandoned(Exception):
+    """The caller making a call was cancelled; a waiter takes over."""
+
+
+@dataclass(frozen=True)
+class _Entry:
+    result: ProviderResult
+    stored_at: float
+
+
+def request_key(
+    *,
+    provider_id: str,
+    model: str,
+    segment_fingerprint: str,
+    target_lang: str,
+    system_prompt_addendum: str | None,
+) -> str:
+    """SHA-256 hex digest identifying one single-segment request."""
+    addendum_hash = (
+        ""
+        if system_prompt_addendum is None
+        else hashlib.sha256(system_prompt_addendum.encode("utf-8")).hexdigest()
+    )
+    preimage = json.dumps(
+        [_KEY_VERSION, provider_id, model, segment_fingerprint, target_lang, addendum_hash]
+    )
+    return hashlib.sha256(preimage.encode("utf-8")).hexdigest()
+
+
+def as_cache_hit(result: ProviderResult) -> ProviderResult:
+    """``result`` as served without a provider call: nothing spent."""
+    return _replace(
+        result,
+        input_tokens=0,
+        output_tokens=0,
+        cache_read_tokens=None,
+        cache_write_tokens=None,
+        latency_ms=0,
+        cost_usd=0.0,
+        endpoint=None,
+    )
+
+
+class ResponseCache:
+    """Thread-safe LRU/TTL response store with single-flight calls.
+    Shared by every router of a process; the key names the provider."""
+
+    def __init__(
+        self,
+        options: ResponseCacheOptions | None = None,
+        *,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._options = options if options is not None else ResponseCacheOptions()
+        # Wall-clock time, so entries written to disk by an earlier
+        # process expire on schedule.
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._in_flight: dict[str, Future[ProviderResult]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._expired = 0
+        self._conn: sqlite3.Connection | None = None
+        self._puts_since_trim = 0
+        if self._options.path is not None:
+            self._conn = self._open(self._options.path)
+
+    @property
+    def options(self) -> ResponseCacheOptions:
+        return self._options
+
+    def get(self, key: str) -> ProviderResult | None:
+        """The stored result for ``key``, or ``None``. Does not count
+        towards the hit / miss counters."""
+        with self._lock:
+            entry = self._lookup_locked(key)
+        return None if entry is None else entry.result
+
+    def put(self, key: str, result: ProviderResult) -> None:
+        with self._lock:
+            self._store_locked(key, result)
+
+    def get_or_call(
+        self, key: str, call: Callable[[], ProviderResult]
+    ) -> tuple[ProviderResult, bool]:
+        """The stored result for ``key``, else ``call()``'s, made once
+        however many threads ask at the same time. The flag is ``True``
+        when this caller did not make the call itself."""
+        while True:
+            claim = self._claim(key)
+            if isinstance(claim, ProviderResult):
+                return claim, True
+            flight, leading = claim
+            if leading:
+                return self._lead(key, flight, call), False
+            try:
+                return flight.result(), True
+            except _Abandoned:
+                continue  # The caller making the call gave up; retry.
+
+    async def aget_or_call(
+        self, key: str, call: Callable[[], Awaitable[ProviderResult]]
+    ) -> tuple[ProviderResult, bool]:
+        """Coroutine form of :meth:`get_or_call`. Waits without
+        blocking the event loop, and coalesces with sync callers."""
+        while True:
+            claim = self._claim(key)
+            if isinstance(claim, ProviderResult):
+                return claim, True
+            flight, leading = claim
+            if not leading:
+                try:
+                    # Shielded: a cancelled waiter must not cancel the
+                    # call the other callers are waiting for.
+                    return await asyncio.shield(asyncio.wrap_future(flight)), True
+                except _Abandoned:
+                    continue
+            try:
+                result = await call()
+            except asyncio.CancelledError:
+                self._fail(key, flight, _Abandoned())
+                raise
+            except BaseException as exc:
+                self._fail(key, flight, exc)
+                raise
+            self._succeed(key, flight, result)
+            return result, False
+
+    def stats(self) -> ResponseCacheStats:
+        with self._lock:
+            return ResponseCacheStats(
+                entries=len(self._entries),
+                max_entries=self._options.max_entries,
+                hits=self._hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                evictions=self._evictions,
+                expired=self._expired,
+                in_flight=len(self._in_flight),
+                path=str(self._options.path) if self._options.path is not None else None,
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # --- Internals ---
+
+    def _claim(self, key: str) -> ProviderResult | tuple[Future[ProviderResult], bool]:
+        """The stored result for ``key``, or the flight to wait on and
+        whether this caller makes the call."""
+        with self._lock:
+            entry = self._lookup_locked(key)
+            if entry is not None:
+                self._hits += 1
+                return entry.result
+            flight = self._in_flight.get(key)
+            if flight is not None:
+                self._coalesced += 1
+                return flight, False
+            flight = Future()
+            flight.set_running_or_notify_cancel()
+            self._in_flight[key] = flight
+            self._misses += 1
+            return flight, True
+
+    def _lead(
+        self, key: str, flight: Future[ProviderResult], call: Callable[[], ProviderResult]
+    ) -> ProviderResult:
+        try:
+            result = call()
+        except BaseException as exc:
+            self._fail(key, flight, exc)
+            raise
+        self._succeed(key, flight, result)
+        return result
+
+    def _succeed(self, key: str, flight: Future[ProviderResult], result: ProviderResult) -> None:
+        with self._lock:
+            self._store_locked(key, result)
+            self._in_flight.pop(key, None)
+        flight.set_result(result)
+
+    def _fail(self, key: str, flight: Future[ProviderResult], exc: BaseException) -> None:
+        with self._lock:
+            self._in_flight.pop(key, None)
+        flight.set_exception(exc)
+
+    def _lookup_locked(self, key: str) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load_locked(key)
+            if entry is None:
+                return None
+            self._remember_locked(key, entry)
+        if self._is_expired(entry):
+            self._expired += 1
+            del self._entries[key]
+            self._delete_locked(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store_locked(self, key: str, result: ProviderResult) -> None:
+        entry = _Entry(result=as_cache_hit(result), stored_at=self._clock())
+        self._remember_locked(key, entry)
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, target_text, provider, model, confidence, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        key,
+                        entry.result.target_text,
+                        entry.result.provider,
+                        entry.result.model,
+                        entry.result.confidence,
+                        entry.stored_at,
+                    ),
+                )
+                self._puts_since_trim += 1
+                if self._puts_since_trim >= min(_TRIM_INTERVAL_PUTS, self._options.max_entries):
+                    self._trim(self._conn)
+
+    def _remember_locked(self, key: str, entry: _Entry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._options.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def _load_locked(self, key: str) -> _Entry | None:
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT target_text, provider, model, confidence, stored_at "
+            "FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        target_text, provider, model, confidence, stored_at = row
+        result = as_cache_hit(
+            ProviderResult(
+                target_text=target_text, provider=provider, model=model, confidence=confidence
+            )
+        )
+        return _Entry(result=result, stored_at=stored_at)
+
+    def _delete_locked(self, key: str) -> None:
+        if self._conn is not None:
+            with self._conn:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def _is_expired(self, entry: _Entry) -> bool:
+        ttl = self._options.ttl_s
+        return ttl is not None and self._clock() - entry.stored_at >= ttl
+
+    def _open(self, path: Path) -> sqlite3.Connection:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Lookups run on router worker threads; every use holds _lock.
+        conn = sqlite3.connect(path, check_same_thread=False)
+        with conn:
+            conn.execute(_SCHEMA)
+            self._trim(conn)
+        return conn
+
+    def _trim(self, conn: sqlite3.Connection) -> None:
+        """Drop expired rows and all but the ``max_entries`` most
+        recent. Runs inside the caller's transaction."""
+        self._puts_since_trim = 0
+        if self._options.ttl_s is not None:
+            conn.execute(
+                "DELETE FROM responses WHERE stored_at <= ?",
+                (self._clock() - self._options.ttl_s,),
+            )
+        conn.execute(
+            "DELETE FROM responses WHERE key NOT IN "
+            "(SELECT key FROM responses ORDER BY stored_at DESC LIMIT ?)",
+            (self._options.max_entries,),
+        )
+
+
+__all__ = [
+    "DEFAULT_RESPONSE_CACHE_ENTRIES",
+    "DEFAULT_RESPONSE_CACHE_TTL_S",
+    "ResponseCache",
+    "ResponseCacheOptions",
+    "ResponseCacheStats",
+    "as_cache_hit",
+    "request_key",
+]
@@ -8,13 +8,25 @@ with the provider-SDK's specific rate-limit exception types.
 
 Sleep is injectable so unit tests don't actually wait. The default is
 ``time.sleep``; tests pass a no-op or a mock recorder.
+
+:func:`awith_retry` is the coroutine twin for the async router path:
+same attempts, same backoff schedule, but it awaits ``asyncio.sleep``
+so a backing-off call does not hold up the other calls on the loop.
+
+When the rate-limit error carries a ``Retry-After`` header, the wait is
+the server's instead of the backoff schedule's. Callers pacing their
+calls through a :class:`~ainemo.providers._rate_limit.RateLimiter`
+pass ``retry_after`` to take the wait over entirely.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import Callable, Final, TypeVar
+from typing import Awaitable, Callable, Final, TypeVar
+
+from ainemo.providers._rate_limit import retry_after_seconds
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +52,7 @@ def with_retry(
     max_attempts: int = MAX_RETRY_ATTEMPTS,
     backoff_base_seconds: float = BACKOFF_BASE_SECONDS,
     sleep: Callable[[float], None] = time.sleep,
+    retry_after: Callable[[BaseException], float | None] = retry_after_seconds,
 ) -> T:
     """Run ``fn`` with exponential-backoff retry on the listed
     exception types.
@@ -52,7 +65,9 @@ def with_retry(
     surface on attempt 1, not be hidden behind 7 seconds of retries.
 
     ``sleep`` is injectable so unit tests can pass a no-op without
-    monkey-patching ``time.sleep`` globally.
+    monkey-patching ``time.sleep`` globally. ``retry_after`` maps the
+    caught exception to the wait before the next attempt; ``None``
+    falls back to the backoff schedule, and ``0`` retries at once.
     """
     if max_attempts < 1:
         raise ValueError(f"max_attempts must be >= 1; got {max_attempts}")
@@ -69,7 +84,7 @@ def with_retry(
                     type(exc).__name__,
                 )
                 raise
-            wait_seconds = backoff_base_seconds * (2 ** (attempt - 1))
+            wait_seconds = _wait_seconds(exc, attempt, backoff_base_seconds, retry_after)
             logger.info(
                 "Provider call hit rate limit on attempt %d/%d (%s); backing off %.1fs.",
                 attempt,
@@ -77,15 +92,67 @@ def with_retry(
                 type(exc).__name__,
                 wait_seconds,
             )
-            sleep(wait_seconds)
+            if wait_seconds > 0:
+                sleep(wait_seconds)
     # Unreachable in practice (the loop either returns or raises),
     # but mypy strict needs the explicit raise.
     assert last_exception is not None
     raise last_exception
 
 
+async def awith_retry(
+    fn: Callable[[], Awaitable[T]],
+    *,
+    rate_limit_exceptions: tuple[type[BaseException], ...],
+    max_attempts: int = MAX_RETRY_ATTEMPTS,
+    backoff_base_seconds: float = BACKOFF_BASE_SECONDS,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    retry_after: Callable[[BaseException], float | None] = retry_after_seconds,
+) -> T:
+    """Async :func:`with_retry`: await ``fn()`` with the same retry
+    and fail-fast rules. ``fn`` is a factory, called once per attempt,
+    because a coroutine object can only be awaited once."""
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be >= 1; got {max_attempts}")
+    for attempt in range(1, max_attempts + 1):
+        try:
+            return await fn()
+        except rate_limit_exceptions as exc:
+            if attempt == max_attempts:
+                logger.warning(
+                    "Provider call exhausted retry budget (%d attempts); raising %s.",
+                    max_attempts,
+                    type(exc).__name__,
+                )
+                raise
+            wait_seconds = _wait_seconds(exc, attempt, backoff_base_seconds, retry_after)
+            logger.info(
+                "Provider call hit rate limit on attempt %d/%d (%s); backing off %.1fs.",
+                attempt,
+                max_attempts,
+                type(exc).__name__,
+                wait_seconds,
+            )
+            if wait_seconds > 0:
+                await sleep(wait_seconds)
+    raise AssertionError("unreachable: the loop either returns or raises")
+
+
+def _wait_seconds(
+    exc: BaseException,
+    attempt: int,
+    backoff_base_seconds: float,
+    retry_after: Callable[[BaseException], float | None],
+) -> float:
+    requested = retry_after(exc)
+    if requested is not None:
+        return max(0.0, requested)
+    return backoff_base_seconds * (2.0 ** (attempt - 1))
+
+
 __all__ = [
     "MAX_RETRY_ATTEMPTS",
     "BACKOFF_BASE_SECONDS",
+    "awith_retry",
     "with_retry",
 ]
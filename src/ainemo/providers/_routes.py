@@ -0,0 +1,115 @@
+"""Pydantic-strict YAML schema for routing config files (``--routes``).
+
+YAML shape:
+
+```yaml
+default_provider: nllb          # mandatory: used when no rule matches
+rules:                          # optional: tried in order, first match wins
+  - provider: opus              # static rule: always this provider
+    target_lang: de-DE
+  - target_lang: fr-FR          # adaptive rule: one of the candidates per call
+    candidates: [openai, anthropic, ollama]
+    objective: cheapest-under-slo
+    latency_slo_ms: 2500
+  - candidates: [openai, anthropic]
+    objective: fastest-under-budget
+    max_cost_per_1k_tokens_usd: 0.01
+```
+
+A rule names either one ``provider`` or a list of ``candidates``, not
+both; the adaptive fields are only accepted with ``candidates``. The
+filters (``source_lang``, ``target_lang``, ``persona``, ``domain``)
+mean "any" when omitted. Unknown keys raise (``extra="forbid"``), so a
+typo fails the load instead of silently widening a rule.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import yaml
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, model_validator
+
+from ainemo.providers._adaptive import AdaptiveRule
+from ainemo.providers.router import RoutingConfig, RoutingRule
+
+
+class _RuleSpec(BaseModel):
+    """One entry of ``rules``."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    provider: str | None = None
+    candidates: list[str] | None = Field(default=None, min_length=1)
+
+    source_lang: str | None = None
+    target_lang: str | None = None
+    persona: str | None = None
+    domain: str | None = None
+
+    objective: str | None = None
+    latency_slo_ms: float | None = None
+    max_cost_per_1k_tokens_usd: float | None = None
+    latency_quantile: float | None = None
+    max_error_rate: float | None = None
+    min_samples: int | None = None
+    exploration: float | None = None
+
+    @model_validator(mode="after")
+    def _static_or_adaptive(self) -> _RuleSpec:
+        if (self.provider is None) == (self.candidates is None):
+            raise ValueError("a rule names either `provider` or `candidates`, not both")
+        if self.provider is not None:
+            adaptive = [
+                name
+                for name in (
+                    "objective",
+                    "latency_slo_ms",
+                    "max_cost_per_1k_tokens_usd",
+                    "latency_quantile",
+                    "max_error_rate",
+                    "min_samples",
+                    "exploration",
+                )
+                if getattr(self, name) is not None
+            ]
+            if adaptive:
+                raise ValueError(f"{adaptive} only apply to a rule with `candidates`")
+        return self
+
+    def to_rule(self) -> RoutingRule | AdaptiveRule:
+        if self.provider is not None:
+            return RoutingRule(
+                provider_id=self.provider,
+                source_lang=self.source_lang,
+                target_lang=self.target_lang,
+                persona=self.persona,
+                domain=self.domain,
+            )
+        # Unset fields keep the AdaptiveRule defaults.
+        settings = self.model_dump(exclude_none=True, exclude={"provider", "candidates"})
+        return AdaptiveRule(candidates=tuple(self.candidates or ()), **settings)
+
+
+class _RoutesFile(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    default_provider: str
+    rules: list[_RuleSpec] = Field(default_factory=list)
+
+
+def load_routing_config(path: Path) -> RoutingConfig:
+    """Read a routes YAML file. Raises ``ValueError`` naming the file
+    for unreadable YAML or an invalid rule."""
+    try:
+        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        spec = _RoutesFile.model_validate(raw)
+        return RoutingConfig(
+            default_provider=spec.default_provider,
+            rules=tuple(rule.to_rule() for rule in spec.rules),
+        )
+    except (OSError, yaml.YAMLError, ValidationError, ValueError) as exc:
+        raise ValueError(f"Invalid routes file {path}: {exc}") from exc
+
+
+__all__ = ["load_routing_config"]
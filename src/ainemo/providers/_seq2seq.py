@@ -0,0 +1,160 @@
+"""Shared batched inference engine for the local seq2seq providers.
+
+NLLB-200 and OPUS-MT are both HuggingFace encoder-decoder models, and
+both used to translate one string per ``generate`` call, which leaves
+most of a CPU idle. :class:`Seq2SeqEngine` is the one place that turns a
+list of source strings into target strings efficiently:
+
+1. Inputs are sorted by length and cut into buckets of ``batch_size``
+   so each padded batch wastes as few pad tokens as possible.
+2. Each bucket is tokenized with padding + truncation and decoded with
+   a single ``generate`` call under ``torch.inference_mode()``.
+3. Outputs are scattered back to the callers' original order.
+
+Per-(model, source, target) generation settings (NLLB's forced
+target-language BOS token) are resolved once and cached. Generation is
+serialised behind a lock because NLLB tokenizers carry the source
+language as mutable state (``tokenizer.src_lang``), and one engine is
+shared by every thread that talks to the provider (the daemon serves
+requests concurrently).
+
+The tokenizer/model objects are typed ``Any`` — the same boundary as
+:class:`~ainemo.providers.nllb._client.NllbModelHolder` — so unit tests
+drive the engine with small fakes and never import a real model.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Final, Hashable, Mapping, Sequence
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# Segments per ``generate`` call. Resource-bundle strings are short, so
+# 16 keeps a padded batch well under a few thousand tokens while giving
+# the CPU matmuls enough rows to use every core.
+DEFAULT_BATCH_SIZE: Final = 16
+
+# Source string for warm-up generations (daemon ``--preload``): short,
+# so the warm-up costs one tiny ``generate`` call per pair.
+WARMUP_TEXT: Final = "Hello"
+WARMUP_KEY: Final = "__ainemo_warmup__"
+
+# Keyword the tokenizer / ``generate`` calls share with the HF API.
+_RETURN_TENSORS_PT: Final = "pt"
+
+
+@dataclass(frozen=True)
+class Seq2SeqEngineStats:
+    """Counters for one :class:`Seq2SeqEngine` since construction."""
+
+    batch_count: int
+    """``generate`` calls issued (one per length bucket)."""
+
+    segment_count: int
+    """Source strings translated across all batches."""
+
+    cached_pair_count: int
+    """Distinct (model, source, target) entries in the settings cache."""
+
+
+class Seq2SeqEngine:
+    """Length-bucketed, batched ``generate`` over a HF seq2seq model."""
+
+    def __init__(self, *, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}.")
+        self._batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pair_cache: dict[Hashable, Any] = {}
+        self._batch_count = 0
+        self._segment_count = 0
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch_size
+
+    def cached(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, building it with
+        ``factory`` on first use. Keys are conventionally
+        ``(model_id, source_code, target_code)``."""
+        with self._lock:
+            if key not in self._pair_cache:
+                self._pair_cache[key] = factory()
+            return self._pair_cache[key]
+
+    def translate_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        model_key: str,
+        tokenizer: Any,
+        model: Any,
+        max_length: int,
+        src_code: str | None = None,
+        tgt_code: str | None = None,
+        generate_kwargs: Mapping[str, Any] | None = None,
+    ) -> list[str]:
+        """Translate ``texts`` and return the outputs in input order.
+
+        ``src_code`` / ``tgt_code`` are set for multilingual models that
+        need them (NLLB: ``tokenizer.src_lang`` and a forced BOS token
+        for the target); pair-specific models (OPUS/Marian) leave both
+        ``None``. ``model_key`` names the model in the settings cache.
+        ``generate_kwargs`` (decoding settings such as ``num_beams``) are
+        merged into every ``generate`` call.
+        """
+        if not texts:
+            return []
+        import torch
+
+        # Shortest first, so each bucket holds strings of similar length
+        # and padding stays minimal. ``sorted`` is stable, which keeps
+        # equal-length inputs in caller order.
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        outputs: list[str] = [""] * len(texts)
+
+        call_kwargs: dict[str, Any] = {"max_length": max_length, **(generate_kwargs or {})}
+        if tgt_code is not None:
+            call_kwargs["forced_bos_token_id"] = self.cached(
+                (model_key, src_code, tgt_code),
+                lambda: tokenizer.convert_tokens_to_ids(tgt_code),
+            )
+
+        with self._lock:
+            if src_code is not None:
+                tokenizer.src_lang = src_code
+            for start in range(0, len(order), self._batch_size):
+                bucket = order[start : start + self._batch_size]
+                inputs = tokenizer(
+                    [texts[i] for i in bucket],
+                    return_tensors=_RETURN_TENSORS_PT,
+                    padding=True,
+                    max_length=max_length,
+                    truncation=True,
+                )
+                with torch.inference_mode():
+                    generated = model.generate(**inputs, **call_kwargs)
+                decoded = tokenizer.batch_decode(generated, skip_special_tokens=True)
+                if len(decoded) != len(bucket):
+                    raise RuntimeError(
+                        f"Seq2seq generate returned {len(decoded)} outputs for a "
+                        f"batch of {len(bucket)} inputs."
+                    )
+                for index, text in zip(bucket, decoded, strict=True):
+                    outputs[index] = str(text)
+                self._batch_count += 1
+            self._segment_count += len(texts)
+        return outputs
+
+    def stats(self) -> Seq2SeqEngineStats:
+        with self._lock:
+            return Seq2SeqEngineStats(
+                batch_count=self._batch_count,
+                segment_count=self._segment_count,
+                cached_pair_count=len(self._pair_cache),
+            )
+
+
+__all__ = ["DEFAULT_BATCH_SIZE", "WARMUP_KEY", "WARMUP_TEXT", "Seq2SeqEngine", "Seq2SeqEngineStats"]
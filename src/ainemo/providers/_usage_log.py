@@ -26,7 +26,8 @@ from __future__ import annotations
 
 import json
 import statistics
-from dataclasses import dataclass
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Final, Iterator, Mapping
@@ -48,8 +49,13 @@ FIELD_TARGET_LANG: Final = "target_lang"
 FIELD_SEGMENT_FINGERPRINT: Final = "segment_fingerprint"
 FIELD_INPUT_TOKENS: Final = "input_tokens"
 FIELD_OUTPUT_TOKENS: Final = "output_tokens"
+FIELD_CACHE_READ_TOKENS: Final = "cache_read_tokens"
+FIELD_CACHE_WRITE_TOKENS: Final = "cache_write_tokens"
 FIELD_LATENCY_MS: Final = "latency_ms"
 FIELD_COST_USD: Final = "cost_usd"
+FIELD_RESPONSE_CACHE_HIT: Final = "response_cache_hit"
+FIELD_ENDPOINT: Final = "endpoint"
+FIELD_BATCH_JOB: Final = "batch_job"
 
 
 @dataclass(frozen=True)
@@ -67,6 +73,29 @@ class UsageStats:
     by_model: dict[str, int]
     """call_count grouped by model id."""
 
+    total_cache_read_tokens: int = 0
+    """Input tokens served from provider prompt caches (part of
+    ``total_input_tokens``)."""
+
+    total_cache_write_tokens: int = 0
+    """Input tokens written to provider prompt caches (part of
+    ``total_input_tokens``)."""
+
+    response_cache_hits: int = 0
+    """Requests the router answered from its response cache. Not
+    provider calls, so not part of ``call_count`` or the totals."""
+
+    by_endpoint: dict[str, int] = field(default_factory=dict)
+    """call_count grouped by pooled endpoint; calls to a provider's
+    single endpoint are not listed."""
+
+    latency_ms_by_endpoint: dict[str, int] = field(default_factory=dict)
+    """Total latency of the calls in ``by_endpoint``."""
+
+    batch_calls: int = 0
+    """Calls served by offline batch jobs (part of ``call_count``; their
+    latency is recorded as 0)."""
+
 
 class UsageLog:
     """Single-writer JSONL log. Construct with the path; methods are
@@ -76,6 +105,9 @@ class UsageLog:
         self._path = path
         # Lazy mkdir on first record() / stats() call so importing the
         # module is side-effect-free.
+        # The async router records from worker threads; serialize the
+        # appends so concurrent records never interleave within a line.
+        self._write_lock = threading.Lock()
 
     @property
     def path(self) -> Path:
@@ -93,10 +125,19 @@ class UsageLog:
         source_lang: str,
         target_lang: str,
         segment_fingerprint: str,
+        cache_read_tokens: int | None = None,
+        cache_write_tokens: int | None = None,
+        response_cache_hit: bool = False,
+        endpoint: str | None = None,
+        batch_job: str | None = None,
     ) -> None:
         """Append one provider-call record. ``None`` token/cost values
         are stored as JSON null so the read side can distinguish
-        "not measured" from zero."""
+        "not measured" from zero. The prompt-cache counts are written
+        only when the provider reported them. A request answered from
+        the router's response cache is flagged ``response_cache_hit``;
+        ``endpoint`` is written for calls served from an endpoint pool,
+        ``batch_job`` for results of an offline batch job."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
         payload = {
             FIELD_TIMESTAMP: _utc_now_iso(),
@@ -110,8 +151,19 @@ class UsageLog:
             FIELD_LATENCY_MS: latency_ms,
             FIELD_COST_USD: cost_usd,
         }
-        with self._path.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        if cache_read_tokens is not None:
+            payload[FIELD_CACHE_READ_TOKENS] = cache_read_tokens
+        if cache_write_tokens is not None:
+            payload[FIELD_CACHE_WRITE_TOKENS] = cache_write_tokens
+        if response_cache_hit:
+            payload[FIELD_RESPONSE_CACHE_HIT] = True
+        if endpoint is not None:
+            payload[FIELD_ENDPOINT] = endpoint
+        if batch_job is not None:
+            payload[FIELD_BATCH_JOB] = batch_job
+        line = json.dumps(payload, ensure_ascii=False) + "\n"
+        with self._write_lock, self._path.open("a", encoding="utf-8") as f:
+            f.write(line)
 
     def stats(self, since: datetime | None = None) -> UsageStats:
         """Read the log and aggregate. ``since`` filters by timestamp
@@ -119,23 +171,42 @@ class UsageLog:
         call_count = 0
         total_input = 0
         total_output = 0
+        total_cache_read = 0
+        total_cache_write = 0
         total_latency = 0
         total_cost = 0.0
+        response_cache_hits = 0
+        batch_calls = 0
         by_provider: dict[str, int] = {}
         by_model: dict[str, int] = {}
+        by_endpoint: dict[str, int] = {}
+        latency_by_endpoint: dict[str, int] = {}
         since_iso = since.isoformat() if since is not None else None
         for record in self._iter_records():
             if since_iso is not None and str(record.get(FIELD_TIMESTAMP, "")) < since_iso:
                 continue
+            if record.get(FIELD_RESPONSE_CACHE_HIT) is True:
+                response_cache_hits += 1
+                continue
             call_count += 1
+            if record.get(FIELD_BATCH_JOB) is not None:
+                batch_calls += 1
             total_input += _as_int(record.get(FIELD_INPUT_TOKENS))
             total_output += _as_int(record.get(FIELD_OUTPUT_TOKENS))
+            total_cache_read += _as_int(record.get(FIELD_CACHE_READ_TOKENS))
+            total_cache_write += _as_int(record.get(FIELD_CACHE_WRITE_TOKENS))
             total_latency += _as_int(record.get(FIELD_LATENCY_MS))
             total_cost += _as_float(record.get(FIELD_COST_USD))
             provider = str(record.get(FIELD_PROVIDER, ""))
             model = str(record.get(FIELD_MODEL, ""))
             by_provider[provider] = by_provider.get(provider, 0) + 1
             by_model[model] = by_model.get(model, 0) + 1
+            endpoint = record.get(FIELD_ENDPOINT)
+            if isinstance(endpoint, str):
+                by_endpoint[endpoint] = by_endpoint.get(endpoint, 0) + 1
+                latency_by_endpoint[endpoint] = latency_by_endpoint.get(endpoint, 0) + _as_int(
+                    record.get(FIELD_LATENCY_MS)
+                )
         return UsageStats(
             call_count=call_count,
             total_input_tokens=total_input,
@@ -144,6 +215,12 @@ class UsageLog:
             total_cost_usd=total_cost,
             by_provider=by_provider,
             by_model=by_model,
+            total_cache_read_tokens=total_cache_read,
+            total_cache_write_tokens=total_cache_write,
+            response_cache_hits=response_cache_hits,
+            by_endpoint=by_endpoint,
+            latency_ms_by_endpoint=latency_by_endpoint,
+            batch_calls=batch_calls,
         )
 
     def estimate_for(
@@ -214,6 +291,48 @@ class UsageLog:
         median_cost_per_token = statistics.median(cost_per_token_samples)
         return median_cost_per_token * total_tokens
 
+    def estimate_latency_ms(self, provider_id: str, model: str | None = None) -> float | None:
+        """Median latency of past calls via ``(provider_id, model)``.
+
+        ``model`` ``None`` matches any model, as in :meth:`estimate_for`.
+        Returns ``None`` when no record qualifies (see :meth:`_call_median`).
+        """
+        return self._call_median(provider_id, model, FIELD_LATENCY_MS)
+
+    def estimate_input_tokens(self, provider_id: str, model: str | None = None) -> float | None:
+        """Median input tokens of past calls via ``(provider_id, model)``.
+
+        For LLM providers this is mostly the fixed system prompt, which a
+        character count of the source alone misses.
+        """
+        return self._call_median(provider_id, model, FIELD_INPUT_TOKENS)
+
+    def _call_median(self, provider_id: str, model: str | None, field_name: str) -> float | None:
+        """Median of a positive numeric field over past calls. Response-
+        cache hits and offline batch results are left out; they carry
+        no call latency."""
+        samples: list[int] = []
+        for record in self._iter_records():
+            if str(record.get(FIELD_PROVIDER, "")) != provider_id:
+                continue
+            if model is not None and str(record.get(FIELD_MODEL, "")) != model:
+                continue
+            if record.get(FIELD_RESPONSE_CACHE_HIT) is True:
+                continue
+            if record.get(FIELD_BATCH_JOB) is not None:
+                continue
+            value = _as_int(record.get(field_name))
+            if value > 0:
+                samples.append(value)
+        if not samples:
+            return None
+        return float(statistics.median(samples))
+
+    def records(self) -> Iterator[dict[str, object]]:
+        """Every readable record, oldest first. Adaptive routing starts
+        its per-provider windows from these."""
+        return self._iter_records()
+
     def _iter_records(self) -> Iterator[dict[str, object]]:
         if not self._path.exists():
             return
@@ -6,6 +6,10 @@ type so unhappy-path remediation lives in one place.
 
 Per AGENTS.md § Translation-Domain Conventions: API keys via env vars
 only, never in config files.
+
+Clients come from the process-wide
+:class:`~ainemo.providers._http.ClientRegistry`, shared per endpoint
+and key, over one tuned connection pool per endpoint.
 """
 
 from __future__ import annotations
@@ -13,10 +17,22 @@ from __future__ import annotations
 import os
 from typing import Final
 
-from anthropic import Anthropic
+from anthropic import (
+    Anthropic,
+    AsyncAnthropic,
+    DefaultAsyncHttpxClient,
+    DefaultHttpxClient,
+)
+
+from ainemo.providers._http import client_registry
+from ainemo.providers._ids import PROVIDER_ID_ANTHROPIC
 
 ENV_VAR_API_KEY: Final = "ANTHROPIC_API_KEY"
 
+# Same override the SDK itself honors; keys the registry's pools.
+ENV_VAR_BASE_URL: Final = "ANTHROPIC_BASE_URL"
+DEFAULT_BASE_URL: Final = "https://api.anthropic.com"
+
 
 class MissingAnthropicApiKey(Exception):
     """Raised when ``ANTHROPIC_API_KEY`` is unset at provider call
@@ -42,7 +58,51 @@ def build_client() -> Anthropic:
     api_key = os.getenv(ENV_VAR_API_KEY)
     if not api_key:
         raise MissingAnthropicApiKey()
-    return Anthropic(api_key=api_key)
+    registry = client_registry()
+    endpoint = _endpoint()
+    return registry.client(
+        PROVIDER_ID_ANTHROPIC,
+        endpoint,
+        api_key,
+        lambda: Anthropic(
+            api_key=api_key,
+            base_url=endpoint,
+            http_client=registry.http_client(PROVIDER_ID_ANTHROPIC, endpoint, DefaultHttpxClient),
+        ),
+    )
+
+
+def build_async_client() -> AsyncAnthropic:
+    """:func:`build_client` for the ``atranslate`` path — same env
+    var, same error when it is unset."""
+    api_key = os.getenv(ENV_VAR_API_KEY)
+    if not api_key:
+        raise MissingAnthropicApiKey()
+    registry = client_registry()
+    endpoint = _endpoint()
+    return registry.async_client(
+        PROVIDER_ID_ANTHROPIC,
+        endpoint,
+        api_key,
+        lambda: AsyncAnthropic(
+            api_key=api_key,
+            base_url=endpoint,
+            http_client=registry.async_http_client(
+                PROVIDER_ID_ANTHROPIC, endpoint, DefaultAsyncHttpxClient
+            ),
+        ),
+    )
+
+
+def _endpoint() -> str:
+    return os.getenv(ENV_VAR_BASE_URL) or DEFAULT_BASE_URL
 
 
-__all__ = ["ENV_VAR_API_KEY", "MissingAnthropicApiKey", "build_client"]
+__all__ = [
+    "DEFAULT_BASE_URL",
+    "ENV_VAR_API_KEY",
+    "ENV_VAR_BASE_URL",
+    "MissingAnthropicApiKey",
+    "build_async_client",
+    "build_client",
+]
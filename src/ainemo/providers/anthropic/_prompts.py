@@ -37,5 +37,33 @@ USER_MESSAGE_TEMPLATE: Final = (
     "preserving placeholders verbatim:\n\n{text}"
 )
 
+# Packed user-message template, used when ``pack_size`` > 1. ``{items}``
+# is a JSON array of id/text objects (see ainemo.providers._packing);
+# the reply is asked for in the same shape so it can be checked by id
+# and count. The system prompt stays the same as the per-segment one.
+PACKED_USER_MESSAGE_TEMPLATE: Final = (
+    'Translate the "text" of each of the {count} items in the following JSON '
+    "array from {from_lang} to {to_lang}, preserving placeholders verbatim. "
+    "Reply with only a JSON array holding one object per item, with the "
+    'item\'s "id" unchanged and its translation as "text".\n\n{items}'
+)
+
+# Multi-target user-message template (``multi_target=True``). Same items
+# as the packed template; ``{to_langs}`` is a comma-separated list of
+# BCP-47 tags, and each reply item maps every tag to its translation.
+MULTI_TARGET_USER_MESSAGE_TEMPLATE: Final = (
+    'Translate the "text" of each of the {count} items in the following JSON '
+    "array from {from_lang} into each of these languages: {to_langs}. "
+    "Preserve placeholders verbatim. Reply with only a JSON array holding one "
+    'object per item, with the item\'s "id" unchanged and a "translations" '
+    "object mapping each language tag to the translation.\n\n{items}"
+)
+
 
-__all__ = ["SYSTEM_PROMPT", "GLOSSARY_PREFIX", "USER_MESSAGE_TEMPLATE"]
+__all__ = [
+    "SYSTEM_PROMPT",
+    "GLOSSARY_PREFIX",
+    "MULTI_TARGET_USER_MESSAGE_TEMPLATE",
+    "PACKED_USER_MESSAGE_TEMPLATE",
+    "USER_MESSAGE_TEMPLATE",
+]
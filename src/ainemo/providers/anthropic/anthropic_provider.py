@@ -12,22 +12,62 @@ reviewer-validated logic (cycle-2 P2 follow-up): conditional unwrap
 of stray model-emitted quotes only when the source was unquoted; a
 single trailing newline is stripped, internal whitespace preserved
 verbatim.
+
+Prompt caching: the system prompt and the persona / glossary addendum
+go out as separate system blocks, each marked with an ephemeral
+``cache_control`` breakpoint, so every segment of a run re-reads them
+from Anthropic's prompt cache instead of paying full input price.
+Prefixes under the model's minimum cacheable length are simply not
+cached. ``usage.cache_creation_input_tokens`` and
+``usage.cache_read_input_tokens`` are recorded as ``cache_write_tokens``
+/ ``cache_read_tokens`` and priced at the cache-write and cache-read
+multiples of the input rate.
+
+Offline batch jobs (:class:`~ainemo.providers.base.BulkBatchProvider`)
+go through Message Batches: each request carries the same ``params``
+an interactive call would send, so prompt caching applies within the
+batch too.
 """
 
 from __future__ import annotations
 
 import time
-from typing import ClassVar, Final, Mapping
+from typing import ClassVar, Final, Mapping, Sequence
 
 from ainemo.core.segment import Segment
+from ainemo.providers._bulk import at_batch_price
 from ainemo.providers._ids import PROVIDER_ID_ANTHROPIC
-from ainemo.providers.anthropic._client import build_client
+from ainemo.providers._packing import (
+    DEFAULT_PACK_SIZE,
+    PackReply,
+    encode_pack,
+    pack_max_tokens,
+    translate_in_packs,
+    translate_multi_in_packs,
+)
+from ainemo.providers.anthropic._client import build_async_client, build_client
 from ainemo.providers.anthropic._prompts import (
     GLOSSARY_PREFIX,
+    MULTI_TARGET_USER_MESSAGE_TEMPLATE,
+    PACKED_USER_MESSAGE_TEMPLATE,
     SYSTEM_PROMPT,
     USER_MESSAGE_TEMPLATE,
 )
-from ainemo.providers.base import Provider, ProviderResult
+from ainemo.providers.base import (
+    BULK_STATE_ENDED,
+    BULK_STATE_PENDING,
+    AsyncProvider,
+    BulkBatchProvider,
+    BulkItem,
+    BulkRequest,
+    BulkStatus,
+    MultiTargetProvider,
+    PackingProvider,
+    Provider,
+    ProviderResult,
+    TokenUsage,
+    WarmableProvider,
+)
 
 # --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
 
@@ -47,10 +87,28 @@ _TEMPERATURE: Final = 0.0
 # context limit.
 DEFAULT_MAX_TOKENS: Final = 2000
 
+# Upper bound on ``max_tokens`` for a packed request, which is scaled
+# with the pack (see :func:`~ainemo.providers._packing.pack_max_tokens`);
+# 8,192 output tokens is within every supported Claude model's limit.
+_PACK_MAX_TOKENS_LIMIT: Final = 8_192
+
 # Anthropic Messages API content-block types.
 _CONTENT_BLOCK_TYPE_TEXT: Final = "text"
 _USER_ROLE: Final = "user"
 
+# Message Batches: the ``processing_status`` of a finished batch, and
+# the result type of a request that produced a message.
+_BATCH_STATUS_ENDED: Final = "ended"
+_BATCH_RESULT_SUCCEEDED: Final = "succeeded"
+
+# Prompt-cache breakpoint attached to each static system block.
+_CACHE_CONTROL: Final = {"type": "ephemeral"}
+
+# Prompt-cache pricing as multiples of the model's input rate (5-minute
+# ephemeral cache) — verify alongside the table below.
+_CACHE_WRITE_MULTIPLIER: Final = 1.25
+_CACHE_READ_MULTIPLIER: Final = 0.10
+
 # USD pricing per 1M tokens, by model id. Keys are dated model IDs
 # only — undated aliases shift behind the scenes and would make cost
 # surveillance non-deterministic. Models not in this table get
@@ -76,15 +134,26 @@ class AnthropicProvider:
         *,
         model: str = DEFAULT_MODEL,
         max_tokens: int = DEFAULT_MAX_TOKENS,
+        pack_size: int = DEFAULT_PACK_SIZE,
+        multi_target: bool = False,
+        prompt_caching: bool = True,
         client: object | None = None,
+        async_client: object | None = None,
     ) -> None:
+        if pack_size < 1:
+            raise ValueError(f"pack_size must be >= 1, got {pack_size}.")
         self._model = model
         self._max_tokens = max_tokens
+        self._pack_size = pack_size
+        self._multi_target = multi_target
+        self._prompt_caching = prompt_caching
         # `client` is injectable so unit tests pass a mock without
         # hitting the network or needing ANTHROPIC_API_KEY. Production
         # leaves it None and the provider lazily builds a real client
-        # on the first translate call.
+        # on the first translate call. `async_client` is the same for
+        # the `atranslate` path.
         self._client = client
+        self._async_client = async_client
 
     def translate(
         self,
@@ -94,48 +163,85 @@ class AnthropicProvider:
         system_prompt_addendum: str | None = None,
     ) -> ProviderResult:
         client = self._get_client()
-        user_message = USER_MESSAGE_TEMPLATE.format(
-            from_lang=segment.source_lang,
-            to_lang=target_lang,
-            text=segment.source_text,
-        )
-        # Cycle-3 S6: persona + termbase glossary block lands as a
-        # system-prompt addendum when the pipeline is wired with a
-        # termbase / persona. None preserves cycle-2 behavior.
-        system_prompt = (
-            SYSTEM_PROMPT
-            if not system_prompt_addendum
-            else f"{SYSTEM_PROMPT}\n\n{system_prompt_addendum}"
+        started = time.perf_counter()
+        response = client.messages.create(  # type: ignore[attr-defined]
+            **self._request_kwargs(segment, target_lang, system_prompt_addendum)
         )
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return self._to_result(response, segment, elapsed_ms)
 
+    async def atranslate(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> ProviderResult:
+        """Same request as :meth:`translate`, sent through the SDK's
+        ``AsyncAnthropic`` client."""
+        client = self._get_async_client()
         started = time.perf_counter()
-        # The Anthropic Messages API takes the system prompt as a
-        # top-level kwarg (not as a message), unlike the OpenAI chat
-        # API; everything else is the user message.
-        response = client.messages.create(  # type: ignore[attr-defined]
-            model=self._model,
-            max_tokens=self._max_tokens,
-            temperature=_TEMPERATURE,
-            system=system_prompt,
-            messages=[{"role": _USER_ROLE, "content": user_message}],
+        response = await client.messages.create(  # type: ignore[attr-defined]
+            **self._request_kwargs(segment, target_lang, system_prompt_addendum)
         )
         elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return self._to_result(response, segment, elapsed_ms)
 
-        target_text = _extract_target_text(response, segment.source_text)
-        input_tokens, output_tokens = _extract_usage(response)
-        cost_usd = _estimate_cost(self._model, input_tokens, output_tokens)
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        """Translate ``segments`` ``pack_size`` at a time, one Messages
+        call per pack (see :mod:`ainemo.providers._packing`).
+        ``max_tokens`` grows with each pack's size (see
+        :func:`~ainemo.providers._packing.pack_max_tokens`)."""
+        return translate_in_packs(
+            segments,
+            pack_size=self._pack_size,
+            send_pack=lambda pack: self._send_pack(pack, target_lang, system_prompt_addendum),
+            translate_one=lambda segment: self.translate(
+                segment, target_lang, system_prompt_addendum=system_prompt_addendum
+            ),
+            make_result=self._make_result,
+        )
 
-        return ProviderResult(
-            target_text=target_text,
-            provider=self.provider_id,
-            model=self._model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            latency_ms=elapsed_ms,
-            cost_usd=cost_usd,
-            confidence=None,
+    @property
+    def pack_size(self) -> int:
+        return self._pack_size
+
+    def translate_multi(
+        self,
+        segments: Sequence[Segment],
+        target_langs: Sequence[str],
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> dict[str, list[ProviderResult]]:
+        """Translate ``segments`` into all of ``target_langs``, one Messages call per pack
+        (at least one segment per pack)."""
+        return translate_multi_in_packs(
+            segments,
+            target_langs,
+            pack_size=self._pack_size,
+            send_pack=lambda pack, langs: self._send_multi_pack(
+                pack, langs, system_prompt_addendum
+            ),
+            translate_one=lambda segment, lang: self.translate(
+                segment, lang, system_prompt_addendum=system_prompt_addendum
+            ),
+            make_result=self._make_result,
         )
 
+    @property
+    def multi_target(self) -> bool:
+        return self._multi_target
+
+    @property
+    def model(self) -> str:
+        return self._model
+
     def supports(self, source_lang: str, target_lang: str) -> bool:
         # Claude handles every BCP-47 pair we'd realistically translate
         # for software i18n; the SDK doesn't expose a per-pair
@@ -143,6 +249,58 @@ class AnthropicProvider:
         # gating once benchmark data lands.
         return True
 
+    def warm_up(self, lang_pairs: Sequence[tuple[str, str]]) -> None:
+        """Build the SDK client ahead of the first call. Sends no
+        request, so warming costs nothing; ``lang_pairs`` is unused."""
+        del lang_pairs
+        self._get_client()
+
+    def submit_bulk(self, requests: Sequence[BulkRequest]) -> str:
+        """Create a Message Batch with one entry per request."""
+        batch = self._get_client().messages.batches.create(  # type: ignore[attr-defined]
+            requests=[
+                {
+                    "custom_id": request.custom_id,
+                    "params": self._request_kwargs(
+                        request.segment, request.target_lang, request.system_prompt_addendum
+                    ),
+                }
+                for request in requests
+            ]
+        )
+        return str(batch.id)
+
+    def poll_bulk(self, job_id: str) -> BulkStatus:
+        batch = self._get_client().messages.batches.retrieve(job_id)  # type: ignore[attr-defined]
+        counts = batch.request_counts
+        failed = counts.errored + counts.canceled + counts.expired
+        return BulkStatus(
+            job_id=job_id,
+            state=(
+                BULK_STATE_ENDED
+                if batch.processing_status == _BATCH_STATUS_ENDED
+                else BULK_STATE_PENDING
+            ),
+            total=counts.processing + counts.succeeded + failed,
+            succeeded=counts.succeeded,
+            failed=failed,
+        )
+
+    def collect_bulk(self, job_id: str, requests: Mapping[str, BulkRequest]) -> list[BulkItem]:
+        """Stream the batch's results file."""
+        items: list[BulkItem] = []
+        for entry in self._get_client().messages.batches.results(job_id):  # type: ignore[attr-defined]
+            custom_id = str(entry.custom_id)
+            request = requests.get(custom_id)
+            outcome = entry.result
+            if request is None or outcome.type != _BATCH_RESULT_SUCCEEDED:
+                error = getattr(outcome, "error", None) or outcome.type
+                items.append(BulkItem(custom_id=custom_id, result=None, error=str(error)))
+                continue
+            result = self._to_result(outcome.message, request.segment, 0)
+            items.append(BulkItem(custom_id=custom_id, result=at_batch_price(result)))
+        return items
+
     # --- Internals ---
 
     def _get_client(self) -> object:
@@ -150,6 +308,121 @@ class AnthropicProvider:
             self._client = build_client()
         return self._client
 
+    def _get_async_client(self) -> object:
+        # Not cached on the instance: async clients are bound to the
+        # event loop, and the registry already shares one per loop.
+        if self._async_client is not None:
+            return self._async_client
+        return build_async_client()
+
+    def _send_pack(
+        self, pack: Sequence[Segment], target_lang: str, system_prompt_addendum: str | None
+    ) -> PackReply:
+        user_message = PACKED_USER_MESSAGE_TEMPLATE.format(
+            count=len(pack),
+            from_lang=pack[0].source_lang,
+            to_lang=target_lang,
+            items=encode_pack(pack),
+        )
+        return self._send_packed(user_message, system_prompt_addendum, self._pack_max_tokens(pack))
+
+    def _send_multi_pack(
+        self,
+        pack: Sequence[Segment],
+        target_langs: Sequence[str],
+        system_prompt_addendum: str | None,
+    ) -> PackReply:
+        user_message = MULTI_TARGET_USER_MESSAGE_TEMPLATE.format(
+            count=len(pack),
+            from_lang=pack[0].source_lang,
+            to_langs=", ".join(target_langs),
+            items=encode_pack(pack),
+        )
+        return self._send_packed(
+            user_message,
+            system_prompt_addendum,
+            self._pack_max_tokens(pack, lang_count=len(target_langs)),
+        )
+
+    def _pack_max_tokens(self, pack: Sequence[Segment], *, lang_count: int = 1) -> int:
+        return pack_max_tokens(
+            pack,
+            lang_count=lang_count,
+            floor=self._max_tokens,
+            limit=max(self._max_tokens, _PACK_MAX_TOKENS_LIMIT),
+            provider_id=self.provider_id,
+        )
+
+    def _send_packed(
+        self, user_message: str, system_prompt_addendum: str | None, max_tokens: int
+    ) -> PackReply:
+        response = self._get_client().messages.create(  # type: ignore[attr-defined]
+            **self._messages_kwargs(user_message, system_prompt_addendum, max_tokens=max_tokens)
+        )
+        return PackReply(text=_extract_target_text(response, ""), usage=_extract_usage(response))
+
+    def _request_kwargs(
+        self, segment: Segment, target_lang: str, system_prompt_addendum: str | None
+    ) -> dict[str, object]:
+        user_message = USER_MESSAGE_TEMPLATE.format(
+            from_lang=segment.source_lang,
+            to_lang=target_lang,
+            text=segment.source_text,
+        )
+        return self._messages_kwargs(user_message, system_prompt_addendum)
+
+    def _messages_kwargs(
+        self,
+        user_message: str,
+        system_prompt_addendum: str | None,
+        *,
+        max_tokens: int | None = None,
+    ) -> dict[str, object]:
+        # Cycle-3 S6: persona + termbase glossary block lands as a
+        # system-prompt addendum when the pipeline is wired with a
+        # termbase / persona. None preserves cycle-2 behavior.
+        texts = (
+            [SYSTEM_PROMPT]
+            if not system_prompt_addendum
+            else [SYSTEM_PROMPT, system_prompt_addendum]
+        )
+        # The Anthropic Messages API takes the system prompt as a
+        # top-level kwarg (not as a message), unlike the OpenAI chat
+        # API; everything else is the user message. One block per
+        # static part, so a run sharing SYSTEM_PROMPT but switching
+        # personas still hits the cache for the first block.
+        system: list[dict[str, object]] = []
+        for text in texts:
+            block: dict[str, object] = {"type": _CONTENT_BLOCK_TYPE_TEXT, "text": text}
+            if self._prompt_caching:
+                block["cache_control"] = dict(_CACHE_CONTROL)
+            system.append(block)
+        return {
+            "model": self._model,
+            "max_tokens": max_tokens if max_tokens is not None else self._max_tokens,
+            "temperature": _TEMPERATURE,
+            "system": system,
+            "messages": [{"role": _USER_ROLE, "content": user_message}],
+        }
+
+    def _to_result(self, response: object, segment: Segment, elapsed_ms: int) -> ProviderResult:
+        target_text = _extract_target_text(response, segment.source_text)
+        return self._make_result(target_text, _extract_usage(response), elapsed_ms)
+
+    def _make_result(self, target_text: str, usage: TokenUsage, elapsed_ms: int) -> ProviderResult:
+        return ProviderResult(
+            target_text=target_text,
+            provider=self.provider_id,
+            model=self._model,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            latency_ms=elapsed_ms,
+            cost_usd=_estimate_cost(self._model, usage),
+            confidence=None,
+            cache_read_tokens=usage.cache_read_tokens,
+            cache_write_tokens=usage.cache_write_tokens,
+        )
+
 
 def _build_glossary_message(forbidden_terms: tuple[str, ...]) -> str:
     """Compose the glossary-injection suffix. Not yet wired into the
@@ -201,37 +474,63 @@ def _conditionally_unwrap_quotes(text: str, source_text: str) -> str:
     return text
 
 
-def _extract_usage(response: object) -> tuple[int | None, int | None]:
-    """Pull token-usage figures out of the Messages response. Returns
-    ``(None, None)`` when the SDK didn't populate ``usage``."""
+def _extract_usage(response: object) -> TokenUsage:
+    """Pull token-usage figures out of the Messages response. Fields
+    stay ``None`` when the SDK didn't populate them.
+
+    Anthropic's ``input_tokens`` counts only the uncached part of the
+    prompt; the cache reads and writes are added back so
+    ``input_tokens`` means the whole prompt, as for the other
+    providers."""
     usage = getattr(response, "usage", None)
     if usage is None:
-        return None, None
-    inp = getattr(usage, "input_tokens", None)
-    out = getattr(usage, "output_tokens", None)
-    return (
-        int(inp) if inp is not None else None,
-        int(out) if out is not None else None,
+        return TokenUsage()
+    uncached = _as_count(getattr(usage, "input_tokens", None))
+    written = _as_count(getattr(usage, "cache_creation_input_tokens", None))
+    read = _as_count(getattr(usage, "cache_read_input_tokens", None))
+    return TokenUsage(
+        input_tokens=(uncached + (written or 0) + (read or 0) if uncached is not None else None),
+        output_tokens=_as_count(getattr(usage, "output_tokens", None)),
+        cache_read_tokens=read,
+        cache_write_tokens=written,
     )
 
 
-def _estimate_cost(model: str, input_tokens: int | None, output_tokens: int | None) -> float | None:
-    """Multiply the per-1M-token rate by the actual token count.
+def _as_count(value: object) -> int | None:
+    return int(value) if isinstance(value, int) else None
+
+
+def _estimate_cost(model: str, usage: TokenUsage) -> float | None:
+    """Multiply the per-1M-token rates by the actual token counts, with
+    cache writes and reads at their multiples of the input rate.
     Returns ``None`` for unpriced models or when token counts are
     missing — None rather than zero so the "not measured" case stays
     distinguishable in the UsageLog."""
-    if input_tokens is None or output_tokens is None:
+    if usage.input_tokens is None or usage.output_tokens is None:
         return None
     rate = _PRICING_USD_PER_M_TOKENS.get(model)
     if rate is None:
         return None
     input_rate, output_rate = rate
-    return (input_tokens * input_rate + output_tokens * output_rate) / 1_000_000
+    written = usage.cache_write_tokens or 0
+    read = usage.cache_read_tokens or 0
+    uncached = max(usage.input_tokens - written - read, 0)
+    return (
+        uncached * input_rate
+        + written * input_rate * _CACHE_WRITE_MULTIPLIER
+        + read * input_rate * _CACHE_READ_MULTIPLIER
+        + usage.output_tokens * output_rate
+    ) / 1_000_000
 
 
 # Provider Protocol satisfaction is enforced via runtime_checkable; the
 # below assertion documents the cycle-2 contract at module-load time.
 _: type[Provider] = AnthropicProvider
+_async: type[AsyncProvider] = AnthropicProvider
+_warmable: type[WarmableProvider] = AnthropicProvider
+_packing: type[PackingProvider] = AnthropicProvider
+_multi: type[MultiTargetProvider] = AnthropicProvider
+_bulk: type[BulkBatchProvider] = AnthropicProvider
 
 
 __all__ = ["DEFAULT_MODEL", "DEFAULT_MAX_TOKENS", "AnthropicProvider"]
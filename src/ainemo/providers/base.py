@@ -17,8 +17,18 @@ constants in :mod:`ainemo.providers.nllb.nllb_provider` and
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
-from typing import ClassVar, Protocol, runtime_checkable
+from typing import (
+    ClassVar,
+    Final,
+    Literal,
+    Mapping,
+    Protocol,
+    Sequence,
+    TypeGuard,
+    runtime_checkable,
+)
 
 from ainemo.core.segment import Segment
 
@@ -63,6 +73,15 @@ class ProviderResult:
     output_tokens: int | None = None
     """Same shape as ``input_tokens``."""
 
+    cache_read_tokens: int | None = None
+    """Input tokens served from the provider's prompt cache. Part of
+    ``input_tokens`` and billed at the cheaper cached-input rate.
+    ``None`` when the provider reports no cache figures."""
+
+    cache_write_tokens: int | None = None
+    """Input tokens written to the provider's prompt cache. Also part of
+    ``input_tokens``; Anthropic bills them above the base input rate."""
+
     latency_ms: int = 0
     """Wall-clock duration of the provider call in milliseconds.
     Always populated; defaults to 0 only when the result is synthesized
@@ -77,6 +96,72 @@ class ProviderResult:
     confidence: float | None = None
     """Optional 0..1 confidence score the provider exposes."""
 
+    endpoint: str | None = None
+    """Endpoint that served the call when the provider balances over a
+    pool of them (see :mod:`ainemo.providers._endpoints`); ``None``
+    otherwise."""
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """Token counts reported for one API call, before they are priced
+    into a :class:`ProviderResult`. Same conventions as the matching
+    :class:`ProviderResult` fields: ``None`` means "not reported", and
+    the cache counts are part of ``input_tokens``."""
+
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    cache_read_tokens: int | None = None
+    cache_write_tokens: int | None = None
+
+
+# --- Module constants (no magic strings; AGENTS.md § Prohibited Patterns) ---
+
+# Offline batch-job states, provider-neutral (see :class:`BulkStatus`).
+BULK_STATE_PENDING: Final = "pending"
+BULK_STATE_ENDED: Final = "ended"
+BULK_STATE_FAILED: Final = "failed"
+
+BulkState = Literal["pending", "ended", "failed"]
+
+
+@dataclass(frozen=True)
+class BulkRequest:
+    """One segment/language pair in an offline batch job."""
+
+    custom_id: str
+    """Caller-chosen id, unique within the job; results come back
+    keyed by it, in no particular order."""
+
+    segment: Segment
+    target_lang: str
+    system_prompt_addendum: str | None = None
+
+
+@dataclass(frozen=True)
+class BulkStatus:
+    """Progress of an offline batch job."""
+
+    job_id: str
+    state: BulkState
+    """``pending`` while the provider works; ``ended`` once results
+    (possibly partial: expired or cancelled jobs) can be collected;
+    ``failed`` when the job was rejected as a whole."""
+
+    total: int
+    succeeded: int
+    failed: int
+
+
+@dataclass(frozen=True)
+class BulkItem:
+    """One request's outcome from a collected batch job: a result, or
+    the provider's error for that request."""
+
+    custom_id: str
+    result: ProviderResult | None
+    error: str | None = None
+
 
 @runtime_checkable
 class Provider(Protocol):
@@ -128,4 +213,246 @@ class Provider(Protocol):
         ...
 
 
-__all__ = ["Provider", "ProviderResult"]
+@runtime_checkable
+class AsyncProvider(Provider, Protocol):
+    """A :class:`Provider` with a native coroutine path.
+
+    Cloud providers implement :meth:`atranslate` over their SDK's async
+    client so one event loop can keep many calls in flight without a
+    thread per call. It is a separate Protocol rather than a new
+    :class:`Provider` member so sync-only backends (NLLB, OPUS, test
+    stubs) keep satisfying :class:`Provider` unchanged; callers go
+    through :func:`atranslate`, which adapts them.
+    """
+
+    async def atranslate(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> ProviderResult:
+        """Async counterpart of :meth:`Provider.translate`; same
+        contract, same result."""
+        ...
+
+
+@runtime_checkable
+class BatchProvider(Provider, Protocol):
+    """A :class:`Provider` that translates many segments in one call.
+
+    The local seq2seq providers (NLLB, OPUS) implement this over
+    :class:`~ainemo.providers._seq2seq.Seq2SeqEngine` so one padded
+    ``generate`` call serves a whole bucket of segments. Like
+    :class:`AsyncProvider` it is a separate Protocol, so single-segment
+    backends keep satisfying :class:`Provider` unchanged; the router's
+    :meth:`~ainemo.providers.router.ProviderRouter.translate_batch`
+    falls back to per-segment calls for them.
+    """
+
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        """Translate every segment to ``target_lang``.
+
+        Returns one :class:`ProviderResult` per input, in input order.
+        ``latency_ms`` on each result is the segment's share of the
+        batch's wall-clock time; the addendum applies to every segment.
+        """
+        ...
+
+
+@runtime_checkable
+class PackingProvider(BatchProvider, Protocol):
+    """A :class:`BatchProvider` whose batch path packs several segments
+    into each API request (see :mod:`ainemo.providers._packing`).
+
+    The LLM providers implement this. With :attr:`pack_size` 1, the
+    default, they send one request per segment just as
+    :meth:`Provider.translate` does, so :func:`uses_batch_path` keeps
+    them on the per-segment path.
+    """
+
+    @property
+    def pack_size(self) -> int:
+        """Most segments sent in one request."""
+        ...
+
+
+@runtime_checkable
+class MultiTargetProvider(Provider, Protocol):
+    """A :class:`Provider` that can translate segments into several
+    target languages in one request.
+
+    The LLM providers implement this. A bundle going to twelve languages
+    then sends its source text, placeholders and glossary once, not
+    twelve times. :attr:`multi_target` is the opt-in. While it is
+    ``False`` (the default) :func:`uses_multi_target_path` keeps the
+    provider on the one-language-per-call path.
+    """
+
+    @property
+    def multi_target(self) -> bool:
+        """Whether callers should use :meth:`translate_multi`."""
+        ...
+
+    def translate_multi(
+        self,
+        segments: Sequence[Segment],
+        target_langs: Sequence[str],
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> dict[str, list[ProviderResult]]:
+        """Translate every segment into every language in
+        ``target_langs``.
+
+        Returns ``{target_lang: results}`` for each requested language,
+        with one :class:`ProviderResult` per input segment, in input
+        order. The addendum applies to every language, so callers group
+        segments whose addendum differs by language into separate calls.
+        """
+        ...
+
+
+@runtime_checkable
+class ReleasableProvider(Provider, Protocol):
+    """A :class:`Provider` holding local model weights it can drop on
+    request.
+
+    Long-lived callers (the ``nemo daemon`` between phases of a build)
+    free memory through :meth:`release_models`; the provider reloads
+    whatever it needs on its next call.
+    """
+
+    def release_models(self, *, include_pinned: bool = False) -> int:
+        """Unload cached models and return how many were unloaded.
+        Pinned models stay loaded unless ``include_pinned``."""
+        ...
+
+
+@runtime_checkable
+class WarmableProvider(Provider, Protocol):
+    """A :class:`Provider` that can pay its start-up costs ahead of the
+    first real call.
+
+    The ``nemo daemon`` warms providers in a background thread
+    (``--preload`` / the ``warmup`` op) so the first request of a build
+    doesn't wait for a model load or SDK client construction.
+    """
+
+    def warm_up(self, lang_pairs: Sequence[tuple[str, str]]) -> None:
+        """Load whatever ``(source_lang, target_lang)`` pairs need.
+
+        Local models load and run one tiny generation per pair; API
+        providers build their client without sending a request. An
+        empty ``lang_pairs`` warms only what is pair-independent.
+        """
+        ...
+
+
+@runtime_checkable
+class BulkBatchProvider(Provider, Protocol):
+    """A :class:`Provider` that can run requests as an offline batch
+    job at the provider's batch price (see :mod:`ainemo.providers._bulk`).
+
+    The OpenAI (Batch API) and Anthropic (Message Batches) providers
+    implement this. Each request is the one :meth:`Provider.translate`
+    would send for it; the job finishes within the provider's window
+    (24 hours) rather than interactively.
+    """
+
+    @property
+    def model(self) -> str:
+        """Model id the job's requests run on."""
+        ...
+
+    def submit_bulk(self, requests: Sequence[BulkRequest]) -> str:
+        """Create a batch job for ``requests`` and return its id."""
+        ...
+
+    def poll_bulk(self, job_id: str) -> BulkStatus:
+        """Report the job's progress without fetching its results."""
+        ...
+
+    def collect_bulk(self, job_id: str, requests: Mapping[str, BulkRequest]) -> list[BulkItem]:
+        """Fetch an ended job's results. ``requests`` maps each
+        ``custom_id`` to the request it was submitted with. Results are
+        priced at the batch rate and have ``latency_ms`` 0."""
+        ...
+
+
+def uses_batch_path(provider: Provider) -> TypeGuard[BatchProvider]:
+    """``True`` when ``provider`` should get whole batches through
+    :meth:`BatchProvider.translate_batch` rather than one
+    :meth:`Provider.translate` call per segment.
+
+    A :class:`PackingProvider` qualifies only with a ``pack_size``
+    above 1.
+    """
+    if isinstance(provider, PackingProvider):
+        return provider.pack_size > 1
+    return isinstance(provider, BatchProvider)
+
+
+def uses_multi_target_path(provider: Provider) -> TypeGuard[MultiTargetProvider]:
+    """``True`` when ``provider`` should get several target languages
+    per call through :meth:`MultiTargetProvider.translate_multi`."""
+    return isinstance(provider, MultiTargetProvider) and provider.multi_target
+
+
+async def atranslate(
+    provider: Provider,
+    segment: Segment,
+    target_lang: str,
+    *,
+    system_prompt_addendum: str | None = None,
+) -> ProviderResult:
+    """Translate through ``provider`` without blocking the event loop.
+
+    Awaits :meth:`AsyncProvider.atranslate` when the provider has one;
+    otherwise runs the sync :meth:`Provider.translate` in the loop's
+    default thread executor. The addendum kwarg is passed only when
+    set, matching the router's sync call site.
+    """
+    if isinstance(provider, AsyncProvider):
+        if system_prompt_addendum is None:
+            return await provider.atranslate(segment, target_lang)
+        return await provider.atranslate(
+            segment, target_lang, system_prompt_addendum=system_prompt_addendum
+        )
+    if system_prompt_addendum is None:
+        return await asyncio.to_thread(provider.translate, segment, target_lang)
+    return await asyncio.to_thread(
+        provider.translate,
+        segment,
+        target_lang,
+        system_prompt_addendum=system_prompt_addendum,
+    )
+
+
+__all__ = [
+    "BULK_STATE_ENDED",
+    "BULK_STATE_FAILED",
+    "BULK_STATE_PENDING",
+    "AsyncProvider",
+    "BatchProvider",
+    "BulkBatchProvider",
+    "BulkItem",
+    "BulkRequest",
+    "BulkState",
+    "BulkStatus",
+    "MultiTargetProvider",
+    "PackingProvider",
+    "Provider",
+    "ProviderResult",
+    "ReleasableProvider",
+    "TokenUsage",
+    "WarmableProvider",
+    "atranslate",
+    "uses_batch_path",
+    "uses_multi_target_path",
+]
@@ -6,12 +6,23 @@ import time would penalize every code path that touches the providers
 package (test collection, the OpenAI/Anthropic CLIs, etc.). The
 :class:`NllbModelHolder` defers construction to the first translate
 call.
+
+:class:`~ainemo.providers._local_model.LocalModelOptions` (int8
+quantization, bf16, torch threads) are applied once, at that load.
 """
 
 from __future__ import annotations
 
+import gc
+import threading
 from typing import Any, Final
 
+from ainemo.providers._local_model import (
+    LocalModelOptions,
+    apply_thread_settings,
+    prepare_model,
+)
+
 # Default model id. NLLB-200 distilled-600M is the cycle-1 baseline;
 # users override via the constructor. Larger NLLB variants (1.3B, 3.3B)
 # trade quality for inference time/memory.
@@ -27,10 +38,19 @@ class NllbModelHolder:
     we hide that.
     """
 
-    def __init__(self, model_id: str = DEFAULT_MODEL, cache_dir: str | None = None) -> None:
+    def __init__(
+        self,
+        model_id: str = DEFAULT_MODEL,
+        cache_dir: str | None = None,
+        options: LocalModelOptions | None = None,
+    ) -> None:
         self._model_id = model_id
         self._cache_dir = cache_dir
+        self._options = options or LocalModelOptions()
         self._loaded: tuple[Any, Any] | None = None
+        # The daemon may warm the model in a background thread while a
+        # request asks for it; the lock keeps that to a single load.
+        self._lock = threading.Lock()
 
     @property
     def model_id(self) -> str:
@@ -38,22 +58,34 @@ class NllbModelHolder:
 
     def load(self) -> tuple[Any, Any]:
         """Return the (tokenizer, model) pair, loading on first call."""
-        if self._loaded is None:
-            from transformers import (
-                AutoConfig,
-                AutoModelForSeq2SeqLM,
-                AutoTokenizer,
-            )
-
-            config = AutoConfig.from_pretrained(self._model_id, cache_dir=self._cache_dir)
-            tokenizer = AutoTokenizer.from_pretrained(
-                self._model_id, config=config, cache_dir=self._cache_dir
-            )
-            model = AutoModelForSeq2SeqLM.from_pretrained(
-                self._model_id, config=config, cache_dir=self._cache_dir
-            )
-            self._loaded = (tokenizer, model)
-        return self._loaded
+        with self._lock:
+            if self._loaded is None:
+                from transformers import (
+                    AutoConfig,
+                    AutoModelForSeq2SeqLM,
+                    AutoTokenizer,
+                )
+
+                apply_thread_settings(self._options)
+                config = AutoConfig.from_pretrained(self._model_id, cache_dir=self._cache_dir)
+                tokenizer = AutoTokenizer.from_pretrained(
+                    self._model_id, config=config, cache_dir=self._cache_dir
+                )
+                model = AutoModelForSeq2SeqLM.from_pretrained(
+                    self._model_id, config=config, cache_dir=self._cache_dir
+                )
+                self._loaded = (tokenizer, prepare_model(model, self._options))
+            return self._loaded
+
+    def release(self) -> bool:
+        """Drop the loaded pair, if any; the next :meth:`load` reloads
+        it. Returns whether a model was loaded."""
+        with self._lock:
+            if self._loaded is None:
+                return False
+            self._loaded = None
+        gc.collect()
+        return True
 
 
 __all__ = ["DEFAULT_MODEL", "NllbModelHolder"]
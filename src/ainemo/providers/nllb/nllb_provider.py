@@ -5,16 +5,30 @@ NLLB-200 model via HuggingFace ``transformers``. NLLB is a local
 neural-machine-translation model — no API calls, no token billing.
 ``cost_usd`` and token counts are always ``None`` on the
 ProviderResult; latency is measured wall-clock.
+
+Generation runs through the shared
+:class:`~ainemo.providers._seq2seq.Seq2SeqEngine`: single segments are a
+one-element batch, and :meth:`NllbProvider.translate_batch` hands the
+engine whole lists so it can bucket and pad them into a few ``generate``
+calls.
 """
 
 from __future__ import annotations
 
 import time
-from typing import Any, ClassVar, Final, cast
+from typing import Any, ClassVar, Final, Sequence
 
 from ainemo.core.segment import Segment
 from ainemo.providers._ids import PROVIDER_ID_NLLB
-from ainemo.providers.base import Provider, ProviderResult
+from ainemo.providers._local_model import LocalModelOptions
+from ainemo.providers._seq2seq import WARMUP_KEY, WARMUP_TEXT, Seq2SeqEngine
+from ainemo.providers.base import (
+    BatchProvider,
+    Provider,
+    ProviderResult,
+    ReleasableProvider,
+    WarmableProvider,
+)
 from ainemo.providers.nllb._client import DEFAULT_MODEL, NllbModelHolder
 from ainemo.providers.nllb._languages import to_nllb_code
 
@@ -39,13 +53,21 @@ class NllbProvider:
         max_length: int = DEFAULT_MAX_LENGTH,
         cache_dir: str | None = None,
         model_holder: NllbModelHolder | None = None,
+        engine: Seq2SeqEngine | None = None,
+        options: LocalModelOptions | None = None,
     ) -> None:
         self._model_id = model
         self._max_length = max_length
+        # CPU execution options: load-time ones go to the holder, the
+        # decoding ones (beam width) to every generate call.
+        self._options = options or LocalModelOptions()
         # `model_holder` is injectable so unit tests pass a stub
         # without downloading 2.5GB. Production leaves it None and
         # the provider builds a real holder on first translate.
-        self._holder = model_holder or NllbModelHolder(model_id=model, cache_dir=cache_dir)
+        self._holder = model_holder or NllbModelHolder(
+            model_id=model, cache_dir=cache_dir, options=self._options
+        )
+        self._engine = engine or Seq2SeqEngine()
 
     def translate(
         self,
@@ -59,15 +81,7 @@ class NllbProvider:
         # ignored here. The pipeline still injects the addendum for
         # LLM providers in the same call site.
         del system_prompt_addendum
-        from_code = to_nllb_code(segment.source_lang)
-        to_code = to_nllb_code(target_lang)
-        if from_code is None or to_code is None:
-            raise ValueError(
-                f"NllbProvider does not support {segment.source_lang!r} → "
-                f"{target_lang!r}. Use `supports()` to gate before "
-                f"calling, or extend the BCP-47 → NLLB-200 map in "
-                f"`ainemo.providers.nllb._languages`."
-            )
+        from_code, to_code = _nllb_codes(segment.source_lang, target_lang)
 
         tokenizer, model = self._holder.load()
 
@@ -79,22 +93,98 @@ class NllbProvider:
             from_code=from_code,
             to_code=to_code,
             max_length=self._max_length,
+            engine=self._engine,
+            model_key=self._model_id,
+            generate_kwargs=self._options.generate_kwargs(),
         )
         elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return self._result(target_text, elapsed_ms)
 
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        """Translate ``segments`` through the shared engine.
+
+        Segments are grouped by NLLB source code (the tokenizer carries
+        one ``src_lang`` at a time); each group is one engine call, which
+        buckets and pads it into ``generate`` batches. Each result's
+        ``latency_ms`` is an even share of the whole call.
+        """
+        del system_prompt_addendum  # Same accept-and-ignore as `translate`.
+        if not segments:
+            return []
+        groups: dict[str, list[int]] = {}
+        to_code = ""
+        for index, segment in enumerate(segments):
+            from_code, to_code = _nllb_codes(segment.source_lang, target_lang)
+            groups.setdefault(from_code, []).append(index)
+
+        tokenizer, model = self._holder.load()
+
+        started = time.perf_counter()
+        target_texts = [""] * len(segments)
+        for from_code, indices in groups.items():
+            outputs = self._engine.translate_batch(
+                [segments[i].source_text for i in indices],
+                model_key=self._model_id,
+                tokenizer=tokenizer,
+                model=model,
+                max_length=self._max_length,
+                src_code=from_code,
+                tgt_code=to_code,
+                generate_kwargs=self._options.generate_kwargs(),
+            )
+            for index, text in zip(indices, outputs, strict=True):
+                target_texts[index] = text
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        share_ms = elapsed_ms // len(segments)
+        return [self._result(text, share_ms) for text in target_texts]
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return to_nllb_code(source_lang) is not None and to_nllb_code(target_lang) is not None
+
+    def warm_up(self, lang_pairs: Sequence[tuple[str, str]]) -> None:
+        """Load the model(s) for ``lang_pairs`` and translate one short
+        string per pair, so the first real call pays neither."""
+        for source_lang, target_lang in lang_pairs:
+            warmup = Segment(key=WARMUP_KEY, source_text=WARMUP_TEXT, source_lang=source_lang)
+            self.translate_batch([warmup], target_lang)
+
+    def release_models(self, *, include_pinned: bool = False) -> int:
+        """Unload the NLLB model; it reloads on the next translate. NLLB
+        holds a single model, which is never pinned."""
+        del include_pinned
+        return int(self._holder.release())
+
+    def _result(self, target_text: str, latency_ms: int) -> ProviderResult:
         return ProviderResult(
             target_text=target_text,
             provider=self.provider_id,
             model=self._model_id,
             input_tokens=None,  # NLLB doesn't expose token counts.
             output_tokens=None,
-            latency_ms=elapsed_ms,
+            latency_ms=latency_ms,
             cost_usd=None,  # Local model — no per-call cost.
             confidence=None,
         )
 
-    def supports(self, source_lang: str, target_lang: str) -> bool:
-        return to_nllb_code(source_lang) is not None and to_nllb_code(target_lang) is not None
+
+def _nllb_codes(source_lang: str, target_lang: str) -> tuple[str, str]:
+    """Map a BCP-47 pair to NLLB-200 codes or raise ``ValueError``."""
+    from_code = to_nllb_code(source_lang)
+    to_code = to_nllb_code(target_lang)
+    if from_code is None or to_code is None:
+        raise ValueError(
+            f"NllbProvider does not support {source_lang!r} → "
+            f"{target_lang!r}. Use `supports()` to gate before "
+            f"calling, or extend the BCP-47 → NLLB-200 map in "
+            f"`ainemo.providers.nllb._languages`."
+        )
+    return from_code, to_code
 
 
 def _translate_with_pipeline(
@@ -105,33 +195,36 @@ def _translate_with_pipeline(
     from_code: str,
     to_code: str,
     max_length: int,
+    engine: Seq2SeqEngine,
+    model_key: str,
+    generate_kwargs: dict[str, Any] | None = None,
 ) -> str:
-    """Build a one-shot translation pipeline and return the target
-    text. Pulled into a free function so tests can mock it cheaply
-    without standing up the HF transformers types."""
-    from transformers import pipeline
-
-    # The cycle-2 transformers stubs enumerate every task name as a
-    # Literal overload, but ``"translation"`` is missing despite being
-    # supported at runtime (transformers maps it onto a TextGeneration-
-    # like translation pipeline). Cast through Any so mypy stops trying
-    # to find a matching overload.
-    pipeline_factory = cast(Any, pipeline)
-    translator = pipeline_factory(
-        task="translation",
-        model=model,
+    """Translate one string as a one-element engine batch. Pulled into
+    a free function so tests can mock it cheaply without standing up
+    the HF transformers types.
+
+    This used to build a fresh ``transformers.pipeline("translation")``
+    per call. The engine instead reuses the cached forced-BOS setting
+    for the (model, source, target) pair and calls ``generate``
+    directly, which also keeps working on transformers releases that
+    no longer ship the translation pipeline task."""
+    outputs = engine.translate_batch(
+        [text],
+        model_key=model_key,
         tokenizer=tokenizer,
-        src_lang=from_code,
-        tgt_lang=to_code,
+        model=model,
         max_length=max_length,
+        src_code=from_code,
+        tgt_code=to_code,
+        generate_kwargs=generate_kwargs,
     )
-    output = translator(text)
-    if not output:
-        raise RuntimeError("NLLB translation pipeline returned empty output.")
-    return str(output[0]["translation_text"])
+    return outputs[0]
 
 
 _: type[Provider] = NllbProvider  # Protocol-conformance check at load time.
+_batch: type[BatchProvider] = NllbProvider
+_releasable: type[ReleasableProvider] = NllbProvider
+_warmable: type[WarmableProvider] = NllbProvider
 
 
 __all__ = ["DEFAULT_MAX_LENGTH", "NllbProvider"]
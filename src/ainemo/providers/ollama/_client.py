@@ -5,6 +5,17 @@ the official ``ollama`` Python SDK wraps it. There is no API key to
 read, but the host can be overridden via the ``OLLAMA_HOST`` env var
 or the constructor — same shape as the other providers' lazy clients
 so the cycle-2 ProviderRouter doesn't need to special-case Ollama.
+
+``OLLAMA_HOST`` (or the ``host`` argument) may list several daemons,
+comma-separated; :func:`resolve_hosts` splits it and the provider then
+balances requests over an
+:class:`~ainemo.providers._endpoints.EndpointPool`.
+
+Clients come from the process-wide
+:class:`~ainemo.providers._http.ClientRegistry`: one per host, over a
+shared, metered connection pool. The read timeout is left unbounded
+because the first call after a cold start may spend minutes loading
+the model.
 """
 
 from __future__ import annotations
@@ -12,7 +23,12 @@ from __future__ import annotations
 import os
 from typing import Final
 
-from ollama import Client
+import httpx
+from ollama import AsyncClient, Client
+
+from ainemo.providers._endpoints import split_endpoints
+from ainemo.providers._http import client_registry
+from ainemo.providers._ids import PROVIDER_ID_OLLAMA
 
 # Env var name for an alternate Ollama daemon host. Per AGENTS.md §
 # Translation-Domain Conventions: external endpoints via env var, not
@@ -22,18 +38,62 @@ ENV_VAR_HOST: Final = "OLLAMA_HOST"
 # Default daemon URL — matches the upstream ``ollama serve`` default.
 DEFAULT_HOST: Final = "http://localhost:11434"
 
+# Cheap endpoint for pool health checks.
+HEALTH_CHECK_PATH: Final = "/api/version"
+
+
+def resolve_hosts(host: str | None = None) -> tuple[str, ...]:
+    """The daemon URLs to use: ``host``, else the env var, else the
+    default, split on commas."""
+    return split_endpoints(host or os.getenv(ENV_VAR_HOST) or DEFAULT_HOST)
+
 
 def build_client(host: str | None = None) -> Client:
     """Construct an Ollama SDK client. ``host`` overrides the env var
-    which overrides the default daemon URL.
+    which overrides the default daemon URL; of a list, the first host
+    is used.
 
     Module-import remains side-effect free — building the client is
     cheap (no network call) but is still deferred so a misconfigured
     host shows up as a clear error from the first ``translate()``
     rather than swallowing the whole package import.
     """
-    target_host = host or os.getenv(ENV_VAR_HOST) or DEFAULT_HOST
-    return Client(host=target_host)
+    target_host = resolve_hosts(host)[0]
+    registry = client_registry()
+    return registry.client(
+        PROVIDER_ID_OLLAMA,
+        target_host,
+        "",
+        lambda: Client(
+            host=target_host,
+            transport=registry.transport(PROVIDER_ID_OLLAMA, target_host, httpx),
+            timeout=registry.timeout(httpx, bounded_read=False),
+        ),
+    )
+
+
+def build_async_client(host: str | None = None) -> AsyncClient:
+    """:func:`build_client` for the ``atranslate`` path; same host
+    resolution."""
+    target_host = resolve_hosts(host)[0]
+    registry = client_registry()
+    return registry.async_client(
+        PROVIDER_ID_OLLAMA,
+        target_host,
+        "",
+        lambda: AsyncClient(
+            host=target_host,
+            transport=registry.async_transport(PROVIDER_ID_OLLAMA, target_host, httpx),
+            timeout=registry.timeout(httpx, bounded_read=False),
+        ),
+    )
 
 
-__all__ = ["DEFAULT_HOST", "ENV_VAR_HOST", "build_client"]
+__all__ = [
+    "DEFAULT_HOST",
+    "ENV_VAR_HOST",
+    "HEALTH_CHECK_PATH",
+    "build_async_client",
+    "build_client",
+    "resolve_hosts",
+]
@@ -8,6 +8,11 @@ a HuggingFace download or a cloud API bill.
 Per cycle-2 pitch open-question 5: default model is **``llama3.2``**.
 Users override via routes.yaml for ``qwen``, ``gemma``, etc.
 
+``host`` (or ``OLLAMA_HOST``) may list several daemons, comma-
+separated; requests are then balanced over them by an
+:class:`~ainemo.providers._endpoints.EndpointPool` and each result
+names the daemon that served it.
+
 ``cost_usd`` is always ``None`` — local execution has no per-call
 billable cost. Token counts come from ``prompt_eval_count`` /
 ``eval_count`` in the chat response when the underlying Ollama model
@@ -18,14 +23,37 @@ are ``None`` (the UsageLog distinguishes "not measured" from zero).
 from __future__ import annotations
 
 import time
-from typing import ClassVar, Final
+from typing import ClassVar, Final, Sequence
 
 from ainemo.core.segment import Segment
+from ainemo.providers._endpoints import EndpointPool, endpoint_pools, http_probe
 from ainemo.providers._ids import PROVIDER_ID_OLLAMA
-from ainemo.providers.base import Provider, ProviderResult
-from ainemo.providers.ollama._client import build_client
+from ainemo.providers._packing import (
+    DEFAULT_PACK_SIZE,
+    PackReply,
+    encode_pack,
+    translate_in_packs,
+    translate_multi_in_packs,
+)
+from ainemo.providers.base import (
+    AsyncProvider,
+    MultiTargetProvider,
+    PackingProvider,
+    Provider,
+    ProviderResult,
+    TokenUsage,
+    WarmableProvider,
+)
+from ainemo.providers.ollama._client import (
+    HEALTH_CHECK_PATH,
+    build_async_client,
+    build_client,
+    resolve_hosts,
+)
 from ainemo.providers.ollama._prompts import (
     GLOSSARY_PREFIX,
+    MULTI_TARGET_USER_MESSAGE_TEMPLATE,
+    PACKED_USER_MESSAGE_TEMPLATE,
     SYSTEM_PROMPT,
     USER_MESSAGE_TEMPLATE,
 )
@@ -59,15 +87,24 @@ class OllamaProvider:
         *,
         model: str = DEFAULT_MODEL,
         host: str | None = None,
+        pack_size: int = DEFAULT_PACK_SIZE,
+        multi_target: bool = False,
         client: object | None = None,
+        async_client: object | None = None,
     ) -> None:
+        if pack_size < 1:
+            raise ValueError(f"pack_size must be >= 1, got {pack_size}.")
         self._model = model
         self._host = host
+        self._pack_size = pack_size
+        self._multi_target = multi_target
         # `client` is injectable so unit tests pass a fake without
         # hitting any HTTP daemon. Production leaves it None and the
         # provider lazily builds a real client on the first translate
-        # call.
+        # call. `async_client` is the same for the `atranslate` path.
         self._client = client
+        self._async_client = async_client
+        self._pool: EndpointPool | None = None
 
     def translate(
         self,
@@ -76,47 +113,82 @@ class OllamaProvider:
         *,
         system_prompt_addendum: str | None = None,
     ) -> ProviderResult:
-        client = self._get_client()
-        user_message = USER_MESSAGE_TEMPLATE.format(
-            from_lang=segment.source_lang,
-            to_lang=target_lang,
-            text=segment.source_text,
-        )
-        # Cycle-3 S6: persona + termbase glossary block lands as a
-        # system-prompt addendum when the pipeline is wired with a
-        # termbase / persona. None preserves cycle-2 behavior.
-        system_content = (
-            SYSTEM_PROMPT
-            if not system_prompt_addendum
-            else f"{SYSTEM_PROMPT}\n\n{system_prompt_addendum}"
+        started = time.perf_counter()
+        response, endpoint = self._chat(
+            self._request_kwargs(segment, target_lang, system_prompt_addendum)
         )
-        messages = [
-            {"role": _ROLE_SYSTEM, "content": system_content},
-            {"role": _ROLE_USER, "content": user_message},
-        ]
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return self._to_result(response, segment, elapsed_ms, endpoint)
 
+    async def atranslate(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> ProviderResult:
+        """Same request as :meth:`translate`, sent through the SDK's
+        ``ollama.AsyncClient``."""
         started = time.perf_counter()
-        response = client.chat(  # type: ignore[attr-defined]
-            model=self._model,
-            messages=messages,
-            options={_OPTION_KEY_TEMPERATURE: _TEMPERATURE},
+        response, endpoint = await self._achat(
+            self._request_kwargs(segment, target_lang, system_prompt_addendum)
         )
         elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return self._to_result(response, segment, elapsed_ms, endpoint)
 
-        target_text = _extract_target_text(response, segment.source_text)
-        input_tokens, output_tokens = _extract_usage(response)
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        """Translate ``segments`` ``pack_size`` at a time, one chat call
+        per pack (see :mod:`ainemo.providers._packing`)."""
+        return translate_in_packs(
+            segments,
+            pack_size=self._pack_size,
+            send_pack=lambda pack: self._send_pack(pack, target_lang, system_prompt_addendum),
+            translate_one=lambda segment: self.translate(
+                segment, target_lang, system_prompt_addendum=system_prompt_addendum
+            ),
+            make_result=self._make_result,
+        )
 
-        return ProviderResult(
-            target_text=target_text,
-            provider=self.provider_id,
-            model=self._model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            latency_ms=elapsed_ms,
-            cost_usd=None,  # Local execution; no per-call billable cost.
-            confidence=None,
+    @property
+    def pack_size(self) -> int:
+        return self._pack_size
+
+    def translate_multi(
+        self,
+        segments: Sequence[Segment],
+        target_langs: Sequence[str],
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> dict[str, list[ProviderResult]]:
+        """Translate ``segments`` into all of ``target_langs``, one chat call per pack
+        (at least one segment per pack)."""
+        return translate_multi_in_packs(
+            segments,
+            target_langs,
+            pack_size=self._pack_size,
+            send_pack=lambda pack, langs: self._send_multi_pack(
+                pack, langs, system_prompt_addendum
+            ),
+            translate_one=lambda segment, lang: self.translate(
+                segment, lang, system_prompt_addendum=system_prompt_addendum
+            ),
+            make_result=self._make_result,
         )
 
+    @property
+    def multi_target(self) -> bool:
+        return self._multi_target
+
+    @property
+    def model(self) -> str:
+        return self._model
+
     def supports(self, source_lang: str, target_lang: str) -> bool:
         # The supported pair set depends on the locally-pulled model
         # (llama3.2 covers most BCP-47 pairs we'd realistically use
@@ -125,6 +197,18 @@ class OllamaProvider:
         # tells us which pairs are unsafe.
         return True
 
+    def warm_up(self, lang_pairs: Sequence[tuple[str, str]]) -> None:
+        """Build the SDK client ahead of the first call, sending no
+        request. With several hosts, health-check each instead, so a
+        daemon that is down is out of rotation before the first call.
+        ``lang_pairs`` is unused."""
+        del lang_pairs
+        pool = self._get_pool()
+        if pool is None:
+            self._get_client()
+        else:
+            pool.check_health()
+
     # --- Internals ---
 
     def _get_client(self) -> object:
@@ -132,6 +216,128 @@ class OllamaProvider:
             self._client = build_client(self._host)
         return self._client
 
+    def _get_pool(self) -> EndpointPool | None:
+        """The shared pool over the configured hosts; ``None`` for a
+        single host or an injected client."""
+        if self._pool is None and self._client is None and self._async_client is None:
+            hosts = resolve_hosts(self._host)
+            if len(hosts) > 1:
+                self._pool = endpoint_pools().pool(
+                    self.provider_id, hosts, probe=http_probe(HEALTH_CHECK_PATH)
+                )
+        return self._pool
+
+    def _chat(self, kwargs: dict[str, object]) -> tuple[object, str | None]:
+        """Send one chat request; returns the response and the pooled
+        host that served it."""
+        pool = self._get_pool()
+        if pool is None:
+            return self._get_client().chat(**kwargs), None  # type: ignore[attr-defined]
+        with pool.lease() as host:
+            client: object = build_client(host)
+            return client.chat(**kwargs), host  # type: ignore[attr-defined]
+
+    async def _achat(self, kwargs: dict[str, object]) -> tuple[object, str | None]:
+        """:meth:`_chat` through the async client."""
+        pool = self._get_pool()
+        if pool is None:
+            client = self._get_async_client()
+            return await client.chat(**kwargs), None  # type: ignore[attr-defined]
+        async with pool.alease() as host:
+            async_client: object = build_async_client(host)
+            return await async_client.chat(**kwargs), host  # type: ignore[attr-defined]
+
+    def _get_async_client(self) -> object:
+        # Not cached on the instance: async clients are bound to the
+        # event loop, and the registry already shares one per loop.
+        if self._async_client is not None:
+            return self._async_client
+        return build_async_client(self._host)
+
+    def _send_pack(
+        self, pack: Sequence[Segment], target_lang: str, system_prompt_addendum: str | None
+    ) -> PackReply:
+        user_message = PACKED_USER_MESSAGE_TEMPLATE.format(
+            count=len(pack),
+            from_lang=pack[0].source_lang,
+            to_lang=target_lang,
+            items=encode_pack(pack),
+        )
+        return self._send_packed(user_message, system_prompt_addendum)
+
+    def _send_multi_pack(
+        self,
+        pack: Sequence[Segment],
+        target_langs: Sequence[str],
+        system_prompt_addendum: str | None,
+    ) -> PackReply:
+        user_message = MULTI_TARGET_USER_MESSAGE_TEMPLATE.format(
+            count=len(pack),
+            from_lang=pack[0].source_lang,
+            to_langs=", ".join(target_langs),
+            items=encode_pack(pack),
+        )
+        return self._send_packed(user_message, system_prompt_addendum)
+
+    def _send_packed(self, user_message: str, system_prompt_addendum: str | None) -> PackReply:
+        response, endpoint = self._chat(self._chat_kwargs(user_message, system_prompt_addendum))
+        return PackReply(
+            text=_extract_target_text(response, ""),
+            usage=_extract_usage(response),
+            endpoint=endpoint,
+        )
+
+    def _request_kwargs(
+        self, segment: Segment, target_lang: str, system_prompt_addendum: str | None
+    ) -> dict[str, object]:
+        user_message = USER_MESSAGE_TEMPLATE.format(
+            from_lang=segment.source_lang,
+            to_lang=target_lang,
+            text=segment.source_text,
+        )
+        return self._chat_kwargs(user_message, system_prompt_addendum)
+
+    def _chat_kwargs(
+        self, user_message: str, system_prompt_addendum: str | None
+    ) -> dict[str, object]:
+        # Cycle-3 S6: persona + termbase glossary block lands as a
+        # system-prompt addendum when the pipeline is wired with a
+        # termbase / persona. None preserves cycle-2 behavior.
+        system_content = (
+            SYSTEM_PROMPT
+            if not system_prompt_addendum
+            else f"{SYSTEM_PROMPT}\n\n{system_prompt_addendum}"
+        )
+        return {
+            "model": self._model,
+            "messages": [
+                {"role": _ROLE_SYSTEM, "content": system_content},
+                {"role": _ROLE_USER, "content": user_message},
+            ],
+            "options": {_OPTION_KEY_TEMPERATURE: _TEMPERATURE},
+        }
+
+    def _to_result(
+        self, response: object, segment: Segment, elapsed_ms: int, endpoint: str | None
+    ) -> ProviderResult:
+        target_text = _extract_target_text(response, segment.source_text)
+        return self._make_result(target_text, _extract_usage(response), elapsed_ms, endpoint)
+
+    def _make_result(
+        self, target_text: str, usage: TokenUsage, elapsed_ms: int, endpoint: str | None = None
+    ) -> ProviderResult:
+        return ProviderResult(
+            target_text=target_text,
+            provider=self.provider_id,
+            model=self._model,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            latency_ms=elapsed_ms,
+            cost_usd=None,  # Local execution; no per-call billable cost.
+            confidence=None,
+            endpoint=endpoint,
+        )
+
 
 def _build_glossary_message(forbidden_terms: tuple[str, ...]) -> str:
     """Compose the glossary-injection suffix. Cycle 3 termbase work
@@ -176,23 +382,29 @@ def _conditionally_unwrap_quotes(text: str, source_text: str) -> str:
     return text
 
 
-def _extract_usage(response: object) -> tuple[int | None, int | None]:
+def _extract_usage(response: object) -> TokenUsage:
     """Pull token-usage figures out of the chat response. Ollama
     populates ``prompt_eval_count`` (input) and ``eval_count`` (output)
     on most models; older or modified models may omit either, in
     which case the missing field becomes ``None`` so the UsageLog
-    records "not measured" rather than zero."""
+    records "not measured" rather than zero. Ollama reuses its KV
+    cache silently and reports no cache figures, so those stay
+    ``None``."""
     prompt = getattr(response, "prompt_eval_count", None)
     completion = getattr(response, "eval_count", None)
-    return (
-        int(prompt) if prompt is not None else None,
-        int(completion) if completion is not None else None,
+    return TokenUsage(
+        input_tokens=int(prompt) if prompt is not None else None,
+        output_tokens=int(completion) if completion is not None else None,
     )
 
 
 # Provider Protocol satisfaction is enforced via runtime_checkable; the
 # below assertion documents the cycle-2 contract at module-load time.
 _: type[Provider] = OllamaProvider
+_async: type[AsyncProvider] = OllamaProvider
+_warmable: type[WarmableProvider] = OllamaProvider
+_packing: type[PackingProvider] = OllamaProvider
+_multi: type[MultiTargetProvider] = OllamaProvider
 
 
 __all__ = ["DEFAULT_MODEL", "OllamaProvider"]
@@ -6,6 +6,11 @@ the env var for every code path that touches ``ainemo.providers``
 (test collection, the NLLB CLI, etc.) — the cycle-0 audit-bug fix
 moved construction into ``OpenAITranslatorModel.__init__``; cycle 2
 keeps that pattern but lifts it into its own helper module.
+
+Clients come from the process-wide
+:class:`~ainemo.providers._http.ClientRegistry`, so every provider
+instance talking to the same endpoint with the same key shares one
+SDK client and one tuned connection pool.
 """
 
 from __future__ import annotations
@@ -13,12 +18,26 @@ from __future__ import annotations
 import os
 from typing import Final
 
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+
+from ainemo.providers._endpoints import split_endpoints
+from ainemo.providers._http import client_registry
+from ainemo.providers._ids import PROVIDER_ID_OPENAI
 
 # Env var name. Per AGENTS.md § Translation-Domain Conventions: API
 # keys via env vars only, never in config files.
 ENV_VAR_API_KEY: Final = "OPENAI_API_KEY"
 
+# Same override the SDK itself honors, read here so the registry can
+# key pools by endpoint (OpenAI-compatible gateways, Azure proxies).
+# A comma-separated list balances requests over several gateways.
+ENV_VAR_BASE_URL: Final = "OPENAI_BASE_URL"
+DEFAULT_BASE_URL: Final = "https://api.openai.com/v1"
+
+# Cheap endpoint for pool health checks; any reply below 500 (401
+# included) means the gateway is up.
+HEALTH_CHECK_PATH: Final = "/models"
+
 
 class MissingOpenAiApiKey(Exception):
     """Raised when ``OPENAI_API_KEY`` is unset at provider-construction
@@ -34,8 +53,9 @@ class MissingOpenAiApiKey(Exception):
         )
 
 
-def build_client() -> OpenAI:
-    """Read the API key from the env and construct an SDK client.
+def build_client(base_url: str | None = None) -> OpenAI:
+    """Read the API key from the env and construct an SDK client for
+    ``base_url`` (default: the first of :func:`resolve_base_urls`).
 
     Raises :class:`MissingOpenAiApiKey` when the env var is unset, so
     cleanup of the unhappy path lives in one place rather than at
@@ -44,7 +64,55 @@ def build_client() -> OpenAI:
     api_key = os.getenv(ENV_VAR_API_KEY)
     if not api_key:
         raise MissingOpenAiApiKey()
-    return OpenAI(api_key=api_key)
+    registry = client_registry()
+    endpoint = resolve_base_urls(base_url)[0]
+    return registry.client(
+        PROVIDER_ID_OPENAI,
+        endpoint,
+        api_key,
+        lambda: OpenAI(
+            api_key=api_key,
+            base_url=endpoint,
+            http_client=registry.http_client(PROVIDER_ID_OPENAI, endpoint, DefaultHttpxClient),
+        ),
+    )
+
+
+def build_async_client(base_url: str | None = None) -> AsyncOpenAI:
+    """:func:`build_client` for the ``atranslate`` path — same env
+    var, same error when it is unset."""
+    api_key = os.getenv(ENV_VAR_API_KEY)
+    if not api_key:
+        raise MissingOpenAiApiKey()
+    registry = client_registry()
+    endpoint = resolve_base_urls(base_url)[0]
+    return registry.async_client(
+        PROVIDER_ID_OPENAI,
+        endpoint,
+        api_key,
+        lambda: AsyncOpenAI(
+            api_key=api_key,
+            base_url=endpoint,
+            http_client=registry.async_http_client(
+                PROVIDER_ID_OPENAI, endpoint, DefaultAsyncHttpxClient
+            ),
+        ),
+    )
+
+
+def resolve_base_urls(base_url: str | None = None) -> tuple[str, ...]:
+    """The API base URLs to use: ``base_url``, else the env var, else
+    the default, split on commas."""
+    return split_endpoints(base_url or os.getenv(ENV_VAR_BASE_URL) or DEFAULT_BASE_URL)
 
 
-__all__ = ["ENV_VAR_API_KEY", "MissingOpenAiApiKey", "build_client"]
+__all__ = [
+    "DEFAULT_BASE_URL",
+    "ENV_VAR_API_KEY",
+    "ENV_VAR_BASE_URL",
+    "HEALTH_CHECK_PATH",
+    "MissingOpenAiApiKey",
+    "build_async_client",
+    "build_client",
+    "resolve_base_urls",
+]
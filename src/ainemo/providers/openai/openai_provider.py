@@ -4,19 +4,73 @@ Implements :class:`ainemo.providers.base.Provider` against the OpenAI
 chat-completions API. Per the cycle-2 pitch's open-question 4
 resolution: default model is ``gpt-4o-2024-11-20``; configurable via
 constructor or routes.yaml.
+
+Prompt caching: OpenAI caches long prompt prefixes automatically, so
+the request keeps everything static first — the system prompt, then
+the persona / glossary addendum — and the per-segment text last, in
+the user message. Cached prompt tokens come back as
+``usage.prompt_tokens_details.cached_tokens``; they are recorded as
+``cache_read_tokens`` and priced at the model's cached-input rate.
+
+``base_url`` (or ``OPENAI_BASE_URL``) may list several OpenAI-compatible
+gateways, comma-separated; requests are then balanced over them by an
+:class:`~ainemo.providers._endpoints.EndpointPool` and each result
+names the gateway that served it.
+
+Offline batch jobs (:class:`~ainemo.providers.base.BulkBatchProvider`)
+go through the Batch API: the chat-completion requests are uploaded as
+one JSONL file, the batch is created over it, and the output file's
+lines are parsed like interactive responses. Batch jobs use the first
+configured gateway only.
 """
 
 from __future__ import annotations
 
+import json
 import time
-from typing import ClassVar, Final, Mapping
+from typing import ClassVar, Final, Mapping, Sequence
+
+from openai.types.chat import ChatCompletion
 
 from ainemo.core.segment import Segment
+from ainemo.providers._bulk import at_batch_price
+from ainemo.providers._endpoints import EndpointPool, endpoint_pools, http_probe
 from ainemo.providers._ids import PROVIDER_ID_OPENAI
-from ainemo.providers.base import Provider, ProviderResult
-from ainemo.providers.openai._client import build_client
+from ainemo.providers._packing import (
+    DEFAULT_PACK_SIZE,
+    PackReply,
+    encode_pack,
+    pack_max_tokens,
+    translate_in_packs,
+    translate_multi_in_packs,
+)
+from ainemo.providers.base import (
+    BULK_STATE_ENDED,
+    BULK_STATE_FAILED,
+    BULK_STATE_PENDING,
+    AsyncProvider,
+    BulkBatchProvider,
+    BulkItem,
+    BulkRequest,
+    BulkState,
+    BulkStatus,
+    MultiTargetProvider,
+    PackingProvider,
+    Provider,
+    ProviderResult,
+    TokenUsage,
+    WarmableProvider,
+)
+from ainemo.providers.openai._client import (
+    HEALTH_CHECK_PATH,
+    build_async_client,
+    build_client,
+    resolve_base_urls,
+)
 from ainemo.providers.openai._prompts import (
     GLOSSARY_PREFIX,
+    MULTI_TARGET_USER_MESSAGE_TEMPLATE,
+    PACKED_USER_MESSAGE_TEMPLATE,
     SYSTEM_PROMPT,
     USER_MESSAGE_TEMPLATE,
 )
@@ -41,20 +95,40 @@ _PRESENCE_PENALTY: Final = 0.0
 # segment including ICU plurals with multiple branches.
 DEFAULT_MAX_TOKENS: Final = 2000
 
+# Upper bound on ``max_tokens`` for a packed request, which is scaled
+# with the pack (see :func:`~ainemo.providers._packing.pack_max_tokens`);
+# GPT-4o and GPT-4.1 cap completions at 16,384 tokens.
+_PACK_MAX_TOKENS_LIMIT: Final = 16_384
+
 # USD pricing per 1M tokens, by model id. Keys are dated model IDs
 # only — undated aliases (e.g. "gpt-4o") shift behind the scenes
 # and would make cost surveillance non-deterministic. Models not in
 # this table get cost_usd=None on their ProviderResult; the cycle-3+
 # upgrade adds entries as new models ship.
-_PRICING_USD_PER_M_TOKENS: Mapping[str, tuple[float, float]] = {
-    # (input_per_M, output_per_M) — verify in
-    # https://platform.openai.com/docs/pricing before touching.
-    "gpt-4o-2024-11-20": (2.50, 10.00),
-    "gpt-4o-2024-08-06": (2.50, 10.00),
-    "gpt-4o-mini-2024-07-18": (0.15, 0.60),
-    "gpt-4-turbo-2024-04-09": (10.00, 30.00),
+_PRICING_USD_PER_M_TOKENS: Mapping[str, tuple[float, float, float]] = {
+    # (input_per_M, cached_input_per_M, output_per_M) — verify in
+    # https://platform.openai.com/docs/pricing before touching. Models
+    # without prompt-caching discounts repeat the input rate.
+    "gpt-4o-2024-11-20": (2.50, 1.25, 10.00),
+    "gpt-4o-2024-08-06": (2.50, 1.25, 10.00),
+    "gpt-4o-mini-2024-07-18": (0.15, 0.075, 0.60),
+    "gpt-4-turbo-2024-04-09": (10.00, 10.00, 30.00),
 }
 
+# Batch API parameters. Each JSONL line repeats the endpoint path.
+_BATCH_ENDPOINT: Final = "/v1/chat/completions"
+_BATCH_COMPLETION_WINDOW: Final = "24h"
+_BATCH_FILE_PURPOSE: Final = "batch"
+_BATCH_FILE_NAME: Final = "ainemo-batch.jsonl"
+_BATCH_METHOD: Final = "POST"
+_HTTP_OK: Final = 200
+
+# Batch statuses by outcome; the rest (validating, in_progress,
+# finalizing, cancelling) are pending. Expired and cancelled batches
+# still carry the results that completed.
+_BATCH_STATUS_FAILED: Final = "failed"
+_BATCH_STATUSES_ENDED: Final = frozenset({"completed", "expired", "cancelled"})
+
 
 class OpenAIProvider:
     """:class:`ainemo.providers.base.Provider` over OpenAI chat
@@ -67,16 +141,28 @@ class OpenAIProvider:
         *,
         model: str = DEFAULT_MODEL,
         max_tokens: int = DEFAULT_MAX_TOKENS,
+        pack_size: int = DEFAULT_PACK_SIZE,
+        multi_target: bool = False,
+        base_url: str | None = None,
         client: object | None = None,
+        async_client: object | None = None,
     ) -> None:
+        if pack_size < 1:
+            raise ValueError(f"pack_size must be >= 1, got {pack_size}.")
         self._model = model
+        self._base_url = base_url
         self._max_tokens = max_tokens
+        self._pack_size = pack_size
+        self._multi_target = multi_target
         # `client` is injectable so unit tests pass a mock without
         # hitting the network or needing OPENAI_API_KEY. Production
         # leaves it None and the provider lazily builds a real client
         # on the first translate call (also keeps __init__ cheap and
-        # env-var-free at import time).
+        # env-var-free at import time). `async_client` is the same for
+        # the `atranslate` path.
         self._client = client
+        self._async_client = async_client
+        self._pool: EndpointPool | None = None
 
     def translate(
         self,
@@ -85,52 +171,84 @@ class OpenAIProvider:
         *,
         system_prompt_addendum: str | None = None,
     ) -> ProviderResult:
-        client = self._get_client()
-        # Cycle-3 S6: persona + termbase glossary block lands as a
-        # system-prompt addendum when the pipeline is wired with a
-        # termbase / persona. None preserves cycle-2 behavior.
-        system_prompt = (
-            SYSTEM_PROMPT
-            if not system_prompt_addendum
-            else f"{SYSTEM_PROMPT}\n\n{system_prompt_addendum}"
-        )
-        user_message = USER_MESSAGE_TEMPLATE.format(
-            from_lang=segment.source_lang,
-            to_lang=target_lang,
-            text=segment.source_text,
+        started = time.perf_counter()
+        response, endpoint = self._create(
+            self._request_kwargs(segment, target_lang, system_prompt_addendum)
         )
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_message},
-        ]
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return self._to_result(response, segment, elapsed_ms, endpoint)
 
+    async def atranslate(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> ProviderResult:
+        """Same request as :meth:`translate`, sent through the SDK's
+        ``AsyncOpenAI`` client."""
         started = time.perf_counter()
-        response = client.chat.completions.create(  # type: ignore[attr-defined]
-            model=self._model,
-            messages=messages,
-            max_tokens=self._max_tokens,
-            temperature=_TEMPERATURE,
-            top_p=_TOP_P,
-            frequency_penalty=_FREQUENCY_PENALTY,
-            presence_penalty=_PRESENCE_PENALTY,
+        response, endpoint = await self._acreate(
+            self._request_kwargs(segment, target_lang, system_prompt_addendum)
         )
         elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return self._to_result(response, segment, elapsed_ms, endpoint)
 
-        target_text = _extract_target_text(response, segment.source_text)
-        input_tokens, output_tokens = _extract_usage(response)
-        cost_usd = _estimate_cost(self._model, input_tokens, output_tokens)
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        """Translate ``segments`` ``pack_size`` at a time, one chat
+        completion per pack (see :mod:`ainemo.providers._packing`).
+        ``max_tokens`` grows with each pack's size (see
+        :func:`~ainemo.providers._packing.pack_max_tokens`)."""
+        return translate_in_packs(
+            segments,
+            pack_size=self._pack_size,
+            send_pack=lambda pack: self._send_pack(pack, target_lang, system_prompt_addendum),
+            translate_one=lambda segment: self.translate(
+                segment, target_lang, system_prompt_addendum=system_prompt_addendum
+            ),
+            make_result=self._make_result,
+        )
 
-        return ProviderResult(
-            target_text=target_text,
-            provider=self.provider_id,
-            model=self._model,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            latency_ms=elapsed_ms,
-            cost_usd=cost_usd,
-            confidence=None,
+    @property
+    def pack_size(self) -> int:
+        return self._pack_size
+
+    def translate_multi(
+        self,
+        segments: Sequence[Segment],
+        target_langs: Sequence[str],
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> dict[str, list[ProviderResult]]:
+        """Translate ``segments`` into all of ``target_langs``, one chat completion per pack
+        (at least one segment per pack)."""
+        return translate_multi_in_packs(
+            segments,
+            target_langs,
+            pack_size=self._pack_size,
+            send_pack=lambda pack, langs: self._send_multi_pack(
+                pack, langs, system_prompt_addendum
+            ),
+            translate_one=lambda segment, lang: self.translate(
+                segment, lang, system_prompt_addendum=system_prompt_addendum
+            ),
+            make_result=self._make_result,
         )
 
+    @property
+    def multi_target(self) -> bool:
+        return self._multi_target
+
+    @property
+    def model(self) -> str:
+        return self._model
+
     def supports(self, source_lang: str, target_lang: str) -> bool:
         # GPT-4o handles every BCP-47 pair we'd realistically translate
         # for software i18n; the SDK doesn't expose a per-pair
@@ -138,13 +256,262 @@ class OpenAIProvider:
         # gating as benchmark data lands.
         return True
 
+    def warm_up(self, lang_pairs: Sequence[tuple[str, str]]) -> None:
+        """Build the SDK client ahead of the first call, sending no
+        request. With several gateways, health-check each instead.
+        ``lang_pairs`` is unused."""
+        del lang_pairs
+        pool = self._get_pool()
+        if pool is None:
+            self._get_client()
+        else:
+            pool.check_health()
+
+    def submit_bulk(self, requests: Sequence[BulkRequest]) -> str:
+        """Upload ``requests`` as a Batch API input file and create the
+        batch over it."""
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": request.custom_id,
+                    "method": _BATCH_METHOD,
+                    "url": _BATCH_ENDPOINT,
+                    "body": self._request_kwargs(
+                        request.segment, request.target_lang, request.system_prompt_addendum
+                    ),
+                },
+                ensure_ascii=False,
+            )
+            for request in requests
+        ]
+        client = self._get_client()
+        uploaded = client.files.create(  # type: ignore[attr-defined]
+            file=(_BATCH_FILE_NAME, ("\n".join(lines) + "\n").encode("utf-8")),
+            purpose=_BATCH_FILE_PURPOSE,
+        )
+        batch = client.batches.create(  # type: ignore[attr-defined]
+            input_file_id=uploaded.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window=_BATCH_COMPLETION_WINDOW,
+        )
+        return str(batch.id)
+
+    def poll_bulk(self, job_id: str) -> BulkStatus:
+        batch = self._get_client().batches.retrieve(job_id)  # type: ignore[attr-defined]
+        counts = batch.request_counts
+        return BulkStatus(
+            job_id=job_id,
+            state=_bulk_state(str(batch.status)),
+            total=counts.total if counts is not None else 0,
+            succeeded=counts.completed if counts is not None else 0,
+            failed=counts.failed if counts is not None else 0,
+        )
+
+    def collect_bulk(self, job_id: str, requests: Mapping[str, BulkRequest]) -> list[BulkItem]:
+        """Parse the batch's output file (and its error file, for
+        requests that failed)."""
+        client = self._get_client()
+        batch = client.batches.retrieve(job_id)  # type: ignore[attr-defined]
+        items: list[BulkItem] = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            content = client.files.content(file_id).text  # type: ignore[attr-defined]
+            for line in content.splitlines():
+                if line.strip():
+                    items.append(self._bulk_item(json.loads(line), requests))
+        return items
+
     # --- Internals ---
 
+    def _bulk_item(
+        self, line: Mapping[str, object], requests: Mapping[str, BulkRequest]
+    ) -> BulkItem:
+        custom_id = str(line.get("custom_id"))
+        response = line.get("response")
+        request = requests.get(custom_id)
+        if (
+            request is None
+            or not isinstance(response, Mapping)
+            or response.get("status_code") != _HTTP_OK
+        ):
+            error = line.get("error") or (
+                response.get("body") if isinstance(response, Mapping) else None
+            )
+            return BulkItem(custom_id=custom_id, result=None, error=str(error or "no response"))
+        completion = ChatCompletion.model_validate(response.get("body"))
+        return BulkItem(
+            custom_id=custom_id,
+            result=at_batch_price(self._to_result(completion, request.segment, 0, None)),
+        )
+
     def _get_client(self) -> object:
         if self._client is None:
-            self._client = build_client()
+            self._client = build_client(self._base_url)
         return self._client
 
+    def _get_async_client(self) -> object:
+        # Not cached on the instance: async clients are bound to the
+        # event loop, and the registry already shares one per loop.
+        if self._async_client is not None:
+            return self._async_client
+        return build_async_client(self._base_url)
+
+    def _get_pool(self) -> EndpointPool | None:
+        """The shared pool over the configured gateways; ``None`` for a
+        single gateway or an injected client."""
+        if self._pool is None and self._client is None and self._async_client is None:
+            base_urls = resolve_base_urls(self._base_url)
+            if len(base_urls) > 1:
+                self._pool = endpoint_pools().pool(
+                    self.provider_id, base_urls, probe=http_probe(HEALTH_CHECK_PATH)
+                )
+        return self._pool
+
+    def _create(self, kwargs: dict[str, object]) -> tuple[object, str | None]:
+        """Send one chat completion; returns the response and the
+        pooled gateway that served it."""
+        pool = self._get_pool()
+        if pool is None:
+            client = self._get_client()
+            return client.chat.completions.create(**kwargs), None  # type: ignore[attr-defined]
+        with pool.lease() as base_url:
+            pooled: object = build_client(base_url)
+            return pooled.chat.completions.create(**kwargs), base_url  # type: ignore[attr-defined]
+
+    async def _acreate(self, kwargs: dict[str, object]) -> tuple[object, str | None]:
+        """:meth:`_create` through the async client."""
+        pool = self._get_pool()
+        if pool is None:
+            client = self._get_async_client()
+            response = await client.chat.completions.create(**kwargs)  # type: ignore[attr-defined]
+            return response, None
+        async with pool.alease() as base_url:
+            pooled: object = build_async_client(base_url)
+            response = await pooled.chat.completions.create(**kwargs)  # type: ignore[attr-defined]
+            return response, base_url
+
+    def _send_pack(
+        self, pack: Sequence[Segment], target_lang: str, system_prompt_addendum: str | None
+    ) -> PackReply:
+        user_message = PACKED_USER_MESSAGE_TEMPLATE.format(
+            count=len(pack),
+            from_lang=pack[0].source_lang,
+            to_lang=target_lang,
+            items=encode_pack(pack),
+        )
+        return self._send_packed(user_message, system_prompt_addendum, self._pack_max_tokens(pack))
+
+    def _send_multi_pack(
+        self,
+        pack: Sequence[Segment],
+        target_langs: Sequence[str],
+        system_prompt_addendum: str | None,
+    ) -> PackReply:
+        user_message = MULTI_TARGET_USER_MESSAGE_TEMPLATE.format(
+            count=len(pack),
+            from_lang=pack[0].source_lang,
+            to_langs=", ".join(target_langs),
+            items=encode_pack(pack),
+        )
+        return self._send_packed(
+            user_message,
+            system_prompt_addendum,
+            self._pack_max_tokens(pack, lang_count=len(target_langs)),
+        )
+
+    def _pack_max_tokens(self, pack: Sequence[Segment], *, lang_count: int = 1) -> int:
+        return pack_max_tokens(
+            pack,
+            lang_count=lang_count,
+            floor=self._max_tokens,
+            limit=max(self._max_tokens, _PACK_MAX_TOKENS_LIMIT),
+            provider_id=self.provider_id,
+        )
+
+    def _send_packed(
+        self, user_message: str, system_prompt_addendum: str | None, max_tokens: int
+    ) -> PackReply:
+        response, endpoint = self._create(
+            self._chat_kwargs(user_message, system_prompt_addendum, max_tokens=max_tokens)
+        )
+        return PackReply(
+            text=_extract_target_text(response, ""),
+            usage=_extract_usage(response),
+            endpoint=endpoint,
+        )
+
+    def _request_kwargs(
+        self, segment: Segment, target_lang: str, system_prompt_addendum: str | None
+    ) -> dict[str, object]:
+        user_message = USER_MESSAGE_TEMPLATE.format(
+            from_lang=segment.source_lang,
+            to_lang=target_lang,
+            text=segment.source_text,
+        )
+        return self._chat_kwargs(user_message, system_prompt_addendum)
+
+    def _chat_kwargs(
+        self,
+        user_message: str,
+        system_prompt_addendum: str | None,
+        *,
+        max_tokens: int | None = None,
+    ) -> dict[str, object]:
+        # Cycle-3 S6: persona + termbase glossary block lands as a
+        # system-prompt addendum when the pipeline is wired with a
+        # termbase / persona. None preserves cycle-2 behavior. The
+        # static system text comes first and the segment text last so
+        # repeated calls share a cacheable prefix.
+        system_prompt = (
+            SYSTEM_PROMPT
+            if not system_prompt_addendum
+            else f"{SYSTEM_PROMPT}\n\n{system_prompt_addendum}"
+        )
+        return {
+            "model": self._model,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_message},
+            ],
+            "max_tokens": max_tokens if max_tokens is not None else self._max_tokens,
+            "temperature": _TEMPERATURE,
+            "top_p": _TOP_P,
+            "frequency_penalty": _FREQUENCY_PENALTY,
+            "presence_penalty": _PRESENCE_PENALTY,
+        }
+
+    def _to_result(
+        self, response: object, segment: Segment, elapsed_ms: int, endpoint: str | None
+    ) -> ProviderResult:
+        target_text = _extract_target_text(response, segment.source_text)
+        return self._make_result(target_text, _extract_usage(response), elapsed_ms, endpoint)
+
+    def _make_result(
+        self, target_text: str, usage: TokenUsage, elapsed_ms: int, endpoint: str | None = None
+    ) -> ProviderResult:
+        return ProviderResult(
+            target_text=target_text,
+            provider=self.provider_id,
+            model=self._model,
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            latency_ms=elapsed_ms,
+            cost_usd=_estimate_cost(self._model, usage),
+            confidence=None,
+            cache_read_tokens=usage.cache_read_tokens,
+            cache_write_tokens=usage.cache_write_tokens,
+            endpoint=endpoint,
+        )
+
+
+def _bulk_state(status: str) -> BulkState:
+    if status == _BATCH_STATUS_FAILED:
+        return BULK_STATE_FAILED
+    if status in _BATCH_STATUSES_ENDED:
+        return BULK_STATE_ENDED
+    return BULK_STATE_PENDING
+
 
 def _build_glossary_message(forbidden_terms: tuple[str, ...]) -> str:
     """Helper to compose the glossary-injection suffix. Not yet wired
@@ -202,38 +569,53 @@ def _conditionally_unwrap_quotes(text: str, source_text: str) -> str:
     return text
 
 
-def _extract_usage(response: object) -> tuple[int | None, int | None]:
-    """Pull token-usage figures out of the response. Returns
-    ``(None, None)`` when the SDK didn't populate ``usage`` (rare,
-    but defensive)."""
+def _extract_usage(response: object) -> TokenUsage:
+    """Pull token-usage figures out of the response. Fields stay
+    ``None`` when the SDK didn't populate them (rare, but defensive).
+    ``prompt_tokens`` already includes the cached tokens."""
     usage = getattr(response, "usage", None)
     if usage is None:
-        return None, None
-    prompt = getattr(usage, "prompt_tokens", None)
-    completion = getattr(usage, "completion_tokens", None)
-    return (
-        int(prompt) if prompt is not None else None,
-        int(completion) if completion is not None else None,
+        return TokenUsage()
+    details = getattr(usage, "prompt_tokens_details", None)
+    return TokenUsage(
+        input_tokens=_as_count(getattr(usage, "prompt_tokens", None)),
+        output_tokens=_as_count(getattr(usage, "completion_tokens", None)),
+        cache_read_tokens=_as_count(getattr(details, "cached_tokens", None)),
     )
 
 
-def _estimate_cost(model: str, input_tokens: int | None, output_tokens: int | None) -> float | None:
-    """Multiply the per-1M-token rate by the actual token count.
-    Returns None for unpriced models or when token counts are missing
-    (which is what the UsageLog records — None rather than zero so the
-    "not measured" case is distinguishable)."""
-    if input_tokens is None or output_tokens is None:
+def _as_count(value: object) -> int | None:
+    return int(value) if isinstance(value, int) else None
+
+
+def _estimate_cost(model: str, usage: TokenUsage) -> float | None:
+    """Multiply the per-1M-token rates by the actual token counts, with
+    cached prompt tokens at the cached-input rate. Returns None for
+    unpriced models or when token counts are missing (which is what the
+    UsageLog records — None rather than zero so the "not measured" case
+    is distinguishable)."""
+    if usage.input_tokens is None or usage.output_tokens is None:
         return None
     rate = _PRICING_USD_PER_M_TOKENS.get(model)
     if rate is None:
         return None
-    input_rate, output_rate = rate
-    return (input_tokens * input_rate + output_tokens * output_rate) / 1_000_000
+    input_rate, cached_rate, output_rate = rate
+    cached = min(usage.cache_read_tokens or 0, usage.input_tokens)
+    return (
+        (usage.input_tokens - cached) * input_rate
+        + cached * cached_rate
+        + usage.output_tokens * output_rate
+    ) / 1_000_000
 
 
 # Provider Protocol satisfaction is enforced via runtime_checkable; the
 # below assertion documents the cycle-2 contract at module-load time.
 _: type[Provider] = OpenAIProvider
+_async: type[AsyncProvider] = OpenAIProvider
+_warmable: type[WarmableProvider] = OpenAIProvider
+_packing: type[PackingProvider] = OpenAIProvider
+_multi: type[MultiTargetProvider] = OpenAIProvider
+_bulk: type[BulkBatchProvider] = OpenAIProvider
 
 
 __all__ = ["DEFAULT_MODEL", "DEFAULT_MAX_TOKENS", "OpenAIProvider"]
@@ -4,36 +4,254 @@ OPUS-MT models are pair-specific — one HF repo per (source, target)
 route. The provider may translate to many targets in a single run, so
 the loader caches one (tokenizer, model) pair per HF repo id, lazily
 loaded on first use.
+
+:class:`~ainemo.providers._local_model.LocalModelOptions` (int8
+quantization, bf16, torch threads) are applied to each model as it
+loads.
+
+A daemon serving a 25-language build would otherwise end up holding 25
+Marian models (~300 MB each). The options' ``max_models`` /
+``max_model_bytes`` bound the cache: when a load takes it past either
+cap, the least recently used models are evicted until it fits again.
+Models for ``pinned_target_langs`` (or repos pinned with
+:meth:`MarianModelCache.pin`) are never evicted; if the pinned models
+alone exceed a cap, the cache stays over it rather than thrash.
 """
 
 from __future__ import annotations
 
+import gc
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
 from typing import Any
 
+from ainemo.providers._local_model import (
+    LocalModelOptions,
+    apply_thread_settings,
+    prepare_model,
+)
+from ainemo.providers.opus._languages import to_opus_config
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MarianCacheStats:
+    """Counters for one :class:`MarianModelCache` since construction."""
+
+    loads: int
+    """Models loaded from disk (or the network, on first use)."""
+
+    hits: int
+    """``get`` calls answered by an already-loaded model."""
+
+    evictions: int
+    """Models dropped to stay within ``max_models`` / ``max_model_bytes``."""
+
+    releases: int
+    """Models dropped by :meth:`MarianModelCache.release`."""
+
+    models: int
+    """Models currently loaded."""
+
+    bytes: int
+    """Approximate bytes of weights currently loaded."""
+
+    pinned: tuple[str, ...]
+    """HF repo ids exempt from eviction, sorted."""
+
+
+@dataclass(frozen=True)
+class _Loaded:
+    tokenizer: Any
+    model: Any
+    size: int
+
 
 class MarianModelCache:
     """Per-repo lazy cache of (tokenizer, model) pairs.
 
-    The provider holds one cache per instance; entries persist for the
-    lifetime of the provider so a single ``nemo translate`` run that
-    fans out to N target languages pays the model-load cost N times,
-    not N×M segments.
+    The provider holds one cache per instance; by default entries
+    persist for the lifetime of the provider so a single ``nemo
+    translate`` run that fans out to N target languages pays the
+    model-load cost N times, not N×M segments. With a cap set, the
+    cache is an LRU over repo ids (see the module docstring).
     """
 
-    def __init__(self, cache_dir: str | None = None) -> None:
+    def __init__(
+        self, cache_dir: str | None = None, options: LocalModelOptions | None = None
+    ) -> None:
         self._cache_dir = cache_dir
-        self._cache: dict[str, tuple[Any, Any]] = {}
+        self._options = options or LocalModelOptions()
+        self._cache: OrderedDict[str, _Loaded] = OrderedDict()
+        self._pinned: set[str] = set()
+        for lang in self._options.pinned_target_langs:
+            config = to_opus_config(lang)
+            if config is None:
+                raise ValueError(f"Cannot pin {lang!r}: OPUS has no en→{lang} model.")
+            self._pinned.add(config.hf_model_name)
+        self._bytes = 0
+        self._loads = 0
+        self._hits = 0
+        self._evictions = 0
+        self._releases = 0
+        # The daemon translates from several threads. The lock guards the
+        # dict and counters only; a load runs outside it so hits on other
+        # repos are not stuck behind a multi-second ``from_pretrained``.
+        # Threads that want a repo already being loaded wait on its
+        # future instead of loading it a second time.
+        self._lock = threading.Lock()
+        self._loading: dict[str, Future[_Loaded]] = {}
 
     def get(self, hf_model_name: str) -> tuple[Any, Any]:
         """Return the (tokenizer, model) pair for ``hf_model_name``,
-        loading on first request."""
-        if hf_model_name not in self._cache:
-            from transformers import MarianMTModel, MarianTokenizer
+        loading on first request (or after an eviction)."""
+        with self._lock:
+            loaded = self._cache.get(hf_model_name)
+            if loaded is not None:
+                self._cache.move_to_end(hf_model_name)
+                self._hits += 1
+                return loaded.tokenizer, loaded.model
+            flight = self._loading.get(hf_model_name)
+            leader = flight is None
+            if flight is None:
+                flight = Future()
+                flight.set_running_or_notify_cancel()
+                self._loading[hf_model_name] = flight
+        if not leader:
+            loaded = flight.result()
+            with self._lock:
+                self._hits += 1
+            return loaded.tokenizer, loaded.model
+        try:
+            tokenizer, model = self._load(hf_model_name)
+            loaded = _Loaded(tokenizer=tokenizer, model=model, size=model_bytes(model))
+        except BaseException as exc:
+            with self._lock:
+                del self._loading[hf_model_name]
+            flight.set_exception(exc)
+            raise
+        with self._lock:
+            del self._loading[hf_model_name]
+            self._cache[hf_model_name] = loaded
+            self._bytes += loaded.size
+            self._loads += 1
+            self._evict_over_cap(keep=hf_model_name)
+        flight.set_result(loaded)
+        return loaded.tokenizer, loaded.model
+
+    def pin(self, hf_model_name: str) -> None:
+        """Exempt ``hf_model_name`` from eviction (loaded or not)."""
+        with self._lock:
+            self._pinned.add(hf_model_name)
+
+    def unpin(self, hf_model_name: str) -> None:
+        """Make ``hf_model_name`` evictable again. The cache is brought
+        back under its caps on the next load."""
+        with self._lock:
+            self._pinned.discard(hf_model_name)
+
+    def release(self, *, include_pinned: bool = False) -> int:
+        """Drop loaded models to free memory; return how many were
+        dropped. Pinned models stay unless ``include_pinned``. Dropped
+        models reload on their next :meth:`get`."""
+        with self._lock:
+            names = [n for n in self._cache if include_pinned or n not in self._pinned]
+            for name in names:
+                self._bytes -= self._cache.pop(name).size
+            self._releases += len(names)
+        if names:
+            # Marian models hold reference cycles; collect now so the
+            # weights are freed before the caller's next phase.
+            gc.collect()
+        return len(names)
+
+    def stats(self) -> MarianCacheStats:
+        with self._lock:
+            return MarianCacheStats(
+                loads=self._loads,
+                hits=self._hits,
+                evictions=self._evictions,
+                releases=self._releases,
+                models=len(self._cache),
+                bytes=self._bytes,
+                pinned=tuple(sorted(self._pinned)),
+            )
+
+    def _load(self, hf_model_name: str) -> tuple[Any, Any]:
+        from transformers import MarianMTModel, MarianTokenizer
+
+        apply_thread_settings(self._options)
 
-            tokenizer = MarianTokenizer.from_pretrained(hf_model_name, cache_dir=self._cache_dir)
-            model = MarianMTModel.from_pretrained(hf_model_name, cache_dir=self._cache_dir)
-            self._cache[hf_model_name] = (tokenizer, model)
-        return self._cache[hf_model_name]
+        tokenizer = MarianTokenizer.from_pretrained(hf_model_name, cache_dir=self._cache_dir)
+        model = MarianMTModel.from_pretrained(hf_model_name, cache_dir=self._cache_dir)
+        return tokenizer, prepare_model(model, self._options)
+
+    def _evict_over_cap(self, *, keep: str) -> None:
+        """Evict LRU-first until both caps hold. ``keep`` (the model
+        just loaded for the caller) and pinned models are never
+        evicted. Caller holds the lock."""
+        max_models = self._options.max_models
+        max_bytes = self._options.max_model_bytes
+
+        def _over() -> bool:
+            return (max_models is not None and len(self._cache) > max_models) or (
+                max_bytes is not None and self._bytes > max_bytes
+            )
+
+        evicted = False
+        while _over():
+            victim = next(
+                (n for n in self._cache if n != keep and n not in self._pinned),
+                None,
+            )
+            if victim is None:
+                logger.warning(
+                    "OPUS model cache holds %d model(s) (%d bytes), over its cap, "
+                    "but every other loaded model is pinned.",
+                    len(self._cache),
+                    self._bytes,
+                )
+                break
+            self._bytes -= self._cache.pop(victim).size
+            self._evictions += 1
+            evicted = True
+            logger.info("evicted OPUS model %s", victim)
+        if evicted:
+            gc.collect()
+
+
+def model_bytes(model: Any) -> int:
+    """Approximate bytes of ``model``'s weights and buffers.
+
+    Sums the tensors in its ``state_dict`` (including int8-quantized
+    packed weights), counting tied weights once. Objects without a
+    ``state_dict`` count as 0.
+    """
+    state_dict = getattr(model, "state_dict", None)
+    if state_dict is None:
+        return 0
+    seen: set[int] = set()
+    total = 0
+    pending: list[Any] = list(state_dict().values())
+    while pending:
+        value = pending.pop()
+        if isinstance(value, (tuple, list)):
+            pending.extend(value)
+            continue
+        nbytes = getattr(value, "nbytes", None)
+        data_ptr = getattr(value, "data_ptr", None)
+        if not isinstance(nbytes, int) or data_ptr is None:
+            continue
+        pointer = data_ptr()
+        if pointer in seen:
+            continue
+        seen.add(pointer)
+        total += nbytes
+    return total
 
 
-__all__ = ["MarianModelCache"]
+__all__ = ["MarianCacheStats", "MarianModelCache", "model_bytes"]
@@ -8,24 +8,38 @@ extends to other source languages by populating per-source maps.
 OPUS-MT semantics that the cycle-2 wrapping handles:
 
 - Pair-specific model loading: each ``en→<target>`` route uses a
-  different HF repo; :class:`MarianModelCache` caches per-repo.
+  different HF repo; :class:`MarianModelCache` caches per-repo,
+  optionally bounded by ``LocalModelOptions.max_models`` /
+  ``max_model_bytes`` with LRU eviction.
 - Target-language token prefixing: grouped models (Romance, Slavic,
   Germanic, Multilingual) require ``>>{token}<<`` at the start of
   the input to disambiguate the desired target language.
 - Per-target model-prefix override (Korean uses
   ``opus-mt-tc-big-`` because the standard Korean model is
   unusable).
+
+:meth:`OpusProvider.translate_batch` sends whole segment lists through
+the shared :class:`~ainemo.providers._seq2seq.Seq2SeqEngine`, which
+length-buckets and pads them into a few ``generate`` calls.
 """
 
 from __future__ import annotations
 
 import time
-from typing import Any, ClassVar, Final
+from typing import Any, ClassVar, Final, Sequence
 
 from ainemo.core.segment import Segment
 from ainemo.providers._ids import PROVIDER_ID_OPUS
-from ainemo.providers.base import Provider, ProviderResult
-from ainemo.providers.opus._client import MarianModelCache
+from ainemo.providers._local_model import LocalModelOptions
+from ainemo.providers._seq2seq import WARMUP_KEY, WARMUP_TEXT, Seq2SeqEngine
+from ainemo.providers.base import (
+    BatchProvider,
+    Provider,
+    ProviderResult,
+    ReleasableProvider,
+    WarmableProvider,
+)
+from ainemo.providers.opus._client import MarianCacheStats, MarianModelCache
 from ainemo.providers.opus._languages import (
     OpusTargetConfig,
     is_supported_source,
@@ -56,12 +70,18 @@ class OpusProvider:
         max_length: int = DEFAULT_MAX_LENGTH,
         cache_dir: str | None = None,
         cache: MarianModelCache | None = None,
+        engine: Seq2SeqEngine | None = None,
+        options: LocalModelOptions | None = None,
     ) -> None:
         self._max_length = max_length
+        # CPU execution options: load-time ones go to the model cache,
+        # the decoding ones (beam width) to every generate call.
+        self._options = options or LocalModelOptions()
         # `cache` is injectable so unit tests pass a stub without
         # downloading any HF model. Production leaves it None and the
         # provider builds its own cache.
-        self._cache = cache or MarianModelCache(cache_dir=cache_dir)
+        self._cache = cache or MarianModelCache(cache_dir=cache_dir, options=self._options)
+        self._engine = engine or Seq2SeqEngine()
 
     def translate(
         self,
@@ -74,20 +94,7 @@ class OpusProvider:
         # system-prompt surface, so the cycle-3 S6
         # `system_prompt_addendum` is accepted-and-ignored here.
         del system_prompt_addendum
-        if not is_supported_source(segment.source_lang):
-            raise ValueError(
-                f"OpusProvider supports English source only in cycle 2; "
-                f"got source_lang={segment.source_lang!r}. Route to "
-                f"NllbProvider for non-English sources, or extend the "
-                f"OPUS source-language map in cycle 3+."
-            )
-        config = to_opus_config(target_lang)
-        if config is None:
-            raise ValueError(
-                f"OpusProvider has no en→{target_lang} model registered. "
-                f"Use `supports()` to gate before calling, or extend "
-                f"`ainemo.providers.opus._languages._TARGETS`."
-            )
+        config = _opus_config(segment.source_lang, target_lang)
 
         prepared_text = _prepare_input(segment.source_text, config)
         tokenizer, model = self._cache.get(config.hf_model_name)
@@ -98,23 +105,93 @@ class OpusProvider:
             model=model,
             text=prepared_text,
             max_length=self._max_length,
+            generate_kwargs=self._options.generate_kwargs(),
         )
         elapsed_ms = int((time.perf_counter() - started) * 1000)
+        return _result(target_text, config, elapsed_ms)
+
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        """Translate ``segments`` with one engine call.
+
+        OPUS is English-source and pair-specific, so every segment goes
+        through the same ``en→target`` Marian model. Each result's
+        ``latency_ms`` is an even share of the whole call.
+        """
+        del system_prompt_addendum  # Same accept-and-ignore as `translate`.
+        if not segments:
+            return []
+        for segment in segments:
+            config = _opus_config(segment.source_lang, target_lang)
+        tokenizer, model = self._cache.get(config.hf_model_name)
 
-        return ProviderResult(
-            target_text=target_text,
-            provider=self.provider_id,
-            model=config.hf_model_name,
-            input_tokens=None,  # OPUS-MT doesn't expose token counts.
-            output_tokens=None,
-            latency_ms=elapsed_ms,
-            cost_usd=None,  # Local model, no per-call cost.
-            confidence=None,
+        started = time.perf_counter()
+        outputs = self._engine.translate_batch(
+            [_prepare_input(segment.source_text, config) for segment in segments],
+            model_key=config.hf_model_name,
+            tokenizer=tokenizer,
+            model=model,
+            max_length=self._max_length,
+            generate_kwargs=self._options.generate_kwargs(),
         )
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        share_ms = elapsed_ms // len(segments)
+        return [_result(text, config, share_ms) for text in outputs]
 
     def supports(self, source_lang: str, target_lang: str) -> bool:
         return is_supported_source(source_lang) and to_opus_config(target_lang) is not None
 
+    def warm_up(self, lang_pairs: Sequence[tuple[str, str]]) -> None:
+        """Load the model(s) for ``lang_pairs`` and translate one short
+        string per pair, so the first real call pays neither."""
+        for source_lang, target_lang in lang_pairs:
+            warmup = Segment(key=WARMUP_KEY, source_text=WARMUP_TEXT, source_lang=source_lang)
+            self.translate_batch([warmup], target_lang)
+
+    def release_models(self, *, include_pinned: bool = False) -> int:
+        """Unload the cached Marian models (see :meth:`MarianModelCache.release`)."""
+        return self._cache.release(include_pinned=include_pinned)
+
+    def model_cache_stats(self) -> MarianCacheStats:
+        return self._cache.stats()
+
+
+def _opus_config(source_lang: str, target_lang: str) -> OpusTargetConfig:
+    """Resolve the Marian model config for a pair or raise ``ValueError``."""
+    if not is_supported_source(source_lang):
+        raise ValueError(
+            f"OpusProvider supports English source only in cycle 2; "
+            f"got source_lang={source_lang!r}. Route to "
+            f"NllbProvider for non-English sources, or extend the "
+            f"OPUS source-language map in cycle 3+."
+        )
+    config = to_opus_config(target_lang)
+    if config is None:
+        raise ValueError(
+            f"OpusProvider has no en→{target_lang} model registered. "
+            f"Use `supports()` to gate before calling, or extend "
+            f"`ainemo.providers.opus._languages._TARGETS`."
+        )
+    return config
+
+
+def _result(target_text: str, config: OpusTargetConfig, latency_ms: int) -> ProviderResult:
+    return ProviderResult(
+        target_text=target_text,
+        provider=PROVIDER_ID_OPUS,
+        model=config.hf_model_name,
+        input_tokens=None,  # OPUS-MT doesn't expose token counts.
+        output_tokens=None,
+        latency_ms=latency_ms,
+        cost_usd=None,  # Local model, no per-call cost.
+        confidence=None,
+    )
+
 
 def _prepare_input(text: str, config: OpusTargetConfig) -> str:
     """Apply the target-language token prefix when the config requires
@@ -130,9 +207,16 @@ def _translate_with_marian(
     model: Any,
     text: str,
     max_length: int,
+    generate_kwargs: dict[str, Any] | None = None,
 ) -> str:
     """Run a MarianMT generate cycle. Pulled into a free function so
-    tests can mock the HF call without standing up MarianMT types."""
+    tests can mock the HF call without standing up MarianMT types.
+
+    Same ``generate`` settings as the batch path
+    (:class:`~ainemo.providers._seq2seq.Seq2SeqEngine`), so one segment
+    translates identically either way."""
+    import torch
+
     inputs = tokenizer(
         text,
         return_tensors="pt",
@@ -140,11 +224,15 @@ def _translate_with_marian(
         max_length=max_length,
         truncation=True,
     )
-    translated = model.generate(**inputs)
+    with torch.inference_mode():
+        translated = model.generate(**inputs, max_length=max_length, **(generate_kwargs or {}))
     return str(tokenizer.decode(translated[0], skip_special_tokens=True))
 
 
 _: type[Provider] = OpusProvider  # Protocol-conformance check at load time.
+_batch: type[BatchProvider] = OpusProvider
+_releasable: type[ReleasableProvider] = OpusProvider
+_warmable: type[WarmableProvider] = OpusProvider
 
 
 __all__ = ["DEFAULT_MAX_LENGTH", "OpusProvider"]
@@ -13,20 +13,104 @@ exponential-backoff retry via
 The router itself implements the :class:`Provider` Protocol — drop-in
 for the cycle-1 pipeline contract — so existing callers don't need to
 know there's routing happening underneath.
+
+:meth:`ProviderRouter.atranslate` is the asyncio-native twin of
+:meth:`ProviderRouter.translate`: the same routing, attribution and
+UsageLog record, but providers are awaited (sync-only ones run in a
+worker thread, see :func:`ainemo.providers.base.atranslate`), retry
+backoff awaits instead of sleeping, and the UsageLog append runs off
+the event loop. One process can keep many calls in flight without a
+thread per call.
+
+:meth:`ProviderRouter.translate_batch` routes a list of segments at
+once: batch-capable providers (:class:`~ainemo.providers.base.BatchProvider`)
+get one call for all the segments routed to them, others get one call
+per segment. Either way every segment gets its own UsageLog record.
+
+:meth:`ProviderRouter.translate_multi` goes one step further for a
+bundle fanning out to several languages: when one
+:class:`~ainemo.providers.base.MultiTargetProvider` serves every
+requested language, each call covers all of them. Every (segment,
+language) pair still gets its own UsageLog record.
+
+A router given a :class:`~ainemo.providers._rate_limit.RateLimiterRegistry`
+paces every call through the (provider, model) limiter: the call waits
+its fair turn under the request and token budgets, reports a rate-limit
+rejection to the limiter, and settles the token estimate with the
+reported usage. Retries then wait in the limiter's queue rather than
+on their own backoff schedule.
+
+``deadline_s`` bounds every router call, retries included, and raises
+:class:`~ainemo.providers._hedge.ProviderDeadlineExceeded` when it
+passes. A :class:`~ainemo.providers._hedge.HedgePolicy` hedges
+single-segment calls: one still running past the provider's observed
+latency quantile gets a duplicate, and the first to finish wins (see
+:mod:`ainemo.providers._hedge`). Every attempt that completes is
+recorded to the UsageLog, losers included, because each one is billed.
+
+A router given a :class:`~ainemo.providers._response_cache.ResponseCache`
+answers repeated single-segment requests from it, and sends identical
+requests in flight at the same time to the provider once (see
+:mod:`ainemo.providers._response_cache`). Those answers are recorded as
+response-cache hits: no tokens, no cost. Batch and multi-target
+provider calls are not cached.
+
+A :class:`~ainemo.providers._adaptive.AdaptiveRule` in the routing
+config chooses among several candidate providers per call, from their
+recent latency, error rate and cost (see
+:mod:`ainemo.providers._adaptive`). :meth:`ProviderRouter.explain_route`
+returns the decision with its per-candidate scores; ``routing_seed``
+makes the exploration draws reproducible.
 """
 
 from __future__ import annotations
 
+import asyncio
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from dataclasses import replace as _replace
-from typing import Callable, ClassVar, Mapping
+from typing import Awaitable, Callable, ClassVar, Final, Iterable, Mapping, Sequence, TypeVar
 
 from ainemo.core.segment import Segment
+from ainemo.providers._adaptive import AdaptiveRule, RouteDecision, RouteSelector
 from ainemo.providers._errors import UnknownProviderError
-from ainemo.providers._retry import with_retry
+from ainemo.providers._hedge import (
+    HedgePolicy,
+    LatencyWindow,
+    ProviderDeadlineExceeded,
+    arun_hedged,
+    run_hedged,
+)
+from ainemo.providers._rate_limit import (
+    RateLimiter,
+    RateLimiterRegistry,
+    estimate_tokens,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+from ainemo.providers._response_cache import ResponseCache, as_cache_hit, request_key
+from ainemo.providers._retry import awith_retry, with_retry
 from ainemo.providers._usage_log import UsageLog
-from ainemo.providers.base import Provider, ProviderResult
+from ainemo.providers.base import (
+    BatchProvider,
+    MultiTargetProvider,
+    PackingProvider,
+    Provider,
+    ProviderResult,
+    atranslate,
+    uses_batch_path,
+    uses_multi_target_path,
+)
+
+T = TypeVar("T")
+P = TypeVar("P", bound=Provider)
+
+# Worker threads racing sync provider calls when a deadline or hedge
+# policy is set: the caller waits while the attempts run here.
+_RACE_WORKERS: Final = 64
+_RACE_THREAD_PREFIX: Final = "ainemo-router"
 
 # --- Routing config -------------------------------------------------------
 
@@ -79,10 +163,20 @@ class RoutingConfig:
     wins. ``default_provider`` is used only when no rule matches —
     NOT as a silent fallback when the rule-selected provider has no
     credentials (per /bet open question 7: fail fast on no-creds).
+    An :class:`AdaptiveRule` matches like a static rule, then picks
+    one of its candidates per call.
     """
 
     default_provider: str
-    rules: tuple[RoutingRule, ...] = field(default_factory=tuple)
+    rules: tuple[RoutingRule | AdaptiveRule, ...] = field(default_factory=tuple)
+
+    def provider_ids(self) -> tuple[str, ...]:
+        """Every provider id the config can route to, default first."""
+        ids = [self.default_provider]
+        for rule in self.rules:
+            named = rule.candidates if isinstance(rule, AdaptiveRule) else (rule.provider_id,)
+            ids.extend(provider_id for provider_id in named if provider_id not in ids)
+        return tuple(ids)
 
 
 # --- Router exceptions ----------------------------------------------------
@@ -121,7 +215,15 @@ class ProviderRouter:
         *,
         retry_exceptions: tuple[type[BaseException], ...] = (),
         sleep: Callable[[float], None] = time.sleep,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rate_limiters: RateLimiterRegistry | None = None,
+        deadline_s: float | None = None,
+        hedge: HedgePolicy | None = None,
+        response_cache: ResponseCache | None = None,
+        routing_seed: int | None = None,
     ) -> None:
+        if deadline_s is not None and deadline_s <= 0:
+            raise ValueError(f"deadline_s must be > 0, got {deadline_s}.")
         self._providers = dict(providers)
         self._routing_config = routing_config
         self._usage_log = usage_log
@@ -129,8 +231,29 @@ class ProviderRouter:
         # `sleep` is injectable so unit tests pass a no-op without
         # monkey-patching `time.sleep` globally. Defaults to the real
         # `time.sleep` for production. Forwarded into `with_retry`
-        # below if any retry exceptions are configured.
+        # below if any retry exceptions are configured. `async_sleep`
+        # is the same seam for the `atranslate` path.
         self._sleep = sleep
+        self._async_sleep = async_sleep
+        # `None` sends calls unpaced; the CLI and daemon pass the
+        # process-wide registry so every router shares the limiters.
+        self._rate_limiters = rate_limiters
+        self._deadline_s = deadline_s
+        self._hedge = hedge
+        self._latencies: dict[str, LatencyWindow] = {}
+        self._race_pool: ThreadPoolExecutor | None = None
+        self._race_lock = threading.Lock()
+        # `None` calls the provider for every request. The daemon shares
+        # one cache across its routers; keys name the provider.
+        self._response_cache = response_cache
+        # Applies the routing rules; adaptive rules start their provider
+        # metrics from the UsageLog history.
+        self._selector = RouteSelector(
+            routing_config.rules,
+            routing_config.default_provider,
+            usage_log=usage_log,
+            seed=routing_seed,
+        )
 
     def translate(
         self,
@@ -155,25 +278,244 @@ class ProviderRouter:
         provider; the addendum is what THAT provider sees as a
         system-prompt extension. Both can be set at once.
         """
-        provider = self._select_provider(
-            source_lang=segment.source_lang,
-            target_lang=target_lang,
-            persona=persona,
-            domain=domain,
-        )
-        if not provider.supports(segment.source_lang, target_lang):
-            raise ProviderUnsupportedPair(
-                f"Provider {provider.provider_id!r} does not support "
-                f"({segment.source_lang!r} → {target_lang!r}). Per the "
-                f"cycle-2 fail-fast routing policy, the router does not "
-                f"silently fall back to a different provider — fix the "
-                f"routing config or pass --provider explicitly."
-            )
+        provider = self._resolve(segment, target_lang, persona=persona, domain=domain)
         return self._invoke_provider(
             provider,
             segment,
             target_lang,
             system_prompt_addendum=system_prompt_addendum,
+            hedge_to=self._hedge_target(provider, segment.source_lang, target_lang),
+        )
+
+    async def atranslate(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+        persona: str | None = None,
+        domain: str | None = None,
+    ) -> ProviderResult:
+        """Coroutine form of :meth:`translate` — same routing, errors
+        and UsageLog record.
+
+        Retries await ``async_sleep`` (``asyncio.sleep`` by default)
+        between attempts, and the UsageLog append runs in a worker
+        thread so the event loop never blocks on file I/O.
+        """
+        provider = self._resolve(segment, target_lang, persona=persona, domain=domain)
+        estimated_tokens = estimate_tokens(
+            (segment.source_text,), system_prompt_addendum=system_prompt_addendum
+        )
+
+        async def _run(target: Provider) -> ProviderResult:
+            async def _do_call() -> ProviderResult:
+                started = time.perf_counter()
+                result = await atranslate(
+                    target,
+                    segment,
+                    target_lang,
+                    system_prompt_addendum=system_prompt_addendum,
+                )
+                elapsed_ms = int((time.perf_counter() - started) * 1000)
+                return _finalize(result, target, elapsed_ms)
+
+            limiter = self._limiter(target)
+
+            async def _attempt() -> ProviderResult:
+                if limiter is None:
+                    return await _do_call()
+                await limiter.aacquire(estimated_tokens, sleep=self._async_sleep)
+                try:
+                    result = await _do_call()
+                except BaseException as exc:
+                    self._throttle_on_rate_limit(limiter, exc)
+                    raise
+                limiter.settle(estimated_tokens, _used_tokens((result,)))
+                return result
+
+            if self._retry_exceptions:
+                return await awith_retry(
+                    _attempt,
+                    rate_limit_exceptions=self._retry_exceptions,
+                    sleep=self._async_sleep,
+                    retry_after=_retry_after(limiter),
+                )
+            return await _attempt()
+
+        async def _guarded() -> ProviderResult:
+            return await self._aguarded(
+                provider,
+                _run,
+                lambda target, result: self._record(target, result, segment, target_lang),
+                hedge_to=self._hedge_target(provider, segment.source_lang, target_lang),
+            )
+
+        if self._response_cache is None:
+            return await _guarded()
+        result, shared = await self._response_cache.aget_or_call(
+            _request_key(provider, segment, target_lang, system_prompt_addendum), _guarded
+        )
+        if not shared:
+            return result
+        hit = as_cache_hit(result)
+        await asyncio.to_thread(self._record, provider, hit, segment, target_lang, cache_hit=True)
+        return hit
+
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+        persona: str | None = None,
+        domain: str | None = None,
+    ) -> list[ProviderResult]:
+        """Route and translate ``segments``; results come back in input
+        order.
+
+        Segments are grouped by the provider they route to. A
+        :class:`BatchProvider` gets one retry-wrapped
+        ``translate_batch`` call per group, and a
+        :class:`PackingProvider` one per pack of ``pack_size`` segments,
+        so a retry resends only the pack that failed. Any other provider
+        (or a packing provider with ``pack_size`` 1) gets the
+        :meth:`translate` path once per segment. Each segment is
+        recorded to the UsageLog individually, with the batch's
+        wall-clock time split evenly across its segments when the
+        provider did not report a share itself.
+        """
+        results: list[ProviderResult | None] = [None] * len(segments)
+        groups: dict[str, tuple[Provider, list[int]]] = {}
+        by_source_lang: dict[str, Provider] = {}
+        for index, segment in enumerate(segments):
+            provider = by_source_lang.get(segment.source_lang)
+            if provider is None:
+                provider = self._resolve(segment, target_lang, persona=persona, domain=domain)
+                by_source_lang[segment.source_lang] = provider
+            groups.setdefault(provider.provider_id, (provider, []))[1].append(index)
+
+        for provider, indices in groups.values():
+            if uses_batch_path(provider):
+                for chunk in _batch_chunks(provider, segments, indices):
+                    batch_results = self._invoke_batch(
+                        provider,
+                        [segments[i] for i in chunk],
+                        target_lang,
+                        system_prompt_addendum=system_prompt_addendum,
+                    )
+                    for index, result in zip(chunk, batch_results, strict=True):
+                        results[index] = result
+                continue
+            for index in indices:
+                results[index] = self._invoke_provider(
+                    provider,
+                    segments[index],
+                    target_lang,
+                    system_prompt_addendum=system_prompt_addendum,
+                )
+        return [result for result in results if result is not None]
+
+    def resolves_to_batch(
+        self,
+        source_lang: str,
+        target_lang: str,
+        *,
+        persona: str | None = None,
+        domain: str | None = None,
+    ) -> bool:
+        """``True`` when the pair routes to a provider on the batch path
+        (see :func:`~ainemo.providers.base.uses_batch_path`) that
+        supports it — the pipeline's cue to prefetch TM misses
+        through :meth:`translate_batch`. Routing errors answer
+        ``False`` so the per-segment path raises them as usual."""
+        try:
+            provider = self._select_provider(
+                source_lang=source_lang,
+                target_lang=target_lang,
+                persona=persona,
+                domain=domain,
+            )
+        except ProviderRouteNotFound:
+            return False
+        return uses_batch_path(provider) and provider.supports(source_lang, target_lang)
+
+    def translate_multi(
+        self,
+        segments: Sequence[Segment],
+        target_langs: Sequence[str],
+        *,
+        system_prompt_addendum: str | None = None,
+        persona: str | None = None,
+        domain: str | None = None,
+    ) -> dict[str, list[ProviderResult]]:
+        """Route and translate ``segments`` into every language in
+        ``target_langs``; returns ``{target_lang: results}`` with each
+        list in input order.
+
+        Segments are grouped by source language. A group whose every
+        target language routes to the same
+        :class:`MultiTargetProvider` gets retry-wrapped
+        ``translate_multi`` calls, one per pack for a
+        :class:`PackingProvider`. Any other group goes through
+        :meth:`translate_batch` once per language. Each (segment,
+        language) pair is recorded to the UsageLog individually.
+        """
+        results: dict[str, list[ProviderResult | None]] = {
+            lang: [None] * len(segments) for lang in target_langs
+        }
+        by_source_lang: dict[str, list[int]] = {}
+        for index, segment in enumerate(segments):
+            by_source_lang.setdefault(segment.source_lang, []).append(index)
+
+        for source_lang, indices in by_source_lang.items():
+            provider = self._multi_target_provider(
+                source_lang, target_langs, persona=persona, domain=domain
+            )
+            if provider is None:
+                group = [segments[i] for i in indices]
+                for lang in target_langs:
+                    batch_results = self.translate_batch(
+                        group,
+                        lang,
+                        system_prompt_addendum=system_prompt_addendum,
+                        persona=persona,
+                        domain=domain,
+                    )
+                    for index, result in zip(indices, batch_results, strict=True):
+                        results[lang][index] = result
+                continue
+            for chunk in _batch_chunks(provider, segments, indices):
+                chunk_results = self._invoke_multi(
+                    provider,
+                    [segments[i] for i in chunk],
+                    target_langs,
+                    system_prompt_addendum=system_prompt_addendum,
+                )
+                for lang in target_langs:
+                    for index, result in zip(chunk, chunk_results[lang], strict=True):
+                        results[lang][index] = result
+        return {
+            lang: [result for result in by_index if result is not None]
+            for lang, by_index in results.items()
+        }
+
+    def resolves_to_multi(
+        self,
+        source_lang: str,
+        target_langs: Sequence[str],
+        *,
+        persona: str | None = None,
+        domain: str | None = None,
+    ) -> bool:
+        """``True`` when every pair routes to one provider on the
+        multi-target path (see
+        :func:`~ainemo.providers.base.uses_multi_target_path`) that
+        supports them all — the pipeline's cue to translate all
+        languages through :meth:`translate_multi`."""
+        return (
+            self._multi_target_provider(source_lang, target_langs, persona=persona, domain=domain)
+            is not None
         )
 
     def translate_with(
@@ -219,6 +561,29 @@ class ProviderRouter:
             segment,
             target_lang,
             system_prompt_addendum=system_prompt_addendum,
+            # The caller chose this provider: hedge to it, never to
+            # the secondary.
+            hedge_to=provider if self._hedge is not None else None,
+        )
+
+    def explain_route(
+        self,
+        source_lang: str,
+        target_lang: str,
+        *,
+        persona: str | None = None,
+        domain: str | None = None,
+    ) -> RouteDecision:
+        """Route a call for the pair and return the decision: the
+        provider, the reason and, for an adaptive rule, each
+        candidate's scores. Consumes an exploration draw like a real
+        call, so a seeded router explains the decisions it makes."""
+        return self._selector.decide(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            persona=persona,
+            domain=domain,
+            supported=self._supports_pair(source_lang, target_lang),
         )
 
     def list_registered(self) -> tuple[str, ...]:
@@ -245,76 +610,436 @@ class ProviderRouter:
         target_lang: str,
         *,
         system_prompt_addendum: str | None = None,
+        hedge_to: Provider | None = None,
     ) -> ProviderResult:
         """Time, call, attribute, and record one provider invocation.
 
         Shared by :meth:`translate` and :meth:`translate_with` so the
         wall-clock measurement + attribution patch + UsageLog write happen
         exactly once regardless of how the provider was selected.
+        ``hedge_to`` is where a hedged duplicate goes (``None``: no
+        hedging). With a response cache, a repeated request is answered
+        from it and recorded as a hit.
         """
 
-        def _do_call() -> ProviderResult:
+        def _run(target: Provider) -> ProviderResult:
+            return self._call(
+                target,
+                lambda: _translate_once(target, segment, target_lang, system_prompt_addendum),
+                estimate_tokens(
+                    (segment.source_text,), system_prompt_addendum=system_prompt_addendum
+                ),
+                lambda result: (result,),
+            )
+
+        def _guarded() -> ProviderResult:
+            return self._guarded(
+                provider,
+                _run,
+                lambda target, result: self._record(target, result, segment, target_lang),
+                hedge_to=hedge_to,
+            )
+
+        if self._response_cache is None:
+            return _guarded()
+        result, shared = self._response_cache.get_or_call(
+            _request_key(provider, segment, target_lang, system_prompt_addendum), _guarded
+        )
+        if not shared:
+            return result
+        hit = as_cache_hit(result)
+        self._record(provider, hit, segment, target_lang, cache_hit=True)
+        return hit
+
+    def _invoke_batch(
+        self,
+        provider: BatchProvider,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        """Batch counterpart of :meth:`_invoke_provider`: one timed,
+        retry-wrapped call, then per-segment attribution and records.
+        Bounded by the deadline, never hedged."""
+
+        def _do_call() -> list[ProviderResult]:
             started = time.perf_counter()
-            # Conditional kwarg pass mirrors the cycle-3 S6 pipeline
-            # call site — when no addendum was supplied, call the
-            # underlying provider with the cycle-2 (segment, target_lang)
-            # signature so test stubs and pre-Protocol-bump impls
-            # stay byte-stable.
             if system_prompt_addendum is None:
-                result: ProviderResult = provider.translate(segment, target_lang)
+                raw = provider.translate_batch(segments, target_lang)
             else:
-                result = provider.translate(
-                    segment,
+                raw = provider.translate_batch(
+                    segments,
                     target_lang,
                     system_prompt_addendum=system_prompt_addendum,
                 )
             elapsed_ms = int((time.perf_counter() - started) * 1000)
-            # PR #7 review #10: split the post-call patch into two
-            # explicit defense-in-depth steps so a future bisect or
-            # reader sees one concern per branch. Observable output is
-            # identical to the pre-split single-conditional form
-            # (``test_router.py`` covers both legs); only the number of
-            # ProviderResult allocations changes (worst case 2 instead
-            # of 1, on the cold path where both fields need patching).
-
-            # Step 1: attribution. Providers MUST self-attribute via
-            # ``result.provider``, but a buggy provider returning an
-            # empty string would silently misroute TM rows. Fall back
-            # to the concrete provider's ``provider_id`` ClassVar when
-            # the result didn't set it.
-            if not result.provider:
-                result = _replace(result, provider=provider.provider_id)
-
-            # Step 2: latency. Providers typically populate
-            # ``latency_ms`` themselves; if they didn't (or set 0),
-            # substitute the router's wall-clock measurement so cost
-            # surveillance never under-reports.
-            if result.latency_ms <= 0:
-                result = _replace(result, latency_ms=elapsed_ms)
+            if len(raw) != len(segments):
+                raise RuntimeError(
+                    f"Provider {provider.provider_id!r} returned {len(raw)} results "
+                    f"for a batch of {len(segments)} segments."
+                )
+            share_ms = elapsed_ms // len(segments) if segments else 0
+            return [_finalize(result, provider, share_ms) for result in raw]
+
+        def _record_all(target: BatchProvider, results: list[ProviderResult]) -> None:
+            for segment, result in zip(segments, results, strict=True):
+                self._record(target, result, segment, target_lang)
+
+        return self._guarded(
+            provider,
+            lambda target: self._call(
+                target,
+                _do_call,
+                estimate_tokens(
+                    [segment.source_text for segment in segments],
+                    system_prompt_addendum=system_prompt_addendum,
+                ),
+                lambda results: results,
+            ),
+            _record_all,
+        )
+
+    def _invoke_multi(
+        self,
+        provider: MultiTargetProvider,
+        segments: Sequence[Segment],
+        target_langs: Sequence[str],
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> dict[str, list[ProviderResult]]:
+        """Multi-target counterpart of :meth:`_invoke_batch`."""
+
+        def _do_call() -> dict[str, list[ProviderResult]]:
+            started = time.perf_counter()
+            if system_prompt_addendum is None:
+                raw = provider.translate_multi(segments, target_langs)
+            else:
+                raw = provider.translate_multi(
+                    segments,
+                    target_langs,
+                    system_prompt_addendum=system_prompt_addendum,
+                )
+            elapsed_ms = int((time.perf_counter() - started) * 1000)
+            short = [lang for lang in target_langs if len(raw.get(lang, ())) != len(segments)]
+            if short:
+                raise RuntimeError(
+                    f"Provider {provider.provider_id!r} did not return {len(segments)} "
+                    f"results for {short} in a multi-target call."
+                )
+            cells = len(segments) * len(target_langs)
+            share_ms = elapsed_ms // cells if cells else 0
+            return {
+                lang: [_finalize(result, provider, share_ms) for result in raw[lang]]
+                for lang in target_langs
+            }
 
-            return result
+        def _record_all(
+            target: MultiTargetProvider, results: dict[str, list[ProviderResult]]
+        ) -> None:
+            for lang in target_langs:
+                for segment, result in zip(segments, results[lang], strict=True):
+                    self._record(target, result, segment, lang)
 
-        if self._retry_exceptions:
-            result = with_retry(
+        return self._guarded(
+            provider,
+            lambda target: self._call(
+                target,
                 _do_call,
-                rate_limit_exceptions=self._retry_exceptions,
-                sleep=self._sleep,
+                estimate_tokens(
+                    [segment.source_text for segment in segments],
+                    system_prompt_addendum=system_prompt_addendum,
+                    target_count=len(target_langs),
+                ),
+                lambda results: [result for by_lang in results.values() for result in by_lang],
+            ),
+            _record_all,
+        )
+
+    def _guarded(
+        self,
+        provider: P,
+        run: Callable[[P], T],
+        record: Callable[[P, T], None],
+        *,
+        hedge_to: P | None = None,
+    ) -> T:
+        """Run ``run(provider)`` within the router's deadline, hedged
+        to ``hedge_to`` once it outlasts the provider's latency
+        quantile, and record the winning attempt. Without a deadline
+        or hedge target the call runs on the caller's thread. A failed
+        call counts against the provider's adaptive-routing error
+        rate."""
+        if self._deadline_s is None and hedge_to is None:
+            try:
+                value = run(provider)
+            except Exception:
+                self._observe_error(provider)
+                raise
+            record(provider, value)
+            return value
+
+        def _attempt_of(target: P) -> Callable[[], tuple[P, T]]:
+            def _timed() -> tuple[P, T]:
+                started = time.perf_counter()
+                value = run(target)
+                self._latency(target).observe(time.perf_counter() - started)
+                return target, value
+
+            return _timed
+
+        hedge_after = self._hedge_delay(provider) if hedge_to is not None else None
+        try:
+            winner, value = run_hedged(
+                self._race_executor(),
+                _attempt_of(provider),
+                hedge=None if hedge_to is None or hedge_after is None else _attempt_of(hedge_to),
+                hedge_after_s=hedge_after,
+                deadline_s=self._deadline_s,
+                on_late=lambda late: record(*late),
             )
-        else:
-            result = _do_call()
+        except Exception:
+            self._observe_error(provider)
+            raise
+        record(winner, value)
+        return value
+
+    async def _aguarded(
+        self,
+        provider: Provider,
+        run: Callable[[Provider], Awaitable[T]],
+        record: Callable[[Provider, T], None],
+        *,
+        hedge_to: Provider | None = None,
+    ) -> T:
+        """Coroutine form of :meth:`_guarded`; the winner's UsageLog
+        append runs in a worker thread."""
+        try:
+            winner, value = await self._arace(provider, run, record, hedge_to=hedge_to)
+        except Exception:
+            self._observe_error(provider)
+            raise
+        await asyncio.to_thread(record, winner, value)
+        return value
 
+    async def _arace(
+        self,
+        provider: Provider,
+        run: Callable[[Provider], Awaitable[T]],
+        record: Callable[[Provider, T], None],
+        *,
+        hedge_to: Provider | None,
+    ) -> tuple[Provider, T]:
+        """The attempt that won, and its value (see :meth:`_aguarded`)."""
+        if self._deadline_s is None and hedge_to is None:
+            return provider, await run(provider)
+
+        def _attempt_of(target: Provider) -> Callable[[], Awaitable[tuple[Provider, T]]]:
+            async def _timed() -> tuple[Provider, T]:
+                started = time.perf_counter()
+                value = await run(target)
+                self._latency(target).observe(time.perf_counter() - started)
+                return target, value
+
+            return _timed
+
+        hedge_after = self._hedge_delay(provider) if hedge_to is not None else None
+        return await arun_hedged(
+            _attempt_of(provider),
+            hedge=None if hedge_to is None or hedge_after is None else _attempt_of(hedge_to),
+            hedge_after_s=hedge_after,
+            deadline_s=self._deadline_s,
+            on_late=lambda late: record(*late),
+        )
+
+    def _hedge_target(
+        self, provider: Provider, source_lang: str, target_lang: str
+    ) -> Provider | None:
+        """Where a hedge of a call routed to ``provider`` goes: the
+        policy's secondary provider when it supports the pair, else
+        ``provider`` itself; ``None`` without a hedge policy."""
+        if self._hedge is None:
+            return None
+        secondary_id = self._hedge.secondary_provider
+        secondary = self._providers.get(secondary_id) if secondary_id is not None else None
+        if secondary is not None and secondary.supports(source_lang, target_lang):
+            return secondary
+        return provider
+
+    def _hedge_delay(self, provider: Provider) -> float | None:
+        """Seconds before hedging a call to ``provider``, or ``None``
+        while too few of its calls have been observed."""
+        if self._hedge is None:
+            return None
+        observed = self._latency(provider).quantile(
+            self._hedge.quantile, min_samples=self._hedge.min_samples
+        )
+        return None if observed is None else max(self._hedge.min_delay_s, observed)
+
+    def _latency(self, provider: Provider) -> LatencyWindow:
+        with self._race_lock:
+            window = self._latencies.get(provider.provider_id)
+            if window is None:
+                size = self._hedge.window if self._hedge is not None else None
+                window = LatencyWindow() if size is None else LatencyWindow(size)
+                self._latencies[provider.provider_id] = window
+            return window
+
+    def _race_executor(self) -> ThreadPoolExecutor:
+        with self._race_lock:
+            if self._race_pool is None:
+                self._race_pool = ThreadPoolExecutor(
+                    max_workers=_RACE_WORKERS, thread_name_prefix=_RACE_THREAD_PREFIX
+                )
+            return self._race_pool
+
+    def _call(
+        self,
+        provider: Provider,
+        do_call: Callable[[], T],
+        estimated_tokens: int,
+        results_of: Callable[[T], Iterable[ProviderResult]],
+    ) -> T:
+        """Run ``do_call`` paced by the provider's rate limiter (when
+        the router has limiters) and retry-wrapped (when it has retry
+        exception types). ``results_of`` flattens the call's return
+        value for the limiter's token-usage correction."""
+        limiter = self._limiter(provider)
+
+        def _attempt() -> T:
+            if limiter is None:
+                return do_call()
+            limiter.acquire(estimated_tokens, sleep=self._sleep)
+            try:
+                value = do_call()
+            except BaseException as exc:
+                self._throttle_on_rate_limit(limiter, exc)
+                raise
+            limiter.settle(estimated_tokens, _used_tokens(results_of(value)))
+            return value
+
+        if not self._retry_exceptions:
+            return _attempt()
+        return with_retry(
+            _attempt,
+            rate_limit_exceptions=self._retry_exceptions,
+            sleep=self._sleep,
+            retry_after=_retry_after(limiter),
+        )
+
+    def _limiter(self, provider: Provider) -> RateLimiter | None:
+        if self._rate_limiters is None:
+            return None
+        return self._rate_limiters.limiter(provider.provider_id, _model_of(provider))
+
+    def _throttle_on_rate_limit(self, limiter: RateLimiter, exc: BaseException) -> None:
+        """Report ``exc`` to ``limiter`` when it is a rate-limit
+        rejection: HTTP 429 from any SDK, or a configured retry type."""
+        if is_rate_limit_error(exc) or isinstance(exc, self._retry_exceptions):
+            limiter.throttle(exc)
+
+    def _multi_target_provider(
+        self,
+        source_lang: str,
+        target_langs: Sequence[str],
+        *,
+        persona: str | None,
+        domain: str | None,
+    ) -> MultiTargetProvider | None:
+        """The one multi-target provider serving every pair, or
+        ``None`` (different providers, an unsupported pair, or a
+        routing error)."""
+        try:
+            routed = [
+                self._select_provider(
+                    source_lang=source_lang,
+                    target_lang=lang,
+                    persona=persona,
+                    domain=domain,
+                )
+                for lang in target_langs
+            ]
+        except ProviderRouteNotFound:
+            return None
+        if not routed or any(provider is not routed[0] for provider in routed):
+            return None
+        provider = routed[0]
+        if not uses_multi_target_path(provider):
+            return None
+        if not all(provider.supports(source_lang, lang) for lang in target_langs):
+            return None
+        return provider
+
+    def _record(
+        self,
+        provider: Provider,
+        result: ProviderResult,
+        segment: Segment,
+        target_lang: str,
+        *,
+        cache_hit: bool = False,
+    ) -> None:
         self._usage_log.record(
             provider=provider.provider_id,
             model=result.model,
             input_tokens=result.input_tokens,
             output_tokens=result.output_tokens,
+            cache_read_tokens=result.cache_read_tokens,
+            cache_write_tokens=result.cache_write_tokens,
             latency_ms=result.latency_ms,
             cost_usd=result.cost_usd,
             source_lang=segment.source_lang,
             target_lang=target_lang,
             segment_fingerprint=segment.fingerprint,
+            response_cache_hit=cache_hit,
+            endpoint=result.endpoint,
         )
-        return result
+        if self._selector.adaptive and not cache_hit:
+            self._selector.observe(
+                provider.provider_id,
+                latency_ms=result.latency_ms,
+                cost_usd=result.cost_usd,
+                tokens=_used_tokens((result,)),
+            )
+
+    def _observe_error(self, provider: Provider) -> None:
+        if self._selector.adaptive:
+            self._selector.observe_error(provider.provider_id)
+
+    def _supports_pair(self, source_lang: str, target_lang: str) -> Callable[[str], bool]:
+        """Whether a provider id is registered and supports the pair."""
+
+        def _supported(provider_id: str) -> bool:
+            provider = self._providers.get(provider_id)
+            return provider is not None and provider.supports(source_lang, target_lang)
+
+        return _supported
+
+    def _resolve(
+        self,
+        segment: Segment,
+        target_lang: str,
+        *,
+        persona: str | None,
+        domain: str | None,
+    ) -> Provider:
+        """Select the routed provider and fail fast on an unsupported
+        pair — shared by :meth:`translate` and :meth:`atranslate`."""
+        provider = self._select_provider(
+            source_lang=segment.source_lang,
+            target_lang=target_lang,
+            persona=persona,
+            domain=domain,
+        )
+        if not provider.supports(segment.source_lang, target_lang):
+            raise ProviderUnsupportedPair(
+                f"Provider {provider.provider_id!r} does not support "
+                f"({segment.source_lang!r} → {target_lang!r}). Per the "
+                f"cycle-2 fail-fast routing policy, the router does not "
+                f"silently fall back to a different provider — fix the "
+                f"routing config or pass --provider explicitly."
+            )
+        return provider
 
     def _select_provider(
         self,
@@ -324,37 +1049,152 @@ class ProviderRouter:
         persona: str | None,
         domain: str | None,
     ) -> Provider:
-        for rule in self._routing_config.rules:
-            if rule.matches(
-                source_lang=source_lang,
-                target_lang=target_lang,
-                persona=persona,
-                domain=domain,
-            ):
-                provider = self._providers.get(rule.provider_id)
-                if provider is None:
-                    raise ProviderRouteNotFound(
-                        f"Routing rule selected provider {rule.provider_id!r} "
-                        f"but no provider with that id is registered. "
-                        f"Available: {sorted(self._providers)}."
-                    )
-                return provider
-        # No rule matched — fall back to default.
-        default = self._providers.get(self._routing_config.default_provider)
-        if default is None:
+        decision = self._selector.decide(
+            source_lang=source_lang,
+            target_lang=target_lang,
+            persona=persona,
+            domain=domain,
+            supported=self._supports_pair(source_lang, target_lang),
+        )
+        provider = self._providers.get(decision.provider_id)
+        if provider is not None:
+            return provider
+        if decision.rule_index is not None:
             raise ProviderRouteNotFound(
-                f"No routing rule matched ({source_lang!r} → {target_lang!r}) "
-                f"and the default provider "
-                f"{self._routing_config.default_provider!r} is not registered. "
+                f"Routing rule selected provider {decision.provider_id!r} "
+                f"but no provider with that id is registered. "
                 f"Available: {sorted(self._providers)}."
             )
-        return default
+        # No rule matched and the default is not registered.
+        raise ProviderRouteNotFound(
+            f"No routing rule matched ({source_lang!r} → {target_lang!r}) "
+            f"and the default provider "
+            f"{self._routing_config.default_provider!r} is not registered. "
+            f"Available: {sorted(self._providers)}."
+        )
+
+
+def _batch_chunks(
+    provider: Provider, segments: Sequence[Segment], indices: list[int]
+) -> list[list[int]]:
+    """Split one provider group into its ``translate_batch`` /
+    ``translate_multi`` calls: the whole group, or for a
+    :class:`PackingProvider` one call per pack of same-source-language
+    segments."""
+    if not isinstance(provider, PackingProvider):
+        return [indices]
+    by_source_lang: dict[str, list[int]] = {}
+    for index in indices:
+        by_source_lang.setdefault(segments[index].source_lang, []).append(index)
+    size = provider.pack_size
+    return [
+        group[start : start + size]
+        for group in by_source_lang.values()
+        for start in range(0, len(group), size)
+    ]
+
+
+def _retry_after(limiter: RateLimiter | None) -> Callable[[BaseException], float | None]:
+    """Retry wait policy: the server's ``Retry-After`` for unpaced
+    calls; none for paced ones, whose next attempt queues in the
+    limiter instead."""
+    if limiter is None:
+        return retry_after_seconds
+    return lambda exc: 0.0
+
+
+def _model_of(provider: Provider) -> str:
+    """The provider's configured model id, or ``""`` for providers
+    that do not expose one."""
+    model = getattr(provider, "model", None)
+    return model if isinstance(model, str) else ""
+
+
+def _request_key(
+    provider: Provider, segment: Segment, target_lang: str, system_prompt_addendum: str | None
+) -> str:
+    return request_key(
+        provider_id=provider.provider_id,
+        model=_model_of(provider),
+        segment_fingerprint=segment.fingerprint,
+        target_lang=target_lang,
+        system_prompt_addendum=system_prompt_addendum,
+    )
+
+
+def _used_tokens(results: Iterable[ProviderResult]) -> int | None:
+    """Reported tokens across ``results``, or ``None`` when no result
+    reported any."""
+    counts = [
+        count
+        for result in results
+        for count in (result.input_tokens, result.output_tokens)
+        if count is not None
+    ]
+    return sum(counts) if counts else None
+
+
+def _translate_once(
+    provider: Provider,
+    segment: Segment,
+    target_lang: str,
+    system_prompt_addendum: str | None,
+) -> ProviderResult:
+    """One timed ``provider.translate`` call, finalized."""
+    started = time.perf_counter()
+    # Conditional kwarg pass mirrors the cycle-3 S6 pipeline
+    # call site — when no addendum was supplied, call the
+    # underlying provider with the cycle-2 (segment, target_lang)
+    # signature so test stubs and pre-Protocol-bump impls
+    # stay byte-stable.
+    if system_prompt_addendum is None:
+        result: ProviderResult = provider.translate(segment, target_lang)
+    else:
+        result = provider.translate(
+            segment,
+            target_lang,
+            system_prompt_addendum=system_prompt_addendum,
+        )
+    elapsed_ms = int((time.perf_counter() - started) * 1000)
+    return _finalize(result, provider, elapsed_ms)
+
+
+def _finalize(result: ProviderResult, provider: Provider, elapsed_ms: int) -> ProviderResult:
+    """Post-call patch applied to every provider result, sync or async."""
+    # PR #7 review #10: split the post-call patch into two
+    # explicit defense-in-depth steps so a future bisect or
+    # reader sees one concern per branch. Observable output is
+    # identical to the pre-split single-conditional form
+    # (``test_router.py`` covers both legs); only the number of
+    # ProviderResult allocations changes (worst case 2 instead
+    # of 1, on the cold path where both fields need patching).
+
+    # Step 1: attribution. Providers MUST self-attribute via
+    # ``result.provider``, but a buggy provider returning an
+    # empty string would silently misroute TM rows. Fall back
+    # to the concrete provider's ``provider_id`` ClassVar when
+    # the result didn't set it.
+    if not result.provider:
+        result = _replace(result, provider=provider.provider_id)
+
+    # Step 2: latency. Providers typically populate
+    # ``latency_ms`` themselves; if they didn't (or set 0),
+    # substitute the router's wall-clock measurement so cost
+    # surveillance never under-reports.
+    if result.latency_ms <= 0:
+        result = _replace(result, latency_ms=elapsed_ms)
+
+    return result
 
 
 __all__ = [
+    "AdaptiveRule",
+    "HedgePolicy",
+    "ProviderDeadlineExceeded",
     "ProviderRouter",
     "ProviderRouteNotFound",
     "ProviderUnsupportedPair",
+    "RouteDecision",
     "RoutingConfig",
     "RoutingRule",
     "UnknownProviderError",
@@ -0,0 +1,188 @@
+"""Quality-and-throughput comparison of the local-model CPU options.
+
+:class:`~ainemo.providers._local_model.LocalModelOptions` trades output
+fidelity for speed and memory (int8 quantization, bf16, greedy decoding).
+This harness translates one small fixed corpus of UI strings with a real
+OPUS-MT checkpoint under each configuration and reports, per config:
+
+- segments per second through :meth:`OpusProvider.translate_batch`;
+- agreement with the fp32 / default-decoding baseline — the exact-match
+  rate and the mean character-level similarity (``difflib`` ratio).
+
+Agreement with the baseline is a proxy for quality: it shows how much
+an option changes the output, not whether the change is better or
+worse. Review the per-segment outputs in the results file before
+switching a fleet-wide default.
+
+Target:
+
+- int8 (beam and greedy) mean similarity to baseline ≥ 0.8.
+
+Needs the checkpoint in the local HuggingFace cache (or network on the
+first run); the test skips otherwise. Override the model with
+``AINEMO_BENCH_OPUS_MODEL`` (default ``Helsinki-NLP/opus-mt-en-de``).
+
+Run manually:
+
+    pytest -m benchmark tests/benchmarks/test_local_model_options_benchmark.py
+
+Results write to ``tests/benchmarks/results/``; they are per-host
+artifacts, so compare successive local runs rather than across hosts.
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+from ainemo.core.segment import Segment
+from ainemo.providers._local_model import (
+    DTYPE_BFLOAT16,
+    LocalModelOptions,
+    cpu_supports_bf16,
+)
+from ainemo.providers._seq2seq import Seq2SeqEngine
+from ainemo.providers.opus._client import MarianModelCache
+from ainemo.providers.opus.opus_provider import OpusProvider
+
+# --- Corpus + targets -----------------------------------------------------
+
+_MODEL_ENV_VAR: Final = "AINEMO_BENCH_OPUS_MODEL"
+_DEFAULT_MODEL: Final = "Helsinki-NLP/opus-mt-en-de"
+_TARGET_LANG: Final = "de-DE"
+
+_MIN_INT8_SIMILARITY: Final = 0.8
+
+_REPEATS: Final = 3
+"""Timed passes per config; the median rate is reported."""
+
+_CORPUS: Final = (
+    "Save",
+    "Cancel",
+    "Delete account",
+    "Are you sure you want to delete this file?",
+    "Your changes have been saved.",
+    "Sign in with your email address",
+    "Forgot your password?",
+    "The password must contain at least eight characters.",
+    "No results found",
+    "Search for products, brands and categories",
+    "Add to cart",
+    "Your order has been shipped and will arrive in three to five business days.",
+    "Settings",
+    "Notifications are turned off for this device.",
+    "Upload a profile picture",
+    "You have unsaved changes. Leave this page anyway?",
+    "Download the latest version",
+    "This field is required.",
+    "Thank you for your feedback!",
+    "Contact customer support",
+)
+
+_CONFIGS: Final = {
+    "baseline": LocalModelOptions(),
+    "greedy": LocalModelOptions(num_beams=1),
+    "int8": LocalModelOptions(quantize_int8=True),
+    "int8_greedy": LocalModelOptions(quantize_int8=True, num_beams=1),
+    "bf16": LocalModelOptions(dtype=DTYPE_BFLOAT16),
+}
+
+
+# --- Harness --------------------------------------------------------------
+
+
+def _provider(model_name: str, options: LocalModelOptions) -> OpusProvider:
+    """OPUS provider whose every target resolves to ``model_name``."""
+
+    class _FixedModelCache(MarianModelCache):
+        def get(self, hf_model_name: str) -> tuple[object, object]:
+            return super().get(model_name)
+
+    return OpusProvider(
+        cache=_FixedModelCache(options=options), engine=Seq2SeqEngine(), options=options
+    )
+
+
+def _run_config(
+    model_name: str, options: LocalModelOptions, segments: list[Segment]
+) -> tuple[list[str], float]:
+    provider = _provider(model_name, options)
+    outputs = [r.target_text for r in provider.translate_batch(segments, _TARGET_LANG)]
+    rates: list[float] = []
+    for _ in range(_REPEATS):
+        started = time.perf_counter()
+        provider.translate_batch(segments, _TARGET_LANG)
+        rates.append(len(segments) / (time.perf_counter() - started))
+    return outputs, statistics.median(rates)
+
+
+@pytest.mark.benchmark
+def test_local_model_options_quality_and_throughput() -> None:
+    model_name = os.environ.get(_MODEL_ENV_VAR, _DEFAULT_MODEL)
+    try:
+        MarianModelCache().get(model_name)
+    except (OSError, TypeError, ValueError) as exc:
+        # transformers surfaces a missing offline checkpoint as an
+        # OSError, or as a TypeError when only part of it is cached.
+        pytest.skip(f"{model_name} is not available offline: {exc}")
+
+    segments = [
+        Segment(key=f"k{i}", source_text=text, source_lang="en-US")
+        for i, text in enumerate(_CORPUS)
+    ]
+    configs = dict(_CONFIGS)
+    if not cpu_supports_bf16():
+        del configs["bf16"]
+
+    report: dict[str, dict[str, object]] = {}
+    baseline_outputs: list[str] = []
+    for name, options in configs.items():
+        outputs, rate = _run_config(model_name, options, segments)
+        if name == "baseline":
+            baseline_outputs = outputs
+        similarities = [
+            difflib.SequenceMatcher(None, base, out).ratio()
+            for base, out in zip(baseline_outputs, outputs, strict=True)
+        ]
+        report[name] = {
+            "segments_per_s": rate,
+            "exact_match_rate": sum(s == 1.0 for s in similarities) / len(similarities),
+            "mean_similarity": statistics.fmean(similarities),
+            "outputs": outputs,
+        }
+        print(
+            f"\n[{name}] {rate:.1f} seg/s, exact={report[name]['exact_match_rate']:.2f}, "
+            f"similarity={report[name]['mean_similarity']:.3f}"
+        )
+
+    _record_result(
+        "local_model_options",
+        {"model": model_name, "corpus": list(_CORPUS), "configs": report},
+    )
+    for name in ("int8", "int8_greedy"):
+        similarity = report[name]["mean_similarity"]
+        assert isinstance(similarity, float)
+        assert similarity >= _MIN_INT8_SIMILARITY, (
+            f"{name} output drifted from the fp32 baseline (mean similarity "
+            f"{similarity:.3f} < {_MIN_INT8_SIMILARITY}). Inspect the outputs "
+            f"in tests/benchmarks/results/local_model_options.json."
+        )
+
+
+# --- Helpers --------------------------------------------------------------
+
+
+def _record_result(name: str, data: dict[str, object]) -> None:
+    results_dir = Path(__file__).parent / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    target = results_dir / f"{name}.json"
+    target.write_text(
+        json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
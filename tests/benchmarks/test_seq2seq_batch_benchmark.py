@@ -0,0 +1,194 @@
+"""Batched vs per-segment seq2seq throughput benchmark.
+
+:class:`~ainemo.providers._seq2seq.Seq2SeqEngine` exists so the local
+providers stop paying one ``generate`` call per segment. This benchmark
+runs the same corpus through :meth:`OpusProvider.translate` (one
+segment per call) and :meth:`OpusProvider.translate_batch` (length-
+bucketed, padded batches) and reports segments per second for each.
+
+The model is a tiny randomly initialised MarianMT (same architecture
+class as the real OPUS models, a fraction of the width) with a
+character-level tokenizer, so the benchmark runs offline and measures
+the batching machinery rather than one model's quality. Absolute
+numbers on a real ``opus-mt-*`` checkpoint are lower; the ratio is what
+this tracks.
+
+Target (CPU baseline):
+
+- Batched throughput ≥ 2× the per-segment path on a 256-segment corpus.
+
+Run manually:
+
+    pytest -m benchmark tests/benchmarks/test_seq2seq_batch_benchmark.py
+
+Results write to ``tests/benchmarks/results/``; they are per-host
+artifacts, so compare successive local runs rather than across hosts.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from typing import Any, Final
+
+import pytest
+
+from ainemo.core.segment import Segment
+from ainemo.providers._seq2seq import DEFAULT_BATCH_SIZE, Seq2SeqEngine
+from ainemo.providers.opus._client import MarianModelCache
+from ainemo.providers.opus.opus_provider import OpusProvider
+
+# --- Targets + corpus shape -----------------------------------------------
+
+_MIN_SPEEDUP: Final = 2.0
+"""Batched segments/sec over per-segment segments/sec."""
+
+_CORPUS_SIZE: Final = 256
+
+_MAX_LENGTH: Final = 24
+"""Generation cap. The random model rarely emits EOS, so every output
+runs to roughly this length on both paths — equal work per segment."""
+
+_VOCAB_SIZE: Final = 128
+_PAD_ID: Final = 0
+_EOS_ID: Final = 1
+_RESERVED_IDS: Final = 2
+
+
+# --- Offline model + tokenizer --------------------------------------------
+
+
+class _CharTokenizer:
+    """Character-level stand-in for ``MarianTokenizer``: the subset of
+    its API the engine and ``_translate_with_marian`` use."""
+
+    def __call__(
+        self,
+        text: str | list[str],
+        *,
+        return_tensors: str,
+        padding: bool,
+        max_length: int,
+        truncation: bool,
+    ) -> dict[str, Any]:
+        import torch
+
+        texts = [text] if isinstance(text, str) else text
+        rows = [self._encode(t)[:max_length] for t in texts]
+        width = max(len(r) for r in rows)
+        ids = torch.full((len(rows), width), _PAD_ID, dtype=torch.long)
+        mask = torch.zeros((len(rows), width), dtype=torch.long)
+        for i, row in enumerate(rows):
+            ids[i, : len(row)] = torch.tensor(row)
+            mask[i, : len(row)] = 1
+        return {"input_ids": ids, "attention_mask": mask}
+
+    def decode(self, ids: Any, *, skip_special_tokens: bool) -> str:
+        return "".join(chr(int(i) + 32) for i in ids if int(i) >= _RESERVED_IDS)
+
+    def batch_decode(self, rows: Any, *, skip_special_tokens: bool) -> list[str]:
+        return [self.decode(row, skip_special_tokens=skip_special_tokens) for row in rows]
+
+    def _encode(self, text: str) -> list[int]:
+        span = _VOCAB_SIZE - _RESERVED_IDS
+        return [_RESERVED_IDS + (ord(c) % span) for c in text] + [_EOS_ID]
+
+
+class _TinyMarianCache(MarianModelCache):
+    """Hands out one tiny random MarianMT for every repo id."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        import torch
+        from transformers import MarianConfig, MarianMTModel
+
+        torch.manual_seed(0)
+        config = MarianConfig(
+            vocab_size=_VOCAB_SIZE,
+            d_model=64,
+            encoder_layers=2,
+            decoder_layers=2,
+            encoder_attention_heads=4,
+            decoder_attention_heads=4,
+            encoder_ffn_dim=128,
+            decoder_ffn_dim=128,
+            max_position_embeddings=128,
+            pad_token_id=_PAD_ID,
+            eos_token_id=_EOS_ID,
+            decoder_start_token_id=_PAD_ID,
+        )
+        self._pair = (_CharTokenizer(), MarianMTModel(config).eval())
+
+    def get(self, hf_model_name: str) -> tuple[Any, Any]:
+        return self._pair
+
+
+def _corpus() -> list[Segment]:
+    """Resource-bundle-shaped strings of mixed length."""
+    words = ("Save", "changes", "to", "your", "profile", "before", "leaving", "the", "page")
+    return [
+        Segment(
+            key=f"k{i}",
+            source_text=" ".join(words[: 1 + (i * 7) % len(words)]),
+            source_lang="en-US",
+        )
+        for i in range(_CORPUS_SIZE)
+    ]
+
+
+# --- Benchmark ------------------------------------------------------------
+
+
+@pytest.mark.benchmark
+def test_batched_throughput_beats_per_segment() -> None:
+    provider = OpusProvider(
+        max_length=_MAX_LENGTH,
+        cache=_TinyMarianCache(),
+        engine=Seq2SeqEngine(batch_size=DEFAULT_BATCH_SIZE),
+    )
+    segments = _corpus()
+    provider.translate_batch(segments[:DEFAULT_BATCH_SIZE], "de-DE")  # Warm-up.
+
+    started = time.perf_counter()
+    for segment in segments:
+        provider.translate(segment, "de-DE")
+    per_segment_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    results = provider.translate_batch(segments, "de-DE")
+    batched_s = time.perf_counter() - started
+
+    assert len(results) == len(segments)
+    per_segment_rate = len(segments) / per_segment_s
+    batched_rate = len(segments) / batched_s
+    speedup = batched_rate / per_segment_rate
+    _record_result(
+        "seq2seq_batch_throughput",
+        {
+            "segments": len(segments),
+            "batch_size": DEFAULT_BATCH_SIZE,
+            "per_segment_segments_per_s": per_segment_rate,
+            "batched_segments_per_s": batched_rate,
+            "speedup": speedup,
+            "target_min_speedup": _MIN_SPEEDUP,
+        },
+    )
+    print(
+        f"\n[seq2seq, {len(segments)} segments] per-segment={per_segment_rate:.1f}/s "
+        f"batched={batched_rate:.1f}/s speedup={speedup:.2f}x"
+    )
+    assert speedup >= _MIN_SPEEDUP, (
+        f"Batched seq2seq throughput is only {speedup:.2f}x the per-segment "
+        f"path (target {_MIN_SPEEDUP}x). Inspect Seq2SeqEngine bucketing."
+    )
+
+
+# --- Helpers --------------------------------------------------------------
+
+
+def _record_result(name: str, data: dict[str, object]) -> None:
+    results_dir = Path(__file__).parent / "results"
+    results_dir.mkdir(parents=True, exist_ok=True)
+    target = results_dir / f"{name}.json"
+    target.write_text(json.dumps(data, indent=2, sort_keys=True) + "\n", encoding="utf-8")
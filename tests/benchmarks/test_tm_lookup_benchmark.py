@@ -107,6 +107,38 @@ def test_fuzzy_lookup_throughput(tmp_path: Path) -> None:
     tm.close()
 
 
+@pytest.mark.benchmark
+def test_cold_target_lang_lookup_with_membership_filter(tmp_path: Path) -> None:
+    """Cold run: a new target language, so every lookup misses. With
+    ``membership_filter=True`` the TM answers from memory — no exact
+    SELECT, no query embedding, no fuzzy scan — versus the unfiltered
+    TM paying all three per segment."""
+    embedder: Embedder = _DeterministicEmbedder()
+    db_path = tmp_path / "tm.sqlite"
+    seeded = SqliteTranslationMemory(db_path, embedder=embedder)
+    segments = _make_corpus(_BENCHMARK_SEGMENT_COUNT)
+    for seg in segments:
+        seeded.store(_ts(seg))
+    seeded.close()
+
+    results: dict[bool, float] = {}
+    for use_filter in (False, True):
+        tm = SqliteTranslationMemory(db_path, embedder=embedder, membership_filter=use_filter)
+        latencies_ms: list[float] = []
+        for seg in segments[:200]:
+            start = time.perf_counter()
+            assert tm.lookup(seg, "fr-FR") is None
+            latencies_ms.append((time.perf_counter() - start) * 1000)
+        results[use_filter] = statistics.median(latencies_ms)
+        tm.close()
+
+    print(
+        f"\n[cold fr-FR lookup, {len(segments)} segments] "
+        f"p50 unfiltered={results[False]:.3f}ms filtered={results[True]:.3f}ms"
+    )
+    assert results[True] < results[False]
+
+
 def _make_corpus(n: int, suffix: str = "") -> list[Segment]:
     return [
         Segment(
@@ -0,0 +1,79 @@
+"""``SqliteTranslationMemory.merge_from`` throughput benchmark.
+
+Sharded CI builds produce one ``tm.sqlite`` per runner and fold them
+together with ``nemo tm merge``. The merge is set-based (``ATTACH`` +
+``INSERT ... SELECT ... ON CONFLICT``), so its cost should scale with
+SQLite's B-tree insert rate rather than with Python per-row overhead.
+This benchmark builds two shards of ``_ROWS_PER_SHARD`` translations
+each — half of shard B overlaps shard A so the conflict path is
+exercised — and reports rows/second for each merge.
+
+Opt-in like the rest of the suite under ``tests/benchmarks/``:
+
+    uv run --extra dev pytest -m benchmark tests/benchmarks/test_tm_merge_benchmark.py -s
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from ainemo.core.tm.sqlite import SqliteTranslationMemory
+
+_ROWS_PER_SHARD = 1_000_000
+"""Two shards of 1M rows each → 2M rows through the merge path."""
+
+_MIN_ROWS_PER_SECOND = 100_000
+"""Floor well under what a laptop SSD sustains; a per-row Python
+merge would land an order of magnitude below it."""
+
+_EMBEDDING_BLOB = bytes(16 * 4)  # 16-dim float32 zero vector
+
+
+@pytest.mark.benchmark
+def test_merge_throughput_at_millions_of_rows(tmp_path: Path) -> None:
+    shard_a = tmp_path / "a.sqlite"
+    shard_b = tmp_path / "b.sqlite"
+    _build_shard(shard_a, start=0, created_at=100)
+    _build_shard(shard_b, start=_ROWS_PER_SHARD // 2, created_at=200)
+
+    out = SqliteTranslationMemory(tmp_path / "out.sqlite")
+    for shard in (shard_a, shard_b):
+        started = time.perf_counter()
+        result = out.merge_from(shard)
+        elapsed = time.perf_counter() - started
+        rate = result.translations_read / elapsed
+        print(
+            f"\n[merge {shard.name}] {result.translations_read} rows in {elapsed:.2f}s "
+            f"({rate:,.0f} rows/s, {result.translations_written} written)"
+        )
+        assert rate > _MIN_ROWS_PER_SECOND
+
+    stats = out.stats()
+    assert stats.translation_count == _ROWS_PER_SHARD + _ROWS_PER_SHARD // 2
+    out.close()
+
+
+def _build_shard(path: Path, *, start: int, created_at: int) -> None:
+    """Create an empty TM via the real constructor (so the schema and
+    meta row match), then bulk-load synthetic rows directly — going
+    through ``store()`` one row at a time would dominate the runtime."""
+    SqliteTranslationMemory(path).close()
+    conn = sqlite3.connect(str(path))
+    rows = range(start, start + _ROWS_PER_SHARD)
+    with conn:
+        conn.executemany(
+            "INSERT INTO segments VALUES (?, ?, 'en-US', '[]', ?, ?)",
+            ((f"fp-{i:08d}", f"Sample text {i}", _EMBEDDING_BLOB, created_at) for i in rows),
+        )
+        conn.executemany(
+            "INSERT INTO translations "
+            "(fingerprint, target_lang, target_text, provider, model, confidence, source, "
+            " created_at) "
+            "VALUES (?, 'de-DE', ?, 'bench', '', NULL, 'provider', ?)",
+            ((f"fp-{i:08d}", f"Beispieltext {i}", created_at) for i in rows),
+        )
+    conn.close()
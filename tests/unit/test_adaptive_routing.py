@@ -0,0 +1,309 @@
+"""Unit tests for :mod:`ainemo.providers._adaptive`, the routes-file
+loader, and the router's adaptive routing path.
+
+Metrics are fed directly through :meth:`RouteSelector.observe`, so no
+test depends on wall-clock latency.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ainemo.core.segment import Segment
+from ainemo.providers._adaptive import (
+    OBJECTIVE_FASTEST_UNDER_BUDGET,
+    AdaptiveRule,
+    ProviderMetrics,
+    RouteSelector,
+)
+from ainemo.providers._routes import load_routing_config
+from ainemo.providers._usage_log import UsageLog
+from ainemo.providers.base import ProviderResult
+from ainemo.providers.router import ProviderRouter, RoutingConfig, RoutingRule
+
+_SEGMENT = Segment(key="k", source_text="Hello", source_lang="en-US")
+
+
+def _slo_rule(**overrides: object) -> AdaptiveRule:
+    settings: dict[str, object] = {
+        "candidates": ("cheap", "fast"),
+        "latency_slo_ms": 1000.0,
+        "min_samples": 2,
+        "exploration": 0.0,
+    }
+    settings.update(overrides)
+    return AdaptiveRule(**settings)  # type: ignore[arg-type]
+
+
+def _feed(
+    selector: RouteSelector,
+    provider_id: str,
+    *,
+    latency_ms: int,
+    cost_usd: float,
+    calls: int = 2,
+    errors: int = 0,
+) -> None:
+    for _ in range(calls):
+        selector.observe(provider_id, latency_ms=latency_ms, cost_usd=cost_usd, tokens=1000)
+    for _ in range(errors):
+        selector.observe_error(provider_id)
+
+
+def _decide(selector: RouteSelector) -> str:
+    return selector.decide(source_lang="en-US", target_lang="de-DE").provider_id
+
+
+# --- Rules and metrics -----------------------------------------------------
+
+
+def test_adaptive_rule_validates() -> None:
+    with pytest.raises(ValueError, match="at least one provider"):
+        AdaptiveRule(candidates=(), latency_slo_ms=1.0)
+    with pytest.raises(ValueError, match="must be unique"):
+        AdaptiveRule(candidates=("a", "a"), latency_slo_ms=1.0)
+    with pytest.raises(ValueError, match="needs latency_slo_ms"):
+        AdaptiveRule(candidates=("a",))
+    with pytest.raises(ValueError, match="needs max_cost_per_1k_tokens_usd"):
+        AdaptiveRule(candidates=("a",), objective=OBJECTIVE_FASTEST_UNDER_BUDGET)
+    with pytest.raises(ValueError, match="objective must be one of"):
+        AdaptiveRule(candidates=("a",), objective="best")
+    with pytest.raises(ValueError, match=r"exploration must be in \[0, 1\)"):
+        _slo_rule(exploration=1.0)
+
+
+def test_metrics_window_quantile_error_rate_and_cost() -> None:
+    metrics = ProviderMetrics(window=4)
+    for latency in (100, 200, 300, 400, 500):  # The first sample is evicted.
+        metrics.observe(latency_ms=latency, cost_usd=0.002, tokens=1000)
+    metrics.observe_error()
+    snapshot = metrics.snapshot(0.5)
+    assert (snapshot.samples, snapshot.errors, snapshot.latency_ms) == (4, 1, 400.0)
+    assert snapshot.error_rate == 0.25
+    assert snapshot.cost_per_1k_tokens_usd == pytest.approx(0.002)
+    unpriced = ProviderMetrics()
+    unpriced.observe(latency_ms=10, cost_usd=None, tokens=None)
+    assert unpriced.snapshot(0.95).cost_per_1k_tokens_usd == 0.0
+
+
+# --- Decisions -------------------------------------------------------------
+
+
+def test_static_rules_and_default_keep_their_behavior() -> None:
+    selector = RouteSelector(
+        [RoutingRule(provider_id="opus", target_lang="de-DE")], default_provider="nllb"
+    )
+    assert not selector.adaptive
+    decision = selector.decide(source_lang="en-US", target_lang="de-DE")
+    assert (decision.provider_id, decision.reason, decision.rule_index) == (
+        "opus",
+        "static rule 0",
+        0,
+    )
+    other = selector.decide(source_lang="en-US", target_lang="fr-FR")
+    assert (other.provider_id, other.rule_index) == ("nllb", None)
+
+
+def test_cold_candidates_are_measured_first() -> None:
+    selector = RouteSelector([_slo_rule()], default_provider="cheap")
+    _feed(selector, "cheap", latency_ms=100, cost_usd=0.001)
+    decision = selector.decide(source_lang="en-US", target_lang="de-DE")
+    assert decision.provider_id == "fast"
+    assert decision.reason == "measuring fast: 0 of 2 calls"
+    assert [score.note for score in decision.scores] == ["eligible", "measuring (0/2)"]
+
+
+def test_cheapest_under_slo() -> None:
+    selector = RouteSelector([_slo_rule()], default_provider="cheap")
+    _feed(selector, "cheap", latency_ms=800, cost_usd=0.001)
+    _feed(selector, "fast", latency_ms=200, cost_usd=0.01)
+    assert _decide(selector) == "cheap"
+    # The cheap provider slows past the SLO: the other one is eligible.
+    _feed(selector, "cheap", latency_ms=3000, cost_usd=0.001, calls=10)
+    decision = selector.decide(source_lang="en-US", target_lang="de-DE")
+    assert decision.provider_id == "fast"
+    assert decision.scores[0].note == "over the latency SLO"
+
+
+def test_fastest_under_budget() -> None:
+    rule = _slo_rule(
+        objective=OBJECTIVE_FASTEST_UNDER_BUDGET,
+        latency_slo_ms=None,
+        max_cost_per_1k_tokens_usd=0.005,
+    )
+    selector = RouteSelector([rule], default_provider="cheap")
+    _feed(selector, "cheap", latency_ms=800, cost_usd=0.001)
+    _feed(selector, "fast", latency_ms=200, cost_usd=0.01)
+    decision = selector.decide(source_lang="en-US", target_lang="de-DE")
+    assert decision.provider_id == "cheap"
+    assert decision.scores[1].note == "over the cost budget"
+
+
+def test_fallbacks_when_nothing_is_eligible() -> None:
+    selector = RouteSelector([_slo_rule(latency_slo_ms=50.0)], default_provider="cheap")
+    _feed(selector, "cheap", latency_ms=800, cost_usd=0.001)
+    _feed(selector, "fast", latency_ms=200, cost_usd=0.01)
+    decision = selector.decide(source_lang="en-US", target_lang="de-DE")
+    assert (decision.provider_id, decision.reason) == (
+        "fast",
+        "no candidate meets the SLO; fastest",
+    )
+
+    _feed(selector, "fast", latency_ms=200, cost_usd=0.01, calls=0, errors=2)
+    assert _decide(selector) == "cheap"  # "fast" is now at 50% errors.
+    _feed(selector, "cheap", latency_ms=800, cost_usd=0.001, calls=0, errors=4)
+    decision = selector.decide(source_lang="en-US", target_lang="de-DE")
+    assert (decision.provider_id, decision.reason) == (
+        "fast",
+        "every candidate over the error-rate limit",
+    )
+
+
+def test_unsupported_candidates_are_skipped() -> None:
+    selector = RouteSelector([_slo_rule()], default_provider="cheap")
+    decision = selector.decide(
+        source_lang="en-US", target_lang="de-DE", supported=lambda pid: pid == "fast"
+    )
+    assert decision.provider_id == "fast"
+    assert not decision.scores[0].eligible
+
+
+def test_exploration_is_reproducible_with_a_seed() -> None:
+    def _run(seed: int) -> list[tuple[str, bool]]:
+        selector = RouteSelector([_slo_rule(exploration=0.5)], default_provider="cheap", seed=seed)
+        _feed(selector, "cheap", latency_ms=800, cost_usd=0.001)
+        _feed(selector, "fast", latency_ms=200, cost_usd=0.01)
+        decisions = [selector.decide(source_lang="en-US", target_lang="de-DE") for _ in range(40)]
+        return [(decision.provider_id, decision.explored) for decision in decisions]
+
+    first = _run(3)
+    assert first == _run(3)
+    assert any(explored for _, explored in first)
+    assert any(not explored for _, explored in first)
+
+
+def test_history_is_seeded_from_the_usage_log(tmp_path: Path) -> None:
+    log = UsageLog(tmp_path / "usage.jsonl")
+    for provider, latency, cost in (("cheap", 800, 0.001), ("fast", 200, 0.01)):
+        for _ in range(2):
+            log.record(
+                provider=provider,
+                model="m",
+                input_tokens=900,
+                output_tokens=100,
+                latency_ms=latency,
+                cost_usd=cost,
+                source_lang="en-US",
+                target_lang="de-DE",
+                segment_fingerprint="f",
+            )
+    # Response-cache hits say nothing about the provider.
+    log.record(
+        provider="fast",
+        model="m",
+        input_tokens=0,
+        output_tokens=0,
+        latency_ms=0,
+        cost_usd=0.0,
+        source_lang="en-US",
+        target_lang="de-DE",
+        segment_fingerprint="f",
+        response_cache_hit=True,
+    )
+    selector = RouteSelector([_slo_rule()], default_provider="cheap", usage_log=log)
+    decision = selector.decide(source_lang="en-US", target_lang="de-DE")
+    assert decision.provider_id == "cheap"
+    assert [score.samples for score in decision.scores] == [2, 2]
+
+
+# --- Routes file -----------------------------------------------------------
+
+
+def test_load_routing_config(tmp_path: Path) -> None:
+    path = tmp_path / "routes.yaml"
+    path.write_text(
+        "default_provider: nllb\n"
+        "rules:\n"
+        "  - provider: opus\n"
+        "    target_lang: de-DE\n"
+        "  - candidates: [openai, anthropic]\n"
+        "    objective: fastest-under-budget\n"
+        "    max_cost_per_1k_tokens_usd: 0.01\n",
+        encoding="utf-8",
+    )
+    config = load_routing_config(path)
+    static, adaptive = config.rules
+    assert static == RoutingRule(provider_id="opus", target_lang="de-DE")
+    assert isinstance(adaptive, AdaptiveRule)
+    assert adaptive.candidates == ("openai", "anthropic")
+    assert adaptive.min_samples == 10
+    assert config.provider_ids() == ("nllb", "opus", "openai", "anthropic")
+
+
+@pytest.mark.parametrize(
+    ("body", "message"),
+    [
+        ("rules: []\n", "default_provider"),
+        ("default_provider: a\nrules:\n  - {provider: b, candidates: [c]}\n", "not both"),
+        ("default_provider: a\nrules:\n  - {provider: b, objective: x}\n", "only apply"),
+        ("default_provider: a\nrules:\n  - {candidates: [b]}\n", "needs latency_slo_ms"),
+        ("default_provider: a\nrules:\n  - {provider: b, target: x}\n", "Extra inputs"),
+    ],
+)
+def test_load_routing_config_rejects_invalid_files(tmp_path: Path, body: str, message: str) -> None:
+    path = tmp_path / "routes.yaml"
+    path.write_text(body, encoding="utf-8")
+    with pytest.raises(ValueError, match=f"(?s)Invalid routes file .*{message}"):
+        load_routing_config(path)
+
+
+# --- Router ----------------------------------------------------------------
+
+
+class _Provider:
+    def __init__(self, provider_id: str, *, fail: bool = False) -> None:
+        self.provider_id = provider_id  # type: ignore[misc]
+        self.fail = fail
+        self.calls = 0
+
+    def translate(
+        self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+    ) -> ProviderResult:
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("down")
+        return ProviderResult(
+            target_text=f"{self.provider_id}:{segment.source_text}",
+            provider=self.provider_id,
+            model="m",
+            input_tokens=3,
+            output_tokens=2,
+        )
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return True
+
+
+def test_router_routes_around_a_failing_candidate(tmp_path: Path) -> None:
+    flaky = _Provider("flaky", fail=True)
+    steady = _Provider("steady")
+    router = ProviderRouter(
+        providers={"flaky": flaky, "steady": steady},
+        routing_config=RoutingConfig(
+            default_provider="steady",
+            rules=(_slo_rule(candidates=("flaky", "steady"), min_samples=1),),
+        ),
+        usage_log=UsageLog(tmp_path / "usage.jsonl"),
+        routing_seed=0,
+    )
+    assert router.explain_route("en-US", "de-DE").reason == "measuring flaky: 0 of 1 calls"
+    with pytest.raises(ConnectionError):
+        router.translate(_SEGMENT, "de-DE")
+    for _ in range(3):
+        assert router.translate(_SEGMENT, "de-DE").target_text == "steady:Hello"
+    assert flaky.calls == 1
+    decision = router.explain_route("en-US", "de-DE")
+    assert decision.provider_id == "steady"
+    assert decision.scores[0].note == "error rate 100% over 20%"
@@ -33,6 +33,8 @@ from ainemo.providers.base import Provider, ProviderResult
 class _FakeUsage:
     input_tokens: int
     output_tokens: int
+    cache_creation_input_tokens: int | None = None
+    cache_read_input_tokens: int | None = None
 
 
 @dataclass
@@ -68,9 +70,18 @@ class _FakeClient:
         input_tokens: int = 100,
         output_tokens: int = 50,
         usage: bool = True,
+        cache_write_tokens: int | None = None,
+        cache_read_tokens: int | None = None,
     ) -> "_FakeClient":
         usage_obj = (
-            _FakeUsage(input_tokens=input_tokens, output_tokens=output_tokens) if usage else None
+            _FakeUsage(
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                cache_creation_input_tokens=cache_write_tokens,
+                cache_read_input_tokens=cache_read_tokens,
+            )
+            if usage
+            else None
         )
         response = _FakeResponse(
             content=[_FakeTextBlock(text=text)],
@@ -138,7 +149,8 @@ def test_translate_passes_system_at_top_level_not_in_messages() -> None:
     AnthropicProvider(client=client).translate(_seg(), "de-DE")
     call = client.calls[0]
     assert "system" in call
-    assert isinstance(call["system"], str) and call["system"]
+    assert isinstance(call["system"], list) and call["system"]
+    assert all(block["type"] == "text" and block["text"] for block in call["system"])
     # And no system-role message in the messages array.
     for msg in call["messages"]:
         assert msg["role"] != "system"
@@ -250,6 +262,52 @@ def test_translate_no_usage_field_returns_no_cost() -> None:
     assert result.cost_usd is None
 
 
+# --- Prompt caching -------------------------------------------------------
+
+
+def test_static_system_blocks_carry_cache_breakpoints() -> None:
+    client = _FakeClient.with_response("x")
+    AnthropicProvider(client=client).translate(
+        _seg(), "de-DE", system_prompt_addendum="Persona: terse."
+    )
+    system = client.calls[0]["system"]
+    assert [block["text"] for block in system][1] == "Persona: terse."
+    assert all(block["cache_control"] == {"type": "ephemeral"} for block in system)
+    # The per-segment text stays out of the cached prefix.
+    assert "Hello" not in "".join(block["text"] for block in system)
+
+
+def test_prompt_caching_can_be_disabled() -> None:
+    client = _FakeClient.with_response("x")
+    AnthropicProvider(prompt_caching=False, client=client).translate(_seg(), "de-DE")
+    assert all("cache_control" not in block for block in client.calls[0]["system"])
+
+
+def test_cache_tokens_recorded_and_priced() -> None:
+    client = _FakeClient.with_response(
+        "x", input_tokens=20, output_tokens=10, cache_write_tokens=0, cache_read_tokens=2000
+    )
+    result = AnthropicProvider(client=client).translate(_seg(), "de-DE")
+    # input_tokens covers the whole prompt, cached part included.
+    assert result.input_tokens == 2020
+    assert result.cache_read_tokens == 2000
+    assert result.cache_write_tokens == 0
+    # Sonnet 4.5: $3.00/M input, reads at 0.1x, $15.00/M output.
+    expected_cost = (20 * 3.00 + 2000 * 3.00 * 0.10 + 10 * 15.00) / 1_000_000
+    assert result.cost_usd is not None
+    assert abs(result.cost_usd - expected_cost) < 1e-12
+
+
+def test_cache_write_priced_above_input_rate() -> None:
+    client = _FakeClient.with_response(
+        "x", input_tokens=20, output_tokens=0, cache_write_tokens=2000, cache_read_tokens=0
+    )
+    result = AnthropicProvider(client=client).translate(_seg(), "de-DE")
+    expected_cost = (20 * 3.00 + 2000 * 3.00 * 1.25) / 1_000_000
+    assert result.cost_usd is not None
+    assert abs(result.cost_usd - expected_cost) < 1e-12
+
+
 # --- supports() -----------------------------------------------------------
 
 
@@ -310,3 +368,41 @@ def test_translate_raises_when_no_text_block() -> None:
     client = _FakeClient(messages=_FakeMessages(response=response))
     with pytest.raises(RuntimeError, match="no text content"):
         AnthropicProvider(client=client).translate(_seg(), "de-DE")
+
+
+# --- Async path -------------------------------------------------------------
+
+
+@dataclass
+class _FakeAsyncMessages:
+    response: _FakeResponse
+    calls: list[dict[str, Any]] = field(default_factory=list)
+
+    async def create(self, **kwargs: Any) -> _FakeResponse:
+        self.calls.append(kwargs)
+        return self.response
+
+
+@dataclass
+class _FakeAsyncClient:
+    messages: _FakeAsyncMessages
+
+
+def test_atranslate_sends_same_request_as_translate() -> None:
+    import asyncio
+
+    from ainemo.providers.base import AsyncProvider
+
+    sync_client = _FakeClient.with_response("Hallo")
+    async_client = _FakeAsyncClient(messages=_FakeAsyncMessages(sync_client.messages.response))
+    provider = AnthropicProvider(client=sync_client, async_client=async_client)
+    assert isinstance(provider, AsyncProvider)
+
+    sync_result = provider.translate(_seg(), "de-DE", system_prompt_addendum="Formal.")
+    async_result = asyncio.run(
+        provider.atranslate(_seg(), "de-DE", system_prompt_addendum="Formal.")
+    )
+
+    assert async_client.messages.calls == sync_client.calls
+    assert async_result.target_text == sync_result.target_text == "Hallo"
+    assert async_result.cost_usd == sync_result.cost_usd
@@ -0,0 +1,449 @@
+"""Unit tests for :mod:`ainemo.providers._bulk`, the OpenAI and
+Anthropic batch clients, and ``nemo translate --submit-batch`` /
+``--collect-batch``.
+
+The provider tests run against stand-in Batch API servers on local
+ports; each job reports ``pending`` for its first ``pending_polls``
+polls and fails the request listed in ``fail``.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from ainemo.cli import main
+from ainemo.cli.commands import CMD_NAME_TRANSLATE
+from ainemo.core.segment import Segment
+from ainemo.providers._bulk import (
+    BATCH_PRICE_MULTIPLIER,
+    BulkJob,
+    BulkResultProvider,
+    at_batch_price,
+    wait_for_bulk,
+)
+from ainemo.providers._usage_log import UsageLog
+from ainemo.providers.anthropic.anthropic_provider import AnthropicProvider
+from ainemo.providers.base import (
+    BULK_STATE_ENDED,
+    BULK_STATE_PENDING,
+    BulkBatchProvider,
+    BulkStatus,
+    ProviderResult,
+)
+from ainemo.providers.openai.openai_provider import OpenAIProvider
+
+_HELLO = Segment(key="greeting", source_text="Hello", source_lang="en-US")
+_BYE = Segment(key="farewell", source_text="Goodbye", source_lang="en-US")
+_TRANSLATION = "Hallo"
+_LIVE_TRANSLATION = "Live"
+
+
+def _result(text: str, cost: float | None = 0.01) -> ProviderResult:
+    return ProviderResult(
+        target_text=text,
+        provider="openai",
+        model="gpt-4o",
+        input_tokens=10,
+        output_tokens=2,
+        latency_ms=0,
+        cost_usd=cost,
+    )
+
+
+def _job(tmp_path: Path) -> BulkJob:
+    return BulkJob.from_misses(
+        [(_HELLO, "de-DE", None), (_BYE, "de-DE", "Glossary: ...")],
+        provider="openai",
+        model="gpt-4o",
+        source_path=tmp_path / "messages_en_US.properties",
+        source_lang="en-US",
+        target_langs=["de-DE"],
+    )
+
+
+# --- Manifest and helpers --------------------------------------------------
+
+
+def test_manifest_round_trips(tmp_path: Path) -> None:
+    path = tmp_path / "jobs" / "job.json"
+    job = _job(tmp_path).submitted("batch_1")
+    job.save(path)
+    assert BulkJob.load(path) == job
+    assert not (tmp_path / "jobs" / "job.json.partial").exists()
+    requests = job.bulk_requests()
+    assert list(requests) == ["seg-000000", "seg-000001"]
+    assert requests["seg-000001"].system_prompt_addendum == "Glossary: ..."
+    assert requests["seg-000000"].segment.fingerprint == _HELLO.fingerprint
+
+
+def test_invalid_manifest_names_the_file(tmp_path: Path) -> None:
+    path = tmp_path / "job.json"
+    with pytest.raises(ValueError, match="Invalid batch manifest"):
+        BulkJob.load(path)
+    path.write_text(json.dumps({"version": 99}), encoding="utf-8")
+    with pytest.raises(ValueError, match="expected manifest version 1"):
+        BulkJob.load(path)
+
+
+def test_result_provider_serves_results_and_falls_back() -> None:
+    fallback = OpenAIProvider(client=object())
+    served = _result(_TRANSLATION)
+    live = _result(_LIVE_TRANSLATION)
+    fallback.translate = lambda segment, target_lang, **kwargs: live  # type: ignore[method-assign]
+    provider = BulkResultProvider({(_HELLO.fingerprint, "de-DE", None): served}, fallback)
+    assert provider.translate(_HELLO, "de-DE") is served
+    assert provider.translate(_HELLO, "fr-FR") is live
+    assert provider.translate(_HELLO, "de-DE", system_prompt_addendum="x") is live
+    assert (provider.result_count, provider.fallback_count) == (1, 2)
+
+
+def test_at_batch_price() -> None:
+    assert at_batch_price(_result("x", 0.02)).cost_usd == 0.02 * BATCH_PRICE_MULTIPLIER
+    assert at_batch_price(_result("x", None)).cost_usd is None
+
+
+@dataclass
+class _Polls:
+    pending: int
+    polls: int = 0
+    slept: list[float] = field(default_factory=list)
+    now: float = 0.0
+
+    def poll_bulk(self, job_id: str) -> BulkStatus:
+        self.polls += 1
+        state = BULK_STATE_PENDING if self.polls <= self.pending else BULK_STATE_ENDED
+        return BulkStatus(job_id=job_id, state=state, total=1, succeeded=0, failed=0)
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_wait_for_bulk_polls_until_the_deadline() -> None:
+    polls = _Polls(pending=10)
+    status = wait_for_bulk(
+        polls,  # type: ignore[arg-type]
+        "b",
+        wait_s=50,
+        poll_interval_s=20,
+        sleep=polls.sleep,
+        clock=lambda: polls.now,
+    )
+    assert (status.state, polls.slept) == (BULK_STATE_PENDING, [20, 20, 10])
+
+    polls = _Polls(pending=1)
+    status = wait_for_bulk(
+        polls,  # type: ignore[arg-type]
+        "b",
+        wait_s=50,
+        poll_interval_s=20,
+        sleep=polls.sleep,
+        clock=lambda: polls.now,
+    )
+    assert (status.state, polls.polls) == (BULK_STATE_ENDED, 2)
+    polls = _Polls(pending=1)
+    assert wait_for_bulk(polls, "b").state == BULK_STATE_PENDING  # type: ignore[arg-type]
+
+
+# --- Stand-in Batch APIs ---------------------------------------------------
+
+
+class _BatchServer:
+    """A local stand-in for the OpenAI Batch API or the Anthropic
+    Message Batches API, plus OpenAI's interactive chat endpoint."""
+
+    def __init__(self, *, pending_polls: int = 0, fail: tuple[str, ...] = ()) -> None:
+        self.pending_polls = pending_polls
+        self.fail = fail
+        self.polls = 0
+        self.custom_ids: list[str] = []
+        self.live_calls = 0
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                if self.path.endswith("/content"):
+                    error = self.path.split("/")[-2] == "file-errors"
+                    self._reply_lines(server.openai_lines(error=error))
+                elif self.path.endswith("/results"):
+                    self._reply_lines(server.anthropic_lines())
+                elif "/messages/batches/" in self.path:
+                    server.polls += 1
+                    self._reply(server.anthropic_batch(self._url()))
+                else:
+                    server.polls += 1
+                    self._reply(server.openai_batch())
+
+            def do_POST(self) -> None:  # noqa: N802
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.path.endswith("/files"):
+                    for line in body.decode("utf-8").splitlines():
+                        if line.startswith('{"custom_id"'):
+                            server.custom_ids.append(json.loads(line)["custom_id"])
+                    self._reply(
+                        {
+                            "id": "file-in",
+                            "object": "file",
+                            "bytes": len(body),
+                            "created_at": 0,
+                            "filename": "batch.jsonl",
+                            "purpose": "batch",
+                        }
+                    )
+                elif self.path.endswith("/batches") and "/messages/" in self.path:
+                    requests = json.loads(body)["requests"]
+                    server.custom_ids.extend(request["custom_id"] for request in requests)
+                    self._reply(server.anthropic_batch(self._url()))
+                elif self.path.endswith("/batches"):
+                    self._reply(server.openai_batch())
+                else:
+                    server.live_calls += 1
+                    self._reply(_chat_completion(_LIVE_TRANSLATION))
+
+            def _url(self) -> str:
+                return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+            def _reply(self, body: dict[str, object]) -> None:
+                self._send(json.dumps(body).encode(), "application/json")
+
+            def _reply_lines(self, lines: list[dict[str, object]]) -> None:
+                payload = "".join(json.dumps(line) + "\n" for line in lines)
+                self._send(payload.encode(), "application/octet-stream")
+
+            def _send(self, payload: bytes, content_type: str) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+
+    @property
+    def ended(self) -> bool:
+        return self.polls > self.pending_polls
+
+    @property
+    def succeeded(self) -> list[str]:
+        return [custom_id for custom_id in self.custom_ids if custom_id not in self.fail]
+
+    def openai_batch(self) -> dict[str, object]:
+        failed = len(self.custom_ids) - len(self.succeeded)
+        return {
+            "id": "batch_1",
+            "object": "batch",
+            "endpoint": "/v1/chat/completions",
+            "input_file_id": "file-in",
+            "completion_window": "24h",
+            "created_at": 0,
+            "status": "completed" if self.ended else "in_progress",
+            "output_file_id": "file-out" if self.ended else None,
+            "error_file_id": "file-errors" if self.ended and failed else None,
+            "request_counts": {
+                "total": len(self.custom_ids),
+                "completed": len(self.succeeded) if self.ended else 0,
+                "failed": failed if self.ended else 0,
+            },
+        }
+
+    def openai_lines(self, *, error: bool) -> list[dict[str, object]]:
+        if error:
+            return [
+                {
+                    "custom_id": custom_id,
+                    "response": {"status_code": 400, "body": {"error": "bad request"}},
+                }
+                for custom_id in self.fail
+            ]
+        return [
+            {
+                "custom_id": custom_id,
+                "response": {"status_code": 200, "body": _chat_completion(_TRANSLATION)},
+            }
+            for custom_id in self.succeeded
+        ]
+
+    def anthropic_batch(self, url: str) -> dict[str, object]:
+        errored = len(self.custom_ids) - len(self.succeeded)
+        return {
+            "id": "msgbatch_1",
+            "type": "message_batch",
+            "processing_status": "ended" if self.ended else "in_progress",
+            "request_counts": {
+                "processing": 0 if self.ended else len(self.custom_ids),
+                "succeeded": len(self.succeeded) if self.ended else 0,
+                "errored": errored if self.ended else 0,
+                "canceled": 0,
+                "expired": 0,
+            },
+            "created_at": "2026-01-01T00:00:00Z",
+            "expires_at": "2026-01-02T00:00:00Z",
+            "ended_at": "2026-01-01T01:00:00Z" if self.ended else None,
+            "archived_at": None,
+            "cancel_initiated_at": None,
+            "results_url": f"{url}/v1/messages/batches/msgbatch_1/results" if self.ended else None,
+        }
+
+    def anthropic_lines(self) -> list[dict[str, object]]:
+        return [
+            {
+                "custom_id": custom_id,
+                "result": (
+                    {
+                        "type": "errored",
+                        "error": {
+                            "type": "error",
+                            "error": {"type": "invalid_request_error", "message": "bad"},
+                        },
+                    }
+                    if custom_id in self.fail
+                    else {
+                        "type": "succeeded",
+                        "message": {
+                            "id": "msg_1",
+                            "type": "message",
+                            "role": "assistant",
+                            "model": "claude",
+                            "content": [{"type": "text", "text": _TRANSLATION}],
+                            "stop_reason": "end_turn",
+                            "stop_sequence": None,
+                            "usage": {"input_tokens": 10, "output_tokens": 2},
+                        },
+                    }
+                ),
+            }
+            for custom_id in self.custom_ids
+        ]
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _chat_completion(text: str) -> dict[str, object]:
+    return {
+        "id": "chatcmpl-1",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [
+            {
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": text},
+            }
+        ],
+        "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+    }
+
+
+@pytest.fixture
+def server(monkeypatch: pytest.MonkeyPatch) -> Iterator[_BatchServer]:
+    stand_in = _BatchServer(pending_polls=1, fail=("seg-000001",))
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"{stand_in.url}/v1")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", stand_in.url)
+    yield stand_in
+    stand_in.close()
+
+
+@pytest.mark.parametrize("provider_class", [OpenAIProvider, AnthropicProvider])
+def test_provider_submits_polls_and_collects(
+    server: _BatchServer, provider_class: type[BulkBatchProvider]
+) -> None:
+    provider = provider_class()
+    requests = _job(Path(".")).bulk_requests()
+    job_id = provider.submit_bulk(list(requests.values()))
+    assert server.custom_ids == ["seg-000000", "seg-000001"]
+    assert provider.poll_bulk(job_id).state == BULK_STATE_PENDING
+    status = provider.poll_bulk(job_id)
+    assert (status.state, status.total, status.succeeded, status.failed) == (
+        BULK_STATE_ENDED,
+        2,
+        1,
+        1,
+    )
+    items = {item.custom_id: item for item in provider.collect_bulk(job_id, requests)}
+    served = items["seg-000000"].result
+    assert served is not None and served.target_text == _TRANSLATION
+    assert (served.latency_ms, served.provider) == (0, provider.provider_id)
+    assert items["seg-000001"].result is None and items["seg-000001"].error
+
+
+def test_cli_submits_then_collects(tmp_path: Path, server: _BatchServer) -> None:
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\nfarewell=Goodbye\n", encoding="utf-8")
+    manifest = tmp_path / "job.json"
+    usage = tmp_path / "usage.jsonl"
+    base_args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de-DE",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tmp_path / "tm.sqlite"),
+        "--usage-log",
+        str(usage),
+        "--provider",
+        "openai",
+    ]
+    assert main([*base_args, "--submit-batch", str(manifest)]) == 0
+    job = BulkJob.load(manifest)
+    assert job.job_id == "batch_1" and len(job.requests) == 2
+    assert not (tmp_path / "out").exists()
+    # A submitted job is not submitted twice.
+    assert main([*base_args, "--submit-batch", str(manifest)]) == 2
+
+    assert main([*base_args, "--collect-batch", str(manifest)]) == 3
+    assert main([*base_args, "--collect-batch", str(manifest)]) == 0
+    output = (tmp_path / "out" / "messages_de_DE.properties").read_text(encoding="utf-8")
+    assert f"greeting={_TRANSLATION}" in output
+    assert f"farewell={_LIVE_TRANSLATION}" in output  # The failed request, translated live.
+    assert server.live_calls == 1
+    job = BulkJob.load(manifest)
+    assert job.usage_recorded and job.collected
+    stats = UsageLog(usage).stats()
+    assert (stats.call_count, stats.batch_calls) == (2, 1)
+
+    # Collecting again records no usage twice; the TM answers.
+    assert main([*base_args, "--collect-batch", str(manifest)]) == 0
+    assert UsageLog(usage).stats().batch_calls == 1
+
+
+def test_cli_rejects_batch_flags_without_a_batch_provider(tmp_path: Path) -> None:
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\n", encoding="utf-8")
+    args = [CMD_NAME_TRANSLATE, "--from", str(src), "--to-langs", "de-DE"]
+    assert main([*args, "--submit-batch", str(tmp_path / "job.json")]) == 2
+    assert (
+        main(
+            [
+                *args,
+                "--provider",
+                "openai",
+                "--collect-batch",
+                str(tmp_path / "job.json"),
+                "--cascade-draft",
+                "noop",
+            ]
+        )
+        == 2
+    )
@@ -0,0 +1,342 @@
+"""Unit tests for :class:`ainemo.core.tm.cached.CachedTranslationMemory`.
+
+The wrapper sits in front of a real :class:`SqliteTranslationMemory`
+whose ``lookup`` is counted, so each test can assert exactly which
+lookups reached the backend and which were answered from the cache.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import pytest
+
+from ainemo.core.segment import (
+    TRANSLATION_SOURCE_EXACT_TM,
+    TRANSLATION_SOURCE_PROVIDER,
+    Segment,
+    TranslatedSegment,
+)
+from ainemo.core.tm import sqlite as sqlite_module
+from ainemo.core.tm.base import (
+    TM_MATCH_TYPE_FUZZY,
+    TmHit,
+    TmStats,
+    TmUsage,
+    TranslationMemory,
+)
+from ainemo.core.tm.cached import CachedTranslationMemory
+from ainemo.core.tm.sqlite import Embedder, SqliteTranslationMemory
+
+_LANG_EN_US = "en-US"
+_LANG_DE = "de-DE"
+_LANG_FR = "fr-FR"
+_PROVIDER_TEST = "test"
+_PROVIDER_OTHER = "other"
+
+
+class _CountingBackend:
+    """Delegates to a SQLite TM and counts the lookups it serves."""
+
+    def __init__(self, path: Path, embedder: Embedder | None = None) -> None:
+        self.inner = SqliteTranslationMemory(path, embedder=embedder)
+        self.lookups = 0
+        self.closed = False
+
+    def lookup(
+        self,
+        segment: Segment,
+        target_lang: str,
+        fuzzy_threshold: float = 0.85,
+        *,
+        provider: str | None = None,
+        model: str | None = None,
+    ) -> TmHit | None:
+        self.lookups += 1
+        return self.inner.lookup(
+            segment, target_lang, fuzzy_threshold, provider=provider, model=model
+        )
+
+    def store(self, translated: TranslatedSegment) -> None:
+        self.inner.store(translated)
+
+    def stats(self) -> TmStats:
+        return self.inner.stats()
+
+    def iter_translations(
+        self, *, source_lang: str, target_lang: str
+    ) -> Iterator[TranslatedSegment]:
+        return self.inner.iter_translations(source_lang=source_lang, target_lang=target_lang)
+
+    def close(self) -> None:
+        self.closed = True
+        self.inner.close()
+
+
+class _CountingUsageBackend(_CountingBackend):
+    """Counting backend that also exposes the SQLite TM's usage tracking."""
+
+    def record_hit(self, translated: TranslatedSegment) -> None:
+        self.inner.record_hit(translated)
+
+    def flush_hits(self) -> None:
+        self.inner.flush_hits()
+
+    def iter_top_translations(
+        self, *, per_target_lang: int, target_lang: str | None = None
+    ) -> Iterator[TmUsage]:
+        return self.inner.iter_top_translations(
+            per_target_lang=per_target_lang, target_lang=target_lang
+        )
+
+
+def _seg(key: str = "k", source_text: str = "Hello") -> Segment:
+    return Segment(key=key, source_text=source_text, source_lang=_LANG_EN_US)
+
+
+def _ts(
+    seg: Segment,
+    target_text: str = "Hallo",
+    *,
+    target_lang: str = _LANG_DE,
+    provider: str = _PROVIDER_TEST,
+) -> TranslatedSegment:
+    return TranslatedSegment(
+        segment=seg,
+        target_lang=target_lang,
+        target_text=target_text,
+        provider=provider,
+        model="m1",
+        confidence=0.9,
+        source=TRANSLATION_SOURCE_PROVIDER,
+    )
+
+
+@pytest.fixture
+def backend(tmp_path: Path) -> Iterator[_CountingBackend]:
+    counting = _CountingBackend(tmp_path / "tm.sqlite")
+    yield counting
+    if not counting.closed:
+        counting.close()
+
+
+def test_satisfies_protocol(backend: _CountingBackend) -> None:
+    assert isinstance(CachedTranslationMemory(backend), TranslationMemory)
+
+
+def test_repeated_exact_lookup_served_from_cache(backend: _CountingBackend) -> None:
+    backend.store(_ts(_seg()))
+    tm = CachedTranslationMemory(backend)
+
+    first = tm.lookup(_seg(key="a"), _LANG_DE)
+    second = tm.lookup(_seg(key="b"), _LANG_DE)
+
+    assert backend.lookups == 1
+    assert first is not None and second is not None
+    assert second.translated.target_text == "Hallo"
+    assert second.translated.source == TRANSLATION_SOURCE_EXACT_TM
+    # The hit is rebound to the caller's segment, like the backend does.
+    assert second.translated.segment.key == "b"
+
+
+def test_miss_is_cached_until_store(backend: _CountingBackend) -> None:
+    tm = CachedTranslationMemory(backend)
+    seg = _seg()
+
+    assert tm.lookup(seg, _LANG_DE) is None
+    assert tm.lookup(seg, _LANG_DE) is None
+    assert backend.lookups == 1
+
+    tm.store(_ts(seg))
+    scoped = tm.lookup(seg, _LANG_DE, provider=_PROVIDER_TEST, model="m1")
+    unscoped = tm.lookup(seg, _LANG_DE)
+    assert scoped is not None and unscoped is not None
+    assert scoped.translated.source == TRANSLATION_SOURCE_EXACT_TM
+    # Write-through: the stored row answers without a backend read.
+    assert backend.lookups == 1
+
+
+def test_store_overrides_cached_unscoped_hit(
+    backend: _CountingBackend, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """After a store, the unscoped lookup answers with the newest row —
+    as the backend does once the rows' timestamps differ."""
+    clock = iter(range(1_000, 2_000))
+    monkeypatch.setattr(sqlite_module, "_now_seconds", lambda: next(clock))
+    seg = _seg()
+    backend.store(_ts(seg, "Hallo", provider=_PROVIDER_OTHER))
+    tm = CachedTranslationMemory(backend)
+    assert tm.lookup(seg, _LANG_DE) is not None
+
+    tm.store(_ts(seg, "Servus"))
+
+    hit = tm.lookup(seg, _LANG_DE)
+    assert hit is not None
+    assert hit.translated.target_text == "Servus"
+    backend_hit = backend.lookup(seg, _LANG_DE)
+    assert backend_hit is not None
+    assert backend_hit.translated.target_text == "Servus"
+
+
+def test_cached_miss_only_serves_stricter_thresholds(backend: _CountingBackend) -> None:
+    tm = CachedTranslationMemory(backend)
+    seg = _seg()
+
+    tm.lookup(seg, _LANG_DE, 0.9)
+    tm.lookup(seg, _LANG_DE, 0.95)
+    assert backend.lookups == 1
+    tm.lookup(seg, _LANG_DE, 0.8)
+    assert backend.lookups == 2
+
+
+def test_store_in_other_language_keeps_cached_misses(backend: _CountingBackend) -> None:
+    tm = CachedTranslationMemory(backend)
+    seg = _seg()
+    tm.lookup(seg, _LANG_DE)
+
+    tm.store(_ts(_seg(source_text="Bye"), "Au revoir", target_lang=_LANG_FR))
+
+    assert tm.lookup(seg, _LANG_DE) is None
+    assert backend.lookups == 1
+    assert tm.cache_stats().negative_hits == 1
+
+
+def test_fuzzy_hits_are_not_cached(tmp_path: Path) -> None:
+    counting = _CountingBackend(tmp_path / "tm.sqlite", embedder=lambda _: np.ones(16, np.float32))
+    counting.store(_ts(_seg(source_text="Hello there")))
+    tm = CachedTranslationMemory(counting)
+
+    first = tm.lookup(_seg(source_text="Hello here"), _LANG_DE)
+    tm.lookup(_seg(source_text="Hello here"), _LANG_DE)
+
+    assert first is not None
+    assert first.match_type == TM_MATCH_TYPE_FUZZY
+    assert counting.lookups == 2
+    counting.close()
+
+
+def test_evicts_least_recently_used_by_entry_count(backend: _CountingBackend) -> None:
+    tm = CachedTranslationMemory(backend, max_entries=2)
+    a, b, c = _seg(source_text="a"), _seg(source_text="b"), _seg(source_text="c")
+
+    tm.lookup(a, _LANG_DE)
+    tm.lookup(b, _LANG_DE)
+    tm.lookup(a, _LANG_DE)  # refresh a; b is now least recent
+    tm.lookup(c, _LANG_DE)  # evicts b
+
+    assert tm.cache_stats().evictions == 1
+    lookups = backend.lookups
+    tm.lookup(a, _LANG_DE)
+    assert backend.lookups == lookups
+    tm.lookup(b, _LANG_DE)
+    assert backend.lookups == lookups + 1
+
+
+def test_evicts_by_byte_budget(backend: _CountingBackend) -> None:
+    long_text = "x" * 10_000
+    for i in range(5):
+        backend.store(_ts(_seg(source_text=f"s{i}"), long_text))
+    tm = CachedTranslationMemory(backend, max_bytes=25_000)
+
+    for i in range(5):
+        tm.lookup(_seg(source_text=f"s{i}"), _LANG_DE)
+
+    stats = tm.cache_stats()
+    assert stats.bytes <= 25_000
+    assert stats.entries == 2
+    assert stats.evictions == 3
+
+
+def test_stats_report_backend_counts_and_cache_counters(backend: _CountingBackend) -> None:
+    backend.store(_ts(_seg()))
+    tm = CachedTranslationMemory(backend)
+    tm.lookup(_seg(), _LANG_DE)
+    tm.lookup(_seg(), _LANG_DE)
+    tm.lookup(_seg(source_text="missing"), _LANG_DE)
+    tm.lookup(_seg(source_text="missing"), _LANG_DE)
+
+    stats = tm.stats()
+    assert stats.translation_count == 1
+    assert stats.cache is not None
+    assert (stats.cache.hits, stats.cache.negative_hits, stats.cache.misses) == (1, 1, 2)
+    assert stats.cache.entries == 2
+    assert backend.stats().cache is None
+
+
+def test_iter_translations_passes_through(backend: _CountingBackend) -> None:
+    tm = CachedTranslationMemory(backend)
+    tm.store(_ts(_seg()))
+    rows = list(tm.iter_translations(source_lang=_LANG_EN_US, target_lang=_LANG_DE))
+    assert [row.target_text for row in rows] == ["Hallo"]
+
+
+def test_close_closes_backend(backend: _CountingBackend) -> None:
+    tm = CachedTranslationMemory(backend)
+    tm.close()
+    assert backend.closed
+
+
+def test_rejects_non_positive_bounds(backend: _CountingBackend) -> None:
+    with pytest.raises(ValueError):
+        CachedTranslationMemory(backend, max_entries=0)
+    with pytest.raises(ValueError):
+        CachedTranslationMemory(backend, max_bytes=0)
+
+
+# --- Usage tracking + hot-set preload --------------------------------------
+
+
+def test_cache_hits_reach_backend_hit_counters(tmp_path: Path) -> None:
+    sqlite_tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    sqlite_tm.store(_ts(_seg()))
+    tm = CachedTranslationMemory(sqlite_tm)
+
+    for _ in range(3):
+        tm.lookup(_seg(), _LANG_DE)
+
+    [usage] = sqlite_tm.iter_top_translations(per_target_lang=1)
+    assert usage.hit_count == 3
+    assert tm.cache_stats().hits == 2
+    tm.close()
+
+
+def test_lookup_without_recording_hits_leaves_backend_counters(tmp_path: Path) -> None:
+    sqlite_tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    sqlite_tm.store(_ts(_seg()))
+    tm = CachedTranslationMemory(sqlite_tm)
+
+    for _ in range(2):  # A backend lookup, then a cached hit.
+        assert tm.lookup(_seg(), _LANG_DE, record_hits=False) is not None
+
+    assert list(sqlite_tm.iter_top_translations(per_target_lang=1)) == []
+    tm.close()
+
+
+def test_preload_hot_set_serves_first_lookups_from_memory(tmp_path: Path) -> None:
+    sqlite_tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    for text in ("hot", "warm", "cold"):
+        sqlite_tm.store(_ts(_seg(source_text=text), text.upper()))
+    for text, hits in (("hot", 3), ("warm", 1)):
+        for _ in range(hits):
+            sqlite_tm.lookup(_seg(source_text=text), _LANG_DE)
+    sqlite_tm.close()
+
+    counting = _CountingUsageBackend(tmp_path / "tm.sqlite")
+    tm = CachedTranslationMemory(counting)
+    assert tm.preload_hot_set(per_target_lang=10) == 2
+
+    hot = tm.lookup(_seg(key="k1", source_text="hot"), _LANG_DE, provider=_PROVIDER_TEST)
+    warm = tm.lookup(_seg(source_text="warm"), _LANG_DE)
+    assert hot is not None and hot.translated.target_text == "HOT"
+    assert hot.translated.segment.key == "k1"
+    assert warm is not None
+    assert counting.lookups == 0
+    tm.lookup(_seg(source_text="cold"), _LANG_DE)
+    assert counting.lookups == 1
+    tm.close()
+
+
+def test_preload_hot_set_without_usage_tracking_is_noop(backend: _CountingBackend) -> None:
+    assert CachedTranslationMemory(backend).preload_hot_set(per_target_lang=10) == 0
@@ -0,0 +1,282 @@
+"""Unit tests for :mod:`ainemo.core.cascade` and the pipeline's
+cascade mode."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Sequence
+
+import pytest
+
+from ainemo.core.adapters.java_properties import JavaPropertiesAdapter
+from ainemo.core.cascade import CascadePolicy, DraftScore, score_draft
+from ainemo.core.icu import parse_placeholders
+from ainemo.core.pipeline import TranslationPipeline
+from ainemo.core.planner import RunBudget, plan_run
+from ainemo.core.segment import Segment, TranslatedSegment
+from ainemo.core.termbase.base import Concept, ConceptHit, Term
+from ainemo.core.tm.sqlite import SqliteTranslationMemory
+from ainemo.core.validators.base import Violation
+from ainemo.core.validators.placeholder import PlaceholderParityValidator
+from ainemo.providers._usage_log import UsageLog
+from ainemo.providers.base import ProviderResult
+from ainemo.providers.router import ProviderRouter, RoutingConfig
+
+_EN = "en-US"
+_DE = "de-DE"
+_FR = "fr-FR"
+
+
+class _Provider:
+    """Translates with a fixed table; unknown sources echo back."""
+
+    def __init__(
+        self,
+        provider_id: str,
+        table: dict[str, str] | None = None,
+        langs: tuple[str, ...] = (_DE, _FR),
+    ) -> None:
+        self.provider_id = provider_id
+        self._table = table or {}
+        self._langs = langs
+        self.calls: list[tuple[str, str]] = []
+
+    def translate(
+        self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+    ) -> ProviderResult:
+        self.calls.append((segment.source_text, target_lang))
+        return ProviderResult(
+            target_text=self._table.get(segment.source_text, segment.source_text),
+            provider=self.provider_id,
+            model=f"{self.provider_id}-1",
+        )
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return target_lang in self._langs
+
+
+class _BatchProvider(_Provider):
+    def __init__(self, provider_id: str, table: dict[str, str]) -> None:
+        super().__init__(provider_id, table)
+        self.batches: list[list[str]] = []
+
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        self.batches.append([segment.source_text for segment in segments])
+        return [
+            ProviderResult(
+                target_text=self._table.get(segment.source_text, segment.source_text),
+                provider=self.provider_id,
+                model=f"{self.provider_id}-1",
+            )
+            for segment in segments
+        ]
+
+
+@dataclass
+class _Termbase:
+    hits: tuple[ConceptHit, ...]
+
+    def lookup_concepts_for(
+        self,
+        source_text: str,
+        source_lang: str,
+        target_lang: str,
+        domain_id: str | None = None,
+        max_hits: int = 16,
+    ) -> tuple[ConceptHit, ...]:
+        return self.hits
+
+
+def _hit(source: str, *targets: str) -> ConceptHit:
+    def _term(lang: str, surface: str) -> Term:
+        return Term(
+            term_id=f"{lang}:{surface}",
+            concept_id="c1",
+            lang=lang,
+            surface=surface,
+            register=None,
+            part_of_speech=None,
+            source="manual",
+        )
+
+    return ConceptHit(
+        concept=Concept(concept_id="c1", qid=None, definition=None, created_at=0),
+        matched_source_term=_term(_EN, source),
+        target_terms=tuple(_term(_DE, target) for target in targets),
+        relevance=1.0,
+    )
+
+
+def _draft(source: str, target: str, **metadata: object) -> tuple[Segment, TranslatedSegment]:
+    segment = Segment(
+        key="k",
+        source_text=source,
+        source_lang=_EN,
+        placeholders=parse_placeholders(source),
+        metadata=dict(metadata),
+    )
+    return segment, TranslatedSegment(
+        segment=segment, target_lang=_DE, target_text=target, provider="draft", model="m"
+    )
+
+
+# --- Scoring ---------------------------------------------------------------
+
+
+def test_policy_validates_threshold() -> None:
+    with pytest.raises(ValueError, match="threshold must be in"):
+        CascadePolicy(draft_provider=_Provider("draft"), threshold=1.2)
+
+
+def test_score_from_placeholders_and_length() -> None:
+    assert score_draft(*_draft("Hi {name}", "Hallo {name}"), ()).composite == 1.0
+    dropped = score_draft(*_draft("Hi {name}", "Hallo"), ())
+    assert dropped.placeholder_parity == 0.0
+    assert dropped.composite == pytest.approx(1 / 3)
+    too_long = score_draft(*_draft("Save", "Speichern", max_length=4), ())
+    assert too_long.composite == pytest.approx(2 / 3)
+
+
+def test_any_validator_violation_scores_zero() -> None:
+    violation = Violation(validator="forbidden-terms", severity="warning", message="x")
+    assert score_draft(*_draft("Hi", "Hallo"), (violation,)).composite == 0.0
+
+
+def test_termbase_agreement_joins_the_composite() -> None:
+    segment, draft = _draft("Open the file", "Öffne die Datei")
+    agreeing = _Termbase((_hit("file", "Datei"), _hit("open", "öffnen", "Öffne")))
+    assert score_draft(segment, draft, (), termbase=agreeing).termbase_agreement == 1.0  # type: ignore[arg-type]
+    no_target = _Termbase((_hit("file"),))
+    # Concepts without a target term say nothing about the draft.
+    assert score_draft(segment, draft, (), termbase=no_target).termbase_agreement is None  # type: ignore[arg-type]
+    half = _Termbase((_hit("file", "Akte"), _hit("open", "Öffne")))
+    score = score_draft(segment, draft, (), termbase=half)  # type: ignore[arg-type]
+    assert score == DraftScore(
+        placeholder_parity=1.0, length_budget=1.0, termbase_agreement=0.5, violation_count=0
+    )
+    assert score.composite == pytest.approx(0.8)
+    # Concepts without a target term say nothing about the draft.
+    assert (
+        score_draft(segment, draft, (), termbase=_Termbase((_hit("file"),))).termbase_agreement
+        is None
+    )  # type: ignore[arg-type]
+
+
+# --- Pipeline --------------------------------------------------------------
+
+
+def _pipeline(
+    tmp_path: Path, provider: object, cascade: CascadePolicy, langs: tuple[str, ...] = (_DE,)
+) -> TranslationPipeline:
+    return TranslationPipeline(
+        adapter=JavaPropertiesAdapter(),
+        tm=SqliteTranslationMemory(tmp_path / "tm.sqlite"),
+        provider=provider,  # type: ignore[arg-type]
+        validators=(PlaceholderParityValidator(),),
+        target_langs=langs,
+        source_lang=_EN,
+        cascade=cascade,
+    )
+
+
+def _bundle(tmp_path: Path) -> Path:
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("save=Save\ngreet=Hello {name}\n", encoding="utf-8")
+    return src
+
+
+def test_only_doubtful_drafts_are_escalated(tmp_path: Path) -> None:
+    draft = _Provider("draft", {"Save": "Speichern", "Hello {name}": "Hallo Name"})
+    llm = _Provider("llm", {"Hello {name}": "Hallo {name}"})
+    pipeline = _pipeline(tmp_path, llm, CascadePolicy(draft_provider=draft))
+
+    result = pipeline.translate_file(_bundle(tmp_path), tmp_path / "out")
+
+    assert draft.calls == [("Save", _DE), ("Hello {name}", _DE)]
+    assert llm.calls == [("Hello {name}", _DE)]
+    assert (result.provider_call_count, result.escalation_count, result.error_count) == (2, 1, 0)
+    save, greet = result.outcomes
+    assert (save.escalated, save.draft_score, save.translated.provider) == (False, 1.0, "draft")  # type: ignore[union-attr]
+    assert (greet.escalated, greet.draft_score) == (True, 0.0)
+    assert greet.translated is not None and greet.translated.target_text == "Hallo {name}"
+    written = result.target_lang_paths[_DE].read_text(encoding="utf-8")
+    assert "Speichern" in written and "Hallo {name}" in written
+
+
+def test_escalations_stay_within_the_run_budget(tmp_path: Path) -> None:
+    """Escalations are admitted and charged like any call: once one no
+    longer fits, doubtful drafts are skipped instead of escalated."""
+
+    class _PricedProvider(_Provider):
+        def translate(
+            self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+        ) -> ProviderResult:
+            result = super().translate(segment, target_lang)
+            return replace(result, cost_usd=0.01)
+
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("a=Hi {name}\nb=Bye {name}\nc=See {name}\n", encoding="utf-8")
+    draft = _Provider("draft", {"Hi {name}": "Hallo", "Bye {name}": "Tschüss", "See {name}": "Bis"})
+    llm = _PricedProvider("llm")
+    pipeline = _pipeline(tmp_path, llm, CascadePolicy(draft_provider=draft))
+    plan = plan_run(
+        pipeline.collect_misses(src),
+        segment_count=3,
+        target_langs=(_DE,),
+        provider_for=lambda _: "draft",
+        budget=RunBudget(max_cost_usd=0.015),
+    )
+
+    result = pipeline.translate_file(src, tmp_path / "out", plan=plan)
+
+    assert len(draft.calls) == 3
+    assert llm.calls == [("Hi {name}", _DE)]
+    assert (result.escalation_count, result.skipped_count) == (1, 2)
+    assert result.spent_cost_usd == pytest.approx(0.01)
+    assert [outcome.draft_score for outcome in result.outcomes if outcome.skipped] == [0.0, 0.0]
+    # The doubtful drafts were not stored: a re-run escalates them.
+    assert pipeline.collect_misses(src) != []
+
+
+def test_unsupported_pair_skips_the_draft(tmp_path: Path) -> None:
+    draft = _Provider("draft", langs=(_DE,))
+    llm = _Provider("llm")
+    pipeline = _pipeline(tmp_path, llm, CascadePolicy(draft_provider=draft), langs=(_DE, _FR))
+
+    result = pipeline.translate_file(_bundle(tmp_path), tmp_path / "out")
+
+    assert [lang for _, lang in draft.calls] == [_DE, _DE]
+    assert llm.calls == [("Save", _FR), ("Hello {name}", _FR)]
+    assert result.escalation_count == 0
+    assert {outcome.draft_score for outcome in result.outcomes if outcome.target_lang == _FR} == {
+        None
+    }
+
+
+def test_batch_drafts_and_both_legs_are_logged(tmp_path: Path) -> None:
+    log = UsageLog(tmp_path / "usage.jsonl")
+
+    def _router(provider: object) -> ProviderRouter:
+        return ProviderRouter(
+            providers={provider.provider_id: provider},  # type: ignore[attr-defined,dict-item]
+            routing_config=RoutingConfig(default_provider=provider.provider_id),  # type: ignore[attr-defined]
+            usage_log=log,
+        )
+
+    draft = _BatchProvider("draft", {"Save": "Speichern", "Hello {name}": "Hallo"})
+    llm = _Provider("llm", {"Hello {name}": "Hallo {name}"})
+    pipeline = _pipeline(tmp_path, _router(llm), CascadePolicy(draft_provider=_router(draft)))
+
+    result = pipeline.translate_file(_bundle(tmp_path), tmp_path / "out")
+
+    assert draft.batches == [["Save", "Hello {name}"]]
+    assert draft.calls == []
+    assert result.escalation_count == 1
+    assert log.stats().by_provider == {"draft": 2, "llm": 1}
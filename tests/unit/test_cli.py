@@ -136,11 +136,76 @@ def test_tm_stats_with_populated_tm(tmp_path: Path, capsys: pytest.CaptureFixtur
     assert "translations:" in captured.out
 
 
+def test_tm_stats_top_lists_most_hit_translations(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """A second translate run is served by the TM; `--top` lists those hits."""
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("k1=v1\nk2=v2\n", encoding="utf-8")
+    tm_path = tmp_path / "tm.sqlite"
+    for _ in range(2):
+        main(
+            [
+                CMD_NAME_TRANSLATE,
+                "--from",
+                str(src),
+                "--to-langs",
+                "de-DE",
+                "--output-dir",
+                str(tmp_path / "out"),
+                "--tm-path",
+                str(tm_path),
+            ]
+        )
+    capsys.readouterr()
+
+    rc = main([CMD_NAME_TM, "stats", "--tm-path", str(tm_path), "--top", "1"])
+    assert rc == 0
+    out = capsys.readouterr().out
+    assert "Top 1 for de-DE:" in out
+    assert out.count("'v1'") + out.count("'v2'") == 2  # one row: source → target
+
+
 def test_tm_stats_missing_db(tmp_path: Path) -> None:
     rc = main([CMD_NAME_TM, "stats", "--tm-path", str(tmp_path / "nope.sqlite")])
     assert rc == 2
 
 
+def test_tm_merge_combines_shards(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """`nemo tm merge OUT A B` folds per-shard TMs into one."""
+    shard_paths = []
+    for shard, body in (("a", "k1=v1\n"), ("b", "k2=v2\n")):
+        src = tmp_path / f"{shard}_en_US.properties"
+        src.write_text(body, encoding="utf-8")
+        shard_path = tmp_path / f"{shard}.sqlite"
+        main(
+            [
+                CMD_NAME_TRANSLATE,
+                "--from",
+                str(src),
+                "--to-langs",
+                "de-DE",
+                "--output-dir",
+                str(tmp_path / "out"),
+                "--tm-path",
+                str(shard_path),
+            ]
+        )
+        shard_paths.append(str(shard_path))
+    capsys.readouterr()
+
+    merged = tmp_path / "merged.sqlite"
+    rc = main([CMD_NAME_TM, "merge", str(merged), *shard_paths])
+    assert rc == 0
+    captured = capsys.readouterr()
+    assert "translations: 2" in captured.out
+
+
+def test_tm_merge_missing_input(tmp_path: Path) -> None:
+    rc = main([CMD_NAME_TM, "merge", str(tmp_path / "out.sqlite"), str(tmp_path / "nope.sqlite")])
+    assert rc == 2
+
+
 def test_validate_subcommand(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     src = tmp_path / "messages_en_US.properties"
     src.write_text("welcome=Hello {name}!\n", encoding="utf-8")
@@ -457,3 +522,317 @@ def test_translate_provider_scopes_tm_lookup(tmp_path: Path) -> None:
     # via the router on every call; one segment × first run only.)
     lines = [ln for ln in log.read_text(encoding="utf-8").splitlines() if ln]
     assert len(lines) == 1
+
+
+def test_translate_memory_tm_backend_snapshots_to_tm_path(tmp_path: Path) -> None:
+    """``--tm-backend memory`` loads the TM file, serves the run from
+    memory and writes the file back at exit, so the next run (on
+    either backend) hits it."""
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\n", encoding="utf-8")
+    tm_path = tmp_path / "tm.sqlite"
+    log = tmp_path / "usage.jsonl"
+
+    for run, backend in enumerate(("memory", "memory", "sqlite")):
+        rc = main(
+            [
+                CMD_NAME_TRANSLATE,
+                "--from",
+                str(src),
+                "--to-langs",
+                "de-DE",
+                "--output-dir",
+                str(tmp_path / f"out{run}"),
+                "--tm-path",
+                str(tm_path),
+                "--usage-log",
+                str(log),
+                "--tm-backend",
+                backend,
+            ]
+        )
+        assert rc == 0
+        assert tm_path.exists()
+
+    # Only the first run reached the provider.
+    lines = [ln for ln in log.read_text(encoding="utf-8").splitlines() if ln]
+    assert len(lines) == 1
+
+
+def test_translate_rejects_int8_with_bfloat16(tmp_path: Path) -> None:
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\n", encoding="utf-8")
+    exit_code = main(
+        [
+            CMD_NAME_TRANSLATE,
+            "--from",
+            str(src),
+            "--to-langs",
+            "de-DE",
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--tm-path",
+            str(tmp_path / "tm.sqlite"),
+            "--local-int8",
+            "--local-dtype",
+            "bfloat16",
+        ]
+    )
+    assert exit_code == 2
+    assert not (tmp_path / "tm.sqlite").exists()
+
+
+def test_build_provider_forwards_local_model_options() -> None:
+    from ainemo.cli.commands import _build_provider
+    from ainemo.providers._local_model import LocalModelOptions
+
+    options = LocalModelOptions(quantize_int8=True, num_threads=2, num_beams=1)
+    for provider_id in ("nllb", "opus"):
+        provider = _build_provider(provider_id, local_options=options)
+        assert provider._options is options  # type: ignore[attr-defined]
+
+
+def test_opus_cache_flags_build_local_model_options() -> None:
+    import argparse
+
+    from ainemo.cli.commands import add_local_model_arguments, local_model_options_from_args
+
+    parser = argparse.ArgumentParser()
+    add_local_model_arguments(parser)
+    options = local_model_options_from_args(
+        parser.parse_args(
+            ["--opus-max-models", "4", "--opus-max-model-mb", "1200", "--opus-pin", "de-DE, fr-FR"]
+        )
+    )
+    assert options.max_models == 4
+    assert options.max_model_bytes == 1200 * 1024 * 1024
+    assert options.pinned_target_langs == ("de-DE", "fr-FR")
+
+    with pytest.raises(ValueError, match="--opus-pin"):
+        local_model_options_from_args(parser.parse_args(["--opus-pin", "xx-XX"]))
+
+
+def test_llm_flags_reach_llm_providers(tmp_path: Path) -> None:
+    from ainemo.cli.commands import _build_provider
+
+    for provider_id in ("openai", "anthropic", "ollama"):
+        provider = _build_provider(provider_id, pack_size=8, multi_target=True)
+        assert provider.pack_size == 8  # type: ignore[attr-defined]
+        assert provider.multi_target is True  # type: ignore[attr-defined]
+
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\n", encoding="utf-8")
+    exit_code = main(
+        [
+            CMD_NAME_TRANSLATE,
+            "--from",
+            str(src),
+            "--to-langs",
+            "de-DE",
+            "--output-dir",
+            str(tmp_path / "out"),
+            "--tm-path",
+            str(tmp_path / "tm.sqlite"),
+            "--llm-pack-size",
+            "0",
+        ]
+    )
+    assert exit_code == 2
+
+
+def test_http_flags_configure_shared_client_registry(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from ainemo.providers import _http
+
+    monkeypatch.setattr(_http, "_registry", None)
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\n", encoding="utf-8")
+    base_args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de-DE",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tmp_path / "tm.sqlite"),
+        "--usage-log",
+        str(tmp_path / "usage.jsonl"),
+    ]
+    assert main([*base_args, "--llm-max-connections", "4", "--llm-timeout", "30"]) == 0
+    options = _http.client_registry().options
+    assert (options.max_connections, options.max_keepalive_connections) == (4, 4)
+    assert options.read_timeout_s == 30.0
+    assert main([*base_args, "--llm-max-connections", "0"]) == 2
+
+
+def test_rate_limit_flags_configure_shared_limiters(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from ainemo.providers import _rate_limit
+
+    monkeypatch.setattr(_rate_limit, "_registry", None)
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\n", encoding="utf-8")
+    base_args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de-DE",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tmp_path / "tm.sqlite"),
+        "--usage-log",
+        str(tmp_path / "usage.jsonl"),
+    ]
+    assert main([*base_args, "--llm-rpm", "500", "--llm-tpm", "30000"]) == 0
+    registry = _rate_limit.rate_limiters()
+    assert registry.limit == _rate_limit.RateLimit(500, 30000)
+    # The noop provider's calls went through its limiter.
+    [stats] = registry.stats()
+    assert (stats.provider, stats.acquired, stats.queued) == ("noop", 1, 0)
+    assert main([*base_args, "--llm-rpm", "0"]) == 2
+
+
+def test_deadline_and_hedge_flags(tmp_path: Path) -> None:
+    import argparse
+
+    from ainemo.cli.commands import hedge_policy_from_args
+    from ainemo.providers._hedge import HedgePolicy
+
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\n", encoding="utf-8")
+    base_args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de-DE",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tmp_path / "tm.sqlite"),
+        "--usage-log",
+        str(tmp_path / "usage.jsonl"),
+    ]
+    flags = {"llm_hedge": False, "llm_hedge_quantile": 0.9, "llm_hedge_provider": "noop"}
+    assert hedge_policy_from_args(argparse.Namespace(**flags)) == HedgePolicy(
+        quantile=0.9, secondary_provider="noop"
+    )
+    flags["llm_hedge_provider"] = None
+    assert hedge_policy_from_args(argparse.Namespace(**flags)) is None
+    assert main([*base_args, "--llm-deadline", "30", "--llm-hedge"]) == 0
+    assert main([*base_args, "--llm-endpoint-strategy", "ewma"]) == 0
+    assert main([*base_args, "--llm-endpoint-concurrency", "0"]) == 2
+    assert main([*base_args, "--llm-deadline", "0"]) == 2
+    assert main([*base_args, "--llm-hedge", "--llm-hedge-quantile", "1.5"]) == 2
+
+
+def test_response_cache_flags(tmp_path: Path) -> None:
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\n", encoding="utf-8")
+    base_args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de-DE",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tmp_path / "tm.sqlite"),
+        "--usage-log",
+        str(tmp_path / "usage.jsonl"),
+    ]
+    cache_path = tmp_path / "responses.sqlite"
+    assert main([*base_args, "--response-cache-path", str(cache_path)]) == 0
+    assert cache_path.exists()
+    assert main([*base_args, "--response-cache", "--response-cache-size", "0"]) == 2
+    assert main([*base_args, "--response-cache", "--response-cache-ttl", "-1"]) == 2
+
+
+def test_routes_flags_and_provider_routes_explain(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\n", encoding="utf-8")
+    routes = tmp_path / "routes.yaml"
+    routes.write_text(
+        "default_provider: noop\n"
+        "rules:\n"
+        "  - target_lang: de-DE\n"
+        "    provider: noop\n"
+        "  - target_lang: fr-FR\n"
+        "    candidates: [openai, anthropic]\n"
+        "    objective: cheapest-under-slo\n"
+        "    latency_slo_ms: 2000\n",
+        encoding="utf-8",
+    )
+    base_args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de-DE",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tmp_path / "tm.sqlite"),
+        "--usage-log",
+        str(tmp_path / "usage.jsonl"),
+    ]
+    assert main([*base_args, "--routes", str(routes), "--routing-seed", "7"]) == 0
+    assert (tmp_path / "out" / "messages_de_DE.properties").exists()
+
+    bad = tmp_path / "bad.yaml"
+    bad.write_text("default_provider: nope\n", encoding="utf-8")
+    assert main([*base_args, "--routes", str(bad)]) == 2
+
+    capsys.readouterr()
+    rc = main(
+        [
+            CMD_NAME_PROVIDER,
+            "routes",
+            "--routes",
+            str(routes),
+            "--usage-log",
+            str(tmp_path / "usage.jsonl"),
+            "--explain",
+        ]
+    )
+    assert rc == 0
+    out = capsys.readouterr().out
+    assert "rule 1: cheapest-under-slo over ['openai', 'anthropic'] when target_lang=fr-FR" in out
+    assert "en-US -> de-DE: noop (static rule 0)" in out
+    assert "en-US -> fr-FR: openai (measuring openai: 0 of 10 calls)" in out
+    assert main([CMD_NAME_PROVIDER, "routes", "--routes", str(routes), "--pair", "x"]) == 2
+
+
+def test_cascade_flags_draft_and_print_escalations(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello {name}\n", encoding="utf-8")
+    base_args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de-DE",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tmp_path / "tm.sqlite"),
+        "--usage-log",
+        str(tmp_path / "usage.jsonl"),
+        "--cascade-draft",
+        "noop",
+    ]
+    # The echoed draft keeps its placeholder and has no length budget.
+    assert main(base_args) == 0
+    assert "escalated:  0" in capsys.readouterr().out
+    assert main([*base_args, "--cascade-threshold", "1.5"]) == 2
@@ -11,6 +11,9 @@ import json
 from pathlib import Path
 from typing import Any
 
+import httpx
+import pytest
+
 from ainemo.cli.daemon import (
     ERR_INVALID_ENVELOPE,
     ERR_INVALID_JSON,
@@ -18,11 +21,19 @@ from ainemo.cli.daemon import (
     ERR_PROVIDER_FAILURE,
     ERR_UNKNOWN_OP,
     ERR_VERSION_MISMATCH,
+    OP_HTTP_POOLS,
     OP_PING,
+    OP_RATE_LIMITS,
+    OP_RELEASE_MODELS,
+    OP_RESPONSE_CACHE,
     OP_TRANSLATE,
     OP_TRANSLATE_FILE,
+    OP_WARMUP,
     PROTOCOL_VERSION,
     DaemonServer,
+    PreloadSpec,
+    WarmupPlan,
+    parse_preload_spec,
 )
 
 
@@ -54,7 +65,7 @@ def test_ping_returns_ok_with_pong(tmp_path: Path) -> None:
     assert response["v"] == "1"
     assert response["id"] == "abc"
     assert response["ok"] is True
-    assert response["result"] == {"pong": True}
+    assert response["result"] == {"pong": True, "ready": True, "warmup_errors": []}
 
 
 def test_request_id_echoes_back(tmp_path: Path) -> None:
@@ -459,6 +470,83 @@ def test_loop_continues_after_systemexit(tmp_path: Path) -> None:
     assert responses[1]["ok"] is True
 
 
+# --- TM-backed translate + cached TM handles -----------------------------
+
+
+def _translate_request(request_id: str, tm_path: Path, key: str = "k") -> dict[str, Any]:
+    return {
+        "v": "1",
+        "id": request_id,
+        "op": OP_TRANSLATE,
+        "params": {
+            "key": key,
+            "source_text": "Hello",
+            "source_lang": "en-US",
+            "target_lang": "de-DE",
+            "provider": "noop",
+            "tm_path": str(tm_path),
+        },
+    }
+
+
+def test_translate_with_tm_path_answers_repeat_from_tm(tmp_path: Path) -> None:
+    """With ``tm_path`` the first translate goes to the provider and is
+    stored; the repeat is a TM hit with zero usage and no UsageLog row."""
+    usage_log = tmp_path / "usage.jsonl"
+    tm_path = tmp_path / "tm.sqlite"
+    server = DaemonServer(usage_log_path=usage_log)
+    first, second = _drive(
+        server,
+        [_translate_request("a", tm_path), _translate_request("b", tm_path, key="other")],
+    )
+    assert first["result"]["translation_source"] == "provider"
+    assert second["ok"] is True
+    assert second["result"]["translation_source"] == "exact_tm"
+    assert second["result"]["target_text"] == "Hello"
+    assert second["result"]["provider"] == "noop"
+    assert second["result"]["input_tokens"] == 0
+    lines = [ln for ln in usage_log.read_text(encoding="utf-8").splitlines() if ln]
+    assert len(lines) == 1
+
+
+def test_translate_without_tm_path_does_not_open_tm(tmp_path: Path) -> None:
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    [request] = [_translate_request("a", tmp_path / "tm.sqlite")]
+    del request["params"]["tm_path"]
+    [response] = _drive(server, [request])
+    assert response["result"]["translation_source"] == "provider"
+    assert server._tms == {}
+
+
+def test_translate_file_reuses_cached_tm_across_requests(tmp_path: Path) -> None:
+    """One TM handle per tm_path for the daemon lifetime: the second
+    run over the same bundle is answered from the cached TM."""
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text("greeting=Hello\nfarewell=Goodbye\n", encoding="utf-8")
+    tm_path = tmp_path / "tm.sqlite"
+    request = {
+        "v": "1",
+        "op": OP_TRANSLATE_FILE,
+        "params": {
+            "source_path": str(src),
+            "target_langs": ["de-DE"],
+            "output_dir": str(tmp_path / "out"),
+            "provider": "noop",
+            "tm_path": str(tm_path),
+        },
+    }
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    first, second = _drive(server, [{**request, "id": "1"}, {**request, "id": "2"}])
+    assert first["result"]["provider_call_count"] == 2
+    assert second["result"]["tm_hit_count"] == 2
+    assert second["result"]["provider_call_count"] == 0
+    [tm] = server._tms.values()
+    cache = tm.cache_stats()
+    assert cache.hits == 2
+    server.close()
+    assert server._tms == {}
+
+
 # --- Cycle-3 S6 persona-aware envelope -----------------------------------
 
 
@@ -567,3 +655,340 @@ def test_translate_with_persona_id_loads_persona_from_termbase(tmp_path: Path) -
     )
     assert response["ok"] is True
     assert response["result"]["target_text"] == "Hello"
+
+
+def test_preload_hot_set_warms_daemon_tm_cache(tmp_path: Path) -> None:
+    """Hot rows preloaded on start answer the first translate from memory."""
+    tm_path = tmp_path / "tm.sqlite"
+    first_daemon = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    _drive(
+        first_daemon,
+        [_translate_request("a", tm_path), _translate_request("b", tm_path)],
+    )
+    first_daemon.close()
+
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    assert server.preload_hot_set(tm_path, per_target_lang=10) == 1
+    [response] = _drive(server, [_translate_request("c", tm_path)])
+    assert response["result"]["translation_source"] == "exact_tm"
+    [tm] = server._tms.values()
+    assert tm.cache_stats().misses == 0
+    server.close()
+
+
+def test_preloaded_relative_tm_path_serves_absolute_requests(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The hot set preloaded from a relative ``--tm-path`` answers
+    requests that name the same file by its absolute path."""
+    monkeypatch.chdir(tmp_path)
+    relative = Path(".ainemo") / "tm.sqlite"
+    relative.parent.mkdir()
+    first_daemon = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    _drive(first_daemon, [_translate_request("a", relative), _translate_request("b", relative)])
+    first_daemon.close()
+
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    assert server.preload_hot_set(relative, per_target_lang=10) == 1
+    [response] = _drive(server, [_translate_request("c", tmp_path / relative)])
+    assert response["result"]["translation_source"] == "exact_tm"
+    [tm] = server._tms.values()
+    assert tm.cache_stats().misses == 0
+    server.close()
+
+
+def test_daemon_builds_local_providers_with_its_options(tmp_path: Path) -> None:
+    from ainemo.providers._local_model import LocalModelOptions
+
+    options = LocalModelOptions(num_beams=1)
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl", local_options=options)
+    router = server._get_or_build_router("opus")
+    assert router._providers["opus"]._options is options  # type: ignore[attr-defined]
+
+
+def test_release_models_unloads_local_provider_models(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import torch
+
+    from ainemo.providers.opus._client import MarianModelCache
+
+    monkeypatch.setattr(
+        MarianModelCache, "_load", lambda self, name: (f"tok:{name}", torch.nn.Linear(4, 4))
+    )
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    server._get_or_build_router("noop")
+    cache = server._get_or_build_router("opus")._providers["opus"]._cache  # type: ignore[attr-defined]
+    cache.pin("pinned-repo")
+    for repo in ("pinned-repo", "repo-a", "repo-b"):
+        cache.get(repo)
+
+    responses = _drive(
+        server,
+        [
+            {"v": "1", "id": "1", "op": OP_RELEASE_MODELS, "params": {}},
+            {"v": "1", "id": "2", "op": OP_RELEASE_MODELS, "params": {"include_pinned": True}},
+            {"v": "1", "id": "3", "op": OP_RELEASE_MODELS, "params": {"include_pinned": "yes"}},
+        ],
+    )
+    assert responses[0]["result"] == {
+        "released_model_count": 2,
+        "released_by_provider": {"opus": 2},
+    }
+    assert responses[1]["result"]["released_model_count"] == 1
+    assert responses[2]["error"]["code"] == ERR_INVALID_PARAMS
+    assert cache.stats().models == 0
+
+
+def test_http_pools_reports_shared_pool_stats(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from ainemo.providers import _endpoints, _http
+
+    registry = _http.ClientRegistry()
+    monkeypatch.setattr(_http, "_registry", registry)
+    registry.transport("ollama", "http://localhost:11434", httpx)
+    pools = _endpoints.EndpointPoolRegistry()
+    monkeypatch.setattr(_endpoints, "_registry", pools)
+    pools.pool("ollama", ("http://a:11434",))
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    [response] = _drive(server, [{"v": "1", "id": "1", "op": OP_HTTP_POOLS}])
+    assert response["result"] == {
+        "pools": [
+            {
+                "provider": "ollama",
+                "endpoint": "http://localhost:11434",
+                "kind": "sync",
+                "max_connections": 32,
+                "requests": 0,
+                "in_flight": 0,
+                "peak_in_flight": 0,
+                "open_connections": 0,
+                "utilization": 0.0,
+            }
+        ],
+        "endpoints": [
+            {
+                "provider": "ollama",
+                "endpoint": "http://a:11434",
+                "requests": 0,
+                "in_flight": 0,
+                "failures": 0,
+                "ewma_latency_ms": None,
+                "healthy": True,
+                "ejections": 0,
+            }
+        ],
+    }
+
+
+# --- Warm-up / preload ----------------------------------------------------
+
+
+def test_parse_preload_spec() -> None:
+    assert parse_preload_spec("noop") == PreloadSpec(provider_id="noop")
+    assert parse_preload_spec("opus:de-DE, fr-FR") == PreloadSpec(
+        provider_id="opus", lang_pairs=(("en-US", "de-DE"), ("en-US", "fr-FR"))
+    )
+    assert parse_preload_spec("nllb:ja-JP/en-US").lang_pairs == (("ja-JP", "en-US"),)
+    with pytest.raises(ValueError, match="missing provider id"):
+        parse_preload_spec(":de-DE")
+    with pytest.raises(ValueError, match="bad language pair"):
+        parse_preload_spec("nllb:en-US/")
+
+
+def test_ping_answers_not_ready_while_warmup_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    from ainemo.providers.opus.opus_provider import OpusProvider
+
+    release = threading.Event()
+    warmed: list[Any] = []
+
+    def _slow_warm_up(self: OpusProvider, lang_pairs: Any) -> None:
+        release.wait(timeout=10)
+        warmed.append(tuple(lang_pairs))
+
+    monkeypatch.setattr(OpusProvider, "warm_up", _slow_warm_up)
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    thread = server.start_warmup(WarmupPlan(providers=(parse_preload_spec("opus:de-DE"),)))
+    [before] = _drive(server, [{"v": "1", "id": "p1", "op": OP_PING}])
+    assert before["result"]["ready"] is False
+    release.set()
+    thread.join(timeout=10)
+    [after] = _drive(server, [{"v": "1", "id": "p2", "op": OP_PING}])
+    assert after["result"] == {"pong": True, "ready": True, "warmup_errors": []}
+    assert warmed == [(("en-US", "de-DE"),)]
+    assert "opus" in server._routers
+
+
+def test_warmup_op_opens_tm_and_reports_failures(tmp_path: Path) -> None:
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    tm_path = tmp_path / "tm.sqlite"
+    [started] = _drive(
+        server,
+        [
+            {
+                "v": "1",
+                "id": "w",
+                "op": OP_WARMUP,
+                "params": {
+                    "provider": "opus",
+                    "lang_pairs": [["ja-JP", "de-DE"]],
+                    "tm_path": str(tm_path),
+                },
+            }
+        ],
+    )
+    assert started["result"] == {"ready": False}
+    for thread in server._warmup_threads:
+        thread.join(timeout=30)
+    [ping] = _drive(server, [{"v": "1", "id": "p", "op": OP_PING}])
+    assert ping["result"]["ready"] is True
+    [error] = ping["result"]["warmup_errors"]
+    assert "provider 'opus'" in error
+    assert "unsupported language pair" in error
+    # The failed provider step does not stop the TM step.
+    assert tm_path.resolve() in server._tms
+    server.close()
+
+
+@pytest.mark.parametrize("hot_set", [0, 7])
+def test_warmup_op_uses_the_configured_hot_set(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, hot_set: int
+) -> None:
+    from ainemo.core.tm.cached import CachedTranslationMemory
+
+    preloads: list[int] = []
+    monkeypatch.setattr(
+        CachedTranslationMemory,
+        "preload_hot_set",
+        lambda self, *, per_target_lang: preloads.append(per_target_lang) or 0,
+    )
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl", hot_set_per_target_lang=hot_set)
+    tm_path = tmp_path / "tm.sqlite"
+    _drive(server, [{"v": "1", "id": "w", "op": OP_WARMUP, "params": {"tm_path": str(tm_path)}}])
+    for thread in server._warmup_threads:
+        thread.join(timeout=30)
+    assert preloads == ([hot_set] if hot_set else [])
+    assert tm_path.resolve() in server._tms
+    server.close()
+
+
+def test_close_does_not_wait_for_a_stuck_warmup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    from ainemo.cli import daemon as daemon_module
+    from ainemo.providers.opus.opus_provider import OpusProvider
+
+    release = threading.Event()
+    monkeypatch.setattr(OpusProvider, "warm_up", lambda self, lang_pairs: release.wait(10))
+    monkeypatch.setattr(daemon_module, "_WARMUP_JOIN_TIMEOUT_S", 0.1)
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    thread = server.start_warmup(
+        WarmupPlan(
+            providers=(parse_preload_spec("opus:de-DE"),),
+            tm_path=tmp_path / "tm.sqlite",
+            hot_set_per_target_lang=10,
+        )
+    )
+    server.close()
+    assert thread.is_alive()
+    release.set()
+    thread.join(timeout=10)
+    # The warm-up stopped after the step it was in: no TM was opened
+    # after close.
+    assert server._tms == {}
+
+
+def test_warmup_op_validates_params(tmp_path: Path) -> None:
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    responses = _drive(
+        server,
+        [
+            {"v": "1", "id": "a", "op": OP_WARMUP, "params": {"lang_pairs": [["en", "de"]]}},
+            {
+                "v": "1",
+                "id": "b",
+                "op": OP_WARMUP,
+                "params": {"provider": "opus", "lang_pairs": ["en/de"]},
+            },
+        ],
+    )
+    assert [r["error"]["code"] for r in responses] == [ERR_INVALID_PARAMS] * 2
+    assert server._warmup_threads == []
+
+
+def test_rate_limits_reports_limiters_of_routed_calls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from ainemo.providers import _rate_limit
+
+    registry = _rate_limit.RateLimiterRegistry(_rate_limit.RateLimit(requests_per_minute=600))
+    monkeypatch.setattr(_rate_limit, "_registry", registry)
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    responses = _drive(
+        server,
+        [
+            {
+                "v": "1",
+                "id": "1",
+                "op": OP_TRANSLATE,
+                "params": {
+                    "key": "k",
+                    "source_text": "Hello",
+                    "source_lang": "en-US",
+                    "target_lang": "de-DE",
+                    "provider": "noop",
+                },
+            },
+            {"v": "1", "id": "2", "op": OP_RATE_LIMITS},
+        ],
+    )
+    [limiter] = responses[1]["result"]["limiters"]
+    assert (limiter["provider"], limiter["model"]) == ("noop", "")
+    assert limiter["requests_per_minute"] == 600.0
+    assert (limiter["acquired"], limiter["queued"], limiter["throttle_events"]) == (1, 0, 0)
+    assert limiter["requests_available"] == pytest.approx(59.0, abs=0.1)
+
+
+def test_response_cache_answers_repeated_translates(tmp_path: Path) -> None:
+    from ainemo.providers._response_cache import ResponseCache
+    from ainemo.providers._usage_log import UsageLog
+
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl", response_cache=ResponseCache())
+    translate = {
+        "v": "1",
+        "op": OP_TRANSLATE,
+        "params": {
+            "key": "k",
+            "source_text": "Hello",
+            "source_lang": "en-US",
+            "target_lang": "de-DE",
+            "provider": "noop",
+        },
+    }
+    responses = _drive(
+        server,
+        [
+            {**translate, "id": "1"},
+            {**translate, "id": "2"},
+            {"v": "1", "id": "3", "op": OP_RESPONSE_CACHE},
+        ],
+    )
+    assert responses[0]["result"]["target_text"] == responses[1]["result"]["target_text"]
+    cache = responses[2]["result"]["response_cache"]
+    assert (cache["misses"], cache["hits"], cache["entries"]) == (1, 1, 1)
+    stats = UsageLog(tmp_path / "usage.jsonl").stats()
+    assert (stats.call_count, stats.response_cache_hits) == (1, 1)
+    server.close()
+
+
+def test_response_cache_op_without_cache(tmp_path: Path) -> None:
+    server = DaemonServer(usage_log_path=tmp_path / "usage.jsonl")
+    [response] = _drive(server, [{"v": "1", "id": "1", "op": OP_RESPONSE_CACHE}])
+    assert response["result"] == {"response_cache": None}
@@ -0,0 +1,334 @@
+"""Unit tests for :mod:`ainemo.providers._endpoints` and the Ollama
+provider's pooled path.
+
+Pool state is driven through ``acquire`` / ``release`` with an
+injected clock; the provider tests run against stand-in Ollama
+daemons on local ports.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from ainemo.core.segment import Segment
+from ainemo.providers._endpoints import (
+    STRATEGY_EWMA,
+    EndpointPool,
+    EndpointPoolOptions,
+    EndpointPoolRegistry,
+    configure_endpoint_pools,
+    is_endpoint_failure,
+    split_endpoints,
+)
+from ainemo.providers._usage_log import UsageLog
+from ainemo.providers.ollama.ollama_provider import OllamaProvider
+from ainemo.providers.router import ProviderRouter, RoutingConfig
+
+_SEGMENT = Segment(key="k", source_text="Hello", source_lang="en-US")
+
+
+@dataclass
+class _Clock:
+    now: float = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def _pool(*endpoints: str, clock: _Clock | None = None, **options: object) -> EndpointPool:
+    return EndpointPool(
+        "ollama",
+        endpoints,
+        EndpointPoolOptions(**options),  # type: ignore[arg-type]
+        clock=clock or _Clock(),
+    )
+
+
+def _fail(pool: EndpointPool, endpoint: str, times: int = 1) -> None:
+    for _ in range(times):
+        assert pool.acquire() == endpoint
+        pool.release(endpoint, error=ConnectionError("refused"))
+
+
+# --- Options and helpers ---------------------------------------------------
+
+
+def test_options_validate() -> None:
+    with pytest.raises(ValueError, match="strategy must be one of"):
+        EndpointPoolOptions(strategy="random")
+    with pytest.raises(ValueError, match="max_concurrency must be >= 1"):
+        EndpointPoolOptions(max_concurrency=0)
+    with pytest.raises(ValueError, match="max_ejection_s must be >= ejection_s"):
+        EndpointPoolOptions(ejection_s=60, max_ejection_s=30)
+    with pytest.raises(ValueError, match="endpoints must be unique"):
+        _pool("http://a", "http://a")
+
+
+def test_split_endpoints() -> None:
+    assert split_endpoints(" http://a:11434/, http://b:11434 ,,http://a:11434") == (
+        "http://a:11434",
+        "http://b:11434",
+    )
+
+
+def test_endpoint_failures() -> None:
+    assert is_endpoint_failure(ConnectionError("refused"))
+    assert is_endpoint_failure(TimeoutError())
+    assert is_endpoint_failure(_StatusError(503))
+    assert is_endpoint_failure(_StatusError(429))
+    assert not is_endpoint_failure(_StatusError(400))
+    assert not is_endpoint_failure(ValueError("bad input"))
+
+
+# --- Balancing -------------------------------------------------------------
+
+
+def test_least_outstanding_spreads_load() -> None:
+    pool = _pool("http://a", "http://b")
+    first, second = pool.acquire(), pool.acquire()
+    assert {first, second} == {"http://a", "http://b"}
+    pool.release(first)
+    # ``first`` is idle again while ``second`` is busy.
+    assert pool.acquire() == first
+    assert sorted(stats.requests for stats in pool.stats()) == [1, 2]
+
+
+def test_ewma_prefers_the_faster_endpoint() -> None:
+    pool = _pool("http://slow", "http://fast", strategy=STRATEGY_EWMA)
+    for endpoint, latency in (("http://slow", 400.0), ("http://fast", 100.0)):
+        assert pool.acquire() == endpoint
+        pool.release(endpoint, latency_ms=latency)
+    # Each request in flight adds the fast endpoint's average again:
+    # 100, 200 and 300 ms stay below the idle slow one (400 ms); at
+    # 400 ms the tie goes to the endpoint that served fewer requests.
+    assert [pool.acquire() for _ in range(4)] == ["http://fast"] * 3 + ["http://slow"]
+
+
+def test_ewma_explores_each_endpoint_once_then_uses_the_pool_mean() -> None:
+    pool = _pool("http://a", "http://b", "http://c", strategy=STRATEGY_EWMA)
+    assert pool.acquire() == "http://a"
+    pool.release("http://a", latency_ms=100.0)
+    # "b" and "c" have never served a request: each is tried once,
+    # whatever "a"'s average says.
+    assert pool.acquire() == "http://b"
+    pool.release("http://b", latency_ms=300.0)
+    held = pool.acquire()
+    assert held == "http://c"
+    # "c" has no sample yet, so it weighs in at the mean (200 ms) per
+    # request in flight rather than as the fastest endpoint: 400 ms
+    # loses to idle "a" (100 ms), then to "a" with one in flight (200).
+    assert [pool.acquire() for _ in range(2)] == ["http://a"] * 2
+    pool.release(held, latency_ms=50.0)
+    assert pool.acquire() == "http://c"
+
+
+def test_concurrency_cap_makes_callers_wait() -> None:
+    pool = _pool("http://a", max_concurrency=1)
+    held = pool.acquire()
+    acquired = threading.Event()
+
+    def _second() -> None:
+        pool.release(pool.acquire())
+        acquired.set()
+
+    waiter = threading.Thread(target=_second)
+    waiter.start()
+    assert not acquired.wait(0.05)
+    pool.release(held)
+    assert acquired.wait(5)
+    waiter.join()
+
+
+def test_async_waiter_is_woken_by_a_release() -> None:
+    pool = _pool("http://a", max_concurrency=1)
+
+    async def _run() -> str:
+        held = await pool.aacquire()
+        waiter = asyncio.create_task(pool.aacquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        pool.release(held)
+        return await asyncio.wait_for(waiter, 5)
+
+    assert asyncio.run(_run()) == "http://a"
+
+
+# --- Ejection and health ---------------------------------------------------
+
+
+def test_failing_endpoint_is_ejected_then_retried() -> None:
+    clock = _Clock()
+    pool = _pool("http://a", "http://b", clock=clock, eject_after_failures=2, ejection_s=10)
+    assert pool.acquire() == "http://a"
+    pool.release("http://a", error=_StatusError(400))  # The request's fault: no strike.
+    _fail(pool, "http://b")
+    pool.release(pool.acquire())  # "http://a" again: fewer requests.
+    _fail(pool, "http://b")
+    assert [stats.healthy for stats in pool.stats()] == [True, False]
+    assert {pool.acquire() for _ in range(3)} == {"http://a"}
+
+    # After the ejection one trial goes through; its failure doubles the ejection.
+    clock.now += 10
+    assert pool.acquire() == "http://b"
+    assert pool.acquire() == "http://a"  # Only one trial at a time.
+    pool.release("http://b", error=ConnectionError("still down"))
+    clock.now += 10
+    assert pool.acquire() == "http://a"
+    clock.now += 10
+    assert pool.acquire() == "http://b"
+    pool.release("http://b", latency_ms=50)
+    stats = pool.stats()[1]
+    assert (stats.healthy, stats.ejections, stats.failures) == (True, 0, 3)
+
+
+def test_every_endpoint_ejected_spreads_load_anyway() -> None:
+    pool = _pool("http://a", "http://b", eject_after_failures=1)
+    _fail(pool, "http://a")
+    _fail(pool, "http://b")
+    assert {pool.acquire(), pool.acquire()} == {"http://a", "http://b"}
+
+
+def test_check_health_ejects_and_readmits() -> None:
+    down = {"http://b"}
+    pool = EndpointPool(
+        "ollama", ("http://a", "http://b"), probe=lambda endpoint: endpoint not in down
+    )
+    assert pool.check_health() == {"http://a": True, "http://b": False}
+    assert {pool.acquire() for _ in range(3)} == {"http://a"}
+    down.clear()
+    pool.check_health()
+    assert all(stats.healthy for stats in pool.stats())
+
+
+def test_registry_shares_one_pool_per_endpoint_list() -> None:
+    registry = EndpointPoolRegistry()
+    first = registry.pool("ollama", ("http://a", "http://b"))
+    assert registry.pool("ollama", ("http://a", "http://b")) is first
+    assert registry.pool("openai", ("http://a", "http://b")) is not first
+    assert len(registry.stats()) == 4
+
+
+# --- Ollama against stand-in daemons ---------------------------------------
+
+
+class _Daemon:
+    """A local stand-in for ``ollama serve``."""
+
+    def __init__(self, *, status: int = 200) -> None:
+        self.status = status
+        self.chats = 0
+        daemon = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802
+                self._reply(daemon.status, {"version": "0.5.0"})
+
+            def do_POST(self) -> None:  # noqa: N802
+                self.rfile.read(int(self.headers["Content-Length"]))
+                daemon.chats += 1
+                self._reply(
+                    daemon.status,
+                    {
+                        "model": "llama3.2",
+                        "created_at": "2026-01-01T00:00:00Z",
+                        "message": {"role": "assistant", "content": "Hallo"},
+                        "done": True,
+                        "prompt_eval_count": 5,
+                        "eval_count": 2,
+                    },
+                )
+
+            def _reply(self, status: int, body: dict[str, object]) -> None:
+                payload = json.dumps(body if status == 200 else {"error": "down"}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(
+            target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def daemons() -> Iterator[tuple[_Daemon, _Daemon]]:
+    configure_endpoint_pools(EndpointPoolOptions(eject_after_failures=2))
+    pair = (_Daemon(), _Daemon())
+    yield pair
+    for daemon in pair:
+        daemon.close()
+    configure_endpoint_pools(EndpointPoolOptions())
+
+
+def test_ollama_balances_and_logs_per_endpoint_latency(
+    tmp_path: Path, daemons: tuple[_Daemon, _Daemon]
+) -> None:
+    first, second = daemons
+    provider = OllamaProvider(host=f"{first.url},{second.url}")
+    log = UsageLog(tmp_path / "usage.jsonl")
+    router = ProviderRouter(
+        providers={provider.provider_id: provider},
+        routing_config=RoutingConfig(default_provider=provider.provider_id),
+        usage_log=log,
+    )
+    results = [router.translate(_SEGMENT, "de-DE") for _ in range(4)]
+    assert {result.target_text for result in results} == {"Hallo"}
+    assert (first.chats, second.chats) == (2, 2)
+    stats = log.stats()
+    assert stats.by_endpoint == {first.url: 2, second.url: 2}
+    assert set(stats.latency_ms_by_endpoint) == {first.url, second.url}
+
+
+def test_ollama_routes_around_a_failing_daemon(daemons: tuple[_Daemon, _Daemon]) -> None:
+    first, second = daemons
+    second.status = 500
+    provider = OllamaProvider(host=f"{first.url},{second.url}")
+    failures = 0
+    for _ in range(6):
+        try:
+            assert provider.translate(_SEGMENT, "de-DE").endpoint == first.url
+        except Exception as exc:  # noqa: BLE001 - the SDK's ResponseError
+            assert getattr(exc, "status_code", None) == 500
+            failures += 1
+    assert (failures, second.chats) == (2, 2)
+
+    async def _run() -> str | None:
+        return (await provider.atranslate(_SEGMENT, "de-DE")).endpoint
+
+    assert asyncio.run(_run()) == first.url
+
+
+def test_ollama_warm_up_health_checks_the_pool(daemons: tuple[_Daemon, _Daemon]) -> None:
+    first, second = daemons
+    second.status = 503
+    provider = OllamaProvider(host=f"{first.url},{second.url}")
+    provider.warm_up([])
+    started = time.monotonic()
+    assert {provider.translate(_SEGMENT, "de-DE").endpoint for _ in range(3)} == {first.url}
+    assert second.chats == 0
+    assert time.monotonic() - started < 5
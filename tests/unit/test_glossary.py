@@ -17,8 +17,13 @@ from pathlib import Path
 import pytest
 
 from ainemo.core.termbase._ids import TERM_SOURCE_MANUAL
-from ainemo.core.termbase.base import Concept, Domain, Persona, Term
-from ainemo.core.termbase.glossary import build_glossary_block, format_glossary_block
+from ainemo.core.termbase.base import Concept, ConceptHit, Domain, Persona, Term
+from ainemo.core.termbase.glossary import (
+    GlossaryPromptBuilder,
+    PromptBudget,
+    build_glossary_block,
+    format_glossary_block,
+)
 from ainemo.core.termbase.kuzu.store import KuzuTermbase
 
 pytestmark = pytest.mark.unit
@@ -210,3 +215,153 @@ def test_pipeline_delegates_to_shared_builder() -> None:
         "build_glossary_block; the cycle-3 byte-stability invariant "
         "depends on the shared builder."
     )
+
+
+def _hit(source_term: str, target_term: str, relevance: float) -> ConceptHit:
+    concept_id = f"c-{source_term}-{target_term}"
+    return ConceptHit(
+        concept=Concept(concept_id=concept_id, qid=None, definition=None, created_at=1),
+        matched_source_term=Term(
+            term_id=f"{concept_id}-en",
+            concept_id=concept_id,
+            lang="en",
+            surface=source_term,
+            register=None,
+            part_of_speech=None,
+            source=TERM_SOURCE_MANUAL,
+        ),
+        target_terms=(
+            Term(
+                term_id=f"{concept_id}-de",
+                concept_id=concept_id,
+                lang="de",
+                surface=target_term,
+                register=None,
+                part_of_speech=None,
+                source=TERM_SOURCE_MANUAL,
+            ),
+        ),
+        relevance=relevance,
+    )
+
+
+class _StubTermbase:
+    """Answers every lookup with ``hits``, counting the lookups."""
+
+    def __init__(self, *hits: ConceptHit) -> None:
+        self._hits = hits
+        self.lookups = 0
+
+    def lookup_concepts_for(
+        self,
+        source_text: str,
+        source_lang: str,
+        target_lang: str,
+        *,
+        domain_id: str | None = None,
+        max_hits: int = 16,
+    ) -> tuple[ConceptHit, ...]:
+        self.lookups += 1
+        return self._hits
+
+
+def test_prompt_budget_validates() -> None:
+    with pytest.raises(ValueError, match="max_tokens must be >= 1"):
+        PromptBudget(max_tokens=0)
+
+
+def test_prompt_builder_without_budget_is_byte_stable(tb: KuzuTermbase) -> None:
+    _seed_concept(tb, concept_id="c1", source_term="login", target_term="Anmeldung")
+    persona = _make_persona(prompt_addendum="Use formal address.")
+    builder = GlossaryPromptBuilder(tb, persona)
+    for text in ("please login here", "nothing to see"):
+        assert builder.build(
+            source_text=text, source_lang="en", target_lang="de"
+        ) == build_glossary_block(tb, persona, source_text=text, source_lang="en", target_lang="de")
+    assert builder.stats().tokens_saved == 0
+
+
+def test_prompt_builder_keeps_present_ranked_distinct_entries() -> None:
+    termbase = _StubTermbase(
+        _hit("log", "Protokoll", 0.9),
+        _hit("sign in", "Anmeldung", 0.5),
+        _hit("login", "Anmeldung", 0.5),
+        _hit("password", "Passwort", 0.8),
+        _hit("logout", "Abmeldung", 0.7),
+    )
+    builder = GlossaryPromptBuilder(termbase, None, budget=PromptBudget(max_tokens=1000))
+    text = "Enter the password to login"
+    addendum = builder.build(source_text=text, source_lang="en", target_lang="de")
+    # "logout" is absent; "sign in" repeats the target of the longer "login".
+    assert addendum == "\n".join(
+        [
+            _GLOSSARY_HEADER,
+            '- "log" → "Protokoll"',
+            '- "password" → "Passwort"',
+            '- "login" → "Anmeldung"',
+        ]
+    )
+    assert builder.build(source_text=text, source_lang="en", target_lang="de") == addendum
+    assert termbase.lookups == 1
+    stats = builder.stats()
+    assert (stats.prompts, stats.dropped_entries) == (1, 2)
+    assert stats.tokens_saved > 0
+
+
+def test_prompt_builder_truncates_to_budget_and_keeps_persona() -> None:
+    termbase = _StubTermbase(_hit("login", "Anmeldung", 0.9), _hit("password", "Passwort", 0.5))
+    persona = _make_persona(prompt_addendum="Use formal address.")
+    text = "login with password"
+    first_entry = "\n\n".join(
+        ["Use formal address.", "\n".join([_GLOSSARY_HEADER, '- "login" → "Anmeldung"'])]
+    )
+    budget = PromptBudget(max_tokens=PromptBudget(max_tokens=1).tokens(first_entry))
+    builder = GlossaryPromptBuilder(termbase, persona, budget=budget)
+    assert builder.build(source_text=text, source_lang="en", target_lang="de") == first_entry
+
+    tiny = GlossaryPromptBuilder(termbase, persona, budget=PromptBudget(max_tokens=1))
+    assert tiny.build(source_text=text, source_lang="en", target_lang="de") == "Use formal address."
+    assert tiny.stats().dropped_entries == 2
+    tiny.reset()
+    assert tiny.stats().prompts == 0
+
+
+def test_pipeline_reports_prompt_tokens_saved(tmp_path: Path) -> None:
+    from ainemo.core.adapters.java_properties import JavaPropertiesAdapter
+    from ainemo.core.pipeline import TranslationPipeline
+    from ainemo.core.segment import Segment
+    from ainemo.core.tm.sqlite import SqliteTranslationMemory
+    from ainemo.providers.base import ProviderResult
+
+    addenda: list[str | None] = []
+
+    class _Provider:
+        provider_id = "llm"
+
+        def translate(
+            self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+        ) -> ProviderResult:
+            addenda.append(system_prompt_addendum)
+            return ProviderResult(target_text=segment.source_text, provider="llm", model="llm-1")
+
+        def supports(self, source_lang: str, target_lang: str) -> bool:
+            return True
+
+    src = tmp_path / "messages_en.properties"
+    src.write_text("a=login\nb=password\n", encoding="utf-8")
+    pipeline = TranslationPipeline(
+        adapter=JavaPropertiesAdapter(),
+        tm=SqliteTranslationMemory(tmp_path / "tm.sqlite"),
+        provider=_Provider(),
+        validators=[],
+        target_langs=("de",),
+        source_lang="en",
+        termbase=_StubTermbase(_hit("login", "Anmeldung", 0.9), _hit("password", "Passwort", 0.5)),
+        prompt_budget=PromptBudget(max_tokens=1000),
+    )
+    result = pipeline.translate_file(src, tmp_path / "out")
+    assert addenda == [
+        f'{_GLOSSARY_HEADER}\n- "login" → "Anmeldung"',
+        f'{_GLOSSARY_HEADER}\n- "password" → "Passwort"',
+    ]
+    assert result.prompt_tokens_saved > 0
@@ -0,0 +1,275 @@
+"""Unit tests for :mod:`ainemo.providers._hedge` and the router's
+deadline / hedging paths.
+
+Slow attempts block on :class:`threading.Event` (or sleep briefly on
+the event loop), so races resolve in milliseconds.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import ClassVar, Iterator
+
+import pytest
+
+from ainemo.core.segment import Segment
+from ainemo.providers._hedge import (
+    HedgePolicy,
+    LatencyWindow,
+    ProviderDeadlineExceeded,
+    arun_hedged,
+    run_hedged,
+)
+from ainemo.providers._usage_log import UsageLog
+from ainemo.providers.base import ProviderResult
+from ainemo.providers.router import ProviderRouter, RoutingConfig
+
+_SEGMENT = Segment(key="k", source_text="Hello", source_lang="en-US")
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolExecutor]:
+    pool = ThreadPoolExecutor(max_workers=4)
+    yield pool
+    pool.shutdown(wait=True)
+
+
+# --- Policy and latency window --------------------------------------------
+
+
+def test_hedge_policy_validates() -> None:
+    with pytest.raises(ValueError, match="quantile must be between 0 and 1"):
+        HedgePolicy(quantile=1.0)
+    with pytest.raises(ValueError, match="window must be >= min_samples"):
+        HedgePolicy(min_samples=50, window=10)
+
+
+def test_latency_window_quantile_needs_enough_samples() -> None:
+    window = LatencyWindow(size=100)
+    for ms in range(1, 101):
+        window.observe(ms / 1000)
+    assert window.quantile(0.95) == 0.095
+    assert window.quantile(0.5, min_samples=101) is None
+    window.observe(10.0)  # Evicts the oldest sample.
+    assert window.quantile(0.99) == 0.1
+
+
+# --- run_hedged -----------------------------------------------------------
+
+
+def test_fast_primary_never_hedges(executor: ThreadPoolExecutor) -> None:
+    hedges: list[str] = []
+
+    def _hedge() -> str:
+        hedges.append("sent")
+        return "hedge"
+
+    value = run_hedged(
+        executor, lambda: "primary", hedge=_hedge, hedge_after_s=5.0, on_late=lambda _v: None
+    )
+    assert value == "primary"
+    assert hedges == []
+
+
+def test_slow_primary_loses_to_hedge_and_is_recorded_late(executor: ThreadPoolExecutor) -> None:
+    release = threading.Event()
+    late: list[str] = []
+    recorded = threading.Event()
+
+    def _slow() -> str:
+        release.wait(5)
+        return "primary"
+
+    def _on_late(value: str) -> None:
+        late.append(value)
+        recorded.set()
+
+    value = run_hedged(executor, _slow, hedge=lambda: "hedge", hedge_after_s=0.01, on_late=_on_late)
+    assert value == "hedge"
+    release.set()
+    assert recorded.wait(5)
+    assert late == ["primary"]
+
+
+def test_first_error_fails_fast(executor: ThreadPoolExecutor) -> None:
+    def _boom() -> str:
+        raise PermissionError("bad key")
+
+    with pytest.raises(PermissionError):
+        run_hedged(executor, _boom, hedge=lambda: "hedge", hedge_after_s=5.0, on_late=print)
+
+
+def test_deadline_raises_and_late_result_still_recorded(executor: ThreadPoolExecutor) -> None:
+    release = threading.Event()
+    recorded = threading.Event()
+
+    def _slow() -> str:
+        release.wait(5)
+        return "late"
+
+    with pytest.raises(ProviderDeadlineExceeded, match="0.02s deadline"):
+        run_hedged(executor, _slow, deadline_s=0.02, on_late=lambda _v: recorded.set())
+    release.set()
+    assert recorded.wait(5)
+
+
+def test_async_hedge_cancels_the_loser() -> None:
+    cancelled: list[bool] = []
+
+    async def _slow() -> str:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return "primary"
+
+    async def _fast() -> str:
+        return "hedge"
+
+    async def _run() -> str:
+        value = await arun_hedged(_slow, hedge=_fast, hedge_after_s=0.01, on_late=print)
+        await asyncio.sleep(0)  # Let the cancellation land.
+        return value
+
+    assert asyncio.run(_run()) == "hedge"
+    assert cancelled == [True]
+
+
+def test_async_deadline() -> None:
+    async def _slow() -> str:
+        await asyncio.sleep(5)
+        return "late"
+
+    with pytest.raises(ProviderDeadlineExceeded):
+        asyncio.run(arun_hedged(_slow, deadline_s=0.02, on_late=print))
+
+
+# --- Router ---------------------------------------------------------------
+
+
+class _TimedProvider:
+    """Answers at once unless ``slow`` is set, then blocks on ``release``."""
+
+    def __init__(self, provider_id: str) -> None:
+        self.provider_id = provider_id  # type: ignore[misc]
+        self.slow = False
+        self.release = threading.Event()
+        self.calls = 0
+
+    def translate(
+        self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+    ) -> ProviderResult:
+        self.calls += 1
+        if self.slow:
+            self.release.wait(5)
+        return ProviderResult(
+            target_text=f"{self.provider_id}:{segment.source_text}",
+            provider=self.provider_id,
+            model="m",
+            input_tokens=3,
+            output_tokens=2,
+        )
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return True
+
+
+def _router(
+    tmp_path: Path,
+    *providers: _TimedProvider,
+    hedge: HedgePolicy | None = None,
+    deadline_s: float | None = None,
+) -> tuple[ProviderRouter, UsageLog]:
+    log = UsageLog(tmp_path / "usage.jsonl")
+    router = ProviderRouter(
+        providers={p.provider_id: p for p in providers},
+        routing_config=RoutingConfig(default_provider=providers[0].provider_id),
+        usage_log=log,
+        hedge=hedge,
+        deadline_s=deadline_s,
+    )
+    return router, log
+
+
+def test_router_hedges_slow_call_to_secondary_and_records_both(tmp_path: Path) -> None:
+    primary = _TimedProvider("primary")
+    secondary = _TimedProvider("secondary")
+    policy = HedgePolicy(min_samples=5, window=5, min_delay_s=0.01, secondary_provider="secondary")
+    router, log = _router(tmp_path, primary, secondary, hedge=policy)
+
+    # Warm-up calls establish the primary's latency before any hedge.
+    for _ in range(5):
+        assert router.translate(_SEGMENT, "de-DE").target_text == "primary:Hello"
+    assert secondary.calls == 0
+
+    primary.slow = True
+    result = router.translate(_SEGMENT, "de-DE")
+    assert result.target_text == "secondary:Hello"
+    primary.release.set()
+    deadline = time.monotonic() + 5
+    while log.stats().call_count < 7 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    # 5 warm-up calls, the winning hedge, and the losing primary.
+    assert log.stats().call_count == 7
+
+
+def test_router_deadline_bounds_the_call(tmp_path: Path) -> None:
+    provider = _TimedProvider("slow")
+    provider.slow = True
+    router, _ = _router(tmp_path, provider, deadline_s=0.02)
+    with pytest.raises(ProviderDeadlineExceeded):
+        router.translate(_SEGMENT, "de-DE")
+    provider.release.set()
+
+
+def test_router_rejects_non_positive_deadline(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="deadline_s must be > 0"):
+        _router(tmp_path, _TimedProvider("p"), deadline_s=0)
+
+
+class _AsyncSlowProvider:
+    provider_id: ClassVar[str] = "async-slow"
+
+    def __init__(self) -> None:
+        self.delays = [0.0] * 3 + [5.0, 0.0]
+
+    def translate(
+        self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+    ) -> ProviderResult:
+        raise AssertionError("the async path must be used")
+
+    async def atranslate(
+        self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+    ) -> ProviderResult:
+        await asyncio.sleep(self.delays.pop(0))
+        return ProviderResult(target_text="ok", provider=self.provider_id, model="m")
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return True
+
+
+def test_router_atranslate_hedges_to_same_provider(tmp_path: Path) -> None:
+    provider = _AsyncSlowProvider()
+    log = UsageLog(tmp_path / "usage.jsonl")
+    router = ProviderRouter(
+        providers={provider.provider_id: provider},
+        routing_config=RoutingConfig(default_provider=provider.provider_id),
+        usage_log=log,
+        hedge=HedgePolicy(min_samples=3, window=3, min_delay_s=0.01),
+    )
+
+    async def _run() -> None:
+        for _ in range(4):
+            assert (await router.atranslate(_SEGMENT, "de-DE")).target_text == "ok"
+
+    started = time.monotonic()
+    asyncio.run(_run())
+    # The 5 s call was hedged and cancelled rather than awaited.
+    assert time.monotonic() - started < 2
+    assert provider.delays == []
+    assert log.stats().call_count == 4
@@ -0,0 +1,185 @@
+"""Unit tests for :mod:`ainemo.providers._http`.
+
+Requests go to a throwaway ``http.server`` on localhost, so the pooling
+and metering run over real sockets without touching any provider API.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import httpx
+import pytest
+
+from ainemo.core.segment import Segment
+from ainemo.providers import _http
+from ainemo.providers._http import (
+    CLIENT_KIND_ASYNC,
+    CLIENT_KIND_SYNC,
+    ClientRegistry,
+    HttpTransportOptions,
+    client_registry,
+)
+from ainemo.providers.openai.openai_provider import OpenAIProvider
+
+_COMPLETION: dict[str, Any] = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-2024-11-20",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hallo"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 12, "completion_tokens": 2, "total_tokens": 14},
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connections are reused.
+
+    def do_GET(self) -> None:
+        self._reply({"ok": True})
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self._reply(_COMPLETION)
+
+    def _reply(self, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def registry(monkeypatch: pytest.MonkeyPatch) -> ClientRegistry:
+    """A fresh process-wide registry for the test."""
+    fresh = ClientRegistry()
+    monkeypatch.setattr(_http, "_registry", fresh)
+    return fresh
+
+
+# --- Options --------------------------------------------------------------
+
+
+def test_options_validate_limits() -> None:
+    with pytest.raises(ValueError, match="max_connections must be >= 1"):
+        HttpTransportOptions(max_connections=0)
+    with pytest.raises(ValueError, match="max_keepalive_connections"):
+        HttpTransportOptions(max_connections=4, max_keepalive_connections=8)
+    with pytest.raises(ValueError, match="read_timeout_s must be > 0"):
+        HttpTransportOptions(read_timeout_s=0)
+
+
+def test_timeout_can_leave_reads_unbounded() -> None:
+    registry = ClientRegistry(HttpTransportOptions(connect_timeout_s=2.0, read_timeout_s=9.0))
+    assert registry.timeout(httpx) == httpx.Timeout(connect=2.0, read=9.0, write=9.0, pool=30.0)
+    assert registry.timeout(httpx, bounded_read=False).read is None
+
+
+# --- Sharing --------------------------------------------------------------
+
+
+def test_client_shared_per_provider_endpoint_and_credential(registry: ClientRegistry) -> None:
+    built: list[object] = []
+
+    def _build() -> object:
+        built.append(object())
+        return built[-1]
+
+    first = registry.client("openai", "https://a", "key-1", _build)
+    assert registry.client("openai", "https://a", "key-1", _build) is first
+    assert registry.client("openai", "https://a", "key-2", _build) is not first
+    assert registry.client("openai", "https://b", "key-1", _build) is not first
+    assert len(built) == 3
+    # Only a digest of the credential is kept.
+    assert not any("key-1" in part for key in registry._clients for part in key)
+
+
+def test_transport_shared_per_endpoint(registry: ClientRegistry) -> None:
+    transport = registry.transport("ollama", "http://h", httpx)
+    assert registry.transport("ollama", "http://h", httpx) is transport
+    assert registry.transport("ollama", "http://other", httpx) is not transport
+    assert client_registry() is registry
+
+
+def test_async_clients_shared_per_event_loop(registry: ClientRegistry) -> None:
+    async def _get() -> tuple[object, object]:
+        build = object
+        return (
+            registry.async_client("openai", "https://a", "k", build),
+            registry.async_client("openai", "https://a", "k", build),
+        )
+
+    first_a, first_b = asyncio.run(_get())
+    second_a, _ = asyncio.run(_get())
+    assert first_a is first_b
+    assert second_a is not first_a
+
+
+# --- Metering -------------------------------------------------------------
+
+
+def test_sync_pool_metered_and_connection_reused(registry: ClientRegistry, server_url: str) -> None:
+    client = registry.http_client("ollama", server_url, httpx.Client)
+    for _ in range(3):
+        assert client.get(f"{server_url}/").json() == {"ok": True}
+
+    [stats] = registry.stats()
+    assert (stats.provider, stats.endpoint, stats.kind) == ("ollama", server_url, CLIENT_KIND_SYNC)
+    assert (stats.requests, stats.in_flight, stats.peak_in_flight) == (3, 0, 1)
+    assert stats.open_connections == 1
+    assert stats.utilization == 0.0
+
+
+def test_async_pool_metered(registry: ClientRegistry, server_url: str) -> None:
+    async def _run() -> None:
+        client = registry.async_http_client("ollama", server_url, httpx.AsyncClient)
+        await asyncio.gather(*(client.get(f"{server_url}/") for _ in range(4)))
+
+    asyncio.run(_run())
+    [stats] = registry.stats()
+    assert stats.kind == CLIENT_KIND_ASYNC
+    assert (stats.requests, stats.in_flight) == (4, 0)
+    assert 1 <= stats.peak_in_flight <= 4
+
+
+def test_openai_provider_uses_shared_pool(
+    registry: ClientRegistry, server_url: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("OPENAI_BASE_URL", f"{server_url}/v1")
+    segment = Segment(key="k", source_text="Hello", source_lang="en-US")
+
+    first = OpenAIProvider()
+    second = OpenAIProvider()
+    assert first.translate(segment, "de-DE").target_text == "Hallo"
+    assert second.translate(segment, "de-DE").target_text == "Hallo"
+
+    assert first._get_client() is second._get_client()
+    [stats] = registry.stats()
+    assert (stats.provider, stats.endpoint) == ("openai", f"{server_url}/v1")
+    assert (stats.requests, stats.in_flight, stats.open_connections) == (2, 0, 1)
@@ -189,6 +189,7 @@ def test_persona_round_trip_with_overrides(tb: KuzuTermbase) -> None:
         register="neutral",
         style_guide_url="https://example.invalid/sg",
         glossary_overrides=overrides,
+        do_not_translate=("Acme Cloud",),
     )
     tb.add_persona(persona)
     fetched = tb.get_persona("software-ui")
@@ -212,6 +213,33 @@ def test_persona_round_trip_with_overrides(tb: KuzuTermbase) -> None:
     assert tb.stats().persona_count == 1
 
 
+def test_persona_table_without_do_not_translate_is_migrated(tmp_path: Path) -> None:
+    import kuzu
+
+    path = tmp_path / "termbase.kuzu"
+    db = kuzu.Database(str(path))
+    conn = kuzu.Connection(db)
+    conn.execute(
+        "CREATE NODE TABLE Persona (persona_id STRING, domain_id STRING, name STRING, "
+        "register STRING, forbidden_terms_json STRING, prompt_addendum STRING, "
+        "style_guide_url STRING, glossary_overrides_json STRING, PRIMARY KEY (persona_id))"
+    )
+    conn.execute(
+        "CREATE (:Persona {persona_id: 'old', name: 'Old', forbidden_terms_json: '[]', "
+        "prompt_addendum: ''})"
+    )
+    conn.close()
+    db.close()
+
+    tb = KuzuTermbase(path)
+    try:
+        old = tb.get_persona("old")
+        assert old is not None
+        assert old.do_not_translate == ()
+    finally:
+        tb.close()
+
+
 def test_persona_provider_hints_field_does_not_exist() -> None:
     # Q2 from the pitch (resolved at /bet, 2026-05-05): the proposed
     # `provider_hints` optional field was dropped — persona-aware
@@ -229,6 +257,7 @@ def test_persona_provider_hints_field_does_not_exist() -> None:
         "register",
         "style_guide_url",
         "glossary_overrides",
+        "do_not_translate",
     }
 
 
@@ -0,0 +1,113 @@
+"""Unit tests for :mod:`ainemo.providers._local_model`.
+
+Uses a two-layer ``torch.nn`` module in place of a real seq2seq model —
+the load-time options only care about ``nn.Linear`` layers and dtypes.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+import torch
+
+from ainemo.providers import _local_model
+from ainemo.providers._local_model import (
+    DTYPE_BFLOAT16,
+    LocalModelOptions,
+    apply_thread_settings,
+    prepare_model,
+)
+
+
+def _tiny_model() -> torch.nn.Module:
+    return torch.nn.Sequential(torch.nn.Linear(8, 8), torch.nn.ReLU(), torch.nn.Linear(8, 4))
+
+
+# --- Options --------------------------------------------------------------
+
+
+def test_defaults_change_nothing() -> None:
+    options = LocalModelOptions()
+    assert options.generate_kwargs() == {}
+    model = _tiny_model()
+    prepared = prepare_model(model, options)
+    assert prepared is model
+    assert not prepared.training
+    assert next(prepared.parameters()).dtype == torch.float32
+
+
+def test_num_beams_becomes_generate_kwarg() -> None:
+    assert LocalModelOptions(num_beams=1).generate_kwargs() == {"num_beams": 1}
+    assert LocalModelOptions(num_beams=4).generate_kwargs() == {"num_beams": 4}
+
+
+def test_invalid_options_rejected() -> None:
+    with pytest.raises(ValueError, match="dtype must be one of"):
+        LocalModelOptions(dtype="float16")
+    with pytest.raises(ValueError, match="cannot be combined"):
+        LocalModelOptions(quantize_int8=True, dtype=DTYPE_BFLOAT16)
+    with pytest.raises(ValueError, match="num_beams must be >= 1"):
+        LocalModelOptions(num_beams=0)
+    with pytest.raises(ValueError, match="num_threads must be >= 1"):
+        LocalModelOptions(num_threads=0)
+
+
+# --- Load-time model preparation -----------------------------------------
+
+
+def test_int8_quantizes_linear_layers_and_still_runs() -> None:
+    prepared = prepare_model(_tiny_model(), LocalModelOptions(quantize_int8=True))
+    from torch.ao.nn.quantized.dynamic import Linear as DynamicQuantizedLinear
+
+    layers = [
+        m for m in prepared.modules() if isinstance(m, (torch.nn.Linear, DynamicQuantizedLinear))
+    ]
+    assert len(layers) == 2
+    assert all(isinstance(m, DynamicQuantizedLinear) for m in layers)
+    with torch.inference_mode():
+        assert prepared(torch.ones(2, 8)).shape == (2, 4)
+
+
+def test_bf16_casts_when_supported(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_local_model, "cpu_supports_bf16", lambda: True)
+    prepared = prepare_model(_tiny_model(), LocalModelOptions(dtype=DTYPE_BFLOAT16))
+    assert next(prepared.parameters()).dtype == torch.bfloat16
+
+
+def test_bf16_falls_back_to_fp32_without_cpu_support(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    monkeypatch.setattr(_local_model, "cpu_supports_bf16", lambda: False)
+    with caplog.at_level(logging.WARNING):
+        prepared = prepare_model(_tiny_model(), LocalModelOptions(dtype=DTYPE_BFLOAT16))
+    assert next(prepared.parameters()).dtype == torch.float32
+    assert "no native bfloat16" in caplog.text
+
+
+# --- Thread settings ------------------------------------------------------
+
+
+def test_thread_settings_apply_intra_op_threads(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str, int]] = []
+    monkeypatch.setattr(torch, "set_num_threads", lambda n: calls.append(("intra", n)))
+    monkeypatch.setattr(torch, "set_num_interop_threads", lambda n: calls.append(("inter", n)))
+    monkeypatch.setattr(_local_model, "_interop_threads_applied", None)
+
+    apply_thread_settings(LocalModelOptions(num_threads=3, num_interop_threads=2))
+    apply_thread_settings(LocalModelOptions(num_interop_threads=2))  # Already applied.
+
+    assert calls == [("intra", 3), ("inter", 2)]
+
+
+def test_interop_threads_already_fixed_is_logged_not_raised(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    def _refuse(_n: int) -> None:
+        raise RuntimeError("Error: cannot set number of interop threads")
+
+    monkeypatch.setattr(torch, "set_num_interop_threads", _refuse)
+    monkeypatch.setattr(_local_model, "_interop_threads_applied", None)
+    with caplog.at_level(logging.WARNING):
+        apply_thread_settings(LocalModelOptions(num_interop_threads=4))
+    assert "already fixed" in caplog.text
@@ -0,0 +1,203 @@
+"""Unit tests for :class:`ainemo.providers.opus._client.MarianModelCache`.
+
+``_load`` is replaced with a factory of small ``torch.nn.Linear``
+models, so the LRU / byte accounting runs against real tensors without
+downloading any Helsinki-NLP checkpoint.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+import torch
+
+from ainemo.providers._local_model import LocalModelOptions
+from ainemo.providers.opus._client import MarianModelCache, model_bytes
+from ainemo.providers.opus._languages import to_opus_config
+
+# 16x16 fp32 weight + 16 bias = 1088 bytes per fake model.
+_MODEL_BYTES = (16 * 16 + 16) * 4
+
+
+class _FakeLoadCache(MarianModelCache):
+    def __init__(self, options: LocalModelOptions | None = None) -> None:
+        super().__init__(options=options)
+        self.loaded: list[str] = []
+
+    def _load(self, hf_model_name: str) -> tuple[Any, Any]:
+        self.loaded.append(hf_model_name)
+        return f"tok:{hf_model_name}", torch.nn.Linear(16, 16)
+
+
+def _repo(lang: str) -> str:
+    config = to_opus_config(lang)
+    assert config is not None
+    return config.hf_model_name
+
+
+# --- Defaults -------------------------------------------------------------
+
+
+def test_unbounded_by_default_and_loads_once() -> None:
+    cache = _FakeLoadCache()
+    first = cache.get("a")
+    for name in ("b", "c", "a", "b"):
+        cache.get(name)
+    assert cache.get("a")[1] is first[1]
+    assert cache.loaded == ["a", "b", "c"]
+    stats = cache.stats()
+    assert (stats.loads, stats.hits, stats.evictions, stats.models) == (3, 3, 0, 3)
+    assert stats.bytes == 3 * _MODEL_BYTES
+
+
+def test_model_bytes_counts_tied_weights_once() -> None:
+    linear = torch.nn.Linear(16, 16)
+    tied = torch.nn.Sequential(linear, linear)
+    assert model_bytes(linear) == _MODEL_BYTES
+    assert model_bytes(tied) == _MODEL_BYTES
+    assert model_bytes("__stub_model__") == 0
+
+
+# --- Caps -----------------------------------------------------------------
+
+
+def test_max_models_evicts_least_recently_used() -> None:
+    cache = _FakeLoadCache(LocalModelOptions(max_models=2))
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")  # "b" is now least recently used.
+    cache.get("c")
+    assert cache.stats().models == 2
+    cache.get("a")
+    cache.get("b")  # Evicted; reloads (and evicts "c").
+    assert cache.loaded == ["a", "b", "c", "b"]
+    assert cache.stats().evictions == 2
+
+
+def test_max_bytes_evicts_until_under_budget() -> None:
+    cache = _FakeLoadCache(LocalModelOptions(max_model_bytes=2 * _MODEL_BYTES))
+    for name in ("a", "b", "c"):
+        cache.get(name)
+    stats = cache.stats()
+    assert stats.models == 2
+    assert stats.bytes == 2 * _MODEL_BYTES
+    assert stats.evictions == 1
+
+
+def test_pinned_target_langs_survive_eviction() -> None:
+    de = _repo("de-DE")
+    cache = _FakeLoadCache(LocalModelOptions(max_models=1, pinned_target_langs=("de-DE",)))
+    cache.get(de)
+    cache.get("other-1")
+    cache.get("other-2")
+    cache.get(de)
+    assert cache.loaded.count(de) == 1
+    assert cache.stats().pinned == (de,)
+
+
+def test_all_pinned_over_cap_warns_instead_of_thrashing(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    cache = _FakeLoadCache(LocalModelOptions(max_models=1))
+    cache.pin("a")
+    cache.get("a")
+    with caplog.at_level(logging.WARNING):
+        cache.get("b")
+    assert cache.stats().models == 2
+    assert "pinned" in caplog.text
+    cache.unpin("a")
+    cache.get("c")  # Back under the cap: both "a" and "b" go.
+    assert cache.stats().models == 1
+
+
+def test_unknown_pinned_language_rejected() -> None:
+    with pytest.raises(ValueError, match="Cannot pin 'xx-XX'"):
+        MarianModelCache(options=LocalModelOptions(pinned_target_langs=("xx-XX",)))
+
+
+# --- Release --------------------------------------------------------------
+
+
+def test_release_keeps_pinned_unless_asked() -> None:
+    cache = _FakeLoadCache()
+    cache.pin("a")
+    for name in ("a", "b", "c"):
+        cache.get(name)
+    assert cache.release() == 2
+    assert cache.stats().models == 1
+    assert cache.stats().bytes == _MODEL_BYTES
+    assert cache.release(include_pinned=True) == 1
+    stats = cache.stats()
+    assert (stats.models, stats.bytes, stats.releases) == (0, 0, 3)
+    cache.get("b")
+    assert cache.loaded == ["a", "b", "c", "b"]
+
+
+# --- Concurrency ----------------------------------------------------------
+
+
+class _BlockingLoadCache(_FakeLoadCache):
+    """Blocks loads of ``"slow"`` until ``release_slow`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.slow_started = threading.Event()
+        self.release_slow = threading.Event()
+
+    def _load(self, hf_model_name: str) -> tuple[Any, Any]:
+        if hf_model_name == "slow":
+            self.slow_started.set()
+            assert self.release_slow.wait(timeout=5)
+        return super()._load(hf_model_name)
+
+
+def test_cold_load_does_not_block_hits_on_other_models() -> None:
+    cache = _BlockingLoadCache()
+    cache.get("warm")
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        slow = pool.submit(cache.get, "slow")
+        assert cache.slow_started.wait(timeout=5)
+        assert cache.get("warm")[0] == "tok:warm"
+        assert cache.get("other")[0] == "tok:other"
+        cache.release_slow.set()
+        assert slow.result(timeout=5)[0] == "tok:slow"
+
+
+def test_concurrent_gets_of_one_model_load_it_once() -> None:
+    cache = _BlockingLoadCache()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(cache.get, "slow") for _ in range(4)]
+        assert cache.slow_started.wait(timeout=5)
+        cache.release_slow.set()
+        models = {id(f.result(timeout=5)[1]) for f in futures}
+    assert len(models) == 1
+    assert cache.loaded == ["slow"]
+    stats = cache.stats()
+    assert (stats.loads, stats.hits) == (1, 3)
+
+
+def test_failed_load_reaches_waiters_and_is_retried() -> None:
+    class _FailingCache(_BlockingLoadCache):
+        fail = True
+
+        def _load(self, hf_model_name: str) -> tuple[Any, Any]:
+            result = super()._load(hf_model_name)
+            if self.fail:
+                raise OSError("download failed")
+            return result
+
+    cache = _FailingCache()
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(cache.get, "slow") for _ in range(2)]
+        assert cache.slow_started.wait(timeout=5)
+        cache.release_slow.set()
+        for future in futures:
+            with pytest.raises(OSError, match="download failed"):
+                future.result(timeout=5)
+    cache.fail = False
+    assert cache.get("slow")[0] == "tok:slow"
+    assert cache.stats().models == 1
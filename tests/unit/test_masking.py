@@ -0,0 +1,180 @@
+"""Unit tests for :mod:`ainemo.core.masking` and the pipeline's
+``mask_placeholders`` mode."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Sequence
+
+from ainemo.core.adapters.java_properties import JavaPropertiesAdapter
+from ainemo.core.icu import parse_placeholders
+from ainemo.core.masking import mask_segment
+from ainemo.core.pipeline import TranslationPipeline
+from ainemo.core.segment import Segment
+from ainemo.core.tm.sqlite import SqliteTranslationMemory
+from ainemo.providers.base import ProviderResult
+
+_PLURAL = "{count, plural, one {# file in {folder_name}} other {# files in {folder_name}}}"
+
+
+def _segment(text: str, key: str = "k") -> Segment:
+    return Segment(
+        key=key, source_text=text, source_lang="en", placeholders=parse_placeholders(text)
+    )
+
+
+def _result(text: str, *, tokens: int = 10) -> ProviderResult:
+    return ProviderResult(
+        target_text=text, provider="llm", model="llm-1", input_tokens=tokens, cost_usd=0.5
+    )
+
+
+def _german(text: str) -> str:
+    return text.replace("files", "Dateien").replace("file", "Datei")
+
+
+class _BatchProvider:
+    """Translates with ``translate_text``, recording every request."""
+
+    provider_id = "llm"
+
+    def __init__(self, translate_text: Callable[[str], str] = _german) -> None:
+        self._translate_text = translate_text
+        self.batches: list[list[str]] = []
+
+    def translate(self, segment: Segment, target_lang: str) -> ProviderResult:
+        self.batches.append([segment.source_text])
+        return _result(self._translate_text(segment.source_text))
+
+    def translate_batch(
+        self, segments: Sequence[Segment], target_lang: str
+    ) -> list[ProviderResult]:
+        self.batches.append([segment.source_text for segment in segments])
+        return [_result(self._translate_text(segment.source_text)) for segment in segments]
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return True
+
+
+def test_mask_segment_splits_icu_branches() -> None:
+    masked = mask_segment(_segment(_PLURAL))
+    assert masked is not None
+    assert [part.source_text for part in masked.parts] == ["# file in {0}", "# files in {0}"]
+    restored = masked.restore([_result("# Datei in {0}"), _result("# Dateien in {0}")])
+    assert restored is not None
+    assert restored.target_text == (
+        "{count, plural, one {# Datei in {folder_name}} other {# Dateien in {folder_name}}}"
+    )
+    assert (restored.input_tokens, restored.cost_usd) == (20, 1.0)
+
+
+def test_mask_segment_handles_nesting_and_skips_untranslatable_text() -> None:
+    text = (
+        "{gender, select, female {{n, plural, one {She has # message} other {She has # "
+        "messages}}} other {{n, plural, one {They have # message} other {They have # "
+        "messages}}}}"
+    )
+    masked = mask_segment(_segment(text))
+    assert masked is not None
+    # The select branches hold only a token each: not sent.
+    assert [part.source_text for part in masked.parts] == [
+        "She has # message",
+        "She has # messages",
+        "They have # message",
+        "They have # messages",
+    ]
+    restored = masked.restore([_result(part.source_text.upper()) for part in masked.parts])
+    assert restored is not None
+    assert restored.target_text == (
+        "{gender, select, female {{n, plural, one {SHE HAS # MESSAGE} other {SHE HAS # "
+        "MESSAGES}}} other {{n, plural, one {THEY HAVE # MESSAGE} other {THEY HAVE # "
+        "MESSAGES}}}}"
+    )
+
+
+def test_mask_segment_leaves_segments_that_would_not_shrink() -> None:
+    assert mask_segment(_segment("Plain text")) is None
+    assert mask_segment(_segment("Hello {0}")) is None
+    assert mask_segment(_segment("{a}{b}")) is None  # nothing to translate
+    masked = mask_segment(_segment("Hello {user_display_name}, welcome"))
+    assert masked is not None
+    assert [part.source_text for part in masked.parts] == ["Hello {0}, welcome"]
+
+
+def test_restore_rejects_parts_failing_parity() -> None:
+    masked = mask_segment(_segment(_PLURAL))
+    assert masked is not None
+    assert masked.restore([_result("# Datei"), _result("# Dateien in {0}")]) is None
+    assert masked.restore([_result("# Datei in {0} {1}"), _result("# Dateien in {0}")]) is None
+
+
+def _pipeline(
+    tmp_path: Path, provider: _BatchProvider, source: str
+) -> tuple[TranslationPipeline, Path]:
+    src = tmp_path / "messages_en.properties"
+    src.write_text(source, encoding="utf-8")
+    pipeline = TranslationPipeline(
+        adapter=JavaPropertiesAdapter(),
+        tm=SqliteTranslationMemory(tmp_path / "tm.sqlite"),
+        provider=provider,
+        validators=[],
+        target_langs=("de",),
+        source_lang="en",
+        mask_placeholders=True,
+    )
+    return pipeline, src
+
+
+def test_pipeline_batches_sub_segments_and_restores(tmp_path: Path) -> None:
+    provider = _BatchProvider()
+    pipeline, src = _pipeline(tmp_path, provider, f"files={_PLURAL}\ntitle=Files\n")
+    result = pipeline.translate_file(src, tmp_path / "out")
+    assert provider.batches == [["# file in {0}", "# files in {0}", "Files"]]
+    assert result.masked_count == 1
+    translated = {o.segment_key: o.translated for o in result.outcomes}
+    files = translated["files"]
+    assert files is not None
+    assert files.target_text == (
+        "{count, plural, one {# Datei in {folder_name}} other {# Dateien in {folder_name}}}"
+    )
+
+
+def test_pipeline_retries_unmasked_when_parity_fails(tmp_path: Path) -> None:
+    provider = _BatchProvider(lambda text: text.replace("{0}", "").replace("file", "Datei"))
+    pipeline, src = _pipeline(tmp_path, provider, f"files={_PLURAL}\n")
+    result = pipeline.translate_file(src, tmp_path / "out")
+    assert provider.batches == [["# file in {0}", "# files in {0}"], [_PLURAL]]
+    assert result.masked_count == 0
+    assert result.provider_call_count == 1
+
+
+def test_pipeline_masks_single_part_segments_one_at_a_time(tmp_path: Path) -> None:
+    class _Provider:
+        provider_id = "llm"
+
+        def __init__(self) -> None:
+            self.sources: list[str] = []
+
+        def translate(self, segment: Segment, target_lang: str) -> ProviderResult:
+            self.sources.append(segment.source_text)
+            return _result(segment.source_text.replace("Hello", "Hallo"))
+
+        def supports(self, source_lang: str, target_lang: str) -> bool:
+            return True
+
+    provider = _Provider()
+    src = tmp_path / "messages_en.properties"
+    src.write_text(f"greet=Hello {{user_display_name}}, welcome\nfiles={_PLURAL}\n")
+    pipeline = TranslationPipeline(
+        adapter=JavaPropertiesAdapter(),
+        tm=SqliteTranslationMemory(tmp_path / "tm.sqlite"),
+        provider=provider,
+        validators=[],
+        target_langs=("de",),
+        source_lang="en",
+        mask_placeholders=True,
+    )
+    result = pipeline.translate_file(src, tmp_path / "out")
+    # Two sub-segments would cost two calls: the plural goes out whole.
+    assert provider.sources == ["Hello {0}, welcome", _PLURAL]
+    assert result.masked_count == 1
@@ -0,0 +1,258 @@
+"""Unit tests for :class:`ainemo.core.tm.memory.InMemoryTranslationMemory`.
+
+The lookup / store / iterate / usage contract runs against both
+backends in ``test_sqlite_tm.py`` (the ``make_tm`` fixture). This file
+covers what only the in-memory backend has: thread-safety of its
+structures and snapshot load / save.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pytest
+
+from ainemo.core.segment import (
+    TRANSLATION_SOURCE_PROVIDER,
+    Placeholder,
+    Segment,
+    TranslatedSegment,
+)
+from ainemo.core.tm import memory as memory_module
+from ainemo.core.tm.base import TM_MATCH_TYPE_FUZZY
+from ainemo.core.tm.memory import InMemoryTranslationMemory
+from ainemo.core.tm.sqlite import SqliteTranslationMemory
+
+_LANG_EN_US = "en-US"
+_LANG_DE = "de-DE"
+_PROVIDER_TEST = "test"
+
+
+def _seg(
+    *,
+    key: str = "k",
+    source_text: str = "Hello",
+    source_lang: str = _LANG_EN_US,
+    placeholders: tuple[Placeholder, ...] = (),
+) -> Segment:
+    return Segment(
+        key=key, source_text=source_text, source_lang=source_lang, placeholders=placeholders
+    )
+
+
+def _ts(
+    seg: Segment,
+    target_text: str = "Hallo",
+    *,
+    target_lang: str = _LANG_DE,
+    provider: str = _PROVIDER_TEST,
+    model: str = "",
+) -> TranslatedSegment:
+    return TranslatedSegment(
+        segment=seg,
+        target_lang=target_lang,
+        target_text=target_text,
+        provider=provider,
+        model=model,
+        confidence=0.92,
+        source=TRANSLATION_SOURCE_PROVIDER,
+    )
+
+
+def _stub_embedder(text: str) -> np.ndarray:
+    """Deterministic mean-zero Gaussian per text (see test_sqlite_tm)."""
+    digest = hashlib.sha256(text.encode("utf-8")).digest()
+    rng = np.random.default_rng(seed=int.from_bytes(digest[:8], "big"))
+    return rng.standard_normal(16, dtype=np.float32)
+
+
+def _identical_embedder(text: str) -> np.ndarray:
+    return np.ones(16, dtype=np.float32)
+
+
+# --- In-memory specifics ---------------------------------------------------
+
+
+def test_memory_iter_translations_tolerates_concurrent_store() -> None:
+    tm = InMemoryTranslationMemory()
+    for i in range(3):
+        tm.store(_ts(_seg(source_text=f"s{i}")))
+
+    seen = []
+    for row in tm.iter_translations(source_lang=_LANG_EN_US, target_lang=_LANG_DE):
+        seen.append(row.target_text)
+        tm.store(_ts(_seg(source_text=f"new-{row.segment.source_text}")))
+    assert len(seen) == 3
+
+
+def test_memory_concurrent_stores_are_all_kept() -> None:
+    tm = InMemoryTranslationMemory(_stub_embedder)
+
+    def _worker(offset: int) -> None:
+        for i in range(50):
+            tm.store(_ts(_seg(source_text=f"t{offset}-{i}")))
+
+    threads = [threading.Thread(target=_worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10.0)
+
+    stats = tm.stats()
+    assert stats.translation_count == 200
+    assert stats.embedding_count == 200
+
+
+def test_snapshot_round_trips_through_sqlite(tmp_path: Path) -> None:
+    path = tmp_path / "tm.sqlite"
+    tm = InMemoryTranslationMemory(_stub_embedder, snapshot_path=path)
+    tm.store(_ts(_seg(source_text="Hello"), "Hallo"))
+    tm.store(_ts(_seg(source_text="Bye"), "Tschüss", provider="other", model="m"))
+    tm.lookup(_seg(source_text="Hello"), _LANG_DE)
+    tm.close()
+
+    sqlite_tm = SqliteTranslationMemory(path, embedder=_stub_embedder)
+    [usage] = sqlite_tm.iter_top_translations(per_target_lang=1)
+    assert (usage.translated.target_text, usage.hit_count) == ("Hallo", 1)
+    hit = sqlite_tm.lookup(_seg(source_text="Bye"), _LANG_DE, provider="other", model="m")
+    assert hit is not None and hit.translated.target_text == "Tschüss"
+    assert sqlite_tm.stats().embedding_count == 2
+    sqlite_tm.close()
+
+
+def test_load_keeps_counters_and_embeddings_without_reembedding(tmp_path: Path) -> None:
+    path = tmp_path / "tm.sqlite"
+    seed = SqliteTranslationMemory(path, embedder=_identical_embedder)
+    seed.store(_ts(_seg(source_text="Hello world"), "Hallo Welt"))
+    seed.lookup(_seg(source_text="Hello world"), _LANG_DE)
+    seed.close()
+
+    calls: list[str] = []
+
+    def _counting_embedder(text: str) -> np.ndarray:
+        calls.append(text)
+        return _identical_embedder(text)
+
+    tm = InMemoryTranslationMemory(_counting_embedder, snapshot_path=path)
+    assert calls == []
+    assert tm.stats().embedding_count == 1
+    [usage] = tm.iter_top_translations(per_target_lang=1)
+    assert usage.hit_count == 1
+
+    hit = tm.lookup(_seg(source_text="Greetings"), _LANG_DE)
+    assert hit is not None and hit.match_type == TM_MATCH_TYPE_FUZZY
+    assert calls == ["Greetings"]
+
+
+def test_snapshot_is_skipped_when_clean(tmp_path: Path) -> None:
+    path = tmp_path / "tm.sqlite"
+    InMemoryTranslationMemory(snapshot_path=path).close()
+    assert not path.exists()
+
+
+def _wait_for_interval_snapshot(tm: InMemoryTranslationMemory) -> None:
+    thread = tm._snapshot_thread
+    assert thread is not None
+    thread.join(timeout=10)
+
+
+def test_periodic_snapshot_after_interval(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(memory_module.time, "monotonic", lambda: now[0])
+    path = tmp_path / "tm.sqlite"
+    tm = InMemoryTranslationMemory(snapshot_path=path, snapshot_interval_seconds=60.0)
+
+    tm.store(_ts(_seg(source_text="one")))
+    assert not path.exists()
+    now[0] += 61.0
+    tm.store(_ts(_seg(source_text="two")))
+    _wait_for_interval_snapshot(tm)
+    assert path.exists()
+    assert not path.with_name(path.name + ".tmp").exists()
+
+    reader = SqliteTranslationMemory(path)
+    assert reader.stats().translation_count == 2
+    reader.close()
+
+
+def test_failed_snapshot_keeps_changes_pending(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "tm.sqlite"
+    tm = InMemoryTranslationMemory(snapshot_path=path)
+    tm.store(_ts(_seg(source_text="one")))
+    real_insert_rows = SqliteTranslationMemory.insert_rows
+
+    def _disk_full(self: SqliteTranslationMemory, rows: object) -> int:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(SqliteTranslationMemory, "insert_rows", _disk_full)
+    with pytest.raises(OSError, match="disk full"):
+        tm.snapshot()
+    assert not path.exists()
+    assert not path.with_name(path.name + ".tmp").exists()
+
+    monkeypatch.setattr(SqliteTranslationMemory, "insert_rows", real_insert_rows)
+    tm.close()
+    reader = SqliteTranslationMemory(path)
+    assert reader.stats().translation_count == 1
+    reader.close()
+
+
+def test_interval_snapshot_runs_off_the_calling_thread(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = [100.0]
+    monkeypatch.setattr(memory_module.time, "monotonic", lambda: now[0])
+    path = tmp_path / "tm.sqlite"
+    tm = InMemoryTranslationMemory(snapshot_path=path, snapshot_interval_seconds=60.0)
+    real_insert_rows = SqliteTranslationMemory.insert_rows
+    release = threading.Event()
+
+    def _slow_insert_rows(self: SqliteTranslationMemory, rows: Any) -> int:
+        assert release.wait(timeout=10)
+        return real_insert_rows(self, rows)
+
+    monkeypatch.setattr(SqliteTranslationMemory, "insert_rows", _slow_insert_rows)
+    tm.store(_ts(_seg(source_text="one")))
+    now[0] += 61.0
+    tm.store(_ts(_seg(source_text="two")))  # Returns while the snapshot is blocked.
+    assert tm.lookup(_seg(source_text="one"), _LANG_DE) is not None
+    release.set()
+    tm.close()
+    reader = SqliteTranslationMemory(path)
+    assert reader.stats().translation_count == 2
+    reader.close()
+
+
+def test_failed_interval_snapshot_does_not_fail_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    now = [100.0]
+    monkeypatch.setattr(memory_module.time, "monotonic", lambda: now[0])
+    path = tmp_path / "tm.sqlite"
+    tm = InMemoryTranslationMemory(snapshot_path=path, snapshot_interval_seconds=60.0)
+    real_insert_rows = SqliteTranslationMemory.insert_rows
+
+    def _disk_full(self: SqliteTranslationMemory, rows: object) -> int:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(SqliteTranslationMemory, "insert_rows", _disk_full)
+    tm.store(_ts(_seg(source_text="one")))
+    now[0] += 61.0
+    with caplog.at_level(logging.WARNING):
+        tm.store(_ts(_seg(source_text="two")))
+        _wait_for_interval_snapshot(tm)
+    assert "disk full" in caplog.text
+    assert not path.exists()
+
+    monkeypatch.setattr(SqliteTranslationMemory, "insert_rows", real_insert_rows)
+    tm.close()
+    reader = SqliteTranslationMemory(path)
+    assert reader.stats().translation_count == 2
+    reader.close()
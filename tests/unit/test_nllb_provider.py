@@ -8,13 +8,15 @@ pipeline; that lives outside the cycle-2 unit suite.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
 import pytest
 
 from ainemo.core.segment import Segment
 from ainemo.providers._ids import PROVIDER_ID_NLLB
-from ainemo.providers.base import Provider, ProviderResult
+from ainemo.providers._local_model import LocalModelOptions
+from ainemo.providers._seq2seq import Seq2SeqEngine
+from ainemo.providers.base import BatchProvider, Provider, ProviderResult, ReleasableProvider
 from ainemo.providers.nllb._client import DEFAULT_MODEL, NllbModelHolder
 from ainemo.providers.nllb._languages import (
     supported_bcp47_tags,
@@ -191,3 +193,87 @@ def test_supported_bcp47_tags_returns_sorted() -> None:
     assert "en" in tags
     assert "de" in tags
     assert "zh-cn" in tags
+
+
+# --- translate_batch ------------------------------------------------------
+
+
+class _RecordingEngine(Seq2SeqEngine):
+    """Engine whose ``translate_batch`` echoes with the codes instead of
+    running ``generate``, recording each call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[dict[str, Any]] = []
+
+    def translate_batch(self, texts: Sequence[str], **kwargs: Any) -> list[str]:
+        self.calls.append({"texts": list(texts), **kwargs})
+        return [f"[{kwargs['src_code']}>{kwargs['tgt_code']}] {t}" for t in texts]
+
+
+def test_satisfies_batch_provider_protocol() -> None:
+    assert isinstance(NllbProvider(model_holder=_StubHolder()), BatchProvider)
+
+
+def test_translate_batch_groups_by_source_language_and_keeps_order() -> None:
+    engine = _RecordingEngine()
+    p = NllbProvider(model_holder=_StubHolder(), engine=engine)
+    results = p.translate_batch(
+        [_seg("One"), _seg("Zwei", source_lang="de"), _seg("Three")],
+        "fr-FR",
+    )
+
+    assert [r.target_text for r in results] == [
+        "[eng_Latn>fra_Latn] One",
+        "[deu_Latn>fra_Latn] Zwei",
+        "[eng_Latn>fra_Latn] Three",
+    ]
+    assert [c["texts"] for c in engine.calls] == [["One", "Three"], ["Zwei"]]
+    assert all(c["tokenizer"] == "__stub_tokenizer__" for c in engine.calls)
+    assert all(c["max_length"] == DEFAULT_MAX_LENGTH for c in engine.calls)
+    assert {r.provider for r in results} == {PROVIDER_ID_NLLB}
+    assert all(r.cost_usd is None and r.latency_ms >= 0 for r in results)
+
+
+def test_translate_batch_empty_returns_empty() -> None:
+    engine = _RecordingEngine()
+    assert NllbProvider(model_holder=_StubHolder(), engine=engine).translate_batch([], "de") == []
+    assert engine.calls == []
+
+
+def test_translate_batch_unsupported_pair_raises() -> None:
+    p = NllbProvider(model_holder=_StubHolder(), engine=_RecordingEngine())
+    with pytest.raises(ValueError, match="does not support"):
+        p.translate_batch([_seg(), _seg(source_lang="zz-ZZ")], "de-DE")
+
+
+def test_translate_passes_shared_engine(stub_pipeline: dict[str, Any]) -> None:
+    engine = _RecordingEngine()
+    NllbProvider(model="m", model_holder=_StubHolder(), engine=engine).translate(_seg(), "de")
+    call = stub_pipeline["calls"][0]
+    assert call["engine"] is engine
+    assert call["model_key"] == "m"
+
+
+def test_num_beams_option_reaches_every_generate_path(stub_pipeline: dict[str, Any]) -> None:
+    engine = _RecordingEngine()
+    p = NllbProvider(
+        model_holder=_StubHolder(), engine=engine, options=LocalModelOptions(num_beams=1)
+    )
+    p.translate(_seg(), "de")
+    p.translate_batch([_seg()], "de")
+    assert stub_pipeline["calls"][0]["generate_kwargs"] == {"num_beams": 1}
+    assert engine.calls[0]["generate_kwargs"] == {"num_beams": 1}
+
+
+def test_holder_receives_load_time_options() -> None:
+    options = LocalModelOptions(quantize_int8=True)
+    p = NllbProvider(options=options)
+    assert p._holder._options is options
+
+
+def test_release_models_unloads_the_held_model() -> None:
+    p = NllbProvider(model_holder=_StubHolder())
+    assert isinstance(p, ReleasableProvider)
+    assert p.release_models() == 1
+    assert p.release_models() == 0  # Nothing loaded any more.
@@ -266,3 +266,34 @@ def test_module_import_does_not_require_running_daemon(
     monkeypatch.delenv(ENV_VAR_HOST, raising=False)
     sys.modules.pop("ainemo.providers.ollama.ollama_provider", None)
     importlib.import_module("ainemo.providers.ollama.ollama_provider")
+
+
+# --- Async path -------------------------------------------------------------
+
+
+@dataclass
+class _FakeAsyncOllamaClient:
+    response: _FakeChatResponse
+    calls: list[dict[str, Any]] = field(default_factory=list)
+
+    async def chat(self, **kwargs: Any) -> _FakeChatResponse:
+        self.calls.append(kwargs)
+        return self.response
+
+
+def test_atranslate_sends_same_request_as_translate() -> None:
+    import asyncio
+
+    from ainemo.providers.base import AsyncProvider
+
+    sync_client = _FakeOllamaClient.with_response("Hallo")
+    async_client = _FakeAsyncOllamaClient(response=sync_client.response)
+    provider = OllamaProvider(client=sync_client, async_client=async_client)
+    assert isinstance(provider, AsyncProvider)
+
+    sync_result = provider.translate(_seg(), "de-DE")
+    async_result = asyncio.run(provider.atranslate(_seg(), "de-DE"))
+
+    assert async_client.calls == sync_client.calls
+    assert async_result.target_text == sync_result.target_text == "Hallo"
+    assert async_result.input_tokens == 80
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -9,7 +10,14 @@ import pytest
 
 from ainemo.core.segment import Segment
 from ainemo.providers._ids import PROVIDER_ID_OPENAI
-from ainemo.providers.base import Provider, ProviderResult
+from ainemo.providers.base import (
+    PackingProvider,
+    Provider,
+    ProviderResult,
+    WarmableProvider,
+    uses_batch_path,
+    uses_multi_target_path,
+)
 from ainemo.providers.openai._client import ENV_VAR_API_KEY, MissingOpenAiApiKey
 from ainemo.providers.openai.openai_provider import (
     DEFAULT_MAX_TOKENS,
@@ -20,10 +28,16 @@ from ainemo.providers.openai.openai_provider import (
 # --- Fake SDK client ------------------------------------------------------
 
 
+@dataclass
+class _FakePromptDetails:
+    cached_tokens: int
+
+
 @dataclass
 class _FakeUsage:
     prompt_tokens: int
     completion_tokens: int
+    prompt_tokens_details: _FakePromptDetails | None = None
 
 
 @dataclass
@@ -68,9 +82,15 @@ class _FakeClient:
         prompt_tokens: int = 100,
         completion_tokens: int = 50,
         usage: bool = True,
+        cached_tokens: int | None = None,
     ) -> "_FakeClient":
+        details = _FakePromptDetails(cached_tokens) if cached_tokens is not None else None
         usage_obj = (
-            _FakeUsage(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+            _FakeUsage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                prompt_tokens_details=details,
+            )
             if usage
             else None
         )
@@ -265,6 +285,38 @@ def test_translate_no_usage_field_returns_no_cost() -> None:
     assert result.cost_usd is None
 
 
+# --- Prompt caching -------------------------------------------------------
+
+
+def test_translate_keeps_static_prompt_prefix_across_segments() -> None:
+    client = _FakeClient.with_response("x")
+    provider = OpenAIProvider(client=client)
+    provider.translate(_seg("Save"), "de-DE", system_prompt_addendum="Persona: terse.")
+    provider.translate(_seg("Cancel"), "de-DE", system_prompt_addendum="Persona: terse.")
+    first, second = (call["messages"] for call in client.calls)
+    assert first[0] == second[0]
+    assert "Save" in first[-1]["content"]
+
+
+def test_cached_prompt_tokens_recorded_and_priced_at_cached_rate() -> None:
+    client = _FakeClient.with_response(
+        "x", prompt_tokens=1200, completion_tokens=10, cached_tokens=1024
+    )
+    result = OpenAIProvider(client=client).translate(_seg(), "de-DE")
+    assert result.input_tokens == 1200
+    assert result.cache_read_tokens == 1024
+    assert result.cache_write_tokens is None
+    # gpt-4o-2024-11-20: $2.50/M uncached, $1.25/M cached, $10.00/M output
+    expected_cost = (176 * 2.50 + 1024 * 1.25 + 10 * 10.00) / 1_000_000
+    assert result.cost_usd is not None
+    assert abs(result.cost_usd - expected_cost) < 1e-12
+
+
+def test_no_prompt_details_leaves_cache_counts_unset() -> None:
+    result = OpenAIProvider(client=_FakeClient.with_response("x")).translate(_seg(), "de-DE")
+    assert result.cache_read_tokens is None
+
+
 # --- supports() -----------------------------------------------------------
 
 
@@ -321,3 +373,141 @@ def test_translate_raises_on_none_content() -> None:
     client = _FakeClient(chat=_FakeChat(completions=_FakeCompletions(response=response)))
     with pytest.raises(RuntimeError, match="no content"):
         OpenAIProvider(client=client).translate(_seg(), "de-DE")
+
+
+# --- Async path -------------------------------------------------------------
+
+
+@dataclass
+class _FakeAsyncCompletions:
+    response: _FakeResponse
+    calls: list[dict[str, Any]] = field(default_factory=list)
+
+    async def create(self, **kwargs: Any) -> _FakeResponse:
+        self.calls.append(kwargs)
+        return self.response
+
+
+@dataclass
+class _FakeAsyncChat:
+    completions: _FakeAsyncCompletions
+
+
+@dataclass
+class _FakeAsyncClient:
+    chat: _FakeAsyncChat
+
+
+def test_atranslate_sends_same_request_as_translate() -> None:
+    import asyncio
+
+    from ainemo.providers.base import AsyncProvider
+
+    sync_client = _FakeClient.with_response("Hallo")
+    async_client = _FakeAsyncClient(
+        chat=_FakeAsyncChat(
+            completions=_FakeAsyncCompletions(sync_client.chat.completions.response)
+        )
+    )
+    provider = OpenAIProvider(client=sync_client, async_client=async_client)
+    assert isinstance(provider, AsyncProvider)
+
+    sync_result = provider.translate(_seg(), "de-DE", system_prompt_addendum="Formal.")
+    async_result = asyncio.run(
+        provider.atranslate(_seg(), "de-DE", system_prompt_addendum="Formal.")
+    )
+
+    assert async_client.chat.completions.calls == sync_client.calls
+    assert async_result.target_text == sync_result.target_text == "Hallo"
+    assert async_result.cost_usd == sync_result.cost_usd
+
+
+def test_warm_up_builds_client_without_a_request(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Daemon warm-up surfaces a missing key before the first translate
+    and never sends a request."""
+    monkeypatch.delenv(ENV_VAR_API_KEY, raising=False)
+    with pytest.raises(MissingOpenAiApiKey):
+        OpenAIProvider().warm_up([("en-US", "de-DE")])
+    client = _FakeClient.with_response("Hallo")
+    p = OpenAIProvider(client=client)
+    assert isinstance(p, WarmableProvider)
+    p.warm_up([("en-US", "de-DE")])
+    assert client.calls == []
+
+
+# --- Packed batches ---------------------------------------------------------
+
+
+def test_translate_batch_packs_segments_into_one_request() -> None:
+    reply = json.dumps([{"id": "0", "text": "Speichern"}, {"id": "1", "text": "Abbrechen"}])
+    client = _FakeClient.with_response(reply, prompt_tokens=200, completion_tokens=10)
+    provider = OpenAIProvider(client=client, pack_size=2)
+    assert isinstance(provider, PackingProvider)
+    assert uses_batch_path(provider)
+
+    results = provider.translate_batch(
+        [_seg("Save"), _seg("Cancel")], "de-DE", system_prompt_addendum="Formal."
+    )
+
+    assert [r.target_text for r in results] == ["Speichern", "Abbrechen"]
+    assert len(client.calls) == 1
+    messages = client.calls[0]["messages"]
+    assert messages[0]["content"].endswith("Formal.")
+    assert '"text": "Save"' in messages[1]["content"]
+    assert sum(r.input_tokens or 0 for r in results) == 200
+    assert sum(r.output_tokens or 0 for r in results) == 10
+    expected_cost = (200 * 2.50 + 10 * 10.00) / 1_000_000
+    assert abs(sum(r.cost_usd or 0.0 for r in results) - expected_cost) < 1e-12
+
+
+def test_translate_batch_falls_back_for_missing_entries() -> None:
+    client = _FakeClient.with_response(json.dumps([{"id": "0", "text": "Speichern"}]))
+    provider = OpenAIProvider(client=client, pack_size=2)
+
+    results = provider.translate_batch([_seg("Save"), _seg("Cancel")], "de-DE")
+
+    # The single-segment retry gets the same fake reply, verbatim.
+    assert results[0].target_text == "Speichern"
+    assert len(client.calls) == 2
+    assert client.calls[1]["messages"][1]["content"].endswith("Cancel")
+
+
+def test_packed_request_max_tokens_scales_with_the_pack() -> None:
+    client = _FakeClient.with_response("[]")
+    provider = OpenAIProvider(client=client, pack_size=50)
+
+    provider.translate_batch([_seg("Save")], "de-DE")
+    provider.translate_batch([_seg("x" * 400) for _ in range(50)], "de-DE")
+    provider.translate_multi([_seg("x" * 400) for _ in range(50)], ["de-DE", "fr-FR"])
+
+    # Small packs keep the single-segment limit; large ones grow, up to
+    # the model's output limit.
+    assert client.calls[0]["max_tokens"] == 2000
+    packed = [call["max_tokens"] for call in client.calls if call["max_tokens"] != 2000]
+    assert 2000 < packed[0] < packed[-1] <= 16_384
+
+
+def test_default_pack_size_stays_per_segment() -> None:
+    provider = OpenAIProvider(client=_FakeClient.with_response("Hallo"))
+    assert provider.pack_size == 1
+    assert not uses_batch_path(provider)
+    with pytest.raises(ValueError, match="pack_size must be >= 1"):
+        OpenAIProvider(pack_size=0)
+
+
+def test_translate_multi_asks_for_every_language_at_once() -> None:
+    reply = json.dumps(
+        [{"id": "0", "translations": {"de-DE": "Speichern", "fr-FR": "Enregistrer"}}]
+    )
+    client = _FakeClient.with_response(reply, prompt_tokens=90, completion_tokens=12)
+    provider = OpenAIProvider(client=client, multi_target=True)
+    assert uses_multi_target_path(provider)
+    assert not uses_multi_target_path(OpenAIProvider(client=client))
+
+    results = provider.translate_multi([_seg("Save")], ["de-DE", "fr-FR"])
+
+    assert results["de-DE"][0].target_text == "Speichern"
+    assert results["fr-FR"][0].target_text == "Enregistrer"
+    assert len(client.calls) == 1
+    assert "de-DE, fr-FR" in client.calls[0]["messages"][1]["content"]
+    assert results["de-DE"][0].input_tokens == results["fr-FR"][0].input_tokens == 45
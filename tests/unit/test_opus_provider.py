@@ -6,13 +6,21 @@ tests run fast and don't download Helsinki-NLP models.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
 import pytest
 
 from ainemo.core.segment import Segment
 from ainemo.providers._ids import PROVIDER_ID_OPUS
-from ainemo.providers.base import Provider, ProviderResult
+from ainemo.providers._local_model import LocalModelOptions
+from ainemo.providers._seq2seq import Seq2SeqEngine
+from ainemo.providers.base import (
+    BatchProvider,
+    Provider,
+    ProviderResult,
+    ReleasableProvider,
+    WarmableProvider,
+)
 from ainemo.providers.opus._client import MarianModelCache
 from ainemo.providers.opus._languages import (
     OpusTargetConfig,
@@ -207,6 +215,59 @@ def test_model_cache_loads_each_target_once(stub_marian: dict[str, Any]) -> None
     assert cache.requested.count("Helsinki-NLP/opus-mt-en-ROMANCE") == 1
 
 
+# --- translate_batch ------------------------------------------------------
+
+
+class _RecordingEngine(Seq2SeqEngine):
+    """Engine whose ``translate_batch`` echoes instead of running
+    ``generate``, recording each call."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls: list[dict[str, Any]] = []
+
+    def translate_batch(self, texts: Sequence[str], **kwargs: Any) -> list[str]:
+        self.calls.append({"texts": list(texts), **kwargs})
+        return [f"[opus-batch] {t}" for t in texts]
+
+
+def test_satisfies_batch_provider_protocol() -> None:
+    assert isinstance(OpusProvider(cache=_StubMarianCache()), BatchProvider)
+
+
+def test_translate_batch_one_engine_call_with_prefixed_inputs() -> None:
+    cache = _StubMarianCache()
+    engine = _RecordingEngine()
+    results = OpusProvider(cache=cache, engine=engine).translate_batch(
+        [_seg("One"), _seg("Two")], "fr-FR"
+    )
+
+    assert [r.target_text for r in results] == [
+        "[opus-batch] >>fr<<One",
+        "[opus-batch] >>fr<<Two",
+    ]
+    assert len(engine.calls) == 1
+    call = engine.calls[0]
+    assert call["model_key"] == "Helsinki-NLP/opus-mt-en-ROMANCE"
+    assert call["max_length"] == DEFAULT_MAX_LENGTH
+    assert "src_code" not in call  # Pair-specific model: no language settings.
+    assert cache.requested == ["Helsinki-NLP/opus-mt-en-ROMANCE"]
+    assert {r.model for r in results} == {"Helsinki-NLP/opus-mt-en-ROMANCE"}
+    assert {r.provider for r in results} == {PROVIDER_ID_OPUS}
+
+
+def test_translate_batch_empty_returns_empty() -> None:
+    engine = _RecordingEngine()
+    assert OpusProvider(cache=_StubMarianCache(), engine=engine).translate_batch([], "de") == []
+    assert engine.calls == []
+
+
+def test_translate_batch_rejects_non_english_source() -> None:
+    p = OpusProvider(cache=_StubMarianCache(), engine=_RecordingEngine())
+    with pytest.raises(ValueError, match="English source only"):
+        p.translate_batch([_seg(), _seg(source_lang="fr-FR")], "de-DE")
+
+
 # --- BCP-47 → OPUS config mapping ----------------------------------------
 
 
@@ -263,3 +324,43 @@ def test_hf_model_name_uses_prefix_correctly() -> None:
     ko = OpusTargetConfig(bcp47="ko", model_id="ko", model_prefix="opus-mt-tc-big-")
     assert de.hf_model_name == "Helsinki-NLP/opus-mt-en-gem"
     assert ko.hf_model_name == "Helsinki-NLP/opus-mt-tc-big-en-ko"
+
+
+def test_num_beams_option_reaches_every_generate_path(stub_marian: dict[str, Any]) -> None:
+    engine = _RecordingEngine()
+    p = OpusProvider(
+        cache=_StubMarianCache(), engine=engine, options=LocalModelOptions(num_beams=2)
+    )
+    p.translate(_seg(), "de-DE")
+    p.translate_batch([_seg()], "de-DE")
+    assert stub_marian["calls"][0]["generate_kwargs"] == {"num_beams": 2}
+    assert engine.calls[0]["generate_kwargs"] == {"num_beams": 2}
+
+
+def test_model_cache_receives_load_time_options() -> None:
+    options = LocalModelOptions(num_threads=2)
+    assert OpusProvider(options=options)._cache._options is options
+
+
+def test_release_models_delegates_to_cache() -> None:
+    class _ReleaseCache(_StubMarianCache):
+        def release(self, *, include_pinned: bool = False) -> int:
+            return 3 if include_pinned else 2
+
+    p = OpusProvider(cache=_ReleaseCache())
+    assert isinstance(p, ReleasableProvider)
+    assert p.release_models() == 2
+    assert p.release_models(include_pinned=True) == 3
+
+
+def test_warm_up_loads_and_runs_each_pair() -> None:
+    cache = _StubMarianCache()
+    engine = _RecordingEngine()
+    p = OpusProvider(cache=cache, engine=engine)
+    assert isinstance(p, WarmableProvider)
+    p.warm_up([("en-US", "de-DE"), ("en-US", "fr-FR")])
+    assert cache.requested == [
+        "Helsinki-NLP/opus-mt-en-gem",
+        "Helsinki-NLP/opus-mt-en-ROMANCE",
+    ]
+    assert [call["texts"] for call in engine.calls] == [[">>deu<<Hello"], [">>fr<<Hello"]]
@@ -0,0 +1,287 @@
+"""Unit tests for :mod:`ainemo.providers._packing`."""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Sequence
+
+import pytest
+
+from ainemo.core.segment import Segment
+from ainemo.providers._packing import (
+    PackReply,
+    apportion,
+    decode_multi_pack,
+    decode_pack,
+    encode_pack,
+    pack_max_tokens,
+    translate_in_packs,
+    translate_multi_in_packs,
+)
+from ainemo.providers.base import ProviderResult, TokenUsage
+
+
+def _segs(*texts: str, source_lang: str = "en-US") -> list[Segment]:
+    return [Segment(key=t, source_text=t, source_lang=source_lang) for t in texts]
+
+
+def _make_result(text: str, usage: TokenUsage, latency_ms: int) -> ProviderResult:
+    return ProviderResult(
+        target_text=text,
+        provider="fake",
+        model="m",
+        input_tokens=usage.input_tokens,
+        output_tokens=usage.output_tokens,
+        latency_ms=latency_ms,
+        cache_read_tokens=usage.cache_read_tokens,
+        cache_write_tokens=usage.cache_write_tokens,
+    )
+
+
+def _result(text: str, input_tokens: int, output_tokens: int) -> ProviderResult:
+    return _make_result(text, TokenUsage(input_tokens, output_tokens), 5)
+
+
+class _FakeBackend:
+    """Echoes each pack uppercased, minus any positions in ``drop``."""
+
+    def __init__(
+        self,
+        drop: tuple[int, ...] = (),
+        input_tokens: int = 100,
+        cache_read_tokens: int | None = None,
+    ) -> None:
+        self.drop = drop
+        self.input_tokens = input_tokens
+        self.cache_read_tokens = cache_read_tokens
+        self.packs: list[list[str]] = []
+        self.singles: list[str] = []
+
+    def send_pack(self, pack: Sequence[Segment]) -> PackReply:
+        self.packs.append([s.source_text for s in pack])
+        items = [
+            {"id": str(i), "text": s.source_text.upper()}
+            for i, s in enumerate(pack)
+            if i not in self.drop
+        ]
+        usage = TokenUsage(
+            input_tokens=self.input_tokens,
+            output_tokens=30,
+            cache_read_tokens=self.cache_read_tokens,
+        )
+        return PackReply(text=json.dumps(items), usage=usage)
+
+    def translate_one(self, segment: Segment) -> ProviderResult:
+        self.singles.append(segment.source_text)
+        return _result(segment.source_text.upper(), 7, 3)
+
+    def run(self, segments: Sequence[Segment], pack_size: int) -> list[ProviderResult]:
+        return translate_in_packs(
+            segments,
+            pack_size=pack_size,
+            send_pack=self.send_pack,
+            translate_one=self.translate_one,
+            make_result=_make_result,
+        )
+
+
+# --- Wire format ----------------------------------------------------------
+
+
+def test_encode_pack_keys_items_by_position() -> None:
+    assert json.loads(encode_pack(_segs("Save", "Straße"))) == [
+        {"id": "0", "text": "Save"},
+        {"id": "1", "text": "Straße"},
+    ]
+    assert "Straße" in encode_pack(_segs("Straße"))
+
+
+def test_decode_pack_accepts_fenced_and_integer_ids() -> None:
+    raw = '```json\n[{"id": "1", "text": "B"}, {"id": 0, "text": "A"}]\n```'
+    assert decode_pack(raw, 2) == {0: "A", 1: "B"}
+
+
+def test_decode_pack_drops_invalid_entries() -> None:
+    raw = json.dumps(
+        [
+            {"id": "0", "text": "A"},
+            {"id": "1", "text": "B"},
+            {"id": "1", "text": "B again"},  # Duplicate: neither is trusted.
+            {"id": "2", "text": None},
+            {"id": "9", "text": "unknown"},
+            {"id": True, "text": "bool"},
+            "not an object",
+        ]
+    )
+    assert decode_pack(raw, 3) == {0: "A"}
+
+
+@pytest.mark.parametrize("raw", ["", "not json", '{"id": "0", "text": "A"}', "[1, 2"])
+def test_decode_pack_unparseable_is_empty(raw: str) -> None:
+    assert decode_pack(raw, 1) == {}
+
+
+# --- Apportioning ---------------------------------------------------------
+
+
+def test_apportion_sums_exactly_to_total() -> None:
+    shares = apportion(100, [1, 1, 1])
+    assert shares == [34, 33, 33]
+    assert sum(s for s in apportion(7, [5, 0, 12, 3]) if s is not None) == 7
+
+
+def test_apportion_edge_cases() -> None:
+    assert apportion(None, [1, 2]) == [None, None]
+    assert apportion(10, [0, 0]) == [5, 5]
+    assert apportion(10, []) == []
+
+
+# --- translate_in_packs ---------------------------------------------------
+
+
+def test_pack_size_one_translates_one_by_one() -> None:
+    backend = _FakeBackend()
+    results = backend.run(_segs("a", "b"), pack_size=1)
+    assert [r.target_text for r in results] == ["A", "B"]
+    assert backend.packs == []
+    assert backend.singles == ["a", "b"]
+
+
+def test_packs_split_by_size_and_source_lang_keep_order() -> None:
+    backend = _FakeBackend()
+    segments = [*_segs("a", "b"), *_segs("un", source_lang="fr-FR"), *_segs("c")]
+    results = backend.run(segments, pack_size=2)
+    assert [r.target_text for r in results] == ["A", "B", "UN", "C"]
+    assert backend.packs == [["a", "b"], ["c"], ["un"]]
+    assert backend.singles == []
+
+
+def test_usage_apportioned_and_sums_to_reply() -> None:
+    backend = _FakeBackend(input_tokens=101)
+    results = backend.run(_segs("a", "bbb", "cccccc"), pack_size=3)
+    assert sum(r.input_tokens or 0 for r in results) == 101
+    assert sum(r.output_tokens or 0 for r in results) == 30
+    # Longer sources carry more of the pack's tokens.
+    assert [r.output_tokens for r in results] == [3, 9, 18]
+
+
+def test_cache_tokens_apportioned_like_input() -> None:
+    backend = _FakeBackend(input_tokens=100, cache_read_tokens=60)
+    results = backend.run(_segs("aa", "bb", "cc"), pack_size=3)
+    assert [r.cache_read_tokens for r in results] == [20, 20, 20]
+    assert all(r.cache_write_tokens is None for r in results)
+
+
+def test_missing_entries_fall_back_with_their_share(caplog: pytest.LogCaptureFixture) -> None:
+    backend = _FakeBackend(drop=(1,), input_tokens=90)
+    with caplog.at_level(logging.WARNING):
+        results = backend.run(_segs("aa", "bb", "cc"), pack_size=3)
+    assert [r.target_text for r in results] == ["AA", "BB", "CC"]
+    assert backend.singles == ["bb"]
+    # The fallback segment carries its pack share plus its own call.
+    assert results[1].input_tokens == 30 + 7
+    assert sum(r.input_tokens or 0 for r in results) == 90 + 7
+    assert sum(r.output_tokens or 0 for r in results) == 30 + 3
+    assert "1 of 3 packed translation(s)" in caplog.text
+
+
+def test_fallback_without_usage_keeps_its_pack_share() -> None:
+    """A retry that reports no token counts still carries its share,
+    so the cells sum to the pack's usage."""
+    backend = _FakeBackend(drop=(0,), input_tokens=90)
+    backend.translate_one = lambda segment: _make_result(  # type: ignore[method-assign]
+        segment.source_text.upper(), TokenUsage(), 5
+    )
+    results = backend.run(_segs("aa", "bb", "cc"), pack_size=3)
+    assert results[0].input_tokens == 30
+    assert sum(r.input_tokens or 0 for r in results) == 90
+    assert sum(r.output_tokens or 0 for r in results) == 30
+    assert results[0].cache_read_tokens is None
+
+
+def test_pack_max_tokens_scales_with_source_and_languages() -> None:
+    small = pack_max_tokens(_segs("Save"), floor=2000, limit=16_000)
+    one_lang = pack_max_tokens(_segs("x" * 2000, "y" * 2000), floor=2000, limit=16_000)
+    two_langs = pack_max_tokens(
+        _segs("x" * 2000, "y" * 2000), lang_count=2, floor=2000, limit=16_000
+    )
+    assert small == 2000
+    assert 2000 < one_lang < two_langs
+    assert pack_max_tokens(_segs("x" * 100_000), floor=2000, limit=16_000) == 16_000
+
+
+def test_unparseable_reply_falls_back_for_every_segment() -> None:
+    backend = _FakeBackend()
+    backend.send_pack = lambda pack: PackReply(  # type: ignore[method-assign]
+        text="Sorry, I can't do that.", usage=TokenUsage(input_tokens=40, output_tokens=10)
+    )
+    results = backend.run(_segs("a", "b"), pack_size=2)
+    assert backend.singles == ["a", "b"]
+    assert sum(r.input_tokens or 0 for r in results) == 40 + 2 * 7
+    assert sum(r.output_tokens or 0 for r in results) == 10 + 2 * 3
+
+
+def test_send_pack_errors_propagate() -> None:
+    backend = _FakeBackend()
+
+    def _boom(pack: Sequence[Segment]) -> PackReply:
+        raise ConnectionError("down")
+
+    backend.send_pack = _boom  # type: ignore[method-assign]
+    with pytest.raises(ConnectionError):
+        backend.run(_segs("a", "b"), pack_size=2)
+    assert backend.singles == []
+
+
+# --- Multi-target packs ---------------------------------------------------
+
+
+def test_decode_multi_pack_keeps_requested_langs_only() -> None:
+    raw = json.dumps(
+        [
+            {"id": "0", "translations": {"de-DE": "Hallo", "fr-FR": "Bonjour", "es-ES": "Hola"}},
+            {"id": "1", "translations": {"de-DE": "Tschüss", "fr-FR": 3}},
+            {"id": "2", "translations": "not a mapping"},
+        ]
+    )
+    assert decode_multi_pack(raw, 3, ("de-DE", "fr-FR")) == {
+        (0, "de-DE"): "Hallo",
+        (0, "fr-FR"): "Bonjour",
+        (1, "de-DE"): "Tschüss",
+    }
+
+
+def test_multi_target_pack_falls_back_per_missing_cell() -> None:
+    sent: list[tuple[list[str], tuple[str, ...]]] = []
+    singles: list[tuple[str, str]] = []
+
+    def _send(pack: Sequence[Segment], langs: Sequence[str]) -> PackReply:
+        sent.append(([s.source_text for s in pack], tuple(langs)))
+        items = [
+            {"id": str(i), "translations": {"de-DE": f"de:{s.source_text}"}}
+            for i, s in enumerate(pack)
+        ]
+        return PackReply(text=json.dumps(items), usage=TokenUsage(40, 20))
+
+    def _one(segment: Segment, lang: str) -> ProviderResult:
+        singles.append((segment.source_text, lang))
+        return _result(f"{lang}:{segment.source_text}", 5, 1)
+
+    results = translate_multi_in_packs(
+        _segs("aa", "bb"),
+        ("de-DE", "fr-FR"),
+        pack_size=1,
+        send_pack=_send,
+        translate_one=_one,
+        make_result=_make_result,
+    )
+
+    assert sent == [(["aa"], ("de-DE", "fr-FR")), (["bb"], ("de-DE", "fr-FR"))]
+    assert [r.target_text for r in results["de-DE"]] == ["de:aa", "de:bb"]
+    assert [r.target_text for r in results["fr-FR"]] == ["fr-FR:aa", "fr-FR:bb"]
+    assert singles == [("aa", "fr-FR"), ("bb", "fr-FR")]
+    # Each pack's usage is spread over its cells, fallbacks included.
+    all_results = results["de-DE"] + results["fr-FR"]
+    assert sum(r.input_tokens or 0 for r in all_results) == 2 * 40 + 2 * 5
+    assert sum(r.output_tokens or 0 for r in all_results) == 2 * 20 + 2 * 1
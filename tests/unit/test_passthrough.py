@@ -0,0 +1,138 @@
+"""Unit tests for :mod:`ainemo.core.passthrough` and the pipeline's
+passthrough stage."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ainemo.cli import main
+from ainemo.cli.commands import CMD_NAME_TRANSLATE
+from ainemo.core.adapters.java_properties import JavaPropertiesAdapter
+from ainemo.core.icu import parse_placeholders
+from ainemo.core.passthrough import (
+    PASSTHROUGH_REASON_BUILTIN,
+    PASSTHROUGH_REASON_DO_NOT_TRANSLATE,
+    PASSTHROUGH_REASON_EMPTY,
+    PASSTHROUGH_REASON_NO_TEXT,
+    PASSTHROUGH_REASON_PATTERN,
+    PassthroughPolicy,
+)
+from ainemo.core.pipeline import TranslationPipeline
+from ainemo.core.segment import TRANSLATION_SOURCE_PASSTHROUGH, Segment
+from ainemo.core.termbase.base import Persona
+from ainemo.core.tm.sqlite import SqliteTranslationMemory
+from ainemo.providers.base import ProviderResult
+
+
+def _segment(text: str) -> Segment:
+    return Segment(
+        key="k", source_text=text, source_lang="en", placeholders=parse_placeholders(text)
+    )
+
+
+@pytest.mark.parametrize(
+    ("text", "reason"),
+    [
+        ("", PASSTHROUGH_REASON_EMPTY),
+        ("{0}", PASSTHROUGH_REASON_EMPTY),
+        ("{first} {last}", PASSTHROUGH_REASON_EMPTY),
+        ("42", PASSTHROUGH_REASON_NO_TEXT),
+        ("{0} / {1}", PASSTHROUGH_REASON_NO_TEXT),
+        ("$9.99", PASSTHROUGH_REASON_NO_TEXT),
+        ("https://example.com/help?topic=1", PASSTHROUGH_REASON_BUILTIN),
+        ("support@example.com", PASSTHROUGH_REASON_BUILTIN),
+        ("%s: %d", PASSTHROUGH_REASON_BUILTIN),
+        ("%1$s (%2$d%%)", PASSTHROUGH_REASON_BUILTIN),
+        ("ACME cloud", PASSTHROUGH_REASON_DO_NOT_TRANSLATE),
+        ("SKU-1234", PASSTHROUGH_REASON_PATTERN),
+        ("Save", None),
+        ("Hello {0}", None),
+        ("Visit https://example.com", None),
+        ("{n, plural, one {#} other {#}}", None),
+    ],
+)
+def test_classify(text: str, reason: str | None) -> None:
+    policy = PassthroughPolicy(patterns=(r"SKU-\d+",), do_not_translate=("Acme Cloud",))
+    assert policy.classify(_segment(text)) == reason
+
+
+def test_builtin_patterns_can_be_turned_off() -> None:
+    assert PassthroughPolicy(builtin=False).classify(_segment("support@example.com")) is None
+
+
+def test_invalid_pattern_raises() -> None:
+    with pytest.raises(ValueError, match="Invalid passthrough pattern"):
+        PassthroughPolicy(patterns=("(",))
+
+
+class _Provider:
+    provider_id = "llm"
+
+    def __init__(self) -> None:
+        self.sources: list[str] = []
+
+    def translate(self, segment: Segment, target_lang: str) -> ProviderResult:
+        self.sources.append(segment.source_text)
+        return ProviderResult(target_text=f"[{segment.source_text}]", provider="llm", model="m")
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return True
+
+
+def test_pipeline_copies_passthrough_segments_without_tm_or_provider(tmp_path: Path) -> None:
+    src = tmp_path / "messages_en.properties"
+    src.write_text("title=Save\ncount={0}\nurl=https://example.com\nbrand=Acme Cloud\n")
+    provider = _Provider()
+    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    persona = Persona(
+        persona_id="ui",
+        name="UI",
+        forbidden_terms=(),
+        prompt_addendum="",
+        do_not_translate=("Acme Cloud",),
+    )
+    pipeline = TranslationPipeline(
+        adapter=JavaPropertiesAdapter(),
+        tm=tm,
+        provider=provider,
+        validators=[],
+        target_langs=("de", "fr"),
+        source_lang="en",
+        persona=persona,
+        passthrough=PassthroughPolicy(),
+    )
+    result = pipeline.translate_file(src, tmp_path / "out")
+    assert provider.sources == ["Save", "Save"]
+    assert (result.passthrough_count, result.provider_call_count) == (6, 2)
+    assert tm.stats().translation_count == 2
+    copied = [o.translated for o in result.outcomes if o.passthrough]
+    assert all(
+        t is not None and t.source == TRANSLATION_SOURCE_PASSTHROUGH and t.target_text
+        for t in copied
+    )
+    assert "brand=Acme Cloud" in (tmp_path / "out" / "messages_de.properties").read_text()
+
+
+def test_cli_passthrough_flags(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    src = tmp_path / "messages_en.properties"
+    src.write_text("title=Save\ncount={0}\nsku=SKU-12\n")
+    args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tmp_path / "tm.sqlite"),
+        "--usage-log",
+        str(tmp_path / "usage.jsonl"),
+    ]
+    assert main([*args, "--passthrough-pattern", r"SKU-\d+"]) == 0
+    out = capsys.readouterr().out
+    assert "passthrough: 2" in out
+    assert "provider:   1" in out
+    assert main([*args, "--passthrough-pattern", "("]) == 2
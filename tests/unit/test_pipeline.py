@@ -3,12 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, Sequence
+
+import numpy as np
 
 from ainemo.core.adapters.java_properties import JavaPropertiesAdapter
 from ainemo.core.pipeline import TranslationPipeline
 from ainemo.core.segment import (
     Segment,
+    TranslatedSegment,
 )
 from ainemo.core.tm.sqlite import SqliteTranslationMemory
 from ainemo.core.validators.placeholder import PlaceholderParityValidator
@@ -477,3 +480,168 @@ def test_expected_provider_none_preserves_cycle1_any_match_semantics(
     assert result.tm_hit_count == 1
     assert result.provider_call_count == 0
     tm.close()
+
+
+# --- Batch prefetch -------------------------------------------------------
+
+
+class _BatchFakeProvider(_FakeProvider):
+    """:class:`_FakeProvider` with a ``translate_batch`` path."""
+
+    provider_id: ClassVar[str] = "batch-fake"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        self.batches.append([s.source_text for s in segments])
+        return [
+            ProviderResult(
+                target_text=f"[{target_lang}] {s.source_text}",
+                provider=self.provider_id,
+                model=_FAKE_MODEL,
+            )
+            for s in segments
+        ]
+
+
+def test_batch_provider_translates_misses_in_one_call_per_lang(tmp_path: Path) -> None:
+    src = tmp_path / "messages_en_US.properties"
+    _write_props(src, "a=Hello\nb=Goodbye\nc=Hello\n")
+
+    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    provider = _BatchFakeProvider()
+    pipeline = TranslationPipeline(
+        adapter=JavaPropertiesAdapter(),
+        tm=tm,
+        provider=provider,
+        validators=(),
+        target_langs=(_LANG_DE, _LANG_FR),
+        source_lang=_LANG_EN_US,
+    )
+
+    result = pipeline.translate_file(src, tmp_path / "out")
+
+    # Duplicates are sent once; the repeat is then a TM hit, exactly as
+    # on the per-segment path.
+    assert provider.batches == [["Hello", "Goodbye"], ["Hello", "Goodbye"]]
+    assert provider.calls == []
+    assert result.provider_call_count == 4
+    assert result.tm_hit_count == 2
+    written = result.target_lang_paths[_LANG_FR].read_text(encoding="utf-8")
+    assert "[fr-FR] Goodbye" in written
+
+    rerun = pipeline.translate_file(src, tmp_path / "out2")
+    assert rerun.tm_hit_count == 6
+    assert len(provider.batches) == 2  # All hits: no batch call at all.
+    tm.close()
+
+
+def test_prefetched_result_is_not_replaced_by_a_later_fuzzy_hit(tmp_path: Path) -> None:
+    """A row stored after the prefetch pass must not turn a prefetched
+    (already paid-for) miss into a fuzzy TM hit."""
+    src = tmp_path / "messages_en_US.properties"
+    _write_props(src, "a=Hello\nb=Goodbye\n")
+
+    # Every text embeds the same: any stored row is a perfect fuzzy match.
+    tm = SqliteTranslationMemory(
+        tmp_path / "tm.sqlite", embedder=lambda text: np.ones(4, dtype=np.float32)
+    )
+    provider = _BatchFakeProvider()
+    result = TranslationPipeline(
+        adapter=JavaPropertiesAdapter(),
+        tm=tm,
+        provider=provider,
+        validators=(),
+        target_langs=(_LANG_DE,),
+        source_lang=_LANG_EN_US,
+    ).translate_file(src, tmp_path / "out")
+
+    assert provider.batches == [["Hello", "Goodbye"]]
+    assert (result.provider_call_count, result.tm_hit_count) == (2, 0)
+    assert "[de-DE] Goodbye" in result.target_lang_paths[_LANG_DE].read_text(encoding="utf-8")
+    tm.close()
+
+
+# --- Multi-target prefetch ------------------------------------------------
+
+
+class _MultiFakeProvider(_FakeProvider):
+    """:class:`_FakeProvider` with a ``translate_multi`` path."""
+
+    provider_id: ClassVar[str] = "multi-fake"
+    multi_target: ClassVar[bool] = True
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.multi_calls: list[tuple[list[str], tuple[str, ...], str | None]] = []
+
+    def translate_multi(
+        self,
+        segments: Sequence[Segment],
+        target_langs: Sequence[str],
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> dict[str, list[ProviderResult]]:
+        self.multi_calls.append(
+            ([s.source_text for s in segments], tuple(target_langs), system_prompt_addendum)
+        )
+        return {
+            lang: [
+                ProviderResult(
+                    target_text=f"[{lang}] {s.source_text}",
+                    provider=self.provider_id,
+                    model=_FAKE_MODEL,
+                )
+                for s in segments
+            ]
+            for lang in target_langs
+        }
+
+
+def test_multi_target_provider_translates_all_langs_in_one_call(tmp_path: Path) -> None:
+    src = tmp_path / "messages_en_US.properties"
+    _write_props(src, "a=Hello\nb=Goodbye\nc=Hello\n")
+
+    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    # A German TM row from an earlier run: only French needs "Hello".
+    tm.store(
+        TranslatedSegment(
+            segment=Segment(key="a", source_text="Hello", source_lang=_LANG_EN_US),
+            target_lang=_LANG_DE,
+            target_text="Hallo",
+            provider="multi-fake",
+            model=_FAKE_MODEL,
+        )
+    )
+    provider = _MultiFakeProvider()
+    pipeline = TranslationPipeline(
+        adapter=JavaPropertiesAdapter(),
+        tm=tm,
+        provider=provider,
+        validators=(),
+        target_langs=(_LANG_DE, _LANG_FR),
+        source_lang=_LANG_EN_US,
+    )
+
+    result = pipeline.translate_file(src, tmp_path / "out")
+
+    assert provider.calls == []
+    assert sorted(provider.multi_calls) == [
+        (["Goodbye"], (_LANG_DE, _LANG_FR), None),
+        (["Hello"], (_LANG_FR,), None),
+    ]
+    # Per-language TM stores and counts match the per-segment path.
+    assert result.provider_call_count == 3
+    assert result.tm_hit_count == 3
+    written = result.target_lang_paths[_LANG_FR].read_text(encoding="utf-8")
+    assert "[fr-FR] Goodbye" in written
+    assert "Hallo" in result.target_lang_paths[_LANG_DE].read_text(encoding="utf-8")
+    tm.close()
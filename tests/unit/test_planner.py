@@ -0,0 +1,319 @@
+"""Unit tests for :mod:`ainemo.core.planner`, the pipeline's run budget
+and ``nemo translate --plan`` / ``--max-tokens``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Sequence
+
+import pytest
+
+from ainemo.cli import main
+from ainemo.cli.commands import CMD_NAME_TRANSLATE
+from ainemo.core.adapters.java_properties import JavaPropertiesAdapter
+from ainemo.core.pipeline import TranslationPipeline
+from ainemo.core.planner import RunBudget, plan_run
+from ainemo.core.segment import Segment
+from ainemo.core.tm.sqlite import SqliteTranslationMemory
+from ainemo.providers._usage_log import UsageLog
+from ainemo.providers.base import ProviderResult
+
+_EN = "en-US"
+_DE = "de-DE"
+_FR = "fr-FR"
+_SOURCE = "title=Hello\ncheckout.pay=Pay\nfooter=Bye\n"
+
+
+class _Provider:
+    """Echoes the source, reporting ``tokens`` and ``cost_usd`` per call."""
+
+    provider_id = "llm"
+
+    def __init__(self, *, tokens: int = 101, cost_usd: float = 0.00101) -> None:
+        self._tokens = tokens
+        self._cost_usd = cost_usd
+        self.calls: list[tuple[str, str]] = []
+
+    def translate(self, segment: Segment, target_lang: str) -> ProviderResult:
+        self.calls.append((segment.key, target_lang))
+        return ProviderResult(
+            target_text=segment.source_text,
+            provider=self.provider_id,
+            model="llm-1",
+            input_tokens=self._tokens - 1,
+            output_tokens=1,
+            cost_usd=self._cost_usd,
+        )
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return True
+
+
+class _BatchProvider(_Provider):
+    """A :class:`_Provider` that also takes whole batches, one result
+    (and charge) per segment."""
+
+    def __init__(self, *, tokens: int = 101, cost_usd: float = 0.00101) -> None:
+        super().__init__(tokens=tokens, cost_usd=cost_usd)
+        self.batch_sizes: list[int] = []
+
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        self.batch_sizes.append(len(segments))
+        return [self.translate(segment, target_lang) for segment in segments]
+
+
+def _usage_log(tmp_path: Path) -> UsageLog:
+    """A log whose ``llm`` history is 100 input tokens, $0.00001 per
+    token and 500 ms per call."""
+    log = UsageLog(tmp_path / "usage.jsonl")
+    for _ in range(3):
+        log.record(
+            provider="llm",
+            model="llm-1",
+            input_tokens=100,
+            output_tokens=20,
+            latency_ms=500,
+            cost_usd=0.0012,
+            source_lang=_EN,
+            target_lang=_DE,
+            segment_fingerprint="f",
+        )
+    return log
+
+
+def _pipeline(tmp_path: Path, provider: _Provider) -> TranslationPipeline:
+    return TranslationPipeline(
+        adapter=JavaPropertiesAdapter(),
+        tm=SqliteTranslationMemory(tmp_path / "tm.sqlite"),
+        provider=provider,
+        validators=[],
+        target_langs=(_DE, _FR),
+        source_lang=_EN,
+    )
+
+
+def _source(tmp_path: Path) -> Path:
+    src = tmp_path / "messages_en_US.properties"
+    src.write_text(_SOURCE, encoding="utf-8")
+    return src
+
+
+def test_budget_validates() -> None:
+    with pytest.raises(ValueError, match="max_cost_usd must be > 0"):
+        RunBudget(max_cost_usd=0)
+    with pytest.raises(ValueError, match="max_tokens must be >= 1"):
+        RunBudget(max_tokens=0)
+    assert RunBudget(max_tokens=10).fits(1e9, 10)
+    assert not RunBudget(max_cost_usd=1.0, max_tokens=10).fits(1.5, 1)
+
+
+def test_plan_estimates_from_usage_history(tmp_path: Path) -> None:
+    src = _source(tmp_path)
+    pipeline = _pipeline(tmp_path, _Provider())
+    plan = plan_run(
+        pipeline.collect_misses(src),
+        segment_count=6,
+        target_langs=(_DE, _FR),
+        provider_for=lambda _: "llm",
+        usage_log=_usage_log(tmp_path),
+    )
+    assert (plan.miss_count, plan.tm_hit_count, plan.admitted_count) == (6, 0, 6)
+    # "Hello": 1 token by characters, raised to the 100-token median call input.
+    first = plan.calls[0]
+    assert (first.input_tokens, first.output_tokens) == (100, 1)
+    assert first.cost_usd == pytest.approx(101 * 0.0012 / 120)
+    (estimate,) = plan.by_provider()
+    assert (estimate.provider_id, estimate.calls, estimate.wall_time_s) == ("llm", 6, 3.0)
+    assert plan.cost_usd == pytest.approx(6 * 101 * 0.0012 / 120)
+
+    unknown = plan_run(
+        pipeline.collect_misses(src),
+        segment_count=6,
+        target_langs=(_DE, _FR),
+        provider_for=lambda _: "other",
+        usage_log=_usage_log(tmp_path),
+    )
+    assert (unknown.cost_usd, unknown.wall_time_s) == (None, None)
+    assert unknown.calls[0].input_tokens == 1
+
+
+def test_budget_admits_priority_keys_first(tmp_path: Path) -> None:
+    pipeline = _pipeline(tmp_path, _Provider())
+    plan = plan_run(
+        pipeline.collect_misses(_source(tmp_path)),
+        segment_count=6,
+        target_langs=(_FR, _DE),
+        provider_for=lambda _: "llm",
+        usage_log=_usage_log(tmp_path),
+        budget=RunBudget(max_tokens=350),
+        priority_keys=("checkout.*",),
+    )
+    admitted = [(call.segment_key, call.target_lang) for call in plan.calls if call.admitted]
+    assert admitted == [("checkout.pay", _FR), ("checkout.pay", _DE), ("title", _FR)]
+    assert len(plan.skipped) == 3
+
+
+def test_pipeline_translates_admitted_misses_only(tmp_path: Path) -> None:
+    src = _source(tmp_path)
+    provider = _Provider()
+    pipeline = _pipeline(tmp_path, provider)
+    plan = plan_run(
+        pipeline.collect_misses(src),
+        segment_count=6,
+        target_langs=(_DE, _FR),
+        provider_for=lambda _: "llm",
+        usage_log=_usage_log(tmp_path),
+        budget=RunBudget(max_tokens=350),
+    )
+    result = pipeline.translate_file(src, tmp_path / "out", plan=plan)
+    assert provider.calls == [("title", _DE), ("checkout.pay", _DE), ("footer", _DE)]
+    assert (result.provider_call_count, result.skipped_count) == (3, 3)
+    assert result.spent_tokens == 303
+    assert (tmp_path / "out" / "messages_fr_FR.properties").read_text(encoding="utf-8") == ""
+
+    # A re-run picks up where the budget stopped: the TM answers the rest.
+    provider.calls.clear()
+    again = pipeline.translate_file(src, tmp_path / "out")
+    assert (again.tm_hit_count, len(provider.calls)) == (3, 3)
+
+
+def test_pipeline_stops_on_recorded_spend(tmp_path: Path) -> None:
+    """Calls cost more than estimated: the recorded spend ends the run
+    before the plan's admissions run out."""
+    src = _source(tmp_path)
+    provider = _Provider(cost_usd=0.01)
+    pipeline = _pipeline(tmp_path, provider)
+    plan = plan_run(
+        pipeline.collect_misses(src),
+        segment_count=6,
+        target_langs=(_DE, _FR),
+        provider_for=lambda _: "llm",
+        usage_log=_usage_log(tmp_path),
+        budget=RunBudget(max_cost_usd=0.015),
+    )
+    assert plan.admitted_count == 6
+    result = pipeline.translate_file(src, tmp_path / "out", plan=plan)
+    assert (result.provider_call_count, result.skipped_count) == (2, 4)
+    assert result.spent_cost_usd == pytest.approx(0.02)
+
+
+def test_batched_prefetch_stays_within_the_budget(tmp_path: Path) -> None:
+    """Without usage history the plan cannot price a miss: the first
+    one goes alone, and its cost estimates the rest of the batch."""
+    src = _source(tmp_path)
+    provider = _BatchProvider(cost_usd=0.01)
+    pipeline = _pipeline(tmp_path, provider)
+    plan = plan_run(
+        pipeline.collect_misses(src),
+        segment_count=6,
+        target_langs=(_DE, _FR),
+        provider_for=lambda _: "llm",
+        budget=RunBudget(max_cost_usd=0.015),
+    )
+    assert plan.admitted_count == 6
+    assert plan.unpriced_providers == ("llm",)
+    result = pipeline.translate_file(src, tmp_path / "out", plan=plan)
+    assert provider.batch_sizes == [1]
+    assert (result.provider_call_count, result.skipped_count) == (1, 5)
+    assert result.spent_cost_usd == pytest.approx(0.01)
+
+
+def test_batched_prefetch_counts_queued_misses_against_the_budget(tmp_path: Path) -> None:
+    """Calls use more tokens than estimated: the second batch admits
+    each miss against the spend plus the misses already queued, as the
+    per-segment path would."""
+    src = _source(tmp_path)
+    provider = _BatchProvider(tokens=120)
+    pipeline = _pipeline(tmp_path, provider)
+    plan = plan_run(
+        pipeline.collect_misses(src),
+        segment_count=6,
+        target_langs=(_DE, _FR),
+        provider_for=lambda _: "llm",
+        usage_log=_usage_log(tmp_path),
+        budget=RunBudget(max_tokens=610),
+    )
+    assert plan.admitted_count == 6
+    result = pipeline.translate_file(src, tmp_path / "out", plan=plan)
+    # 360 spent + 101 + 101 queued fits; a third 101 would not.
+    assert provider.batch_sizes == [3, 2]
+    assert (result.provider_call_count, result.skipped_count) == (5, 1)
+    assert result.spent_tokens == 600
+
+
+def test_cli_plan_calls_no_provider_and_budget_reports_partial_output(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    src = _source(tmp_path)
+    base_args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de-DE,fr-FR",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tmp_path / "tm.sqlite"),
+        "--usage-log",
+        str(tmp_path / "usage.jsonl"),
+    ]
+    assert main([*base_args, "--plan"]) == 0
+    out = capsys.readouterr().out
+    assert "misses:     6" in out
+    assert "cost unknown (no usage history)" in out
+    assert "note:" not in out
+    assert not (tmp_path / "out").exists()
+    assert not (tmp_path / "usage.jsonl").exists()
+
+    # ``noop`` reports no tokens: the plan's character estimates are charged.
+    assert main([*base_args, "--max-tokens", "6"]) == 0
+    out = capsys.readouterr().out
+    assert "skipped:    3" in out
+    assert "fr-FR: 3 untranslated" in out
+    assert main([*base_args, "--max-tokens", "0"]) == 2
+
+    assert main([*base_args, "--plan", "--max-cost-usd", "1"]) == 0
+    assert "note:       no cost history for noop;" in capsys.readouterr().out
+
+
+def test_plan_leaves_tm_hit_counts_alone(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    src = _source(tmp_path)
+    tm_path = tmp_path / "tm.sqlite"
+    args = [
+        CMD_NAME_TRANSLATE,
+        "--from",
+        str(src),
+        "--to-langs",
+        "de-DE",
+        "--output-dir",
+        str(tmp_path / "out"),
+        "--tm-path",
+        str(tm_path),
+        "--usage-log",
+        str(tmp_path / "usage.jsonl"),
+    ]
+
+    def _hit_counts() -> list[int]:
+        tm = SqliteTranslationMemory(tm_path)
+        try:
+            return sorted(usage.hit_count for usage in tm.iter_top_translations(per_target_lang=10))
+        finally:
+            tm.close()
+
+    assert main(args) == 0
+    for _ in range(3):
+        assert main([*args, "--plan"]) == 0
+    assert _hit_counts() == []
+    # A budgeted run plans first, then translates: each hit counts once.
+    assert main([*args, "--max-tokens", "100"]) == 0
+    assert "TM hits:    3" in capsys.readouterr().out
+    assert _hit_counts() == [1, 1, 1]
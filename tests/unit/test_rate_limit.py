@@ -0,0 +1,310 @@
+"""Unit tests for :mod:`ainemo.providers._rate_limit`.
+
+Limiters run on a fake monotonic clock that only the injected sleep
+advances, so pacing and pauses are asserted exactly without waiting.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from ainemo.core.segment import Segment
+from ainemo.providers._rate_limit import (
+    RateLimit,
+    RateLimiter,
+    RateLimiterRegistry,
+    estimate_tokens,
+    is_rate_limit_error,
+    rate_limit_hint,
+)
+from ainemo.providers._retry import with_retry
+from ainemo.providers._usage_log import UsageLog
+from ainemo.providers.base import ProviderResult
+from ainemo.providers.router import ProviderRouter, RoutingConfig
+
+
+@dataclass
+class _Clock:
+    now: float = 1000.0
+    sleeps: list[float] = field(default_factory=list)
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@dataclass
+class _Response:
+    headers: dict[str, str]
+
+
+class _RateLimitError(Exception):
+    """Shaped like an SDK ``RateLimitError``: status code + response."""
+
+    status_code = 429
+
+    def __init__(self, headers: dict[str, str] | None = None) -> None:
+        super().__init__("rate limited")
+        self.response = _Response(headers or {})
+
+
+def _limiter(clock: _Clock, rpm: float | None = None, tpm: float | None = None) -> RateLimiter:
+    return RateLimiter("openai", "gpt-4o", RateLimit(rpm, tpm), clock=clock)
+
+
+# --- Budgets --------------------------------------------------------------
+
+
+def test_rate_limit_rejects_non_positive_budgets() -> None:
+    with pytest.raises(ValueError, match="requests_per_minute must be > 0"):
+        RateLimit(requests_per_minute=0)
+    with pytest.raises(ValueError, match="tokens_per_minute must be > 0"):
+        RateLimit(tokens_per_minute=-5)
+
+
+def test_unlimited_limiter_never_waits() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock)
+    for _ in range(100):
+        limiter.acquire(10_000, sleep=clock.sleep)
+    assert clock.sleeps == []
+    stats = limiter.stats()
+    assert (stats.requests_per_minute, stats.requests_available, stats.acquired) == (
+        None,
+        None,
+        100,
+    )
+
+
+def test_request_budget_bursts_then_queues_in_arrival_order() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, rpm=60)  # 1 request/s, 6 s burst.
+    # Reserve without sleeping, as concurrent callers would.
+    waits = [limiter._reserve(0) for _ in range(9)]
+    assert waits == [0.0] * 6 + [1.0, 2.0, 3.0]
+    stats = limiter.stats()
+    assert (stats.queued, stats.peak_queued, stats.waited_s) == (3, 3, 6.0)
+    assert stats.requests_available == -3.0
+
+
+def test_token_budget_waits_and_settles_to_reported_usage() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, tpm=600)  # 10 tokens/s, 60 token burst.
+    limiter.acquire(60, sleep=clock.sleep)
+    limiter.acquire(20, sleep=clock.sleep)
+    assert clock.sleeps == [2.0]
+    # The second call used 5 tokens, not 20: the 15 come back.
+    limiter.settle(20, 5)
+    assert limiter.stats().tokens_available == 15.0
+    limiter.acquire(15, sleep=clock.sleep)
+    assert clock.sleeps == [2.0]
+
+
+def test_aacquire_waits_without_blocking_the_loop() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, rpm=60)
+    for _ in range(6):
+        limiter._reserve(0)
+    waiting = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _sleep(seconds: float) -> None:
+        waiting.set()
+        await release.wait()
+
+    async def _run() -> int:
+        task = asyncio.create_task(limiter.aacquire(sleep=_sleep))
+        await waiting.wait()
+        queued = limiter.stats().queued
+        release.set()
+        await task
+        return queued
+
+    assert asyncio.run(_run()) == 1
+    assert limiter.stats().queued == 0
+
+
+# --- Throttling -----------------------------------------------------------
+
+
+def test_throttle_honors_retry_after_and_halves_the_rate() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, rpm=60)
+    paused = limiter.throttle(_RateLimitError({"Retry-After": "5"}))
+    assert paused == 5.0
+    stats = limiter.stats()
+    assert (stats.throttle_events, stats.rate_factor, stats.paused_for_s) == (1, 0.5, 5.0)
+    assert stats.requests_per_minute == 30.0
+    # One call goes when the pause ends, the rest follow at 30/min.
+    assert [limiter._reserve(0) for _ in range(3)] == [5.0, 7.0, 9.0]
+
+
+def test_successes_restore_the_rate() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock, rpm=60)
+    limiter.throttle(_RateLimitError({"retry-after-ms": "250"}))
+    assert limiter.stats().paused_for_s == 0.25
+    for _ in range(5):
+        limiter.settle(0, None)
+    assert limiter.stats().rate_factor == pytest.approx(0.75)
+    for _ in range(20):
+        limiter.settle(0, None)
+    assert limiter.stats().rate_factor == 1.0
+
+
+def test_throttle_without_headers_learns_the_rejected_rate() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock)
+    for _ in range(40):
+        limiter.acquire(sleep=clock.sleep)
+    assert limiter.throttle(_RateLimitError()) == 1.0
+    assert limiter.stats().requests_per_minute == 20.0  # 40/min, halved.
+    assert limiter.throttle(_RateLimitError()) == 2.0  # Consecutive: doubled.
+    clock.sleep(2.0)
+    limiter.settle(0, None)  # A success resets the doubling.
+    assert limiter.throttle(_RateLimitError()) == 1.0
+
+
+def test_throttle_waits_for_the_exhausted_budget_reset() -> None:
+    clock = _Clock()
+    limiter = _limiter(clock)
+    headers = {
+        "x-ratelimit-limit-requests": "500",
+        "x-ratelimit-remaining-requests": "499",
+        "x-ratelimit-reset-requests": "120ms",
+        "x-ratelimit-limit-tokens": "30000",
+        "x-ratelimit-remaining-tokens": "0",
+        "x-ratelimit-reset-tokens": "1m30s",
+    }
+    assert limiter.throttle(_RateLimitError(headers)) == 90.0
+    stats = limiter.stats()
+    assert (stats.requests_per_minute, stats.tokens_per_minute) == (250.0, 15000.0)
+    assert stats.tokens_available == 0.0
+
+
+# --- Header parsing -------------------------------------------------------
+
+
+def test_rate_limit_hint_reads_anthropic_headers_and_dates() -> None:
+    reset = datetime.now(timezone.utc) + timedelta(seconds=30)
+    hint = rate_limit_hint(
+        _RateLimitError(
+            {
+                "retry-after": format_datetime(reset + timedelta(seconds=10), usegmt=True),
+                "anthropic-ratelimit-requests-limit": "50",
+                "anthropic-ratelimit-tokens-remaining": "1200",
+                "anthropic-ratelimit-tokens-reset": reset.isoformat().replace("+00:00", "Z"),
+            }
+        )
+    )
+    assert hint.retry_after_s == pytest.approx(40, abs=2)
+    assert hint.reset_tokens_s == pytest.approx(30, abs=2)
+    assert (hint.limit_requests, hint.remaining_tokens) == (50.0, 1200.0)
+
+
+def test_rate_limit_hint_ignores_missing_and_malformed_headers() -> None:
+    assert rate_limit_hint(ValueError("no response")).retry_after_s is None
+    hint = rate_limit_hint(
+        _RateLimitError({"retry-after": "soon", "x-ratelimit-limit-tokens": "-1"})
+    )
+    assert (hint.retry_after_s, hint.limit_tokens) == (None, None)
+
+
+def test_is_rate_limit_error_checks_status_code() -> None:
+    assert is_rate_limit_error(_RateLimitError())
+    assert not is_rate_limit_error(RuntimeError("boom"))
+
+
+def test_estimate_tokens_counts_prompt_and_each_translation() -> None:
+    assert estimate_tokens(["a" * 40]) == 10 + 10
+    assert estimate_tokens(["a" * 40], system_prompt_addendum="b" * 20, target_count=3) == 15 + 30
+
+
+def test_with_retry_waits_for_retry_after() -> None:
+    attempts: list[int] = []
+    sleeps: list[float] = []
+
+    def _call() -> str:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise _RateLimitError({"retry-after": "7"})
+        return "ok"
+
+    assert with_retry(_call, rate_limit_exceptions=(_RateLimitError,), sleep=sleeps.append) == "ok"
+    assert sleeps == [7.0]
+
+
+# --- Router ---------------------------------------------------------------
+
+
+class _FlakyProvider:
+    provider_id: ClassVar[str] = "flaky"
+    model = "flaky-1"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def translate(
+        self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+    ) -> ProviderResult:
+        self.calls += 1
+        if self.calls == 1:
+            raise _RateLimitError({"retry-after": "3"})
+        return ProviderResult(
+            target_text="ok",
+            provider=self.provider_id,
+            model=self.model,
+            input_tokens=4,
+            output_tokens=2,
+        )
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return True
+
+
+def test_router_paces_retries_through_the_limiter(tmp_path: Path) -> None:
+    registry = RateLimiterRegistry()
+    sleeps: list[float] = []
+    router = ProviderRouter(
+        providers={"flaky": _FlakyProvider()},
+        routing_config=RoutingConfig(default_provider="flaky"),
+        usage_log=UsageLog(tmp_path / "usage.jsonl"),
+        retry_exceptions=(_RateLimitError,),
+        sleep=sleeps.append,
+        rate_limiters=registry,
+    )
+    segment = Segment(key="k", source_text="Hello", source_lang="en-US")
+    assert router.translate(segment, "de-DE").target_text == "ok"
+
+    # The retry queued in the limiter for the server's 3 s, once.
+    assert len(sleeps) == 1
+    assert sleeps[0] == pytest.approx(3.0, abs=0.1)
+    [stats] = registry.stats()
+    assert (stats.provider, stats.model) == ("flaky", "flaky-1")
+    assert (stats.acquired, stats.throttle_events, stats.queued) == (2, 1, 0)
+
+
+def test_router_reports_unretried_rate_limits(tmp_path: Path) -> None:
+    registry = RateLimiterRegistry()
+    router = ProviderRouter(
+        providers={"flaky": _FlakyProvider()},
+        routing_config=RoutingConfig(default_provider="flaky"),
+        usage_log=UsageLog(tmp_path / "usage.jsonl"),
+        rate_limiters=registry,
+    )
+    segment = Segment(key="k", source_text="Hello", source_lang="en-US")
+    with pytest.raises(_RateLimitError):
+        router.translate(segment, "de-DE")
+    [stats] = registry.stats()
+    assert stats.throttle_events == 1
+    assert stats.paused_for_s > 0
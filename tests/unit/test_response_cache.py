@@ -0,0 +1,286 @@
+"""Unit tests for :mod:`ainemo.providers._response_cache` and the
+router's cached single-segment paths.
+
+Entries expire on an injected clock; concurrent callers block on
+:class:`threading.Event` so coalescing is asserted deterministically.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from ainemo.core.segment import Segment
+from ainemo.providers._response_cache import (
+    ResponseCache,
+    ResponseCacheOptions,
+    request_key,
+)
+from ainemo.providers._usage_log import UsageLog
+from ainemo.providers.base import ProviderResult
+from ainemo.providers.router import ProviderRouter, RoutingConfig
+
+_SEGMENT = Segment(key="k", source_text="Hello", source_lang="en-US")
+
+
+@dataclass
+class _Clock:
+    now: float = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _result(text: str = "Hallo") -> ProviderResult:
+    return ProviderResult(
+        target_text=text,
+        provider="openai",
+        model="gpt-4o",
+        input_tokens=12,
+        output_tokens=3,
+        latency_ms=250,
+        cost_usd=0.001,
+    )
+
+
+def _key(addendum: str | None = None, target_lang: str = "de-DE") -> str:
+    return request_key(
+        provider_id="openai",
+        model="gpt-4o",
+        segment_fingerprint=_SEGMENT.fingerprint,
+        target_lang=target_lang,
+        system_prompt_addendum=addendum,
+    )
+
+
+# --- Keys and options ------------------------------------------------------
+
+
+def test_request_key_covers_the_whole_request() -> None:
+    assert _key() == _key()
+    assert len({_key(), _key("glossary"), _key("persona"), _key(target_lang="fr-FR")}) == 4
+
+
+def test_options_validate() -> None:
+    with pytest.raises(ValueError, match="max_entries must be >= 1"):
+        ResponseCacheOptions(max_entries=0)
+    with pytest.raises(ValueError, match="ttl_s must be > 0"):
+        ResponseCacheOptions(ttl_s=0)
+
+
+# --- Store -----------------------------------------------------------------
+
+
+def test_hit_is_served_without_spend() -> None:
+    cache = ResponseCache()
+    cache.put(_key(), _result())
+    hit = cache.get(_key())
+    assert hit is not None
+    assert (hit.target_text, hit.provider, hit.model) == ("Hallo", "openai", "gpt-4o")
+    assert (hit.input_tokens, hit.output_tokens, hit.latency_ms, hit.cost_usd) == (0, 0, 0, 0.0)
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    cache = ResponseCache(ResponseCacheOptions(max_entries=2))
+    cache.put("a", _result("A"))
+    cache.put("b", _result("B"))
+    assert cache.get("a") is not None  # "b" is now the least recent.
+    cache.put("c", _result("C"))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats().evictions == 1
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = _Clock()
+    cache = ResponseCache(ResponseCacheOptions(ttl_s=60), clock=clock)
+    cache.put("a", _result())
+    clock.now += 59
+    assert cache.get("a") is not None
+    clock.now += 1
+    assert cache.get("a") is None
+    assert (cache.stats().expired, cache.stats().entries) == (1, 0)
+
+
+def test_on_disk_store_survives_reopen_and_drops_expired_rows(tmp_path: Path) -> None:
+    clock = _Clock()
+    options = ResponseCacheOptions(ttl_s=60, path=tmp_path / "responses.sqlite")
+    first = ResponseCache(options, clock=clock)
+    first.put("old", _result("Alt"))
+    clock.now += 30
+    first.put("new", _result("Neu"))
+    first.close()
+
+    clock.now += 40  # "old" is 70 s old, "new" 40 s.
+    second = ResponseCache(options, clock=clock)
+    warm = second.get("new")
+    assert warm is not None and warm.target_text == "Neu"
+    assert second.get("old") is None
+    second.close()
+
+
+def test_on_disk_store_stays_bounded_without_reopening(tmp_path: Path) -> None:
+    import sqlite3
+    from contextlib import closing
+
+    def _stored_keys() -> set[str]:
+        with closing(sqlite3.connect(path)) as conn:
+            return {row[0] for row in conn.execute("SELECT key FROM responses")}
+
+    clock = _Clock()
+    path = tmp_path / "responses.sqlite"
+    cache = ResponseCache(ResponseCacheOptions(max_entries=3, path=path), clock=clock)
+    for i in range(20):
+        clock.now += 1
+        cache.put(f"k{i}", _result(f"T{i}"))
+        assert len(_stored_keys()) <= 2 * 3
+    assert {"k17", "k18", "k19"} <= _stored_keys()
+    cache.close()
+
+
+# --- Single-flight ---------------------------------------------------------
+
+
+def test_concurrent_identical_calls_share_one_provider_call() -> None:
+    cache = ResponseCache()
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def _call() -> ProviderResult:
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return _result()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(cache.get_or_call, "k", _call)
+        assert started.wait(5)
+        waiters = [pool.submit(cache.get_or_call, "k", _call) for _ in range(3)]
+        while cache.stats().coalesced < 3:
+            time.sleep(0.001)
+        release.set()
+        assert leader.result() == (_result(), False)
+        assert all(waiter.result() == (_result(), True) for waiter in waiters)
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert (stats.misses, stats.coalesced, stats.hits, stats.in_flight) == (1, 3, 0, 0)
+    assert cache.get_or_call("k", _call)[1] is True
+    assert cache.stats().hits == 1
+
+
+def test_errors_reach_waiters_and_are_not_cached() -> None:
+    cache = ResponseCache()
+
+    def _fail() -> ProviderResult:
+        raise PermissionError("bad key")
+
+    with pytest.raises(PermissionError):
+        cache.get_or_call("k", _fail)
+    assert cache.get("k") is None
+    assert cache.get_or_call("k", _result) == (_result(), False)
+
+
+def test_async_waiter_takes_over_from_a_cancelled_caller() -> None:
+    cache = ResponseCache()
+    calls: list[str] = []
+
+    async def _slow() -> ProviderResult:
+        calls.append("slow")
+        await asyncio.sleep(5)
+        return _result("slow")
+
+    async def _fast() -> ProviderResult:
+        calls.append("fast")
+        return _result("fast")
+
+    async def _run() -> tuple[ProviderResult, bool]:
+        leader = asyncio.create_task(cache.aget_or_call("k", _slow))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.aget_or_call("k", _fast))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await waiter
+
+    assert asyncio.run(_run()) == (_result("fast"), False)
+    assert calls == ["slow", "fast"]
+
+
+# --- Router ----------------------------------------------------------------
+
+
+class _CountingProvider:
+    provider_id: ClassVar[str] = "counting"
+    model = "counting-1"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def translate(
+        self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+    ) -> ProviderResult:
+        self.calls += 1
+        return ProviderResult(
+            target_text=f"{target_lang}:{segment.source_text}:{system_prompt_addendum}",
+            provider=self.provider_id,
+            model=self.model,
+            input_tokens=5,
+            output_tokens=2,
+            cost_usd=0.01,
+        )
+
+    async def atranslate(
+        self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+    ) -> ProviderResult:
+        return self.translate(segment, target_lang, system_prompt_addendum=system_prompt_addendum)
+
+    def supports(self, source_lang: str, target_lang: str) -> bool:
+        return True
+
+
+def _router(tmp_path: Path, provider: _CountingProvider) -> tuple[ProviderRouter, UsageLog]:
+    log = UsageLog(tmp_path / "usage.jsonl")
+    router = ProviderRouter(
+        providers={provider.provider_id: provider},
+        routing_config=RoutingConfig(default_provider=provider.provider_id),
+        usage_log=log,
+        response_cache=ResponseCache(),
+    )
+    return router, log
+
+
+def test_router_answers_repeats_from_cache_and_logs_hits(tmp_path: Path) -> None:
+    provider = _CountingProvider()
+    router, log = _router(tmp_path, provider)
+
+    first = router.translate(_SEGMENT, "de-DE", system_prompt_addendum="glossary")
+    again = router.translate_with("counting", _SEGMENT, "de-DE", system_prompt_addendum="glossary")
+    other = router.translate(_SEGMENT, "de-DE", system_prompt_addendum="persona")
+    assert again.target_text == first.target_text
+    assert other.target_text != first.target_text
+    assert (again.cost_usd, again.input_tokens) == (0.0, 0)
+    assert provider.calls == 2
+
+    stats = log.stats()
+    assert (stats.call_count, stats.response_cache_hits) == (2, 1)
+    assert stats.total_cost_usd == pytest.approx(0.02)
+
+
+def test_router_atranslate_uses_the_cache(tmp_path: Path) -> None:
+    provider = _CountingProvider()
+    router, log = _router(tmp_path, provider)
+
+    async def _run() -> list[ProviderResult]:
+        return [await router.atranslate(_SEGMENT, "de-DE") for _ in range(3)]
+
+    results = asyncio.run(_run())
+    assert {result.target_text for result in results} == {"de-DE:Hello:None"}
+    assert provider.calls == 1
+    assert log.stats().response_cache_hits == 2
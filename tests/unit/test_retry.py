@@ -9,6 +9,7 @@ import pytest
 from ainemo.providers._retry import (
     BACKOFF_BASE_SECONDS,
     MAX_RETRY_ATTEMPTS,
+    awith_retry,
     with_retry,
 )
 
@@ -157,3 +158,49 @@ def test_multiple_exception_types_all_trigger_retry() -> None:
     )
     assert result == "ok"
     assert counter["calls"] == 3
+
+
+# --- awith_retry ------------------------------------------------------------
+
+
+def test_async_retry_awaits_backoff_then_succeeds() -> None:
+    import asyncio
+
+    fn = _make_succeed_after(2)
+    sleeps: list[float] = []
+
+    async def _call() -> str:
+        return fn()
+
+    async def _record_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    result = asyncio.run(
+        awith_retry(_call, rate_limit_exceptions=(_RateLimitError,), sleep=_record_sleep)
+    )
+    assert result == "ok"
+    assert fn.calls == 3
+    assert sleeps == [BACKOFF_BASE_SECONDS, BACKOFF_BASE_SECONDS * 2]
+
+
+def test_async_retry_fails_fast_and_exhausts_like_sync() -> None:
+    import asyncio
+
+    async def _auth() -> str:
+        raise _AuthError("bad key")
+
+    fn = _make_succeed_after(MAX_RETRY_ATTEMPTS)
+
+    async def _limited() -> str:
+        return fn()
+
+    async def _no_async_sleep(seconds: float) -> None:
+        pass
+
+    with pytest.raises(_AuthError):
+        asyncio.run(awith_retry(_auth, rate_limit_exceptions=(_RateLimitError,)))
+    with pytest.raises(_RateLimitError):
+        asyncio.run(
+            awith_retry(_limited, rate_limit_exceptions=(_RateLimitError,), sleep=_no_async_sleep)
+        )
+    assert fn.calls == MAX_RETRY_ATTEMPTS
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, Sequence
 
 import pytest
 
@@ -327,3 +327,373 @@ def test_router_supports_when_any_provider_supports(tmp_path: Path) -> None:
     )
     assert router.supports(_LANG_EN_US, "th-TH") is True
     assert router.supports(_LANG_EN_US, "ja-JP") is False
+
+
+# --- atranslate (asyncio-native path) --------------------------------------
+
+
+@dataclass
+class _AsyncStubProvider(_StubProvider):
+    """Stub with a native ``atranslate``; tracks how many calls are in
+    flight at once."""
+
+    provider_id: ClassVar[str] = "async-stub"
+    delay_seconds: float = 0.01
+    in_flight: int = 0
+    max_in_flight: int = 0
+
+    async def atranslate(
+        self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+    ) -> ProviderResult:
+        import asyncio
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay_seconds)
+        self.in_flight -= 1
+        return self.translate(segment, target_lang, system_prompt_addendum=system_prompt_addendum)
+
+
+def test_atranslate_keeps_many_calls_in_flight_and_records_each(tmp_path: Path) -> None:
+    import asyncio
+
+    log = UsageLog(tmp_path / "usage.jsonl")
+    provider = _AsyncStubProvider()
+    router = ProviderRouter(
+        providers={"async-stub": provider},
+        routing_config=RoutingConfig(default_provider="async-stub"),
+        usage_log=log,
+    )
+
+    async def _run() -> list[ProviderResult]:
+        return await asyncio.gather(*(router.atranslate(_seg(), _LANG_DE) for _ in range(100)))
+
+    results = asyncio.run(_run())
+
+    assert {r.target_text for r in results} == {"TRANSLATED"}
+    assert provider.max_in_flight == 100
+    assert log.stats().call_count == 100
+
+
+def test_atranslate_runs_sync_provider_in_thread(tmp_path: Path) -> None:
+    import asyncio
+    import threading
+
+    seen_threads: list[int] = []
+
+    @dataclass
+    class _ThreadRecordingProvider(_StubProvider):
+        def translate(
+            self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+        ) -> ProviderResult:
+            seen_threads.append(threading.get_ident())
+            return super().translate(segment, target_lang)
+
+    router = ProviderRouter(
+        providers={"stub": _ThreadRecordingProvider(latency_ms=0)},
+        routing_config=RoutingConfig(default_provider="stub"),
+        usage_log=UsageLog(tmp_path / "usage.jsonl"),
+    )
+    result = asyncio.run(router.atranslate(_seg(), _LANG_DE))
+
+    assert result.provider == "stub"
+    assert result.latency_ms >= 0
+    assert seen_threads and seen_threads[0] != threading.get_ident()
+
+
+def test_atranslate_retries_with_async_sleep_and_fails_fast_on_route(tmp_path: Path) -> None:
+    import asyncio
+
+    class _FlakyAsync:
+        provider_id: ClassVar[str] = "flaky"
+        calls = 0
+
+        def translate(
+            self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+        ) -> ProviderResult:
+            raise AssertionError("sync path must not be used")
+
+        async def atranslate(
+            self, segment: Segment, target_lang: str, *, system_prompt_addendum: str | None = None
+        ) -> ProviderResult:
+            self.calls += 1
+            if self.calls == 1:
+                raise _RateLimitError("simulated")
+            return ProviderResult(target_text="ok", provider="flaky", model="m", latency_ms=5)
+
+        def supports(self, source_lang: str, target_lang: str) -> bool:
+            return target_lang == _LANG_DE
+
+    sleeps: list[float] = []
+
+    async def _record_sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    log = UsageLog(tmp_path / "usage.jsonl")
+    router = ProviderRouter(
+        providers={"flaky": _FlakyAsync()},
+        routing_config=RoutingConfig(default_provider="flaky"),
+        usage_log=log,
+        retry_exceptions=(_RateLimitError,),
+        async_sleep=_record_sleep,
+    )
+
+    assert asyncio.run(router.atranslate(_seg(), _LANG_DE)).target_text == "ok"
+    assert len(sleeps) == 1
+    assert log.stats().call_count == 1
+    with pytest.raises(ProviderUnsupportedPair):
+        asyncio.run(router.atranslate(_seg(), "ja-JP"))
+
+
+# --- translate_batch --------------------------------------------------------
+
+
+@dataclass
+class _BatchStubProvider(_StubProvider):
+    """Stub with a native ``translate_batch``; records each batch."""
+
+    provider_id: ClassVar[str] = "batch-stub"
+    batches: list[list[str]] = field(default_factory=list)
+
+    def translate_batch(
+        self,
+        segments: Sequence[Segment],
+        target_lang: str,
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> list[ProviderResult]:
+        self.batches.append([s.source_text for s in segments])
+        return [
+            ProviderResult(target_text=s.source_text.upper(), provider="", model=self.model)
+            for s in segments
+        ]
+
+
+def _segs(*texts: str) -> list[Segment]:
+    return [Segment(key=t, source_text=t, source_lang=_LANG_EN_US) for t in texts]
+
+
+def test_translate_batch_one_call_per_batch_provider_and_one_record_per_segment(
+    tmp_path: Path,
+) -> None:
+    log = UsageLog(tmp_path / "usage.jsonl")
+    provider = _BatchStubProvider()
+    router = ProviderRouter(
+        providers={"batch-stub": provider},
+        routing_config=RoutingConfig(default_provider="batch-stub"),
+        usage_log=log,
+    )
+
+    results = router.translate_batch(_segs("a", "b", "c"), _LANG_DE)
+
+    assert [r.target_text for r in results] == ["A", "B", "C"]
+    assert provider.batches == [["a", "b", "c"]]
+    assert provider.calls == []
+    # Attribution patched per result; every segment recorded.
+    assert {r.provider for r in results} == {"batch-stub"}
+    assert log.stats().call_count == 3
+
+
+def test_translate_batch_falls_back_per_segment_and_keeps_order(tmp_path: Path) -> None:
+    log = UsageLog(tmp_path / "usage.jsonl")
+    batch = _BatchStubProvider()
+    single = _make_provider("single", target_text="SINGLE")
+    router = ProviderRouter(
+        providers={"batch-stub": batch, "single": single},
+        routing_config=RoutingConfig(
+            default_provider="batch-stub",
+            rules=(RoutingRule(provider_id="single", source_lang="fr-FR"),),
+        ),
+        usage_log=log,
+    )
+    segments = [
+        *_segs("one"),
+        Segment(key="f", source_text="un", source_lang="fr-FR"),
+        *_segs("two"),
+    ]
+
+    results = router.translate_batch(segments, _LANG_DE)
+
+    assert [r.target_text for r in results] == ["ONE", "SINGLE", "TWO"]
+    assert batch.batches == [["one", "two"]]
+    assert log.stats().call_count == 3
+
+
+def test_translate_batch_retries_whole_batch(tmp_path: Path) -> None:
+    @dataclass
+    class _FlakyBatch(_BatchStubProvider):
+        failures: int = 1
+
+        def translate_batch(
+            self,
+            segments: Sequence[Segment],
+            target_lang: str,
+            *,
+            system_prompt_addendum: str | None = None,
+        ) -> list[ProviderResult]:
+            if self.failures:
+                self.failures -= 1
+                raise _RateLimitError("simulated")
+            return super().translate_batch(segments, target_lang)
+
+    provider = _FlakyBatch()
+    log = UsageLog(tmp_path / "usage.jsonl")
+    router = ProviderRouter(
+        providers={"batch-stub": provider},
+        routing_config=RoutingConfig(default_provider="batch-stub"),
+        usage_log=log,
+        retry_exceptions=(_RateLimitError,),
+        sleep=lambda _s: None,
+    )
+
+    assert [r.target_text for r in router.translate_batch(_segs("x", "y"), _LANG_DE)] == ["X", "Y"]
+    assert log.stats().call_count == 2
+
+
+def test_translate_batch_rejects_short_result_list(tmp_path: Path) -> None:
+    @dataclass
+    class _Short(_BatchStubProvider):
+        def translate_batch(
+            self,
+            segments: Sequence[Segment],
+            target_lang: str,
+            *,
+            system_prompt_addendum: str | None = None,
+        ) -> list[ProviderResult]:
+            return super().translate_batch(segments[:1], target_lang)
+
+    router = ProviderRouter(
+        providers={"batch-stub": _Short()},
+        routing_config=RoutingConfig(default_provider="batch-stub"),
+        usage_log=UsageLog(tmp_path / "usage.jsonl"),
+    )
+    with pytest.raises(RuntimeError, match="returned 1 results for a batch of 2"):
+        router.translate_batch(_segs("x", "y"), _LANG_DE)
+
+
+def test_resolves_to_batch(tmp_path: Path) -> None:
+    router = ProviderRouter(
+        providers={"batch-stub": _BatchStubProvider(), "stub": _StubProvider()},
+        routing_config=RoutingConfig(
+            default_provider="batch-stub",
+            rules=(RoutingRule(provider_id="stub", target_lang="fr-FR"),),
+        ),
+        usage_log=UsageLog(tmp_path / "usage.jsonl"),
+    )
+    assert router.resolves_to_batch(_LANG_EN_US, _LANG_DE) is True
+    assert router.resolves_to_batch(_LANG_EN_US, "fr-FR") is False
+
+
+@dataclass
+class _PackingStubProvider(_BatchStubProvider):
+    """Batch stub with a ``pack_size``, like the LLM providers."""
+
+    provider_id: ClassVar[str] = "pack-stub"
+    size: int = 2
+
+    @property
+    def pack_size(self) -> int:
+        return self.size
+
+
+def test_translate_batch_sends_one_call_per_pack(tmp_path: Path) -> None:
+    provider = _PackingStubProvider()
+    log = UsageLog(tmp_path / "usage.jsonl")
+    router = ProviderRouter(
+        providers={"pack-stub": provider},
+        routing_config=RoutingConfig(default_provider="pack-stub"),
+        usage_log=log,
+    )
+    segments = [*_segs("a", "b"), Segment(key="f", source_text="un", source_lang="fr-FR")]
+    segments.extend(_segs("c"))
+
+    results = router.translate_batch(segments, _LANG_DE)
+
+    assert [r.target_text for r in results] == ["A", "B", "UN", "C"]
+    assert provider.batches == [["a", "b"], ["c"], ["un"]]
+    assert log.stats().call_count == 4
+    assert router.resolves_to_batch(_LANG_EN_US, _LANG_DE) is True
+
+
+def test_pack_size_one_takes_per_segment_path(tmp_path: Path) -> None:
+    provider = _PackingStubProvider(size=1)
+    router = ProviderRouter(
+        providers={"pack-stub": provider},
+        routing_config=RoutingConfig(default_provider="pack-stub"),
+        usage_log=UsageLog(tmp_path / "usage.jsonl"),
+    )
+
+    router.translate_batch(_segs("a", "b"), _LANG_DE)
+
+    assert provider.batches == []
+    assert provider.calls == [("a", _LANG_DE), ("b", _LANG_DE)]
+    assert router.resolves_to_batch(_LANG_EN_US, _LANG_DE) is False
+
+
+# --- translate_multi --------------------------------------------------------
+
+
+@dataclass
+class _MultiStubProvider(_PackingStubProvider):
+    """Packing stub with a ``translate_multi`` path."""
+
+    provider_id: ClassVar[str] = "multi-stub"
+    multi_target: bool = True
+    multi_calls: list[tuple[list[str], tuple[str, ...]]] = field(default_factory=list)
+
+    def translate_multi(
+        self,
+        segments: Sequence[Segment],
+        target_langs: Sequence[str],
+        *,
+        system_prompt_addendum: str | None = None,
+    ) -> dict[str, list[ProviderResult]]:
+        self.multi_calls.append(([s.source_text for s in segments], tuple(target_langs)))
+        return {
+            lang: [
+                ProviderResult(target_text=f"{lang}:{s.source_text}", provider="", model="m")
+                for s in segments
+            ]
+            for lang in target_langs
+        }
+
+
+def test_translate_multi_one_call_per_pack_and_record_per_pair(tmp_path: Path) -> None:
+    provider = _MultiStubProvider(size=2)
+    log = UsageLog(tmp_path / "usage.jsonl")
+    router = ProviderRouter(
+        providers={"multi-stub": provider},
+        routing_config=RoutingConfig(default_provider="multi-stub"),
+        usage_log=log,
+    )
+
+    results = router.translate_multi(_segs("a", "b", "c"), (_LANG_DE, "fr-FR"))
+
+    assert [r.target_text for r in results["fr-FR"]] == ["fr-FR:a", "fr-FR:b", "fr-FR:c"]
+    assert provider.multi_calls == [(["a", "b"], (_LANG_DE, "fr-FR")), (["c"], (_LANG_DE, "fr-FR"))]
+    assert {r.provider for r in results[_LANG_DE]} == {"multi-stub"}
+    assert log.stats().call_count == 6
+    assert router.resolves_to_multi(_LANG_EN_US, (_LANG_DE, "fr-FR")) is True
+
+
+def test_translate_multi_falls_back_per_lang_when_routes_differ(tmp_path: Path) -> None:
+    multi = _MultiStubProvider()
+    single = _make_provider("single", target_text="SINGLE")
+    router = ProviderRouter(
+        providers={"multi-stub": multi, "single": single},
+        routing_config=RoutingConfig(
+            default_provider="multi-stub",
+            rules=(RoutingRule(provider_id="single", target_lang="fr-FR"),),
+        ),
+        usage_log=UsageLog(tmp_path / "usage.jsonl"),
+    )
+
+    results = router.translate_multi(_segs("a", "b"), (_LANG_DE, "fr-FR"))
+
+    assert multi.multi_calls == []
+    assert multi.batches == [["a", "b"]]
+    assert [r.target_text for r in results["fr-FR"]] == ["SINGLE", "SINGLE"]
+    assert router.resolves_to_multi(_LANG_EN_US, (_LANG_DE, "fr-FR")) is False
+    assert router.resolves_to_multi(_LANG_EN_US, (_LANG_DE,)) is True
+    multi.multi_target = False
+    assert router.resolves_to_multi(_LANG_EN_US, (_LANG_DE,)) is False
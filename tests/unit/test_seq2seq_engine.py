@@ -0,0 +1,169 @@
+"""Unit tests for :class:`ainemo.providers._seq2seq.Seq2SeqEngine`.
+
+Drives the engine with list-based fake tokenizer/model objects, so the
+bucketing, ordering and caching logic is exercised without loading a
+HuggingFace model. Only ``torch.inference_mode`` is real.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from ainemo.providers._seq2seq import DEFAULT_BATCH_SIZE, Seq2SeqEngine
+
+# --- Fakes ----------------------------------------------------------------
+
+
+class _FakeTokenizer:
+    """Passes texts through as "ids" and records what it was asked."""
+
+    def __init__(self) -> None:
+        self.src_lang: str | None = None
+        self.batches: list[list[str]] = []
+        self.src_langs_seen: list[str | None] = []
+        self.converted: list[str] = []
+
+    def __call__(self, texts: list[str], **kwargs: Any) -> dict[str, Any]:
+        assert kwargs["padding"] is True
+        assert kwargs["truncation"] is True
+        self.batches.append(list(texts))
+        self.src_langs_seen.append(self.src_lang)
+        return {"input_ids": list(texts)}
+
+    def convert_tokens_to_ids(self, token: str) -> int:
+        self.converted.append(token)
+        return len(token)
+
+    def batch_decode(self, generated: list[str], *, skip_special_tokens: bool) -> list[str]:
+        assert skip_special_tokens is True
+        return list(generated)
+
+
+class _FakeModel:
+    """Upper-cases each input and records the generate kwargs."""
+
+    def __init__(self) -> None:
+        self.generate_kwargs: list[dict[str, Any]] = []
+
+    def generate(self, *, input_ids: list[str], **kwargs: Any) -> list[str]:
+        self.generate_kwargs.append(kwargs)
+        return [text.upper() for text in input_ids]
+
+
+def _run(engine: Seq2SeqEngine, texts: list[str], **kwargs: Any) -> list[str]:
+    return engine.translate_batch(
+        texts,
+        model_key=kwargs.pop("model_key", "m"),
+        tokenizer=kwargs.pop("tokenizer", _FakeTokenizer()),
+        model=kwargs.pop("model", _FakeModel()),
+        max_length=kwargs.pop("max_length", 64),
+        **kwargs,
+    )
+
+
+# --- Ordering + bucketing -------------------------------------------------
+
+
+def test_outputs_come_back_in_input_order() -> None:
+    texts = ["ccc", "a", "bbbb", "dd", "e"]
+    assert _run(Seq2SeqEngine(batch_size=2), texts) == ["CCC", "A", "BBBB", "DD", "E"]
+
+
+def test_buckets_are_sorted_by_length_and_capped_at_batch_size() -> None:
+    tokenizer = _FakeTokenizer()
+    _run(Seq2SeqEngine(batch_size=2), ["ccc", "a", "bbbb", "dd", "e"], tokenizer=tokenizer)
+    # Stable sort: the two 1-char inputs keep caller order.
+    assert tokenizer.batches == [["a", "e"], ["dd", "ccc"], ["bbbb"]]
+
+
+def test_empty_input_skips_generate() -> None:
+    model = _FakeModel()
+    assert _run(Seq2SeqEngine(), [], model=model) == []
+    assert model.generate_kwargs == []
+
+
+def test_max_length_is_forwarded_to_generate() -> None:
+    model = _FakeModel()
+    _run(Seq2SeqEngine(), ["x"], model=model, max_length=123)
+    assert model.generate_kwargs[0]["max_length"] == 123
+
+
+def test_output_count_mismatch_raises() -> None:
+    class _DroppingModel(_FakeModel):
+        def generate(self, *, input_ids: list[str], **kwargs: Any) -> list[str]:
+            return super().generate(input_ids=input_ids, **kwargs)[:-1]
+
+    with pytest.raises(RuntimeError, match="returned 1 outputs for a batch of 2"):
+        _run(Seq2SeqEngine(), ["a", "b"], model=_DroppingModel())
+
+
+def test_invalid_batch_size_rejected() -> None:
+    with pytest.raises(ValueError, match="batch_size"):
+        Seq2SeqEngine(batch_size=0)
+
+
+def test_default_batch_size() -> None:
+    assert Seq2SeqEngine().batch_size == DEFAULT_BATCH_SIZE
+
+
+# --- Multilingual (NLLB-style) settings -----------------------------------
+
+
+def test_src_lang_is_set_and_target_forced_bos_passed() -> None:
+    tokenizer = _FakeTokenizer()
+    model = _FakeModel()
+    _run(
+        Seq2SeqEngine(),
+        ["Hello"],
+        tokenizer=tokenizer,
+        model=model,
+        src_code="eng_Latn",
+        tgt_code="deu_Latn",
+    )
+    assert tokenizer.src_langs_seen == ["eng_Latn"]
+    assert model.generate_kwargs[0]["forced_bos_token_id"] == len("deu_Latn")
+
+
+def test_forced_bos_is_resolved_once_per_pair() -> None:
+    engine = Seq2SeqEngine()
+    tokenizer = _FakeTokenizer()
+    for _ in range(3):
+        _run(engine, ["Hi"], tokenizer=tokenizer, src_code="eng_Latn", tgt_code="fra_Latn")
+    _run(engine, ["Hi"], tokenizer=tokenizer, src_code="eng_Latn", tgt_code="deu_Latn")
+    assert tokenizer.converted == ["fra_Latn", "deu_Latn"]
+    assert engine.stats().cached_pair_count == 2
+
+
+def test_pair_specific_models_get_no_language_settings() -> None:
+    tokenizer = _FakeTokenizer()
+    model = _FakeModel()
+    _run(Seq2SeqEngine(), ["Hi"], tokenizer=tokenizer, model=model)
+    assert tokenizer.src_langs_seen == [None]
+    assert "forced_bos_token_id" not in model.generate_kwargs[0]
+
+
+# --- Cache + stats --------------------------------------------------------
+
+
+def test_cached_builds_once_per_key() -> None:
+    engine = Seq2SeqEngine()
+    calls: list[int] = []
+
+    def _factory() -> str:
+        calls.append(1)
+        return "value"
+
+    assert engine.cached(("m", "a", "b"), _factory) == "value"
+    assert engine.cached(("m", "a", "b"), _factory) == "value"
+    assert len(calls) == 1
+
+
+def test_stats_count_batches_and_segments() -> None:
+    engine = Seq2SeqEngine(batch_size=2)
+    _run(engine, ["a", "b", "c"])
+    _run(engine, ["d"])
+    stats = engine.stats()
+    assert stats.batch_count == 3
+    assert stats.segment_count == 4
@@ -6,32 +6,51 @@ match + store + stats) and the cycle-1 scope-7 contract (embedding-
 based fuzzy match) using a deterministic stub embedder. The real
 MiniLM embedder is exercised in an integration test gated on whether
 the model is already cached locally.
+
+Tests taking the ``make_tm`` fixture run against both backends —
+SQLite and :class:`ainemo.core.tm.memory.InMemoryTranslationMemory` —
+so the in-memory TM is held to the same semantics. Tests that build a
+:class:`SqliteTranslationMemory` directly cover what only the SQLite
+backend has: the schema and its migrations, ``merge_from``, the
+negative-lookup filter and the deferred hit-count flush.
 """
 
 from __future__ import annotations
 
 import hashlib
+import sqlite3
 from pathlib import Path
+from typing import Any, Callable
 
 import numpy as np
+import pytest
 
 from ainemo.core.segment import (
     TRANSLATION_SOURCE_EXACT_TM,
     TRANSLATION_SOURCE_FUZZY_TM,
+    TRANSLATION_SOURCE_MANUAL,
     TRANSLATION_SOURCE_PROVIDER,
     Placeholder,
     PlaceholderKind,
     Segment,
     TranslatedSegment,
 )
+from ainemo.core.tm import memory as memory_module
+from ainemo.core.tm import sqlite as sqlite_module
 from ainemo.core.tm.base import (
     DEFAULT_FUZZY_THRESHOLD,
     EXACT_MATCH_SIMILARITY,
     TM_MATCH_TYPE_EXACT,
     TM_MATCH_TYPE_FUZZY,
     TranslationMemory,
+    UsageTrackingTranslationMemory,
+)
+from ainemo.core.tm.memory import InMemoryTranslationMemory
+from ainemo.core.tm.sqlite import (
+    MERGE_POLICY_KEEP_EXISTING,
+    Embedder,
+    SqliteTranslationMemory,
 )
-from ainemo.core.tm.sqlite import Embedder, SqliteTranslationMemory
 
 # --- Test fixtures ---------------------------------------------------------
 
@@ -39,6 +58,12 @@ _LANG_EN_US = "en-US"
 _LANG_DE = "de-DE"
 _PROVIDER_TEST = "test"
 
+_BACKEND_SQLITE = "sqlite"
+_BACKEND_MEMORY = "memory"
+
+_AnyTm = SqliteTranslationMemory | InMemoryTranslationMemory
+_MakeTm = Callable[..., _AnyTm]
+
 
 def _seg(
     *,
@@ -99,12 +124,44 @@ def _identical_embedder(text: str) -> np.ndarray:
     return np.ones(16, dtype=np.float32)
 
 
+@pytest.fixture(params=[_BACKEND_SQLITE, _BACKEND_MEMORY])
+def make_tm(request: pytest.FixtureRequest, tmp_path: Path) -> _MakeTm:
+    """Factory for a TM of the parametrized backend.
+
+    ``path`` is where the TM persists: the SQLite file, or the
+    in-memory TM's snapshot. Without it each SQLite TM gets a fresh
+    file and the in-memory TM is not persisted.
+    """
+    files = iter(range(1_000))
+
+    def _make(embedder: Embedder | None = None, *, path: Path | None = None) -> _AnyTm:
+        if request.param == _BACKEND_MEMORY:
+            return InMemoryTranslationMemory(embedder, snapshot_path=path)
+        if path is None:
+            path = tmp_path / f"tm{next(files)}.sqlite"
+        return SqliteTranslationMemory(path, embedder=embedder)
+
+    return _make
+
+
+def _hit_counts(tm: _AnyTm) -> dict[str, tuple[int, int | None]]:
+    """Usage counters by target text, pending hits included."""
+    return {row.target_text: (row.hit_count, row.last_hit_at) for row in tm.iter_rows()}
+
+
+def _stored_hit_counts(tm: SqliteTranslationMemory) -> dict[str, tuple[int, int | None]]:
+    """Usage counters as written to the SQLite file so far."""
+    cursor = tm._conn.execute("SELECT target_text, hit_count, last_hit_at FROM translations")
+    return {str(text): (int(hits), last) for text, hits, last in cursor}
+
+
 # --- Protocol conformance --------------------------------------------------
 
 
-def test_satisfies_protocol(tmp_path: Path) -> None:
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+def test_satisfies_protocol(make_tm: _MakeTm) -> None:
+    tm = make_tm()
     assert isinstance(tm, TranslationMemory)
+    assert isinstance(tm, UsageTrackingTranslationMemory)
     tm.close()
 
 
@@ -120,8 +177,8 @@ def test_creates_database_directory(tmp_path: Path) -> None:
 # --- Store + exact match (scope 6) ----------------------------------------
 
 
-def test_store_then_exact_lookup(tmp_path: Path) -> None:
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+def test_store_then_exact_lookup(make_tm: _MakeTm) -> None:
+    tm = make_tm()
     seg = _seg()
     tm.store(_ts(seg, target_text="Hallo"))
 
@@ -134,15 +191,15 @@ def test_store_then_exact_lookup(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_lookup_misses_for_unknown_segment(tmp_path: Path) -> None:
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+def test_lookup_misses_for_unknown_segment(make_tm: _MakeTm) -> None:
+    tm = make_tm()
     assert tm.lookup(_seg(source_text="never seen"), _LANG_DE) is None
     tm.close()
 
 
-def test_lookup_misses_for_other_target_lang(tmp_path: Path) -> None:
+def test_lookup_misses_for_other_target_lang(make_tm: _MakeTm) -> None:
     """Storing for de-DE must not surface for fr-FR."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm = make_tm()
     seg = _seg()
     tm.store(_ts(seg, target_lang=_LANG_DE))
 
@@ -150,9 +207,9 @@ def test_lookup_misses_for_other_target_lang(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_store_is_idempotent(tmp_path: Path) -> None:
+def test_store_is_idempotent(make_tm: _MakeTm) -> None:
     """Storing the same translated twice must not duplicate rows."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm = make_tm()
     seg = _seg()
     tm.store(_ts(seg, target_text="Hallo"))
     tm.store(_ts(seg, target_text="Hallo"))
@@ -163,8 +220,8 @@ def test_store_is_idempotent(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_store_overwrites_for_same_provider(tmp_path: Path) -> None:
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+def test_store_overwrites_for_same_provider(make_tm: _MakeTm) -> None:
+    tm = make_tm()
     seg = _seg()
     tm.store(_ts(seg, target_text="Hallo v1"))
     tm.store(_ts(seg, target_text="Hallo v2"))
@@ -175,14 +232,14 @@ def test_store_overwrites_for_same_provider(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_lookup_filters_by_provider_and_model(tmp_path: Path) -> None:
+def test_lookup_filters_by_provider_and_model(make_tm: _MakeTm) -> None:
     """Cycle-2 contract pin: ``lookup(provider=, model=)`` narrows
     to the specific (provider, model) row even when newer rows for
     the same (segment, target_lang) exist with other providers or
     models. Without these filters, the router cannot route
     deterministically — a ``gpt-4o`` lookup would surface the most
     recent ``gpt-4-turbo`` row simply because it was written later."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm = make_tm()
     seg = _seg()
     tm.store(
         TranslatedSegment(
@@ -238,10 +295,10 @@ def test_lookup_filters_by_provider_and_model(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_lookup_returns_none_when_filtered_pair_missing(tmp_path: Path) -> None:
+def test_lookup_returns_none_when_filtered_pair_missing(make_tm: _MakeTm) -> None:
     """A specific (provider, model) filter that has no rows must
     return None — never silently broaden to another row."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm = make_tm()
     seg = _seg()
     tm.store(
         TranslatedSegment(
@@ -273,13 +330,13 @@ def test_translated_segment_is_keyword_only() -> None:
         TranslatedSegment(seg, _LANG_DE, "x", "openai")  # type: ignore[misc]
 
 
-def test_different_models_under_same_provider_coexist(tmp_path: Path) -> None:
+def test_different_models_under_same_provider_coexist(make_tm: _MakeTm) -> None:
     """Cycle-2 contract pin: two models behind the same provider id
     cache independently. Without the model in the TM PK,
     ``gpt-4o-2024-11-20`` and ``gpt-4-turbo`` translations of the
     same source segment overwrite each other, breaking
     model-specific routing."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm = make_tm()
     seg = _seg()
     tm.store(
         TranslatedSegment(
@@ -310,10 +367,10 @@ def test_different_models_under_same_provider_coexist(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_different_providers_coexist(tmp_path: Path) -> None:
+def test_different_providers_coexist(make_tm: _MakeTm) -> None:
     """Two providers translating the same segment store independently;
     the most recent (by created_at) wins on lookup."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm = make_tm()
     seg = _seg()
     tm.store(_ts(seg, target_text="From NLLB", provider="nllb"))
     tm.store(_ts(seg, target_text="From OpenAI", provider="openai"))
@@ -323,10 +380,10 @@ def test_different_providers_coexist(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_lookup_with_placeholder_aware_fingerprint(tmp_path: Path) -> None:
+def test_lookup_with_placeholder_aware_fingerprint(make_tm: _MakeTm) -> None:
     """Two segments with the same text but different placeholder
     classification must NOT collide in the TM."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm = make_tm()
     text = "Click {0}"
     positional = _seg(
         source_text=text,
@@ -346,8 +403,8 @@ def test_lookup_with_placeholder_aware_fingerprint(tmp_path: Path) -> None:
 # --- Stats ----------------------------------------------------------------
 
 
-def test_stats_counts(tmp_path: Path) -> None:
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+def test_stats_counts(make_tm: _MakeTm) -> None:
+    tm = make_tm()
     seg1 = _seg(source_text="One")
     seg2 = _seg(source_text="Two")
     tm.store(_ts(seg1, target_lang=_LANG_DE))
@@ -361,8 +418,8 @@ def test_stats_counts(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_stats_embedding_count_zero_without_embedder(tmp_path: Path) -> None:
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+def test_stats_embedding_count_zero_without_embedder(make_tm: _MakeTm) -> None:
+    tm = make_tm()
     tm.store(_ts(_seg()))
     assert tm.stats().embedding_count == 0
     tm.close()
@@ -371,16 +428,16 @@ def test_stats_embedding_count_zero_without_embedder(tmp_path: Path) -> None:
 # --- Persistence ---------------------------------------------------------
 
 
-def test_persists_across_sessions(tmp_path: Path) -> None:
+def test_persists_across_sessions(make_tm: _MakeTm, tmp_path: Path) -> None:
     """Closing and reopening the TM must surface previously-stored
     translations."""
     db_path = tmp_path / "tm.sqlite"
-    tm = SqliteTranslationMemory(db_path)
+    tm = make_tm(path=db_path)
     seg = _seg()
     tm.store(_ts(seg, target_text="Hallo"))
     tm.close()
 
-    tm2 = SqliteTranslationMemory(db_path)
+    tm2 = make_tm(path=db_path)
     hit = tm2.lookup(seg, _LANG_DE)
     assert hit is not None
     assert hit.translated.target_text == "Hallo"
@@ -390,37 +447,40 @@ def test_persists_across_sessions(tmp_path: Path) -> None:
 # --- Fuzzy lookup (scope 7) -----------------------------------------------
 
 
-def test_fuzzy_lookup_returns_none_without_embedder(tmp_path: Path) -> None:
+def test_fuzzy_lookup_returns_none_without_embedder(make_tm: _MakeTm) -> None:
     """No embedder → fuzzy is silently disabled. The TM serves exact
     matches only."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm = make_tm()
     seg = _seg(source_text="A different text that won't exact-match")
     assert tm.lookup(seg, _LANG_DE) is None
     tm.close()
 
 
-def test_fuzzy_lookup_returns_match_above_threshold(tmp_path: Path) -> None:
+def test_fuzzy_lookup_returns_match_above_threshold(make_tm: _MakeTm) -> None:
     """With an embedder that returns identical vectors for all inputs,
     every cross-segment cosine similarity is 1.0 → fuzzy matches return
     the stored translation."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", embedder=_identical_embedder)
+    tm = make_tm(_identical_embedder)
     stored = _seg(source_text="Hello world")
     tm.store(_ts(stored, target_text="Hallo Welt"))
 
-    query = _seg(source_text="Greetings universe")
+    query = _seg(key="query", source_text="Greetings universe")
     hit = tm.lookup(query, _LANG_DE)
     assert hit is not None
     assert hit.match_type == TM_MATCH_TYPE_FUZZY
     assert hit.translated.source == TRANSLATION_SOURCE_FUZZY_TM
     assert hit.translated.target_text == "Hallo Welt"
+    # The matched row's source text, under the caller's key.
+    assert hit.translated.segment.source_text == "Hello world"
+    assert hit.translated.segment.key == "query"
     assert hit.similarity >= DEFAULT_FUZZY_THRESHOLD
     tm.close()
 
 
-def test_fuzzy_lookup_below_threshold_returns_none(tmp_path: Path) -> None:
+def test_fuzzy_lookup_below_threshold_returns_none(make_tm: _MakeTm) -> None:
     """The deterministic stub embedder returns near-orthogonal vectors
     for unrelated texts, so cosine similarity is well below 0.85."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", embedder=_stub_embedder)
+    tm = make_tm(_stub_embedder)
     tm.store(_ts(_seg(source_text="completely different")))
 
     query = _seg(source_text="something unrelated")
@@ -428,10 +488,10 @@ def test_fuzzy_lookup_below_threshold_returns_none(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_fuzzy_only_considers_same_source_lang(tmp_path: Path) -> None:
+def test_fuzzy_only_considers_same_source_lang(make_tm: _MakeTm) -> None:
     """A stored segment in fr-FR must not surface for an en-US query
     even if their embeddings are identical."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", embedder=_identical_embedder)
+    tm = make_tm(_identical_embedder)
     tm.store(_ts(_seg(source_text="Bonjour", source_lang="fr-FR")))
 
     query = _seg(source_text="Hello", source_lang=_LANG_EN_US)
@@ -439,10 +499,10 @@ def test_fuzzy_only_considers_same_source_lang(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_fuzzy_only_considers_target_lang_with_translation(tmp_path: Path) -> None:
+def test_fuzzy_only_considers_target_lang_with_translation(make_tm: _MakeTm) -> None:
     """A stored segment with a de-DE translation must not surface as a
     fuzzy match for a fr-FR target."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", embedder=_identical_embedder)
+    tm = make_tm(_identical_embedder)
     tm.store(_ts(_seg(), target_lang=_LANG_DE))
 
     query = _seg(source_text="Greetings")
@@ -450,9 +510,9 @@ def test_fuzzy_only_considers_target_lang_with_translation(tmp_path: Path) -> No
     tm.close()
 
 
-def test_exact_match_preferred_over_fuzzy(tmp_path: Path) -> None:
+def test_exact_match_preferred_over_fuzzy(make_tm: _MakeTm) -> None:
     """When an exact match exists, fuzzy is not consulted."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", embedder=_identical_embedder)
+    tm = make_tm(_identical_embedder)
     seg = _seg()
     tm.store(_ts(seg, target_text="EXACT"))
     tm.store(_ts(_seg(source_text="something else"), target_text="FUZZY"))
@@ -464,16 +524,16 @@ def test_exact_match_preferred_over_fuzzy(tmp_path: Path) -> None:
     tm.close()
 
 
-def test_store_with_embedder_populates_embedding(tmp_path: Path) -> None:
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", embedder=_identical_embedder)
+def test_store_with_embedder_populates_embedding(make_tm: _MakeTm) -> None:
+    tm = make_tm(_identical_embedder)
     tm.store(_ts(_seg()))
     assert tm.stats().embedding_count == 1
     tm.close()
 
 
-def test_custom_threshold(tmp_path: Path) -> None:
+def test_custom_threshold(make_tm: _MakeTm) -> None:
     """The caller's `fuzzy_threshold` overrides the default."""
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", embedder=_identical_embedder)
+    tm = make_tm(_identical_embedder)
     tm.store(_ts(_seg()))
 
     # Identical-embedder gives similarity == 1.0; threshold 1.5 is
@@ -486,7 +546,7 @@ def test_custom_threshold(tmp_path: Path) -> None:
 # --- Many-segment fuzzy lookup -------------------------------------------
 
 
-def test_fuzzy_picks_best_match_among_many(tmp_path: Path) -> None:
+def test_fuzzy_picks_best_match_among_many(make_tm: _MakeTm) -> None:
     """Across N stored segments with varying embeddings, fuzzy returns
     the one with the highest cosine similarity. We craft embeddings to
     place a clear winner."""
@@ -507,7 +567,7 @@ def test_fuzzy_picks_best_match_among_many(tmp_path: Path) -> None:
             "far match": 0.05,
         }
     )
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", embedder=embedder)
+    tm = make_tm(embedder)
     tm.store(_ts(_seg(source_text="near match"), target_text="NEAR"))
     tm.store(_ts(_seg(source_text="medium match"), target_text="MEDIUM"))
     tm.store(_ts(_seg(source_text="far match"), target_text="FAR"))
@@ -519,6 +579,28 @@ def test_fuzzy_picks_best_match_among_many(tmp_path: Path) -> None:
     tm.close()
 
 
+def test_iter_translations_keeps_stored_source(make_tm: _MakeTm) -> None:
+    tm = make_tm()
+    tm.store(_ts(_seg(source_text="One"), target_text="Eins"))
+    tm.store(
+        TranslatedSegment(
+            segment=_seg(source_text="Two"),
+            target_lang=_LANG_DE,
+            target_text="Zwei",
+            provider="human",
+            source=TRANSLATION_SOURCE_MANUAL,
+        )
+    )
+    tm.store(_ts(_seg(source_text="One"), target_text="Un", target_lang="fr-FR"))
+
+    rows = list(tm.iter_translations(source_lang=_LANG_EN_US, target_lang=_LANG_DE))
+    by_text = {row.target_text: row for row in rows}
+    assert set(by_text) == {"Eins", "Zwei"}
+    assert by_text["Zwei"].source == TRANSLATION_SOURCE_MANUAL
+    assert by_text["Eins"].segment.key == by_text["Eins"].segment.fingerprint
+    tm.close()
+
+
 def test_iter_translations_streams_without_materializing(tmp_path: Path) -> None:
     """Regression for the cycle-3 S5 P2 finding.
 
@@ -534,7 +616,6 @@ def test_iter_translations_streams_without_materializing(tmp_path: Path) -> None
     cursor.fetchall(), this fails. Direct iteration over the cursor
     (the correct path) does not touch fetchall().
     """
-    from typing import Any
     from typing import Iterator as _Iterator
 
     tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
@@ -568,7 +649,7 @@ def test_iter_translations_streams_without_materializing(tmp_path: Path) -> None
     tm.close()
 
 
-def test_iter_translations_works_across_threads(tmp_path: Path) -> None:
+def test_iter_translations_works_across_threads(make_tm: _MakeTm) -> None:
     """Cycle-5 dogfood regression — the cycle-5 reviewer Flask app runs
     requests on werkzeug worker threads, but `SqliteTranslationMemory`
     holds a long-lived `sqlite3.Connection` opened on a different thread.
@@ -582,7 +663,7 @@ def test_iter_translations_works_across_threads(tmp_path: Path) -> None:
     """
     import threading
 
-    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm = make_tm()
     seg = _seg(key="k1", source_text="Hello world")
     tm.store(_ts(seg, target_text="Hallo welt"))
 
@@ -604,3 +685,447 @@ def test_iter_translations_works_across_threads(tmp_path: Path) -> None:
     assert rows[0].target_text == "Hallo welt"
 
     tm.close()
+
+
+# --- merge_from (sharded-build TM merge) ----------------------------------
+
+
+def test_merge_from_copies_rows_and_embeddings_without_reembedding(tmp_path: Path) -> None:
+    shard = SqliteTranslationMemory(tmp_path / "a.sqlite", embedder=_stub_embedder)
+    shard.store(_ts(_seg(key="k1", source_text="Hello"), target_text="Hallo"))
+    shard.store(_ts(_seg(key="k2", source_text="Bye"), target_text="Tschüss"))
+    shard.close()
+
+    calls: list[str] = []
+
+    def _counting_embedder(text: str) -> np.ndarray:
+        calls.append(text)
+        return _stub_embedder(text)
+
+    out = SqliteTranslationMemory(tmp_path / "out.sqlite", embedder=_counting_embedder)
+    result = out.merge_from(tmp_path / "a.sqlite")
+
+    assert result.segments_read == 2
+    assert result.translations_read == 2
+    assert result.translations_written == 2
+    assert calls == []
+    stats = out.stats()
+    assert stats.translation_count == 2
+    assert stats.embedding_count == 2
+    hit = out.lookup(_seg(key="k1", source_text="Hello"), _LANG_DE)
+    assert hit is not None and hit.translated.target_text == "Hallo"
+    out.close()
+
+
+def test_merge_from_latest_policy_keeps_newer_row(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import ainemo.core.tm.sqlite as sqlite_module
+
+    seg = _seg()
+    monkeypatch.setattr(sqlite_module, "_now_seconds", lambda: 100)
+    old = SqliteTranslationMemory(tmp_path / "old.sqlite")
+    old.store(_ts(seg, target_text="Alt"))
+    old.close()
+    monkeypatch.setattr(sqlite_module, "_now_seconds", lambda: 200)
+    new = SqliteTranslationMemory(tmp_path / "new.sqlite")
+    new.store(_ts(seg, target_text="Neu"))
+    new.close()
+
+    out = SqliteTranslationMemory(tmp_path / "out.sqlite")
+    out.merge_from(tmp_path / "new.sqlite")
+    result = out.merge_from(tmp_path / "old.sqlite")
+
+    assert result.translations_written == 0
+    hit = out.lookup(seg, _LANG_DE)
+    assert hit is not None and hit.translated.target_text == "Neu"
+    out.close()
+
+
+def test_merge_from_keep_existing_policy_keeps_first_merged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import ainemo.core.tm.sqlite as sqlite_module
+
+    seg = _seg()
+    monkeypatch.setattr(sqlite_module, "_now_seconds", lambda: 100)
+    first = SqliteTranslationMemory(tmp_path / "first.sqlite")
+    first.store(_ts(seg, target_text="Erste"))
+    first.close()
+    monkeypatch.setattr(sqlite_module, "_now_seconds", lambda: 200)
+    second = SqliteTranslationMemory(tmp_path / "second.sqlite")
+    second.store(_ts(seg, target_text="Zweite"))
+    second.close()
+
+    out = SqliteTranslationMemory(tmp_path / "out.sqlite")
+    out.merge_from(tmp_path / "first.sqlite", policy=MERGE_POLICY_KEEP_EXISTING)
+    out.merge_from(tmp_path / "second.sqlite", policy=MERGE_POLICY_KEEP_EXISTING)
+
+    hit = out.lookup(seg, _LANG_DE)
+    assert hit is not None and hit.translated.target_text == "Erste"
+    out.close()
+
+
+def test_merge_from_keeps_distinct_providers_side_by_side(tmp_path: Path) -> None:
+    seg = _seg()
+    a = SqliteTranslationMemory(tmp_path / "a.sqlite")
+    a.store(_ts(seg, target_text="Hallo (A)", provider="openai"))
+    a.close()
+    b = SqliteTranslationMemory(tmp_path / "b.sqlite")
+    b.store(_ts(seg, target_text="Hallo (B)", provider="anthropic"))
+    b.close()
+
+    out = SqliteTranslationMemory(tmp_path / "out.sqlite")
+    out.merge_from(tmp_path / "a.sqlite")
+    out.merge_from(tmp_path / "b.sqlite")
+
+    assert out.stats().translation_count == 2
+    hit_a = out.lookup(seg, _LANG_DE, provider="openai")
+    hit_b = out.lookup(seg, _LANG_DE, provider="anthropic")
+    assert hit_a is not None and hit_a.translated.target_text == "Hallo (A)"
+    assert hit_b is not None and hit_b.translated.target_text == "Hallo (B)"
+    out.close()
+
+
+def test_merge_from_fills_missing_embedding(tmp_path: Path) -> None:
+    seg = _seg()
+    with_embedding = SqliteTranslationMemory(tmp_path / "emb.sqlite", embedder=_stub_embedder)
+    with_embedding.store(_ts(seg))
+    with_embedding.close()
+
+    out = SqliteTranslationMemory(tmp_path / "out.sqlite")
+    out.store(_ts(seg))
+    assert out.stats().embedding_count == 0
+    out.merge_from(tmp_path / "emb.sqlite")
+    assert out.stats().embedding_count == 1
+    out.close()
+
+
+def test_merge_from_rejects_bad_inputs(tmp_path: Path) -> None:
+    out = SqliteTranslationMemory(tmp_path / "out.sqlite")
+    with pytest.raises(ValueError, match="not found"):
+        out.merge_from(tmp_path / "missing.sqlite")
+    with pytest.raises(ValueError, match="into itself"):
+        out.merge_from(tmp_path / "out.sqlite")
+    shard = SqliteTranslationMemory(tmp_path / "shard.sqlite")
+    shard.close()
+    with pytest.raises(ValueError, match="Unknown merge policy"):
+        out.merge_from(tmp_path / "shard.sqlite", policy="coin-flip")
+
+    import sqlite3
+
+    foreign = tmp_path / "foreign.sqlite"
+    sqlite3.connect(str(foreign)).execute("CREATE TABLE t (x)").connection.close()
+    with pytest.raises(ValueError, match="not an AI-NEMO translation memory"):
+        out.merge_from(foreign)
+    # The failed merge detached the source; the next one still works.
+    assert out.merge_from(tmp_path / "shard.sqlite").translations_read == 0
+    out.close()
+
+
+# --- Negative-lookup membership filter ------------------------------------
+
+
+def test_membership_filter_skips_exact_query_on_certain_miss(tmp_path: Path) -> None:
+    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", membership_filter=True)
+    stored = _seg(key="k1", source_text="Hello")
+    tm.store(_ts(stored))
+
+    queries: list[str] = []
+    tm._conn.set_trace_callback(queries.append)
+    assert tm.lookup(_seg(key="k2", source_text="never seen"), _LANG_DE) is None
+    assert not any("FROM translations" in q for q in queries)
+
+    hit = tm.lookup(stored, _LANG_DE, provider=_PROVIDER_TEST)
+    assert hit is not None and hit.translated.target_text == "Hallo"
+    tm._conn.set_trace_callback(None)
+    tm.close()
+
+
+def test_membership_filter_built_at_open_from_existing_rows(tmp_path: Path) -> None:
+    db = tmp_path / "tm.sqlite"
+    seg = _seg()
+    first = SqliteTranslationMemory(db)
+    first.store(_ts(seg, provider="openai"))
+    first.close()
+
+    tm = SqliteTranslationMemory(db, membership_filter=True)
+    assert tm.might_contain(seg, _LANG_DE)
+    assert tm.might_contain(seg, _LANG_DE, provider="openai")
+    assert not tm.might_contain(seg, "fr-FR")
+    hit = tm.lookup(seg, _LANG_DE, provider="openai")
+    assert hit is not None
+    tm.close()
+
+
+def test_membership_filter_has_no_false_negatives(tmp_path: Path) -> None:
+    """Bloom filters may say "maybe" for absent keys but must never
+    say "no" for present ones — across bulk build and scalar adds."""
+    db = tmp_path / "tm.sqlite"
+    seeded = SqliteTranslationMemory(db)
+    segments = [_seg(key=f"k{i}", source_text=f"Text {i}") for i in range(60)]
+    for seg in segments[:40]:
+        seeded.store(_ts(seg))
+    seeded.close()
+
+    tm = SqliteTranslationMemory(db, membership_filter=True)
+    for seg in segments[40:]:
+        tm.store(_ts(seg))
+    for seg in segments:
+        assert tm.might_contain(seg, _LANG_DE, provider=_PROVIDER_TEST, model="")
+    tm.close()
+
+
+def test_store_during_membership_rebuild_is_not_lost(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A store racing a filter rebuild waits for the swap, so its row
+    is in the filter the lookups then use."""
+    import threading
+
+    from ainemo.core.tm._membership import TmMembershipFilter
+
+    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", membership_filter=True)
+    tm.store(_ts(_seg(source_text="old")))
+    scanned = threading.Event()
+    release = threading.Event()
+    real_add_many = TmMembershipFilter.add_many
+
+    def _slow_add_many(self: TmMembershipFilter, keys: Any) -> None:
+        real_add_many(self, keys)
+        scanned.set()
+        assert release.wait(timeout=10)
+
+    monkeypatch.setattr(TmMembershipFilter, "add_many", _slow_add_many)
+    rebuild = threading.Thread(target=tm._rebuild_membership)
+    rebuild.start()
+    assert scanned.wait(timeout=10)
+    new = _seg(source_text="new")
+    store = threading.Thread(target=tm.store, args=(_ts(new),))
+    store.start()
+    store.join(timeout=0.2)  # Without the lock the store finishes here.
+    release.set()
+    rebuild.join(timeout=10)
+    store.join(timeout=10)
+
+    assert tm.might_contain(new, _LANG_DE, provider=_PROVIDER_TEST, model="")
+    assert tm.lookup(new, _LANG_DE) is not None
+    tm.close()
+
+
+def test_fuzzy_skipped_without_embedding_the_query_when_no_candidates(tmp_path: Path) -> None:
+    calls: list[str] = []
+
+    def _counting_embedder(text: str) -> np.ndarray:
+        calls.append(text)
+        return _identical_embedder(text)
+
+    tm = SqliteTranslationMemory(
+        tmp_path / "tm.sqlite", embedder=_counting_embedder, membership_filter=True
+    )
+    tm.store(_ts(_seg(source_text="Hello"), target_lang=_LANG_DE))
+    calls.clear()
+
+    assert not tm.has_fuzzy_candidates(_LANG_EN_US, "fr-FR")
+    assert tm.lookup(_seg(source_text="Hello there"), "fr-FR") is None
+    assert calls == []
+
+    assert tm.has_fuzzy_candidates(_LANG_EN_US, _LANG_DE)
+    hit = tm.lookup(_seg(source_text="Hello there"), _LANG_DE)
+    assert hit is not None and hit.match_type == TM_MATCH_TYPE_FUZZY
+    tm.close()
+
+
+def test_has_fuzzy_candidates_without_filter_queries_sqlite(tmp_path: Path) -> None:
+    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite", embedder=_stub_embedder)
+    assert not tm.has_fuzzy_candidates(_LANG_EN_US, _LANG_DE)
+    tm.store(_ts(_seg(), provider="openai"))
+    assert tm.has_fuzzy_candidates(_LANG_EN_US, _LANG_DE)
+    assert tm.has_fuzzy_candidates(_LANG_EN_US, _LANG_DE, provider="openai")
+    assert not tm.has_fuzzy_candidates(_LANG_EN_US, _LANG_DE, provider="anthropic")
+    tm.close()
+
+
+def test_membership_filter_refreshed_after_merge(tmp_path: Path) -> None:
+    seg = _seg()
+    shard = SqliteTranslationMemory(tmp_path / "shard.sqlite")
+    shard.store(_ts(seg))
+    shard.close()
+
+    tm = SqliteTranslationMemory(tmp_path / "out.sqlite", membership_filter=True)
+    assert not tm.might_contain(seg, _LANG_DE)
+    tm.merge_from(tmp_path / "shard.sqlite")
+    assert tm.lookup(seg, _LANG_DE) is not None
+    tm.close()
+
+
+# --- Usage tracking (hit_count / last_hit_at) -----------------------------
+
+
+def test_hits_are_deferred_until_flush(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Lookups count hits in memory; no UPDATE runs on the lookup path."""
+    monkeypatch.setattr(sqlite_module, "_now_seconds", lambda: 5_000)
+    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm.store(_ts(_seg()))
+    statements: list[str] = []
+    tm._conn.set_trace_callback(statements.append)
+
+    for _ in range(3):
+        assert tm.lookup(_seg(), _LANG_DE) is not None
+
+    assert not any(stmt.lstrip().upper().startswith("UPDATE") for stmt in statements)
+    tm._conn.set_trace_callback(None)
+    assert _stored_hit_counts(tm) == {"Hallo": (0, None)}
+    tm.flush_hits()
+    assert _stored_hit_counts(tm) == {"Hallo": (3, 5_000)}
+    tm.close()
+
+
+def test_close_flushes_pending_hits(make_tm: _MakeTm, tmp_path: Path) -> None:
+    tm = make_tm(path=tmp_path / "tm.sqlite")
+    tm.store(_ts(_seg()))
+    tm.lookup(_seg(), _LANG_DE)
+    tm.close()
+
+    reopened = make_tm(path=tmp_path / "tm.sqlite")
+    assert _hit_counts(reopened)["Hallo"][0] == 1
+    reopened.close()
+
+
+def test_lookup_without_recording_hits(make_tm: _MakeTm) -> None:
+    tm = make_tm(_identical_embedder)
+    tm.store(_ts(_seg(), "Hallo"))
+    assert tm.lookup(_seg(), _LANG_DE, record_hits=False) is not None
+    fuzzy = tm.lookup(_seg(key="q", source_text="Greetings"), _LANG_DE, record_hits=False)
+    assert fuzzy is not None and fuzzy.match_type == TM_MATCH_TYPE_FUZZY
+    assert _hit_counts(tm)["Hallo"] == (0, None)
+    tm.close()
+
+
+def test_hits_flush_once_batch_is_full(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sqlite_module, "_HIT_FLUSH_MAX_PENDING", 2)
+    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm.store(_ts(_seg(source_text="a"), "A"))
+    tm.store(_ts(_seg(source_text="b"), "B"))
+
+    tm.lookup(_seg(source_text="a"), _LANG_DE)
+    assert _stored_hit_counts(tm)["A"][0] == 0
+    tm.lookup(_seg(source_text="b"), _LANG_DE)
+    counts = _stored_hit_counts(tm)
+    assert (counts["A"][0], counts["B"][0]) == (1, 1)
+    tm.close()
+
+
+def test_hit_flush_waits_for_another_threads_transaction(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A lookup thread's hit flush never BEGINs inside another thread's
+    open transaction on the shared connection."""
+    import threading
+
+    monkeypatch.setattr(sqlite_module, "_HIT_FLUSH_MAX_PENDING", 1)
+    tm = SqliteTranslationMemory(tmp_path / "tm.sqlite")
+    tm.store(_ts(_seg()))
+    worker = threading.Thread(target=tm.lookup, args=(_seg(), _LANG_DE))
+    with tm._transaction():
+        worker.start()
+        worker.join(timeout=0.2)
+        assert worker.is_alive()
+    worker.join(timeout=5.0)
+    assert _stored_hit_counts(tm)["Hallo"][0] == 1
+    tm.close()
+
+
+def test_fuzzy_hit_counts_toward_matched_row(make_tm: _MakeTm) -> None:
+    tm = make_tm(_identical_embedder)
+    tm.store(_ts(_seg(source_text="Hello there")))
+    hit = tm.lookup(_seg(source_text="Hello here"), _LANG_DE)
+    assert hit is not None and hit.match_type == TM_MATCH_TYPE_FUZZY
+    tm.flush_hits()
+    assert _hit_counts(tm)["Hallo"][0] == 1
+    tm.close()
+
+
+def test_restore_keeps_hit_count(make_tm: _MakeTm) -> None:
+    tm = make_tm()
+    tm.store(_ts(_seg()))
+    tm.lookup(_seg(), _LANG_DE)
+    tm.flush_hits()
+    tm.store(_ts(_seg(), "Servus"))
+    assert _hit_counts(tm)["Servus"][0] == 1
+    tm.close()
+
+
+def test_iter_top_translations_ranks_per_target_lang(make_tm: _MakeTm) -> None:
+    tm = make_tm()
+    for text, hits in (("a", 3), ("b", 1), ("c", 2), ("cold", 0)):
+        tm.store(_ts(_seg(source_text=text), text.upper()))
+        for _ in range(hits):
+            tm.lookup(_seg(source_text=text), _LANG_DE)
+    tm.store(_ts(_seg(source_text="a"), "A-fr", target_lang="fr-FR"))
+    tm.lookup(_seg(source_text="a"), "fr-FR")
+
+    top = list(tm.iter_top_translations(per_target_lang=2))
+
+    assert [(u.translated.target_lang, u.translated.target_text, u.hit_count) for u in top] == [
+        (_LANG_DE, "A", 3),
+        (_LANG_DE, "C", 2),
+        ("fr-FR", "A-fr", 1),
+    ]
+    assert all(u.translated.source == TRANSLATION_SOURCE_EXACT_TM for u in top)
+    assert all(u.newest_for_provider and u.newest_for_target_lang for u in top)
+    only_fr = list(tm.iter_top_translations(per_target_lang=5, target_lang="fr-FR"))
+    assert [u.translated.target_text for u in only_fr] == ["A-fr"]
+    tm.close()
+
+
+def test_iter_top_translations_flags_newest_row(
+    make_tm: _MakeTm, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock = iter(range(1_000, 2_000))
+    monkeypatch.setattr(sqlite_module, "_now_seconds", lambda: next(clock))
+    monkeypatch.setattr(memory_module, "_now_seconds", lambda: next(clock))
+    tm = make_tm()
+    tm.store(_ts(_seg(), "Alt", provider="openai"))
+    tm.store(_ts(_seg(), "Neu", provider="anthropic"))
+    tm.lookup(_seg(), _LANG_DE, provider="openai")
+    tm.lookup(_seg(), _LANG_DE, provider="anthropic")
+
+    flags = {
+        u.translated.target_text: (u.newest_for_provider, u.newest_for_target_lang)
+        for u in tm.iter_top_translations(per_target_lang=5)
+    }
+    assert flags == {"Alt": (True, False), "Neu": (True, True)}
+    tm.close()
+
+
+def test_v2_database_migrates_keeping_rows(tmp_path: Path) -> None:
+    """v2 → v3 only adds the usage columns; existing rows survive."""
+    path = tmp_path / "tm.sqlite"
+    tm = SqliteTranslationMemory(path)
+    tm.store(_ts(_seg()))
+    tm.close()
+    conn = sqlite3.connect(str(path))
+    with conn:
+        conn.execute("ALTER TABLE translations DROP COLUMN last_hit_at")
+        conn.execute("ALTER TABLE translations DROP COLUMN hit_count")
+        conn.execute("UPDATE meta SET value = '2' WHERE key = 'schema_version'")
+    conn.close()
+
+    migrated = SqliteTranslationMemory(path)
+    assert migrated.lookup(_seg(), _LANG_DE) is not None
+    migrated.flush_hits()
+    assert _stored_hit_counts(migrated)["Hallo"][0] == 1
+    migrated.close()
+
+
+def test_merge_from_carries_hit_counts(tmp_path: Path) -> None:
+    shard = SqliteTranslationMemory(tmp_path / "shard.sqlite")
+    shard.store(_ts(_seg()))
+    shard.lookup(_seg(), _LANG_DE)
+    shard.close()
+
+    tm = SqliteTranslationMemory(tmp_path / "out.sqlite")
+    tm.merge_from(tmp_path / "shard.sqlite")
+    assert _stored_hit_counts(tm)["Hallo"][0] == 1
+    tm.close()
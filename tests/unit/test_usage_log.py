@@ -7,6 +7,7 @@ from pathlib import Path
 
 from ainemo.providers._usage_log import (
     DEFAULT_USAGE_LOG_PATH,
+    FIELD_CACHE_READ_TOKENS,
     FIELD_MODEL,
     FIELD_PROVIDER,
     UsageLog,
@@ -96,6 +97,22 @@ def test_stats_handles_none_token_and_cost(tmp_path: Path) -> None:
     assert stats.total_cost_usd == 0.0
 
 
+def test_stats_totals_prompt_cache_tokens(tmp_path: Path) -> None:
+    log_path = tmp_path / "usage.jsonl"
+    log = UsageLog(log_path)
+    _record_one(log, input_tokens=1200, cache_read_tokens=1024, cache_write_tokens=0)
+    _record_one(log, input_tokens=1200, cache_write_tokens=1024)
+    _record_one(log)  # Provider without cache figures.
+
+    stats = log.stats()
+    assert stats.total_input_tokens == 1200 + 1200 + 120
+    assert stats.total_cache_read_tokens == 1024
+    assert stats.total_cache_write_tokens == 1024
+    # Unreported cache counts are left out of the record, not zeroed.
+    last = log_path.read_text(encoding="utf-8").splitlines()[-1]
+    assert FIELD_CACHE_READ_TOKENS not in last
+
+
 def test_stats_filters_by_since(tmp_path: Path) -> None:
     """`since` filter narrows the window to records at or after the
     given timestamp."""
@@ -138,3 +155,24 @@ def test_record_uses_constant_field_names(tmp_path: Path) -> None:
     raw = (tmp_path / "usage.jsonl").read_text(encoding="utf-8")
     assert f'"{FIELD_PROVIDER}"' in raw
     assert f'"{FIELD_MODEL}"' in raw
+
+
+def test_stats_counts_response_cache_hits_apart_from_calls(tmp_path: Path) -> None:
+    log = UsageLog(tmp_path / "usage.jsonl")
+    _record_one(log)
+    _record_one(log, input_tokens=0, output_tokens=0, cost_usd=0.0, response_cache_hit=True)
+    stats = log.stats()
+    assert (stats.call_count, stats.response_cache_hits) == (1, 1)
+    assert stats.total_input_tokens == 120
+    assert stats.by_provider == {"openai": 1}
+
+
+def test_stats_groups_pooled_calls_by_endpoint(tmp_path: Path) -> None:
+    log = UsageLog(tmp_path / "usage.jsonl")
+    _record_one(log, endpoint="http://a:11434", latency_ms=100)
+    _record_one(log, endpoint="http://a:11434", latency_ms=300)
+    _record_one(log, endpoint="http://b:11434", latency_ms=50)
+    _record_one(log)
+    stats = log.stats()
+    assert stats.by_endpoint == {"http://a:11434": 2, "http://b:11434": 1}
+    assert stats.latency_ms_by_endpoint == {"http://a:11434": 400, "http://b:11434": 50}